@@ -0,0 +1,570 @@
+"""
+@project: parser
+@file: benchmark.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+import argparse
+import io
+import multiprocessing
+import os
+import pickle
+import re
+import shutil
+import tempfile
+import timeit
+import tracemalloc
+
+import ply.yacc as yacc
+
+from pya2l.parser.cache import A2lCache
+from pya2l.parser.grammar.lexer import lexer, decode_numeric
+from pya2l.parser.grammar.node import A2lNode
+from pya2l.parser.grammar.parser import A2lParser
+from pya2l.parser.grammar.scanner import A2lScanner, split_offsets, PARALLEL_CHUNK_SIZE
+from pya2l.parser.grammar.transfer import encode_nodes, decode_nodes
+from pya2l.parser.metadata import probe
+
+SMALL_A2L = """
+    /begin PROJECT project_name "example project"
+        /begin MODULE first_module "first module long identifier"
+            /begin CHARACTERISTIC
+                example_of_characteristic
+                "first characteristic long identifier"
+                VALUE
+                0
+                DAMOS_SST
+                0
+                first_characteristic_conversion
+                -4.5
+                12.0
+            /end CHARACTERISTIC
+        /end MODULE
+    /end PROJECT
+"""
+
+
+def synthetic_a2l(objects, pairs=0):
+    # builds a module with `objects` measurements, characteristics and compu methods, and a compu tab of `pairs`
+    # value pairs.
+    blocks = list()
+    for i in range(objects):
+        blocks.append("""
+            /begin MEASUREMENT measurement_{0} "measurement {0}"
+                UWORD conversion_{1} 0 0 0 65535
+                ECU_ADDRESS 0x{0:08X}
+                FORMAT "%8.3"
+                /begin FUNCTION_LIST function_{1} /end FUNCTION_LIST
+            /end MEASUREMENT
+            /begin CHARACTERISTIC characteristic_{0} "characteristic {0}"
+                CURVE 0x{0:08X} record_layout_0 0 conversion_{1} -100.0 100.0
+                /begin AXIS_DESCR STD_AXIS measurement_{0} conversion_{1} 8 0 255
+                    FORMAT "%8.3"
+                /end AXIS_DESCR
+            /end CHARACTERISTIC
+            /begin COMPU_METHOD conversion_{0} "conversion {0}" RAT_FUNC "%8.3" "unit"
+                COEFFS 0 1 0 0 0 1
+            /end COMPU_METHOD""".format(i, i % 16))
+    if pairs:
+        blocks.append("""
+            /begin COMPU_TAB compu_tab_0 "compu tab" TAB_INTP {0}
+                {1}
+            /end COMPU_TAB""".format(pairs, ' '.join('{0} {1}.5'.format(i, i) for i in range(pairs))))
+    return """
+    ASAP2_VERSION 1 61
+    /begin PROJECT project_name "synthetic project"
+        /begin MODULE module_name "synthetic module"{0}
+        /end MODULE
+    /end PROJECT
+""".format(''.join(blocks))
+
+
+def report(name, seconds, count, unit='file'):
+    print('{:<40} {:>12.3f} ms/{}'.format(name, seconds * 1000.0 / count, unit))
+
+
+def bench_small(count):
+    # reproduces the former behavior, where every A2lParser instance built its own engine from the tables.
+    output_directory = tempfile.mkdtemp()
+    try:
+        def per_instance_engine():
+            yacc.yacc(debug=True, module=A2lParser, optimize=True, outputdir=output_directory,
+                      errorlog=yacc.NullLogger()).parse(SMALL_A2L, lexer=lexer)
+
+        report('small file, engine built per instance', timeit.timeit(per_instance_engine, number=count), count)
+    finally:
+        shutil.rmtree(output_directory)
+    report('small file, shared engine', timeit.timeit(lambda: A2lParser(SMALL_A2L), number=count), count)
+
+
+def bench_scaling(count):
+    # the time per object must stay constant while the number of objects in the module grows.
+    for objects in (1000, 2000, 4000, 8000, 16000):
+        string = synthetic_a2l(objects)
+        report('module of {} objects'.format(objects * 3), timeit.timeit(lambda: A2lParser(string), number=1),
+               objects * 3, unit='object')
+    for pairs in (1000, 10000, 100000):
+        string = synthetic_a2l(0, pairs=pairs)
+        report('compu tab of {} pairs'.format(pairs), timeit.timeit(lambda: A2lParser(string), number=1), pairs,
+               unit='pair')
+
+
+def count_tokens(lexer, string):
+    lexer.input(string)
+    count = 0
+    while lexer.token() is not None:
+        count += 1
+    return count
+
+
+def bench_lexers(count):
+    string = synthetic_a2l(16000, pairs=100000)
+    for name, lexer in (('ply lexer', A2lParser.lexers['ply']()), ('scanner', A2lScanner())):
+        tokens = count_tokens(lexer, string)
+        seconds = timeit.timeit(lambda: count_tokens(lexer, string), number=3) / 3
+        print('{:<40} {:>12.0f} tokens/s'.format('{} ({} tokens)'.format(name, tokens), tokens / seconds))
+    for name in ('ply', 'scanner'):
+        report('parse with ' + name, timeit.timeit(lambda: A2lParser(string, lexer=name), number=1), 1)
+
+
+def legacy_decode_numeric(value):
+    try:
+        return int(value, 10)
+    except ValueError:
+        try:
+            return int(value, 16)
+        except ValueError:
+            return float(value)
+
+
+def bench_numerics(count):
+    # the literals are weighted the way they appear in measurement and characteristic heavy files.
+    literals = ['0x{:08X}'.format(i) for i in range(4)] + ['0', '255', '-100.0', '100.0']
+    for name, decode in (('legacy', legacy_decode_numeric), ('classified', decode_numeric),
+                         ('classified, lexeme kept', lambda v: decode_numeric(v, True))):
+        seconds = timeit.timeit(lambda: [decode(literal) for literal in literals], number=count * 100)
+        print('{:<40} {:>12.3f} us/literal'.format('decode numerics, ' + name,
+                                                   seconds * 1e6 / (count * 100 * len(literals))))
+
+
+def peak_memory(function):
+    # the pages of a memory mapped file are not allocated by python, they are not part of the peak.
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_files(count):
+    output_directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(output_directory, 'synthetic.a2l')
+        with open(path, 'w') as fp:
+            fp.write(synthetic_a2l(4000, pairs=50000))
+
+        def read_and_parse():
+            with open(path, 'r') as fp:
+                return A2lParser(fp.read(), lexer='scanner')
+
+        for name, function in (('read, then parse', read_and_parse), ('from_file', lambda: A2lParser.from_file(path))):
+            report(name, timeit.timeit(function, number=1), 1)
+            print('{:<40} {:>12.1f} MB peak ({:.1f} MB file)'.format(name, peak_memory(function) / 1e6,
+                                                                     os.path.getsize(path) / 1e6))
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_stream(count):
+    # tokenizing a stream must use the same amount of memory whatever the size of the file is.
+    output_directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(output_directory, 'synthetic.a2l')
+        for objects in (1000, 4000, 16000):
+            with open(path, 'w') as fp:
+                fp.write(synthetic_a2l(objects))
+
+            def read_and_tokenize():
+                with open(path, 'rb') as fp:
+                    scanner = A2lScanner()
+                    scanner.input(fp.read())
+                    return sum(1 for _ in scanner)
+
+            def stream_and_tokenize():
+                with open(path, 'rb') as fp:
+                    scanner = A2lScanner()
+                    scanner.input_stream(fp)
+                    return sum(1 for _ in scanner)
+
+            for name, function in (('read, then tokenize', read_and_tokenize),
+                                   ('tokenize stream', stream_and_tokenize)):
+                print('{:<40} {:>12.1f} MB peak ({:.1f} MB file)'.format(name, peak_memory(function) / 1e6,
+                                                                         os.path.getsize(path) / 1e6))
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_comments(count):
+    # a commented-out a2ml block, as found in files generated by some tools.
+    comment = '/*' + synthetic_a2l(2000).replace('*/', '') + '*/'
+    patterns = (('legacy comment pattern', re.compile(r'(/\*(.|\n)*?\*/)')),
+                ('unrolled comment pattern', re.compile(r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/')))
+    for name, regex in patterns:
+        report(name + ' ({:.1f} MB)'.format(len(comment) / 1e6), timeit.timeit(lambda: regex.match(comment), number=3),
+               3, unit='comment')
+    for name, regex in patterns:
+        report(name + ', unterminated', timeit.timeit(lambda: regex.match(comment[:-2]), number=3), 3, unit='comment')
+
+
+def count_nodes(node):
+    count = 1
+    for name in node.properties:
+        value = getattr(node, name)
+        for child in value if isinstance(value, list) else (value,):
+            if isinstance(child, A2lNode):
+                count += count_nodes(child)
+    return count
+
+
+def retained_memory(function):
+    tracemalloc.start()
+    try:
+        result = function()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_memory(count):
+    # the conversion names, formats, units and function names of the synthetic file repeat across the objects.
+    string = synthetic_a2l(8000)
+    for lexer in ('ply', 'scanner'):
+        for name, intern_table in (('not interned', False), ('interned', None)):
+            a2l, memory = retained_memory(lambda: A2lParser(string, lexer=lexer, intern_table=intern_table))
+            nodes = count_nodes(a2l.tree)
+            print('{:<40} {:>12.1f} bytes/node ({} nodes, {:.1f} MB)'.format(
+                '{}, {}'.format(lexer, name), memory / float(nodes), nodes, memory / 1e6))
+    intern_table = dict()
+    for _ in range(2):
+        a2l, memory = retained_memory(lambda: A2lParser(string, lexer='scanner', intern_table=intern_table))
+    print('{:<40} {:>12.1f} bytes/node ({} values in table)'.format('scanner, shared table (second parse)',
+                                                                  memory / float(count_nodes(a2l.tree)),
+                                                                  len(intern_table)))
+
+
+def bench_buffer(count):
+    string = synthetic_a2l(13000, pairs=50000)
+
+    def token_list():
+        scanner = A2lScanner()
+        scanner.input(string)
+        return list(scanner)
+
+    for name, function in (('list of tokens', token_list), ('token buffer', lambda: A2lScanner().tokenize(string))):
+        result, memory = retained_memory(function)
+        seconds = timeit.timeit(function, number=1)
+        print('{:<40} {:>12.1f} MB ({} tokens, {:.0f} tokens/s)'.format(name, memory / 1e6, len(result),
+                                                                        len(result) / seconds))
+
+
+def bench_cache(count):
+    output_directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(output_directory, 'synthetic.a2l')
+        with open(path, 'w') as fp:
+            fp.write(synthetic_a2l(8000))
+        cache = A2lCache(os.path.join(output_directory, 'cache'))
+        report('from_file', timeit.timeit(lambda: A2lParser.from_file(path), number=1), 1)
+        report('cache miss', timeit.timeit(lambda: cache.from_file(path), number=1), 1)
+        report('cache hit', timeit.timeit(lambda: cache.from_file(path), number=3), 3)
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_parallel(count):
+    output_directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(output_directory, 'synthetic.a2l')
+        with open(path, 'w') as fp:
+            fp.write(synthetic_a2l(16000, pairs=100000))
+        with open(path, 'rb') as fp:
+            data = fp.read()
+        report('split offsets', timeit.timeit(lambda: split_offsets(data, 0, PARALLEL_CHUNK_SIZE), number=1), 1)
+        report('tokenize', timeit.timeit(lambda: A2lScanner().tokenize(data), number=1), 1)
+        for processes in (2, 4, 8):
+            report('tokenize, {} processes'.format(processes),
+                   timeit.timeit(lambda: A2lScanner().tokenize_parallel(data, processes, path=path), number=1), 1)
+        report('from_file', timeit.timeit(lambda: A2lParser.from_file(path), number=1), 1)
+        report('from_file, one process per cpu', timeit.timeit(lambda: A2lParser.from_file(path, processes=None),
+                                                               number=1), 1)
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_engines(count):
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pya2l', 'parser', 'example', 'a2l.a2l'),
+              'rb') as fp:
+        example = fp.read()
+    for engine in ('ply', 'descent'):
+        A2lParser('', engine=engine)
+        report('example file, ' + engine, timeit.timeit(lambda: A2lParser(example, lexer='scanner', engine=engine),
+                                                        number=count), count)
+        for objects, pairs in ((8000, 0), (16000, 100000)):
+            string = synthetic_a2l(objects, pairs=pairs)
+            report('{} objects, {} pairs, {}'.format(objects * 3, pairs, engine),
+                   timeit.timeit(lambda: A2lParser(string, lexer='scanner', engine=engine), number=1), 1)
+    # the memory used by a streamed parse on top of the tree it builds (a window of tokens for the descent engine).
+    for objects in (4000, 16000):
+        string = synthetic_a2l(objects)
+        for engine in ('ply', 'descent'):
+            a2l, retained = retained_memory(lambda: A2lParser.from_stream(io.StringIO(string), engine=engine))
+            peak = peak_memory(lambda: A2lParser.from_stream(io.StringIO(string), engine=engine))
+            print('{:<40} {:>12.1f} MB'.format('{} objects, stream, {}, transient'.format(objects * 3, engine),
+                                               (peak - retained) / 1e6))
+
+
+def bench_lazy(count):
+    output_directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(output_directory, 'synthetic.a2l')
+        with open(path, 'w') as fp:
+            fp.write(synthetic_a2l(32000))
+        A2lParser.descent_engine()
+        for name, lazy in (('from_file', False), ('from_file, lazy', True)):
+            a2l, memory = retained_memory(lambda: A2lParser.from_file(path, engine='descent', lazy=lazy))
+            report(name, timeit.timeit(lambda: A2lParser.from_file(path, engine='descent', lazy=lazy), number=1), 1)
+            print('{:<40} {:>12.1f} MB'.format(name + ', retained', memory / 1e6))
+        a2l = A2lParser.from_file(path, lazy=True)
+        module = a2l.tree.project.module[0]
+        report('first access of a characteristic', timeit.timeit(lambda: module.characteristic[-1], number=1), 1,
+               unit='node')
+        report('find a characteristic by name',
+               timeit.timeit(lambda: module.characteristic.find('characteristic_16000'), number=1), 1, unit='node')
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_selective(count):
+    output_directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(output_directory, 'synthetic.a2l')
+        with open(path, 'w') as fp:
+            fp.write(synthetic_a2l(16000))
+        A2lParser.descent_engine()
+        for name, options in (('all blocks', dict()),
+                              ('measurements and compu methods', dict(include={'MEASUREMENT', 'COMPU_METHOD'})),
+                              ('compu methods', dict(include={'COMPU_METHOD'})),
+                              ('all but characteristics', dict(exclude={'CHARACTERISTIC'}))):
+            a2l, memory = retained_memory(lambda: A2lParser.from_file(path, engine='descent', **options))
+            seconds = timeit.timeit(lambda: A2lParser.from_file(path, engine='descent', **options), number=1)
+            print('{:<40} {:>12.3f} ms/file ({:.1f} MB)'.format(name, seconds * 1000.0, memory / 1e6))
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_projection(count):
+    # an address and limits only workload.
+    string = synthetic_a2l(16000)
+    projection = dict(CHARACTERISTIC=('name', 'address', 'lower_limit', 'upper_limit'),
+                      MEASUREMENT=('name', 'ecu_address', 'lower_limit', 'upper_limit'),
+                      COMPU_METHOD=('name', 'coeffs'))
+    A2lParser.descent_engine()
+    for name, options in (('all properties', dict()), ('projection', dict(projection=projection))):
+        a2l, memory = retained_memory(lambda: A2lParser(string, lexer='scanner', engine='descent', **options))
+        seconds = timeit.timeit(lambda: A2lParser(string, lexer='scanner', engine='descent', **options), number=1)
+        print('{:<40} {:>12.3f} ms/file ({:.1f} MB)'.format(name, seconds * 1000.0, memory / 1e6))
+
+
+def bench_workers(count):
+    # the transfer of the nodes bounds the speedup, it is done by the parent process.
+    output_directory = tempfile.mkdtemp()
+    try:
+        paths = list()
+        for i in range(8):
+            paths.append(os.path.join(output_directory, 'synthetic_{}.a2l'.format(i)))
+            with open(paths[-1], 'w') as fp:
+                fp.write(synthetic_a2l(4000))
+        A2lParser.descent_engine()
+        tree = A2lParser.from_file(paths[0], engine='descent').tree
+        for name, dumps, loads in (('pickle', lambda: pickle.dumps(tree, -1), pickle.loads),
+                                   ('encode_nodes', lambda: pickle.dumps(encode_nodes(tree), -1),
+                                    lambda data: decode_nodes(pickle.loads(data)))):
+            data = dumps()
+            report('send a tree, ' + name, timeit.timeit(dumps, number=1), 1)
+            report('receive a tree, {} ({:.1f} MB)'.format(name, len(data) / 1e6),
+                   timeit.timeit(lambda: loads(data), number=1), 1)
+        print('{} cpus'.format(multiprocessing.cpu_count()))
+        report('8 files', timeit.timeit(lambda: [A2lParser.from_file(path, engine='descent') for path in paths],
+                                        number=1), 1)
+        for workers in (2, 4, 8):
+            report('8 files, parse_many, {} workers'.format(workers),
+                   timeit.timeit(lambda: A2lParser.parse_many(paths, workers, engine='descent'), number=1), 1)
+        path = os.path.join(output_directory, 'synthetic.a2l')
+        with open(path, 'w') as fp:
+            fp.write(synthetic_a2l(32000))
+        report('from_file', timeit.timeit(lambda: A2lParser.from_file(path, engine='descent'), number=1), 1)
+        for workers in (2, 4, 8):
+            report('from_file, {} workers'.format(workers),
+                   timeit.timeit(lambda: A2lParser.from_file(path, workers=workers), number=1), 1)
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_transfer(count):
+    # the child blocks of a module, as sent back by a worker: pickled as they are, or encoded by encode_nodes.
+    A2lParser.descent_engine()
+    nodes = list(A2lParser(synthetic_a2l(4000), lexer='scanner', engine='descent').tree.project.module[0]._children)
+    pickled = pickle.dumps(nodes, -1)
+    encoded = pickle.dumps(encode_nodes(nodes), -1)
+    number = max(count // 20, 1)
+    print('{:<40} {:>12.1f} MB'.format('size, pickle', len(pickled) / 1e6))
+    print('{:<40} {:>12.1f} MB'.format('size, encode_nodes', len(encoded) / 1e6))
+    report('load, pickle', timeit.timeit(lambda: pickle.loads(pickled), number=number), number)
+    report('load, encode_nodes', timeit.timeit(lambda: decode_nodes(pickle.loads(encoded)), number=number), number)
+    decoded = pickle.loads(encoded)
+    report('decode_nodes only', timeit.timeit(lambda: decode_nodes(decoded), number=number), number)
+
+
+def bench_reparse(count):
+    # editing the long identifier of a characteristic of a large file, then of the same one `count` times.
+    output_directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(output_directory, 'synthetic.a2l')
+        with open(path, 'w') as fp:
+            fp.write(synthetic_a2l(32000))
+        A2lParser.descent_engine()
+        a2l = A2lParser.from_file(path, engine='descent')
+        report('from_file', timeit.timeit(lambda: A2lParser.from_file(path, engine='descent'), number=1), 1)
+        for where in (0.01, 0.5, 0.99):
+            data = a2l.tree._source.data
+            offset = data.find(b'"characteristic', int(len(data) * where)) + 1
+            report('first edit at {:.0%}'.format(where), timeit.timeit(lambda: a2l.reparse(offset, 0, 'x'), number=1),
+                   1, 'edit')
+        report('next edits', timeit.timeit(lambda: a2l.reparse(offset, 0, 'x'), number=count), count, 'edit')
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_recover(count):
+    # a valid file, then the same file with an invalid characteristic every `every` characteristics.
+    string = synthetic_a2l(16000)
+    A2lParser.descent_engine()
+    report('descent', timeit.timeit(lambda: A2lParser(string, lexer='scanner', engine='descent'), number=1), 1)
+    report('recover', timeit.timeit(lambda: A2lParser(string, recover=True), number=1), 1)
+    for every in (1000, 100, 10, 2):
+        parts = string.split('CURVE ')
+        invalid = ''.join(part + ('CURVE XX ' if index % every == 0 else 'CURVE ')
+                          for index, part in enumerate(parts[:-1])) + parts[-1]
+        report('recover, one error every {0}'.format(every),
+               timeit.timeit(lambda: A2lParser(invalid, recover=True), number=1), 1)
+
+
+def bench_iterparse(count):
+    # the peak memory of a complete parse, then of the iteration over all the nodes and over the measurements only. the
+    # peak memory of the iteration does not grow with the size of the file.
+    output_directory = tempfile.mkdtemp()
+    try:
+        A2lParser.descent_engine()
+        for size in (16000, 64000):
+            path = os.path.join(output_directory, 'synthetic.a2l')
+            with open(path, 'w') as fp:
+                fp.write(synthetic_a2l(size))
+            functions = [('iterparse', lambda: sum(1 for _ in A2lParser.iterparse(path))),
+                         ('iterparse, measurements', lambda: sum(1 for _ in A2lParser.iterparse(
+                             path, tags={'MEASUREMENT'})))]
+            if size == 16000:
+                functions.insert(0, ('from_file', lambda: A2lParser.from_file(path, engine='descent')))
+            for name, function in functions:
+                seconds = timeit.timeit(function, number=1)
+                tracemalloc.start()
+                try:
+                    function()
+                    memory = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                print('{:<40} {:>12.3f} ms/file ({:.1f} MB peak)'.format('{0}, {1} objects'.format(name, size),
+                                                                          seconds * 1000.0, memory / 1e6))
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_probe(count):
+    output_directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(output_directory, 'synthetic.a2l')
+        with open(path, 'w') as fp:
+            fp.write(synthetic_a2l(16000))
+        A2lParser.descent_engine()
+        report('from_file', timeit.timeit(lambda: A2lParser.from_file(path, engine='descent'), number=1), 1)
+        report('probe', timeit.timeit(lambda: probe(path), number=count), count)
+    finally:
+        shutil.rmtree(output_directory)
+
+
+def bench_get_node(count):
+    # the former recursive get_node, which concatenated the lists of every level of the tree.
+    def walk(node, node_type):
+        nodes = list()
+        for child in node._children:
+            if child.node() == node_type:
+                nodes.append(child)
+            nodes += walk(child, node_type)
+        return nodes
+
+    a2l = A2lParser(synthetic_a2l(16000), lexer='scanner')
+    report('walk', timeit.timeit(lambda: walk(a2l.tree, 'MEASUREMENT'), number=count), count, 'call')
+    report('index', timeit.timeit(lambda: a2l.get_node('MEASUREMENT'), number=1), 1, 'call (first)')
+    report('index', timeit.timeit(lambda: a2l.get_node('MEASUREMENT'), number=count), count, 'call')
+
+
+def bench_lookup(count):
+    a2l = A2lParser(synthetic_a2l(16000), lexer='scanner')
+    module = a2l.tree.project.module[0]
+    names = [measurement.name for measurement in module.measurement]
+    name = names[len(names) // 2]
+    report('scan', timeit.timeit(lambda: next(m for m in module.measurement if m.name == name), number=count), count,
+           'call')
+    report('index', timeit.timeit(lambda: module.lookup('MEASUREMENT', name), number=1), 1, 'call (first)')
+    report('index', timeit.timeit(lambda: module.lookup('MEASUREMENT', name), number=count), count, 'call')
+
+
+def bench_references(count):
+    # the conversions of the synthetic module are the first compu methods, a scan of the list finds them early.
+    a2l = A2lParser(synthetic_a2l(4000), lexer='scanner')
+    module = a2l.tree.project.module[0]
+
+    def scan():
+        return [[m for m in module.compu_method if m.name == node.conversion] for node in module.characteristic]
+
+    def resolve():
+        module._references = None
+        return module.resolve_references()
+
+    report('scan', timeit.timeit(scan, number=1), 1, 'module')
+    report('resolve', timeit.timeit(resolve, number=1), 1, 'module (all references)')
+    report('cached', timeit.timeit(lambda: module.characteristic[0].resolve('conversion'), number=count), count,
+           'call')
+
+
+BENCHMARKS = dict(small=bench_small, scaling=bench_scaling, lexers=bench_lexers, numerics=bench_numerics,
+                  files=bench_files, stream=bench_stream, comments=bench_comments, memory=bench_memory,
+                  buffer=bench_buffer, cache=bench_cache, parallel=bench_parallel, engines=bench_engines,
+                  lazy=bench_lazy, selective=bench_selective, projection=bench_projection, workers=bench_workers,
+                  transfer=bench_transfer, reparse=bench_reparse, recover=bench_recover,
+                  iterparse=bench_iterparse, probe=bench_probe, get_node=bench_get_node,
+                  lookup=bench_lookup, references=bench_references)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='pya2l parser benchmarks.')
+    parser.add_argument('benchmark', nargs='*', help='benchmarks to run (' + ', '.join(sorted(BENCHMARKS)) + ')')
+    parser.add_argument('-n', type=int, default=200, help='number of iterations')
+    args = parser.parse_args()
+    for name in args.benchmark or sorted(BENCHMARKS):
+        BENCHMARKS[name](args.n)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,6 +12,13 @@ from pya2l.parser.grammar.parser import A2lParser as Parser
 from pya2l.parser.grammar.node import A2lNode
 
 
+@pytest.fixture(autouse=True, params=['ply', 'descent'])
+def engine(request, monkeypatch):
+    # every test is run with both parser engines, a regression of the descent engine is not hidden by the default one.
+    monkeypatch.setattr(Parser, 'default_engine', request.param)
+    return request.param
+
+
 def test_invalid_node_property():
     class InvalidNode(A2lNode):
         __slots__ = 'invalid_property',
@@ -5736,3 +5743,1312 @@ def test_custom_class():
         /end PROJECT"""
     a2l = Parser(a2l_string, PROJECT=CustomProject)
     assert isinstance(a2l.tree.project, CustomProject)
+    # the classes are only used by the parses of the parser.
+    assert type(Parser(a2l_string).tree.project) is Project
+
+
+def test_concurrent_custom_classes(tmpdir):
+    import threading
+    from pya2l.parser.grammar.node import Characteristic, Project, node_to_class
+
+    class CustomCharacteristic(Characteristic):
+        pass
+
+    class OtherCharacteristic(Characteristic):
+        pass
+
+    a2l_string = u"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name "module long identifier"
+                {0}
+            /end MODULE
+        /end PROJECT""".format(u'\n'.join(
+        u'/begin CHARACTERISTIC c{0} "" VALUE 0 record_layout_name 0 compu_method_name 0 1 '
+        u'/end CHARACTERISTIC'.format(i) for i in range(200)))
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string.encode('ascii'))
+    classes = dict(custom=dict(CHARACTERISTIC=CustomCharacteristic), other=dict(CHARACTERISTIC=OtherCharacteristic),
+                   none=dict())
+    expected = dict(custom=CustomCharacteristic, other=OtherCharacteristic, none=Characteristic)
+    errors = list()
+
+    def parse(name):
+        try:
+            for _ in range(10):
+                a2l = Parser(a2l_string, **classes[name])
+                assert set(type(node) for node in a2l.get_node('CHARACTERISTIC')) == set([expected[name]])
+                assert type(a2l.tree.project) is Project
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=parse, args=(name,)) for name in sorted(classes) * 2]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert node_to_class['CHARACTERISTIC'] is Characteristic
+
+    # the blocks parsed later (lazy mode, reparse) are built with the classes of their parser.
+    a2l = Parser.from_file(str(path), lazy=True, CHARACTERISTIC=CustomCharacteristic)
+    assert type(a2l.tree.project.module[0].characteristic[42]) is CustomCharacteristic
+    start, end = a2l.tree.project.module[0].characteristic[0].span
+    assert type(a2l.reparse(start + len('/begin CHARACTERISTIC c0'), 0, '0')) is CustomCharacteristic
+    assert a2l.tree.project.module[0].characteristic[0].name == 'c00'
+
+
+def test_parser_engine_is_shared():
+    first = Parser('')
+    second = Parser('/begin PROJECT project_name "project long identifier" /end PROJECT')
+    assert first.engine() is second.engine()
+    assert first.tree is not second.tree
+    assert second.tree.project.name == 'project_name'
+
+
+def test_long_lists_keep_order():
+    pairs = 20000
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin COMPU_TAB compu_tab_name "compu tab long identifier" TAB_INTP {0}
+                    {1}
+                /end COMPU_TAB
+                /begin COMPU_VTAB compu_vtab_name "compu vtab long identifier" TAB_VERB 3
+                    0 "zero" 1 "one" 2 "two"
+                /end COMPU_VTAB
+            /end MODULE
+        /end PROJECT""".format(pairs, ' '.join('{0} {1}'.format(i, -i) for i in range(pairs)))
+    a2l = Parser(a2l_string)
+    in_val_out_val = a2l.tree.project.module[0].compu_tab[0].in_val_out_val
+    assert len(in_val_out_val) == 2 * pairs
+    assert in_val_out_val[:4] == [0, 0, 1, -1]
+    assert in_val_out_val[-2:] == [pairs - 1, 1 - pairs]
+    assert a2l.tree.project.module[0].compu_vtab[0].compu_vtab_in_val_out_val == [(0, 'zero'), (1, 'one'),
+                                                                                  (2, 'two')]
+
+
+def test_grammar_conflicts():
+    import ply.yacc as yacc
+    from pya2l.parser.grammar import parsetab
+
+    class Log(object):
+        def __init__(self):
+            self.messages = list()
+
+        def warning(self, message, *args, **kwargs):
+            self.messages.append(message % args)
+
+        error = info = debug = critical = warning
+
+    # the ambiguities of the lists are resolved by the precedence of the grammar (see A2lParser.precedence).
+    log = Log()
+    yacc.yacc(module=Parser, tabmodule='unused_parsetab', debug=False, write_tables=False, errorlog=log)
+    assert [message for message in log.messages if 'conflict' in message] == []
+
+    # the tables are not built again when the engine is loaded.
+    grammar = yacc.ParserReflect(dict((name, getattr(Parser, name)) for name in dir(Parser)), log=Log())
+    grammar.get_all()
+    assert grammar.signature() == parsetab._lr_signature
+
+
+def test_scanner_token_stream_matches_ply_lexer():
+    from pya2l.parser.grammar.scanner import A2lScanner
+
+    a2l_string = """
+        /* c comment */ ASAP2_VERSION 1 61 // c++ comment
+        /begin PROJECT project_name "project \\"long\\" identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin COMPU_METHOD compu_method_name "" RAT_FUNC "%4.2" "unit"
+                    COEFFS 0 1.0 -2. +3e-2 0x1F 0XaB
+                /end COMPU_METHOD
+                /begin FUNCTION function_name ""
+                    /begin DEF_CHARACTERISTIC array[0] struct.member[1] /end DEF_CHARACTERISTIC
+                /end FUNCTION
+            /end MODULE
+        /end PROJECT"""
+
+    def token_stream(lexer):
+        lexer.input(a2l_string)
+        return [(t.type, t.value, t.lexpos) for t in iter(lexer.token, None)]
+
+    assert token_stream(A2lScanner()) == token_stream(Parser.lexers['ply']())
+    assert token_stream(A2lScanner())[:4] == [('ASAP2_VERSION', 'ASAP2_VERSION', 25), ('NUMERIC', 1, 39),
+                                              ('NUMERIC', 61, 41), ('begin', '/begin', 67)]
+    a2l = Parser(a2l_string, lexer='scanner')
+    assert a2l.tree.project.long_identifier == 'project \\"long\\" identifier'
+    coeffs = a2l.tree.project.module[0].compu_method[0].coeffs
+    assert (coeffs.a, coeffs.b, coeffs.c, coeffs.d, coeffs.e, coeffs.f) == (0, 1.0, -2.0, 0.03, 31, 171)
+    assert a2l.tree.project.module[0].function[0].def_characteristic.identifier == ['array[0]', 'struct.member[1]']
+
+
+@pytest.mark.parametrize('lexer', ('ply', 'scanner'))
+def test_numeric_decoding(lexer):
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin MEASUREMENT measurement_name "measurement long identifier"
+                    UBYTE compu_method_name 0 0 -1e24 1E+3
+                    ECU_ADDRESS 0x00ABCDEF
+                    BIT_MASK 0X0f
+                    FORMAT "%4.2"
+                /end MEASUREMENT
+            /end MODULE
+        /end PROJECT"""
+    measurement = Parser(a2l_string, lexer=lexer).tree.project.module[0].measurement[0]
+    assert measurement.lower_limit == -1e24 and isinstance(measurement.lower_limit, float)
+    assert measurement.upper_limit == 1000.0 and isinstance(measurement.upper_limit, float)
+    assert measurement.ecu_address == 0xABCDEF
+    assert measurement.bit_mask == 15
+    assert not hasattr(measurement.ecu_address, 'lexeme')
+
+    measurement = Parser(a2l_string, lexer=lexer, keep_lexemes=True).tree.project.module[0].measurement[0]
+    assert measurement.ecu_address == 0xABCDEF and measurement.ecu_address.lexeme == '0x00ABCDEF'
+    assert measurement.bit_mask.lexeme == '0X0f'
+    assert measurement.lower_limit == -1e24 and measurement.lower_limit.lexeme == '-1e24'
+    assert measurement.resolution == 0 and measurement.resolution.lexeme == '0'
+
+
+@pytest.mark.parametrize('encoding, bom', (('latin-1', b''), ('utf-8', b''), ('utf-8', b'\xef\xbb\xbf'),
+                                           ('utf-16-le', b'\xff\xfe'), ('utf-16-be', b'\xfe\xff')))
+def test_parse_from_bytes_and_file(tmpdir, encoding, bom):
+    a2l_string = u"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "Modul f\u00fcr \u00b0C"
+                /begin COMPU_METHOD compu_method_name "Temperatur" RAT_FUNC "%4.2" "\u00b0C"
+                    COEFFS 0 1 0 0 0 0x1F
+                /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT"""
+    buf = bom + a2l_string.encode(encoding)
+    path = tmpdir.join('file.a2l')
+    path.write_binary(buf)
+    for a2l in (Parser.from_bytes(buf), Parser.from_bytes(bytearray(buf)), Parser.from_file(str(path))):
+        module = a2l.tree.project.module[0]
+        assert module.long_identifier == u'Modul f\u00fcr \u00b0C'
+        assert module.compu_method[0].unit == u'\u00b0C'
+        assert module.compu_method[0].coeffs.f == 31
+
+
+def test_parse_from_empty_file(tmpdir):
+    path = tmpdir.join('file.a2l')
+    path.write_binary(b'')
+    assert Parser.from_file(str(path)).tree.project is None
+
+
+def test_parse_from_bytes_invalid_sequence():
+    with pytest.raises(A2lFormatException) as e:
+        Parser.from_bytes(b'/begin PROJECT project_name /end PROJECT')
+    assert 'invalid sequence at position 28' in str(e.value)
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 3, 7, 64, 65536))
+def test_stream_token_stream_matches_scanner(chunk_size):
+    import io
+    from pya2l.parser.grammar.scanner import A2lScanner
+
+    a2l_string = u"""
+        /* c comment crossing chunk boundaries */ ASAP2_VERSION 1 61 // c++ comment
+        /begin PROJECT project_name "project \\"long\\" identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin COMPU_METHOD compu_method_name "" RAT_FUNC "%4.2" "unit"
+                    COEFFS 0 1.0 -2. +3e-2 0x1F 1.5e+300
+                /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT"""
+
+    def token_stream(scanner):
+        return [(t.type, t.value, t.lexpos) for t in scanner]
+
+    scanner = A2lScanner()
+    scanner.input(a2l_string)
+    expected = token_stream(scanner)
+    for fp in (io.StringIO(a2l_string), io.BytesIO(a2l_string.encode('latin-1'))):
+        scanner = A2lScanner()
+        scanner.input_stream(fp, chunk_size)
+        assert token_stream(scanner) == expected
+    a2l = Parser.from_stream(io.BytesIO(b'\xff\xfe' + a2l_string.encode('utf-16-le')), chunk_size)
+    assert a2l.tree.project.module[0].compu_method[0].coeffs.f == 1.5e300
+
+
+def test_stream_invalid_sequence():
+    import io
+
+    with pytest.raises(A2lFormatException) as e:
+        Parser.from_stream(io.StringIO(u' ' * 1000 + u'/begin PROJECT project_name /end PROJECT'), 16)
+    assert 'invalid sequence at position 1028' in str(e.value)
+
+
+def test_scanner_long_white_space_runs(capsys):
+    import io
+    from pya2l.parser.grammar.scanner import A2lScanner
+
+    a2l_string = u'ASAP2_VERSION 1 61' + u' ' * 100000 + u'@' + u'\n' * 100000
+    scanner = A2lScanner()
+    scanner.input(a2l_string)
+    assert [t.type for t in scanner] == ['ASAP2_VERSION', 'NUMERIC', 'NUMERIC']
+    scanner.input_stream(io.StringIO(a2l_string), 64)
+    assert [t.type for t in scanner] == ['ASAP2_VERSION', 'NUMERIC', 'NUMERIC']
+    assert capsys.readouterr().out == 'invalid character at line 1, position 100018\n' * 2
+
+
+@pytest.mark.parametrize('lexer', ('ply', 'scanner'))
+@pytest.mark.parametrize('a2l_string, message', (
+        ('ASAP2_VERSION 1 61 /* unterminated comment', 'unterminated comment at position 19'),
+        ('/begin PROJECT project_name "unterminated string /end PROJECT', 'unterminated string at position 28'),
+        ('/begin PROJECT project_name "' + 'x' * 100 + '" /end PROJECT',
+         'string longer than 64 characters at position 28'),
+        ('/* ' + 'x' * 200 + ' */ ASAP2_VERSION 1 61', 'comment longer than 128 characters at position 0'),
+        ('// ' + 'x' * 200 + '\nASAP2_VERSION 1 61', 'comment longer than 128 characters at position 0')))
+def test_invalid_comments_and_strings(lexer, a2l_string, message):
+    with pytest.raises(A2lFormatException) as e:
+        Parser(a2l_string, lexer=lexer, max_comment_length=128, max_string_length=64)
+    assert message in str(e.value)
+
+
+@pytest.mark.parametrize('lexer', ('ply', 'scanner'))
+def test_comments(lexer):
+    a2l_string = """
+        /* comment with / and * and /* */ ASAP2_VERSION 1 // comment with /* */
+        61 /**/ /***/ /* ** / */ //"""
+    a2l = Parser(a2l_string, lexer=lexer, max_comment_length=None, max_string_length=None)
+    assert a2l.tree.asap2_version.version_no == 1
+    assert a2l.tree.asap2_version.upgrade_no == 61
+
+
+def test_stream_unterminated_string_is_limited():
+    import io
+
+    with pytest.raises(A2lFormatException) as e:
+        Parser.from_stream(io.StringIO(u'/begin PROJECT project_name "' + u'x' * 100000), 64, max_string_length=1024)
+    assert 'string longer than 1024 characters at position 28' in str(e.value)
+
+
+def test_stream_endless_line_comment_is_limited():
+    class EndlessComment(object):
+        # a // comment which never ends, read is not called again once the comment is too long.
+        def __init__(self):
+            self.chunks = 0
+
+        def read(self, size):
+            self.chunks += 1
+            assert self.chunks < 1000
+            return b'ASAP2_VERSION 1 61 // comment' if self.chunks == 1 else b'x' * size
+
+    fp = EndlessComment()
+    with pytest.raises(A2lFormatException) as e:
+        Parser.from_stream(fp, 64, max_comment_length=1024)
+    assert 'comment longer than 1024 characters at position 19' in str(e.value)
+    assert fp.chunks < 64
+
+
+@pytest.mark.parametrize('lexer', ('ply', 'scanner'))
+def test_interned_values(lexer):
+    a2l_string = """
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin MEASUREMENT first_measurement_name "measurement long identifier"
+                    UWORD compu_method_name 0 0 0 65535 FORMAT "%8.3"
+                /end MEASUREMENT
+                /begin MEASUREMENT second_measurement_name "measurement long identifier"
+                    UWORD compu_method_name 0 0 0 65535 FORMAT "%8.3"
+                /end MEASUREMENT
+            /end MODULE
+        /end PROJECT"""
+    first, second = Parser(a2l_string, lexer=lexer).tree.project.module[0].measurement
+    assert first.conversion is second.conversion
+    assert first.long_identifier is second.long_identifier
+    assert first.format is second.format
+    assert first.data_type is second.data_type
+
+    first, second = Parser(a2l_string, lexer=lexer, intern_table=False).tree.project.module[0].measurement
+    assert first.conversion == second.conversion and first.conversion is not second.conversion
+
+    intern_table = dict()
+    first = Parser(a2l_string, lexer=lexer, intern_table=intern_table).tree.project.module[0].measurement[0]
+    second = Parser(a2l_string, lexer=lexer, intern_table=intern_table).tree.project.module[0].measurement[0]
+    assert first.conversion is second.conversion
+    assert intern_table['compu_method_name'] is first.conversion
+
+
+def test_token_buffer():
+    import io
+    from pya2l.parser.grammar.scanner import A2lScanner, TOKEN_TYPES
+
+    a2l_string = u"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin COMPU_METHOD compu_method_name "" RAT_FUNC "%4.2" "unit"
+                    COEFFS 0 1.0 -2. +3e-2 0x1F 0XaB
+                /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT"""
+    scanner = A2lScanner()
+    scanner.input(a2l_string)
+    expected = [(t.type, t.value, t.lexpos) for t in scanner]
+    token_buffer = scanner.tokenize(a2l_string)
+    assert len(token_buffer) == 28
+    assert token_buffer.types.typecode == 'H' and token_buffer.starts.itemsize == token_buffer.ends.itemsize == 8
+    assert [(t, v, s) for t, v, s, _ in token_buffer] == expected
+    assert token_buffer[3] == ('STRING', 'project long identifier', 37, 62)
+    assert token_buffer[20] == ('NUMERIC', 31, 261, 265)
+    assert token_buffer.values[0] is None and token_buffer.value(0) == '/begin'
+    assert token_buffer.count('begin') == token_buffer.count('end') == 3
+    assert TOKEN_TYPES[token_buffer.types[1]] == token_buffer.type(1) == 'PROJECT'
+    assert list(scanner.tokenize_stream(io.BytesIO(a2l_string.encode('utf-8')), 16)) == list(token_buffer)
+
+
+def test_token_buffer_to_numpy():
+    numpy = pytest.importorskip('numpy')
+    from pya2l.parser.grammar.scanner import A2lScanner, TOKEN_CODES
+
+    types, starts, ends = A2lScanner().tokenize(u'ASAP2_VERSION 1 61 /begin PROJECT p "" /end PROJECT').to_numpy()
+    assert types.dtype == numpy.uint16 and starts.dtype == ends.dtype == numpy.int64
+    assert int((types == TOKEN_CODES['NUMERIC']).sum()) == 2
+    assert list(ends - starts) == [13, 1, 2, 6, 7, 1, 2, 4, 7]
+
+
+def test_cache(tmpdir, monkeypatch):
+    from pya2l.parser.cache import A2lCache
+
+    a2l_string = b"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin COMPU_METHOD compu_method_name "" RAT_FUNC "%4.2" "unit"
+                    COEFFS 0 1.0 -2. +3e-2 0x1F 0XaB
+                /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT"""
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string)
+    cache = A2lCache(str(tmpdir.join('cache')))
+    expected = cache.from_file(str(path)).tree.json
+    assert len(tmpdir.join('cache').listdir()) == 1
+
+    # the cached tree is returned without parsing the file again.
+    with monkeypatch.context() as patch:
+        patch.setattr(Parser, 'engine', None)
+        a2l = cache.from_file(str(path))
+        assert a2l.tree.json == expected
+        assert a2l.tree.project.module[0].compu_method[0].coeffs._parent is a2l.tree.project.module[0].compu_method[0]
+        assert cache.from_bytes(bytearray(a2l_string)).tree.json == expected
+
+    # the entries are keyed on the content and on the options of the parser.
+    cache.from_bytes(a2l_string.replace(b'unit', b'volt'))
+    cache.from_bytes(a2l_string, keep_lexemes=True)
+    assert len(tmpdir.join('cache').listdir()) == 3
+    # both engines build the same tree, they share the entries.
+    cache.from_bytes(a2l_string, engine='ply')
+    cache.from_bytes(a2l_string, engine='descent')
+    assert len(tmpdir.join('cache').listdir()) == 3
+    # the number of processes scanning the data does not change the tree either.
+    cache.from_file(str(path), processes=2)
+    assert len(tmpdir.join('cache').listdir()) == 3
+    with monkeypatch.context() as patch:
+        patch.setattr(Parser, 'engine', None)
+        assert cache.from_file(str(path), processes=None).tree.json == expected
+
+    # unreadable entries are ignored and replaced.
+    for entry in tmpdir.join('cache').listdir():
+        entry.write_binary(b'invalid')
+    assert cache.from_file(str(path)).tree.json == expected
+
+    # the least recently used entries are evicted.
+    size = tmpdir.join('cache').listdir()[0].size()
+    cache = A2lCache(str(tmpdir.join('cache')), max_size=size + 64)
+    cache.from_bytes(a2l_string.replace(b'unit', b'ampere'))
+    assert len(tmpdir.join('cache').listdir()) == 1
+    cache.clear()
+    assert not tmpdir.join('cache').listdir()
+
+
+def test_cache_index(tmpdir, monkeypatch):
+    import pya2l.parser.grammar.node as node
+    from pya2l.parser.cache import A2lCache
+
+    a2l_string = b"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name "module long identifier"
+                /begin UNIT first "" "s" DERIVED /end UNIT
+                /begin UNIT second "" "m" DERIVED /end UNIT
+            /end MODULE
+        /end PROJECT"""
+    cache = A2lCache(str(tmpdir.join('cache')))
+    cache.from_bytes(a2l_string)
+
+    # the index is stored with the tree, the loaded tree does not build it again.
+    def build(tree):
+        raise AssertionError('the index is built again')
+
+    monkeypatch.setattr(node, 'A2lTypeIndex', build)
+    monkeypatch.setattr(node, 'A2lNameIndex', build)
+    a2l = cache.from_bytes(a2l_string)
+    assert [unit.name for unit in a2l.get_node('UNIT')] == ['first', 'second']
+    assert a2l.tree.project.get_node('MODULE') == [a2l.tree.project.module[0]]
+    module = a2l.tree.project.module[0]
+    assert module.lookup('UNIT', 'second') is module.unit[1] and module.find('first') is module.unit[0]
+
+    # the names of a lazy tree are indexed without parsing its nodes.
+    monkeypatch.undo()
+    cache.from_bytes(a2l_string, lazy=True)
+    monkeypatch.setattr(node, 'A2lNameIndex', build)
+    module = cache.from_bytes(a2l_string, lazy=True).tree.project.module[0]
+    assert module.lookup('UNIT', 'second').display == 'm'
+
+
+def test_parallel_scan(tmpdir):
+    from pya2l.parser.grammar.scanner import A2lScanner, split_offsets
+
+    a2l_string = u"""
+        ASAP2_VERSION 1 61
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier /begin MEASUREMENT"
+                /begin COMPU_METHOD compu_method_name "" RAT_FUNC "%4.2" "unit \\" /begin"
+                    COEFFS 0 1.0 -2. +3e-2 0x1F 0XaB
+                /end COMPU_METHOD
+                /* /begin COMPU_METHOD */
+                // /begin COMPU_METHOD
+                /begin COMPU_METHOD second_compu_method_name "\u00b0C" IDENTICAL "%4.2" "unit"
+                /end COMPU_METHOD
+                /begin MEASUREMENT measurement_name "" UWORD compu_method_name 0 0 0 65535
+                    /begin FUNCTION_LIST function_name /end FUNCTION_LIST
+                /end MEASUREMENT
+            /end MODULE
+        /end PROJECT"""
+    offsets = split_offsets(a2l_string, 0, 1)
+    assert [a2l_string[offset:offset + 26] for offset in offsets[1:]] == ['/begin COMPU_METHOD compu_',
+                                                                          '/begin COMPU_METHOD second',
+                                                                          '/begin MEASUREMENT measure']
+    for data in (a2l_string, a2l_string.encode('utf-8'), a2l_string.encode('latin-1')):
+        assert list(A2lScanner().tokenize_parallel(data, 2, chunk_size=1)) == list(A2lScanner().tokenize(data))
+        scanner = A2lScanner()
+        scanner.input_parallel(data, 2, chunk_size=1)
+        assert Parser(None, lexer=scanner).tree.json == Parser(a2l_string).tree.json
+    scanner = A2lScanner()
+    scanner.input_parallel(a2l_string.replace('IDENTICAL', ''), 2, chunk_size=1)
+    with pytest.raises(A2lFormatException) as e:
+        Parser(None, lexer=scanner)
+    with pytest.raises(A2lFormatException) as expected:
+        Parser(a2l_string.replace('IDENTICAL', ''))
+    assert str(e.value) == str(expected.value)
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string.encode('utf-8'))
+    assert Parser.from_file(str(path), processes=2).tree.json == Parser(a2l_string).tree.json
+
+
+def test_from_bytes_lexer(tmpdir):
+    from pya2l.parser.grammar.scanner import A2lScanner
+
+    a2l_string = b"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin COMPU_METHOD compu_method_name "" RAT_FUNC "%4.2" "unit" COEFFS 0 1 0 0 0 1 /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT"""
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string)
+    expected = Parser(a2l_string.decode('ascii')).tree.json
+    # the scanner might be given, configured by the caller.
+    for processes in (1, 2):
+        assert Parser.from_bytes(a2l_string, processes=processes, lexer='scanner').tree.json == expected
+        assert Parser.from_file(str(path), processes=processes, lexer=A2lScanner()).tree.json == expected
+        with pytest.raises(A2lFormatException) as e:
+            Parser.from_file(str(path), processes=processes, lexer=A2lScanner(max_string_length=16))
+        assert 'string longer than 16 characters' in str(e.value)
+    # bytes are not scanned by the ply lexer.
+    for function, source in ((Parser.from_bytes, a2l_string), (Parser.from_file, str(path))):
+        with pytest.raises(ValueError) as e:
+            function(source, lexer='ply')
+        assert str(e.value) == "bytes are only scanned by the scanner, not by the lexer 'ply'."
+
+
+def test_node_spans(tmpdir):
+    import io
+
+    a2l_string = u"""ASAP2_VERSION 1 61
+/begin PROJECT project_name "project long identifier"
+    /begin MODULE first_module_name "first module long identifier"
+        /begin RECORD_LAYOUT record_layout_name
+            NO_AXIS_PTS_X 1 UBYTE /* comment */
+            AXIS_PTS_X 2 UWORD INDEX_INCR DIRECT
+        /end RECORD_LAYOUT
+        /begin COMPU_METHOD compu_method_name "\u00b0C" RAT_FUNC "%4.2" "unit"
+            COEFFS 0 1.0 -2. +3e-2 0x1F 0XaB
+        /end COMPU_METHOD
+    /end MODULE
+/end PROJECT
+"""
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string.encode('utf-8'))
+    for a2l, data in ((Parser(a2l_string), a2l_string),
+                      (Parser(a2l_string, lexer='scanner'), a2l_string),
+                      (Parser.from_bytes(a2l_string.encode('utf-8')), a2l_string.encode('utf-8')),
+                      (Parser.from_file(str(path)), a2l_string.encode('utf-8'))):
+        module = a2l.tree.project.module[0]
+        record_layout = module.record_layout[0]
+        compu_method = module.compu_method[0]
+        assert a2l.tree.span == (0, len(data))
+        assert a2l.tree.asap2_version.location == (1, 1)
+        assert module.location == (3, 5) and record_layout.location == (4, 9)
+        assert compu_method.coeffs.location == (9, 13)
+        for node, text in ((module, u'/begin MODULE first_module_name "first module'),
+                           (record_layout.no_axis_pts_x, u'NO_AXIS_PTS_X 1 UBYTE'),
+                           (record_layout.axis_pts_x, u'AXIS_PTS_X 2 UWORD INDEX_INCR DIRECT'),
+                           (compu_method, u'/begin COMPU_METHOD compu_method_name "\u00b0C" RAT_FUNC'),
+                           (compu_method.coeffs, u'COEFFS 0 1.0 -2. +3e-2 0x1F 0XaB')):
+            start, end = node.span
+            span = data[start:end] if isinstance(data, str) else data[start:end].decode('utf-8')
+            assert span.startswith(text)
+            assert span.endswith(u'/end ' + node.node() if span.startswith(u'/begin') else text)
+    assert Parser.from_stream(io.BytesIO(a2l_string.encode('utf-8')), chunk_size=16).tree.project.span is None
+
+    with pytest.raises(A2lFormatException) as e:
+        Parser(a2l_string.replace('RAT_FUNC', ''))
+    assert (e.value.line, e.value.column) == (8, 53)
+    assert 'invalid sequence at position 364 (line 8, column 53)' in str(e.value)
+
+
+def test_descent_engine():
+    import io
+    import os
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pya2l', 'parser', 'example', 'a2l.a2l')
+    with io.open(path, 'rb') as fp:
+        data = fp.read()
+    expected = Parser(data, lexer='scanner', engine='ply').tree
+    tree = Parser(data, lexer='scanner', engine='descent').tree
+    assert tree.json == expected.json
+    assert tree.project.module[0].span == expected.project.module[0].span
+    assert Parser.descent_engine() is Parser.descent_engine()
+
+    # the errors are reported by the ply engine.
+    with pytest.raises(A2lFormatException) as e:
+        Parser('/begin PROJECT project_name "project long identifier" /end MODULE', engine='descent')
+    assert 'invalid sequence at position 59 (line 1, column 60)' in str(e.value)
+
+
+def test_descent_engine_window_and_fallback(monkeypatch):
+    import io
+    from pya2l.parser.grammar import descent
+
+    a2l_string = u"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin COMPU_METHOD first_compu_method "" IDENTICAL "%4.2" "unit" /end COMPU_METHOD
+                /begin COMPU_METHOD second_compu_method "" IDENTICAL "%4.2" "unit" /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT"""
+    expected = Parser(a2l_string, engine='ply').tree
+
+    # the tokens of a stream are read by windows, the ones read before are dropped.
+    monkeypatch.setattr(descent, 'WINDOW_SIZE', 4)
+    windows = list()
+    read = descent.TokenWindow.read
+
+    def tracked_read(window, pos):
+        read(window, pos)
+        windows.append(len(window.types))
+
+    monkeypatch.setattr(descent.TokenWindow, 'read', tracked_read)
+    tree = Parser.from_stream(io.StringIO(a2l_string), 16, engine='descent').tree
+    assert tree.json == expected.json
+    assert tree.project.module[0].compu_method[1]._start == expected.project.module[0].compu_method[1]._start
+    assert len(windows) > 4 and max(windows) <= 4 + 2 * descent.LOOKAHEAD
+
+    # a rule the descent engine does not parse is parsed by the ply engine of the rule.
+    engine = Parser.descent_engine()
+    data = a2l_string[a2l_string.index('/begin COMPU_METHOD'):a2l_string.index('/end MODULE')]
+    tokens = list(Parser.lexers['scanner']()._generate(iter((data,)), raw=True))
+    nodes = engine.parse_rule('module_optional_list', tokens, data)
+
+    def mismatch(*args):
+        raise descent.Mismatch(0)
+
+    monkeypatch.setitem(engine.rules, 'module_optional_list', mismatch)
+    assert [node.json for _, node in engine.parse_rule('module_optional_list', tokens, data)] == \
+        [node.json for _, node in nodes]
+    with pytest.raises(A2lFormatException) as e:
+        engine.parse_rule('module_optional_list', tokens[:-1], data)
+    assert 'invalid sequence at position 0' in str(e.value)
+
+
+def test_action_shapes(monkeypatch):
+    from pya2l.parser.grammar import descent, parser
+    monkeypatch.setattr(descent, 'a2l_node_factory', lambda *args: args)
+    monkeypatch.setattr(parser, 'a2l_node_factory', lambda *args: args)
+    # the value computed by the descent engine after the declared shape of each action is the one computed by it.
+    for production in Parser.engine().productions[1:]:
+        function = getattr(Parser, production.func)
+        symbols = tuple(symbol for symbol in production.str.split()[2:] if symbol != '<empty>')
+        if descent.action_shape(function)[0] in (None, 'node'):
+            continue
+        items = [object() for _ in symbols]
+
+        def values():
+            # the list of a left recursive append is extended by the action.
+            if descent.action_shape(function)[0] == 'append' and len(symbols) == 2:
+                return [[items[0]]] + items[1:]
+            return list(items)
+
+        expected = descent.call_action(function, (production.name,) + symbols, [None] + values())
+        assert descent.value_builder(production.name, symbols, function)(values()) == expected, production.str
+
+    with pytest.raises(ValueError):
+        descent.action('unknown')
+
+
+def test_lazy_parse(tmpdir):
+    import pickle
+    from pya2l.parser.grammar.skeleton import A2lBlock, A2lLazyList, skeleton
+
+    a2l_string = b"""
+        ASAP2_VERSION 1 61
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin MOD_COMMON "comment" BYTE_ORDER MSB_LAST /end MOD_COMMON
+                /begin COMPU_METHOD first_compu_method "/end COMPU_METHOD" RAT_FUNC "%4.2" "unit"
+                    COEFFS 0 1 0 0 0 1
+                /end COMPU_METHOD
+                /* /begin COMPU_METHOD commented_compu_method "" RAT_FUNC "%4.2" "unit" /end COMPU_METHOD */
+                /begin COMPU_METHOD second_compu_method "" TAB_VERB "%4.2" "unit"
+                    COMPU_TAB_REF compu_vtab_name
+                /end COMPU_METHOD
+                /begin COMPU_VTAB compu_vtab_name "" TAB_VERB 1 0 "zero" /end COMPU_VTAB
+            /end MODULE
+        /end PROJECT"""
+    expected = Parser.from_bytes(a2l_string).tree
+
+    project, = skeleton(a2l_string)
+    assert (project.keyword, project.name) == ('PROJECT', 'project_name')
+    assert [(block.keyword, block.name) for block in project.children[0].children] == [
+        ('MOD_COMMON', None), ('COMPU_METHOD', 'first_compu_method'), ('COMPU_METHOD', 'second_compu_method'),
+        ('COMPU_VTAB', 'compu_vtab_name')]
+    start, end = project.children[0].children[1].span
+    assert a2l_string[start:end].startswith(b'/begin COMPU_METHOD first_compu_method')
+    assert a2l_string[start:end].endswith(b'COEFFS 0 1 0 0 0 1\n                /end COMPU_METHOD')
+
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string)
+    for a2l in (Parser(a2l_string.decode('ascii'), lazy=True), Parser.from_bytes(a2l_string, lazy=True),
+                Parser.from_file(str(path), lazy=True)):
+        module = a2l.tree.project.module[0]
+        assert module.mod_common.byte_order == 'MSB_LAST'
+        assert isinstance(module.compu_method, A2lLazyList) and len(module.compu_method) == 2
+        assert all(isinstance(item, A2lBlock) for item in list.__iter__(module.compu_method))
+
+        # the blocks are parsed when accessed, only once.
+        compu_method = module.compu_method.find('second_compu_method')
+        assert compu_method.compu_tab_ref == 'compu_vtab_name' and compu_method._parent is module
+        assert module.compu_method[1] is compu_method and module.compu_method[-1] is compu_method
+        assert isinstance(list.__getitem__(module.compu_method, 0), A2lBlock)
+        assert module.compu_method[0].long_identifier == '/end COMPU_METHOD'
+        assert module.compu_method[0].span == expected.project.module[0].compu_method[0].span
+        assert module.compu_method.find('commented_compu_method') is None
+        assert [node.name for node in a2l.get_node('COMPU_VTAB')] == ['compu_vtab_name']
+        assert a2l.tree.json == expected.json
+
+    # the blocks which are not parsed yet are kept as blocks in a pickled tree, parsed from the file when accessed.
+    tree = pickle.loads(pickle.dumps(Parser.from_file(str(path), lazy=True).tree, pickle.HIGHEST_PROTOCOL))
+    assert isinstance(list.__getitem__(tree.project.module[0].compu_vtab, 0), A2lBlock)
+    assert tree.json == expected.json
+
+    # the errors of a block are reported when it is parsed, the ones of the skeleton by a complete parse.
+    invalid_string = a2l_string.replace(b'TAB_VERB 1 0', b'TAB_VERB 1 ;')
+    with pytest.raises(A2lFormatException) as expected:
+        Parser.from_bytes(invalid_string)
+    a2l = Parser.from_bytes(invalid_string, lazy=True)
+    with pytest.raises(A2lFormatException) as e:
+        a2l.tree.project.module[0].compu_vtab[0]
+    assert (e.value.line, e.value.column) == (expected.value.line, expected.value.column) == (13, 65)
+    with pytest.raises(A2lFormatException) as e:
+        Parser.from_bytes(a2l_string.replace(b'/end MODULE', b''), lazy=True)
+    assert 'invalid sequence' in str(e.value)
+
+
+def test_selective_parse(tmpdir):
+    import io
+    a2l_string = b"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin MOD_PAR "comment" /end MOD_PAR
+                /begin A2ML struct { int; }; /end A2ML
+                /begin MEASUREMENT measurement_name "/end MEASUREMENT" UWORD compu_method_name 0 0 0 1
+                    /* /end MEASUREMENT */ FORMAT "%4.2"
+                /end MEASUREMENT
+                /begin CHARACTERISTIC characteristic_name "" VALUE 0 record_layout_name 0 compu_method_name 0 1
+                    /begin AXIS_DESCR STD_AXIS measurement_name compu_method_name 8 0 255 /end AXIS_DESCR
+                /end CHARACTERISTIC
+                /begin COMPU_METHOD compu_method_name "" RAT_FUNC "%4.2" "unit" /end COMPU_METHOD
+                /begin IF_DATA unsupported 1 2 3 /end IF_DATA
+            /end MODULE
+        /end PROJECT"""
+    expected = Parser.from_bytes(a2l_string).tree.project.module[0]
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string)
+    for a2l in (Parser(a2l_string.decode('ascii'), include={'MEASUREMENT', 'COMPU_METHOD'}),
+                Parser.from_file(str(path), include={'MEASUREMENT', 'COMPU_METHOD'}, processes=None),
+                Parser.from_bytes(a2l_string, exclude={'MOD_PAR', 'A2ML', 'IF_DATA', 'CHARACTERISTIC'}),
+                Parser.from_bytes(a2l_string, include={'MEASUREMENT', 'COMPU_METHOD', 'IF_DATA'}, exclude={'IF_DATA'})):
+        module = a2l.tree.project.module[0]
+        assert module.name == 'first_module_name'
+        assert module.mod_par is None and module.a2ml is None and module.characteristic == []
+        assert module.if_data_module == [] and a2l.get_node('AXIS_DESCR') == []
+        assert module.measurement[0].json == expected.measurement[0].json
+        assert module.measurement[0].span == expected.measurement[0].span
+        assert module.compu_method[0].json == expected.compu_method[0].json
+        assert module._children == [module.measurement[0], module.compu_method[0]]
+
+    # the skipped blocks are not checked.
+    module = Parser.from_bytes(a2l_string.replace(b'1 2 3', b'; ;'), include=set()).tree.project.module[0]
+    assert module.measurement == [] and module.compu_method == []
+    module = Parser.from_bytes(a2l_string, include={'CHARACTERISTIC'}, lazy=True).tree.project.module[0]
+    assert module.characteristic[0].axis_descr[0].json == expected.characteristic[0].axis_descr[0].json
+    assert module.measurement == []
+    with pytest.raises(ValueError):
+        Parser.from_stream(io.BytesIO(a2l_string), include={'MEASUREMENT'})
+    # only the keywords of the child blocks of the modules are selected.
+    for options, option, keywords in ((dict(include={'MEASUREMENT', 'AXIS_DESCR'}), 'include', 'AXIS_DESCR'),
+                                      (dict(exclude={'CHARACTERISTICS'}), 'exclude', 'CHARACTERISTICS'),
+                                      (dict(include={'MODULE', 'PROJECT'}, lazy=True), 'include', 'MODULE, PROJECT')):
+        with pytest.raises(ValueError) as e:
+            Parser.from_bytes(a2l_string, **options)
+        assert str(e.value) == option + ' only selects the child blocks of the modules, not ' + keywords + '.'
+
+
+def test_projection(tmpdir):
+    import pickle
+    from pya2l.parser.cache import A2lCache
+    from pya2l.parser.grammar.node import node_to_class, Characteristic
+
+    a2l_string = b"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin CHARACTERISTIC characteristic_name "long identifier" VALUE 0x10 record_layout_name 0
+                    compu_method_name -1.5 2.5
+                    FORMAT "%4.2"
+                    /begin ANNOTATION ANNOTATION_LABEL "label" /end ANNOTATION
+                    /begin AXIS_DESCR STD_AXIS measurement_name compu_method_name 8 0 255 /end AXIS_DESCR
+                /end CHARACTERISTIC
+            /end MODULE
+        /end PROJECT"""
+    projection = dict(CHARACTERISTIC=('name', 'address', 'lower_limit', 'upper_limit', 'axis_descr'))
+    expected = Parser.from_bytes(a2l_string).tree.project.module[0].characteristic[0]
+    for a2l in (Parser.from_bytes(a2l_string, projection=projection),
+                Parser.from_bytes(a2l_string, projection=projection, lazy=True)):
+        characteristic = a2l.tree.project.module[0].characteristic[0]
+        assert isinstance(characteristic, Characteristic)
+        assert (characteristic.name, characteristic.address) == ('characteristic_name', 0x10)
+        assert (characteristic.lower_limit, characteristic.upper_limit) == (-1.5, 2.5)
+        assert characteristic.axis_descr[0].json == expected.axis_descr[0].json
+        for name in ('long_identifier', 'format', 'annotation'):
+            with pytest.raises(AttributeError) as e:
+                getattr(characteristic, name)
+            assert str(e.value) == name + ' of CHARACTERISTIC is not kept by the projection of the parser.'
+        with pytest.raises(AttributeError) as e:
+            characteristic.format = '%8.4'
+        assert str(e.value) == 'format of CHARACTERISTIC is not kept by the projection of the parser.'
+        assert characteristic.json == dict(node='CHARACTERISTIC', name='characteristic_name', address=0x10,
+                                           lower_limit=-1.5, upper_limit=2.5, axis_descr=[expected.axis_descr[0].json])
+        assert a2l.get_node('ANNOTATION') == [] and len(a2l.get_node('AXIS_DESCR')) == 1
+        tree = pickle.loads(pickle.dumps(a2l.tree, pickle.HIGHEST_PROTOCOL))
+        assert tree.project.module[0].characteristic[0].json == characteristic.json
+    assert node_to_class['CHARACTERISTIC'] is Characteristic
+    assert Parser.from_bytes(a2l_string).tree.project.module[0].characteristic[0].format == '%4.2'
+
+    # the child blocks of the modules whose property is dropped are not scanned, an invalid one is not reported.
+    invalid_string = a2l_string.replace(b'FORMAT "%4.2"', b'FORMAT')
+    with pytest.raises(A2lFormatException):
+        Parser.from_bytes(invalid_string)
+    for a2l in (Parser.from_bytes(invalid_string, projection=dict(MODULE=('name', 'long_identifier'))),
+                Parser.from_bytes(invalid_string, projection=dict(MODULE=('name',)), lazy=True)):
+        module = a2l.tree.project.module[0]
+        assert module.name == 'first_module_name' and module._children == []
+        with pytest.raises(AttributeError):
+            module.characteristic
+
+    # the options given as sets or dicts are keyed in a stable order.
+    assert A2lCache.key(a2l_string, projection=projection, include={'MODULE', 'CHARACTERISTIC'}) == \
+           A2lCache.key(a2l_string, projection=dict(projection), include={'CHARACTERISTIC', 'MODULE'})
+
+    with pytest.raises(ValueError):
+        Parser.from_bytes(a2l_string, projection=dict(CHARACTERISTIC=('name', 'unknown')))
+    with pytest.raises(ValueError):
+        Parser.from_bytes(a2l_string, projection=dict(UNKNOWN=('name',)))
+
+
+def test_parallel_parse(tmpdir, monkeypatch):
+    import pickle
+    import pya2l.parser.grammar.parser as parser_module
+    from pya2l.parser.grammar.node import Characteristic, FixAxisParDist
+    from pya2l.parser.grammar.transfer import encode_nodes, decode_nodes
+
+    # every child block of the modules is a range parsed by a worker.
+    monkeypatch.setattr(parser_module, 'PARALLEL_CHUNK_SIZE', 1)
+    a2l_string = b"""
+        ASAP2_VERSION 1 61
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module_name "first module long identifier"
+                /begin MOD_PAR "comment" /end MOD_PAR
+                /begin MEASUREMENT measurement_name "" UWORD compu_method_name 0 0 0 1
+                    MATRIX_DIM 2 3 4
+                /end MEASUREMENT
+                /begin CHARACTERISTIC characteristic_name "" CURVE 0 record_layout_name 0 compu_method_name 0 1
+                    /begin AXIS_DESCR FIX_AXIS measurement_name compu_method_name 8 0 255
+                        FIX_AXIS_PAR_DIST 0 1 8
+                    /end AXIS_DESCR
+                /end CHARACTERISTIC
+                /begin COMPU_METHOD compu_method_name "" RAT_FUNC "%4.2" "unit" COEFFS 0 1 0 0 0 1 /end COMPU_METHOD
+            /end MODULE
+            /begin MODULE second_module_name "second module long identifier"
+                /begin COMPU_METHOD compu_method_name "" IDENTICAL "%4.2" "unit" /end COMPU_METHOD
+                /begin COMPU_METHOD other_compu_method_name "" IDENTICAL "%4.2" "unit" /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT"""
+    expected = Parser.from_bytes(a2l_string).tree
+    nodes = list()
+
+    def walk(node):
+        nodes.append((node.node(), node.span, node.json, node._parent.node() if node._parent else None))
+        for child in node._children:
+            walk(child)
+        return nodes
+
+    expected_nodes = walk(expected)
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string)
+    for a2l in [Parser.from_bytes(a2l_string, workers=2), Parser.from_file(str(path), workers=None),
+                Parser(a2l_string.decode('ascii'), workers=2)] + Parser.parse_many([str(path)] * 3, workers=2):
+        del nodes[:]
+        assert walk(a2l.tree) == expected_nodes
+        assert a2l.tree.project.module[1].compu_method[1].location == (18, 17)
+        assert a2l.tree.project.module[0].characteristic[0].axis_descr[0].fix_axis_par_dist._parent is \
+               a2l.tree.project.module[0].characteristic[0].axis_descr[0]
+
+    # the options are applied by the workers.
+    projection = dict(CHARACTERISTIC=('name', 'axis_descr'))
+    a2l = Parser.from_bytes(a2l_string, workers=2, projection=projection, exclude={'MEASUREMENT'})
+    characteristic = a2l.tree.project.module[0].characteristic[0]
+    assert isinstance(characteristic, Characteristic) and a2l.tree.project.module[0].measurement == []
+    assert characteristic.json == Parser.from_bytes(a2l_string, projection=projection).tree.project.module[0] \
+        .characteristic[0].json
+    assert Parser.from_bytes(a2l_string, workers=2, keep_lexemes=True).tree.project.module[0].measurement[0] \
+        .lower_limit.lexeme == '0'
+
+    # the errors are the ones of a serial parse.
+    errors = list()
+    for workers in (1, 2):
+        with pytest.raises(A2lFormatException) as e:
+            Parser.from_bytes(a2l_string.replace(b'COEFFS 0 1', b'COEFFS 0'), workers=workers)
+        errors.append(str(e.value))
+    assert errors[0] == errors[1] and '(line 14, column' in errors[1]
+    invalid_path = tmpdir.join('invalid.a2l')
+    invalid_path.write_binary(a2l_string.replace(b'COEFFS 0 1', b'COEFFS 0'))
+    with pytest.raises(A2lFormatException) as e:
+        Parser.parse_many([str(path), str(invalid_path)], workers=2)
+    assert str(e.value) == errors[0]
+
+    # the unset slots, the tuples and the nodes which are not children are kept by the transfer.
+    node = FixAxisParDist(0, 1, 8)
+    value = [node, (1, (2, [node])), [u'a', 1, 2.5, None], ()]
+    decoded = decode_nodes(pickle.loads(pickle.dumps(encode_nodes(value), pickle.HIGHEST_PROTOCOL)))
+    assert decoded[0].json == node.json and not hasattr(decoded[0], 'shift')
+    assert decoded[1][0] == 1 and decoded[1][1][0] == 2 and decoded[1][1][1][0].json == node.json
+    assert decoded[2:] == value[2:]
+
+
+def test_reparse(tmpdir, monkeypatch):
+    import io
+    import pya2l.parser.grammar.parser as parser_module
+
+    # the edits are folded after every second one.
+    monkeypatch.setattr(parser_module, 'MAX_EDITS', 2)
+    a2l_string = u"""
+        ASAP2_VERSION 1 61
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE module_name "module long identifier"
+                /begin MEASUREMENT measurement_name "" UWORD compu_method_name 0 0 0 1
+                    MATRIX_DIM 2 3 4
+                /end MEASUREMENT
+                /begin CHARACTERISTIC characteristic_name "" CURVE 0 record_layout_name 0 compu_method_name 0 1
+                    /begin AXIS_DESCR FIX_AXIS measurement_name compu_method_name 8 0 255
+                        FIX_AXIS_PAR_DIST 0 1 8
+                    /end AXIS_DESCR
+                /end CHARACTERISTIC
+                /begin COMPU_METHOD compu_method_name "" RAT_FUNC "%4.2" "unit" COEFFS 0 1 0 0 0 1 /end COMPU_METHOD
+            /end MODULE
+        /end PROJECT"""
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string.encode('ascii'))
+
+    def walk(node, nodes):
+        nodes.append((node.node(), node.span, node.location, node.json))
+        for child in node._children:
+            walk(child, nodes)
+        return nodes
+
+    def edit(a2l, old, new):
+        data = a2l.tree._source.data
+        offset = data.find(old if isinstance(data, str) else old.encode('ascii'))
+        return a2l.reparse(offset, len(old), new)
+
+    for a2l in (Parser(a2l_string), Parser.from_file(str(path)), Parser.from_file(str(path), lazy=True)):
+        module = a2l.tree.project.module[0]
+        measurement = module.measurement[0]
+        node = edit(a2l, u'"" CURVE', u'"long identifier" CURVE')
+        assert node is module.characteristic[0] and node.long_identifier == 'long identifier'
+        assert node._parent is module and node.axis_descr[0]._parent is node
+        assert module.measurement[0] is measurement
+        node = edit(a2l, u'0 1 8', u'0 2 8')
+        assert node is module.characteristic[0].axis_descr[0] and node.fix_axis_par_dist.distance == 2
+        node = edit(a2l, u'MATRIX_DIM 2 3 4', u'MATRIX_DIM 5 6 7 ')
+        assert node is module.measurement[0] and node.matrix_dim[0] == 5
+        # the positions of the nodes are the ones of a parse of the edited data.
+        expected = walk(Parser(a2l.tree._source.data, lexer='scanner').tree, [])
+        assert walk(a2l.tree, []) == expected
+
+        # an invalid edit leaves the tree as is, its range being parsed again with the next edit.
+        with pytest.raises(A2lFormatException):
+            edit(a2l, u'COEFFS 0 1', u'COEFFS 0 ')
+        assert module.compu_method[0].coeffs.b == 1
+        node = edit(a2l, u'COEFFS 0 ', u'COEFFS 0 3')
+        assert node is module.compu_method[0] and node.coeffs.b == 3
+
+        # the whole data is parsed again if the edit is not in a block.
+        root = edit(a2l, u'ASAP2_VERSION 1 61', u'ASAP2_VERSION 1 70')
+        assert root is a2l.tree and root.asap2_version.upgrade_no == 70
+        assert walk(a2l.tree, []) == walk(Parser(a2l.tree._source.data, lexer='scanner').tree, [])
+
+    a2l = Parser.from_stream(io.StringIO(a2l_string), 16)
+    with pytest.raises(ValueError):
+        a2l.reparse(0, 0, u' ')
+
+
+def test_recover(tmpdir):
+    import io
+    from pya2l.parser import A2lDiagnostic
+    a2l_string = u"""ASAP2_VERSION 1 61
+/begin PROJECT p "project"
+  /begin MODULE m "module"
+    /begin CHARACTERISTIC a "" VALUE 0 DAMOS_SST 0 conv 0 1 /end CHARACTERISTIC
+    /begin CHARACTERISTIC b "" VALUE 0 DAMOS_SST 0 conv 0 XX 1 /end CHARACTERISTIC
+    stray 12
+    /begin CHARACTERISTIC c "" VALUE 0 DAMOS_SST 0 conv 0 1
+    /begin MEASUREMENT d "" UWORD conv 0 0 0 1 /end MEASUREMENT
+    /begin MEASUREMENT e "" UWORD conv 0 0 0 1 $ /end MEASUREMENT
+    /end FOO
+    /begin CHARACTERISTIC f "" VALUE 0 DAMOS_SST 0 conv 0 1
+      /begin AXIS_DESCR STD_AXIS m conv 8 0 255
+    /end CHARACTERISTIC
+  /end MODULE
+/end PROJECT
+"""
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string.encode('ascii'))
+    expected = [((5, 59), 'b "" VALUE 0 DAMOS_SST 0 conv 0 XX', ', CHARACTERISTIC b skipped'),
+                ((6, 5), 'stray 12', 'unexpected tokens at position 240'),
+                ((7, 5), '/begin CHARACTERISTIC c', 'unterminated CHARACTERISTIC block at position 253'),
+                ((9, 48), '$', 'invalid character at position 420'),
+                ((10, 5), '/end FOO', 'unexpected /end at position 443'),
+                ((12, 7), '/begin AXIS_DESCR', 'unterminated AXIS_DESCR block at position 518')]
+    for a2l in (Parser(a2l_string, recover=True), Parser.from_bytes(a2l_string.encode('ascii'), recover=True),
+                Parser.from_file(str(path), recover=True)):
+        module = a2l.tree.project.module[0]
+        assert [c.name for c in module.characteristic] == ['a', 'f']
+        assert [m.name for m in module.measurement] == ['d', 'e']
+        assert module.characteristic[1].axis_descr == []
+        assert len(a2l.diagnostics) == len(expected)
+        for diagnostic, (location, text, message) in zip(a2l.diagnostics, expected):
+            assert isinstance(diagnostic, A2lDiagnostic)
+            assert diagnostic.location == location
+            assert text in a2l_string[diagnostic.start:diagnostic.end]
+            assert diagnostic.message.endswith(message)
+        start, end = module.measurement[1].span
+        assert a2l_string[start:end] == u'/begin MEASUREMENT e "" UWORD conv 0 0 0 1 $ /end MEASUREMENT'
+
+    # a valid file is parsed as usual.
+    a2l = Parser(a2l_string.replace(u'XX', u''), recover=True)
+    with pytest.raises(A2lFormatException):
+        Parser(a2l_string)
+    assert Parser(u'/begin PROJECT p "" /end PROJECT', recover=True).diagnostics == []
+    assert Parser(u'/begin PROJECT p "" /end PROJECT').diagnostics == ()
+    assert len(a2l.diagnostics) == len(expected) - 1
+
+    with pytest.raises(ValueError):
+        Parser.from_stream(io.StringIO(a2l_string), recover=True)
+    with pytest.raises(ValueError):
+        Parser(a2l_string, recover=True, lazy=True)
+
+
+def test_iterparse(tmpdir, monkeypatch):
+    from pya2l.parser.grammar.scanner import A2lScanner
+    a2l_string = b"""
+        ASAP2_VERSION 1 61
+        /begin PROJECT project_name "project long identifier"
+            /begin HEADER "header" VERSION "1.0" /end HEADER
+            /begin MODULE module_name "module long identifier"
+                /begin MOD_PAR "comment" /end MOD_PAR
+                /begin MEASUREMENT first_measurement "" UWORD compu_method_name 0 0 0 1 /end MEASUREMENT
+                /begin CHARACTERISTIC characteristic_name "" CURVE 0 record_layout_name 0 compu_method_name 0 1
+                    /begin AXIS_DESCR STD_AXIS first_measurement compu_method_name 8 0 255 /end AXIS_DESCR
+                /end CHARACTERISTIC
+                /begin MEASUREMENT second_measurement "" UWORD compu_method_name 0 0 0 1 /end MEASUREMENT
+            /end MODULE
+        /end PROJECT"""
+    path = tmpdir.join('file.a2l')
+    path.write_binary(a2l_string)
+    expected = Parser.from_bytes(a2l_string)
+
+    def events(node, nodes):
+        # the root, the project and the modules do not hold the child blocks of the modules.
+        json = node.node() if node.node() in ('ROOT', 'PROJECT', 'MODULE') else node.json
+        nodes.append(('start', node.node(), json))
+        for child in node._children:
+            events(child, nodes)
+        nodes.append(('end', node.node(), json))
+        return nodes
+
+    for source in (a2l_string, str(path)):
+        assert [(event, node.node(), node.node() if node.node() in ('ROOT', 'PROJECT', 'MODULE') else node.json)
+                for event, node in Parser.iterparse(source, ('start', 'end'))] == events(expected.tree, [])
+        measurements = list(Parser.iterparse(source, tags={'MEASUREMENT'}))
+        assert [(event, node.name, node.span) for event, node in measurements] == \
+            [('end', node.name, node.span) for node in expected.get_node('MEASUREMENT')]
+        # the nodes are not kept by their parent, which is given with its header.
+        module = measurements[0][1]._parent
+        assert (module.node(), module.name, module.long_identifier) == \
+            ('MODULE', 'module_name', 'module long identifier')
+        assert module.measurement == [] and module.span == expected.tree.project.module[0].span
+        root = module.get_root()
+        assert root.asap2_version.version_no == 1 and root.project.header.version == '1.0'
+        assert [node.node() for _, node in Parser.iterparse(source, ('start',), tags={'AXIS_DESCR', 'MODULE'})] == \
+            ['MODULE', 'AXIS_DESCR']
+
+    # the file is read by chunks while the nodes are yielded.
+    chunks = list()
+    stream_source = A2lScanner._stream_source
+
+    def counted_stream_source(fp, chunk_size):
+        source, position, decode = stream_source(fp, chunk_size)
+        return (chunks.append(chunk) or chunk for chunk in source), position, decode
+
+    monkeypatch.setattr(A2lScanner, '_stream_source', staticmethod(counted_stream_source))
+    block = b'/begin MEASUREMENT m "" UWORD compu_method_name 0 0 0 1 /end MEASUREMENT\n'
+    path.write_binary(b'/begin PROJECT p "" /begin MODULE m ""\n' + block * 10000 + b'/end MODULE /end PROJECT')
+    iterator = Parser.iterparse(str(path), tags={'MEASUREMENT'}, chunk_size=1024)
+    assert next(iterator)[1].name == 'm' and 0 < len(chunks) < 10
+    assert sum(1 for _ in iterator) == 9999 and len(chunks) > 100
+
+    # the blocks which can not contain any node of tags are not parsed.
+    invalid = a2l_string.replace(b'CURVE 0', b'CURVE ;')
+    assert len(list(Parser.iterparse(invalid, tags={'MEASUREMENT'}))) == 2
+    with pytest.raises(A2lFormatException):
+        list(Parser.iterparse(invalid, tags={'AXIS_DESCR'}))
+    with pytest.raises(A2lFormatException):
+        list(Parser.iterparse(a2l_string.replace(b'/end MODULE', b'')))
+    with pytest.raises(A2lFormatException):
+        list(Parser.iterparse(a2l_string.replace(b'/begin MOD_PAR', b'MOD_PAR')))
+    with pytest.raises(ValueError):
+        list(Parser.iterparse(a2l_string, events=('begin',)))
+
+
+def test_probe(tmpdir):
+    import io
+    import os
+    from pya2l.parser import probe
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pya2l', 'parser', 'example', 'a2l.a2l')
+    with io.open(path, 'rb') as fp:
+        data = fp.read()
+    tree = Parser(data, lexer='scanner').tree
+    for source in (path, data):
+        metadata = probe(source)
+        assert metadata['asap2_version'] == dict(version_no=tree.asap2_version.version_no,
+                                                 upgrade_no=tree.asap2_version.upgrade_no)
+        assert metadata['project']['name'] == tree.project.name
+        assert metadata['project']['version'] == tree.project.header.version
+        assert metadata['project']['project_no'] == tree.project.header.project_no
+        module, = metadata['modules']
+        assert module['name'] == tree.project.module[0].name
+        assert module['epk'] == tree.project.module[0].mod_par.epk
+        assert module['addr_epk'] == tree.project.module[0].mod_par.addr_epk
+        for keyword in ('CHARACTERISTIC', 'MEASUREMENT', 'AXIS_DESCR', 'COMPU_METHOD', 'RECORD_LAYOUT'):
+            assert module['counts'][keyword] == metadata['counts'][keyword] == len(tree.get_node(keyword))
+        assert metadata['counts']['PROJECT'] == metadata['counts']['MODULE'] == 1
+
+    a2l_string = b"""
+        /begin PROJECT project_name "project long identifier"
+            /begin MODULE first_module "" /begin MEASUREMENT m "" UWORD c 0 0 0 1 /end MEASUREMENT /end MODULE
+            /begin MODULE second_module ""
+                /begin MOD_PAR "" EPK "epk" ADDR_EPK 0x10 ADDR_EPK 0x20 /end MOD_PAR
+                /begin CHARACTERISTIC c "" VALUE 0 ; /end CHARACTERISTIC
+            /end MODULE
+        /end PROJECT"""
+    metadata = probe(a2l_string)
+    assert metadata['asap2_version'] is None
+    assert metadata['project'] == dict(name='project_name', long_identifier='project long identifier', version=None,
+                                       project_no=None)
+    # the child blocks of the modules are only counted, they are not checked.
+    assert [(module['name'], module['epk'], module['addr_epk'], module['counts'])
+            for module in metadata['modules']] == \
+        [('first_module', None, [], dict(MEASUREMENT=1)),
+         ('second_module', 'epk', [0x10, 0x20], dict(MOD_PAR=1, CHARACTERISTIC=1))]
+    with pytest.raises(A2lFormatException):
+        probe(a2l_string.replace(b'/end MODULE', b''))
+
+
+def test_type_index():
+    import io
+    import os
+    import pickle
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pya2l', 'parser', 'example', 'a2l.a2l')
+    with io.open(path, 'rb') as fp:
+        data = fp.read()
+
+    def walk(node, node_type, nodes):
+        for child in node._children:
+            if child.node() == node_type:
+                nodes.append(child)
+            walk(child, node_type, nodes)
+        return nodes
+
+    def check(a2l, node_types):
+        module = a2l.tree.project.module[0]
+        for node_type in node_types:
+            for node in (a2l.tree, a2l.tree.project, module, module.characteristic[0]):
+                assert node.get_node(node_type) == walk(node, node_type, [])
+            assert a2l.get_node(node_type) == walk(a2l.tree, node_type, [])
+
+    a2l = Parser.from_bytes(data)
+    node_types = ('CHARACTERISTIC', 'AXIS_DESCR', 'MEASUREMENT', 'UNIT', 'MODULE', 'IF_DATA', 'ASAP2_VERSION')
+    check(a2l, node_types)
+    # the returned lists are copies.
+    a2l.get_node('CHARACTERISTIC').pop()
+    assert len(a2l.get_node('CHARACTERISTIC')) == len(walk(a2l.tree, 'CHARACTERISTIC', []))
+
+    # the index follows the nodes parsed again.
+    axis_descr = a2l.get_node('AXIS_DESCR')[2]
+    a2l.reparse(axis_descr.span[1] - len('/end AXIS_DESCR'), 0, ' ')
+    module = a2l.tree.project.module[0]
+    a2l.reparse(module.span[1] - len('/end MODULE'), 0, '/begin UNIT unit_name "" "x" DERIVED /end UNIT ')
+    assert a2l.tree.project.module[0] is not module and len(a2l.get_node('UNIT')) == 1
+    check(a2l, node_types)
+
+    # the nodes added to the tree drop its index.
+    module = a2l.tree.project.module[0]
+    unit = Parser(u'/begin PROJECT p "" /begin MODULE m "" /begin UNIT other "" "y" DERIVED /end UNIT /end MODULE '
+                  u'/end PROJECT').get_node('UNIT')[0]
+    module.add_properties([('unit', unit)])
+    assert a2l.get_node('UNIT')[-1] is unit
+
+    # so do the nodes added to the root.
+    assert a2l.get_node('A2ML_VERSION') == []
+    version = Parser(u'A2ML_VERSION 1 31').tree.a2ml_version
+    a2l.tree.add_properties([('a2ml_version', version)])
+    assert a2l.get_node('A2ML_VERSION') == [version]
+
+    # the index is stored with the tree.
+    a2l.get_node('UNIT')
+    tree = pickle.loads(pickle.dumps(a2l.tree))
+    assert tree._index is not None
+    assert [node.name for node in tree.get_node('UNIT')] == ['unit_name', 'other']
+
+
+def test_name_index():
+    import pickle
+    a2l_string = u'''/begin PROJECT project_name "" /begin MODULE module_name ""
+        /begin UNIT speed "" "km/h" DERIVED /end UNIT
+        /begin GROUP speed "" /end GROUP
+        /begin UNIT speed "" "m/s" DERIVED /end UNIT
+        /begin FRAME frame_name "" 0 0 /end FRAME
+        /begin COMPU_METHOD identity "" IDENTICAL "%4.2" "" /end COMPU_METHOD
+        /begin UNIT other "" "s" DERIVED /end UNIT
+        /begin UNIT speed "" "mph" DERIVED /end UNIT
+        /end MODULE /end PROJECT'''
+    for lazy in (False, True):
+        a2l = Parser(a2l_string, lazy=lazy)
+        module = a2l.tree.project.module[0]
+        # the names are indexed without parsing the lazy lists.
+        assert module.lookup('UNIT', 'other') is not None
+        assert not lazy or [item.__class__.__name__ for item in list.__iter__(module.unit)] == \
+            ['A2lBlock', 'A2lBlock', 'Unit', 'A2lBlock']
+        assert module.lookup('UNIT', 'speed').display == 'km/h'
+        assert module.lookup('GROUP', 'speed').group_name == 'speed'
+        assert module.lookup('FRAME', 'frame_name') is module.frame
+        assert module.lookup('COMPU_METHOD', 'speed') is None
+        assert module.find('speed') is module.lookup('GROUP', 'speed')
+        assert module.find('identity') is module.compu_method[0]
+        assert module.find('unknown') is None
+        with pytest.raises(ValueError):
+            module.lookup('AXIS_DESCR', 'speed')
+        assert [(d.message, d.line) for d in module.duplicates] == [(u'duplicate UNIT speed in module module_name', 4),
+                                                                   (u'duplicate UNIT speed in module module_name', 8)]
+
+        # the index follows the nodes parsed again.
+        a2l.reparse(a2l.tree.project.module[0].unit[0].span[0] + len('/begin UNIT '), len('speed'), 'first')
+        module = a2l.tree.project.module[0]
+        assert module.lookup('UNIT', 'speed').display == 'm/s'
+        assert module.lookup('UNIT', 'first').display == 'km/h'
+        assert len(module.duplicates) == 1
+
+        # the index is dropped when a node is added.
+        module.add_properties([('unit', Parser(a2l_string).tree.project.module[0].unit[1])])
+        assert module.lookup('UNIT', 'speed').display == 'm/s' and len(module.duplicates) == 2
+        # the nodes renamed directly are not known by the index until it is dropped.
+        module.unit[-1].name = 'renamed'
+        assert module.lookup('UNIT', 'renamed') is None
+        module.unit[-1].drop_indexes()
+        assert module.lookup('UNIT', 'renamed') is module.unit[-1]
+
+        # the index is stored with the tree.
+        module = pickle.loads(pickle.dumps(a2l.tree)).project.module[0]
+        assert module._names is not None and module.lookup('UNIT', 'other').display == 's'
+
+
+def test_references():
+    import pickle
+    a2l_string = u'''/begin PROJECT project_name "" /begin MODULE module_name ""
+        /begin CHARACTERISTIC curve "" CURVE 0 layout 0 method 0 1
+            /begin AXIS_DESCR COM_AXIS speed NO_COMPU_METHOD 8 0 1 AXIS_PTS_REF axis /end AXIS_DESCR
+            /begin AXIS_DESCR CURVE_AXIS speed NO_COMPU_METHOD 8 0 1 CURVE_AXIS_REF missing_curve /end AXIS_DESCR
+        /end CHARACTERISTIC
+        /begin AXIS_PTS axis "" 0 speed layout 0 method 8 0 1 /end AXIS_PTS
+        /begin MEASUREMENT speed "" UBYTE missing_method 0 0 0 1 /end MEASUREMENT
+        /begin COMPU_METHOD method "" TAB_VERB "%4.2" "" COMPU_TAB_REF table REF_UNIT unit /end COMPU_METHOD
+        /begin COMPU_VTAB table "" TAB_VERB 1 0 "zero" /end COMPU_VTAB
+        /begin FUNCTION function "" /begin DEF_CHARACTERISTIC curve axis missing /end DEF_CHARACTERISTIC
+            /begin IN_MEASUREMENT speed /end IN_MEASUREMENT /end FUNCTION
+        /begin GROUP group "" /begin FUNCTION_LIST function /end FUNCTION_LIST /end GROUP
+        /begin RECORD_LAYOUT layout /end RECORD_LAYOUT
+        /begin UNIT unit "" "s" DERIVED /end UNIT
+        /end MODULE /end PROJECT'''
+    for lazy in (False, True):
+        a2l = Parser(a2l_string, lazy=lazy)
+        module = a2l.tree.project.module[0]
+        characteristic = module.characteristic[0]
+        method = characteristic.resolve('conversion')
+        assert method is module.compu_method[0] and characteristic.resolve('conversion') is method
+        assert characteristic.resolve('deposit') is module.record_layout[0]
+        assert method.resolve('compu_tab_ref') is module.compu_vtab[0]
+        assert method.resolve('ref_unit') is module.unit[0]
+        assert characteristic.axis_descr[0].resolve('axis_pts_ref') is module.axis_pts[0]
+        assert characteristic.axis_descr[0].resolve('conversion') is None
+        assert characteristic.axis_descr[1].resolve('curve_axis_ref') is None
+        assert module.function[0].resolve('def_characteristic') == [characteristic, module.axis_pts[0], None]
+        assert module.function[0].resolve('in_measurement') == [module.measurement[0]]
+        assert module.group[0].resolve('function_list') == [module.function[0]]
+        assert module.group[0].resolve('ref_measurement') is None
+        with pytest.raises(ValueError):
+            characteristic.resolve('long_identifier')
+        assert [(d.message, d.line) for d in a2l.resolve_references()] == [
+            (u'dangling reference curve_axis_ref missing_curve of CHARACTERISTIC curve', 4),
+            (u'dangling reference conversion missing_method of MEASUREMENT speed', 7),
+            (u'dangling reference def_characteristic missing of FUNCTION function', 10)]
+
+        # the links are resolved again once the module is changed.
+        a2l.reparse(module.unit[0].span[0] + len('/begin UNIT '), len('unit'), 'other')
+        module = a2l.tree.project.module[0]
+        assert module.compu_method[0].resolve('ref_unit') is None
+        a2l.reparse(module.compu_method[0].span[1] - len('/end COMPU_METHOD'), 0, '\n')
+        assert a2l.tree.project.module[0].measurement[0].resolve('conversion') is None
+        a2l.reparse(module.measurement[0].span[0] + len('/begin MEASUREMENT speed "" UBYTE '), len('missing_method'),
+                    'method')
+        assert module.measurement[0].resolve('conversion') is module.compu_method[0]
+        module = pickle.loads(pickle.dumps(a2l.tree)).project.module[0]
+        assert getattr(module, '_references', None) is None and len(module.resolve_references()) == 3
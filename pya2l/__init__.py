@@ -5,5 +5,6 @@
 @date: 13.04.2018
 """
 
-from .parser import A2lParser, A2lFormatException
+from .version import __version__
+from .parser import A2lParser, A2lFormatException, A2lDiagnostic, A2lCache, probe
 from .cli import main
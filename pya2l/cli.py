@@ -17,10 +17,7 @@ def main():
 
     args = parser.parse_args()
 
-    with open(args.input_file[0], 'r') as fp:
-        data = fp.read()
-
-    a2l = A2lParser(data)
+    a2l = A2lParser.from_file(args.input_file[0])
 
     if args.sub_command == JSON_CMD:
         with open(args.o[0] if args.o is not None else args.input_file[0] + '.json', 'wb') as fp:
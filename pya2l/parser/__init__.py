@@ -5,4 +5,6 @@
 @date: 20.03.2018
 """
 
-from .grammar import A2lParser, A2lFormatException
+from .grammar import A2lParser, A2lFormatException, A2lDiagnostic
+from .cache import A2lCache
+from .metadata import probe
@@ -0,0 +1,182 @@
+"""
+@project: parser
+@file: cache.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+import gc
+import hashlib
+import mmap
+import os
+import pickle
+import tempfile
+
+from ..version import __version__
+from .grammar.parser import A2lParser
+from .grammar.source import A2lSource
+
+# incremented whenever the layout of the stored trees changes without a new version of the package.
+CACHE_FORMAT = 1
+
+DEFAULT_MAX_SIZE = 1 << 30
+
+# options of A2lParser which do not change the resulting tree.
+UNKEYED_OPTIONS = frozenset(('lexer', 'intern_table', 'workers', 'processes', 'engine'))
+
+replace = getattr(os, 'replace', os.rename)
+
+
+def canonical(value):
+    # the options given as sets or dicts (include, projection...) are keyed in a stable order, classes by their name.
+    if isinstance(value, type):
+        return value.__module__ + '.' + value.__name__
+    if isinstance(value, dict):
+        return sorted((canonical(k), canonical(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return sorted(canonical(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    return value
+
+
+def index(tree, lazy=False):
+    # the indexes are stored with the tree, the loaded trees do not walk their nodes again (see get_node and
+    # Module.lookup). the type index of a lazy tree would parse all of its nodes, it is only built when requested.
+    if not lazy:
+        tree.get_index()
+    project = tree.project
+    for module in getattr(project, 'module', None) or ():
+        module.get_names()
+
+
+def default_directory():
+    directory = os.environ.get('PYA2L_CACHE_DIR')
+    if directory:
+        return directory
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'pya2l')
+
+
+class A2lCache(object):
+    """
+    on-disk cache of parsed trees, keyed by the content of the parsed data, the package version and the parser options.
+    entries are written atomically, several processes might share the same directory. the least recently used entries
+    are removed as soon as the total size of the cache exceeds max_size bytes.
+    """
+
+    def __init__(self, directory=None, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory or default_directory()
+        self.max_size = max_size
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                if not os.path.isdir(self.directory):
+                    raise
+
+    def from_file(self, path, **kwargs):
+        with open(path, 'rb') as fp:
+            if not os.fstat(fp.fileno()).st_size:
+                return self.from_bytes(b'', **kwargs)
+            buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                a2l = self.from_bytes(buf, **kwargs)
+            finally:
+                buf.close()
+        a2l.tree._source = A2lSource(path=path)
+        return a2l
+
+    def from_bytes(self, buf, **kwargs):
+        if kwargs.get('recover'):
+            # the diagnostics are not stored with the tree, the data is parsed again.
+            return A2lParser.from_bytes(buf, **kwargs)
+        path = os.path.join(self.directory, self.key(buf, **kwargs) + '.pickle')
+        tree = self.load(path)
+        if tree is None:
+            a2l = A2lParser.from_bytes(buf, **kwargs)
+            index(a2l.tree, kwargs.get('lazy'))
+            self.store(path, a2l.tree)
+        else:
+            a2l = A2lParser.__new__(A2lParser)
+            a2l.tree = tree
+            a2l.tree._source = A2lSource(buf)
+        return a2l
+
+    @staticmethod
+    def key(buf, **kwargs):
+        options = list()
+        for name, value in sorted(kwargs.items()):
+            if name not in UNKEYED_OPTIONS:
+                options.append((name, canonical(value)))
+        digest = hashlib.sha256(repr((__version__, CACHE_FORMAT, options)).encode('utf-8'))
+        digest.update(buf)
+        return digest.hexdigest()
+
+    def load(self, path):
+        try:
+            with open(path, 'rb') as fp:
+                # the garbage collector would otherwise run many times while the nodes are created.
+                enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    tree = pickle.load(fp)
+                finally:
+                    if enabled:
+                        gc.enable()
+        except (IOError, OSError):
+            return None
+        except Exception:
+            # the entry can not be loaded anymore (a custom node class has been moved, for example).
+            self.remove(path)
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return tree
+
+    def store(self, path, tree):
+        try:
+            data = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # custom node classes defined locally can not be pickled, such trees are not cached.
+            return
+        fd, temporary = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(data)
+            replace(temporary, path)
+        except OSError:
+            self.remove(temporary)
+            return
+        self.evict()
+
+    def evict(self):
+        entries = list()
+        for name in os.listdir(self.directory):
+            if name.endswith('.pickle'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            self.remove(path)
+            size -= entry_size
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.pickle'):
+                self.remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def remove(path):
+        # another process might have removed the file already.
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,432 @@
+"""
+@project: a2l_parser
+@file: descent.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+import itertools
+import operator
+
+import ply.yacc as yacc
+
+from .exception import A2lFormatException
+from .node import a2l_node_factory
+from .scanner import A2lScanner
+
+# number of tokens looked at to choose between the alternatives of a rule: the blocks are told apart by the keyword
+# following /begin, a few of them by the token following the keyword.
+LOOKAHEAD = 3
+
+# type of the tokens following the last one, as in ply.
+END = '$end'
+
+# number of tokens read at once from the scanner, the parser holds the tokens of the last reading only.
+WINDOW_SIZE = 4096
+
+
+class Mismatch(Exception):
+    pass
+
+
+# the type, value and position of a token.
+ITEMS = operator.itemgetter(0), operator.itemgetter(1), operator.itemgetter(2)
+
+
+class Types(dict):
+    # the types of the tokens held by a TokenWindow, by index. the tokens following the ones held are read when their
+    # type is first looked at, the tokens following the stream have the type END.
+    __slots__ = 'window',
+
+    def __init__(self, window):
+        super(Types, self).__init__()
+        self.window = window
+
+    def __missing__(self, pos):
+        self.window.read(pos)
+        return self.get(pos, END)
+
+
+class TokenWindow(object):
+    """
+    the tokens of a stream of (type, value, start, end) tuples, read by WINDOW_SIZE as the parser moves on. the
+    parser looks at most LOOKAHEAD tokens ahead and back at the last token it matched only, the tokens read before are
+    dropped when the following ones are read (all but the last 2 * LOOKAHEAD ones). the values and the positions of
+    the tokens are only looked at once their type has been, which reads them.
+    """
+
+    __slots__ = 'tokens', 'types', 'values', 'starts', 'end'
+
+    def __init__(self, tokens):
+        self.tokens = iter(tokens)
+        self.types, self.values, self.starts = Types(self), dict(), dict()
+        # the index following the last token read.
+        self.end = 0
+
+    def read(self, pos):
+        while self.tokens is not None and pos >= self.end:
+            tokens = list(itertools.islice(self.tokens, WINDOW_SIZE))
+            if len(tokens) < WINDOW_SIZE:
+                self.tokens = None
+            kept = range(max(self.end - 2 * LOOKAHEAD, 0), self.end)
+            indices = range(self.end, self.end + len(tokens))
+            self.end += len(tokens)
+            for column, item in zip((self.types, self.values, self.starts), ITEMS):
+                # clearing a dictionary is faster than removing its items one by one.
+                last = [(index, column[index]) for index in kept]
+                column.clear()
+                column.update(last)
+                column.update(zip(indices, map(item, tokens)))
+
+
+class Branch(dict):
+    # a node of a prediction tree, the alternative chosen when no entry matches the next token is stored with None as
+    # key.
+    pass
+
+
+# the shapes of the semantic actions the engine computes without calling them, declared on the productions with their
+# parameters (see action):
+# - select i: the value of the i-th symbol.
+# - factory first end: the node built by a2l_node_factory from the values of the symbols first to end (excluded).
+# - optional: the value of the only symbol, an empty tuple if it is None.
+# - tagged: the type of the only symbol and its value.
+# - append: a list holding the value of the only symbol, or the list of the first symbol with the second appended.
+# - empty: None.
+# - node: any other action building a node, which is called with a ply production.
+# the actions without shape are called with a ply production.
+SHAPES = frozenset(('select', 'factory', 'optional', 'tagged', 'append', 'empty', 'node'))
+
+
+def action(shape, *parameters):
+    """
+    declares the shape (one of SHAPES) of the semantic action of a production, and its parameters. the action must
+    compute the value described by its shape, which the descent engine computes without calling it.
+    """
+    if shape not in SHAPES:
+        raise ValueError('unknown action shape {0}.'.format(shape))
+
+    def declare(function):
+        function.shape = shape, parameters
+        return function
+    return declare
+
+
+def action_shape(function):
+    # the shape declared on the action of a production and its parameters, None if it has none.
+    return getattr(function, 'shape', (None, ()))
+
+
+def builds_node(function):
+    # whether the action of a production returns a node.
+    return action_shape(function)[0] in ('factory', 'node')
+
+
+def first_sets(rules, terminals, k):
+    """
+    returns, for each rule, the set of the sequences of at most k terminals its alternatives can start with. a sequence
+    shorter than k ends with the alternative.
+    """
+    first = dict((name, set()) for name in rules)
+
+    def sequence_first(symbols):
+        result = {()}
+        for symbol in symbols:
+            complete = set(s for s in result if len(s) >= k)
+            incomplete = set(s for s in result if len(s) < k)
+            following = {(symbol,)} if symbol in terminals else first[symbol]
+            result = complete | set((s + f)[:k] for s in incomplete for f in following)
+            if not incomplete:
+                break
+        return result
+
+    changed = True
+    while changed:
+        changed = False
+        for name, alternatives in rules.items():
+            for symbols, _ in alternatives:
+                sequences = sequence_first(symbols)
+                if not sequences <= first[name]:
+                    first[name] |= sequences
+                    changed = True
+    return first, sequence_first
+
+
+def insert(tree, sequence, choice):
+    # the first alternative inserted for a sequence is kept, as ply does for a reduce/reduce conflict.
+    node = tree
+    for depth, symbol in enumerate(sequence):
+        child = node.get(symbol)
+        if depth == len(sequence) - 1:
+            if child is None:
+                node[symbol] = choice
+            elif child.__class__ is Branch:
+                child.setdefault(None, choice)
+            return
+        if child is None:
+            child = node[symbol] = Branch()
+        elif child.__class__ is not Branch:
+            child = node[symbol] = Branch({None: child})
+        node = child
+    tree.setdefault(None, choice)
+
+
+def collapse(node):
+    # a branch leading to a single alternative is replaced by that alternative.
+    for symbol, child in node.items():
+        if child.__class__ is Branch:
+            node[symbol] = collapse(child)
+    choices = set(map(id, node.values()))
+    if len(choices) == 1 and not any(child.__class__ is Branch for child in node.values()):
+        return next(iter(node.values()))
+    return node
+
+
+def predict(tree, types, pos):
+    # walks down the prediction tree, the deepest alternative found on the way is returned if the walk stops early.
+    choice = tree.get(types[pos])
+    default = tree.get(None)
+    while choice.__class__ is Branch:
+        default = choice.get(None, default)
+        pos += 1
+        choice = choice.get(types[pos])
+    return default if choice is None else choice
+
+
+def call_action(function, names, values):
+    # runs an action the engine does not compute with a ply production, as the ply engine does.
+    symbols = list()
+    for name, value in zip(names, values):
+        symbol = yacc.YaccSymbol()
+        symbol.type = name
+        symbol.value = value
+        symbols.append(symbol)
+    function(yacc.YaccProduction(symbols))
+    return symbols[0].value
+
+
+def value_builder(name, symbols, function):
+    """
+    returns the function computing the value of a production of rule name from the list of the values of its symbols,
+    after the shape of its action.
+    """
+    shape, parameters = action_shape(function)
+    if shape == 'select':
+        return operator.itemgetter(parameters[0] - 1)
+    if shape == 'factory':
+        first, end = parameters
+        return lambda values: a2l_node_factory(*values[first - 1:end - 1])
+    if shape == 'optional':
+        return lambda values: tuple() if values[0] is None else values[0]
+    if shape == 'tagged':
+        return lambda values: (symbols[0], values[0])
+    if shape == 'append' and len(symbols) == 2:
+        def append(values):
+            values[0].append(values[1])
+            return values[0]
+        return append
+    if shape == 'append':
+        return lambda values: [values[0]]
+    if shape == 'empty':
+        return lambda values: None
+    names = (name,) + symbols
+    return lambda values: call_action(function, names, [None] + values)
+
+
+def special_production(rules, symbols, function, terminals, recursive):
+    # the function of the most frequent productions, made of a single symbol or extending a list, which is faster than
+    # the one of production_function. None for the other productions.
+    shape = action_shape(function)[0]
+    if recursive and shape == 'append' and len(symbols) == 2 and symbols[1] not in terminals:
+        item = symbols[1]
+
+        def append(T, V, S, pos, left):
+            value, pos = rules[item](T, V, S, pos)
+            left.append(value)
+            return left, pos
+        return append
+    if recursive or len(symbols) != 1:
+        return None
+    symbol, = symbols
+    if symbol in terminals:
+        if shape != 'select':
+            return None
+
+        def terminal(T, V, S, pos):
+            if T[pos] != symbol:
+                raise Mismatch(pos)
+            return V[pos], pos + 1
+        return terminal
+    if shape == 'select':
+        return lambda T, V, S, pos: rules[symbol](T, V, S, pos)
+    if shape == 'tagged':
+        def tagged(T, V, S, pos):
+            value, pos = rules[symbol](T, V, S, pos)
+            return (symbol, value), pos
+        return tagged
+    if shape == 'optional':
+        def optional(T, V, S, pos):
+            value, pos = rules[symbol](T, V, S, pos)
+            return (tuple() if value is None else value), pos
+        return optional
+    if shape == 'append':
+        def first(T, V, S, pos):
+            value, pos = rules[symbol](T, V, S, pos)
+            return [value], pos
+        return first
+    return None
+
+
+def production_function(rules, name, symbols, function, terminals, recursive):
+    """
+    returns the function matching the symbols of a production of rule name from pos, which returns the value of the
+    production and the position of the following token. the value of a left recursive symbol is given to it. the
+    nonterminals are parsed by the functions of rules.
+    """
+    special = special_production(rules, symbols, function, terminals, recursive)
+    if special is not None:
+        return special
+    build = value_builder(name, symbols, function)
+    steps = tuple((symbol, symbol in terminals) for symbol in symbols[1 if recursive else 0:])
+    spans = bool(symbols) and symbols[0] in terminals and builds_node(function)
+
+    def production(T, V, S, pos, *left):
+        if spans:
+            # the position of the first token is read while it is held by the window.
+            if T[pos] != symbols[0]:
+                raise Mismatch(pos)
+            start = S[pos]
+        values = list(left)
+        for symbol, terminal in steps:
+            if terminal:
+                if T[pos] != symbol:
+                    raise Mismatch(pos)
+                values.append(V[pos])
+                pos += 1
+            else:
+                value, pos = rules[symbol](T, V, S, pos)
+                values.append(value)
+        value = build(values)
+        if spans:
+            value._start = start
+            value._last = S[pos - 1]
+        return value, pos
+    return production
+
+
+def rule_function(tree, tails):
+    """
+    returns the function parsing a rule: the production is chosen from the next tokens with the prediction tree of
+    its alternatives, the left recursive alternatives are then matched as long as tails predicts one.
+    """
+    def choice(T, V, S, pos):
+        production = tree.get(T[pos])
+        if production is None or production.__class__ is Branch:
+            production = predict(tree, T, pos)
+            if production is None:
+                raise Mismatch(pos)
+        return production(T, V, S, pos)
+
+    if not tails:
+        return choice
+
+    def loop(T, V, S, pos):
+        value, pos = choice(T, V, S, pos)
+        while True:
+            tail = tails.get(T[pos])
+            if tail is None or tail.__class__ is Branch:
+                tail = predict(tails, T, pos)
+                if tail is None:
+                    return value, pos
+            value, pos = tail(T, V, S, pos, value)
+    return loop
+
+
+class A2lDescentEngine(object):
+    """
+    recursive descent parser built from the productions of the ply grammar, running the same semantic actions. the
+    alternatives of a rule are chosen from the next LOOKAHEAD tokens and the left recursive alternatives (the lists) are
+    parsed as loops. the actions whose shape is declared (see action) are computed by the engine, the other ones are
+    called with a ply production. the tokens are read from the scanner as the parse moves on (see TokenWindow). tokens
+    the engine does not expect are given to the ply engine (fallback, or rule_engine(rule) when a single rule is
+    parsed), which raises the same errors as when parsing alone.
+    """
+
+    def __init__(self, productions, module, fallback, rule_engine):
+        self.fallback = fallback
+        self.rule_engine = rule_engine
+        grammar = dict()
+        for production in productions[1:]:
+            symbols = tuple(symbol for symbol in production.str.split()[2:] if symbol != '<empty>')
+            grammar.setdefault(production.name, list()).append((symbols, getattr(module, production.func)))
+        terminals = set(module.tokens)
+        first, sequence_first = first_sets(grammar, terminals, LOOKAHEAD)
+        self.rules = dict()
+        for name, alternatives in grammar.items():
+            tree, tails = Branch(), Branch()
+            for symbols, function in alternatives:
+                recursive = symbols[:1] == (name,)
+                production = production_function(self.rules, name, symbols, function, terminals, recursive)
+                for sequence in sequence_first(symbols[1:] if recursive else symbols):
+                    insert(tails if recursive else tree, sequence, production)
+            for branches in (tree, tails):
+                for symbol, child in branches.items():
+                    if child.__class__ is Branch:
+                        branches[symbol] = collapse(child)
+            self.rules[name] = production if len(alternatives) == 1 and not tails else rule_function(tree, tails)
+        self.start = self.rules[productions[0].str.split()[2]]
+
+    def parse(self, input=None, lexer=None):
+        if input is not None and isinstance(lexer, A2lScanner):
+            tokens = lexer._generate(*lexer._source(input), raw=True)
+        else:
+            if input is not None:
+                lexer.input(input)
+            tokens = ((token.type, token.value, token.lexpos, None) for token in iter(lexer.token, None))
+        window = TokenWindow(tokens)
+        try:
+            tree, pos = self.start(window.types, window.values, window.starts, 0)
+            if window.types[pos] != END:
+                raise Mismatch(pos)
+            return tree
+        except Mismatch as e:
+            pos, = e.args
+        if input is not None:
+            # the data is scanned again and parsed by the ply engine, which reports the error.
+            return self.fallback.parse(input, lexer=lexer)
+        # the tokens of a stream are not held, the error is reported as the ply engine does.
+        position = window.starts.get(pos)
+        if position is None:
+            raise A2lFormatException('unvalid sequence in root node ', 0, string='')
+        offset = getattr(lexer, 'lexoffset', 0)
+        # the data scanned last might follow the token, which is then reported without its context.
+        raise A2lFormatException('invalid sequence at position ', position,
+                                 string=lexer.lexdata if position >= offset else None, offset=offset)
+
+    def parse_rule(self, rule, tokens, data, offset=0):
+        """
+        returns the value of rule parsed from (type, value, start, end) tokens scanned from data, which must all be
+        part of it. offset is the position of data in the scanned input. tokens the engine does not expect are given to
+        the ply engine of rule (see rule_engine), the error being reported at the token the descent engine stopped at.
+        """
+        # the tokens of a single rule are held as lists, they are given again to the ply engine.
+        tokens = list(tokens)
+        types, values, starts = (list(map(item, tokens)) for item in ITEMS)
+        types.extend([END] * LOOKAHEAD)
+        try:
+            value, pos = self.rules[rule](types, values, starts, 0)
+            if types[pos] == END:
+                return value
+            raise Mismatch(pos)
+        except Mismatch as e:
+            pos, = e.args
+        position = tokens[pos][2] if pos < len(tokens) else offset + len(data)
+        replay = A2lScanner(intern_table=False)
+        replay.input_tokens(tokens, data, offset)
+        try:
+            return self.rule_engine(rule).parse(None, lexer=replay)
+        except A2lFormatException:
+            pass
+        # the tokens of a stream might come from the previous chunks, before data.
+        raise A2lFormatException('invalid sequence at position ', position, string=data if position >= offset else None,
+                                 offset=offset)
@@ -0,0 +1,68 @@
+"""
+@project: a2l_parser
+@file: exception.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+
+class A2lFormatException(Exception):
+    def __init__(self, message, position, string=None, offset=0):
+        self.value = str(message) + str(position)
+        # the message without the location and the context of the error.
+        self.reason = self.value
+        self.position = position
+        self.line = self.column = None
+        if string:
+            position -= offset
+            # the line is only known if string holds the data from its beginning (it does not for a stream).
+            if not offset:
+                # source imports the scanner, which raises these exceptions.
+                from .source import newline_offsets, offset_location
+                self.line, self.column = offset_location(newline_offsets(string, position), position)
+                self.value += ' (line ' + str(self.line) + ', column ' + str(self.column) + ')'
+            delta = 120
+            s = position - delta if position >= delta else 0
+            e = position + delta if len(string) >= position + delta else -1
+            substring = string[s:e]
+            if isinstance(substring, (bytes, bytearray)) and not isinstance(substring, str):
+                substring = substring.decode('latin-1')
+            substring = substring.replace('\r', ' ').replace('\n', ' ')
+            indicator = ' ' * (delta if position >= delta else position) + '^'
+            self.value += '\r\n\t' + ('...' if s else '   ') + substring + '\r\n\t   ' + indicator
+
+        super(A2lFormatException, self).__init__(self.value)
+
+    def __reduce__(self):
+        # the message is already formatted, the exception is rebuilt from it (when raised in another process).
+        return A2lFormatException, (self.value, ''), dict(reason=self.reason, position=self.position, line=self.line,
+                                                          column=self.column)
+
+
+class A2lDiagnostic(object):
+    """
+    problem found by a recovering parse (see the recover option of A2lParser): its message, the offset of the error in
+    the data and its line and column (both starting at 1), and the offsets of the first character and following the last
+    one of the data which has been skipped.
+    """
+
+    __slots__ = 'message', 'position', 'start', 'end', 'line', 'column'
+
+    def __init__(self, message, position, start, end):
+        self.message = message
+        self.position = position
+        self.start = start
+        self.end = end
+        self.line = self.column = None
+
+    def get_span(self):
+        return self.start, self.end
+
+    def get_location(self):
+        return self.line, self.column
+
+    def __repr__(self):
+        return 'A2lDiagnostic({0!r}, {1!r}, {2!r}, {3!r})'.format(self.message, self.position, self.start, self.end)
+
+    span = property(fget=get_span)
+    location = property(fget=get_location)
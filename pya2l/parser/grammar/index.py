@@ -0,0 +1,209 @@
+"""
+@project: a2l_parser
+@file: index.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+from .skeleton import A2lBlock
+
+# the types of the nodes whose descendants are indexed by type.
+INDEXED_TYPES = frozenset(('ROOT', 'PROJECT', 'MODULE'))
+
+
+def subtree(node):
+    # the nodes of the subtree of node, in the order of the data (the children of the lazy lists being parsed).
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        yield node
+        pending.extend(reversed(node._children))
+
+
+def first_after(nodes, position, source):
+    # the index of the first of nodes, which are in the order of the data, starting after position.
+    low, high = 0, len(nodes)
+    while low < high:
+        middle = (low + high) // 2
+        if source.offsets(nodes[middle])[0] <= position:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+class A2lTypeIndex(object):
+    """
+    lists of the nodes of a tree by type (as returned by node()), in the order of the data, for the descendants of the
+    root, of the project and of each module of the tree. built in one walk of the tree, it is kept up to date by
+    replace when a node is parsed again (see A2lParser.reparse).
+    """
+
+    __slots__ = 'containers',
+
+    def __init__(self, tree):
+        # the lists by type of the indexed nodes.
+        self.containers = dict()
+        self.add(tree, ())
+
+    def add(self, node, ancestors):
+        # indexes the subtree of node, whose nodes are appended to the lists by type of ancestors.
+        pending = [(node, ancestors)]
+        while pending:
+            node, ancestors = pending.pop()
+            node_type = node.node()
+            for types in ancestors:
+                if node_type in types:
+                    types[node_type].append(node)
+                else:
+                    types[node_type] = [node]
+            if node._node in INDEXED_TYPES:
+                self.containers[node] = types = dict()
+                ancestors = ancestors + (types,)
+            pending.extend((child, ancestors) for child in reversed(node._children))
+
+    def get(self, node, node_type):
+        """
+        returns the list of the descendants of node of type node_type, None if the descendants of node are not indexed.
+        """
+        types = self.containers.get(node)
+        if types is None:
+            return None
+        return types.get(node_type, ())
+
+    def replace(self, old, new, source):
+        """
+        replaces the nodes of the subtree of old by the ones of the subtree of new, which takes its place in the tree.
+        source gives the positions of the nodes in the current data.
+        """
+        ancestors = list()
+        parent = new._parent
+        while parent is not None:
+            if parent in self.containers:
+                ancestors.append(self.containers[parent])
+            parent = parent._parent
+        removed = dict()
+        for node in subtree(old):
+            removed.setdefault(node.node(), set()).add(id(node))
+            self.containers.pop(node, None)
+        added = dict()
+        self.add(new, (added,))
+        for types in ancestors:
+            for node_type, identifiers in removed.items():
+                if node_type in types:
+                    types[node_type] = [node for node in types[node_type] if id(node) not in identifiers]
+            for node_type, nodes in added.items():
+                if node_type in types:
+                    items = types[node_type]
+                    index = first_after(items, source.offsets(nodes[0])[0], source)
+                    items[index:index] = nodes
+                else:
+                    types[node_type] = list(nodes)
+
+
+# the types of the child nodes of the modules indexed by name, with the attribute of the module holding them and the
+# property holding their name. a name is looked for in the types in this order by A2lNameIndex.find.
+NAMED_TYPES = (('CHARACTERISTIC', 'characteristic', 'name'), ('MEASUREMENT', 'measurement', 'name'),
+               ('AXIS_PTS', 'axis_pts', 'name'), ('COMPU_METHOD', 'compu_method', 'name'),
+               ('COMPU_TAB', 'compu_tab', 'name'), ('COMPU_VTAB', 'compu_vtab', 'name'),
+               ('COMPU_VTAB_RANGE', 'compu_vtab_range', 'name'), ('RECORD_LAYOUT', 'record_layout', 'name'),
+               ('FUNCTION', 'function', 'name'), ('GROUP', 'group', 'group_name'), ('UNIT', 'unit', 'name'),
+               ('FRAME', 'frame', 'name'))
+
+NAMED_ATTRIBUTES = dict((attribute, (node_type, name)) for node_type, attribute, name in NAMED_TYPES)
+TYPE_ATTRIBUTES = dict((node_type, attribute) for node_type, attribute, _ in NAMED_TYPES)
+
+
+def item_name(item, name):
+    # the name of an item of a list of a module, which might be a block of the skeleton (see the lazy mode).
+    if item.__class__ is A2lBlock:
+        if item.node is None:
+            return item.name
+        item = item.node
+    return getattr(item, name, None)
+
+
+class A2lNameIndex(object):
+    """
+    positions of the named child nodes of a module (see NAMED_TYPES) in its attributes, by type and name. the blocks of
+    the lists of a module parsed in lazy mode are indexed by the name found by the skeleton, only the node which is
+    looked up is parsed. the positions of the nodes whose name is already used in the same type are kept as duplicates,
+    the first node being the one looked up.
+    """
+
+    __slots__ = 'names', 'duplicates'
+
+    def __init__(self, module):
+        self.names = dict()
+        self.duplicates = dict()
+        for node_type, attribute, name in NAMED_TYPES:
+            self.names[node_type] = dict()
+            # the attribute might be dropped by the projection of the parser.
+            value = getattr(module, attribute, None)
+            if isinstance(value, list):
+                for position, item in enumerate(list.__iter__(value)):
+                    self.add(node_type, item_name(item, name), position)
+            elif value is not None:
+                self.add(node_type, item_name(value, name), None)
+
+    def add(self, node_type, name, position):
+        if name is None:
+            return
+        names = self.names[node_type]
+        if name not in names:
+            names[name] = position
+            return
+        duplicates = self.duplicates.setdefault(node_type, dict()).setdefault(name, list())
+        if position < names[name]:
+            names[name], position = position, names[name]
+        duplicates.append(position)
+        duplicates.sort()
+
+    def remove(self, node_type, name, position):
+        if name is None:
+            return
+        duplicates = self.duplicates.get(node_type, dict())
+        if self.names[node_type].get(name) == position:
+            if name in duplicates:
+                self.names[node_type][name] = duplicates[name].pop(0)
+            else:
+                del self.names[node_type][name]
+        elif name in duplicates:
+            duplicates[name].remove(position)
+        if not duplicates.get(name, True):
+            del duplicates[name]
+
+    def get(self, module, node_type, name):
+        """
+        returns the child node of module of type node_type named name, None if there is none. raises a ValueError if
+        node_type is not indexed by name.
+        """
+        if node_type not in self.names:
+            raise ValueError('{0} is not indexed by name.'.format(node_type))
+        if name not in self.names[node_type]:
+            return None
+        position = self.names[node_type][name]
+        value = getattr(module, TYPE_ATTRIBUTES[node_type])
+        return value if position is None else value[position]
+
+    def find(self, module, name):
+        """
+        returns the first child node of module named name, in the order of the types of NAMED_TYPES, or None.
+        """
+        for node_type, _, _ in NAMED_TYPES:
+            node = self.get(module, node_type, name)
+            if node is not None:
+                return node
+        return None
+
+    def replace(self, attribute, position, old, new):
+        """
+        updates the index once the item at position (None for a single node) of attribute has been replaced by new.
+        """
+        if attribute not in NAMED_ATTRIBUTES:
+            return
+        node_type, name = NAMED_ATTRIBUTES[attribute]
+        old_name, new_name = item_name(old, name), item_name(new, name)
+        if old_name != new_name:
+            self.remove(node_type, old_name, position)
+            self.add(node_type, new_name, position)
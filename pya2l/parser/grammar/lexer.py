@@ -5,9 +5,46 @@
 @date: 20.03.2018
 """
 
-import os
 import ply.lex as lex
 
+from .exception import A2lFormatException
+
+# longest comment and string accepted, in characters (or bytes, for a bytes-like input). None disables the check.
+MAX_COMMENT_LENGTH = 1 << 26
+MAX_STRING_LENGTH = 1 << 20
+
+
+class A2lInt(int):
+    def __new__(cls, value, lexeme):
+        self = super(A2lInt, cls).__new__(cls, value)
+        self.lexeme = lexeme
+        return self
+
+    def __getnewargs__(self):
+        return int(self), self.lexeme
+
+
+class A2lFloat(float):
+    def __new__(cls, value, lexeme):
+        self = super(A2lFloat, cls).__new__(cls, value)
+        self.lexeme = lexeme
+        return self
+
+    def __getnewargs__(self):
+        return float(self), self.lexeme
+
+
+def decode_numeric(lexeme, keep_lexeme=False):
+    # the literal has already been matched by the NUMERIC rule, so it is classified from its characters only.
+    # hexadecimal digits include 'e', the prefix must be looked for first.
+    if 'x' in lexeme or 'X' in lexeme:
+        value, cls = int(lexeme, 16), A2lInt
+    elif '.' in lexeme or 'e' in lexeme or 'E' in lexeme:
+        value, cls = float(lexeme), A2lFloat
+    else:
+        value, cls = int(lexeme, 10), A2lInt
+    return cls(value, lexeme) if keep_lexeme else value
+
 
 class KeywordsList(dict):
     def __init__(self, keywords):
@@ -423,14 +460,32 @@ tokens = list(keywords.values()) + [
 t_ignore = ' \t\r\n'
 
 
-@lex.TOKEN(r'(/\*(.|\n)*?\*/)')
+def check_length(token, kind, maximum):
+    if maximum is not None and len(token.value) > maximum:
+        raise A2lFormatException(kind + ' longer than ' + str(maximum) + ' characters at position ', token.lexpos,
+                                 string=token.lexer.lexdata, offset=token.lexer.lexoffset)
+
+
+def unterminated(token, kind):
+    raise A2lFormatException('unterminated ' + kind + ' at position ', token.lexpos, string=token.lexer.lexdata,
+                             offset=token.lexer.lexoffset)
+
+
+# the comment and string patterns are unrolled (no alternation per character), they run in linear time whether the
+# construct is terminated or not. an unterminated construct is reported as soon as its opening character is seen.
+@lex.TOKEN(r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/')
 def t_ignore_C_COMMENT(token):
-    pass
+    check_length(token, 'comment', token.lexer.max_comment_length)
+
 
+@lex.TOKEN(r'/\*')
+def t_ignore_UNTERMINATED_C_COMMENT(token):
+    unterminated(token, 'comment')
 
-@lex.TOKEN(r'(\/{2}.+\n)')
+
+@lex.TOKEN(r'//[^\n]*')
 def t_ignore_CPP_COMMENT(token):
-    pass
+    check_length(token, 'comment', token.lexer.max_comment_length)
 
 
 t_PARENTHESE_OPEN = r'\('
@@ -455,21 +510,23 @@ def t_end(token):
     return token
 
 
-@lex.TOKEN(r'"(?:[^"\\]|\\.)*"')
+@lex.TOKEN(r'"[^"\\]*(?:\\.[^"\\]*)*"')
 def t_STRING(token):
+    check_length(token, 'string', token.lexer.max_string_length)
     token.value = token.value[1:-1]
+    if token.lexer.intern_table is not None:
+        token.value = token.lexer.intern_table.setdefault(token.value, token.value)
     return token
 
 
+@lex.TOKEN(r'"')
+def t_ignore_UNTERMINATED_STRING(token):
+    unterminated(token, 'string')
+
+
 @lex.TOKEN(r'[+-]?(([0]{1}[Xx]{1}[A-Fa-f0-9]+)|(\d+(\.(\d*([eE][+-]?\d+)?)?|([eE][+-]?\d+)?)?))')
 def t_NUMERIC(token):
-    try:
-        token.value = int(token.value, 10)
-    except ValueError:
-        try:
-            token.value = int(token.value, 16)
-        except ValueError:
-            token.value = float(token.value)
+    token.value = decode_numeric(token.value, token.lexer.keep_lexemes)
     return token
 
 
@@ -479,6 +536,8 @@ def t_IDENT(token):
         token.type = keywords[token.value.split('[')[0]]
     except KeyError:
         pass
+    if token.lexer.intern_table is not None:
+        token.value = token.lexer.intern_table.setdefault(token.value, token.value)
     return token
 
 
@@ -487,4 +546,29 @@ def t_error(token):
     token.lexer.skip(1)
 
 
-lexer = lex.lex(optimize=True, outputdir=os.path.dirname(os.path.realpath(__file__)), lextab='lextab')
+# the master regular expression is built from the rules above when the module is imported, no table is read from or
+# written to the package directory.
+lexer = lex.lex()
+lexer.keep_lexemes = False
+lexer.max_comment_length = MAX_COMMENT_LENGTH
+lexer.max_string_length = MAX_STRING_LENGTH
+lexer.intern_table = None
+lexer.lexoffset = 0
+
+
+def make_intern_table(intern_table=None):
+    # identifiers and strings (conversion names, units, formats...) repeat a lot, only one instance of each value is
+    # kept. None gives a table per parse, False disables interning and a dict is shared by the parses it is given to.
+    if intern_table is None:
+        return dict()
+    return None if intern_table is False else intern_table
+
+
+def clone_lexer(keep_lexemes=False, max_comment_length=MAX_COMMENT_LENGTH, max_string_length=MAX_STRING_LENGTH,
+                intern_table=None):
+    clone = lexer.clone()
+    clone.keep_lexemes = keep_lexemes
+    clone.max_comment_length = max_comment_length
+    clone.max_string_length = max_string_length
+    clone.intern_table = make_intern_table(intern_table)
+    return clone
@@ -1,10 +0,0 @@
-# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
-_tabversion   = '3.10'
-_lextokens    = set(('A2ML', 'A2ML_VERSION', 'ABSOLUTE', 'ADDRESS_EXTENSION_DAQ', 'ADDRESS_EXTENSION_FREE', 'ADDRESS_EXTENSION_ODT', 'ADDRESS_MAPPING', 'ADDR_EPK', 'ALIGNMENT_BYTE', 'ALIGNMENT_FLOAT32_IEEE', 'ALIGNMENT_FLOAT64_IEEE', 'ALIGNMENT_INT64', 'ALIGNMENT_LONG', 'ALIGNMENT_WORD', 'ALTERNATE_CURVES', 'ALTERNATE_WITH_X', 'ALTERNATE_WITH_Y', 'ANNOTATION', 'ANNOTATION_LABEL', 'ANNOTATION_ORIGIN', 'ANNOTATION_TEXT', 'ARRAY_SIZE', 'ASAP2_VERSION', 'ASCII', 'ASTERISK', 'AVAILABLE_EVENT_LIST', 'AXIS_DESCR', 'AXIS_PTS', 'AXIS_PTS_REF', 'AXIS_PTS_X', 'AXIS_PTS_Y', 'AXIS_PTS_Z', 'AXIS_RESCALE_X', 'AXIS_RESCALE_Y', 'AXIS_RESCALE_Z', 'A_INT64', 'A_UINT64', 'BAUDRATE', 'BA_BLOB', 'BIT_MASK', 'BIT_OPERATION', 'BRACE_CLOSE', 'BRACE_OPEN', 'BTL_CYCLES', 'BYTE', 'BYTE_ORDER', 'CALIBRATION', 'CALIBRATION_ACCESS', 'CALIBRATION_HANDLE', 'CALIBRATION_METHOD', 'CALIBRATION_VARIABLES', 'CAN_ID_BROADCAST', 'CAN_ID_MASTER', 'CAN_ID_SLAVE', 'CHARACTERISTIC', 'CHECKSUM', 'CODE', 'COEFFS', 'COEFFS_LINEAR', 'COLUMN_DIR', 'COMMA', 'COMPARISON_QUANTITY', 'COMPU_METHOD', 'COMPU_TAB', 'COMPU_TAB_REF', 'COMPU_VTAB', 'COMPU_VTAB_RANGE', 'COM_AXIS', 'CPU_TYPE', 'CUBOID', 'CURLY_CLOSE', 'CURLY_OPEN', 'CURVE', 'CURVE_AXIS', 'CURVE_AXIS_REF', 'CUSTOMER', 'CUSTOMER_NO', 'DAQ', 'DAQ_EVENT', 'DAQ_LIST', 'DAQ_LIST_CAN_ID', 'DAQ_LIST_TYPE', 'DAQ_STIM', 'DATA', 'DATA_SIZE', 'DEFAULT_EVENT_LIST', 'DEFAULT_VALUE', 'DEFAULT_VALUE_NUMERIC', 'DEF_CHARACTERISTIC', 'DEPENDENT_CHARACTERISTIC', 'DEPOSIT', 'DERIVED', 'DIFFERENCE', 'DIRECT', 'DISPLAY_IDENTIFIER', 'DIST_OP_X', 'DIST_OP_Y', 'DIST_OP_Z', 'DP_BLOB', 'DUAL', 'DYNAMIC', 'ECU', 'ECU_ADDRESS', 'ECU_ADDRESS_EXTENSION', 'ECU_CALIBRATION_OFFSET', 'EEPROM', 'EPK', 'EPROM', 'EQUAL', 'ERROR_MASK', 'EVENT', 'EVENT_FIXED', 'EVENT_GROUP', 'EXCLUDE_FROM_FLASH', 'EXTENDED_LIMITS', 'EXTENDED_SI', 'EXTERN', 'FIRST_PID', 'FIXED', 'FIXED_EVENT_LIST', 'FIX_AXIS', 'FIX_AXIS_PAR', 'FIX_AXIS_PAR_DIST', 'FIX_AXIS_PAR_LIST', 'FIX_NO_AXIS_PTS_X', 'FIX_NO_AXIS_PTS_Y', 'FIX_NO_AXIS_PTS_Z', 'FLASH', 'FLOAT32_IEEE', 'FLOAT64_IEEE', 'FNC_VALUES', 'FORM', 'FORMAT', 'FORMULA', 'FORMULA_INV', 'FRAME', 'FRAME_MEASUREMENT', 'FREEZE_SUPPORTED', 'FUNCTION', 'FUNCTION_LIST', 'FUNCTION_VERSION', 'GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE', 'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG', 'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD', 'GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD', 'GRANULARITY_ODT_ENTRY_SIZE_STIM_BYTE', 'GROUP', 'GUARD_RAILS', 'HEADER', 'IDENT', 'IDENTICAL', 'IDENTIFICATION', 'IDENTIFICATION_FIELD_TYPE_ABSOLUTE', 'IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE', 'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD', 'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED', 'IF_DATA', 'INDEX_DECR', 'INDEX_INCR', 'INIT_SEGMENT', 'INTERN', 'IN_MEASUREMENT', 'KP_BLOB', 'LEFT_SHIFT', 'LINEAR', 'LOC_MEASUREMENT', 'LONG', 'MAP', 'MAP_LIST', 'MATRIX_DIM', 'MAX_BLOCK_SIZE', 'MAX_GRAD', 'MAX_ODT', 'MAX_ODT_ENTRIES', 'MAX_REFRESH', 'MEASUREMENT', 'MEMORY_LAYOUT', 'MEMORY_SEGMENT', 'MODULE', 'MOD_COMMON', 'MOD_PAR', 'MONOTONY', 'MON_DECREASE', 'MON_INCREASE', 'MSB_FIRST', 'MSB_LAST', 'NOT_IN_MCD_SYSTEM', 'NO_AXIS_PTS_X', 'NO_AXIS_PTS_Y', 'NO_AXIS_PTS_Z', 'NO_CALIBRATION', 'NO_OF_INTERFACES', 'NO_OVERLOAD_INDICATION', 'NO_RESCALE_X', 'NO_RESCALE_Y', 'NO_RESCALE_Z', 'NUMBER', 'NUMERIC', 'OFFLINE_CALIBRATION', 'OFFLINE_DATA', 'OFFSET_X', 'OFFSET_Y', 'OFFSET_Z', 'OPTIMISATION_TYPE_DEFAULT', 'OPTIMISATION_TYPE_MAX_ENTRY_SIZE', 'OPTIMISATION_TYPE_ODT_TYPE_16', 'OPTIMISATION_TYPE_ODT_TYPE_32', 'OPTIMISATION_TYPE_ODT_TYPE_64', 'OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT', 'OUT_MEASUREMENT', 'OVERLOAD_INDICATION_EVENT', 'OVERLOAD_INDICATION_PID', 'PAG', 'PAGE', 'PARENTHESE_CLOSE', 'PARENTHESE_OPEN', 'PA_BLOB', 'PBYTE', 'PGM', 'PHONE_NO', 'PLONG', 'PRESCALER_SUPPORTED', 'PRG_CODE', 'PRG_DATA', 'PRG_RESERVED', 'PROJECT', 'PROJECT_NO', 'PROTOCOL_LAYER', 'PWORD', 'QP_BLOB', 'RAM', 'RASTER', 'RAT_FUNC', 'READ_ONLY', 'READ_WRITE', 'RECORD_LAYOUT', 'REF_CHARACTERISTIC', 'REF_GROUP', 'REF_MEASUREMENT', 'REF_MEMORY_SEGMENT', 'REF_UNIT', 'REGISTER', 'RESERVED', 'RESUME_SUPPORTED', 'RES_AXIS', 'RIGHT_SHIFT', 'RIP_ADDR_W', 'RIP_ADDR_X', 'RIP_ADDR_Y', 'RIP_ADDR_Z', 'ROM', 'ROOT', 'ROW_DIR', 'SAMPLE_POINT', 'SAMPLE_RATE', 'SBYTE', 'SECTOR', 'SEED_KEY', 'SEGMENT', 'SEMICOLON', 'SERAM', 'SHIFT_OP_X', 'SHIFT_OP_Y', 'SHIFT_OP_Z', 'SIGN_EXTEND', 'SINGLE', 'SI_EXPONENTS', 'SJW', 'SLONG', 'SOURCE', 'SRC_ADDR_X', 'SRC_ADDR_Y', 'SRC_ADDR_Z', 'STATIC', 'STD_AXIS', 'STIM', 'STRICT_DECREASE', 'STRICT_INCREASE', 'STRING', 'SUB_FUNCTION', 'SUB_GROUP', 'SUPPLIER', 'SWORD', 'SYMBOL_LINK', 'SYNC_EDGE', 'SYSTEM_CONSTANT', 'S_REC_LAYOUT', 'TAB_INTP', 'TAB_NOINTP', 'TAB_VERB', 'TIMESTAMP_FIXED', 'TIMESTAMP_SUPPORTED', 'TP_BLOB', 'TRIPLE', 'UBYTE', 'ULONG', 'UNIT', 'UNIT_CONVERSION', 'USER', 'USER_RIGHTS', 'UWORD', 'VALUE', 'VAL_BLK', 'VARIABLE', 'VARIABLES', 'VARIANT_CODING', 'VAR_ADDRESS', 'VAR_CHARACTERISTIC', 'VAR_CRITERION', 'VAR_FORBIDDEN_COMB', 'VAR_MEASUREMENT', 'VAR_NAMING', 'VAR_SELECTION_CHARACTERISTIC', 'VAR_SEPARATOR', 'VERSION', 'VIRTUAL', 'VIRTUAL_CHARACTERISTIC', 'WORD', 'XCP', 'XCP_ON_CAN', 'begin', 'block', 'char', 'double', 'end', 'enum', 'float', 'int', 'long', 'struct', 'taggedstruct', 'taggedunion', 'uchar', 'uint', 'ulong'))
-_lexreflags   = 64
-_lexliterals  = ''
-_lexstateinfo = {'INITIAL': 'inclusive'}
-_lexstatere   = {'INITIAL': [('(?P<t_ignore_C_COMMENT>(/\\*(.|\\n)*?\\*/))|(?P<t_ignore_CPP_COMMENT>(\\/{2}.+\\n))|(?P<t_begin>(\\/begin))|(?P<t_end>(\\/end))|(?P<t_STRING>"(?:[^"\\\\]|\\\\.)*")|(?P<t_NUMERIC>[+-]?(([0]{1}[Xx]{1}[A-Fa-f0-9]+)|(\\d+(\\.(\\d*([eE][+-]?\\d+)?)?|([eE][+-]?\\d+)?)?)))|(?P<t_IDENT>[A-Za-z_][A-Za-z0-9_\\.\\[\\]]*)|(?P<t_PARENTHESE_OPEN>\\()|(?P<t_PARENTHESE_CLOSE>\\))|(?P<t_CURLY_OPEN>\\{)|(?P<t_CURLY_CLOSE>\\})|(?P<t_BRACE_OPEN>\\[)|(?P<t_BRACE_CLOSE>\\])|(?P<t_ASTERISK>\\*)|(?P<t_SEMICOLON>;)|(?P<t_EQUAL>=)|(?P<t_COMMA>,)', [None, ('t_ignore_C_COMMENT', 'ignore_C_COMMENT'), None, None, ('t_ignore_CPP_COMMENT', 'ignore_CPP_COMMENT'), None, ('t_begin', 'begin'), None, ('t_end', 'end'), None, ('t_STRING', 'STRING'), ('t_NUMERIC', 'NUMERIC'), None, None, None, None, None, None, None, ('t_IDENT', 'IDENT'), (None, 'PARENTHESE_OPEN'), (None, 'PARENTHESE_CLOSE'), (None, 'CURLY_OPEN'), (None, 'CURLY_CLOSE'), (None, 'BRACE_OPEN'), (None, 'BRACE_CLOSE'), (None, 'ASTERISK'), (None, 'SEMICOLON'), (None, 'EQUAL'), (None, 'COMMA')])]}
-_lexstateignore = {'INITIAL': ' \t\r\n'}
-_lexstateerrorf = {'INITIAL': 't_error'}
-_lexstateeoff = {}
@@ -5,9 +5,29 @@
 @date: 05.04.2018
 """
 
+import contextlib
+import threading
+
+from .exception import A2lDiagnostic
+from .index import A2lNameIndex, A2lTypeIndex, INDEXED_TYPES, NAMED_TYPES
+from .reference import A2lReferences
+
+# the slots which are not pickled: the resolved references are looked up again when requested. the indexes are pickled
+# with the tree (see A2lCache.store).
+TRANSIENT = frozenset(('_references',))
+
+# the classes of the node types, used by the parses which are not given any other ones (see using_classes).
 node_to_class = dict()
 
 
+class A2lClassRegistry(threading.local):
+    # the classes used by the parses of the current thread (see using_classes).
+    classes = node_to_class
+
+
+registry = A2lClassRegistry()
+
+
 def a2l_node_type(node_type):
     def wrapper(cls):
         node_to_class[node_type] = cls
@@ -18,14 +38,31 @@ def a2l_node_type(node_type):
 
 
 class A2lNode(object):
-    __slots__ = '_node', '_parent', '_children'
+    __slots__ = '_parent', '_children', '_start', '_last'
+
+    # set on the class by a2l_node_type, it is not an instance attribute (which would prevent pickling).
+    _node = None
+
+    # the properties whose values are discarded (see projected_class).
+    _dropped = frozenset()
+
+    # the class and the kept properties a projected class is built from (see projected_class).
+    _projection = None
 
     def __init__(self, *args, **kwargs):
         if not isinstance(self.__slots__, tuple):
             raise ValueError('__slot__ attribute must be a list (maybe \',\' is missing at the end?).')
         self._parent = None
         self._children = list()
+        self._start = None
+        self._last = None
+        self.add_properties(args)
+
+    def add_properties(self, args):
+        # sets, or appends to the list attributes, the (attribute, value) pairs of the optional properties.
         for attribute, value in args:
+            if attribute in self._dropped:
+                continue
             attr = getattr(self, attribute)
             if isinstance(attr, list):
                 attr.append(value)
@@ -42,6 +79,23 @@ class A2lNode(object):
 
     def add_children(self, a2l_node):
         self._children.append(a2l_node)
+        # the node is added to a tree, whose indexes do not hold it. the nodes being built are not in a tree yet.
+        if self._parent is not None or isinstance(self, A2lFile):
+            self.drop_indexes()
+
+    def drop_indexes(self):
+        """
+        drops the indexes of the tree holding the node (see get_node and Module.lookup), which are built again when
+        requested. the nodes added by add_properties drop them, drop_indexes should be called once the tree is changed
+        otherwise: a node appended to a list or renamed directly is not known by the indexes.
+        """
+        node = self
+        while node is not None:
+            if isinstance(node, Module):
+                node._names = node._references = None
+            elif isinstance(node, A2lFile):
+                node._index = None
+            node = node._parent
 
     def get_properties(self):
         return (p for p in self.__slots__ if not p.startswith('_'))
@@ -50,13 +104,57 @@ class A2lNode(object):
         return self._node
 
     def get_node(self, node_name):
+        # the descendants of the root, of the project and of the modules of a tree are indexed (see A2lTypeIndex), the
+        # other nodes walk their subtree.
+        if self._node in INDEXED_TYPES:
+            root = self.get_root()
+            if isinstance(root, A2lFile):
+                nodes = root.get_index().get(self, node_name)
+                if nodes is not None:
+                    return list(nodes)
         nodes = list()
-        for node in self._children:
+        pending = list(reversed(self._children))
+        while pending:
+            node = pending.pop()
             if node.node() == node_name:
                 nodes.append(node)
-            nodes += node.get_node(node_name)
+            pending.extend(reversed(node._children))
         return nodes
 
+    def resolve(self, attribute):
+        """
+        returns the node named by attribute (see REFERENCES) in the module of the node, None if it is not found, or the
+        list of nodes for the lists of references. the link is kept once resolved (see Module.get_references).
+        """
+        module = self._parent
+        while module is not None and module._node != 'MODULE':
+            module = module._parent
+        if module is None:
+            raise ValueError('{0} is not in a module.'.format(self._node))
+        return module.get_references().resolve(module, self, attribute)
+
+    def get_root(self):
+        node = self
+        while node._parent is not None:
+            node = node._parent
+        return node
+
+    def get_span(self):
+        # the offsets of the first and of the last token of the node are set by the parser. the end of the last token is
+        # only scanned when requested.
+        source = getattr(self.get_root(), '_source', None)
+        if self._start is None or source is None or source.data is None:
+            return None
+        start, last = source.offsets(self)
+        return start, source.token_end(last)
+
+    def get_location(self):
+        # line and column of the first token of the node.
+        source = getattr(self.get_root(), '_source', None)
+        if self._start is None or source is None or source.data is None:
+            return None
+        return source.location(source.offsets(self)[0])
+
     def get_json(self):
         tmp = dict(node=self.node())
         for p in self.properties:
@@ -76,18 +174,42 @@ class A2lNode(object):
 
     properties = property(fget=get_properties)
     json = property(fget=get_json)
+    span = property(fget=get_span)
+    location = property(fget=get_location)
+
+
+def node_state(node):
+    # the state of a node without its transient slots.
+    return None, dict((name, getattr(node, name)) for cls in type(node).__mro__
+                      for name in getattr(cls, '__slots__', ()) if name not in TRANSIENT and hasattr(node, name))
 
 
 @a2l_node_type('ROOT')
 class A2lFile(A2lNode):
-    __slots__ = 'asap2_version', 'a2ml_version', 'project'
+    __slots__ = 'asap2_version', 'a2ml_version', 'project', '_source', '_index'
 
     def __init__(self, args):
         self.asap2_version = None
         self.a2ml_version = None
         self.project = None
+        self._source = None
+        self._index = None
         super(A2lFile, self).__init__(*args)
 
+    def get_index(self):
+        # the nodes of the tree by type, indexed when first requested.
+        if getattr(self, '_index', None) is None:
+            self._index = A2lTypeIndex(self)
+        return self._index
+
+    def get_span(self):
+        # the whole parsed data.
+        if self._source is None or self._source.data is None:
+            return None
+        return 0, len(self._source.data)
+
+    span = property(fget=get_span)
+
 
 @a2l_node_type('VERSION')
 class Version(A2lNode):
@@ -294,7 +416,8 @@ class Characteristic(A2lNode):
                 'upper_limit', 'display_identifier', 'format', 'byte_order', 'bit_mask', 'function_list', 'number', \
                 'extended_limits', 'read_only', 'guard_rails', 'map_list', 'max_refresh', 'dependent_characteristic', \
                 'virtual_characteristic', 'ref_memory_segment', 'annotation', 'comparison_quantity', \
-                'if_data_characteristic', 'axis_descr', 'calibration_access', 'matrix_dim', 'ecu_address_extension','symbol_link'
+                'if_data_characteristic', 'axis_descr', 'calibration_access', 'matrix_dim', 'ecu_address_extension', \
+                'symbol_link'
 
     def __init__(self, name, long_identifier, type, address, deposit, max_diff, conversion, lower_limit,
                  upper_limit, args):
@@ -758,7 +881,8 @@ class IfDataMemorySegment(A2lNode):
 
 @a2l_node_type('if_data_module')
 class IfDataModule(A2lNode):
-    __slots__ = 'name', 'source', 'raster', 'event_group', 'seed_key', 'checksum', 'tp_blob', 'tp_data','if_data_module_unsupported_element'
+    __slots__ = 'name', 'source', 'raster', 'event_group', 'seed_key', 'checksum', 'tp_blob', 'tp_data', \
+                'if_data_module_unsupported_element'
 
     def __init__(self, name, args):
         self.name = name
@@ -894,7 +1018,7 @@ class Module(A2lNode):
     __slots__ = 'name', 'long_identifier', 'a2ml', 'mod_par', 'mod_common', 'if_data_xcp', 'if_data_module', \
                 'characteristic', 'axis_pts', 'measurement', 'compu_method', 'compu_tab', 'compu_vtab', \
                 'compu_vtab_range', 'function', 'group', 'record_layout', 'variant_coding', 'frame', 'user_rights', \
-                'unit'
+                'unit', '_names', '_references'
 
     def __init__(self, name, long_identifier, args):
         self.name = name
@@ -918,8 +1042,63 @@ class Module(A2lNode):
         self.frame = None
         self.user_rights = list()
         self.unit = list()
+        self._names = None
+        self._references = None
         super(Module, self).__init__(*args)
 
+    def __getstate__(self):
+        return node_state(self)
+
+    def get_names(self):
+        # the positions of the child nodes by type and name, indexed when first requested.
+        if getattr(self, '_names', None) is None:
+            self._names = A2lNameIndex(self)
+        return self._names
+
+    def lookup(self, node_type, name):
+        """
+        returns the child node of type node_type named name, or None. the named types are the ones of NAMED_TYPES,
+        raises a ValueError for the other ones. the names are indexed on the first call, the lists parsed in lazy mode
+        only parse the node which is returned.
+        """
+        return self.get_names().get(self, node_type, name)
+
+    def find(self, name):
+        """
+        returns the child node named name, the types being looked up in the order of NAMED_TYPES, or None.
+        """
+        return self.get_names().find(self, name)
+
+    def get_references(self):
+        # the resolved references of the child nodes, kept until the module is changed.
+        if getattr(self, '_references', None) is None:
+            self._references = A2lReferences()
+        return self._references
+
+    def resolve_references(self):
+        """
+        resolves the references of every child node in a single pass (see A2lNode.resolve), returns the names which
+        are not found as diagnostics.
+        """
+        return self.get_references().resolve_all(self)
+
+    def get_duplicates(self):
+        # the nodes whose name is used by a previous node of the same type, as diagnostics.
+        names = self.get_names()
+        diagnostics = list()
+        for node_type, attribute, _ in NAMED_TYPES:
+            for name, positions in sorted(names.duplicates.get(node_type, dict()).items()):
+                for position in positions:
+                    node = getattr(self, attribute)[position]
+                    start, end = node.span or (None, None)
+                    diagnostic = A2lDiagnostic('duplicate {0} {1} in module {2}'.format(node_type, name, self.name),
+                                               start, start, end)
+                    diagnostic.line, diagnostic.column = node.location or (None, None)
+                    diagnostics.append(diagnostic)
+        return diagnostics
+
+    duplicates = property(fget=get_duplicates)
+
 
 @a2l_node_type('MOD_COMMON')
 class ModCommon(A2lNode):
@@ -1526,10 +1705,109 @@ class XcpOnCan(A2lNode):
         super(XcpOnCan, self).__init__(*args)
 
 
+def node_classes():
+    """
+    returns the classes of the node types used by the parses of the current thread.
+    """
+    return registry.classes
+
+
+@contextlib.contextmanager
+def using_classes(classes):
+    """
+    makes the parses of the current thread build the nodes of the types of classes with the given classes, the other
+    ones being built with the classes used so far. node_to_class is not changed, the parses of the other threads are
+    not affected.
+    """
+    if not classes:
+        yield
+        return
+    previous = registry.classes
+    current = dict(previous)
+    current.update(classes)
+    registry.classes = current
+    try:
+        yield
+    finally:
+        registry.classes = previous
+
+
 def a2l_node_factory(node_type, *args, **kwargs):
     try:
-        return node_to_class[node_type](*args, **kwargs)
+        return registry.classes[node_type](*args, **kwargs)
     except KeyError:
         raise NotImplementedError(str(node_type))
     except:
         raise
+
+
+# the classes built by projected_class, by base class and kept properties.
+projected_classes = dict()
+
+
+def projected_class(cls, fields):
+    """
+    returns a subclass of cls whose instances only keep the properties in fields. the values of the other properties
+    are discarded when the node is built, reading them or setting them afterwards raises an AttributeError. a
+    projected class is projected from its base class. the child blocks of the modules whose property of MODULE is
+    discarded are skipped unscanned by the parser (see A2lParser._parse_skeleton), the tokens of the other discarded
+    properties are scanned before the grammar gives them a property.
+    """
+    if cls._projection is not None:
+        cls = cls._projection[0]
+    fields = frozenset(fields)
+    key = cls, fields
+    if key not in projected_classes:
+        properties = set(p for c in cls.__mro__ for p in getattr(c, '__slots__', ()) if not p.startswith('_'))
+        if not fields <= properties:
+            raise ValueError('{0} has no properties {1}.'.format(cls._node, ', '.join(sorted(fields - properties))))
+        dropped = frozenset(properties - fields)
+
+        def dropped_property(name):
+            # shadows the slot of the base class, which is never set.
+            message = '{0} of {1} is not kept by the projection of the parser.'.format(name, cls._node)
+
+            def get_value(self):
+                raise AttributeError(message)
+
+            def set_value(self, value):
+                # the constructors of the nodes set their properties before A2lNode.__init__, which are discarded.
+                if hasattr(self, '_children'):
+                    raise AttributeError(message)
+
+            return property(fget=get_value, fset=set_value)
+
+        def __reduce_ex__(self, protocol):
+            state = dict((p, getattr(self, p)) for c in cls.__mro__ for p in getattr(c, '__slots__', ())
+                         if p not in dropped and p not in TRANSIENT and hasattr(self, p))
+            return projected_node, (cls, fields), (None, state)
+
+        def get_properties(self):
+            return (p for p in cls.__slots__ if not p.startswith('_') and p in fields)
+
+        attributes = dict((name, dropped_property(name)) for name in dropped)
+        attributes.update(__slots__=(), __module__=cls.__module__, __reduce_ex__=__reduce_ex__, _dropped=dropped,
+                          _projection=key, get_properties=get_properties, properties=property(fget=get_properties))
+        projected_classes[key] = type(cls.__name__, (cls,), attributes)
+    return projected_classes[key]
+
+
+def projected_node(cls, fields):
+    # creates an empty node of a projected class, when unpickled.
+    projected = projected_class(cls, fields)
+    return projected.__new__(projected)
+
+
+@contextlib.contextmanager
+def projecting(fields):
+    """
+    uses, for the node types of fields, the projected classes keeping the properties given for each of them (see
+    using_classes).
+    """
+    classes = node_classes()
+    unknown = set(fields) - set(classes)
+    if unknown:
+        raise ValueError('unknown node types ' + ', '.join(sorted(unknown)) + '.')
+    with using_classes(dict((node_type, projected_class(classes[node_type], properties))
+                            for node_type, properties in fields.items())):
+        yield
@@ -5,37 +5,933 @@
 @date: 20.03.2018
 """
 
+import bisect
+import functools
+import itertools
+import mmap
+import multiprocessing
+import operator
 import os
+import threading
 import ply.yacc as yacc
-from .lexer import tokens as lex_tokens
+from .exception import A2lFormatException, A2lDiagnostic
+from .lexer import tokens as lex_tokens, clone_lexer, MAX_COMMENT_LENGTH, MAX_STRING_LENGTH
+from .scanner import A2lScanner, DEFAULT_CHUNK_SIZE, PARALLEL_CHUNK_SIZE, detect_encoding, text_type
+from .source import A2lSource, MAX_EDITS
+from .descent import A2lDescentEngine, action, builds_node
+from .skeleton import A2lBlock, A2lLazyList, skeleton, recovered_skeleton
+from .transfer import encode_nodes, decode_nodes
 from .node import *
 
 
-class A2lFormatException(Exception):
-    def __init__(self, message, position, string=None):
-        self.value = str(message) + str(position)
-        if string:
-            delta = 120
-            s = position - delta if position >= delta else 0
-            e = position + delta if len(string) >= position + delta else -1
-            substring = string[s:e].replace('\r', ' ').replace('\n', ' ')
-            indicator = ' ' * (delta if position >= delta else position) + '^'
-            self.value += '\r\n\t' + ('...' if s else '   ') + substring + '\r\n\t   ' + indicator
+PARSE_TABLE_MODULE = __name__.rsplit('.', 1)[0] + '.parsetab'
 
-        super(A2lFormatException, self).__init__(self.value)
+SCANNER_OPTIONS = 'keep_lexemes', 'max_comment_length', 'max_string_length', 'intern_table'
+
+# the options parsing the skeleton of the data first (see A2lParser._parse_skeleton), unless they are not set.
+SKELETON_OPTIONS = 'lazy', 'include', 'exclude', 'recover'
+
+# the rule of the ranges of child blocks of the modules parsed by worker processes.
+PARALLEL_RULE = 'module_optional_list'
+
+# the rules of the list attributes of MODULE, whose blocks are only parsed when accessed in lazy mode.
+LAZY_RULES = frozenset(('if_data_module', 'characteristic', 'axis_pts', 'measurement', 'compu_method', 'compu_tab',
+                        'compu_vtab', 'compu_vtab_range', 'function', 'group', 'record_layout', 'user_rights', 'unit'))
+
+
+# the keyword of the only block each of these blocks can be nested in (None for the top level). a recovering parse
+# closes the blocks which are not terminated when one of them begins (see recovered_skeleton).
+PARENT_KEYWORDS = dict(dict.fromkeys(('A2ML', 'MOD_PAR', 'MOD_COMMON', 'CHARACTERISTIC', 'AXIS_PTS', 'MEASUREMENT',
+                                      'COMPU_METHOD', 'COMPU_TAB', 'COMPU_VTAB', 'COMPU_VTAB_RANGE', 'FUNCTION',
+                                      'GROUP', 'RECORD_LAYOUT', 'VARIANT_CODING', 'FRAME', 'USER_RIGHTS', 'UNIT'),
+                                     'MODULE'),
+                       MODULE='PROJECT', PROJECT=None)
+
+# the keywords of the blocks only found in the modules, the other blocks might be nested in any of them.
+MODULE_BLOCKS = frozenset(keyword for keyword, parent in PARENT_KEYWORDS.items() if parent == 'MODULE')
+
+# the keywords of the child blocks of the modules, selected by the include and exclude options of A2lParser.
+SELECTABLE_BLOCKS = MODULE_BLOCKS | frozenset(('IF_DATA',))
+
+# the types of the nodes which are not parsed from a child block of a module.
+SHELL_NODES = frozenset(('ROOT', 'PROJECT', 'MODULE'))
+
+# the events of A2lParser.iterparse.
+ITERPARSE_EVENTS = frozenset(('start', 'end'))
+
+# the largest number of consecutive child blocks of a module parsed at once by A2lParser.iterparse.
+ITERPARSE_BATCH_SIZE = 64
+
+# the types of the first and of the last tokens of a MODULE, all the other ones are part of its child blocks.
+MODULE_HEAD = 'begin', 'MODULE', 'IDENT', 'STRING'
+MODULE_TAIL = 'end', 'MODULE'
+
+# the largest number of child blocks of a module parsed at once by a recovering parse.
+RECOVERY_CHUNK_SIZE = 1024
+
+
+def block_rule(block):
+    # the rule a child block of a MODULE is parsed with.
+    if block.keyword == 'IF_DATA':
+        return 'if_data_xcp' if block.name == 'XCP' else 'if_data_module'
+    return None if block.keyword is None else block.keyword.lower()
+
+
+def describe(block):
+    # the keyword and the name of a block of the skeleton, for the diagnostics.
+    return ' '.join(item for item in (block.keyword or 'block', block.name) if item)
+
+
+def bytes_lexer(kwargs):
+    # bytes are only scanned by the scanner, an A2lScanner (configured by the caller) might be given as lexer.
+    lexer = kwargs.setdefault('lexer', 'scanner')
+    if not isinstance(lexer, A2lScanner) and lexer != 'scanner':
+        raise ValueError('bytes are only scanned by the scanner, not by the lexer {0!r}.'.format(lexer))
+
+
+def skeleton_options(kwargs):
+    # whether the options of A2lParser given in kwargs parse the skeleton of the data first.
+    return kwargs.get('workers', 1) != 1 or any(kwargs.get(name) not in (None, False) for name in SKELETON_OPTIONS)
+
+
+def parse_range(arguments):
+    # parses a range of child blocks of a MODULE in a worker process of A2lParser._parse_skeleton, only their encoded
+    # nodes being sent back (see encode_nodes). None is returned if the range is not valid, the errors are then reported
+    # by a serial parse.
+    data, start, encoding, options, projection, classes = arguments
+    decode = None if encoding is None else operator.methodcaller('decode', encoding)
+    tokens = A2lScanner(**options)._generate(iter((data,)), 0, decode, raw=True, offset=start)
+    with using_classes(classes), projecting(projection or dict()):
+        try:
+            return encode_nodes(A2lParser.descent_engine().parse_rule(PARALLEL_RULE, tokens, data, offset=start))
+        except A2lFormatException:
+            return None
+
+
+def parse_path(arguments):
+    # parses a file in a worker process of A2lParser.parse_many, its tree being sent back encoded.
+    cls, path, kwargs = arguments
+    return encode_nodes(cls.from_file(path, **kwargs).tree)
+
+
+def child_start(item, source, epoch):
+    # the offset of the first token of a child of a node in the current data. the blocks of the skeleton (see the lazy
+    # mode) have the epoch of the node containing them.
+    if item.__class__ is A2lBlock:
+        if item.node is not None:
+            return source.offsets(item.node)[0]
+        return source.translate(item.start, epoch)
+    return source.offsets(item)[0]
+
+
+def find_child(items, position, source, epoch):
+    # the index of the last of items, which are in the order of the data, starting before position (-1 if none).
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high) // 2
+        if child_start(list.__getitem__(items, middle), source, epoch) < position:
+            low = middle + 1
+        else:
+            high = middle
+    return low - 1
+
+
+def node_attribute(parent, node, source):
+    # the attribute of parent holding node, and the index of node in it if it is a list (None otherwise).
+    for attribute in (p for c in type(parent).__mro__ for p in getattr(c, '__slots__', ()) if not p.startswith('_')):
+        value = getattr(parent, attribute, None)
+        if value is node:
+            return attribute, None
+        if isinstance(value, list) and value and isinstance(list.__getitem__(value, 0), (A2lNode, A2lBlock)):
+            index = find_child(value, source.offsets(node)[0] + 1, source, source.epoch(parent))
+            item = list.__getitem__(value, index) if index >= 0 else None
+            if item is node or item.__class__ is A2lBlock and item.node is node:
+                return attribute, index
+    return None, None
+
+
+def update_offsets(tree):
+    # folds the edits of the source of an edited tree. the nodes parsed again since the previous fold are translated to
+    # the current data first, the nodes which are not part of the tree anymore being forgotten.
+    source = tree._source
+    epochs = dict((node, epoch) for node, epoch in source.epochs.items() if node.get_root() is tree)
+    epoch = source.folded + len(source.edits)
+    for registered in epochs:
+        pending = [registered]
+        while pending:
+            node = pending.pop()
+            if node is not registered and node in epochs:
+                continue
+            node._start, node._last = source.offsets(node)
+            pending.extend(node._children)
+    source.fold()
+    source.epochs = dict.fromkeys(epochs, epoch)
+
+
+def spanned(function, node, end):
+    def production(p):
+        function(p)
+        last = p.slice[-1]
+        position = getattr(last, 'endlexpos', None) if isinstance(last, yacc.YaccSymbol) else last.lexpos
+        if node:
+            p[0]._start = p.slice[1].lexpos
+            p[0]._last = position
+        if end:
+            p.slice[0].endlexpos = position
+    return production
+
+
+def track_spans(engine):
+    """
+    makes the productions building a node record the offsets of its first and last tokens on it, which costs one call
+    per node. ply only knows the position of a nonterminal when it tracks the positions for every production, which
+    slows down the whole parse: the few productions a node can end with record the offset of their last token instead,
+    as endlexpos (the name ply gives to it when tracking).
+    """
+    rules = [(production, [symbol for symbol in production.str.split()[2:] if symbol != '<empty>'])
+             for production in engine.productions[1:]]
+    nonterminals = set(production.name for production, _ in rules)
+    nodes = set(production for production, symbols in rules
+                if builds_node(production.callable) and symbols and symbols[0] not in nonterminals)
+    ends = set()
+    pending = [symbols[-1] for production, symbols in rules if production in nodes and symbols[-1] in nonterminals]
+    while pending:
+        name = pending.pop()
+        if name not in ends:
+            ends.add(name)
+            pending.extend(symbols[-1] for production, symbols in rules
+                           if production.name == name and symbols and symbols[-1] in nonterminals)
+    for production, symbols in rules:
+        if production in nodes or (symbols and production.name in ends):
+            production.callable = spanned(production.callable, production in nodes, production.name in ends)
+    return engine
 
 
 class A2lParser(object):
     tokens = lex_tokens
 
-    def __init__(self, string, **custom_classes):
-        self.tree = None
-        for node, cls in custom_classes.items():
-            node_to_class[node] = cls
-      
-        self._yacc = yacc.yacc(debug=True, module=self, optimize=True,
-                               outputdir=os.path.dirname(os.path.realpath(__file__)))
-        self._yacc.parse(string)
+    # the lists of parameters and of values are greedy: a list only ends when the following token can not extend it.
+    # the rules whose reduction ends a list (marked with %prec LIST) rank below the tokens starting an item, the
+    # shift/reduce conflicts between them are resolved as shifts.
+    precedence = (('nonassoc', 'LIST'), ('nonassoc', 'IDENT', 'STRING', 'NUMERIC', 'begin'))
+
+    _engine = None
+    _descent_engine = None
+    _rule_engines = dict()
+    _engine_lock = threading.Lock()
+
+    lexers = dict(ply=clone_lexer, scanner=A2lScanner)
+
+    # engine used when none is given, 'ply' (LALR tables) or 'descent' (see A2lDescentEngine).
+    default_engine = 'ply'
+
+    # the problems found by a recovering parse, as A2lDiagnostic (see _parse_recovering).
+    diagnostics = ()
+
+    # the classes given to the parser by node type, used instead of the ones of node_to_class by the parses of its data
+    # (lazy mode, reparse). they are only used by the thread of the parse (see using_classes).
+    classes = dict()
+
+    def __init__(self, string, lexer='ply', keep_lexemes=False, max_comment_length=MAX_COMMENT_LENGTH,
+                 max_string_length=MAX_STRING_LENGTH, intern_table=None, engine=None, lazy=False, include=None,
+                 exclude=None, projection=None, workers=1, recover=False, **custom_classes):
+        self.classes = custom_classes
+        # projection gives, by node type, the properties to keep (see projected_class).
+        for option, keywords in (('include', include), ('exclude', exclude)):
+            unknown = set() if keywords is None else set(keywords) - SELECTABLE_BLOCKS
+            if unknown:
+                raise ValueError(option + ' only selects the child blocks of the modules, not ' +
+                                 ', '.join(sorted(unknown)) + '.')
+        with using_classes(custom_classes), projecting(projection or dict()):
+            self.tree = None
+            if recover:
+                if string is None or not (isinstance(lexer, A2lScanner) or lexer in self.lexers):
+                    raise ValueError('recover needs the whole data to be given at once.')
+                if lazy or include is not None or exclude is not None or workers != 1:
+                    raise ValueError('recover can not be combined with lazy, include, exclude or workers.')
+                if not isinstance(lexer, A2lScanner):
+                    lexer = A2lScanner(keep_lexemes=keep_lexemes, max_comment_length=max_comment_length,
+                                       max_string_length=max_string_length, intern_table=intern_table)
+                self.tree, self.diagnostics = self._parse_recovering(string, lexer)
+                return
+            # the child blocks of the modules whose property is dropped by the projection are skipped by the skeleton.
+            dropped = node_classes()['MODULE']._dropped
+            if (lazy or include is not None or exclude is not None or workers != 1 or dropped) and \
+                    string is not None and (isinstance(lexer, A2lScanner) or lexer in self.lexers):
+                if not isinstance(lexer, A2lScanner):
+                    lexer = A2lScanner(keep_lexemes=keep_lexemes, max_comment_length=max_comment_length,
+                                       max_string_length=max_string_length, intern_table=intern_table)
+                self.tree = self._parse_skeleton(string, lexer, lazy, include, exclude, projection, workers,
+                                                 custom_classes)
+                if self.tree is not None:
+                    return
+            elif include is not None or exclude is not None:
+                raise ValueError('include and exclude need the whole data to be given at once.')
+            if lexer in self.lexers:
+                lexer = self.lexers[lexer](keep_lexemes=keep_lexemes, max_comment_length=max_comment_length,
+                                           max_string_length=max_string_length, intern_table=intern_table)
+            engine = engine or self.default_engine
+            if engine == 'descent':
+                engine = self.descent_engine()
+            elif engine == 'ply':
+                engine = self.engine()
+            self.tree = engine.parse(string, lexer=lexer)
+        # the whole data is known unless it has been streamed, the spans of the nodes are then not available.
+        if not getattr(lexer, 'lexoffset', 0):
+            self.tree._source = A2lSource(lexer.lexdata)
+
+    def _parse_skeleton(self, data, scanner, lazy, include, exclude, projection, workers=1, classes=None):
+        # the skeleton is scanned down to the child blocks of the modules. the blocks whose keyword is not in include,
+        # or is in exclude, are skipped, as well as the blocks whose property of MODULE is dropped by the projection.
+        # the blocks of LAZY_RULES are also left out of the scan in lazy mode, the lists of the modules are then given
+        # the blocks, parsed by parse_block when accessed. unless workers is 1, the other child blocks are grouped in
+        # ranges parsed by a pool of workers processes (one per cpu if workers is None), while the remaining tokens are
+        # parsed by the descent engine. None is returned if the skeleton can not be parsed, the errors are then reported
+        # by a complete parse.
+        if isinstance(data, (str, text_type)):
+            encoding, position = None, 0
+        else:
+            encoding, position = detect_encoding(data)
+            if encoding == 'utf-16':
+                data, encoding, position = bytes(data).decode(encoding), None, 0
+        try:
+            blocks = skeleton(data, position, max_depth=3)
+        except A2lFormatException:
+            return None
+        modules = [module for project in blocks if project.keyword == 'PROJECT'
+                   for module in project.children if module.keyword == 'MODULE']
+        workers = workers or multiprocessing.cpu_count()
+        chunk_size = max(PARALLEL_CHUNK_SIZE, len(data) // (4 * workers))
+        dropped = node_classes()['MODULE']._dropped
+        children = list()
+        for module in modules:
+            module_children = list()
+            # the range of consecutive child blocks being grouped, it is closed by any block left out of the scan.
+            current = None
+            for block in module.children:
+                if include is not None and block.keyword not in include or exclude is not None and \
+                        block.keyword in exclude or block_rule(block) in dropped:
+                    module_children.append((block, None))
+                    current = None
+                elif lazy and block_rule(block) in LAZY_RULES:
+                    module_children.append((block, block_rule(block)))
+                    current = None
+                elif workers != 1:
+                    if current is None or current.end - current.start >= chunk_size:
+                        current = A2lBlock(None, None, block.start, block.end)
+                        module_children.append((current, PARALLEL_RULE))
+                    current.end = block.end
+            children.append(module_children)
+        ranges = [block for block, rule in itertools.chain.from_iterable(children) if rule == PARALLEL_RULE]
+        if len(ranges) == 1:
+            # a single range is parsed with the rest of the data.
+            children = [[(block, rule) for block, rule in module_children if rule != PARALLEL_RULE]
+                        for module_children in children]
+            ranges = list()
+        # the offsets delimit the ranges to scan. the blocks only separated by white spaces are left out at once.
+        offsets = [position]
+        for block, _ in itertools.chain.from_iterable(children):
+            if len(offsets) > 1 and not data[offsets[-1]:block.start].strip():
+                offsets[-1] = block.end
+            else:
+                offsets.extend(block.span)
+        offsets.append(len(data))
+        decode = None if encoding is None else operator.methodcaller('decode', encoding)
+        tokens = itertools.chain.from_iterable(
+            scanner._generate(iter((data[start:end],)), 0, decode, raw=True, offset=start)
+            for start, end in zip(offsets[::2], offsets[1::2]))
+        options = dict(keep_lexemes=scanner.keep_lexemes, max_comment_length=scanner.max_length['comment'],
+                       max_string_length=scanner.max_length['string'])
+        pool = multiprocessing.Pool(min(workers, len(ranges))) if ranges else None
+        try:
+            # the ranges are parsed by the workers while the rest of the data is parsed by this process.
+            results = pool.imap(parse_range, ((data[block.start:block.end], block.start, encoding, options, projection,
+                                               classes or dict()) for block in ranges)) if ranges else iter(())
+            try:
+                tree = self.descent_engine().parse_rule('a2l', tokens, data)
+            except A2lFormatException:
+                return None
+            for module, module_children in zip(tree.project.module if tree.project else (), children):
+                for block, rule in module_children:
+                    if rule == PARALLEL_RULE:
+                        items = next(results)
+                        if items is None:
+                            return None
+                        module.add_properties(decode_nodes(items))
+        finally:
+            if pool is not None:
+                pool.terminate()
+        if lazy:
+            load = functools.partial(A2lParser.parse_block, encoding=encoding, projection=projection, classes=classes,
+                                     **options)
+            for module, module_children in zip(tree.project.module if tree.project else (), children):
+                lists = dict((rule, list()) for rule in LAZY_RULES)
+                for block, rule in module_children:
+                    if rule in LAZY_RULES:
+                        lists[rule].append(block)
+                for rule, items in lists.items():
+                    if rule not in dropped:
+                        setattr(module, rule, A2lLazyList(items, module, load))
+                module._children = A2lLazyList(sorted(
+                    module._children + [block for block, rule in module_children if rule in LAZY_RULES],
+                    key=lambda item: item.start if item.__class__ is A2lBlock else item._start), module, load)
+        tree._source = A2lSource(data)
+        return tree
+
+    def _parse_recovering(self, data, scanner):
+        # the skeleton of the data is scanned first, its problems being recovered (see recovered_skeleton). the child
+        # blocks of the modules are parsed by ranges, the blocks which can not be parsed being skipped. the remaining
+        # tokens (the project and the headers of the modules, any token of a module between its blocks being skipped)
+        # are parsed last, the tokens from an error up to the next /begin or /end token being skipped. the cost of an
+        # error is bounded by the distance from the previous one: the size of the ranges is reset to one block after an
+        # error, then doubled after each valid range. returns the tree and the diagnostics, in the order of the data.
+        diagnostics = list()
+        if isinstance(data, (str, text_type)):
+            encoding, position = None, 0
+        else:
+            encoding, position = detect_encoding(data)
+            if encoding == 'utf-16':
+                data, encoding, position = bytes(data).decode(encoding), None, 0
+        blocks = recovered_skeleton(data, diagnostics, PARENT_KEYWORDS, position, max_depth=3)
+        skipped = list()
+        for start, end in sorted(diagnostic.span for diagnostic in diagnostics):
+            if skipped and start <= skipped[-1][1]:
+                skipped[-1][1] = max(skipped[-1][1], end)
+            else:
+                skipped.append([start, end])
+        skipped_starts = [start for start, _ in skipped]
+        decode = None if encoding is None else operator.methodcaller('decode', encoding)
+        engine = self.descent_engine()
+
+        def scan(start, end):
+            # the tokens of data from start to end, the ranges skipped by the skeleton being left out.
+            ranges = list()
+            for skipped_start, skipped_end in skipped[max(bisect.bisect_right(skipped_starts, start) - 1, 0):]:
+                if skipped_start >= end:
+                    break
+                if skipped_start > start:
+                    ranges.append((start, skipped_start))
+                start = max(start, skipped_end)
+            if start < end:
+                ranges.append((start, end))
+            return itertools.chain.from_iterable(scanner._generate(iter((data[first:last],)), 0, decode, raw=True,
+                                                                   offset=first) for first, last in ranges)
+
+        def collect(start, end):
+            # the tokens are kept up to an error of the scanner, the rest of the range is skipped.
+            tokens = list()
+            try:
+                for token in scan(start, end):
+                    tokens.append(token)
+            except A2lFormatException as e:
+                diagnostics.append(A2lDiagnostic(e.reason, e.position, e.position, end))
+            return tokens
+
+        scanner.errors = set()
+        try:
+            modules = [module for project in blocks if project.keyword == 'PROJECT' for module in project.children
+                       if module.keyword == 'MODULE']
+            items = dict()
+            for module in modules:
+                children = module.children
+                starts = [block.start for block in children]
+                items[module.start] = module_items = list()
+                index, size, invalid = 0, RECOVERY_CHUNK_SIZE, None
+                while index < len(children):
+                    if invalid is not None and invalid[0] == index:
+                        block, e = children[index], invalid[1]
+                        diagnostics.append(A2lDiagnostic('{0}, {1} skipped'.format(e.reason, describe(block)),
+                                                         e.position, block.start, block.end))
+                        index, size, invalid = index + 1, 1, None
+                        continue
+                    last = min(index + size, len(children))
+                    end = children[last - 1].end
+                    tokens = itertools.chain.from_iterable(scan(*block.span) for block in children[index:last])
+                    try:
+                        # only the positions of the errors are needed, not their context.
+                        module_items.extend(engine.parse_rule(PARALLEL_RULE, tokens, data[end:end], offset=end))
+                    except A2lFormatException as e:
+                        # the valid blocks before the invalid one are parsed first.
+                        failed = max(bisect.bisect_right(starts, e.position, index, last) - 1, index)
+                        size, invalid = failed - index, (failed, e)
+                    else:
+                        index, size = last, min(size * 2, RECOVERY_CHUNK_SIZE)
+            # the tokens of the modules are split at their child blocks.
+            ranges = list()
+            start = position
+            for module in modules:
+                ranges.append((start, module.start, None))
+                start = module.start
+                for block in module.children:
+                    ranges.append((start, block.start, module))
+                    start = block.end
+                ranges.append((start, module.end, module))
+                start = module.end
+            ranges.append((start, len(data), None))
+            shell = list()
+            for module, group in itertools.groupby(ranges, key=operator.itemgetter(2)):
+                tokens = [(index, token) for index, piece in enumerate(group) for token in collect(*piece[:2])]
+                if module is not None and len(tokens) >= len(MODULE_HEAD) + len(MODULE_TAIL) and \
+                        tuple(token[0] for _, token in tokens[:len(MODULE_HEAD)]) == MODULE_HEAD and \
+                        tuple(token[0] for _, token in tokens[-len(MODULE_TAIL):]) == MODULE_TAIL:
+                    for _, run in itertools.groupby(tokens[len(MODULE_HEAD):-len(MODULE_TAIL)],
+                                                    key=operator.itemgetter(0)):
+                        run = [token for _, token in run]
+                        diagnostics.append(A2lDiagnostic('unexpected tokens at position {0}'.format(run[0][2]),
+                                                         run[0][2], run[0][2], run[-1][3]))
+                    tokens = tokens[:len(MODULE_HEAD)] + tokens[-len(MODULE_TAIL):]
+                shell.extend(token for _, token in tokens)
+            while True:
+                end = shell[-1][3] if shell else position
+                try:
+                    tree = engine.parse_rule('a2l', shell, data[end:end], offset=end)
+                    break
+                except A2lFormatException as e:
+                    index = min(bisect.bisect_left([token[2] for token in shell], e.position), len(shell) - 1)
+                    following = index + 1
+                    while following < len(shell) and shell[following][0] not in ('begin', 'end'):
+                        following += 1
+                    diagnostics.append(A2lDiagnostic('{0}, tokens skipped'.format(e.reason), e.position,
+                                                     shell[index][2], shell[following - 1][3]))
+                    del shell[index:following]
+            for module in tree.project.module if tree.project else ():
+                module.add_properties(items.get(module._start, ()))
+            runs = list()
+            for offset in sorted(scanner.errors):
+                if runs and runs[-1][1] == offset:
+                    runs[-1][1] += 1
+                else:
+                    runs.append([offset, offset + 1])
+            diagnostics.extend(A2lDiagnostic('invalid character at position {0}'.format(start), start, start, end)
+                               for start, end in runs)
+        finally:
+            scanner.errors = None
+        tree._source = A2lSource(data)
+        diagnostics.sort(key=operator.attrgetter('position'))
+        for diagnostic in diagnostics:
+            diagnostic.line, diagnostic.column = tree._source.location(diagnostic.position)
+        return tree, diagnostics
+
+    @staticmethod
+    def parse_block(block, parent, encoding=None, projection=None, classes=None, **options):
+        """
+        returns the node parsed from a block of the skeleton of the tree of parent (see the lazy mode), as a child of
+        parent. encoding is the one of the data, projection and classes the ones of the parse of the tree and options
+        are given to the scanner.
+        """
+        source = parent.get_root()._source
+        data = source.data
+        # the offsets of the block are the ones of the data when parent was parsed (see reparse).
+        epoch = source.epoch(parent)
+        start, end = source.translate(block.start, epoch), source.translate(block.end - 1, epoch) + 1
+        decode = None if encoding is None else operator.methodcaller('decode', encoding)
+        tokens = A2lScanner(**options)._generate(iter((data[start:end],)), 0, decode, raw=True, offset=start)
+        with using_classes(classes or dict()), projecting(projection or dict()):
+            node = A2lParser.descent_engine().parse_rule(block_rule(block), tokens, data)
+        node.set_parent(parent)
+        if source.folded or source.edits:
+            source.epochs[node] = source.folded + len(source.edits)
+        return node
+
+    @staticmethod
+    def parse_blocks(blocks, parent, encoding=None, projection=None, classes=None, **options):
+        """
+        returns the nodes parsed from consecutive child blocks of a module of the skeleton, as children of parent (see
+        parse_block). the blocks are scanned and parsed at once.
+        """
+        source = parent.get_root()._source
+        data = source.data
+        epoch = source.epoch(parent)
+        decode = None if encoding is None else operator.methodcaller('decode', encoding)
+        scanner = A2lScanner(**options)
+        ranges = ((source.translate(block.start, epoch), source.translate(block.end - 1, epoch) + 1)
+                  for block in blocks)
+        tokens = itertools.chain.from_iterable(scanner._generate(iter((data[start:end],)), 0, decode, raw=True,
+                                                                 offset=start) for start, end in ranges)
+        with using_classes(classes or dict()), projecting(projection or dict()):
+            nodes = [node for _, node in A2lParser.descent_engine().parse_rule(PARALLEL_RULE, tokens, data)]
+        for node in nodes:
+            node.set_parent(parent)
+            if source.folded or source.edits:
+                source.epochs[node] = source.folded + len(source.edits)
+        return nodes
+
+    def reparse(self, offset, length, text, projection=None, **options):
+        """
+        edits the data of the tree, length characters (bytes for binary data) at offset being replaced by text, then
+        parses again the innermost /begin ... /end block containing the edit, or the whole data if none does. the new
+        node replaces the previous one in its parent and is returned (the root if the whole data has been parsed).
+        projection and options (given to the scanner) should be the ones of the parse of the tree, the classes given to
+        the parser are used again. if the block is not valid anymore, the A2lFormatException is raised and the tree is
+        not changed, but the edit is kept: its range is parsed again with the next edit.
+        """
+        source = getattr(self.tree, '_source', None)
+        if source is None or source.data is None:
+            raise ValueError('the data the tree has been parsed from is not known, it can not be edited.')
+        data = source.data
+        encoding = source.encoding
+        if encoding is not None and isinstance(text, (str, text_type)):
+            text = text.encode(encoding)
+        begin = '/begin' if isinstance(data, (str, text_type)) else b'/begin'
+        # the range to parse again, in the data before the edit.
+        start, end = offset, offset + length
+        if source.pending is not None:
+            start, end = min(start, source.pending[0]), max(end, source.pending[1])
+        engine = self.descent_engine()
+        node, block = self.tree, None
+        while True:
+            index = find_child(node._children, start, source, source.epoch(node))
+            if index < 0:
+                break
+            # a block of the skeleton is parsed if it contains the edit.
+            child = node._children[index]
+            first, last = source.offsets(child)
+            if source.token_end(last) <= end:
+                break
+            if data[first:first + len(begin)] == begin:
+                attribute, attribute_index = node_attribute(node, child, source)
+                if attribute in engine.rules:
+                    block, parent, children_index = child, node, index
+                    rule, rule_index = attribute, attribute_index
+            node = child
+        delta = len(text) - length
+        if block is None:
+            source.edit(offset, length, text)
+            try:
+                kwargs = dict(self.classes)
+                kwargs.update(options)
+                a2l = type(self)(source.data, lexer='scanner', engine='descent', projection=projection, **kwargs)
+            except A2lFormatException:
+                source.pending = start, end + delta
+                raise
+            self.tree = a2l.tree
+            return self.tree
+        first, last = source.offsets(block)
+        block_end = source.token_end(last) + delta
+        epoch = source.edit(offset, length, text)
+        data = source.data
+        decode = None if encoding is None else operator.methodcaller('decode', encoding)
+        tokens = A2lScanner(**options)._generate(iter((data[first:block_end],)), 0, decode, raw=True, offset=first)
+        try:
+            with using_classes(self.classes), projecting(projection or dict()):
+                node = engine.parse_rule(rule, tokens, data)
+        except A2lFormatException:
+            source.pending = start, end + delta
+            raise
+        source.pending = None
+        block.set_parent(None)
+        node.set_parent(parent)
+        if rule_index is None:
+            setattr(parent, rule, node)
+        else:
+            list.__setitem__(getattr(parent, rule), rule_index, node)
+        list.__setitem__(parent._children, children_index, node)
+        source.epochs[node] = epoch
+        if getattr(self.tree, '_index', None) is not None:
+            self.tree._index.replace(block, node, source)
+        if getattr(parent, '_names', None) is not None:
+            parent._names.replace(rule, rule_index, block, node)
+        # the references resolved in the module might name the replaced nodes.
+        module = parent
+        while module is not None and module._node != 'MODULE':
+            module = module._parent
+        if module is not None:
+            module._references = None
+        if len(source.edits) >= MAX_EDITS:
+            update_offsets(self.tree)
+        return node
+
+    @classmethod
+    def from_bytes(cls, buf, processes=1, **kwargs):
+        # buf might be any bytes-like object, it is scanned as is (see A2lScanner.input). unless processes is 1, buf is
+        # scanned by a pool of processes, one per cpu if processes is None (see A2lScanner.tokenize_parallel), except
+        # with the options of SKELETON_OPTIONS or workers.
+        bytes_lexer(kwargs)
+        if processes == 1 or skeleton_options(kwargs):
+            return cls(buf, **kwargs)
+        return cls._from_parallel_scan(buf, processes, None, kwargs)
+
+    @classmethod
+    def from_file(cls, path, processes=1, **kwargs):
+        bytes_lexer(kwargs)
+        with open(path, 'rb') as fp:
+            if not os.fstat(fp.fileno()).st_size:
+                return cls.from_bytes(b'', **kwargs)
+            buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if processes == 1 or skeleton_options(kwargs):
+                    a2l = cls.from_bytes(buf, **kwargs)
+                else:
+                    a2l = cls._from_parallel_scan(buf, processes, path, kwargs)
+            finally:
+                try:
+                    buf.close()
+                except BufferError:
+                    # the scanner of a failed parse still refers to the data, it is unmapped once collected.
+                    pass
+        # the file is mapped again if the positions of the nodes are requested.
+        a2l.tree._source = A2lSource(path=path)
+        return a2l
+
+    @classmethod
+    def parse_many(cls, paths, workers=None, **kwargs):
+        """
+        returns the parsers of the files of paths, in the same order. the files are parsed by a pool of workers
+        processes (one per cpu if workers is None), kwargs being given to from_file, and their trees are sent back
+        encoded (see encode_nodes). in lazy mode, the files are parsed by the current process.
+        """
+        paths = list(paths)
+        workers = min(workers or multiprocessing.cpu_count(), len(paths))
+        if workers <= 1 or kwargs.get('lazy'):
+            return [cls.from_file(path, **kwargs) for path in paths]
+        parsers = list()
+        pool = multiprocessing.Pool(workers)
+        try:
+            for path, tree in zip(paths, pool.imap(parse_path, ((cls, path, kwargs) for path in paths))):
+                a2l = cls.__new__(cls)
+                a2l.tree = decode_nodes(tree)
+                a2l.tree._source = A2lSource(path=path)
+                parsers.append(a2l)
+        finally:
+            pool.terminate()
+        return parsers
+
+    @classmethod
+    def iterparse(cls, source, events=('end',), tags=None, keep_lexemes=False, max_comment_length=MAX_COMMENT_LENGTH,
+                  max_string_length=MAX_STRING_LENGTH, intern_table=None, projection=None,
+                  chunk_size=DEFAULT_CHUNK_SIZE, **custom_classes):
+        """
+        yields (event, node) pairs while the data of source (the path of a file, or a bytes-like object) is parsed, like
+        ElementTree.iterparse: the 'start' event of a node comes before the events of its children, its 'end' event
+        after them. only the nodes whose type is in tags (all of them if tags is None) are yielded. the data is scanned
+        by chunks (a file is read by chunks of chunk_size bytes), the tokens of the child blocks of the modules are held
+        until the blocks are parsed, by batches, then released: the memory used does not grow with the data. the parsed
+        blocks are not added to their module. the root, the project and the modules are given at their 'start' event
+        once their header is read, their other children are only added by their 'end' event. the blocks which can not
+        contain any node of tags are skipped without being parsed. the errors of the data are raised when reached.
+        """
+        events = frozenset(events)
+        if not events <= ITERPARSE_EVENTS:
+            raise ValueError('unknown events ' + ', '.join(sorted(events - ITERPARSE_EVENTS)) + '.')
+        tags = None if tags is None else frozenset(tags)
+        # the child blocks of the modules are only selected if tags are all found in them (or not in them at all).
+        include = None if tags is None or not tags <= MODULE_BLOCKS | SHELL_NODES else tags & MODULE_BLOCKS
+        scanner = A2lScanner(keep_lexemes=keep_lexemes, max_comment_length=max_comment_length,
+                             max_string_length=max_string_length, intern_table=intern_table)
+        engine = cls.descent_engine()
+        start, end = 'start' in events, 'end' in events
+        with using_classes(custom_classes), projecting(projection or dict()):
+            dropped = node_classes()['MODULE']._dropped
+        path, fp = None, None
+        if isinstance(source, (str, text_type)):
+            path, fp = source, open(source, 'rb')
+            chunks, position, decode = scanner._stream_source(fp, chunk_size)
+        else:
+            chunks, position, decode = scanner._source(source)
+        tokens = scanner._generate(chunks, position, decode, raw=True)
+
+        def parse(rule, items):
+            # the tokens are all part of the chunk being scanned, or of the previous ones.
+            with using_classes(custom_classes), projecting(projection or dict()):
+                return engine.parse_rule(rule, items, scanner.lexdata, scanner.lexoffset)
+
+        def invalid(token):
+            position, data, offset = token[2], scanner.lexdata, scanner.lexoffset
+            return A2lFormatException('invalid sequence at position ', position,
+                                      string=data if position >= offset else None, offset=offset)
+
+        def collect(block):
+            # the tokens of a block up to the keyword of its /end, block holding its /begin token and its keyword.
+            depth = 1
+            for token in tokens:
+                block.append(token)
+                if token[0] == 'begin':
+                    depth += 1
+                elif token[0] == 'end':
+                    depth -= 1
+                    if not depth:
+                        block.extend(itertools.islice(tokens, 1))
+                        return block
+            raise A2lFormatException('unterminated block at position ', block[0][2])
+
+        def shell(rule, head):
+            # the node of a project or of a module built from its header (whose first tokens are given), without its
+            # children. the /end token of the node is given once read.
+            head.extend(itertools.islice(tokens, 4 - len(head)))
+            last = head[-1][2:]
+            return parse(rule, head + [('end', '/end') + last, head[1][:2] + last])
+
+        def close(node, keyword):
+            token = next(tokens, None)
+            if token is None:
+                raise A2lFormatException('unterminated block at position ', node._start)
+            if token[0] != keyword:
+                raise invalid(token)
+            node._last = token[2]
+
+        def matched(event, node):
+            return event and (tags is None or node.node() in tags)
+
+        def walk(node):
+            if matched(start, node):
+                yield 'start', node
+            for child in node._children:
+                for event in walk(child):
+                    yield event
+            if matched(end, node):
+                yield 'end', node
+
+        def module_events(module):
+            # the consecutive child blocks of the module are parsed by batches.
+            batch, count = list(), 0
+            for token in tokens:
+                if token[0] == 'begin':
+                    block = collect([token] + list(itertools.islice(tokens, 1)))
+                    if include is not None and block[1][0] not in include or \
+                            block_rule(A2lBlock(block[1][0], block[2][1], None, None)) in dropped:
+                        continue
+                    batch.extend(block)
+                    count += 1
+                    if count < ITERPARSE_BATCH_SIZE:
+                        continue
+                elif token[0] != 'end':
+                    raise invalid(token)
+                if batch:
+                    for _, node in parse(PARALLEL_RULE, batch):
+                        node.set_parent(module)
+                        for event in walk(node):
+                            yield event
+                    batch, count = list(), 0
+                    # the values are only shared by the nodes of a batch, unless a table is given.
+                    if intern_table is None:
+                        scanner.intern_table.clear()
+                if token[0] == 'end':
+                    close(module, 'MODULE')
+                    return
+            raise A2lFormatException('unterminated block at position ', module._start)
+
+        def project_events(project):
+            for token in tokens:
+                if token[0] == 'end':
+                    close(project, 'PROJECT')
+                    return
+                if token[0] != 'begin':
+                    raise invalid(token)
+                keyword = next(tokens, None)
+                if keyword is None or keyword[0] not in ('MODULE', 'HEADER'):
+                    raise invalid(keyword or token)
+                if keyword[0] == 'MODULE':
+                    module = shell('module', [token, keyword])
+                    project.add_properties((('module', module),))
+                    if matched(start, module):
+                        yield 'start', module
+                    for event in module_events(module):
+                        yield event
+                    if matched(end, module):
+                        yield 'end', module
+                    continue
+                node = parse('header', collect([token, keyword]))
+                project.add_properties((('header', node),))
+                for event in walk(node):
+                    yield event
+            raise A2lFormatException('unterminated block at position ', project._start)
+
+        def root_events(root, items):
+            # the properties of the root read since its previous child.
+            if items:
+                items = parse('a2l_optional_list', items)
+                root.add_properties(items)
+                for _, node in items:
+                    if isinstance(node, A2lNode) and node._parent is root:
+                        for event in walk(node):
+                            yield event
+
+        try:
+            # the tokens of the root are parsed when a block or the end of the data is reached.
+            root, items = None, list()
+            for token in itertools.chain(tokens, (None,)):
+                if token is not None and token[0] != 'begin':
+                    items.append(token)
+                    continue
+                if root is None:
+                    root = parse('a2l', ())
+                    root._source = A2lSource(path=path) if path is not None else A2lSource(source)
+                    if matched(start, root):
+                        yield 'start', root
+                for event in root_events(root, items):
+                    yield event
+                items = list()
+                if token is None:
+                    break
+                project = shell('project', [token])
+                root.add_properties((('project', project),))
+                if matched(start, project):
+                    yield 'start', project
+                for event in project_events(project):
+                    yield event
+                if matched(end, project):
+                    yield 'end', project
+            if matched(end, root):
+                yield 'end', root
+        finally:
+            if fp is not None:
+                fp.close()
+
+    @classmethod
+    def _from_parallel_scan(cls, buf, processes, path, kwargs):
+        scanner = kwargs.pop('lexer', 'scanner')
+        options = dict((name, kwargs.pop(name)) for name in SCANNER_OPTIONS if name in kwargs)
+        if not isinstance(scanner, A2lScanner):
+            scanner = A2lScanner(**options)
+        scanner.input_parallel(buf, processes, path=path)
+        return cls(None, lexer=scanner, **kwargs)
+
+    @classmethod
+    def from_stream(cls, fp, chunk_size=DEFAULT_CHUNK_SIZE, keep_lexemes=False, max_comment_length=MAX_COMMENT_LENGTH,
+                    max_string_length=MAX_STRING_LENGTH, intern_table=None, **kwargs):
+        # the tokens are fed to the engine while fp is read, the file content is never held in memory as a whole.
+        scanner = A2lScanner(keep_lexemes=keep_lexemes, max_comment_length=max_comment_length,
+                             max_string_length=max_string_length, intern_table=intern_table)
+        scanner.input_stream(fp, chunk_size)
+        return cls(None, lexer=scanner, **kwargs)
+
+    @staticmethod
+    def engine():
+        # the LALR tables are loaded (or, if parsetab.py does not match the grammar, built in memory) once per
+        # process. the resulting engine holds no state between two parses and is shared by all A2lParser instances.
+        if A2lParser._engine is None:
+            with A2lParser._engine_lock:
+                if A2lParser._engine is None:
+                    A2lParser._engine = track_spans(yacc.yacc(module=A2lParser, tabmodule=PARSE_TABLE_MODULE,
+                                                              debug=False, write_tables=False,
+                                                              errorlog=yacc.NullLogger()))
+        return A2lParser._engine
+
+    @staticmethod
+    def descent_engine():
+        # built from the productions of the ply engine, which reports the errors.
+        engine = A2lParser.engine()
+        if A2lParser._descent_engine is None:
+            with A2lParser._engine_lock:
+                if A2lParser._descent_engine is None:
+                    A2lParser._descent_engine = A2lDescentEngine(engine.productions, A2lParser, engine,
+                                                                 A2lParser.rule_engine)
+        return A2lParser._descent_engine
+
+    @staticmethod
+    def rule_engine(rule):
+        # the ply engine parsing rule alone, used by the descent engine when it does not expect a token of a rule. the
+        # tables of a rule other than the start one are built in memory (in about 0.1 s) when first requested.
+        engine = A2lParser.engine()
+        if rule == engine.productions[0].str.split()[2]:
+            return engine
+        if rule not in A2lParser._rule_engines:
+            with A2lParser._engine_lock:
+                if rule not in A2lParser._rule_engines:
+                    A2lParser._rule_engines[rule] = track_spans(yacc.yacc(
+                        module=A2lParser, start=rule, tabmodule=PARSE_TABLE_MODULE, debug=False, write_tables=False,
+                        errorlog=yacc.NullLogger()))
+        return A2lParser._rule_engines[rule]
 
     def get_node(self, node_name):
         if self.tree:
@@ -43,19 +939,28 @@ class A2lParser(object):
         else:
             return []
 
+    def resolve_references(self):
+        # the dangling references of every module of the tree (see Module.resolve_references).
+        project = self.tree.project if self.tree else None
+        return [diagnostic for module in (project.module if project else ()) for diagnostic in
+                module.resolve_references()]
+
     @staticmethod
     def p_error(p):
         if p:
-            raise A2lFormatException('invalid sequence at position ', p.lexpos, string=p.lexer.lexdata)
+            raise A2lFormatException('invalid sequence at position ', p.lexpos, string=p.lexer.lexdata,
+                                     offset=p.lexer.lexoffset)
         else:
             raise A2lFormatException('unvalid sequence in root node ', 0, string='')
 
-    def p_a2l(self, p):
+    @staticmethod
+    @action('node')
+    def p_a2l(p):
         """a2l : a2l_optional_list_optional"""
         p[0] = a2l_node_factory('ROOT', p[1])
-        self.tree = p[0]
 
     @staticmethod
+    @action('tagged')
     def p_a2l_optional(p):
         """a2l_optional : asap2_version
                         | a2ml_version
@@ -63,41 +968,49 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_a2l_optional_list(p):
         """a2l_optional_list : a2l_optional
-                             | a2l_optional a2l_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                             | a2l_optional_list a2l_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_a2l_optional_list_optional(p):
         """a2l_optional_list_optional : empty
                                       | a2l_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_declaration(p):
         """a2ml_declaration : a2ml_type_definition SEMICOLON
                             | a2ml_block_definition SEMICOLON"""
         p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_a2ml_declaration_list(p):
         """a2ml_declaration_list : a2ml_declaration
-                                 | a2ml_declaration a2ml_declaration_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                 | a2ml_declaration_list a2ml_declaration"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_type_definition(p):
         """a2ml_type_definition : a2ml_type_name"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_type_name(p):
         """a2ml_type_name : a2ml_predefined_type_name
                           | a2ml_struct_type_name
@@ -107,6 +1020,7 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_predefined_type_name(p):
         """a2ml_predefined_type_name : char
                                      | int
@@ -135,87 +1049,102 @@ class A2lParser(object):
     @staticmethod
     def p_a2ml_enumerator_list(p):
         """a2ml_enumerator_list : a2ml_enumerator
-                                | a2ml_enumerator COMMA a2ml_enumerator_list"""
-        try:
-            p[0] = [p[1]] + p[3]
-        except IndexError:
+                                | a2ml_enumerator_list COMMA a2ml_enumerator"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_enumerator(p):
         """a2ml_enumerator : a2ml_keyword EQUAL a2ml_constant
                            | a2ml_keyword"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_struct_type_name(p):
         """a2ml_struct_type_name : struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE
                                  | struct a2ml_identifier"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_struct_member_list_optional(p):
         """a2ml_struct_member_list_optional : empty
                                             | a2ml_struct_member_list"""
         p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_a2ml_struct_member_list(p):
         """a2ml_struct_member_list : a2ml_struct_member
-                                   | a2ml_struct_member a2ml_struct_member_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                   | a2ml_struct_member_list a2ml_struct_member"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_struct_member(p):
         """a2ml_struct_member : a2ml_member SEMICOLON"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_member(p):
         """a2ml_member : a2ml_type_name a2ml_array_specifier_optional"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_member_optional(p):
         """a2ml_member_optional : empty
                                 | a2ml_member"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_array_specifier_optional(p):
         """a2ml_array_specifier_optional : empty
                                          | a2ml_array_specifier"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_array_specifier(p):
         """a2ml_array_specifier : BRACE_OPEN a2ml_constant BRACE_CLOSE
-                                | BRACE_OPEN a2ml_constant BRACE_CLOSE a2ml_array_specifier"""
+                                | a2ml_array_specifier BRACE_OPEN a2ml_constant BRACE_CLOSE"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_taggedstruct_type_name(p):
         """a2ml_taggedstruct_type_name : taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE
                                        | taggedstruct a2ml_identifier"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_a2ml_taggedstruct_member_list_optional(p):
         """a2ml_taggedstruct_member_list_optional : empty
                                                   | a2ml_taggedstruct_member_list"""
         p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_a2ml_taggedstruct_member_list(p):
         """a2ml_taggedstruct_member_list : a2ml_taggedstruct_member
-                                         | a2ml_taggedstruct_member a2ml_taggedstruct_member_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                         | a2ml_taggedstruct_member_list a2ml_taggedstruct_member"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
     def p_a2ml_taggedstruct_member(p):
@@ -236,15 +1165,18 @@ class A2lParser(object):
                                       | taggedunion a2ml_identifier"""
 
     @staticmethod
+    @action('append')
     def p_a2ml_taggedunion_member_list(p):
         """a2ml_taggedunion_member_list : a2ml_taggedunion_member
-                                        | a2ml_taggedunion_member a2ml_taggedunion_member_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | a2ml_taggedunion_member_list a2ml_taggedunion_member"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_a2ml_taggedunion_member_list_optional(p):
         """a2ml_taggedunion_member_list_optional : empty
                                                  | a2ml_taggedunion_member_list"""
@@ -278,6 +1210,7 @@ class A2lParser(object):
         """a2ml_constant : NUMERIC"""
 
     @staticmethod
+    @action('select', 1)
     def p_datatype(p):
         """datatype : UBYTE
                     | SBYTE
@@ -292,6 +1225,7 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_datasize(p):
         """datasize : BYTE
                     | WORD
@@ -299,6 +1233,7 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_addrtype(p):
         """addrtype : PBYTE
                     | PWORD
@@ -307,17 +1242,20 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_indexorder(p):
         """indexorder : INDEX_INCR
                       | INDEX_DECR"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_asap2_version(p):
         """asap2_version : ASAP2_VERSION NUMERIC NUMERIC"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_a2ml_version(p):
         """a2ml_version : A2ML_VERSION NUMERIC NUMERIC"""
         p[0] = a2l_node_factory(*p[1:4])
@@ -330,13 +1268,15 @@ class A2lParser(object):
                              | begin IDENT generic_parameter_list_optional end IDENT"""
 
     @staticmethod
+    @action('append')
     def p_generic_parameter_list(p):
         """generic_parameter_list : generic_parameter
-                                  | generic_parameter generic_parameter_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                  | generic_parameter_list generic_parameter"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
     def p_generic_parameter_list_optional(p):
@@ -344,100 +1284,120 @@ class A2lParser(object):
                                            | generic_parameter_list"""
 
     @staticmethod
+    @action('append')
     def p_number_list(p):
         """number_list : NUMERIC
-                       | NUMERIC number_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                       | number_list NUMERIC"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_ident_list(p):
         """ident_list : IDENT
-                      | IDENT ident_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                      | ident_list IDENT"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_string_list(p):
         """string_list : STRING
-                       | STRING string_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                       | string_list STRING"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('factory', 2, 6)
     def p_project(p):
         """project : begin PROJECT IDENT STRING project_optional_list_optional end PROJECT"""
         p[0] = a2l_node_factory(*p[2:6])
 
     @staticmethod
+    @action('tagged')
     def p_project_optional(p):
         """project_optional : header
                             | module"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_project_optional_list(p):
         """project_optional_list : project_optional
-                                 | project_optional project_optional_list """
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                 | project_optional_list project_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_project_optional_list_optional(p):
         """project_optional_list_optional : empty
                                           | project_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_header(p):
         """header : begin HEADER STRING header_optional_list_optional end HEADER"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_header_optional(p):
         """header_optional : version
                            | project_no"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_header_optional_list(p):
         """header_optional_list : header_optional
-                                | header_optional header_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                | header_optional_list header_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_header_optional_list_optional(p):
         """header_optional_list_optional : empty
                                          | header_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_version(p):
         """version : VERSION STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_project_no(p):
         """project_no : PROJECT_NO IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 6)
     def p_module(p):
         """module : begin MODULE IDENT STRING module_optional_list_optional end MODULE"""
         p[0] = a2l_node_factory(*p[2:6])
 
     @staticmethod
+    @action('tagged')
     def p_module_optional(p):
         """module_optional : a2ml
                            | mod_par
@@ -461,31 +1421,37 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_module_optional_list(p):
         """module_optional_list : module_optional
-                                | module_optional module_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                | module_optional_list module_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_module_optional_list_optional(p):
         """module_optional_list_optional : empty
                                          | module_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 3)
     def p_a2ml(p):
         """a2ml : begin A2ML a2ml_declaration_list end A2ML"""
         p[0] = p[3]
 
     @staticmethod
+    @action('node')
     def p_if_data_xcp(p):
         """if_data_xcp : begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATA"""
         p[0] = a2l_node_factory('if_data_xcp', p[4])
 
     @staticmethod
+    @action('tagged')
     def p_if_data_xcp_optional(p):
         """if_data_xcp_optional : protocol_layer
                                 | daq
@@ -494,15 +1460,17 @@ class A2lParser(object):
                                 | segment
                                 | daq_event
                                 | xcp_on_can
-                                | generic_parameter_list"""
+                                | generic_parameter_list %prec LIST"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_xcp_on_can(p):
         """xcp_on_can : begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CAN"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_xcp_on_can_optional(p):
         """xcp_on_can_optional : can_id_broadcast
                                | can_id_master
@@ -517,73 +1485,87 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_xcp_on_can_optional_list(p):
         """xcp_on_can_optional_list : xcp_on_can_optional
-                                    | xcp_on_can_optional xcp_on_can_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | xcp_on_can_optional_list xcp_on_can_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_xcp_on_can_optional_list_optional(p):
         """xcp_on_can_optional_list_optional : empty
                                              | xcp_on_can_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_can_id_broadcast(p):
         """can_id_broadcast : CAN_ID_BROADCAST NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_can_id_master(p):
         """can_id_master : CAN_ID_MASTER NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_can_id_slave(p):
         """can_id_slave : CAN_ID_SLAVE NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_baudrate(p):
         """baudrate : BAUDRATE NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_sample_point(p):
         """sample_point : SAMPLE_POINT NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_sample_rate(p):
         """sample_rate : SAMPLE_RATE SINGLE
                        | SAMPLE_RATE TRIPLE"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_btl_cycles(p):
         """btl_cycles : BTL_CYCLES NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_sjw(p):
         """sjw : SJW NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_sync_edge(p):
         """sync_edge : SYNC_EDGE SINGLE
                      | SYNC_EDGE DUAL"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_daq_list_can_id(p):
         """daq_list_can_id : begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_ID"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_daq_list_can_id_optional(p):
         """daq_list_can_id_optional : daq_list_can_id_type_variable
                                     | daq_list_can_id_type_fixed"""
@@ -596,48 +1578,57 @@ class A2lParser(object):
         p[0] = tuple() if p[1] is None else (p[1],)
 
     @staticmethod
+    @action('select', 1)
     def p_daq_list_can_id_type_variable(p):
         """daq_list_can_id_type_variable : VARIABLE"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_daq_list_can_id_type_fixed(p):
         """daq_list_can_id_type_fixed : FIXED NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_daq_event(p):
         """daq_event : begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT
                      | begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENT"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_daq_event_optional(p):
         """daq_event_optional : available_event_list
                               | default_event_list"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_daq_event_optional_list(p):
         """daq_event_optional_list : daq_event_optional
-                                   | daq_event_optional daq_event_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                   | daq_event_optional_list daq_event_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_daq_event_optional_list_optional(p):
         """daq_event_optional_list_optional : empty
                                             | daq_event_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_default_event_list(p):
         """default_event_list : begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LIST"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_available_event_list(p):
         """available_event_list : begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LIST"""
         p[0] = a2l_node_factory(*p[2:4])
@@ -648,109 +1639,130 @@ class A2lParser(object):
         p[0] = 'event', p[2]
 
     @staticmethod
+    @action('append')
     def p_available_event_list_optional_list(p):
         """available_event_list_optional_list : available_event_list_optional
-                                              | available_event_list_optional available_event_list_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                              | available_event_list_optional_list available_event_list_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_available_event_list_optional_list_optional(p):
         """available_event_list_optional_list_optional : empty
                                                        | available_event_list_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('append')
     def p_if_data_xcp_optional_list(p):
         """if_data_xcp_optional_list : if_data_xcp_optional
-                                     | if_data_xcp_optional if_data_xcp_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                     | if_data_xcp_optional_list if_data_xcp_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_if_data_xcp_optional_list_optional(p):
         """if_data_xcp_optional_list_optional : empty
                                                      | if_data_xcp_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_pag(p):
         """pag : begin PAG NUMERIC pag_optional_list_optional end PAG"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('factory', 2, 7)
     def p_pgm(p):
         """pgm : begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGM"""
         p[0] = a2l_node_factory(*p[2:7])
 
     @staticmethod
+    @action('tagged')
     def p_pgm_optional(p):
         """pgm_optional : sector
-                        | generic_parameter_list"""
+                        | generic_parameter_list %prec LIST"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_pgm_optional_list(p):
         """pgm_optional_list : pgm_optional
-                             | pgm_optional pgm_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                             | pgm_optional_list pgm_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_pgm_optional_list_optional(p):
         """pgm_optional_list_optional : empty
                                       | pgm_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 10)
     def p_sector(p):
         """sector : begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTOR"""
         p[0] = a2l_node_factory(*p[2:10])
 
     @staticmethod
+    @action('tagged')
     def p_pag_optional(p):
         """pag_optional : freeze_supported
-                        | generic_parameter_list"""
+                        | generic_parameter_list %prec LIST"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_pag_optional_list(p):
         """pag_optional_list : pag_optional
-                             | pag_optional pag_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                             | pag_optional_list pag_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_pag_optional_list_optional(p):
         """pag_optional_list_optional : empty
                                       | pag_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_freeze_supported(p):
         """freeze_supported : FREEZE_SUPPORTED"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 2, 14)
     def p_daq(p):
         """daq : begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQ"""
         p[0] = a2l_node_factory(*p[2:14])
 
     @staticmethod
+    @action('select', 1)
     def p_daq_config_type(p):
         """daq_config_type : STATIC
                            | DYNAMIC"""
         p[0] = p[1]
 
     @staticmethod
+    @action('tagged')
     def p_daq_optional(p):
         """daq_optional : daq_list
                         | event
@@ -767,16 +1779,19 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_prescaler_supported(p):
         """prescaler_supported : PRESCALER_SUPPORTED"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_resume_supported(p):
         """resume_supported : RESUME_SUPPORTED"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_optimisation_type(p):
         """optimisation_type : OPTIMISATION_TYPE_DEFAULT
                              | OPTIMISATION_TYPE_ODT_TYPE_16
@@ -787,6 +1802,7 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_address_extension(p):
         """address_extension : ADDRESS_EXTENSION_FREE
                              | ADDRESS_EXTENSION_ODT
@@ -794,6 +1810,7 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_identification_field_type(p):
         """identification_field_type : IDENTIFICATION_FIELD_TYPE_ABSOLUTE
                                      | IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE
@@ -802,6 +1819,7 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_granularity_odt_entry(p):
         """granularity_odt_entry : GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE
                                  | GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD
@@ -810,6 +1828,7 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_overload_indication(p):
         """overload_indication : NO_OVERLOAD_INDICATION
                                | OVERLOAD_INDICATION_PID
@@ -817,31 +1836,37 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_daq_optional_list(p):
         """daq_optional_list : daq_optional
-                             | daq_optional daq_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                             | daq_optional_list daq_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_daq_optional_list_optional(p):
         """daq_optional_list_optional : empty
                                       | daq_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 11)
     def p_event(p):
         """event : begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENT"""
         p[0] = a2l_node_factory(*p[2:11])
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_daq_list(p):
         """daq_list : begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LIST"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_daq_list_optional(p):
         """daq_list_optional : daq_list_type
                              | max_odt
@@ -852,6 +1877,7 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_daq_list_type_enum(p):
         """daq_list_type_enum : DAQ
                               | STIM
@@ -859,51 +1885,61 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_daq_list_type(p):
         """daq_list_type : DAQ_LIST_TYPE daq_list_type_enum"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_max_odt(p):
         """max_odt : MAX_ODT NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_max_odt_entries(p):
         """max_odt_entries : MAX_ODT_ENTRIES NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_first_pid(p):
         """first_pid : FIRST_PID NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_event_fixed(p):
         """event_fixed : EVENT_FIXED NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 1)
     def p_predefined(p):
-        """predefined : generic_parameter_list"""
+        """predefined : generic_parameter_list %prec LIST"""
         p[0] = p[1]  # TODO: implement according to a2ml specification.
 
     @staticmethod
+    @action('append')
     def p_daq_list_optional_list(p):
         """daq_list_optional_list : daq_list_optional
-                                  | daq_list_optional daq_list_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                  | daq_list_optional_list daq_list_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_daq_list_optional_list_optional(p):
         """daq_list_optional_list_optional : empty
                                            | daq_list_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 7)
     def p_timestamp_supported(p):
         """timestamp_supported : begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTED"""
         p[0] = a2l_node_factory(*p[2:7])
@@ -920,35 +1956,41 @@ class A2lParser(object):
         p[0] = ((p.slice[0].type, p[1]),) if p[1] is not None else tuple()
 
     @staticmethod
+    @action('factory', 2, 13)
     def p_protocol_layer(p):
         """protocol_layer : begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYER"""
         p[0] = a2l_node_factory(*p[2:13])
 
     @staticmethod
     def p_protocol_layer_optional(p):
-        """protocol_layer_optional : generic_parameter_list"""
+        """protocol_layer_optional : generic_parameter_list %prec LIST"""
 
     @staticmethod
+    @action('append')
     def p_protocol_layer_optional_list(p):
         """protocol_layer_optional_list : protocol_layer_optional
-                                        | protocol_layer_optional protocol_layer_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | protocol_layer_optional_list protocol_layer_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_protocol_layer_optional_list_optional(p):
         """protocol_layer_optional_list_optional : empty
                                                  | protocol_layer_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('node')
     def p_if_data_module(p):
         """if_data_module : begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATA"""
         p[0] = a2l_node_factory('if_data_module', *p[3:5])
 
     @staticmethod  # TODO: protocol_layer, daq and xcp_on_can are not available in rev.1.51...
+    @action('tagged')
     def p_if_data_module_optional(p):
         """if_data_module_optional : source
                                    | raster
@@ -960,15 +2002,18 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_if_data_module_optional_list(p):
         """if_data_module_optional_list : if_data_module_optional
-                                        | if_data_module_optional if_data_module_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | if_data_module_optional_list if_data_module_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_if_data_module_optional_list_optional(p):
         """if_data_module_optional_list_optional : empty
                                                  | if_data_module_optional_list"""
@@ -976,29 +2021,34 @@ class A2lParser(object):
 
     @staticmethod
     def p_if_data_module_unsupported_element(p):
-        """if_data_module_unsupported_element : generic_parameter_list"""
+        """if_data_module_unsupported_element : generic_parameter_list %prec LIST"""
 
     @staticmethod
+    @action('factory', 2, 7)
     def p_source(p):
         """source : begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCE"""
         p[0] = a2l_node_factory(*p[2:7])
 
     @staticmethod
+    @action('factory', 2, 8)
     def p_raster(p):
         """raster : begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTER"""
         p[0] = a2l_node_factory(*p[2:8])
 
     @staticmethod
+    @action('factory', 2, 6)
     def p_event_group(p):
         """event_group : begin EVENT_GROUP STRING STRING number_list end EVENT_GROUP"""
         p[0] = a2l_node_factory(*p[2:6])
 
     @staticmethod
+    @action('factory', 2, 6)
     def p_seed_key(p):
         """seed_key : begin SEED_KEY STRING STRING STRING end SEED_KEY"""
         p[0] = a2l_node_factory(*p[2:6])
 
     @staticmethod  # TODO: ident ident numeric pattern is not part of the specification, check...
+    @action('node')
     def p_checksum(p):
         """checksum : begin CHECKSUM STRING end CHECKSUM
                     | begin CHECKSUM IDENT max_block_size end CHECKSUM"""
@@ -1008,36 +2058,43 @@ class A2lParser(object):
             p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('select', 2)
     def p_max_block_size(p):
         """max_block_size : MAX_BLOCK_SIZE NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 1)
     def p_tp_blob(p):
         """tp_blob : TP_BLOB"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_tp_data(p):
-        """tp_data : generic_parameter_list"""
+        """tp_data : generic_parameter_list %prec LIST"""
         p[0] = p[1]
 
     @staticmethod
+    @action('tagged')
     def p_source_optional(p):
         """source_optional : display_identifier
                            | qp_blob"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_source_optional_list(p):
         """source_optional_list : source_optional
-                                | source_optional source_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                | source_optional_list source_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_source_optional_list_optional(p):
         """source_optional_list_optional : empty
                                          | source_optional_list"""
@@ -1048,11 +2105,13 @@ class A2lParser(object):
         """qp_blob : QP_BLOB IDENT"""
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_mod_par(p):
         """mod_par : begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PAR"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_mod_par_optional(p):
         """mod_par_optional : version
                             | addr_epk
@@ -1073,61 +2132,73 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_mod_par_optional_list(p):
         """mod_par_optional_list : mod_par_optional
-                                 | mod_par_optional mod_par_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                 | mod_par_optional_list mod_par_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_mod_par_optional_list_optional(p):
         """mod_par_optional_list_optional : empty
                                           | mod_par_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_addr_epk(p):
         """addr_epk : ADDR_EPK NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_epk(p):
         """epk : EPK STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_supplier(p):
         """supplier : SUPPLIER STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_customer(p):
         """customer : CUSTOMER STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_customer_no(p):
         """customer_no : CUSTOMER_NO STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_user(p):
         """user : USER STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_phone_no(p):
         """phone_no : PHONE_NO STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_mod_common(p):
         """mod_common : begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMON"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_mod_common_optional(p):
         """mod_common_optional : s_rec_layout
                                | deposit
@@ -1142,106 +2213,127 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_mod_common_optional_parameter_list(p):
         """mod_common_optional_list : mod_common_optional
-                                    | mod_common_optional mod_common_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | mod_common_optional_list mod_common_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_mod_common_optional_parameter_list_optional(p):
         """mod_common_optional_list_optional : empty
                                              | mod_common_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_s_rec_layout(p):
         """s_rec_layout : S_REC_LAYOUT IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_data_size(p):
         """data_size : DATA_SIZE NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_ecu(p):
         """ecu : ECU STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_cpu_type(p):
         """cpu_type : CPU_TYPE STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_no_of_interfaces(p):
         """no_of_interfaces : NO_OF_INTERFACES NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_ecu_calibration_offset(p):
         """ecu_calibration_offset : ECU_CALIBRATION_OFFSET NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 6)
     def p_calibration_method(p):
         """calibration_method : begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHOD"""
         p[0] = a2l_node_factory(*p[2:6])
 
     @staticmethod
+    @action('tagged')
     def p_calibration_method_optional(p):
         """calibration_method_optional : calibration_handle"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_calibration_method_optional_list(p):
         """calibration_method_optional_list : calibration_method_optional
-                                            | calibration_method_optional calibration_method_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                            | calibration_method_optional_list calibration_method_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_calibration_method_optional_list_optional(p):
         """calibration_method_optional_list_optional : empty
                                                      | calibration_method_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 3)
     def p_calibration_handle(p):
         """calibration_handle : begin CALIBRATION_HANDLE calibration_handle_optional_list_optional end CALIBRATION_HANDLE"""
         p[0] = p[3]
 
     @staticmethod
+    @action('tagged')
     def p_calibration_handle_optional(p):
         """calibration_handle_optional : NUMERIC"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_calibration_handle_optional_list(p):
         """calibration_handle_optional_list : calibration_handle_optional
-                                            | calibration_handle_optional calibration_handle_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                            | calibration_handle_optional_list calibration_handle_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_calibration_handle_optional_list_optional(p):
         """calibration_handle_optional_list_optional : empty
                                                      | calibration_handle_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 8)
     def p_memory_layout(p):
         """memory_layout : begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUT"""
         p[0] = a2l_node_factory(*p[2:8])
 
     @staticmethod
+    @action('select', 1)
     def p_memory_layout_prg_type(p):
         """memory_layout_prg_type : PRG_CODE
                                   | PRG_DATA
@@ -1249,18 +2341,21 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('tagged')
     def p_memory_layout_optional(p):
         """memory_layout_optional : if_data_memory_layout"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_memory_layout_optional_list(p):
         """memory_layout_optional_list : memory_layout_optional
-                                       | memory_layout_optional memory_layout_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | memory_layout_optional_list memory_layout_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
     def p_memory_layout_optional_list_optional(p):
@@ -1278,13 +2373,15 @@ class A2lParser(object):
                                           | ba_blob pa_data"""
 
     @staticmethod
+    @action('append')
     def p_if_data_memory_layout_optional_list(p):
         """if_data_memory_layout_optional_list : if_data_memory_layout_optional
-                                               | if_data_memory_layout_optional if_data_memory_layout_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                               | if_data_memory_layout_optional_list if_data_memory_layout_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
     def p_if_data_memory_layout_optional_list_optional(p):
@@ -1292,52 +2389,62 @@ class A2lParser(object):
                                                         | if_data_memory_layout_optional_list"""
 
     @staticmethod
+    @action('select', 1)
     def p_dp_blob(p):
         """dp_blob : DP_BLOB"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_ba_blob(p):
         """ba_blob : BA_BLOB"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_dp_data(p):
-        """dp_data : generic_parameter_list"""
+        """dp_data : generic_parameter_list %prec LIST"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_pa_data(p):
-        """pa_data : generic_parameter_list"""
+        """pa_data : generic_parameter_list %prec LIST"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 2, 12)
     def p_memory_segment(p):
         """memory_segment : begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENT"""
         p[0] = a2l_node_factory(*p[2:12])
 
     @staticmethod
+    @action('tagged')
     def p_memory_segment_optional(p):
         """memory_segment_optional : if_data_memory_segment
                                    | if_data_xcp"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_memory_segment_optional_parameter_list(p):
         """memory_segment_optional_parameter_list : memory_segment_optional
-                                                  | memory_segment_optional memory_segment_optional_parameter_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                                  | memory_segment_optional_parameter_list memory_segment_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_memory_segment_optional_list_optional(p):
         """memory_segment_optional_list_optional : empty
                                                  | memory_segment_optional_parameter_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_memory_segment_prg_type(p):
         """memory_segment_prg_type : CODE
                                    | DATA
@@ -1350,6 +2457,7 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_memory_segment_memory_type(p):
         """memory_segment_memory_type : RAM
                                       | EEPROM
@@ -1360,22 +2468,26 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_memory_segment_attributes(p):
         """memory_segment_attributes : INTERN
                                      | EXTERN"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_system_constant(p):
         """system_constant : SYSTEM_CONSTANT STRING STRING"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('node')
     def p_if_data_memory_segment(p):
         """if_data_memory_segment : begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATA"""
         p[0] = a2l_node_factory('if_data_memory_segment', *p[3:5])
 
     @staticmethod
+    @action('tagged')
     def p_if_data_memory_segment_optional(p):
         """if_data_memory_segment_optional : address_mapping
                                            | segment
@@ -1383,42 +2495,49 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_if_data_memory_segment_optional_list(p):
         """if_data_memory_segment_optional_list : if_data_memory_segment_optional
-                                                | if_data_memory_segment_optional if_data_memory_segment_optional_list"""
-
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+            | if_data_memory_segment_optional_list if_data_memory_segment_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_if_data_memory_segment_optional_list_optional(p):
         """if_data_memory_segment_optional_list_optional : empty
                                                          | if_data_memory_segment_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod  # TODO: segment is not defined in the specification, check...
+    @action('factory', 2, 9)
     def p_segment(p):
         """segment : begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENT"""
         p[0] = a2l_node_factory(*p[2:9])
 
     @staticmethod
+    @action('tagged')
     def p_segment_optional_parameter(p):
         """segment_optional_parameter : page
                                       | checksum"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_segment_optional_parameter_list(p):
         """segment_optional_parameter_list : segment_optional_parameter
-                                           | segment_optional_parameter segment_optional_parameter_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                           | segment_optional_parameter_list segment_optional_parameter"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_segment_optional_parameter_list_optional(p):
         """segment_optional_parameter_list_optional : empty
                                                     | segment_optional_parameter_list"""
@@ -1433,13 +2552,15 @@ class A2lParser(object):
         """page_optional_parameter : init_segment"""
 
     @staticmethod
+    @action('append')
     def p_page_optional_parameter_list(p):
         """page_optional_parameter_list : page_optional_parameter
-                                        | page_optional_parameter page_optional_parameter_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | page_optional_parameter_list page_optional_parameter"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
     def p_page_optional_parameter_list_optional(p):
@@ -1451,16 +2572,19 @@ class A2lParser(object):
         """init_segment : INIT_SEGMENT NUMERIC"""
 
     @staticmethod
+    @action('factory', 1, 5)
     def p_address_mapping(p):
         """address_mapping : ADDRESS_MAPPING NUMERIC NUMERIC NUMERIC"""
         p[0] = a2l_node_factory(*p[1:5])
 
     @staticmethod
+    @action('factory', 2, 13)
     def p_characteristic(p):
         """characteristic : begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTIC"""
         p[0] = a2l_node_factory(*p[2:13])
 
     @staticmethod
+    @action('select', 1)
     def p_characteristic_type(p):
         """characteristic_type : VALUE
                                | CURVE
@@ -1471,57 +2595,68 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_display_identifier(p):
         """display_identifier : DISPLAY_IDENTIFIER IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_format(p):
         """format : FORMAT STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_byte_order(p):
         """byte_order : BYTE_ORDER byte_order_type"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 1)
     def p_byte_order_type(p):
         """byte_order_type : MSB_FIRST
                            | MSB_LAST"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_bit_mask(p):
         """bit_mask : BIT_MASK NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('node')
     def p_function_list(p):
         """function_list : begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LIST"""
         p[0] = a2l_node_factory(p[2], [('name', c[1]) for c in p[3]])
 
     @staticmethod
+    @action('tagged')
     def p_function_list_optional(p):
         """function_list_optional : IDENT"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_function_list_optional_list(p):
         """function_list_optional_list : function_list_optional
-                                       | function_list_optional function_list_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | function_list_optional_list function_list_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_function_list_optional_list_optional(p):
         """function_list_optional_list_optional : empty
                                                 | function_list_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_number(p):
         """number : NUMBER NUMERIC"""
         p[0] = p[2]
@@ -1532,42 +2667,50 @@ class A2lParser(object):
         p[0] = [p[2], p[3]]
 
     @staticmethod
+    @action('select', 3)
     def p_map_list(p):
         """map_list : begin MAP_LIST ident_list end MAP_LIST"""
         p[0] = p[3]
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_max_refresh(p):
         """max_refresh : MAX_REFRESH NUMERIC NUMERIC"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('node')
     def p_dependent_characteristic(p):
         """dependent_characteristic : begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTIC"""
         p[0] = a2l_node_factory(p[2], p[3], (('characteristic', c) for c in p[4]))
 
     @staticmethod
+    @action('node')
     def p_virtual_characteristic(p):
         """virtual_characteristic : begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTIC"""
         p[0] = a2l_node_factory(p[2], p[3], (('characteristic', c) for c in p[4]))
 
     @staticmethod
+    @action('optional')
     def p_virtual_characteristic_optional(p):
         """virtual_characteristic_optional : empty
                                            | ident_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_ref_memory_segment(p):
         """ref_memory_segment : REF_MEMORY_SEGMENT IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_annotation(p):
         """annotation : begin ANNOTATION annotation_optional_list_optional end ANNOTATION"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_annotation_optional(p):
         """annotation_optional : annotation_label
                                | annotation_origin
@@ -1575,46 +2718,55 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_annotation_optional_list(p):
         """annotation_optional_list : annotation_optional
-                                    | annotation_optional annotation_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | annotation_optional_list annotation_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_annotation_optional_list_optional(p):
         """annotation_optional_list_optional : empty
                                              | annotation_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_annotation_label(p):
         """annotation_label : ANNOTATION_LABEL STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_annotation_origin(p):
         """annotation_origin : ANNOTATION_ORIGIN STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('node')
     def p_annotation_text(p):
         """annotation_text : begin ANNOTATION_TEXT string_list end ANNOTATION_TEXT"""
         p[0] = a2l_node_factory(p[2], (('annotation_text', s) for s in p[3]))
 
     @staticmethod
+    @action('select', 2)
     def p_comparison_quantity(p):
         """comparison_quantity : COMPARISON_QUANTITY IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 10)
     def p_axis_descr(p):
         """axis_descr : begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCR"""
         p[0] = a2l_node_factory(*p[2:10])
 
     @staticmethod
+    @action('tagged')
     def p_axis_descr_optional(p):
         """axis_descr_optional : read_only
                                | format
@@ -1632,36 +2784,43 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_axis_descr_optional_list(p):
         """axis_descr_optional_list : axis_descr_optional
-                                    | axis_descr_optional axis_descr_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | axis_descr_optional_list axis_descr_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_axis_descr_optional_list_optional(p):
         """axis_descr_optional_list_optional : empty
                                              | axis_descr_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_axis_pts_ref(p):
         """axis_pts_ref : AXIS_PTS_REF IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_max_grad(p):
         """max_grad : MAX_GRAD NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_monotony(p):
         """monotony : MONOTONY monotony_type"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 1)
     def p_monotony_type(p):
         """monotony_type : MON_INCREASE
                          | MON_DECREASE
@@ -1670,26 +2829,31 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 1, 5)
     def p_fix_axis_par(p):
         """fix_axis_par : FIX_AXIS_PAR NUMERIC NUMERIC NUMERIC"""
         p[0] = a2l_node_factory(*p[1:5])
 
     @staticmethod
+    @action('factory', 1, 5)
     def p_fix_axis_par_dist(p):
         """fix_axis_par_dist : FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERIC"""
         p[0] = a2l_node_factory(*p[1:5])
 
     @staticmethod
+    @action('select', 3)
     def p_fix_axis_par_list(p):
         """fix_axis_par_list : begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LIST"""
         p[0] = p[3]
 
     @staticmethod
+    @action('select', 2)
     def p_curve_axis_ref(p):
         """curve_axis_ref : CURVE_AXIS_REF IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 1)
     def p_axis_descr_attribute(p):
         """axis_descr_attribute : STD_AXIS
                                 | FIX_AXIS
@@ -1699,11 +2863,13 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_calibration_access(p):
         """calibration_access : CALIBRATION_ACCESS calibration_access_type"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 1)
     def p_calibration_access_type(p):
         """calibration_access_type : CALIBRATION
                                    | NO_CALIBRATION
@@ -1717,11 +2883,13 @@ class A2lParser(object):
         p[0] = (p[2], p[3], p[4])
 
     @staticmethod
+    @action('select', 2)
     def p_ecu_address_extension(p):
         """ecu_address_extension : ECU_ADDRESS_EXTENSION NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('tagged')
     def p_characteristic_optional(p):
         """characteristic_optional : display_identifier
                                    | format
@@ -1748,15 +2916,18 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_characteristic_optional_list(p):
         """characteristic_optional_list : characteristic_optional
-                                        | characteristic_optional characteristic_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | characteristic_optional_list characteristic_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_characteristic_optional_list_optional(p):
         """characteristic_optional_list_optional : empty
                                                  | characteristic_optional_list"""
@@ -1767,11 +2938,13 @@ class A2lParser(object):
         """if_data_characteristic : if_data_memory_layout"""
 
     @staticmethod
+    @action('factory', 2, 14)
     def p_axis_pts(p):
         """axis_pts : begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTS"""
         p[0] = a2l_node_factory(*p[2:14])
 
     @staticmethod
+    @action('tagged')
     def p_axis_pts_optional(p):
         """axis_pts_optional : display_identifier
                              | read_only
@@ -1789,42 +2962,50 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_axis_pts_optional_list(p):
         """axis_pts_optional_list : axis_pts_optional
-                                  | axis_pts_optional axis_pts_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                  | axis_pts_optional_list axis_pts_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_axis_pts_optional_list_optional(p):
         """axis_pts_optional_list_optional : empty
                                            | axis_pts_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_if_data_axis_pts(p):
         """if_data_axis_pts : if_data_memory_layout"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_deposit(p):
         """deposit : DEPOSIT deposit_mode"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 1)
     def p_deposit_mode(p):
         """deposit_mode : ABSOLUTE
                         | DIFFERENCE"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 2, 12)
     def p_measurement(p):
         """measurement : begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENT"""
         p[0] = a2l_node_factory(*p[2:12])
        
     @staticmethod
+    @action('tagged')
     def p_measurement_optional(p):
         """measurement_optional : display_identifier
                                 | read_write
@@ -1848,32 +3029,37 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_measurement_optional_list(p):
         """measurement_optional_list : measurement_optional
-                                     | measurement_optional measurement_optional_list"""
-        try:
-           
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                     | measurement_optional_list measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_measurement_optional_list_optional(p):
         """measurement_optional_list_optional : empty
                                               | measurement_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_read_write(p):
         """read_write : READ_WRITE"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_if_data_measurement(p):
         """if_data_measurement : begin IF_DATA IDENT if_data_measurement_optional_parameter_list_optional end IF_DATA"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_if_data_measurement_optional_parameter(p):
         """if_data_measurement_optional_parameter : kp_blob kp_data
                                                   | dp_blob dp_data
@@ -1882,42 +3068,49 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_if_data_measurement_unsupported_element(p):
         """if_data_measurement_unsupported_element : begin IDENT generic_parameter_list end IDENT"""
         p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_if_data_measurement_optional_parameter_list(p):
         """if_data_measurement_optional_parameter_list : if_data_measurement_optional_parameter
-                                                       | if_data_measurement_optional_parameter if_data_measurement_optional_parameter_list"""
-
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+            | if_data_measurement_optional_parameter_list if_data_measurement_optional_parameter"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_if_data_measurement_optional_parameter_list_optional(p):
         """if_data_measurement_optional_parameter_list_optional : empty
                                                                 | if_data_measurement_optional_parameter_list"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_kp_blob(p):
         """kp_blob : KP_BLOB"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_pa_blob(p):
         """pa_blob : PA_BLOB"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_kp_data(p):
         """kp_data : kp_data_parameter_optional_list"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_kp_data_parameter_optional(p):
         """kp_data_parameter_optional : NUMERIC
                                       | STRING
@@ -1925,26 +3118,26 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_kp_data_parameter_optional_list(p):
         """kp_data_parameter_optional_list : kp_data_parameter_optional
-                                           | kp_data_parameter_optional kp_data_parameter_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
-            p[0] = [p[1]]
-        p[0] = p[1]
+                                           | kp_data_parameter_optional_list kp_data_parameter_optional"""
+        p[0] = p[1]  # TODO: only the first parameter is kept.
 
     @staticmethod
+    @action('select', 2)
     def p_array_size(p):
         """array_size : ARRAY_SIZE NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_bit_operation(p):
         """bit_operation : begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATION"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_bit_operation_optional(p):
         """bit_operation_optional : left_shift
                                   | right_shift
@@ -1952,41 +3145,49 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_bit_operation_optional_list(p):
         """bit_operation_optional_list : bit_operation_optional
-                                       | bit_operation_optional bit_operation_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | bit_operation_optional_list bit_operation_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_bit_operation_optional_list_optional(p):
         """bit_operation_optional_list_optional : empty
                                                 | bit_operation_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_left_shift(p):
         """left_shift : LEFT_SHIFT NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_right_shift(p):
         """right_shift : RIGHT_SHIFT NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 1)
     def p_sign_extend(p):
         """sign_extend : SIGN_EXTEND"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 2, 9)
     def p_compu_method(p):
         """compu_method : begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHOD"""
         p[0] = a2l_node_factory(*p[2:9])
 
     @staticmethod
+    @action('tagged')
     def p_compu_method_optional(p):
         """compu_method_optional : formula
                                  | coeffs
@@ -1996,21 +3197,25 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_compu_method_optional_list(p):
         """compu_method_optional_list : compu_method_optional
-                                      | compu_method_optional compu_method_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                      | compu_method_optional_list compu_method_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_compu_method_optional_list_optional(p):
         """compu_method_optional_list_optional : empty
                                                | compu_method_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_compu_method_conversion_type(p):
         """compu_method_conversion_type : TAB_INTP
                              | TAB_NOINTP
@@ -2022,81 +3227,97 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_formula(p):
         """formula : begin FORMULA STRING formula_optional_list_optional end FORMULA"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_formula_optional(p):
         """formula_optional : formula_inv"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_formula_optional_list(p):
         """formula_optional_list : formula_optional
-                                 | formula_optional formula_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                 | formula_optional_list formula_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_formula_optional_list_optional(p):
         """formula_optional_list_optional : empty
                                           | formula_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_formula_inv(p):
         """formula_inv : FORMULA_INV STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 1, 8)
     def p_coeffs(p):
         """coeffs : COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC"""
         p[0] = a2l_node_factory(*p[1:8])
 
     @staticmethod
+    @action('select', 1)
     def p_coeffs_linear(p):
         """coeffs_linear : COEFFS_LINEAR NUMERIC NUMERIC"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_compu_tab_ref(p):
         """compu_tab_ref : COMPU_TAB_REF IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_ref_unit(p):
         """ref_unit : REF_UNIT IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 4)
     def p_virtual(p):
         """virtual : begin VIRTUAL ident_list end VIRTUAL"""
         p[0] = p[4]
 
     @staticmethod
+    @action('select', 2)
     def p_ecu_address(p):
         """ecu_address : ECU_ADDRESS NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_symbol_link(p):
         """symbol_link : SYMBOL_LINK STRING NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_error_mask(p):
         """error_mask : ERROR_MASK NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 8)
     def p_compu_tab(p):
         """compu_tab : begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TAB"""
         p[0] = a2l_node_factory(*p[2:8])
 
     @staticmethod
+    @action('tagged')
     def p_compu_tab_optional(p):
         """compu_tab_optional : in_val_out_val
                               | default_value
@@ -2104,85 +3325,101 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_compu_tabl_optional_list(p):
         """compu_tab_optional_list : compu_tab_optional
-                                   | compu_tab_optional compu_tab_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                   | compu_tab_optional_list compu_tab_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_compu_tab_optional_list_optional(p):
         """compu_tab_optional_list_optional : empty
                                             | compu_tab_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_in_val_out_val(p):
-        """in_val_out_val : number_list"""
+        """in_val_out_val : number_list %prec LIST"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_compu_tab_conversion_type(p):
         """compu_tab_conversion_type : TAB_INTP
                                      | TAB_NOINTP"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_default_value(p):
         """default_value : DEFAULT_VALUE STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_default_value_numeric(p):  # TODO: should it be removed?
         """default_value_numeric : DEFAULT_VALUE_NUMERIC NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 8)
     def p_compu_vtab(p):
         """compu_vtab : begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTAB"""
         p[0] = a2l_node_factory(*p[2:8])
 
     @staticmethod
+    @action('tagged')
     def p_compu_vtab_optional(p):
         """compu_vtab_optional : default_value
                                | compu_vtab_in_val_out_val"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_compu_vtab_optional_list(p):
         """compu_vtab_optional_list : compu_vtab_optional
-                                    | compu_vtab_optional compu_vtab_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | compu_vtab_optional_list compu_vtab_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_compu_vtab_optional_list_optional(p):
         """compu_vtab_optional_list_optional : empty
                                              | compu_vtab_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_compu_vtab_in_val_out_val(p):
-        """compu_vtab_in_val_out_val : number_string_value_list"""
+        """compu_vtab_in_val_out_val : number_string_value_list %prec LIST"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_compu_vtab_conversion_type(p):
         """compu_vtab_conversion_type : TAB_VERB"""
         p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_number_string_value_list(p):
         """number_string_value_list : number_string_value
-                                    | number_string_value number_string_value_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                    | number_string_value_list number_string_value"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
     def p_number_string_value(p):
@@ -2190,44 +3427,52 @@ class A2lParser(object):
         p[0] = (p[1], p[2])
 
     @staticmethod
+    @action('factory', 2, 7)
     def p_compu_vtab_range(p):
         """compu_vtab_range : begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGE"""
         p[0] = a2l_node_factory(*p[2:7])
 
     @staticmethod
+    @action('tagged')
     def p_compu_vtab_range_optional(p):
         """compu_vtab_range_optional : default_value
                                      | compu_vtab_range_in_val_out_val"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_compu_vtab_range_optional_list(p):
         """compu_vtab_range_optional_list : compu_vtab_range_optional
-                                          | compu_vtab_range_optional compu_vtab_range_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                          | compu_vtab_range_optional_list compu_vtab_range_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_compu_vtab_range_optional_list_optional(p):
         """compu_vtab_range_optional_list_optional : empty
                                                    | compu_vtab_range_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_compu_vtab_range_in_val_out_val(p):
-        """compu_vtab_range_in_val_out_val : number_number_string_value_list"""
+        """compu_vtab_range_in_val_out_val : number_number_string_value_list %prec LIST"""
         p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_number_number_string_value_list(p):
         """number_number_string_value_list : number_number_string_value
-                                           | number_number_string_value number_number_string_value_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                           | number_number_string_value_list number_number_string_value"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
     def p_number_number_string_value(p):
@@ -2235,11 +3480,13 @@ class A2lParser(object):
         p[0] = (p[1], p[2], p[3])
 
     @staticmethod
+    @action('factory', 2, 6)
     def p_function(p):
         """function : begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTION"""
         p[0] = a2l_node_factory(*p[2:6])
 
     @staticmethod
+    @action('tagged')
     def p_function_optional(p):
         """function_optional : annotation
                              | def_characteristic
@@ -2252,186 +3499,223 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_function_optional_list(p):
         """function_optional_list : function_optional
-                                  | function_optional function_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                  | function_optional_list function_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_function_optional_list_optional(p):
         """function_optional_list_optional : empty
                                            | function_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_def_characteristic(p):
         """def_characteristic : begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTIC"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_def_characteristic_optional(p):
         """def_characteristic_optional : identifier"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_def_characteristic_optional_list(p):
         """def_characteristic_optional_list : def_characteristic_optional
-                                            | def_characteristic_optional def_characteristic_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                            | def_characteristic_optional_list def_characteristic_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_def_characteristic_optional_list_optional(p):
         """def_characteristic_optional_list_optional : empty
                                                      | def_characteristic_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_identifier(p):
         """identifier : IDENT"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_ref_characteristic(p):
         """ref_characteristic : begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTIC"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_ref_characteristic_optional(p):
         """ref_characteristic_optional : identifier"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_ref_characteristic_optional_list(p):
         """ref_characteristic_optional_list : ref_characteristic_optional
-                                            | ref_characteristic_optional ref_characteristic_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                            | ref_characteristic_optional_list ref_characteristic_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_ref_characteristic_optional_list_optional(p):
         """ref_characteristic_optional_list_optional : empty
                                                      | ref_characteristic_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_in_measurement(p):
         """in_measurement : begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENT"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_in_measurement_optional(p):
         """in_measurement_optional : identifier"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_in_measurement_optional_list(p):
         """in_measurement_optional_list : in_measurement_optional
-                                        | in_measurement_optional in_measurement_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | in_measurement_optional_list in_measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_in_measurment_optional_list_optional(p):
         """in_measurement_optional_list_optional : empty
                                                  | in_measurement_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_out_measurement(p):
         """out_measurement : begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENT"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_out_measurement_optional(p):
         """out_measurement_optional : identifier"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_out_measurement_optional_list(p):
         """out_measurement_optional_list : out_measurement_optional
-                                         | out_measurement_optional out_measurement_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                         | out_measurement_optional_list out_measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_out_measurment_optional_list_optional(p):
         """out_measurement_optional_list_optional : empty
                                                   | out_measurement_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_loc_measurement(p):
         """loc_measurement : begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENT"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_loc_measurement_optional(p):
         """loc_measurement_optional : identifier"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_loc_measurement_optional_list(p):
         """loc_measurement_optional_list : loc_measurement_optional
-                                         | loc_measurement_optional loc_measurement_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                         | loc_measurement_optional_list loc_measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_loc_measurment_optional_list_optional(p):
         """loc_measurement_optional_list_optional : empty
                                                   | loc_measurement_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_sub_function(p):
         """sub_function : begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTION"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_sub_function_optional(p):
         """sub_function_optional : identifier"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_sub_function_optional_list(p):
         """sub_function_optional_list : sub_function_optional
-                                      | sub_function_optional sub_function_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                      | sub_function_optional_list sub_function_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_sub_function_optional_list_optional(p):
         """sub_function_optional_list_optional : empty
                                                | sub_function_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_function_version(p):
         """function_version : FUNCTION_VERSION STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 6)
     def p_group(p):
         """group : begin GROUP IDENT STRING group_optional_list_optional end GROUP"""
         p[0] = a2l_node_factory(*p[2:6])
 
     @staticmethod
+    @action('tagged')
     def p_group_optional(p):
         """group_optional : annotation
                           | root
@@ -2442,81 +3726,97 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_group_optional_list(p):
         """group_optional_list : group_optional
-                               | group_optional group_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                               | group_optional_list group_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_group_optional_list_optional(p):
         """group_optional_list_optional : empty
                                         | group_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_root(p):
         """root : ROOT"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_ref_measurement(p):
         """ref_measurement : begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENT"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_ref_measurement_optional(p):
         """ref_measurement_optional : identifier"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_ref_measurement_optional_list(p):
         """ref_measurement_optional_list : ref_measurement_optional
-                                         | ref_measurement_optional ref_measurement_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                         | ref_measurement_optional_list ref_measurement_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_ref_measurement_optional_list_optional(p):
         """ref_measurement_optional_list_optional : empty
                                                   | ref_measurement_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_sub_group(p):
         """sub_group : begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUP"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_sub_group_optional(p):
         """sub_group_optional : identifier"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_sub_group_optional_list(p):
         """sub_group_optional_list : sub_group_optional
-                                   | sub_group_optional sub_group_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                   | sub_group_optional_list sub_group_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_sub_group_optional_list_optional(p):
         """sub_group_optional_list_optional : empty
                                             | sub_group_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_record_layout(p):
         """record_layout : begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUT"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_record_layout_optional(p):
         """record_layout_optional : fnc_values
                                   | identification
@@ -2561,26 +3861,31 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_record_layout_optional_list(p):
         """record_layout_optional_list : record_layout_optional
-                                       | record_layout_optional record_layout_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | record_layout_optional_list record_layout_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_record_layout_optional_list_optional(p):
         """record_layout_optional_list_optional : empty
                                                 | record_layout_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 1, 6)
     def p_fnc_values(p):
         """fnc_values : FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtype"""
         p[0] = a2l_node_factory(*p[1:6])
 
     @staticmethod
+    @action('select', 1)
     def p_fnc_values_index_mode(p):
         """fnc_values_index_mode : COLUMN_DIR
                                  | ROW_DIR
@@ -2590,201 +3895,241 @@ class A2lParser(object):
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_identification(p):
         """identification : IDENTIFICATION NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 6)
     def p_axis_pts_x(p):
         """axis_pts_x : AXIS_PTS_X NUMERIC datatype indexorder addrtype"""
         p[0] = a2l_node_factory(*p[1:6])
 
     @staticmethod
+    @action('factory', 1, 6)
     def p_axis_pts_y(p):
         """axis_pts_y : AXIS_PTS_Y NUMERIC datatype indexorder addrtype"""
         p[0] = a2l_node_factory(*p[1:6])
 
     @staticmethod
+    @action('factory', 1, 6)
     def p_axis_pts_z(p):
         """axis_pts_z : AXIS_PTS_Z NUMERIC datatype indexorder addrtype"""
         p[0] = a2l_node_factory(*p[1:6])
 
     @staticmethod
+    @action('factory', 1, 7)
     def p_axis_rescale_x(p):
         """axis_rescale_x : AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtype"""
         p[0] = a2l_node_factory(*p[1:7])
 
     @staticmethod
+    @action('factory', 1, 7)
     def p_axis_rescale_y(p):
         """axis_rescale_y : AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtype"""
         p[0] = a2l_node_factory(*p[1:7])
 
     @staticmethod
+    @action('factory', 1, 7)
     def p_axis_rescale_z(p):
         """axis_rescale_z : AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtype"""
         p[0] = a2l_node_factory(*p[1:7])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_no_axis_pts_x(p):
         """no_axis_pts_x : NO_AXIS_PTS_X NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_no_axis_pts_y(p):
         """no_axis_pts_y : NO_AXIS_PTS_Y NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_no_axis_pts_z(p):
         """no_axis_pts_z : NO_AXIS_PTS_Z NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_no_rescale_x(p):
         """no_rescale_x : NO_RESCALE_X NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_no_rescale_y(p):
         """no_rescale_y : NO_RESCALE_Y NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_no_rescale_z(p):
         """no_rescale_z : NO_RESCALE_Z NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 3)
     def p_fix_no_axis_pts_x(p):
         """fix_no_axis_pts_x : FIX_NO_AXIS_PTS_X NUMERIC"""
         p[0] = a2l_node_factory(*p[1:3])
 
     @staticmethod
+    @action('factory', 1, 3)
     def p_fix_no_axis_pts_y(p):
         """fix_no_axis_pts_y : FIX_NO_AXIS_PTS_Y NUMERIC"""
         p[0] = a2l_node_factory(*p[1:3])
 
     @staticmethod
+    @action('factory', 1, 3)
     def p_fix_no_axis_pts_z(p):
         """fix_no_axis_pts_z : FIX_NO_AXIS_PTS_Z NUMERIC"""
         p[0] = a2l_node_factory(*p[1:3])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_src_addr_x(p):
         """src_addr_x : SRC_ADDR_X NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_src_addr_y(p):
         """src_addr_y : SRC_ADDR_Y NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_src_addr_z(p):
         """src_addr_z : SRC_ADDR_Z NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_rip_addr_x(p):
         """rip_addr_x : RIP_ADDR_X NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_rip_addr_y(p):
         """rip_addr_y : RIP_ADDR_Y NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_rip_addr_z(p):
         """rip_addr_z : RIP_ADDR_Z NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_rip_addr_w(p):
         """rip_addr_w : RIP_ADDR_W NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_shift_op_x(p):
         """shift_op_x : SHIFT_OP_X NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_shift_op_y(p):
         """shift_op_y : SHIFT_OP_Y NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_shift_op_z(p):
         """shift_op_z : SHIFT_OP_Z NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_offset_x(p):
         """offset_x : OFFSET_X NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_offset_y(p):
         """offset_y : OFFSET_Y NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_offset_z(p):
         """offset_z : OFFSET_Z NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_dist_op_x(p):
         """dist_op_x : DIST_OP_X NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_dist_op_y(p):
         """dist_op_y : DIST_OP_Y NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_dist_op_z(p):
         """dist_op_z : DIST_OP_Z NUMERIC datatype"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('select', 2)
     def p_alignment_byte(p):
         """alignment_byte : ALIGNMENT_BYTE NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_alignment_word(p):
         """alignment_word : ALIGNMENT_WORD NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_alignment_long(p):
         """alignment_long : ALIGNMENT_LONG NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_alignment_int64(p):
         """alignment_int64 : ALIGNMENT_INT64 NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_alignment_float32_ieee(p):
         """alignment_float32_ieee : ALIGNMENT_FLOAT32_IEEE NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_alignment_float64_ieee(p):
         """alignment_float64_ieee : ALIGNMENT_FLOAT64_IEEE NUMERIC"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_variant_coding(p):
         """variant_coding : begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODING"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_variant_coding_optional(p):
         """variant_coding_optional : var_separator
                                    | var_naming
@@ -2794,41 +4139,49 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_variant_coding_optional_list(p):
         """variant_coding_optional_list : variant_coding_optional
-                                        | variant_coding_optional variant_coding_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                        | variant_coding_optional_list variant_coding_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_variant_coding_optional_list_optional(p):
         """variant_coding_optional_list_optional : empty
                                                  | variant_coding_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_var_separator(p):
         """var_separator : VAR_SEPARATOR STRING"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_var_naming(p):
         """var_naming : VAR_NAMING IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 2, 7)
     def p_var_criterion(p):
         """var_criterion : begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERION"""
         p[0] = a2l_node_factory(*p[2:7])
 
     @staticmethod
+    @action('factory', 2, 6)
     def p_var_characteristic(p):
         """var_characteristic : begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTIC"""
         p[0] = a2l_node_factory(*p[2:6])
 
     @staticmethod
+    @action('tagged')
     def p_var_characteristic_optional(p):
         """var_characteristic_optional : var_address"""
         p[0] = p.slice[1].type, p[1]
@@ -2840,11 +4193,13 @@ class A2lParser(object):
         p[0] = ('var_address', None) if p[1] is None else p[1]
 
     @staticmethod
+    @action('node')
     def p_var_address(p):
         """var_address : begin VAR_ADDRESS number_list end VAR_ADDRESS"""
         p[0] = a2l_node_factory(p[2], [('address', a) for a in p[3]])
 
     @staticmethod
+    @action('node')
     def p_var_forbidden_comb(p):
         """var_forbidden_comb : begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMB"""
         p[0] = a2l_node_factory(p[2], *p[3])
@@ -2866,177 +4221,208 @@ class A2lParser(object):
     @staticmethod
     def p_var_forbidden_comb_criterion_optional_list(p):
         """var_forbidden_comb_criterion_optional_list : var_forbidden_comb_criterion_optional
-                                                      | var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_list"""
-        try:
-            p[0] = p[1] + p[2]
-        except IndexError:
-            p[0] = p[1]
+            | var_forbidden_comb_criterion_optional_list var_forbidden_comb_criterion_optional"""
+        if len(p) == 3:
+            p[1].extend(p[2])
+        p[0] = p[1]
 
     @staticmethod
+    @action('tagged')
     def p_var_criterion_optional(p):
         """var_criterion_optional : var_measurement
                                   | var_selection_characteristic"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_var_criterion_optional_list(p):
         """var_criterion_optional_list : var_criterion_optional
-                                       | var_criterion_optional var_criterion_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | var_criterion_optional_list var_criterion_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_var_criterion_optional_list_optional(p):
         """var_criterion_optional_list_optional : empty
                                                 | var_criterion_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 2)
     def p_var_measurement(p):
         """var_measurement : VAR_MEASUREMENT IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('select', 2)
     def p_var_selection_characteristic(p):
         """var_selection_characteristic : VAR_SELECTION_CHARACTERISTIC IDENT"""
         p[0] = p[2]
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_reserved(p):
         """reserved : RESERVED NUMERIC datasize"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('factory', 2, 8)
     def p_frame(p):
         """frame : begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAME"""
         p[0] = a2l_node_factory(*p[2:8])
 
     @staticmethod
+    @action('tagged')
     def p_frame_optional(p):
         """frame_optional : frame_measurement
                           | if_data_frame"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_frame_optional_list(p):
         """frame_optional_list : frame_optional
-                               | frame_optional frame_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                               | frame_optional_list frame_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_frame_optional_list_optional(p):
         """frame_optional_list_optional : empty
                                         | frame_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('node')
     def p_if_data_frame(p):
         """if_data_frame : begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATA"""
         p[0] = a2l_node_factory('if_data_frame', *p[3:5])
 
     @staticmethod
+    @action('select', 1)
     def p_if_data_frame_optional(p):
         """if_data_frame_optional : QP_BLOB qp_data"""
         p[0] = p[1]
 
     @staticmethod
+    @action('append')
     def p_if_data_frame_parameter_optional_list(p):
         """if_data_frame_optional_list : if_data_frame_optional
-                                       | if_data_frame_optional if_data_frame_optional_list"""
-
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                       | if_data_frame_optional_list if_data_frame_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_if_data_frame_optional_list_optional(p):
         """if_data_frame_optional_list_optional : empty
                                                 | if_data_frame_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_qp_data(p):
         """qp_data : generic_parameter"""
         p[0] = p[1]
 
     @staticmethod
+    @action('node')
     def p_frame_measurement(p):
         """frame_measurement : FRAME_MEASUREMENT ident_list"""
         p[0] = a2l_node_factory(p[1], [('identifier', i) for i in p[2]])
 
     @staticmethod
+    @action('factory', 2, 5)
     def p_user_rights(p):
         """user_rights : begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTS"""
         p[0] = a2l_node_factory(*p[2:5])
 
     @staticmethod
+    @action('tagged')
     def p_user_rights_optional(p):
         """user_rights_optional : ref_group
                                 | read_only"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_user_rights_optional_list(p):
         """user_rights_optional_list : user_rights_optional
-                                     | user_rights_optional user_rights_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                     | user_rights_optional_list user_rights_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_user_rights_optional_list_optional(p):
         """user_rights_optional_list_optional : empty
                                               | user_rights_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('factory', 2, 4)
     def p_ref_group(p):
         """ref_group : begin REF_GROUP ref_group_optional_list_optional end REF_GROUP"""
         p[0] = a2l_node_factory(*p[2:4])
 
     @staticmethod
+    @action('tagged')
     def p_ref_group_optional(p):
         """ref_group_optional : identifier"""
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_ref_group_optional_list(p):
         """ref_group_optional_list : ref_group_optional
-                                   | ref_group_optional ref_group_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                                   | ref_group_optional_list ref_group_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_ref_group_optional_list_optional(p):
         """ref_group_optional_list_optional : empty
                                             | ref_group_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_read_only(p):
         """read_only : READ_ONLY"""
         p[0] = p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_guard_rails(p):
         """guard_rails : GUARD_RAILS"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 2, 8)
     def p_unit(p):
         """unit : begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNIT"""
         p[0] = a2l_node_factory(*p[2:8])
 
     @staticmethod
+    @action('tagged')
     def p_unit_optional(p):
         """unit_optional : si_exponents
                          | ref_unit
@@ -3044,62 +4430,51 @@ class A2lParser(object):
         p[0] = p.slice[1].type, p[1]
 
     @staticmethod
+    @action('append')
     def p_unit_optional_list(p):
         """unit_optional_list : unit_optional
-                              | unit_optional unit_optional_list"""
-        try:
-            p[0] = [p[1]] + p[2]
-        except IndexError:
+                              | unit_optional_list unit_optional"""
+        if len(p) == 2:
             p[0] = [p[1]]
+        else:
+            p[1].append(p[2])
+            p[0] = p[1]
 
     @staticmethod
+    @action('optional')
     def p_unit_optional_list_optional(p):
         """unit_optional_list_optional : empty
                                        | unit_optional_list"""
         p[0] = tuple() if p[1] is None else p[1]
 
     @staticmethod
+    @action('select', 1)
     def p_unit_type(p):
         """unit_type : EXTENDED_SI
                      | DERIVED"""
         p[0] = p[1]
 
     @staticmethod
+    @action('factory', 1, 9)
     def p_si_exponents(p):
         """si_exponents : SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC"""
         p[0] = a2l_node_factory(*p[1:9])
 
     @staticmethod
+    @action('factory', 1, 4)
     def p_unit_conversion(p):
         """unit_conversion : UNIT_CONVERSION NUMERIC NUMERIC"""
         p[0] = a2l_node_factory(*p[1:4])
 
     @staticmethod
+    @action('empty')
     def p_empty(p):
         """empty :"""
         p[0] = None
 
 
 
-# a2l_string = open(r'C:\Users\vaasu\Desktop\Data\DASY_BASE_01_Copy.a2l', 'r').read()
-
-
-# a2l_string = """
-#     /begin PROJECT project_name "example project"
-#         /begin MODULE first_module "first module long identifier"
-#          /begin MEASUREMENT AyRaw_loc.VseDASy "local recording of AyRaw for measurement purpose [S001_VseDASy_ECU_CSW_BB00001_0_NOINIT_RAM.V2__C_Cl5]"
-#         FLOAT32_IEEE VseDsm_ECU_CSW_BB00001_variantIsSet_ident 1 0 -1E+37 1E+37
-#         ECU_ADDRESS 0x40008770
-#         ECU_ADDRESS_EXTENSION 0x0
-#         FORMAT "%42.15"
-#         SYMBOL_LINK "_S001_VseDASy_ECU_CSW_BB00001_0_NOINIT_RAM._V2__C_Cl5" 0
-#         /end MEASUREMENT
-#         /end MODULE
-#     /end PROJECT
-# """
-
-# tic()
-# a2l = A2lParser(a2l_string)
-# print(toc())
-# for i, node in enumerate(a2l.tree.project.module[0].get_node("MEASUREMENT")):
-#     print(node.name)
+def write_tables(outputdir=os.path.dirname(os.path.realpath(__file__))):
+    # regenerates parsetab.py after a change of the grammar. this is a development helper, parsing never writes
+    # anything to disk.
+    return yacc.yacc(module=A2lParser, tabmodule='parsetab', outputdir=outputdir, debug=False, write_tables=True)
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'A2ML A2ML_VERSION ABSOLUTE ADDRESS_EXTENSION_DAQ ADDRESS_EXTENSION_FREE ADDRESS_EXTENSION_ODT ADDRESS_MAPPING ADDR_EPK ALIGNMENT_BYTE ALIGNMENT_FLOAT32_IEEE ALIGNMENT_FLOAT64_IEEE ALIGNMENT_INT64 ALIGNMENT_LONG ALIGNMENT_WORD ALTERNATE_CURVES ALTERNATE_WITH_X ALTERNATE_WITH_Y ANNOTATION ANNOTATION_LABEL ANNOTATION_ORIGIN ANNOTATION_TEXT ARRAY_SIZE ASAP2_VERSION ASCII ASTERISK AVAILABLE_EVENT_LIST AXIS_DESCR AXIS_PTS AXIS_PTS_REF AXIS_PTS_X AXIS_PTS_Y AXIS_PTS_Z AXIS_RESCALE_X AXIS_RESCALE_Y AXIS_RESCALE_Z A_INT64 A_UINT64 BAUDRATE BA_BLOB BIT_MASK BIT_OPERATION BRACE_CLOSE BRACE_OPEN BTL_CYCLES BYTE BYTE_ORDER CALIBRATION CALIBRATION_ACCESS CALIBRATION_HANDLE CALIBRATION_METHOD CALIBRATION_VARIABLES CAN_ID_BROADCAST CAN_ID_MASTER CAN_ID_SLAVE CHARACTERISTIC CHECKSUM CODE COEFFS COEFFS_LINEAR COLUMN_DIR COMMA COMPARISON_QUANTITY COMPU_METHOD COMPU_TAB COMPU_TAB_REF COMPU_VTAB COMPU_VTAB_RANGE COM_AXIS CPU_TYPE CUBOID CURLY_CLOSE CURLY_OPEN CURVE CURVE_AXIS CURVE_AXIS_REF CUSTOMER CUSTOMER_NO DAQ DAQ_EVENT DAQ_LIST DAQ_LIST_CAN_ID DAQ_LIST_TYPE DAQ_STIM DATA DATA_SIZE DEFAULT_EVENT_LIST DEFAULT_VALUE DEFAULT_VALUE_NUMERIC DEF_CHARACTERISTIC DEPENDENT_CHARACTERISTIC DEPOSIT DERIVED DIFFERENCE DIRECT DISPLAY_IDENTIFIER DIST_OP_X DIST_OP_Y DIST_OP_Z DP_BLOB DUAL DYNAMIC ECU ECU_ADDRESS ECU_ADDRESS_EXTENSION ECU_CALIBRATION_OFFSET EEPROM EPK EPROM EQUAL ERROR_MASK EVENT EVENT_FIXED EVENT_GROUP EXCLUDE_FROM_FLASH EXTENDED_LIMITS EXTENDED_SI EXTERN FIRST_PID FIXED FIXED_EVENT_LIST FIX_AXIS FIX_AXIS_PAR FIX_AXIS_PAR_DIST FIX_AXIS_PAR_LIST FIX_NO_AXIS_PTS_X FIX_NO_AXIS_PTS_Y FIX_NO_AXIS_PTS_Z FLASH FLOAT32_IEEE FLOAT64_IEEE FNC_VALUES FORM FORMAT FORMULA FORMULA_INV FRAME FRAME_MEASUREMENT FREEZE_SUPPORTED FUNCTION FUNCTION_LIST FUNCTION_VERSION GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD GRANULARITY_ODT_ENTRY_SIZE_STIM_BYTE GROUP GUARD_RAILS HEADER IDENT IDENTICAL IDENTIFICATION IDENTIFICATION_FIELD_TYPE_ABSOLUTE IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED IF_DATA INDEX_DECR INDEX_INCR INIT_SEGMENT INTERN IN_MEASUREMENT KP_BLOB LEFT_SHIFT LINEAR LOC_MEASUREMENT LONG MAP MAP_LIST MATRIX_DIM MAX_BLOCK_SIZE MAX_GRAD MAX_ODT MAX_ODT_ENTRIES MAX_REFRESH MEASUREMENT MEMORY_LAYOUT MEMORY_SEGMENT MODULE MOD_COMMON MOD_PAR MONOTONY MON_DECREASE MON_INCREASE MSB_FIRST MSB_LAST NOT_IN_MCD_SYSTEM NO_AXIS_PTS_X NO_AXIS_PTS_Y NO_AXIS_PTS_Z NO_CALIBRATION NO_OF_INTERFACES NO_OVERLOAD_INDICATION NO_RESCALE_X NO_RESCALE_Y NO_RESCALE_Z NUMBER NUMERIC OFFLINE_CALIBRATION OFFLINE_DATA OFFSET_X OFFSET_Y OFFSET_Z OPTIMISATION_TYPE_DEFAULT OPTIMISATION_TYPE_MAX_ENTRY_SIZE OPTIMISATION_TYPE_ODT_TYPE_16 OPTIMISATION_TYPE_ODT_TYPE_32 OPTIMISATION_TYPE_ODT_TYPE_64 OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT OUT_MEASUREMENT OVERLOAD_INDICATION_EVENT OVERLOAD_INDICATION_PID PAG PAGE PARENTHESE_CLOSE PARENTHESE_OPEN PA_BLOB PBYTE PGM PHONE_NO PLONG PRESCALER_SUPPORTED PRG_CODE PRG_DATA PRG_RESERVED PROJECT PROJECT_NO PROTOCOL_LAYER PWORD QP_BLOB RAM RASTER RAT_FUNC READ_ONLY READ_WRITE RECORD_LAYOUT REF_CHARACTERISTIC REF_GROUP REF_MEASUREMENT REF_MEMORY_SEGMENT REF_UNIT REGISTER RESERVED RESUME_SUPPORTED RES_AXIS RIGHT_SHIFT RIP_ADDR_W RIP_ADDR_X RIP_ADDR_Y RIP_ADDR_Z ROM ROOT ROW_DIR SAMPLE_POINT SAMPLE_RATE SBYTE SECTOR SEED_KEY SEGMENT SEMICOLON SERAM SHIFT_OP_X SHIFT_OP_Y SHIFT_OP_Z SIGN_EXTEND SINGLE SI_EXPONENTS SJW SLONG SOURCE SRC_ADDR_X SRC_ADDR_Y SRC_ADDR_Z STATIC STD_AXIS STIM STRICT_DECREASE STRICT_INCREASE STRING SUB_FUNCTION SUB_GROUP SUPPLIER SWORD SYMBOL_LINK SYNC_EDGE SYSTEM_CONSTANT S_REC_LAYOUT TAB_INTP TAB_NOINTP TAB_VERB TIMESTAMP_FIXED TIMESTAMP_SUPPORTED TP_BLOB TRIPLE UBYTE ULONG UNIT UNIT_CONVERSION USER USER_RIGHTS UWORD VALUE VAL_BLK VARIABLE VARIABLES VARIANT_CODING VAR_ADDRESS VAR_CHARACTERISTIC VAR_CRITERION VAR_FORBIDDEN_COMB VAR_MEASUREMENT VAR_NAMING VAR_SELECTION_CHARACTERISTIC VAR_SEPARATOR VERSION VIRTUAL VIRTUAL_CHARACTERISTIC WORD XCP XCP_ON_CAN begin block char double end enum float int long struct taggedstruct taggedunion uchar uint ulonga2l : a2l_optional_list_optionala2l_optional : asap2_version\n                        | a2ml_version\n                        | projecta2l_optional_list : a2l_optional\n                             | a2l_optional a2l_optional_lista2l_optional_list_optional : empty\n                                      | a2l_optional_lista2ml_declaration : a2ml_type_definition SEMICOLON\n                            | a2ml_block_definition SEMICOLONa2ml_declaration_list : a2ml_declaration\n                                 | a2ml_declaration a2ml_declaration_lista2ml_type_definition : a2ml_type_namea2ml_type_name : a2ml_predefined_type_name\n                          | a2ml_struct_type_name\n                          | a2ml_enum_type_name\n                          | a2ml_taggedstruct_type_name\n                          | a2ml_taggedunion_type_namea2ml_predefined_type_name : char\n                                     | int\n                                     | long\n                                     | uchar\n                                     | uint\n                                     | ulong\n                                     | double\n                                     | floata2ml_block_definition : block a2ml_tag a2ml_type_name\n                                 | block a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISKa2ml_enum_type_name : enum a2ml_identifier_optional CURLY_OPEN a2ml_enumerator_list CURLY_CLOSE\n                               | enum a2ml_identifiera2ml_enumerator_list : a2ml_enumerator\n                                | a2ml_enumerator COMMA a2ml_enumerator_lista2ml_enumerator : a2ml_keyword EQUAL a2ml_constant\n                           | a2ml_keyworda2ml_struct_type_name : struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE\n                                 | struct a2ml_identifiera2ml_struct_member_list_optional : empty\n                                            | a2ml_struct_member_lista2ml_struct_member_list : a2ml_struct_member\n                                   | a2ml_struct_member a2ml_struct_member_lista2ml_struct_member : a2ml_member SEMICOLONa2ml_member : a2ml_type_name a2ml_array_specifier_optionala2ml_member_optional : empty\n                                | a2ml_membera2ml_array_specifier_optional : empty\n                                         | a2ml_array_specifiera2ml_array_specifier : BRACE_OPEN a2ml_constant BRACE_CLOSE\n                                | BRACE_OPEN a2ml_constant BRACE_CLOSE a2ml_array_specifiera2ml_taggedstruct_type_name : taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE\n                                       | taggedstruct a2ml_identifiera2ml_taggedstruct_member_list_optional : empty\n                                                  | a2ml_taggedstruct_member_lista2ml_taggedstruct_member_list : a2ml_taggedstruct_member\n                                         | a2ml_taggedstruct_member a2ml_taggedstruct_member_lista2ml_taggedstruct_member : a2ml_taggedstruct_definition SEMICOLON\n                                    | PARENTHESE_OPEN a2ml_taggedstruct_definition PARENTHESE_CLOSE ASTERISK SEMICOLON\n                                    | a2ml_block_definition SEMICOLON\n                                    | PARENTHESE_OPEN a2ml_block_definition PARENTHESE_CLOSE ASTERISK SEMICOLONa2ml_taggedstruct_definition : a2ml_tag a2ml_member_optional\n                                        | a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISKa2ml_taggedunion_type_name : taggedunion a2ml_identifier_optional CURLY_OPEN a2ml_taggedunion_member_list_optional CURLY_CLOSE\n                                      | taggedunion a2ml_identifiera2ml_taggedunion_member_list : a2ml_taggedunion_member\n                                        | a2ml_taggedunion_member a2ml_taggedunion_member_lista2ml_taggedunion_member_list_optional : empty\n                                                 | a2ml_taggedunion_member_lista2ml_taggedunion_member : a2ml_tag SEMICOLON\n                                   | a2ml_tag a2ml_member SEMICOLON\n                                   | a2ml_block_definition SEMICOLONa2ml_tag : STRINGa2ml_identifier : IDENTa2ml_identifier_optional : empty\n                                    | a2ml_identifiera2ml_keyword : STRINGa2ml_constant : NUMERICdatatype : UBYTE\n                    | SBYTE\n                    | UWORD\n                    | SWORD\n                    | ULONG\n                    | SLONG\n                    | A_UINT64\n                    | A_INT64\n                    | FLOAT32_IEEE\n                    | FLOAT64_IEEEdatasize : BYTE\n                    | WORD\n                    | LONGaddrtype : PBYTE\n                    | PWORD\n                    | PLONG\n                    | DIRECTindexorder : INDEX_INCR\n                      | INDEX_DECRasap2_version : ASAP2_VERSION NUMERIC NUMERICa2ml_version : A2ML_VERSION NUMERIC NUMERICgeneric_parameter : IDENT\n                             | STRING\n                             | NUMERIC\n                             | begin IDENT generic_parameter_list_optional end IDENTgeneric_parameter_list : generic_parameter\n                                  | generic_parameter generic_parameter_listgeneric_parameter_list_optional : empty\n                                           | generic_parameter_listnumber_list : NUMERIC\n                       | NUMERIC number_listident_list : IDENT\n                      | IDENT ident_liststring_list : STRING\n                       | STRING string_listproject : begin PROJECT IDENT STRING project_optional_list_optional end PROJECTproject_optional : header\n                            | moduleproject_optional_list : project_optional\n                                 | project_optional project_optional_list project_optional_list_optional : empty\n                                          | project_optional_listheader : begin HEADER STRING header_optional_list_optional end HEADERheader_optional : version\n                           | project_noheader_optional_list : header_optional\n                                | header_optional header_optional_listheader_optional_list_optional : empty\n                                         | header_optional_listversion : VERSION STRINGproject_no : PROJECT_NO IDENTmodule : begin MODULE IDENT STRING module_optional_list_optional end MODULEmodule_optional : a2ml\n                           | mod_par\n                           | mod_common\n                           | if_data_xcp\n                           | if_data_module\n                           | characteristic\n                           | axis_pts\n                           | measurement\n                           | compu_method\n                           | compu_tab\n                           | compu_vtab\n                           | compu_vtab_range\n                           | function\n                           | group\n                           | record_layout\n                           | variant_coding\n                           | frame\n                           | user_rights\n                           | unitmodule_optional_list : module_optional\n                                | module_optional module_optional_listmodule_optional_list_optional : empty\n                                         | module_optional_lista2ml : begin A2ML a2ml_declaration_list end A2MLif_data_xcp : begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATAif_data_xcp_optional : protocol_layer\n                                | daq\n                                | pag\n                                | pgm\n                                | segment\n                                | daq_event\n                                | xcp_on_can\n                                | generic_parameter_listxcp_on_can : begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CANxcp_on_can_optional : can_id_broadcast\n                               | can_id_master\n                               | can_id_slave\n                               | baudrate\n                               | sample_point\n                               | sample_rate\n                               | btl_cycles\n                               | sjw\n                               | sync_edge\n                               | daq_list_can_idxcp_on_can_optional_list : xcp_on_can_optional\n                                    | xcp_on_can_optional xcp_on_can_optional_listxcp_on_can_optional_list_optional : empty\n                                             | xcp_on_can_optional_listcan_id_broadcast : CAN_ID_BROADCAST NUMERICcan_id_master : CAN_ID_MASTER NUMERICcan_id_slave : CAN_ID_SLAVE NUMERICbaudrate : BAUDRATE NUMERICsample_point : SAMPLE_POINT NUMERICsample_rate : SAMPLE_RATE SINGLE\n                       | SAMPLE_RATE TRIPLEbtl_cycles : BTL_CYCLES NUMERICsjw : SJW NUMERICsync_edge : SYNC_EDGE SINGLE\n                     | SYNC_EDGE DUALdaq_list_can_id : begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_IDdaq_list_can_id_optional : daq_list_can_id_type_variable\n                                    | daq_list_can_id_type_fixeddaq_list_can_id_optional_optional : empty\n                                             | daq_list_can_id_optionaldaq_list_can_id_type_variable : VARIABLEdaq_list_can_id_type_fixed : FIXED NUMERICdaq_event : begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT\n                     | begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENTdaq_event_optional : available_event_list\n                              | default_event_listdaq_event_optional_list : daq_event_optional\n                                   | daq_event_optional daq_event_optional_listdaq_event_optional_list_optional : empty\n                                            | daq_event_optional_listdefault_event_list : begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LISTavailable_event_list : begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LISTavailable_event_list_optional : EVENT NUMERICavailable_event_list_optional_list : available_event_list_optional\n                                              | available_event_list_optional available_event_list_optional_listavailable_event_list_optional_list_optional : empty\n                                                       | available_event_list_optional_listif_data_xcp_optional_list : if_data_xcp_optional\n                                     | if_data_xcp_optional if_data_xcp_optional_listif_data_xcp_optional_list_optional : empty\n                                                     | if_data_xcp_optional_listpag : begin PAG NUMERIC pag_optional_list_optional end PAGpgm : begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGMpgm_optional : sector\n                        | generic_parameter_listpgm_optional_list : pgm_optional\n                             | pgm_optional pgm_optional_listpgm_optional_list_optional : empty\n                                      | pgm_optional_listsector : begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTORpag_optional : freeze_supported\n                        | generic_parameter_listpag_optional_list : pag_optional\n                             | pag_optional pag_optional_listpag_optional_list_optional : empty\n                                      | pag_optional_listfreeze_supported : FREEZE_SUPPORTEDdaq : begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQdaq_config_type : STATIC\n                           | DYNAMICdaq_optional : daq_list\n                        | event\n                        | timestamp_supported\n                        | stim\n                        | optimisation_type\n                        | address_extension\n                        | identification_field_type\n                        | granularity_odt_entry\n                        | prescaler_supported\n                        | resume_supported\n                        | IDENT\n                        | NUMERICprescaler_supported : PRESCALER_SUPPORTEDresume_supported : RESUME_SUPPORTEDoptimisation_type : OPTIMISATION_TYPE_DEFAULT\n                             | OPTIMISATION_TYPE_ODT_TYPE_16\n                             | OPTIMISATION_TYPE_ODT_TYPE_32\n                             | OPTIMISATION_TYPE_ODT_TYPE_64\n                             | OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT\n                             | OPTIMISATION_TYPE_MAX_ENTRY_SIZEaddress_extension : ADDRESS_EXTENSION_FREE\n                             | ADDRESS_EXTENSION_ODT\n                             | ADDRESS_EXTENSION_DAQidentification_field_type : IDENTIFICATION_FIELD_TYPE_ABSOLUTE\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNEDgranularity_odt_entry : GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONGoverload_indication : NO_OVERLOAD_INDICATION\n                               | OVERLOAD_INDICATION_PID\n                               | OVERLOAD_INDICATION_EVENTdaq_optional_list : daq_optional\n                             | daq_optional daq_optional_listdaq_optional_list_optional : empty\n                                      | daq_optional_listevent : begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENTdaq_list : begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LISTdaq_list_optional : daq_list_type\n                             | max_odt\n                             | max_odt_entries\n                             | first_pid\n                             | event_fixed\n                             | predefineddaq_list_type_enum : DAQ\n                              | STIM\n                              | DAQ_STIMdaq_list_type : DAQ_LIST_TYPE daq_list_type_enummax_odt : MAX_ODT NUMERICmax_odt_entries : MAX_ODT_ENTRIES NUMERICfirst_pid : FIRST_PID NUMERICevent_fixed : EVENT_FIXED NUMERICpredefined : generic_parameter_listdaq_list_optional_list : daq_list_optional\n                                  | daq_list_optional daq_list_optional_listdaq_list_optional_list_optional : empty\n                                           | daq_list_optional_listtimestamp_supported : begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTEDstim : begin STIM GRANULARITY_ODT_ENTRY_SIZE_STIM_BYTE NUMERIC end STIMtimestamp_fixed : empty\n                           | TIMESTAMP_FIXEDprotocol_layer : begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYERprotocol_layer_optional : generic_parameter_listprotocol_layer_optional_list : protocol_layer_optional\n                                        | protocol_layer_optional protocol_layer_optional_listprotocol_layer_optional_list_optional : empty\n                                                 | protocol_layer_optional_listif_data_module : begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATAif_data_module_optional : source\n                                   | raster\n                                   | event_group\n                                   | seed_key\n                                   | checksum\n                                   | tp_blob tp_data\n                                   | if_data_module_unsupported_elementif_data_module_optional_list : if_data_module_optional\n                                        | if_data_module_optional if_data_module_optional_listif_data_module_optional_list_optional : empty\n                                                 | if_data_module_optional_listif_data_module_unsupported_element : generic_parameter_listsource : begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCEraster : begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTERevent_group : begin EVENT_GROUP STRING STRING number_list end EVENT_GROUPseed_key : begin SEED_KEY STRING STRING STRING end SEED_KEYchecksum : begin CHECKSUM STRING end CHECKSUM\n                    | begin CHECKSUM IDENT max_block_size end CHECKSUMmax_block_size : MAX_BLOCK_SIZE NUMERICtp_blob : TP_BLOBtp_data : generic_parameter_listsource_optional : display_identifier\n                           | qp_blobsource_optional_list : source_optional\n                                | source_optional source_optional_listsource_optional_list_optional : empty\n                                         | source_optional_listqp_blob : QP_BLOB IDENTmod_par : begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PARmod_par_optional : version\n                            | addr_epk\n                            | epk\n                            | supplier\n                            | customer\n                            | customer_no\n                            | user\n                            | phone_no\n                            | ecu\n                            | cpu_type\n                            | no_of_interfaces\n                            | ecu_calibration_offset\n                            | calibration_method\n                            | memory_layout\n                            | memory_segment\n                            | system_constantmod_par_optional_list : mod_par_optional\n                                 | mod_par_optional mod_par_optional_listmod_par_optional_list_optional : empty\n                                          | mod_par_optional_listaddr_epk : ADDR_EPK NUMERICepk : EPK STRINGsupplier : SUPPLIER STRINGcustomer : CUSTOMER STRINGcustomer_no : CUSTOMER_NO STRINGuser : USER STRINGphone_no : PHONE_NO STRINGmod_common : begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMONmod_common_optional : s_rec_layout\n                               | deposit\n                               | byte_order\n                               | data_size\n                               | alignment_byte\n                               | alignment_word\n                               | alignment_long\n                               | alignment_int64\n                               | alignment_float32_ieee\n                               | alignment_float64_ieeemod_common_optional_list : mod_common_optional\n                                    | mod_common_optional mod_common_optional_listmod_common_optional_list_optional : empty\n                                             | mod_common_optional_lists_rec_layout : S_REC_LAYOUT IDENTdata_size : DATA_SIZE NUMERICecu : ECU STRINGcpu_type : CPU_TYPE STRINGno_of_interfaces : NO_OF_INTERFACES NUMERICecu_calibration_offset : ECU_CALIBRATION_OFFSET NUMERICcalibration_method : begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHODcalibration_method_optional : calibration_handlecalibration_method_optional_list : calibration_method_optional\n                                            | calibration_method_optional calibration_method_optional_listcalibration_method_optional_list_optional : empty\n                                                     | calibration_method_optional_listcalibration_handle : begin CALIBRATION_HANDLE calibration_handle_optional_list_optional end CALIBRATION_HANDLEcalibration_handle_optional : NUMERICcalibration_handle_optional_list : calibration_handle_optional\n                                            | calibration_handle_optional calibration_handle_optional_listcalibration_handle_optional_list_optional : empty\n                                                     | calibration_handle_optional_listmemory_layout : begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUTmemory_layout_prg_type : PRG_CODE\n                                  | PRG_DATA\n                                  | PRG_RESERVEDmemory_layout_optional : if_data_memory_layoutmemory_layout_optional_list : memory_layout_optional\n                                       | memory_layout_optional memory_layout_optional_listmemory_layout_optional_list_optional : empty\n                                                | memory_layout_optional_listif_data_memory_layout : begin IF_DATA IDENT if_data_memory_layout_optional_list_optional end IF_DATAif_data_memory_layout_optional : dp_blob dp_data\n                                          | ba_blob pa_dataif_data_memory_layout_optional_list : if_data_memory_layout_optional\n                                               | if_data_memory_layout_optional if_data_memory_layout_optional_listif_data_memory_layout_optional_list_optional : empty\n                                                        | if_data_memory_layout_optional_listdp_blob : DP_BLOBba_blob : BA_BLOBdp_data : generic_parameter_listpa_data : generic_parameter_listmemory_segment : begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENTmemory_segment_optional : if_data_memory_segment\n                                   | if_data_xcpmemory_segment_optional_parameter_list : memory_segment_optional\n                                                  | memory_segment_optional memory_segment_optional_parameter_listmemory_segment_optional_list_optional : empty\n                                                 | memory_segment_optional_parameter_listmemory_segment_prg_type : CODE\n                                   | DATA\n                                   | OFFLINE_DATA\n                                   | VARIABLES\n                                   | SERAM\n                                   | RESERVED\n                                   | CALIBRATION_VARIABLES\n                                   | EXCLUDE_FROM_FLASHmemory_segment_memory_type : RAM\n                                      | EEPROM\n                                      | EPROM\n                                      | ROM\n                                      | REGISTER\n                                      | FLASHmemory_segment_attributes : INTERN\n                                     | EXTERNsystem_constant : SYSTEM_CONSTANT STRING STRINGif_data_memory_segment : begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATAif_data_memory_segment_optional : address_mapping\n                                           | segment\n                                           | generic_parameterif_data_memory_segment_optional_list : if_data_memory_segment_optional\n                                                | if_data_memory_segment_optional if_data_memory_segment_optional_listif_data_memory_segment_optional_list_optional : empty\n                                                         | if_data_memory_segment_optional_listsegment : begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENTsegment_optional_parameter : page\n                                      | checksumsegment_optional_parameter_list : segment_optional_parameter\n                                           | segment_optional_parameter segment_optional_parameter_listsegment_optional_parameter_list_optional : empty\n                                                    | segment_optional_parameter_listpage : begin PAGE NUMERIC IDENT IDENT IDENT page_optional_parameter_list_optional end PAGEpage_optional_parameter : init_segmentpage_optional_parameter_list : page_optional_parameter\n                                        | page_optional_parameter page_optional_parameter_listpage_optional_parameter_list_optional : empty\n                                                 | page_optional_parameter_listinit_segment : INIT_SEGMENT NUMERICaddress_mapping : ADDRESS_MAPPING NUMERIC NUMERIC NUMERICcharacteristic : begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTICcharacteristic_type : VALUE\n                               | CURVE\n                               | MAP\n                               | CUBOID\n                               | VAL_BLK\n                               | ASCIIdisplay_identifier : DISPLAY_IDENTIFIER IDENTformat : FORMAT STRINGbyte_order : BYTE_ORDER byte_order_typebyte_order_type : MSB_FIRST\n                           | MSB_LASTbit_mask : BIT_MASK NUMERICfunction_list : begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LISTfunction_list_optional : IDENTfunction_list_optional_list : function_list_optional\n                                       | function_list_optional function_list_optional_listfunction_list_optional_list_optional : empty\n                                                | function_list_optional_listnumber : NUMBER NUMERICextended_limits : EXTENDED_LIMITS NUMERIC NUMERICmap_list : begin MAP_LIST ident_list end MAP_LISTmax_refresh : MAX_REFRESH NUMERIC NUMERICdependent_characteristic : begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTICvirtual_characteristic : begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTICvirtual_characteristic_optional : empty\n                                           | ident_listref_memory_segment : REF_MEMORY_SEGMENT IDENTannotation : begin ANNOTATION annotation_optional_list_optional end ANNOTATIONannotation_optional : annotation_label\n                               | annotation_origin\n                               | annotation_textannotation_optional_list : annotation_optional\n                                    | annotation_optional annotation_optional_listannotation_optional_list_optional : empty\n                                             | annotation_optional_listannotation_label : ANNOTATION_LABEL STRINGannotation_origin : ANNOTATION_ORIGIN STRINGannotation_text : begin ANNOTATION_TEXT string_list end ANNOTATION_TEXTcomparison_quantity : COMPARISON_QUANTITY IDENTaxis_descr : begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCRaxis_descr_optional : read_only\n                               | format\n                               | annotation\n                               | axis_pts_ref\n                               | max_grad\n                               | monotony\n                               | byte_order\n                               | extended_limits\n                               | fix_axis_par\n                               | fix_axis_par_dist\n                               | fix_axis_par_list\n                               | deposit\n                               | curve_axis_refaxis_descr_optional_list : axis_descr_optional\n                                    | axis_descr_optional axis_descr_optional_listaxis_descr_optional_list_optional : empty\n                                             | axis_descr_optional_listaxis_pts_ref : AXIS_PTS_REF IDENTmax_grad : MAX_GRAD NUMERICmonotony : MONOTONY monotony_typemonotony_type : MON_INCREASE\n                         | MON_DECREASE\n                         | STRICT_INCREASE\n                         | STRICT_DECREASEfix_axis_par : FIX_AXIS_PAR NUMERIC NUMERIC NUMERICfix_axis_par_dist : FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERICfix_axis_par_list : begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LISTcurve_axis_ref : CURVE_AXIS_REF IDENTaxis_descr_attribute : STD_AXIS\n                                | FIX_AXIS\n                                | COM_AXIS\n                                | RES_AXIS\n                                | CURVE_AXIScalibration_access : CALIBRATION_ACCESS calibration_access_typecalibration_access_type : CALIBRATION\n                                   | NO_CALIBRATION\n                                   | NOT_IN_MCD_SYSTEM\n                                   | OFFLINE_CALIBRATIONmatrix_dim : MATRIX_DIM NUMERIC NUMERIC NUMERICecu_address_extension : ECU_ADDRESS_EXTENSION NUMERICcharacteristic_optional : display_identifier\n                                   | format\n                                   | byte_order\n                                   | bit_mask\n                                   | function_list\n                                   | number\n                                   | symbol_link\n                                   | extended_limits\n                                   | read_only\n                                   | guard_rails\n                                   | map_list\n                                   | max_refresh\n                                   | dependent_characteristic\n                                   | virtual_characteristic\n                                   | ref_memory_segment\n                                   | annotation\n                                   | comparison_quantity\n                                   | if_data_characteristic\n                                   | axis_descr\n                                   | calibration_access\n                                   | matrix_dim\n                                   | ecu_address_extensioncharacteristic_optional_list : characteristic_optional\n                                        | characteristic_optional characteristic_optional_listcharacteristic_optional_list_optional : empty\n                                                 | characteristic_optional_listif_data_characteristic : if_data_memory_layoutaxis_pts : begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTSaxis_pts_optional : display_identifier\n                             | read_only\n                             | format\n                             | deposit\n                             | byte_order\n                             | function_list\n                             | ref_memory_segment\n                             | guard_rails\n                             | extended_limits\n                             | annotation\n                             | if_data_axis_pts\n                             | calibration_access\n                             | ecu_address_extensionaxis_pts_optional_list : axis_pts_optional\n                                  | axis_pts_optional axis_pts_optional_listaxis_pts_optional_list_optional : empty\n                                           | axis_pts_optional_listif_data_axis_pts : if_data_memory_layoutdeposit : DEPOSIT deposit_modedeposit_mode : ABSOLUTE\n                        | DIFFERENCEmeasurement : begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENTmeasurement_optional : display_identifier\n                                | read_write\n                                | format\n                                | array_size\n                                | bit_mask\n                                | bit_operation\n                                | byte_order\n                                | max_refresh\n                                | virtual\n                                | function_list\n                                | ecu_address\n                                | symbol_link\n                                | error_mask\n                                | ref_memory_segment\n                                | annotation\n                                | if_data_xcp\n                                | if_data_measurement\n                                | matrix_dim\n                                | ecu_address_extensionmeasurement_optional_list : measurement_optional\n                                     | measurement_optional measurement_optional_listmeasurement_optional_list_optional : empty\n                                              | measurement_optional_listread_write : READ_WRITEif_data_measurement : begin IF_DATA IDENT if_data_measurement_optional_parameter_list_optional end IF_DATAif_data_measurement_optional_parameter : kp_blob kp_data\n                                                  | dp_blob dp_data\n                                                  | pa_blob pa_data\n                                                  | if_data_measurement_unsupported_elementif_data_measurement_unsupported_element : begin IDENT generic_parameter_list end IDENTif_data_measurement_optional_parameter_list : if_data_measurement_optional_parameter\n                                                       | if_data_measurement_optional_parameter if_data_measurement_optional_parameter_listif_data_measurement_optional_parameter_list_optional : empty\n                                                                | if_data_measurement_optional_parameter_listkp_blob : KP_BLOBpa_blob : PA_BLOBkp_data : kp_data_parameter_optional_listkp_data_parameter_optional : NUMERIC\n                                      | STRING\n                                      | IDENTkp_data_parameter_optional_list : kp_data_parameter_optional\n                                           | kp_data_parameter_optional kp_data_parameter_optional_listarray_size : ARRAY_SIZE NUMERICbit_operation : begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATIONbit_operation_optional : left_shift\n                                  | right_shift\n                                  | sign_extendbit_operation_optional_list : bit_operation_optional\n                                       | bit_operation_optional bit_operation_optional_listbit_operation_optional_list_optional : empty\n                                                | bit_operation_optional_listleft_shift : LEFT_SHIFT NUMERICright_shift : RIGHT_SHIFT NUMERICsign_extend : SIGN_EXTENDcompu_method : begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHODcompu_method_optional : formula\n                                 | coeffs\n                                 | coeffs_linear\n                                 | compu_tab_ref\n                                 | ref_unitcompu_method_optional_list : compu_method_optional\n                                      | compu_method_optional compu_method_optional_listcompu_method_optional_list_optional : empty\n                                               | compu_method_optional_listcompu_method_conversion_type : TAB_INTP\n                             | TAB_NOINTP\n                             | TAB_VERB\n                             | RAT_FUNC\n                             | FORM\n                             | IDENTICAL\n                             | LINEARformula : begin FORMULA STRING formula_optional_list_optional end FORMULAformula_optional : formula_invformula_optional_list : formula_optional\n                                 | formula_optional formula_optional_listformula_optional_list_optional : empty\n                                          | formula_optional_listformula_inv : FORMULA_INV STRINGcoeffs : COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERICcoeffs_linear : COEFFS_LINEAR NUMERIC NUMERICcompu_tab_ref : COMPU_TAB_REF IDENTref_unit : REF_UNIT IDENTvirtual : begin VIRTUAL ident_list end VIRTUALecu_address : ECU_ADDRESS NUMERICsymbol_link : SYMBOL_LINK STRING NUMERICerror_mask : ERROR_MASK NUMERICcompu_tab : begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TABcompu_tab_optional : in_val_out_val\n                              | default_value\n                              | default_value_numericcompu_tab_optional_list : compu_tab_optional\n                                   | compu_tab_optional compu_tab_optional_listcompu_tab_optional_list_optional : empty\n                                            | compu_tab_optional_listin_val_out_val : number_listcompu_tab_conversion_type : TAB_INTP\n                                     | TAB_NOINTPdefault_value : DEFAULT_VALUE STRINGdefault_value_numeric : DEFAULT_VALUE_NUMERIC NUMERICcompu_vtab : begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTABcompu_vtab_optional : default_value\n                               | compu_vtab_in_val_out_valcompu_vtab_optional_list : compu_vtab_optional\n                                    | compu_vtab_optional compu_vtab_optional_listcompu_vtab_optional_list_optional : empty\n                                             | compu_vtab_optional_listcompu_vtab_in_val_out_val : number_string_value_listcompu_vtab_conversion_type : TAB_VERBnumber_string_value_list : number_string_value\n                                    | number_string_value number_string_value_listnumber_string_value : NUMERIC STRINGcompu_vtab_range : begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGEcompu_vtab_range_optional : default_value\n                                     | compu_vtab_range_in_val_out_valcompu_vtab_range_optional_list : compu_vtab_range_optional\n                                          | compu_vtab_range_optional compu_vtab_range_optional_listcompu_vtab_range_optional_list_optional : empty\n                                                   | compu_vtab_range_optional_listcompu_vtab_range_in_val_out_val : number_number_string_value_listnumber_number_string_value_list : number_number_string_value\n                                           | number_number_string_value number_number_string_value_listnumber_number_string_value : NUMERIC NUMERIC STRINGfunction : begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTIONfunction_optional : annotation\n                             | def_characteristic\n                             | ref_characteristic\n                             | in_measurement\n                             | out_measurement\n                             | loc_measurement\n                             | sub_function\n                             | function_versionfunction_optional_list : function_optional\n                                  | function_optional function_optional_listfunction_optional_list_optional : empty\n                                           | function_optional_listdef_characteristic : begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTICdef_characteristic_optional : identifierdef_characteristic_optional_list : def_characteristic_optional\n                                            | def_characteristic_optional def_characteristic_optional_listdef_characteristic_optional_list_optional : empty\n                                                     | def_characteristic_optional_listidentifier : IDENTref_characteristic : begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTICref_characteristic_optional : identifierref_characteristic_optional_list : ref_characteristic_optional\n                                            | ref_characteristic_optional ref_characteristic_optional_listref_characteristic_optional_list_optional : empty\n                                                     | ref_characteristic_optional_listin_measurement : begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENTin_measurement_optional : identifierin_measurement_optional_list : in_measurement_optional\n                                        | in_measurement_optional in_measurement_optional_listin_measurement_optional_list_optional : empty\n                                                 | in_measurement_optional_listout_measurement : begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENTout_measurement_optional : identifierout_measurement_optional_list : out_measurement_optional\n                                         | out_measurement_optional out_measurement_optional_listout_measurement_optional_list_optional : empty\n                                                  | out_measurement_optional_listloc_measurement : begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENTloc_measurement_optional : identifierloc_measurement_optional_list : loc_measurement_optional\n                                         | loc_measurement_optional loc_measurement_optional_listloc_measurement_optional_list_optional : empty\n                                                  | loc_measurement_optional_listsub_function : begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTIONsub_function_optional : identifiersub_function_optional_list : sub_function_optional\n                                      | sub_function_optional sub_function_optional_listsub_function_optional_list_optional : empty\n                                               | sub_function_optional_listfunction_version : FUNCTION_VERSION STRINGgroup : begin GROUP IDENT STRING group_optional_list_optional end GROUPgroup_optional : annotation\n                          | root\n                          | ref_characteristic\n                          | ref_measurement\n                          | function_list\n                          | sub_groupgroup_optional_list : group_optional\n                               | group_optional group_optional_listgroup_optional_list_optional : empty\n                                        | group_optional_listroot : ROOTref_measurement : begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENTref_measurement_optional : identifierref_measurement_optional_list : ref_measurement_optional\n                                         | ref_measurement_optional ref_measurement_optional_listref_measurement_optional_list_optional : empty\n                                                  | ref_measurement_optional_listsub_group : begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUPsub_group_optional : identifiersub_group_optional_list : sub_group_optional\n                                   | sub_group_optional sub_group_optional_listsub_group_optional_list_optional : empty\n                                            | sub_group_optional_listrecord_layout : begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUTrecord_layout_optional : fnc_values\n                                  | identification\n                                  | axis_pts_x\n                                  | axis_pts_y\n                                  | axis_pts_z\n                                  | axis_rescale_x\n                                  | axis_rescale_y\n                                  | axis_rescale_z\n                                  | no_axis_pts_x\n                                  | no_axis_pts_y\n                                  | no_axis_pts_z\n                                  | no_rescale_x\n                                  | no_rescale_y\n                                  | no_rescale_z\n                                  | fix_no_axis_pts_x\n                                  | fix_no_axis_pts_y\n                                  | fix_no_axis_pts_z\n                                  | src_addr_x\n                                  | src_addr_y\n                                  | src_addr_z\n                                  | rip_addr_x\n                                  | rip_addr_y\n                                  | rip_addr_z\n                                  | rip_addr_w\n                                  | shift_op_x\n                                  | shift_op_y\n                                  | shift_op_z\n                                  | offset_x\n                                  | offset_y\n                                  | offset_z\n                                  | dist_op_x\n                                  | dist_op_y\n                                  | dist_op_z\n                                  | alignment_byte\n                                  | alignment_word\n                                  | alignment_long\n                                  | alignment_float32_ieee\n                                  | alignment_float64_ieee\n                                  | alignment_int64\n                                  | reservedrecord_layout_optional_list : record_layout_optional\n                                       | record_layout_optional record_layout_optional_listrecord_layout_optional_list_optional : empty\n                                                | record_layout_optional_listfnc_values : FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtypefnc_values_index_mode : COLUMN_DIR\n                                 | ROW_DIR\n                                 | ALTERNATE_WITH_X\n                                 | ALTERNATE_WITH_Y\n                                 | ALTERNATE_CURVESidentification : IDENTIFICATION NUMERIC datatypeaxis_pts_x : AXIS_PTS_X NUMERIC datatype indexorder addrtypeaxis_pts_y : AXIS_PTS_Y NUMERIC datatype indexorder addrtypeaxis_pts_z : AXIS_PTS_Z NUMERIC datatype indexorder addrtypeaxis_rescale_x : AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtypeaxis_rescale_y : AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtypeaxis_rescale_z : AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtypeno_axis_pts_x : NO_AXIS_PTS_X NUMERIC datatypeno_axis_pts_y : NO_AXIS_PTS_Y NUMERIC datatypeno_axis_pts_z : NO_AXIS_PTS_Z NUMERIC datatypeno_rescale_x : NO_RESCALE_X NUMERIC datatypeno_rescale_y : NO_RESCALE_Y NUMERIC datatypeno_rescale_z : NO_RESCALE_Z NUMERIC datatypefix_no_axis_pts_x : FIX_NO_AXIS_PTS_X NUMERICfix_no_axis_pts_y : FIX_NO_AXIS_PTS_Y NUMERICfix_no_axis_pts_z : FIX_NO_AXIS_PTS_Z NUMERICsrc_addr_x : SRC_ADDR_X NUMERIC datatypesrc_addr_y : SRC_ADDR_Y NUMERIC datatypesrc_addr_z : SRC_ADDR_Z NUMERIC datatyperip_addr_x : RIP_ADDR_X NUMERIC datatyperip_addr_y : RIP_ADDR_Y NUMERIC datatyperip_addr_z : RIP_ADDR_Z NUMERIC datatyperip_addr_w : RIP_ADDR_W NUMERIC datatypeshift_op_x : SHIFT_OP_X NUMERIC datatypeshift_op_y : SHIFT_OP_Y NUMERIC datatypeshift_op_z : SHIFT_OP_Z NUMERIC datatypeoffset_x : OFFSET_X NUMERIC datatypeoffset_y : OFFSET_Y NUMERIC datatypeoffset_z : OFFSET_Z NUMERIC datatypedist_op_x : DIST_OP_X NUMERIC datatypedist_op_y : DIST_OP_Y NUMERIC datatypedist_op_z : DIST_OP_Z NUMERIC datatypealignment_byte : ALIGNMENT_BYTE NUMERICalignment_word : ALIGNMENT_WORD NUMERICalignment_long : ALIGNMENT_LONG NUMERICalignment_int64 : ALIGNMENT_INT64 NUMERICalignment_float32_ieee : ALIGNMENT_FLOAT32_IEEE NUMERICalignment_float64_ieee : ALIGNMENT_FLOAT64_IEEE NUMERICvariant_coding : begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODINGvariant_coding_optional : var_separator\n                                   | var_naming\n                                   | var_criterion\n                                   | var_forbidden_comb\n                                   | var_characteristicvariant_coding_optional_list : variant_coding_optional\n                                        | variant_coding_optional variant_coding_optional_listvariant_coding_optional_list_optional : empty\n                                                 | variant_coding_optional_listvar_separator : VAR_SEPARATOR STRINGvar_naming : VAR_NAMING IDENTvar_criterion : begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERIONvar_characteristic : begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTICvar_characteristic_optional : var_addressvar_characteristic_optional_optional : empty\n                                                | var_characteristic_optionalvar_address : begin VAR_ADDRESS number_list end VAR_ADDRESSvar_forbidden_comb : begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMBvar_forbidden_comb_criterion_list : var_forbidden_comb_criterion_optional\n                                             | var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_listvar_forbidden_comb_criterion_optional : IDENT IDENTvar_forbidden_comb_criterion_optional_list : var_forbidden_comb_criterion_optional\n                                                      | var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_listvar_criterion_optional : var_measurement\n                                  | var_selection_characteristicvar_criterion_optional_list : var_criterion_optional\n                                       | var_criterion_optional var_criterion_optional_listvar_criterion_optional_list_optional : empty\n                                                | var_criterion_optional_listvar_measurement : VAR_MEASUREMENT IDENTvar_selection_characteristic : VAR_SELECTION_CHARACTERISTIC IDENTreserved : RESERVED NUMERIC datasizeframe : begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAMEframe_optional : frame_measurement\n                          | if_data_frameframe_optional_list : frame_optional\n                               | frame_optional frame_optional_listframe_optional_list_optional : empty\n                                        | frame_optional_listif_data_frame : begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATAif_data_frame_optional : QP_BLOB qp_dataif_data_frame_optional_list : if_data_frame_optional\n                                       | if_data_frame_optional if_data_frame_optional_listif_data_frame_optional_list_optional : empty\n                                                | if_data_frame_optional_listqp_data : generic_parameterframe_measurement : FRAME_MEASUREMENT ident_listuser_rights : begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTSuser_rights_optional : ref_group\n                                | read_onlyuser_rights_optional_list : user_rights_optional\n                                     | user_rights_optional user_rights_optional_listuser_rights_optional_list_optional : empty\n                                              | user_rights_optional_listref_group : begin REF_GROUP ref_group_optional_list_optional end REF_GROUPref_group_optional : identifierref_group_optional_list : ref_group_optional\n                                   | ref_group_optional ref_group_optional_listref_group_optional_list_optional : empty\n                                            | ref_group_optional_listread_only : READ_ONLYguard_rails : GUARD_RAILSunit : begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNITunit_optional : si_exponents\n                         | ref_unit\n                         | unit_conversionunit_optional_list : unit_optional\n                              | unit_optional unit_optional_listunit_optional_list_optional : empty\n                                       | unit_optional_listunit_type : EXTENDED_SI\n                     | DERIVEDsi_exponents : SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERICunit_conversion : UNIT_CONVERSION NUMERIC NUMERICempty :'
+_lr_signature = 'nonassocLISTnonassocIDENTSTRINGNUMERICbeginA2ML A2ML_VERSION ABSOLUTE ADDRESS_EXTENSION_DAQ ADDRESS_EXTENSION_FREE ADDRESS_EXTENSION_ODT ADDRESS_MAPPING ADDR_EPK ALIGNMENT_BYTE ALIGNMENT_FLOAT32_IEEE ALIGNMENT_FLOAT64_IEEE ALIGNMENT_INT64 ALIGNMENT_LONG ALIGNMENT_WORD ALTERNATE_CURVES ALTERNATE_WITH_X ALTERNATE_WITH_Y ANNOTATION ANNOTATION_LABEL ANNOTATION_ORIGIN ANNOTATION_TEXT ARRAY_SIZE ASAP2_VERSION ASCII ASTERISK AVAILABLE_EVENT_LIST AXIS_DESCR AXIS_PTS AXIS_PTS_REF AXIS_PTS_X AXIS_PTS_Y AXIS_PTS_Z AXIS_RESCALE_X AXIS_RESCALE_Y AXIS_RESCALE_Z A_INT64 A_UINT64 BAUDRATE BA_BLOB BIT_MASK BIT_OPERATION BRACE_CLOSE BRACE_OPEN BTL_CYCLES BYTE BYTE_ORDER CALIBRATION CALIBRATION_ACCESS CALIBRATION_HANDLE CALIBRATION_METHOD CALIBRATION_VARIABLES CAN_ID_BROADCAST CAN_ID_MASTER CAN_ID_SLAVE CHARACTERISTIC CHECKSUM CODE COEFFS COEFFS_LINEAR COLUMN_DIR COMMA COMPARISON_QUANTITY COMPU_METHOD COMPU_TAB COMPU_TAB_REF COMPU_VTAB COMPU_VTAB_RANGE COM_AXIS CPU_TYPE CUBOID CURLY_CLOSE CURLY_OPEN CURVE CURVE_AXIS CURVE_AXIS_REF CUSTOMER CUSTOMER_NO DAQ DAQ_EVENT DAQ_LIST DAQ_LIST_CAN_ID DAQ_LIST_TYPE DAQ_STIM DATA DATA_SIZE DEFAULT_EVENT_LIST DEFAULT_VALUE DEFAULT_VALUE_NUMERIC DEF_CHARACTERISTIC DEPENDENT_CHARACTERISTIC DEPOSIT DERIVED DIFFERENCE DIRECT DISPLAY_IDENTIFIER DIST_OP_X DIST_OP_Y DIST_OP_Z DP_BLOB DUAL DYNAMIC ECU ECU_ADDRESS ECU_ADDRESS_EXTENSION ECU_CALIBRATION_OFFSET EEPROM EPK EPROM EQUAL ERROR_MASK EVENT EVENT_FIXED EVENT_GROUP EXCLUDE_FROM_FLASH EXTENDED_LIMITS EXTENDED_SI EXTERN FIRST_PID FIXED FIXED_EVENT_LIST FIX_AXIS FIX_AXIS_PAR FIX_AXIS_PAR_DIST FIX_AXIS_PAR_LIST FIX_NO_AXIS_PTS_X FIX_NO_AXIS_PTS_Y FIX_NO_AXIS_PTS_Z FLASH FLOAT32_IEEE FLOAT64_IEEE FNC_VALUES FORM FORMAT FORMULA FORMULA_INV FRAME FRAME_MEASUREMENT FREEZE_SUPPORTED FUNCTION FUNCTION_LIST FUNCTION_VERSION GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD GRANULARITY_ODT_ENTRY_SIZE_STIM_BYTE GROUP GUARD_RAILS HEADER IDENT IDENTICAL IDENTIFICATION IDENTIFICATION_FIELD_TYPE_ABSOLUTE IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED IF_DATA INDEX_DECR INDEX_INCR INIT_SEGMENT INTERN IN_MEASUREMENT KP_BLOB LEFT_SHIFT LINEAR LOC_MEASUREMENT LONG MAP MAP_LIST MATRIX_DIM MAX_BLOCK_SIZE MAX_GRAD MAX_ODT MAX_ODT_ENTRIES MAX_REFRESH MEASUREMENT MEMORY_LAYOUT MEMORY_SEGMENT MODULE MOD_COMMON MOD_PAR MONOTONY MON_DECREASE MON_INCREASE MSB_FIRST MSB_LAST NOT_IN_MCD_SYSTEM NO_AXIS_PTS_X NO_AXIS_PTS_Y NO_AXIS_PTS_Z NO_CALIBRATION NO_OF_INTERFACES NO_OVERLOAD_INDICATION NO_RESCALE_X NO_RESCALE_Y NO_RESCALE_Z NUMBER NUMERIC OFFLINE_CALIBRATION OFFLINE_DATA OFFSET_X OFFSET_Y OFFSET_Z OPTIMISATION_TYPE_DEFAULT OPTIMISATION_TYPE_MAX_ENTRY_SIZE OPTIMISATION_TYPE_ODT_TYPE_16 OPTIMISATION_TYPE_ODT_TYPE_32 OPTIMISATION_TYPE_ODT_TYPE_64 OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT OUT_MEASUREMENT OVERLOAD_INDICATION_EVENT OVERLOAD_INDICATION_PID PAG PAGE PARENTHESE_CLOSE PARENTHESE_OPEN PA_BLOB PBYTE PGM PHONE_NO PLONG PRESCALER_SUPPORTED PRG_CODE PRG_DATA PRG_RESERVED PROJECT PROJECT_NO PROTOCOL_LAYER PWORD QP_BLOB RAM RASTER RAT_FUNC READ_ONLY READ_WRITE RECORD_LAYOUT REF_CHARACTERISTIC REF_GROUP REF_MEASUREMENT REF_MEMORY_SEGMENT REF_UNIT REGISTER RESERVED RESUME_SUPPORTED RES_AXIS RIGHT_SHIFT RIP_ADDR_W RIP_ADDR_X RIP_ADDR_Y RIP_ADDR_Z ROM ROOT ROW_DIR SAMPLE_POINT SAMPLE_RATE SBYTE SECTOR SEED_KEY SEGMENT SEMICOLON SERAM SHIFT_OP_X SHIFT_OP_Y SHIFT_OP_Z SIGN_EXTEND SINGLE SI_EXPONENTS SJW SLONG SOURCE SRC_ADDR_X SRC_ADDR_Y SRC_ADDR_Z STATIC STD_AXIS STIM STRICT_DECREASE STRICT_INCREASE STRING SUB_FUNCTION SUB_GROUP SUPPLIER SWORD SYMBOL_LINK SYNC_EDGE SYSTEM_CONSTANT S_REC_LAYOUT TAB_INTP TAB_NOINTP TAB_VERB TIMESTAMP_FIXED TIMESTAMP_SUPPORTED TP_BLOB TRIPLE UBYTE ULONG UNIT UNIT_CONVERSION USER USER_RIGHTS UWORD VALUE VAL_BLK VARIABLE VARIABLES VARIANT_CODING VAR_ADDRESS VAR_CHARACTERISTIC VAR_CRITERION VAR_FORBIDDEN_COMB VAR_MEASUREMENT VAR_NAMING VAR_SELECTION_CHARACTERISTIC VAR_SEPARATOR VERSION VIRTUAL VIRTUAL_CHARACTERISTIC WORD XCP XCP_ON_CAN begin block char double end enum float int long struct taggedstruct taggedunion uchar uint ulonga2l : a2l_optional_list_optionala2l_optional : asap2_version\n                        | a2ml_version\n                        | projecta2l_optional_list : a2l_optional\n                             | a2l_optional_list a2l_optionala2l_optional_list_optional : empty\n                                      | a2l_optional_lista2ml_declaration : a2ml_type_definition SEMICOLON\n                            | a2ml_block_definition SEMICOLONa2ml_declaration_list : a2ml_declaration\n                                 | a2ml_declaration_list a2ml_declarationa2ml_type_definition : a2ml_type_namea2ml_type_name : a2ml_predefined_type_name\n                          | a2ml_struct_type_name\n                          | a2ml_enum_type_name\n                          | a2ml_taggedstruct_type_name\n                          | a2ml_taggedunion_type_namea2ml_predefined_type_name : char\n                                     | int\n                                     | long\n                                     | uchar\n                                     | uint\n                                     | ulong\n                                     | double\n                                     | floata2ml_block_definition : block a2ml_tag a2ml_type_name\n                                 | block a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISKa2ml_enum_type_name : enum a2ml_identifier_optional CURLY_OPEN a2ml_enumerator_list CURLY_CLOSE\n                               | enum a2ml_identifiera2ml_enumerator_list : a2ml_enumerator\n                                | a2ml_enumerator_list COMMA a2ml_enumeratora2ml_enumerator : a2ml_keyword EQUAL a2ml_constant\n                           | a2ml_keyworda2ml_struct_type_name : struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE\n                                 | struct a2ml_identifiera2ml_struct_member_list_optional : empty\n                                            | a2ml_struct_member_lista2ml_struct_member_list : a2ml_struct_member\n                                   | a2ml_struct_member_list a2ml_struct_membera2ml_struct_member : a2ml_member SEMICOLONa2ml_member : a2ml_type_name a2ml_array_specifier_optionala2ml_member_optional : empty\n                                | a2ml_membera2ml_array_specifier_optional : empty\n                                         | a2ml_array_specifiera2ml_array_specifier : BRACE_OPEN a2ml_constant BRACE_CLOSE\n                                | a2ml_array_specifier BRACE_OPEN a2ml_constant BRACE_CLOSEa2ml_taggedstruct_type_name : taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE\n                                       | taggedstruct a2ml_identifiera2ml_taggedstruct_member_list_optional : empty\n                                                  | a2ml_taggedstruct_member_lista2ml_taggedstruct_member_list : a2ml_taggedstruct_member\n                                         | a2ml_taggedstruct_member_list a2ml_taggedstruct_membera2ml_taggedstruct_member : a2ml_taggedstruct_definition SEMICOLON\n                                    | PARENTHESE_OPEN a2ml_taggedstruct_definition PARENTHESE_CLOSE ASTERISK SEMICOLON\n                                    | a2ml_block_definition SEMICOLON\n                                    | PARENTHESE_OPEN a2ml_block_definition PARENTHESE_CLOSE ASTERISK SEMICOLONa2ml_taggedstruct_definition : a2ml_tag a2ml_member_optional\n                                        | a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISKa2ml_taggedunion_type_name : taggedunion a2ml_identifier_optional CURLY_OPEN a2ml_taggedunion_member_list_optional CURLY_CLOSE\n                                      | taggedunion a2ml_identifiera2ml_taggedunion_member_list : a2ml_taggedunion_member\n                                        | a2ml_taggedunion_member_list a2ml_taggedunion_membera2ml_taggedunion_member_list_optional : empty\n                                                 | a2ml_taggedunion_member_lista2ml_taggedunion_member : a2ml_tag SEMICOLON\n                                   | a2ml_tag a2ml_member SEMICOLON\n                                   | a2ml_block_definition SEMICOLONa2ml_tag : STRINGa2ml_identifier : IDENTa2ml_identifier_optional : empty\n                                    | a2ml_identifiera2ml_keyword : STRINGa2ml_constant : NUMERICdatatype : UBYTE\n                    | SBYTE\n                    | UWORD\n                    | SWORD\n                    | ULONG\n                    | SLONG\n                    | A_UINT64\n                    | A_INT64\n                    | FLOAT32_IEEE\n                    | FLOAT64_IEEEdatasize : BYTE\n                    | WORD\n                    | LONGaddrtype : PBYTE\n                    | PWORD\n                    | PLONG\n                    | DIRECTindexorder : INDEX_INCR\n                      | INDEX_DECRasap2_version : ASAP2_VERSION NUMERIC NUMERICa2ml_version : A2ML_VERSION NUMERIC NUMERICgeneric_parameter : IDENT\n                             | STRING\n                             | NUMERIC\n                             | begin IDENT generic_parameter_list_optional end IDENTgeneric_parameter_list : generic_parameter\n                                  | generic_parameter_list generic_parametergeneric_parameter_list_optional : empty\n                                           | generic_parameter_listnumber_list : NUMERIC\n                       | number_list NUMERICident_list : IDENT\n                      | ident_list IDENTstring_list : STRING\n                       | string_list STRINGproject : begin PROJECT IDENT STRING project_optional_list_optional end PROJECTproject_optional : header\n                            | moduleproject_optional_list : project_optional\n                                 | project_optional_list project_optionalproject_optional_list_optional : empty\n                                          | project_optional_listheader : begin HEADER STRING header_optional_list_optional end HEADERheader_optional : version\n                           | project_noheader_optional_list : header_optional\n                                | header_optional_list header_optionalheader_optional_list_optional : empty\n                                         | header_optional_listversion : VERSION STRINGproject_no : PROJECT_NO IDENTmodule : begin MODULE IDENT STRING module_optional_list_optional end MODULEmodule_optional : a2ml\n                           | mod_par\n                           | mod_common\n                           | if_data_xcp\n                           | if_data_module\n                           | characteristic\n                           | axis_pts\n                           | measurement\n                           | compu_method\n                           | compu_tab\n                           | compu_vtab\n                           | compu_vtab_range\n                           | function\n                           | group\n                           | record_layout\n                           | variant_coding\n                           | frame\n                           | user_rights\n                           | unitmodule_optional_list : module_optional\n                                | module_optional_list module_optionalmodule_optional_list_optional : empty\n                                         | module_optional_lista2ml : begin A2ML a2ml_declaration_list end A2MLif_data_xcp : begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATAif_data_xcp_optional : protocol_layer\n                                | daq\n                                | pag\n                                | pgm\n                                | segment\n                                | daq_event\n                                | xcp_on_can\n                                | generic_parameter_list %prec LISTxcp_on_can : begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CANxcp_on_can_optional : can_id_broadcast\n                               | can_id_master\n                               | can_id_slave\n                               | baudrate\n                               | sample_point\n                               | sample_rate\n                               | btl_cycles\n                               | sjw\n                               | sync_edge\n                               | daq_list_can_idxcp_on_can_optional_list : xcp_on_can_optional\n                                    | xcp_on_can_optional_list xcp_on_can_optionalxcp_on_can_optional_list_optional : empty\n                                             | xcp_on_can_optional_listcan_id_broadcast : CAN_ID_BROADCAST NUMERICcan_id_master : CAN_ID_MASTER NUMERICcan_id_slave : CAN_ID_SLAVE NUMERICbaudrate : BAUDRATE NUMERICsample_point : SAMPLE_POINT NUMERICsample_rate : SAMPLE_RATE SINGLE\n                       | SAMPLE_RATE TRIPLEbtl_cycles : BTL_CYCLES NUMERICsjw : SJW NUMERICsync_edge : SYNC_EDGE SINGLE\n                     | SYNC_EDGE DUALdaq_list_can_id : begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_IDdaq_list_can_id_optional : daq_list_can_id_type_variable\n                                    | daq_list_can_id_type_fixeddaq_list_can_id_optional_optional : empty\n                                             | daq_list_can_id_optionaldaq_list_can_id_type_variable : VARIABLEdaq_list_can_id_type_fixed : FIXED NUMERICdaq_event : begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT\n                     | begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENTdaq_event_optional : available_event_list\n                              | default_event_listdaq_event_optional_list : daq_event_optional\n                                   | daq_event_optional_list daq_event_optionaldaq_event_optional_list_optional : empty\n                                            | daq_event_optional_listdefault_event_list : begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LISTavailable_event_list : begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LISTavailable_event_list_optional : EVENT NUMERICavailable_event_list_optional_list : available_event_list_optional\n                                              | available_event_list_optional_list available_event_list_optionalavailable_event_list_optional_list_optional : empty\n                                                       | available_event_list_optional_listif_data_xcp_optional_list : if_data_xcp_optional\n                                     | if_data_xcp_optional_list if_data_xcp_optionalif_data_xcp_optional_list_optional : empty\n                                                     | if_data_xcp_optional_listpag : begin PAG NUMERIC pag_optional_list_optional end PAGpgm : begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGMpgm_optional : sector\n                        | generic_parameter_list %prec LISTpgm_optional_list : pgm_optional\n                             | pgm_optional_list pgm_optionalpgm_optional_list_optional : empty\n                                      | pgm_optional_listsector : begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTORpag_optional : freeze_supported\n                        | generic_parameter_list %prec LISTpag_optional_list : pag_optional\n                             | pag_optional_list pag_optionalpag_optional_list_optional : empty\n                                      | pag_optional_listfreeze_supported : FREEZE_SUPPORTEDdaq : begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQdaq_config_type : STATIC\n                           | DYNAMICdaq_optional : daq_list\n                        | event\n                        | timestamp_supported\n                        | stim\n                        | optimisation_type\n                        | address_extension\n                        | identification_field_type\n                        | granularity_odt_entry\n                        | prescaler_supported\n                        | resume_supported\n                        | IDENT\n                        | NUMERICprescaler_supported : PRESCALER_SUPPORTEDresume_supported : RESUME_SUPPORTEDoptimisation_type : OPTIMISATION_TYPE_DEFAULT\n                             | OPTIMISATION_TYPE_ODT_TYPE_16\n                             | OPTIMISATION_TYPE_ODT_TYPE_32\n                             | OPTIMISATION_TYPE_ODT_TYPE_64\n                             | OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT\n                             | OPTIMISATION_TYPE_MAX_ENTRY_SIZEaddress_extension : ADDRESS_EXTENSION_FREE\n                             | ADDRESS_EXTENSION_ODT\n                             | ADDRESS_EXTENSION_DAQidentification_field_type : IDENTIFICATION_FIELD_TYPE_ABSOLUTE\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD\n                                     | IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNEDgranularity_odt_entry : GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD\n                                 | GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONGoverload_indication : NO_OVERLOAD_INDICATION\n                               | OVERLOAD_INDICATION_PID\n                               | OVERLOAD_INDICATION_EVENTdaq_optional_list : daq_optional\n                             | daq_optional_list daq_optionaldaq_optional_list_optional : empty\n                                      | daq_optional_listevent : begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENTdaq_list : begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LISTdaq_list_optional : daq_list_type\n                             | max_odt\n                             | max_odt_entries\n                             | first_pid\n                             | event_fixed\n                             | predefineddaq_list_type_enum : DAQ\n                              | STIM\n                              | DAQ_STIMdaq_list_type : DAQ_LIST_TYPE daq_list_type_enummax_odt : MAX_ODT NUMERICmax_odt_entries : MAX_ODT_ENTRIES NUMERICfirst_pid : FIRST_PID NUMERICevent_fixed : EVENT_FIXED NUMERICpredefined : generic_parameter_list %prec LISTdaq_list_optional_list : daq_list_optional\n                                  | daq_list_optional_list daq_list_optionaldaq_list_optional_list_optional : empty\n                                           | daq_list_optional_listtimestamp_supported : begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTEDstim : begin STIM GRANULARITY_ODT_ENTRY_SIZE_STIM_BYTE NUMERIC end STIMtimestamp_fixed : empty\n                           | TIMESTAMP_FIXEDprotocol_layer : begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYERprotocol_layer_optional : generic_parameter_list %prec LISTprotocol_layer_optional_list : protocol_layer_optional\n                                        | protocol_layer_optional_list protocol_layer_optionalprotocol_layer_optional_list_optional : empty\n                                                 | protocol_layer_optional_listif_data_module : begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATAif_data_module_optional : source\n                                   | raster\n                                   | event_group\n                                   | seed_key\n                                   | checksum\n                                   | tp_blob tp_data\n                                   | if_data_module_unsupported_elementif_data_module_optional_list : if_data_module_optional\n                                        | if_data_module_optional_list if_data_module_optionalif_data_module_optional_list_optional : empty\n                                                 | if_data_module_optional_listif_data_module_unsupported_element : generic_parameter_list %prec LISTsource : begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCEraster : begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTERevent_group : begin EVENT_GROUP STRING STRING number_list end EVENT_GROUPseed_key : begin SEED_KEY STRING STRING STRING end SEED_KEYchecksum : begin CHECKSUM STRING end CHECKSUM\n                    | begin CHECKSUM IDENT max_block_size end CHECKSUMmax_block_size : MAX_BLOCK_SIZE NUMERICtp_blob : TP_BLOBtp_data : generic_parameter_list %prec LISTsource_optional : display_identifier\n                           | qp_blobsource_optional_list : source_optional\n                                | source_optional_list source_optionalsource_optional_list_optional : empty\n                                         | source_optional_listqp_blob : QP_BLOB IDENTmod_par : begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PARmod_par_optional : version\n                            | addr_epk\n                            | epk\n                            | supplier\n                            | customer\n                            | customer_no\n                            | user\n                            | phone_no\n                            | ecu\n                            | cpu_type\n                            | no_of_interfaces\n                            | ecu_calibration_offset\n                            | calibration_method\n                            | memory_layout\n                            | memory_segment\n                            | system_constantmod_par_optional_list : mod_par_optional\n                                 | mod_par_optional_list mod_par_optionalmod_par_optional_list_optional : empty\n                                          | mod_par_optional_listaddr_epk : ADDR_EPK NUMERICepk : EPK STRINGsupplier : SUPPLIER STRINGcustomer : CUSTOMER STRINGcustomer_no : CUSTOMER_NO STRINGuser : USER STRINGphone_no : PHONE_NO STRINGmod_common : begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMONmod_common_optional : s_rec_layout\n                               | deposit\n                               | byte_order\n                               | data_size\n                               | alignment_byte\n                               | alignment_word\n                               | alignment_long\n                               | alignment_int64\n                               | alignment_float32_ieee\n                               | alignment_float64_ieeemod_common_optional_list : mod_common_optional\n                                    | mod_common_optional_list mod_common_optionalmod_common_optional_list_optional : empty\n                                             | mod_common_optional_lists_rec_layout : S_REC_LAYOUT IDENTdata_size : DATA_SIZE NUMERICecu : ECU STRINGcpu_type : CPU_TYPE STRINGno_of_interfaces : NO_OF_INTERFACES NUMERICecu_calibration_offset : ECU_CALIBRATION_OFFSET NUMERICcalibration_method : begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHODcalibration_method_optional : calibration_handlecalibration_method_optional_list : calibration_method_optional\n                                            | calibration_method_optional_list calibration_method_optionalcalibration_method_optional_list_optional : empty\n                                                     | calibration_method_optional_listcalibration_handle : begin CALIBRATION_HANDLE calibration_handle_optional_list_optional end CALIBRATION_HANDLEcalibration_handle_optional : NUMERICcalibration_handle_optional_list : calibration_handle_optional\n                                            | calibration_handle_optional_list calibration_handle_optionalcalibration_handle_optional_list_optional : empty\n                                                     | calibration_handle_optional_listmemory_layout : begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUTmemory_layout_prg_type : PRG_CODE\n                                  | PRG_DATA\n                                  | PRG_RESERVEDmemory_layout_optional : if_data_memory_layoutmemory_layout_optional_list : memory_layout_optional\n                                       | memory_layout_optional_list memory_layout_optionalmemory_layout_optional_list_optional : empty\n                                                | memory_layout_optional_listif_data_memory_layout : begin IF_DATA IDENT if_data_memory_layout_optional_list_optional end IF_DATAif_data_memory_layout_optional : dp_blob dp_data\n                                          | ba_blob pa_dataif_data_memory_layout_optional_list : if_data_memory_layout_optional\n                                               | if_data_memory_layout_optional_list if_data_memory_layout_optionalif_data_memory_layout_optional_list_optional : empty\n                                                        | if_data_memory_layout_optional_listdp_blob : DP_BLOBba_blob : BA_BLOBdp_data : generic_parameter_list %prec LISTpa_data : generic_parameter_list %prec LISTmemory_segment : begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENTmemory_segment_optional : if_data_memory_segment\n                                   | if_data_xcpmemory_segment_optional_parameter_list : memory_segment_optional\n                                                  | memory_segment_optional_parameter_list memory_segment_optionalmemory_segment_optional_list_optional : empty\n                                                 | memory_segment_optional_parameter_listmemory_segment_prg_type : CODE\n                                   | DATA\n                                   | OFFLINE_DATA\n                                   | VARIABLES\n                                   | SERAM\n                                   | RESERVED\n                                   | CALIBRATION_VARIABLES\n                                   | EXCLUDE_FROM_FLASHmemory_segment_memory_type : RAM\n                                      | EEPROM\n                                      | EPROM\n                                      | ROM\n                                      | REGISTER\n                                      | FLASHmemory_segment_attributes : INTERN\n                                     | EXTERNsystem_constant : SYSTEM_CONSTANT STRING STRINGif_data_memory_segment : begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATAif_data_memory_segment_optional : address_mapping\n                                           | segment\n                                           | generic_parameterif_data_memory_segment_optional_list : if_data_memory_segment_optional\n            | if_data_memory_segment_optional_list if_data_memory_segment_optionalif_data_memory_segment_optional_list_optional : empty\n                                                         | if_data_memory_segment_optional_listsegment : begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENTsegment_optional_parameter : page\n                                      | checksumsegment_optional_parameter_list : segment_optional_parameter\n                                           | segment_optional_parameter_list segment_optional_parametersegment_optional_parameter_list_optional : empty\n                                                    | segment_optional_parameter_listpage : begin PAGE NUMERIC IDENT IDENT IDENT page_optional_parameter_list_optional end PAGEpage_optional_parameter : init_segmentpage_optional_parameter_list : page_optional_parameter\n                                        | page_optional_parameter_list page_optional_parameterpage_optional_parameter_list_optional : empty\n                                                 | page_optional_parameter_listinit_segment : INIT_SEGMENT NUMERICaddress_mapping : ADDRESS_MAPPING NUMERIC NUMERIC NUMERICcharacteristic : begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTICcharacteristic_type : VALUE\n                               | CURVE\n                               | MAP\n                               | CUBOID\n                               | VAL_BLK\n                               | ASCIIdisplay_identifier : DISPLAY_IDENTIFIER IDENTformat : FORMAT STRINGbyte_order : BYTE_ORDER byte_order_typebyte_order_type : MSB_FIRST\n                           | MSB_LASTbit_mask : BIT_MASK NUMERICfunction_list : begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LISTfunction_list_optional : IDENTfunction_list_optional_list : function_list_optional\n                                       | function_list_optional_list function_list_optionalfunction_list_optional_list_optional : empty\n                                                | function_list_optional_listnumber : NUMBER NUMERICextended_limits : EXTENDED_LIMITS NUMERIC NUMERICmap_list : begin MAP_LIST ident_list end MAP_LISTmax_refresh : MAX_REFRESH NUMERIC NUMERICdependent_characteristic : begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTICvirtual_characteristic : begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTICvirtual_characteristic_optional : empty\n                                           | ident_listref_memory_segment : REF_MEMORY_SEGMENT IDENTannotation : begin ANNOTATION annotation_optional_list_optional end ANNOTATIONannotation_optional : annotation_label\n                               | annotation_origin\n                               | annotation_textannotation_optional_list : annotation_optional\n                                    | annotation_optional_list annotation_optionalannotation_optional_list_optional : empty\n                                             | annotation_optional_listannotation_label : ANNOTATION_LABEL STRINGannotation_origin : ANNOTATION_ORIGIN STRINGannotation_text : begin ANNOTATION_TEXT string_list end ANNOTATION_TEXTcomparison_quantity : COMPARISON_QUANTITY IDENTaxis_descr : begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCRaxis_descr_optional : read_only\n                               | format\n                               | annotation\n                               | axis_pts_ref\n                               | max_grad\n                               | monotony\n                               | byte_order\n                               | extended_limits\n                               | fix_axis_par\n                               | fix_axis_par_dist\n                               | fix_axis_par_list\n                               | deposit\n                               | curve_axis_refaxis_descr_optional_list : axis_descr_optional\n                                    | axis_descr_optional_list axis_descr_optionalaxis_descr_optional_list_optional : empty\n                                             | axis_descr_optional_listaxis_pts_ref : AXIS_PTS_REF IDENTmax_grad : MAX_GRAD NUMERICmonotony : MONOTONY monotony_typemonotony_type : MON_INCREASE\n                         | MON_DECREASE\n                         | STRICT_INCREASE\n                         | STRICT_DECREASEfix_axis_par : FIX_AXIS_PAR NUMERIC NUMERIC NUMERICfix_axis_par_dist : FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERICfix_axis_par_list : begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LISTcurve_axis_ref : CURVE_AXIS_REF IDENTaxis_descr_attribute : STD_AXIS\n                                | FIX_AXIS\n                                | COM_AXIS\n                                | RES_AXIS\n                                | CURVE_AXIScalibration_access : CALIBRATION_ACCESS calibration_access_typecalibration_access_type : CALIBRATION\n                                   | NO_CALIBRATION\n                                   | NOT_IN_MCD_SYSTEM\n                                   | OFFLINE_CALIBRATIONmatrix_dim : MATRIX_DIM NUMERIC NUMERIC NUMERICecu_address_extension : ECU_ADDRESS_EXTENSION NUMERICcharacteristic_optional : display_identifier\n                                   | format\n                                   | byte_order\n                                   | bit_mask\n                                   | function_list\n                                   | number\n                                   | symbol_link\n                                   | extended_limits\n                                   | read_only\n                                   | guard_rails\n                                   | map_list\n                                   | max_refresh\n                                   | dependent_characteristic\n                                   | virtual_characteristic\n                                   | ref_memory_segment\n                                   | annotation\n                                   | comparison_quantity\n                                   | if_data_characteristic\n                                   | axis_descr\n                                   | calibration_access\n                                   | matrix_dim\n                                   | ecu_address_extensioncharacteristic_optional_list : characteristic_optional\n                                        | characteristic_optional_list characteristic_optionalcharacteristic_optional_list_optional : empty\n                                                 | characteristic_optional_listif_data_characteristic : if_data_memory_layoutaxis_pts : begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTSaxis_pts_optional : display_identifier\n                             | read_only\n                             | format\n                             | deposit\n                             | byte_order\n                             | function_list\n                             | ref_memory_segment\n                             | guard_rails\n                             | extended_limits\n                             | annotation\n                             | if_data_axis_pts\n                             | calibration_access\n                             | ecu_address_extensionaxis_pts_optional_list : axis_pts_optional\n                                  | axis_pts_optional_list axis_pts_optionalaxis_pts_optional_list_optional : empty\n                                           | axis_pts_optional_listif_data_axis_pts : if_data_memory_layoutdeposit : DEPOSIT deposit_modedeposit_mode : ABSOLUTE\n                        | DIFFERENCEmeasurement : begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENTmeasurement_optional : display_identifier\n                                | read_write\n                                | format\n                                | array_size\n                                | bit_mask\n                                | bit_operation\n                                | byte_order\n                                | max_refresh\n                                | virtual\n                                | function_list\n                                | ecu_address\n                                | symbol_link\n                                | error_mask\n                                | ref_memory_segment\n                                | annotation\n                                | if_data_xcp\n                                | if_data_measurement\n                                | matrix_dim\n                                | ecu_address_extensionmeasurement_optional_list : measurement_optional\n                                     | measurement_optional_list measurement_optionalmeasurement_optional_list_optional : empty\n                                              | measurement_optional_listread_write : READ_WRITEif_data_measurement : begin IF_DATA IDENT if_data_measurement_optional_parameter_list_optional end IF_DATAif_data_measurement_optional_parameter : kp_blob kp_data\n                                                  | dp_blob dp_data\n                                                  | pa_blob pa_data\n                                                  | if_data_measurement_unsupported_elementif_data_measurement_unsupported_element : begin IDENT generic_parameter_list end IDENTif_data_measurement_optional_parameter_list : if_data_measurement_optional_parameter\n            | if_data_measurement_optional_parameter_list if_data_measurement_optional_parameterif_data_measurement_optional_parameter_list_optional : empty\n                                                                | if_data_measurement_optional_parameter_listkp_blob : KP_BLOBpa_blob : PA_BLOBkp_data : kp_data_parameter_optional_listkp_data_parameter_optional : NUMERIC\n                                      | STRING\n                                      | IDENTkp_data_parameter_optional_list : kp_data_parameter_optional\n                                           | kp_data_parameter_optional_list kp_data_parameter_optionalarray_size : ARRAY_SIZE NUMERICbit_operation : begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATIONbit_operation_optional : left_shift\n                                  | right_shift\n                                  | sign_extendbit_operation_optional_list : bit_operation_optional\n                                       | bit_operation_optional_list bit_operation_optionalbit_operation_optional_list_optional : empty\n                                                | bit_operation_optional_listleft_shift : LEFT_SHIFT NUMERICright_shift : RIGHT_SHIFT NUMERICsign_extend : SIGN_EXTENDcompu_method : begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHODcompu_method_optional : formula\n                                 | coeffs\n                                 | coeffs_linear\n                                 | compu_tab_ref\n                                 | ref_unitcompu_method_optional_list : compu_method_optional\n                                      | compu_method_optional_list compu_method_optionalcompu_method_optional_list_optional : empty\n                                               | compu_method_optional_listcompu_method_conversion_type : TAB_INTP\n                             | TAB_NOINTP\n                             | TAB_VERB\n                             | RAT_FUNC\n                             | FORM\n                             | IDENTICAL\n                             | LINEARformula : begin FORMULA STRING formula_optional_list_optional end FORMULAformula_optional : formula_invformula_optional_list : formula_optional\n                                 | formula_optional_list formula_optionalformula_optional_list_optional : empty\n                                          | formula_optional_listformula_inv : FORMULA_INV STRINGcoeffs : COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERICcoeffs_linear : COEFFS_LINEAR NUMERIC NUMERICcompu_tab_ref : COMPU_TAB_REF IDENTref_unit : REF_UNIT IDENTvirtual : begin VIRTUAL ident_list end VIRTUALecu_address : ECU_ADDRESS NUMERICsymbol_link : SYMBOL_LINK STRING NUMERICerror_mask : ERROR_MASK NUMERICcompu_tab : begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TABcompu_tab_optional : in_val_out_val\n                              | default_value\n                              | default_value_numericcompu_tab_optional_list : compu_tab_optional\n                                   | compu_tab_optional_list compu_tab_optionalcompu_tab_optional_list_optional : empty\n                                            | compu_tab_optional_listin_val_out_val : number_list %prec LISTcompu_tab_conversion_type : TAB_INTP\n                                     | TAB_NOINTPdefault_value : DEFAULT_VALUE STRINGdefault_value_numeric : DEFAULT_VALUE_NUMERIC NUMERICcompu_vtab : begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTABcompu_vtab_optional : default_value\n                               | compu_vtab_in_val_out_valcompu_vtab_optional_list : compu_vtab_optional\n                                    | compu_vtab_optional_list compu_vtab_optionalcompu_vtab_optional_list_optional : empty\n                                             | compu_vtab_optional_listcompu_vtab_in_val_out_val : number_string_value_list %prec LISTcompu_vtab_conversion_type : TAB_VERBnumber_string_value_list : number_string_value\n                                    | number_string_value_list number_string_valuenumber_string_value : NUMERIC STRINGcompu_vtab_range : begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGEcompu_vtab_range_optional : default_value\n                                     | compu_vtab_range_in_val_out_valcompu_vtab_range_optional_list : compu_vtab_range_optional\n                                          | compu_vtab_range_optional_list compu_vtab_range_optionalcompu_vtab_range_optional_list_optional : empty\n                                                   | compu_vtab_range_optional_listcompu_vtab_range_in_val_out_val : number_number_string_value_list %prec LISTnumber_number_string_value_list : number_number_string_value\n                                           | number_number_string_value_list number_number_string_valuenumber_number_string_value : NUMERIC NUMERIC STRINGfunction : begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTIONfunction_optional : annotation\n                             | def_characteristic\n                             | ref_characteristic\n                             | in_measurement\n                             | out_measurement\n                             | loc_measurement\n                             | sub_function\n                             | function_versionfunction_optional_list : function_optional\n                                  | function_optional_list function_optionalfunction_optional_list_optional : empty\n                                           | function_optional_listdef_characteristic : begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTICdef_characteristic_optional : identifierdef_characteristic_optional_list : def_characteristic_optional\n                                            | def_characteristic_optional_list def_characteristic_optionaldef_characteristic_optional_list_optional : empty\n                                                     | def_characteristic_optional_listidentifier : IDENTref_characteristic : begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTICref_characteristic_optional : identifierref_characteristic_optional_list : ref_characteristic_optional\n                                            | ref_characteristic_optional_list ref_characteristic_optionalref_characteristic_optional_list_optional : empty\n                                                     | ref_characteristic_optional_listin_measurement : begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENTin_measurement_optional : identifierin_measurement_optional_list : in_measurement_optional\n                                        | in_measurement_optional_list in_measurement_optionalin_measurement_optional_list_optional : empty\n                                                 | in_measurement_optional_listout_measurement : begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENTout_measurement_optional : identifierout_measurement_optional_list : out_measurement_optional\n                                         | out_measurement_optional_list out_measurement_optionalout_measurement_optional_list_optional : empty\n                                                  | out_measurement_optional_listloc_measurement : begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENTloc_measurement_optional : identifierloc_measurement_optional_list : loc_measurement_optional\n                                         | loc_measurement_optional_list loc_measurement_optionalloc_measurement_optional_list_optional : empty\n                                                  | loc_measurement_optional_listsub_function : begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTIONsub_function_optional : identifiersub_function_optional_list : sub_function_optional\n                                      | sub_function_optional_list sub_function_optionalsub_function_optional_list_optional : empty\n                                               | sub_function_optional_listfunction_version : FUNCTION_VERSION STRINGgroup : begin GROUP IDENT STRING group_optional_list_optional end GROUPgroup_optional : annotation\n                          | root\n                          | ref_characteristic\n                          | ref_measurement\n                          | function_list\n                          | sub_groupgroup_optional_list : group_optional\n                               | group_optional_list group_optionalgroup_optional_list_optional : empty\n                                        | group_optional_listroot : ROOTref_measurement : begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENTref_measurement_optional : identifierref_measurement_optional_list : ref_measurement_optional\n                                         | ref_measurement_optional_list ref_measurement_optionalref_measurement_optional_list_optional : empty\n                                                  | ref_measurement_optional_listsub_group : begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUPsub_group_optional : identifiersub_group_optional_list : sub_group_optional\n                                   | sub_group_optional_list sub_group_optionalsub_group_optional_list_optional : empty\n                                            | sub_group_optional_listrecord_layout : begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUTrecord_layout_optional : fnc_values\n                                  | identification\n                                  | axis_pts_x\n                                  | axis_pts_y\n                                  | axis_pts_z\n                                  | axis_rescale_x\n                                  | axis_rescale_y\n                                  | axis_rescale_z\n                                  | no_axis_pts_x\n                                  | no_axis_pts_y\n                                  | no_axis_pts_z\n                                  | no_rescale_x\n                                  | no_rescale_y\n                                  | no_rescale_z\n                                  | fix_no_axis_pts_x\n                                  | fix_no_axis_pts_y\n                                  | fix_no_axis_pts_z\n                                  | src_addr_x\n                                  | src_addr_y\n                                  | src_addr_z\n                                  | rip_addr_x\n                                  | rip_addr_y\n                                  | rip_addr_z\n                                  | rip_addr_w\n                                  | shift_op_x\n                                  | shift_op_y\n                                  | shift_op_z\n                                  | offset_x\n                                  | offset_y\n                                  | offset_z\n                                  | dist_op_x\n                                  | dist_op_y\n                                  | dist_op_z\n                                  | alignment_byte\n                                  | alignment_word\n                                  | alignment_long\n                                  | alignment_float32_ieee\n                                  | alignment_float64_ieee\n                                  | alignment_int64\n                                  | reservedrecord_layout_optional_list : record_layout_optional\n                                       | record_layout_optional_list record_layout_optionalrecord_layout_optional_list_optional : empty\n                                                | record_layout_optional_listfnc_values : FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtypefnc_values_index_mode : COLUMN_DIR\n                                 | ROW_DIR\n                                 | ALTERNATE_WITH_X\n                                 | ALTERNATE_WITH_Y\n                                 | ALTERNATE_CURVESidentification : IDENTIFICATION NUMERIC datatypeaxis_pts_x : AXIS_PTS_X NUMERIC datatype indexorder addrtypeaxis_pts_y : AXIS_PTS_Y NUMERIC datatype indexorder addrtypeaxis_pts_z : AXIS_PTS_Z NUMERIC datatype indexorder addrtypeaxis_rescale_x : AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtypeaxis_rescale_y : AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtypeaxis_rescale_z : AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtypeno_axis_pts_x : NO_AXIS_PTS_X NUMERIC datatypeno_axis_pts_y : NO_AXIS_PTS_Y NUMERIC datatypeno_axis_pts_z : NO_AXIS_PTS_Z NUMERIC datatypeno_rescale_x : NO_RESCALE_X NUMERIC datatypeno_rescale_y : NO_RESCALE_Y NUMERIC datatypeno_rescale_z : NO_RESCALE_Z NUMERIC datatypefix_no_axis_pts_x : FIX_NO_AXIS_PTS_X NUMERICfix_no_axis_pts_y : FIX_NO_AXIS_PTS_Y NUMERICfix_no_axis_pts_z : FIX_NO_AXIS_PTS_Z NUMERICsrc_addr_x : SRC_ADDR_X NUMERIC datatypesrc_addr_y : SRC_ADDR_Y NUMERIC datatypesrc_addr_z : SRC_ADDR_Z NUMERIC datatyperip_addr_x : RIP_ADDR_X NUMERIC datatyperip_addr_y : RIP_ADDR_Y NUMERIC datatyperip_addr_z : RIP_ADDR_Z NUMERIC datatyperip_addr_w : RIP_ADDR_W NUMERIC datatypeshift_op_x : SHIFT_OP_X NUMERIC datatypeshift_op_y : SHIFT_OP_Y NUMERIC datatypeshift_op_z : SHIFT_OP_Z NUMERIC datatypeoffset_x : OFFSET_X NUMERIC datatypeoffset_y : OFFSET_Y NUMERIC datatypeoffset_z : OFFSET_Z NUMERIC datatypedist_op_x : DIST_OP_X NUMERIC datatypedist_op_y : DIST_OP_Y NUMERIC datatypedist_op_z : DIST_OP_Z NUMERIC datatypealignment_byte : ALIGNMENT_BYTE NUMERICalignment_word : ALIGNMENT_WORD NUMERICalignment_long : ALIGNMENT_LONG NUMERICalignment_int64 : ALIGNMENT_INT64 NUMERICalignment_float32_ieee : ALIGNMENT_FLOAT32_IEEE NUMERICalignment_float64_ieee : ALIGNMENT_FLOAT64_IEEE NUMERICvariant_coding : begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODINGvariant_coding_optional : var_separator\n                                   | var_naming\n                                   | var_criterion\n                                   | var_forbidden_comb\n                                   | var_characteristicvariant_coding_optional_list : variant_coding_optional\n                                        | variant_coding_optional_list variant_coding_optionalvariant_coding_optional_list_optional : empty\n                                                 | variant_coding_optional_listvar_separator : VAR_SEPARATOR STRINGvar_naming : VAR_NAMING IDENTvar_criterion : begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERIONvar_characteristic : begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTICvar_characteristic_optional : var_addressvar_characteristic_optional_optional : empty\n                                                | var_characteristic_optionalvar_address : begin VAR_ADDRESS number_list end VAR_ADDRESSvar_forbidden_comb : begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMBvar_forbidden_comb_criterion_list : var_forbidden_comb_criterion_optional\n                                             | var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_listvar_forbidden_comb_criterion_optional : IDENT IDENTvar_forbidden_comb_criterion_optional_list : var_forbidden_comb_criterion_optional\n            | var_forbidden_comb_criterion_optional_list var_forbidden_comb_criterion_optionalvar_criterion_optional : var_measurement\n                                  | var_selection_characteristicvar_criterion_optional_list : var_criterion_optional\n                                       | var_criterion_optional_list var_criterion_optionalvar_criterion_optional_list_optional : empty\n                                                | var_criterion_optional_listvar_measurement : VAR_MEASUREMENT IDENTvar_selection_characteristic : VAR_SELECTION_CHARACTERISTIC IDENTreserved : RESERVED NUMERIC datasizeframe : begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAMEframe_optional : frame_measurement\n                          | if_data_frameframe_optional_list : frame_optional\n                               | frame_optional_list frame_optionalframe_optional_list_optional : empty\n                                        | frame_optional_listif_data_frame : begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATAif_data_frame_optional : QP_BLOB qp_dataif_data_frame_optional_list : if_data_frame_optional\n                                       | if_data_frame_optional_list if_data_frame_optionalif_data_frame_optional_list_optional : empty\n                                                | if_data_frame_optional_listqp_data : generic_parameterframe_measurement : FRAME_MEASUREMENT ident_listuser_rights : begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTSuser_rights_optional : ref_group\n                                | read_onlyuser_rights_optional_list : user_rights_optional\n                                     | user_rights_optional_list user_rights_optionaluser_rights_optional_list_optional : empty\n                                              | user_rights_optional_listref_group : begin REF_GROUP ref_group_optional_list_optional end REF_GROUPref_group_optional : identifierref_group_optional_list : ref_group_optional\n                                   | ref_group_optional_list ref_group_optionalref_group_optional_list_optional : empty\n                                            | ref_group_optional_listread_only : READ_ONLYguard_rails : GUARD_RAILSunit : begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNITunit_optional : si_exponents\n                         | ref_unit\n                         | unit_conversionunit_optional_list : unit_optional\n                              | unit_optional_list unit_optionalunit_optional_list_optional : empty\n                                       | unit_optional_listunit_type : EXTENDED_SI\n                     | DERIVEDsi_exponents : SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERICunit_conversion : UNIT_CONVERSION NUMERIC NUMERICempty :'
     
-_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,12,16,17,33,],[-950,0,-1,-7,-8,-5,-2,-3,-4,-6,-95,-96,-111,]),'ASAP2_VERSION':([0,5,6,7,8,16,17,33,],[9,9,-2,-3,-4,-95,-96,-111,]),'A2ML_VERSION':([0,5,6,7,8,16,17,33,],[10,10,-2,-3,-4,-95,-96,-111,]),'begin':([0,5,6,7,8,16,17,19,24,25,26,33,42,45,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,86,115,117,118,133,134,135,136,137,138,142,144,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,222,223,224,225,226,227,228,229,230,231,232,233,234,239,240,241,242,243,244,245,246,247,248,256,257,341,342,348,349,350,351,353,365,366,367,368,369,370,371,372,373,374,375,380,381,382,383,384,385,397,403,412,413,451,452,453,454,455,456,457,458,459,465,466,467,468,469,470,471,472,514,551,552,553,558,564,565,566,567,574,591,600,606,646,647,648,655,685,693,694,695,696,704,705,706,712,713,714,715,716,717,718,719,720,721,722,742,743,771,772,773,774,807,823,839,841,851,852,853,880,881,896,897,907,908,909,910,911,912,913,914,915,916,917,922,932,933,934,935,936,937,941,950,954,955,998,999,1003,1012,1022,1027,1028,1029,1037,1038,1040,1052,1061,1062,1063,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1084,1086,1087,1099,1104,1105,1111,1112,1113,1114,1115,1116,1120,1134,1137,1138,1141,1143,1145,1148,1154,1164,1165,1166,1168,1173,1174,1175,1176,1177,1180,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1226,1233,1235,1239,1240,1241,1242,1247,1248,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1289,1290,1292,1294,1295,1297,1302,1308,1309,1310,1311,1312,1315,1316,1317,1318,1321,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1366,1367,1368,1369,1371,1377,1379,1384,1385,1386,1400,1401,1413,1415,1416,1417,1419,1420,1421,1423,1427,1428,1429,1430,1431,1440,1441,1442,1443,1446,1447,1448,1449,1450,1451,1452,1453,1454,1455,1459,1460,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1482,1487,1488,1493,1494,1495,1496,1513,1514,1520,1521,1525,1531,1532,1537,1538,1539,1540,1541,1542,1543,1549,1553,1554,1555,1556,1559,1560,1561,1562,1563,1564,1565,1566,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1594,1599,1603,1604,1605,1606,1607,1608,1609,1612,1616,1620,1622,1623,1625,1628,],[11,11,-2,-3,-4,-95,-96,20,20,-112,-113,-111,47,-125,47,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-118,129,161,218,235,129,-876,-877,-878,-879,-880,344,-127,161,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,218,-153,-154,-155,-156,-157,-158,-159,-160,-99,-97,404,-98,235,-302,-303,-304,-305,-306,404,-308,-321,-313,447,461,-885,-886,344,-924,-925,-936,-151,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-585,-586,-587,-467,-468,-469,404,-102,-307,-322,447,-712,-713,-714,-715,-716,-717,-718,-719,461,-763,-764,-765,-766,-767,-768,-773,-875,-330,-434,-358,404,700,700,708,-152,-301,767,-761,-786,-107,842,847,-923,876,404,-222,-223,-228,700,-196,-197,708,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,928,-105,767,-487,-488,-489,-711,-762,-893,-108,847,-909,-910,876,-380,1023,-100,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-318,928,-644,-645,-646,-647,-648,-106,-700,-494,-495,-922,-930,-670,1100,-213,1023,-215,-216,-194,-195,-161,-319,-669,-675,-688,-486,-724,-731,-737,-743,-749,-755,-774,-471,-780,-888,-908,-938,-379,1100,-395,-246,-247,-248,-249,-250,-251,1169,-465,-316,-317,1184,-643,-668,-887,404,-252,-253,-254,-214,1169,-444,-445,-203,-202,-314,1249,1184,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-496,-385,-391,-255,-256,-257,-258,-187,-315,1249,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1336,-466,-631,-470,-672,-674,-485,-538,-915,404,404,-407,-408,1380,-259,-260,-261,-262,-443,-477,-497,-532,-533,-534,-535,-536,1336,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,1409,-588,-480,-673,-660,-409,-410,1380,-412,-413,-458,-478,1409,404,404,-617,-624,-537,-667,-400,404,1461,-263,-264,-265,-566,-632,-671,404,-614,-625,-629,-626,-627,-628,-615,-616,1489,-411,404,-296,-243,-236,-237,-238,-239,1461,-232,-233,-234,-235,-240,-241,-242,-244,-245,-479,-613,-630,1489,-436,-437,-438,-481,-482,-295,404,-229,-618,-435,404,-272,-273,-274,-275,-276,-277,-286,-221,-450,1570,-457,-281,-278,-279,-280,-282,-283,-284,-285,1570,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-271,-292,-516,-517,-518,-519,-520,-521,-522,-526,-498,-291,-523,-524,-525,-270,]),'NUMERIC':([9,10,13,14,117,118,182,191,192,211,212,213,214,215,216,217,222,223,224,225,226,227,228,229,230,231,232,233,234,239,240,241,242,243,244,245,246,247,248,250,255,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,343,393,395,397,398,400,403,412,413,414,415,416,417,418,419,420,423,424,425,426,427,428,429,430,431,432,441,442,443,444,445,446,515,545,546,547,548,549,554,555,556,557,558,559,563,568,577,579,580,581,585,586,587,589,590,612,613,614,663,669,686,688,689,693,694,695,696,697,699,723,724,725,726,727,729,730,732,733,734,738,739,740,741,743,747,748,749,750,751,752,757,758,759,760,761,765,766,864,866,882,892,893,896,897,898,904,919,922,927,938,939,941,944,945,948,949,993,1002,1004,1009,1020,1022,1027,1028,1029,1030,1035,1037,1038,1040,1049,1052,1053,1054,1055,1059,1060,1088,1097,1098,1106,1107,1108,1109,1111,1112,1113,1114,1115,1116,1131,1137,1138,1139,1140,1144,1154,1155,1161,1162,1164,1165,1166,1167,1168,1180,1183,1210,1211,1212,1213,1215,1217,1218,1225,1232,1236,1237,1239,1240,1241,1242,1243,1244,1248,1276,1277,1291,1293,1296,1301,1303,1308,1309,1310,1311,1313,1314,1315,1316,1317,1318,1319,1321,1329,1362,1363,1370,1372,1373,1387,1389,1414,1415,1416,1418,1419,1427,1428,1429,1430,1431,1432,1443,1448,1449,1450,1451,1454,1459,1460,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1485,1493,1494,1495,1496,1497,1500,1502,1512,1515,1519,1520,1521,1524,1525,1530,1533,1537,1538,1539,1540,1541,1542,1543,1545,1546,1547,1548,1549,1550,1553,1556,1559,1560,1561,1562,1563,1564,1565,1566,1589,1591,1592,1594,1595,1599,1600,1610,1611,1613,1617,1618,1619,1620,1624,1628,],[13,14,16,17,231,231,365,374,375,386,387,388,389,390,391,392,231,-153,-154,-155,-156,-157,-158,-159,-160,-99,-97,231,-98,231,-302,-303,-304,-305,-306,231,-308,-321,-313,421,446,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,515,554,558,231,563,566,-102,-307,-322,575,-459,-460,-461,-462,-463,-464,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,579,-684,-685,580,-696,581,648,685,686,-392,-393,-394,688,689,-230,-231,231,697,699,732,741,743,753,762,581,-701,-702,-707,581,835,836,837,869,869,882,892,893,231,-222,-223,-228,896,898,907,908,909,910,911,914,915,918,919,743,924,925,926,927,743,743,-676,-677,-678,-683,944,753,-689,-690,-695,753,-686,-709,1002,1004,743,1020,1021,231,-100,1030,1039,1049,-318,1055,1059,1060,-106,-687,-699,-698,-710,743,1088,1089,1098,1109,-213,231,-215,-216,1120,1123,-194,-195,-161,1136,-319,1139,1140,1141,1144,1145,1155,1098,-386,1161,-432,-433,1162,-246,-247,-248,-249,-250,-251,1179,-316,-317,1182,1183,1225,231,1232,1236,1237,-252,-253,-254,1243,-214,-314,1282,1289,1290,1291,1292,1294,1296,1297,1301,1303,743,1313,-255,-256,-257,-258,1319,1320,-315,1328,1329,1368,1369,1370,1372,1373,231,231,-407,-408,1387,1388,-259,-260,-261,-262,1389,-443,1401,1406,1407,1420,1421,1422,1427,1432,1449,231,231,-623,-624,231,1462,-263,-264,-265,1480,231,1449,-626,-627,-628,231,231,-296,-243,-236,-237,-238,-239,1462,-232,-233,-234,-235,-240,-241,-242,-244,-245,1506,1515,231,-436,-437,-438,1519,1521,1523,1529,1530,1533,-295,231,1552,-229,1555,1556,231,-272,-273,-274,-275,-276,-277,1563,1564,1565,1566,-286,1567,-221,-457,-281,-278,-279,-280,-282,-283,-284,-285,1604,1610,1611,-271,1613,-292,743,1617,1618,1619,1622,1623,1624,-291,1626,-270,]),'PROJECT':([11,29,],[15,33,]),'IDENT':([15,28,41,75,76,77,78,79,80,81,82,83,84,85,87,88,89,111,112,113,114,117,118,140,208,218,222,223,224,225,226,227,228,229,230,231,232,233,234,235,239,240,241,242,243,244,245,246,247,248,336,337,338,362,396,397,403,404,405,409,412,413,421,422,423,424,425,426,427,428,429,430,431,432,511,512,513,516,558,575,576,592,593,594,595,596,597,601,602,603,641,643,645,646,652,653,654,693,694,695,696,698,780,781,785,786,790,791,795,796,800,801,805,806,811,812,816,817,821,822,854,865,896,897,922,925,926,940,991,992,995,1022,1023,1027,1028,1029,1037,1038,1040,1047,1048,1052,1111,1112,1113,1114,1115,1116,1137,1138,1154,1158,1164,1165,1166,1168,1180,1216,1239,1240,1241,1242,1248,1279,1284,1285,1308,1309,1310,1311,1315,1316,1317,1318,1320,1321,1322,1390,1392,1393,1394,1395,1396,1397,1398,1399,1409,1414,1415,1416,1418,1419,1424,1427,1428,1429,1430,1431,1433,1439,1443,1448,1449,1450,1451,1454,1459,1460,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1489,1493,1494,1495,1496,1516,1520,1521,1523,1525,1537,1538,1539,1540,1541,1542,1543,1549,1551,1553,1556,1559,1560,1561,1562,1563,1564,1565,1566,1588,1593,1594,1599,1620,1628,],[18,32,46,118,119,120,121,122,123,124,125,126,127,128,141,142,143,154,154,154,154,232,232,342,379,397,232,-153,-154,-155,-156,-157,-158,-159,-160,-99,-97,232,-98,397,232,-302,-303,-304,-305,-306,232,-308,-321,-313,509,512,513,550,559,232,-102,397,568,573,-307,-322,576,577,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,512,645,646,654,232,739,740,654,654,654,654,654,654,654,817,654,646,512,-896,646,654,-931,-730,232,-222,-223,-228,897,654,-725,654,-732,654,-738,654,-744,654,-750,654,-756,654,-775,817,-472,654,-781,646,1003,232,-100,-318,1053,1054,1061,1081,1082,1085,-213,397,232,-215,-216,-194,-195,-161,1134,1135,-319,-246,-247,-248,-249,-250,-251,-316,-317,232,1234,-252,-253,-254,-214,-314,1295,-255,-256,-257,-258,-315,1330,646,1366,232,232,-407,-408,-259,-260,-261,-262,1390,-443,646,1433,646,646,1439,-527,-528,-529,-530,-531,1443,1451,232,232,-623,-624,1454,232,1477,-263,-264,-265,1481,1485,232,1451,-626,-627,-628,232,232,-296,-243,-236,-237,-238,-239,1477,-232,-233,-234,-235,-240,-241,-242,-244,-245,397,232,-436,-437,-438,1531,-295,232,1551,-229,232,-272,-273,-274,-275,-276,-277,-286,1568,-221,-457,-281,-278,-279,-280,-282,-283,-284,-285,1603,1612,-271,-292,-291,-270,]),'STRING':([18,27,32,40,73,74,97,117,118,119,120,121,122,123,124,125,126,127,139,141,143,183,184,185,186,187,188,189,190,193,222,223,224,225,226,227,228,229,230,231,232,233,234,239,240,241,242,243,244,245,246,247,248,352,357,358,359,360,376,397,403,406,407,408,409,412,413,433,434,435,436,437,438,439,440,460,509,534,536,542,550,558,569,570,571,578,588,668,672,675,682,684,693,694,695,696,735,753,762,775,776,875,896,897,922,951,1022,1027,1028,1029,1037,1038,1040,1052,1056,1065,1091,1092,1117,1137,1138,1154,1168,1180,1209,1214,1224,1248,1308,1309,1310,1311,1321,1323,1324,1414,1415,1416,1418,1419,1427,1443,1448,1449,1450,1451,1454,1459,1460,1493,1494,1495,1496,1501,1520,1521,1522,1525,1537,1538,1539,1540,1541,1542,1543,1549,1553,1556,1559,1560,1561,1562,1563,1564,1565,1566,],[19,31,42,45,115,116,150,234,234,249,250,251,252,253,254,255,256,257,341,343,352,366,367,368,369,370,371,372,373,376,234,-153,-154,-155,-156,-157,-158,-159,-160,-99,-97,234,-98,234,-302,-303,-304,-305,-306,234,-308,-321,-313,519,530,150,150,545,552,234,-102,569,570,571,572,-307,-322,578,-653,-654,-655,-656,-657,-658,-659,600,641,150,150,150,687,234,733,734,735,742,765,530,-55,-57,-67,-69,234,-222,-223,-228,921,945,949,954,955,-68,234,-100,-318,1065,-213,234,-215,-216,-194,-195,-161,-319,1142,1065,-56,-58,1167,-316,-317,234,-214,-314,1288,1293,1300,-315,234,234,-407,-408,-443,1392,1393,1450,234,234,-623,-624,234,234,1450,-626,-627,-628,234,234,-296,234,-436,-437,-438,1522,-295,234,1550,-229,234,-272,-273,-274,-275,-276,-277,-286,-221,-457,-281,-278,-279,-280,-282,-283,-284,-285,]),'end':([19,21,22,23,24,25,26,30,31,34,35,36,37,38,39,42,44,45,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,86,91,92,93,115,116,117,118,128,130,131,132,133,134,135,136,137,138,142,144,146,147,148,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,194,195,196,197,198,199,200,201,202,203,204,205,206,207,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,236,237,238,239,240,241,242,243,244,246,248,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,340,341,342,345,346,347,348,349,350,351,353,364,365,366,367,368,369,370,371,372,373,374,375,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,397,402,403,411,412,413,423,424,425,426,427,428,429,430,431,432,446,448,449,450,451,452,453,454,455,456,457,458,459,462,463,464,465,466,467,468,469,470,471,472,474,489,490,491,510,511,514,516,518,551,552,553,558,560,561,562,564,565,566,567,572,574,579,580,582,583,584,585,586,587,589,590,591,592,593,594,595,596,597,599,600,601,602,603,605,606,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,685,690,691,692,693,694,695,696,701,702,703,704,705,706,707,709,710,711,712,713,714,715,716,717,718,719,720,721,722,737,742,743,744,745,746,747,748,749,750,751,754,755,756,757,758,759,760,761,764,765,766,768,769,770,771,772,773,774,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,838,839,840,841,843,844,845,846,848,849,850,851,852,853,856,857,858,859,860,861,862,863,877,878,879,880,881,895,896,897,899,900,902,906,907,908,909,910,911,912,913,914,915,916,917,918,920,921,922,924,929,930,931,932,933,934,935,936,937,941,943,944,945,947,948,949,950,953,954,955,957,959,961,963,965,967,969,971,973,974,975,976,977,978,979,980,981,985,986,987,988,989,990,997,998,999,1001,1003,1009,1011,1012,1022,1024,1025,1026,1027,1028,1029,1031,1032,1033,1034,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1052,1058,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1080,1081,1082,1083,1084,1085,1086,1087,1089,1094,1095,1096,1097,1098,1099,1101,1102,1103,1104,1105,1111,1112,1113,1114,1115,1116,1119,1120,1122,1123,1125,1126,1127,1128,1129,1130,1133,1134,1135,1136,1137,1138,1141,1142,1143,1145,1147,1148,1150,1151,1152,1153,1157,1160,1164,1165,1166,1168,1170,1171,1172,1173,1174,1175,1176,1177,1179,1180,1182,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1219,1220,1221,1222,1223,1226,1227,1229,1230,1231,1233,1234,1235,1239,1240,1241,1242,1246,1247,1248,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1283,1287,1288,1289,1290,1292,1294,1295,1297,1299,1300,1302,1304,1305,1306,1307,1312,1315,1316,1317,1318,1321,1327,1328,1330,1331,1332,1333,1334,1335,1337,1338,1339,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1357,1358,1359,1360,1361,1364,1365,1366,1367,1368,1369,1371,1375,1376,1377,1378,1379,1381,1382,1383,1384,1385,1386,1391,1393,1400,1401,1403,1405,1406,1407,1410,1411,1412,1413,1417,1420,1421,1422,1423,1426,1427,1428,1429,1430,1431,1435,1436,1437,1438,1440,1441,1442,1445,1446,1447,1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1462,1463,1464,1465,1466,1467,1468,1469,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1481,1482,1486,1487,1488,1490,1491,1492,1493,1494,1495,1496,1499,1505,1506,1507,1508,1509,1510,1511,1513,1514,1518,1520,1521,1525,1528,1529,1531,1532,1534,1535,1536,1537,1538,1539,1540,1541,1542,1543,1549,1552,1553,1554,1555,1556,1558,1559,1560,1561,1562,1563,1564,1565,1566,1568,1571,1572,1573,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1594,1596,1597,1598,1599,1602,1603,1604,1605,1606,1607,1608,1609,1612,1615,1616,1620,1622,1623,1625,1626,1628,],[-950,29,-116,-117,-114,-112,-113,-115,-950,43,-123,-124,-121,-119,-120,-950,-122,-125,-126,90,-149,-150,-147,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-118,-950,-148,145,-11,-950,-950,-950,-950,-950,339,-883,-884,-881,-876,-877,-878,-879,-880,-950,-127,-12,-9,-10,363,-349,-350,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,377,-371,-372,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,401,-211,-212,-209,-153,-154,-155,-156,-157,-158,-159,-160,-99,-97,-101,-98,410,-311,-312,-309,-302,-303,-304,-305,-306,-308,-313,-950,-950,473,-829,-830,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-882,-885,-886,517,-928,-929,-926,-924,-925,-936,-151,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-950,-210,-102,-310,-307,-322,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-950,598,-722,-723,-720,-712,-713,-714,-715,-716,-717,-718,-719,604,-771,-772,-769,-763,-764,-765,-766,-767,-768,-773,-828,-850,-851,-852,642,-894,-875,-950,-927,-330,-434,-358,-950,698,-103,-104,-950,-950,-950,-152,736,-301,-950,-950,763,-705,-706,-703,-701,-702,-707,-708,-950,-950,-950,-950,-950,-950,-950,-721,-761,-950,-950,-950,-770,-786,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-897,-895,-896,-107,-950,-950,855,-934,-935,-932,-931,-730,-923,-950,-946,-947,-950,894,-226,-227,-224,-222,-223,-228,901,-200,-201,-198,-196,-197,903,905,-174,-175,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,923,-950,-105,942,-681,-682,-679,-676,-677,-678,-683,946,-693,-694,-691,-689,-690,-695,-697,-704,-686,-709,952,-492,-493,-490,-487,-488,-489,956,-728,-729,-726,-725,958,-735,-736,-733,-732,960,-741,-742,-739,-738,962,-747,-748,-745,-744,964,-753,-754,-751,-750,966,-759,-760,-757,-756,-711,968,-778,-779,-776,-775,970,-475,-476,-473,-472,972,-784,-785,-782,-781,-762,-950,-893,-898,-108,994,-890,-891,-889,996,-913,-914,-911,-909,-910,-933,1000,-944,-945,-942,-939,-940,-941,1010,-383,-384,-381,-380,-225,-950,-100,-950,-950,-199,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-950,1050,1051,-318,-320,1057,-651,-652,-649,-644,-645,-646,-647,-648,-106,-680,-687,-699,-692,-698,-710,-700,-491,-494,-495,-727,-734,-740,-746,-752,-758,-777,-474,-783,-831,-89,-90,-91,-92,-838,-839,-840,1079,-903,-904,-901,-899,-900,-912,-922,-930,-943,-670,-950,-382,-950,-213,1118,-219,-220,-217,-215,-216,1121,-207,-208,-205,1124,-194,-195,-950,-161,1132,-327,-328,-325,-323,-324,-319,-650,-669,-675,-688,1146,-109,-486,-724,-731,-737,-743,-749,-755,-774,-471,-780,-841,-842,-843,-902,-905,-906,1149,-888,-950,-908,-938,-949,1156,-389,-390,-387,-386,-379,1159,-398,-399,-396,-395,-246,-247,-248,-249,-250,-251,-218,-950,-206,-204,1178,-190,-191,-188,-189,-192,-326,-465,-329,1181,-316,-317,-950,-950,-643,-668,-110,-887,1228,-919,-920,-917,-388,-397,-252,-253,-254,-214,1245,-448,-449,-446,-444,-445,-203,-202,-193,-314,-950,1286,-610,-611,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1298,-664,-665,-662,-661,-496,-892,-918,-916,-921,-385,-950,-391,-255,-256,-257,-258,-447,-187,-315,1326,-563,-564,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-950,-950,-609,-466,-631,-470,-672,-674,-485,-538,-663,-666,-915,1374,-405,-406,-403,-950,-259,-260,-261,-262,-443,-562,-477,-497,-532,-533,-534,-535,-536,1402,-582,-583,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,1404,-638,-639,-636,-633,-634,-635,-642,1408,-950,-588,-480,-673,-660,-404,-401,-409,-402,-410,1425,-416,-417,-414,-412,-413,1434,-950,-458,-478,-581,-637,-640,-641,1444,-621,-622,-619,-617,-537,-667,-948,-400,-415,-950,-950,-263,-264,-265,1483,1484,-483,-484,-566,-632,-671,-620,-614,-625,-629,-626,-627,-628,-615,-616,-950,-411,1498,-299,-300,-297,-296,-243,-236,-237,-238,-239,1504,-268,-269,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-950,-479,1516,-613,-630,1517,-441,-442,-439,-436,-437,-438,-298,-267,1526,1527,-454,-455,-452,-451,-481,-482,-440,-295,-950,-229,-453,-456,-618,-435,1557,-289,-290,-287,-272,-273,-274,-275,-276,-277,-286,1569,-221,-450,-950,-457,-288,-281,-278,-279,-280,-282,-283,-284,-285,-950,1601,-514,-515,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-271,1614,-293,-294,-292,-513,-516,-517,-518,-519,-520,-521,-522,-526,1621,-498,-291,-523,-524,-525,1627,-270,]),'HEADER':([20,43,],[27,71,]),'MODULE':([20,90,],[28,144,]),'VERSION':([31,37,38,39,45,46,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[40,40,-119,-120,-125,-126,40,40,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'PROJECT_NO':([31,37,38,39,45,46,],[41,41,-119,-120,-125,-126,]),'ADDR_EPK':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,182,182,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'EPK':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,183,183,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'SUPPLIER':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,184,184,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'CUSTOMER':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,185,185,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'CUSTOMER_NO':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,186,186,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'USER':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,187,187,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'PHONE_NO':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,188,188,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'ECU':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,189,189,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'CPU_TYPE':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,190,190,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'NO_OF_INTERFACES':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,191,191,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'ECU_CALIBRATION_OFFSET':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,192,192,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'SYSTEM_CONSTANT':([45,115,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,365,366,367,368,369,370,371,372,373,374,375,552,1099,1235,1455,],[-125,193,193,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'A2ML':([47,145,],[72,353,]),'MOD_PAR':([47,363,],[73,551,]),'MOD_COMMON':([47,377,],[74,553,]),'IF_DATA':([47,401,410,847,1100,1184,1228,1249,1336,1374,1380,1444,1517,],[75,567,574,995,1158,1285,1302,1158,1158,1423,1424,1487,1532,]),'CHARACTERISTIC':([47,1326,],[76,1400,]),'AXIS_PTS':([47,1402,],[77,1440,]),'MEASUREMENT':([47,1286,],[78,1367,]),'COMPU_METHOD':([47,1057,],[79,1143,]),'COMPU_TAB':([47,942,],[80,1062,]),'COMPU_VTAB':([47,946,],[81,1063,]),'COMPU_VTAB_RANGE':([47,763,],[82,950,]),'FUNCTION':([47,598,],[83,807,]),'GROUP':([47,604,],[84,823,]),'RECORD_LAYOUT':([47,473,],[85,606,]),'VARIANT_CODING':([47,339,],[86,514,]),'FRAME':([47,996,],[87,1086,]),'USER_RIGHTS':([47,517,],[88,655,]),'UNIT':([47,1000,],[89,1087,]),'block':([72,93,147,148,358,359,534,536,542,672,675,682,684,875,1091,1092,],[97,97,-9,-10,97,97,97,97,97,-55,-57,-67,-69,-68,-56,-58,]),'char':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[103,103,-9,-10,103,-70,103,103,103,103,103,-41,103,]),'int':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[104,104,-9,-10,104,-70,104,104,104,104,104,-41,104,]),'long':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[105,105,-9,-10,105,-70,105,105,105,105,105,-41,105,]),'uchar':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[106,106,-9,-10,106,-70,106,106,106,106,106,-41,106,]),'uint':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[107,107,-9,-10,107,-70,107,107,107,107,107,-41,107,]),'ulong':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[108,108,-9,-10,108,-70,108,108,108,108,108,-41,108,]),'double':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[109,109,-9,-10,109,-70,109,109,109,109,109,-41,109,]),'float':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[110,110,-9,-10,110,-70,110,110,110,110,110,-41,110,]),'struct':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[111,111,-9,-10,111,-70,111,111,111,111,111,-41,111,]),'enum':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[112,112,-9,-10,112,-70,112,112,112,112,112,-41,112,]),'taggedstruct':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[113,113,-9,-10,113,-70,113,113,113,113,113,-41,113,]),'taggedunion':([72,93,147,148,149,150,355,356,525,538,543,666,677,],[114,114,-9,-10,114,-70,114,114,114,114,114,-41,114,]),'XCP':([75,1285,1424,],[117,117,117,]),'VAR_SEPARATOR':([86,133,134,135,136,137,138,341,342,839,1084,1148,],[139,139,-876,-877,-878,-879,-880,-885,-886,-893,-888,-887,]),'VAR_NAMING':([86,133,134,135,136,137,138,341,342,839,1084,1148,],[140,140,-876,-877,-878,-879,-880,-885,-886,-893,-888,-887,]),'SEMICOLON':([94,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,150,152,154,156,158,160,354,521,526,535,537,538,543,544,660,661,662,664,667,670,676,678,679,680,683,867,1005,1006,1007,1090,1093,],[147,148,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-70,-36,-71,-30,-50,-62,-27,-950,666,672,675,-950,682,684,-42,-45,-46,-35,-29,-49,-59,-44,-43,-61,875,-28,-47,1091,1092,-48,-60,]),'PARENTHESE_CLOSE':([98,99,100,101,102,103,104,105,106,107,108,109,110,150,152,154,156,158,160,354,520,521,538,660,661,662,664,667,670,673,674,676,678,679,680,867,874,1005,1090,1093,],[-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-70,-36,-71,-30,-50,-62,-27,659,-950,-950,-42,-45,-46,-35,-29,-49,872,873,-59,-44,-43,-61,-28,1008,-47,-48,-60,]),'BRACE_OPEN':([98,99,100,101,102,103,104,105,106,107,108,109,110,152,154,156,158,160,521,664,667,670,680,1005,],[-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-36,-71,-30,-50,-62,663,-35,-29,-49,-61,663,]),'CURLY_OPEN':([111,112,113,114,151,152,153,154,155,156,157,158,159,160,],[-950,-950,-950,-950,356,-73,-72,-71,357,-73,358,-73,359,-73,]),'S_REC_LAYOUT':([116,197,198,199,200,201,202,203,204,205,206,207,379,380,381,382,383,384,385,386,387,388,389,390,391,392,],[208,208,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,]),'DEPOSIT':([116,197,198,199,200,201,202,203,204,205,206,207,351,379,380,381,382,383,384,385,386,387,388,389,390,391,392,1066,1074,1134,1278,1282,1288,1295,1297,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1401,1423,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1622,1623,1625,],[209,209,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,-936,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-486,-471,-465,-937,209,-466,-485,-538,-532,-533,-534,-535,-536,209,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-478,-400,209,209,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'BYTE_ORDER':([116,197,198,199,200,201,202,203,204,205,206,207,351,379,380,381,382,383,384,385,386,387,388,389,390,391,392,567,1066,1074,1134,1141,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1289,1290,1292,1294,1295,1297,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1368,1369,1401,1420,1423,1441,1442,1482,1487,1513,1514,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1616,1622,1623,1625,],[210,210,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,-936,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-152,-486,-471,-465,210,210,210,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,210,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,210,-466,-631,-470,-672,-674,-485,-538,-477,-497,-532,-533,-534,-535,-536,210,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,210,210,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-498,-523,-524,-525,]),'DATA_SIZE':([116,197,198,199,200,201,202,203,204,205,206,207,379,380,381,382,383,384,385,386,387,388,389,390,391,392,],[211,211,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,]),'ALIGNMENT_BYTE':([116,128,197,198,199,200,201,202,203,204,205,206,207,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[212,212,212,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,212,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_WORD':([116,128,197,198,199,200,201,202,203,204,205,206,207,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[213,213,213,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,213,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_LONG':([116,128,197,198,199,200,201,202,203,204,205,206,207,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[214,214,214,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,214,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_INT64':([116,128,197,198,199,200,201,202,203,204,205,206,207,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[215,215,215,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,215,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_FLOAT32_IEEE':([116,128,197,198,199,200,201,202,203,204,205,206,207,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[216,216,216,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,216,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_FLOAT64_IEEE':([116,128,197,198,199,200,201,202,203,204,205,206,207,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[217,217,217,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,217,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'TP_BLOB':([118,231,232,233,234,239,240,241,242,243,244,246,248,403,412,413,897,922,1052,1137,1138,1180,1248,],[247,-99,-97,-101,-98,247,-302,-303,-304,-305,-306,-308,-313,-102,-307,-322,-100,-318,-319,-316,-317,-314,-315,]),'FNC_VALUES':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[302,302,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'IDENTIFICATION':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[303,303,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_PTS_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[304,304,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_PTS_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[305,305,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_PTS_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[306,306,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_RESCALE_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[307,307,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_RESCALE_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[308,308,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_RESCALE_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[309,309,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_AXIS_PTS_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[310,310,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_AXIS_PTS_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[311,311,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_AXIS_PTS_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[312,312,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_RESCALE_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[313,313,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_RESCALE_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[314,314,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_RESCALE_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[315,315,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'FIX_NO_AXIS_PTS_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[316,316,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'FIX_NO_AXIS_PTS_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[317,317,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'FIX_NO_AXIS_PTS_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[318,318,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SRC_ADDR_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[319,319,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SRC_ADDR_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[320,320,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SRC_ADDR_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[321,321,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RIP_ADDR_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[322,322,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RIP_ADDR_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[323,323,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RIP_ADDR_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[324,324,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RIP_ADDR_W':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[325,325,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SHIFT_OP_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[326,326,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SHIFT_OP_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[327,327,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SHIFT_OP_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[328,328,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'OFFSET_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[329,329,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'OFFSET_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[330,330,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'OFFSET_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[331,331,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'DIST_OP_X':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[332,332,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'DIST_OP_Y':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[333,333,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'DIST_OP_Z':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,974,975,976,977,978,979,980,981,1076,1077,1078,],[334,334,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RESERVED':([128,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,687,974,975,976,977,978,979,980,981,1076,1077,1078,],[335,335,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,889,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'VAR_CRITERION':([129,1079,],[336,1148,]),'VAR_FORBIDDEN_COMB':([129,642,],[337,839,]),'VAR_CHARACTERISTIC':([129,994,],[338,1084,]),'READ_ONLY':([142,348,349,350,351,380,381,382,383,384,385,999,1066,1074,1134,1182,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1290,1295,1297,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1368,1369,1401,1420,1423,1482,1513,1514,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1616,1622,1623,1625,],[351,351,-924,-925,-936,-585,-586,-587,-467,-468,-469,-930,-486,-471,-465,351,351,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,351,-466,-470,-485,-538,-477,-497,-532,-533,-534,-535,-536,351,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-537,-400,-479,-481,-482,351,351,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-498,-523,-524,-525,]),'PARENTHESE_OPEN':([149,150,358,534,538,672,675,1091,1092,],[355,-70,536,536,677,-55,-57,-56,-58,]),'CALIBRATION_METHOD':([161,1010,],[360,1099,]),'MEMORY_LAYOUT':([161,1159,],[361,1235,]),'MEMORY_SEGMENT':([161,1425,],[362,1455,]),'ABSOLUTE':([209,],[381,]),'DIFFERENCE':([209,],[382,]),'MSB_FIRST':([210,],[384,]),'MSB_LAST':([210,],[385,]),'PROTOCOL_LAYER':([218,1498,],[393,1520,]),'DAQ':([218,1504,1544,1567,],[394,1525,1560,1560,]),'PAG':([218,894,],[395,1022,]),'PGM':([218,1118,],[396,1168,]),'SEGMENT':([218,1245,1489,],[398,1321,398,]),'DAQ_EVENT':([218,901,903,],[399,1037,1038,]),'XCP_ON_CAN':([218,905,],[400,1040,]),'FREEZE_SUPPORTED':([231,232,233,234,403,558,693,694,695,696,897,],[-99,-97,-101,-98,-102,696,696,-222,-223,-228,-100,]),'DP_BLOB':([231,232,233,234,403,897,1234,1307,1366,1376,1377,1378,1379,1413,1417,1446,1447,1448,1449,1450,1451,1452,1453,1488,1531,],[-99,-97,-101,-98,-102,-100,1310,1310,1310,-401,-409,-402,-410,1310,-617,-614,-625,-629,-626,-627,-628,-615,-616,-630,-618,]),'BA_BLOB':([231,232,233,234,403,897,1234,1307,1376,1377,1378,1379,],[-99,-97,-101,-98,-102,-100,1311,1311,-401,-409,-402,-410,]),'KP_BLOB':([231,232,233,234,403,897,1366,1377,1379,1413,1417,1446,1447,1448,1449,1450,1451,1452,1453,1488,1531,],[-99,-97,-101,-98,-102,-100,1418,-409,-410,1418,-617,-614,-625,-629,-626,-627,-628,-615,-616,-630,-618,]),'PA_BLOB':([231,232,233,234,403,897,1366,1377,1379,1413,1417,1446,1447,1448,1449,1450,1451,1452,1453,1488,1531,],[-99,-97,-101,-98,-102,-100,1419,-409,-410,1419,-617,-614,-625,-629,-626,-627,-628,-615,-616,-630,-618,]),'DAQ_LIST_TYPE':([231,232,233,234,403,897,1521,1537,1538,1539,1540,1541,1542,1543,1549,1559,1560,1561,1562,1563,1564,1565,1566,],[-99,-97,-101,-98,-102,-100,1544,1544,-272,-273,-274,-275,-276,-277,-286,-281,-278,-279,-280,-282,-283,-284,-285,]),'MAX_ODT':([231,232,233,234,403,897,1521,1537,1538,1539,1540,1541,1542,1543,1549,1559,1560,1561,1562,1563,1564,1565,1566,],[-99,-97,-101,-98,-102,-100,1545,1545,-272,-273,-274,-275,-276,-277,-286,-281,-278,-279,-280,-282,-283,-284,-285,]),'MAX_ODT_ENTRIES':([231,232,233,234,403,897,1521,1537,1538,1539,1540,1541,1542,1543,1549,1559,1560,1561,1562,1563,1564,1565,1566,],[-99,-97,-101,-98,-102,-100,1546,1546,-272,-273,-274,-275,-276,-277,-286,-281,-278,-279,-280,-282,-283,-284,-285,]),'FIRST_PID':([231,232,233,234,403,897,1521,1537,1538,1539,1540,1541,1542,1543,1549,1559,1560,1561,1562,1563,1564,1565,1566,],[-99,-97,-101,-98,-102,-100,1547,1547,-272,-273,-274,-275,-276,-277,-286,-281,-278,-279,-280,-282,-283,-284,-285,]),'EVENT_FIXED':([231,232,233,234,403,897,1521,1537,1538,1539,1540,1541,1542,1543,1549,1559,1560,1561,1562,1563,1564,1565,1566,],[-99,-97,-101,-98,-102,-100,1548,1548,-272,-273,-274,-275,-276,-277,-286,-281,-278,-279,-280,-282,-283,-284,-285,]),'QP_BLOB':([231,232,234,897,918,1044,1045,1046,1085,1134,1135,1153,1230,1231,],[-99,-97,-98,-100,1048,1048,-323,-324,1154,-465,-329,1154,-916,-921,]),'ADDRESS_MAPPING':([231,232,234,897,1321,1454,1493,1494,1495,1496,1556,],[-99,-97,-98,-100,-443,1497,1497,-436,-437,-438,-457,]),'SOURCE':([235,1132,],[405,1180,]),'RASTER':([235,1181,],[406,1248,]),'EVENT_GROUP':([235,1050,],[407,1137,]),'SEED_KEY':([235,1051,],[408,1138,]),'CHECKSUM':([235,736,923,1169,],[409,922,1052,409,]),'VALUE':([249,],[415,]),'CURVE':([249,],[416,]),'MAP':([249,],[417,]),'CUBOID':([249,],[418,]),'VAL_BLK':([249,],[419,]),'ASCII':([249,],[420,]),'UBYTE':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,]),'SBYTE':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,]),'UWORD':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,]),'SWORD':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,]),'ULONG':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,]),'SLONG':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,]),'A_UINT64':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,]),'A_INT64':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,]),'FLOAT32_IEEE':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,]),'FLOAT64_IEEE':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,]),'TAB_INTP':([252,253,],[434,442,]),'TAB_NOINTP':([252,253,],[435,443,]),'TAB_VERB':([252,254,],[436,445,]),'RAT_FUNC':([252,],[437,]),'FORM':([252,],[438,]),'IDENTICAL':([252,],[439,]),'LINEAR':([252,],[440,]),'FUNCTION_VERSION':([256,451,452,453,454,455,456,457,458,459,600,1066,1067,1068,1069,1070,1071,1072,],[460,460,-712,-713,-714,-715,-716,-717,-718,-719,-761,-486,-724,-731,-737,-743,-749,-755,]),'ROOT':([257,465,466,467,468,469,470,471,472,1066,1068,1073,1074,1075,],[472,472,-763,-764,-765,-766,-767,-768,-773,-486,-731,-774,-471,-780,]),'REF_GROUP':([344,855,],[516,999,]),'DISPLAY_IDENTIFIER':([351,380,381,382,383,384,385,567,918,1044,1045,1046,1066,1074,1134,1135,1141,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1289,1290,1292,1294,1295,1297,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1368,1369,1401,1420,1423,1441,1442,1482,1487,1513,1514,1616,],[-936,-585,-586,-587,-467,-468,-469,-152,1047,1047,-323,-324,-486,-471,-465,-329,1047,1047,1047,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1047,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1047,-466,-631,-470,-672,-674,-485,-538,-477,-497,-532,-533,-534,-535,-536,1047,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'FORMAT':([351,380,381,382,383,384,385,567,1066,1074,1134,1141,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1289,1290,1292,1294,1295,1297,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1368,1369,1401,1420,1423,1441,1442,1482,1487,1513,1514,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1616,1622,1623,1625,],[-936,-585,-586,-587,-467,-468,-469,-152,-486,-471,-465,1209,1209,1209,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1209,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1209,-466,-631,-470,-672,-674,-485,-538,-477,-497,-532,-533,-534,-535,-536,1209,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,1209,1209,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-498,-523,-524,-525,]),'BIT_MASK':([351,383,384,385,567,1066,1074,1134,1141,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1288,1289,1290,1292,1294,1295,1297,1328,1330,1331,1332,1333,1334,1335,1368,1369,1401,1420,1423,1441,1442,1482,1487,1513,1514,1616,],[-936,-467,-468,-469,-152,-486,-471,-465,1211,1211,1211,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1211,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-466,-631,-470,-672,-674,-485,-538,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'NUMBER':([351,383,384,385,1066,1074,1134,1182,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1288,1290,1295,1297,1328,1330,1331,1332,1333,1334,1335,1368,1369,1401,1420,1423,1482,1513,1514,1616,],[-936,-467,-468,-469,-486,-471,-465,1276,1276,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-466,-470,-485,-538,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-479,-481,-482,-498,]),'SYMBOL_LINK':([351,383,384,385,567,1066,1074,1134,1141,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1288,1289,1290,1292,1294,1295,1297,1328,1330,1331,1332,1333,1334,1335,1368,1369,1401,1420,1423,1441,1442,1482,1487,1513,1514,1616,],[-936,-467,-468,-469,-152,-486,-471,-465,1214,1214,1214,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1214,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-466,-631,-470,-672,-674,-485,-538,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'EXTENDED_LIMITS':([351,380,381,382,383,384,385,1066,1074,1134,1182,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1290,1295,1297,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1368,1369,1401,1420,1423,1482,1513,1514,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1616,1622,1623,1625,],[-936,-585,-586,-587,-467,-468,-469,-486,-471,-465,1277,1277,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1277,-466,-470,-485,-538,-477,-497,-532,-533,-534,-535,-536,1277,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-537,-400,-479,-481,-482,1277,1277,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-498,-523,-524,-525,]),'GUARD_RAILS':([351,380,381,382,383,384,385,1066,1074,1134,1182,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1290,1295,1297,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1368,1369,1401,1420,1423,1482,1513,1514,1616,],[-936,-585,-586,-587,-467,-468,-469,-486,-471,-465,1278,1278,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1278,-466,-470,-485,-538,-477,-497,-532,-533,-534,-535,-536,1278,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-537,-400,-479,-481,-482,-498,]),'MAX_REFRESH':([351,383,384,385,567,1066,1074,1134,1141,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1288,1289,1290,1292,1294,1295,1297,1328,1330,1331,1332,1333,1334,1335,1368,1369,1401,1420,1423,1441,1442,1482,1487,1513,1514,1616,],[-936,-467,-468,-469,-152,-486,-471,-465,1212,1212,1212,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1212,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-466,-631,-470,-672,-674,-485,-538,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'REF_MEMORY_SEGMENT':([351,380,381,382,383,384,385,567,1066,1074,1134,1141,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1289,1290,1292,1294,1295,1297,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1368,1369,1401,1420,1423,1441,1442,1482,1487,1513,1514,1616,],[-936,-585,-586,-587,-467,-468,-469,-152,-486,-471,-465,1216,1216,1216,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1216,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1216,-466,-631,-470,-672,-674,-485,-538,-477,-497,-532,-533,-534,-535,-536,1216,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'COMPARISON_QUANTITY':([351,383,384,385,1066,1074,1134,1182,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1288,1290,1295,1297,1328,1330,1331,1332,1333,1334,1335,1368,1369,1401,1420,1423,1482,1513,1514,1616,],[-936,-467,-468,-469,-486,-471,-465,1279,1279,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-466,-470,-485,-538,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-479,-481,-482,-498,]),'CALIBRATION_ACCESS':([351,380,381,382,383,384,385,1066,1074,1134,1182,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1290,1295,1297,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1368,1369,1401,1420,1423,1482,1513,1514,1616,],[-936,-585,-586,-587,-467,-468,-469,-486,-471,-465,1281,1281,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1281,-466,-470,-485,-538,-477,-497,-532,-533,-534,-535,-536,1281,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-537,-400,-479,-481,-482,-498,]),'MATRIX_DIM':([351,383,384,385,567,1066,1074,1134,1141,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1288,1289,1290,1292,1294,1295,1297,1328,1330,1331,1332,1333,1334,1335,1368,1369,1401,1420,1423,1441,1442,1482,1487,1513,1514,1616,],[-936,-467,-468,-469,-152,-486,-471,-465,1217,1217,1217,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1217,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-466,-631,-470,-672,-674,-485,-538,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'ECU_ADDRESS_EXTENSION':([351,380,381,382,383,384,385,567,1066,1074,1134,1141,1182,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1278,1280,1282,1288,1289,1290,1292,1294,1295,1297,1328,1330,1331,1332,1333,1334,1335,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1368,1369,1401,1420,1423,1441,1442,1482,1487,1513,1514,1616,],[-936,-585,-586,-587,-467,-468,-469,-152,-486,-471,-465,1218,1218,1218,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1218,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1218,-466,-631,-470,-672,-674,-485,-538,-477,-497,-532,-533,-534,-535,-536,1218,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'AXIS_PTS_REF':([351,380,381,382,383,384,385,1066,1288,1401,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1622,1623,1625,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1588,1588,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'MAX_GRAD':([351,380,381,382,383,384,385,1066,1288,1401,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1622,1623,1625,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1589,1589,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'MONOTONY':([351,380,381,382,383,384,385,1066,1288,1401,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1622,1623,1625,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1590,1590,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'FIX_AXIS_PAR':([351,380,381,382,383,384,385,1066,1288,1401,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1622,1623,1625,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1591,1591,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'FIX_AXIS_PAR_DIST':([351,380,381,382,383,384,385,1066,1288,1401,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1622,1623,1625,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1592,1592,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'CURVE_AXIS_REF':([351,380,381,382,383,384,385,1066,1288,1401,1555,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1603,1604,1605,1606,1607,1608,1609,1612,1622,1623,1625,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1593,1593,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'CURLY_CLOSE':([356,358,359,522,523,524,525,527,528,529,530,531,532,533,534,539,540,541,542,665,666,671,672,675,681,682,684,869,870,871,875,1091,1092,],[-950,-950,-950,664,-37,-38,-39,667,-31,-34,-74,670,-51,-52,-53,680,-65,-66,-63,-40,-41,-54,-55,-57,-64,-67,-69,-75,-32,-33,-68,-56,-58,]),'PRG_CODE':([361,],[547,]),'PRG_DATA':([361,],[548,]),'PRG_RESERVED':([361,],[549,]),'READ_WRITE':([383,384,385,567,1066,1074,1134,1141,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1288,1289,1290,1292,1294,1295,1297,1368,1369,1420,1441,1442,1487,],[-467,-468,-469,-152,-486,-471,-465,1208,1208,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-466,-631,-470,-672,-674,-485,-538,-480,-673,-537,-632,-671,-613,]),'ARRAY_SIZE':([383,384,385,567,1066,1074,1134,1141,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1288,1289,1290,1292,1294,1295,1297,1368,1369,1420,1441,1442,1487,],[-467,-468,-469,-152,-486,-471,-465,1210,1210,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-466,-631,-470,-672,-674,-485,-538,-480,-673,-537,-632,-671,-613,]),'ECU_ADDRESS':([383,384,385,567,1066,1074,1134,1141,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1288,1289,1290,1292,1294,1295,1297,1368,1369,1420,1441,1442,1487,],[-467,-468,-469,-152,-486,-471,-465,1213,1213,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-466,-631,-470,-672,-674,-485,-538,-480,-673,-537,-632,-671,-613,]),'ERROR_MASK':([383,384,385,567,1066,1074,1134,1141,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1288,1289,1290,1292,1294,1295,1297,1368,1369,1420,1441,1442,1487,],[-467,-468,-469,-152,-486,-471,-465,1215,1215,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-466,-631,-470,-672,-674,-485,-538,-480,-673,-537,-632,-671,-613,]),'STATIC':([394,],[556,]),'DYNAMIC':([394,],[557,]),'FIXED_EVENT_LIST':([399,],[564,]),'VARIABLE':([399,1039,],[565,1130,]),'COLUMN_DIR':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,825,]),'ROW_DIR':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,826,]),'ALTERNATE_WITH_X':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,827,]),'ALTERNATE_WITH_Y':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,828,]),'ALTERNATE_CURVES':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,829,]),'INDEX_INCR':([423,424,425,426,427,428,429,430,431,432,609,610,611,835,836,837,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,831,831,831,831,831,831,]),'INDEX_DECR':([423,424,425,426,427,428,429,430,431,432,609,610,611,835,836,837,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,832,832,832,832,832,832,]),'DEFAULT_VALUE':([446,579,580,585,586,587,589,590,743,747,748,749,750,751,757,758,759,760,761,765,766,941,944,945,948,949,],[588,588,588,588,-701,-702,-707,-708,-105,588,-676,-677,-678,-683,588,-689,-690,-695,-697,-686,-709,-106,-687,-699,-698,-710,]),'ANNOTATION':([447,461,952,1184,1249,1336,1570,],[591,591,1066,591,591,591,591,]),'DEF_CHARACTERISTIC':([447,956,],[592,1067,]),'REF_CHARACTERISTIC':([447,461,958,],[593,593,1068,]),'IN_MEASUREMENT':([447,960,],[594,1069,]),'OUT_MEASUREMENT':([447,962,],[595,1070,]),'LOC_MEASUREMENT':([447,964,],[596,1071,]),'SUB_FUNCTION':([447,966,],[597,1072,]),'REF_MEASUREMENT':([461,968,],[601,1073,]),'FUNCTION_LIST':([461,970,1184,1249,1336,],[602,1074,602,602,602,]),'SUB_GROUP':([461,972,],[603,1075,]),'BYTE':([508,],[638,]),'WORD':([508,],[639,]),'LONG':([508,],[640,]),'EXTENDED_SI':([519,],[657,]),'DERIVED':([519,],[658,]),'COMMA':([528,529,530,869,871,],[668,-34,-74,-75,-33,]),'EQUAL':([529,530,],[669,-74,]),'CAN_ID_BROADCAST':([566,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,1247,],[723,723,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'CAN_ID_MASTER':([566,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,1247,],[724,724,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'CAN_ID_SLAVE':([566,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,1247,],[725,725,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'BAUDRATE':([566,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,1247,],[726,726,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'SAMPLE_POINT':([566,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,1247,],[727,727,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'SAMPLE_RATE':([566,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,1247,],[728,728,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'BTL_CYCLES':([566,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,1247,],[729,729,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'SJW':([566,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,1247,],[730,730,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'SYNC_EDGE':([566,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,1247,],[731,731,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'MAX_BLOCK_SIZE':([573,],[738,]),'DEFAULT_VALUE_NUMERIC':([579,743,747,748,749,750,751,765,941,944,],[752,-105,752,-676,-677,-678,-683,-686,-106,-687,]),'ANNOTATION_LABEL':([591,771,772,773,774,954,955,1226,],[775,775,-487,-488,-489,-494,-495,-496,]),'ANNOTATION_ORIGIN':([591,771,772,773,774,954,955,1226,],[776,776,-487,-488,-489,-494,-495,-496,]),'VAR_MEASUREMENT':([646,838,841,988,989,990,1081,1082,],[-107,991,-108,991,-899,-900,-905,-906,]),'VAR_SELECTION_CHARACTERISTIC':([646,838,841,988,989,990,1081,1082,],[-107,992,-108,992,-899,-900,-905,-906,]),'FRAME_MEASUREMENT':([646,648,841,851,852,853,998,1302,],[-107,854,-108,854,-909,-910,-922,-915,]),'SI_EXPONENTS':([656,657,658,860,861,862,863,1003,1089,1422,],[864,-946,-947,864,-939,-940,-941,-670,-949,-948,]),'REF_UNIT':([656,657,658,742,860,861,862,863,932,933,934,935,936,937,1003,1061,1089,1145,1371,1421,1422,],[865,-946,-947,865,865,-939,-940,-941,865,-644,-645,-646,-647,-648,-670,-669,-949,-668,-660,-667,-948,]),'UNIT_CONVERSION':([656,657,658,860,861,862,863,1003,1089,1422,],[866,-946,-947,866,-939,-940,-941,-670,-949,-948,]),'ASTERISK':([659,872,873,1008,],[867,1006,1007,1093,]),'CODE':([687,],[884,]),'DATA':([687,],[885,]),'OFFLINE_DATA':([687,],[886,]),'VARIABLES':([687,],[887,]),'SERAM':([687,],[888,]),'CALIBRATION_VARIABLES':([687,],[890,]),'EXCLUDE_FROM_FLASH':([687,],[891,]),'AVAILABLE_EVENT_LIST':([700,1121,],[899,1176,]),'DEFAULT_EVENT_LIST':([700,1124,],[900,1177,]),'DAQ_LIST_CAN_ID':([708,1178,],[904,1247,]),'SINGLE':([728,731,],[912,916,]),'TRIPLE':([728,],[913,]),'DUAL':([731,],[917,]),'COEFFS':([742,932,933,934,935,936,937,1003,1061,1145,1371,1421,],[938,938,-644,-645,-646,-647,-648,-670,-669,-668,-660,-667,]),'COEFFS_LINEAR':([742,932,933,934,935,936,937,1003,1061,1145,1371,1421,],[939,939,-644,-645,-646,-647,-648,-670,-669,-668,-660,-667,]),'COMPU_TAB_REF':([742,932,933,934,935,936,937,1003,1061,1145,1371,1421,],[940,940,-644,-645,-646,-647,-648,-670,-669,-668,-660,-667,]),'ANNOTATION_TEXT':([767,1146,],[951,1226,]),'PBYTE':([824,825,826,827,828,829,830,831,832,833,834,982,983,984,],[975,-832,-833,-834,-835,-836,975,-93,-94,975,975,975,975,975,]),'PWORD':([824,825,826,827,828,829,830,831,832,833,834,982,983,984,],[976,-832,-833,-834,-835,-836,976,-93,-94,976,976,976,976,976,]),'PLONG':([824,825,826,827,828,829,830,831,832,833,834,982,983,984,],[977,-832,-833,-834,-835,-836,977,-93,-94,977,977,977,977,977,]),'DIRECT':([824,825,826,827,828,829,830,831,832,833,834,982,983,984,],[978,-832,-833,-834,-835,-836,978,-93,-94,978,978,978,978,978,]),'VAR_ADDRESS':([842,1149,],[993,1227,]),'BRACE_CLOSE':([868,869,],[1005,-75,]),'CALIBRATION_HANDLE':([876,1156,],[1009,1233,]),'RAM':([883,884,885,886,887,888,889,890,891,],[1014,-418,-419,-420,-421,-422,-423,-424,-425,]),'EEPROM':([883,884,885,886,887,888,889,890,891,],[1015,-418,-419,-420,-421,-422,-423,-424,-425,]),'EPROM':([883,884,885,886,887,888,889,890,891,],[1016,-418,-419,-420,-421,-422,-423,-424,-425,]),'ROM':([883,884,885,886,887,888,889,890,891,],[1017,-418,-419,-420,-421,-422,-423,-424,-425,]),'REGISTER':([883,884,885,886,887,888,889,890,891,],[1018,-418,-419,-420,-421,-422,-423,-424,-425,]),'FLASH':([883,884,885,886,887,888,889,890,891,],[1019,-418,-419,-420,-421,-422,-423,-424,-425,]),'EVENT':([899,900,1034,1123,1461,1627,],[1035,1035,1035,-204,1501,1628,]),'FORMULA':([928,1298,],[1056,1371,]),'INTERN':([1013,1014,1015,1016,1017,1018,1019,],[1107,-426,-427,-428,-429,-430,-431,]),'EXTERN':([1013,1014,1015,1016,1017,1018,1019,],[1108,-426,-427,-428,-429,-430,-431,]),'OPTIMISATION_TYPE_DEFAULT':([1021,1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[1111,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1111,-263,-264,-265,-243,-236,-237,-238,-239,1111,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_ODT_TYPE_16':([1021,1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[1112,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1112,-263,-264,-265,-243,-236,-237,-238,-239,1112,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_ODT_TYPE_32':([1021,1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[1113,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1113,-263,-264,-265,-243,-236,-237,-238,-239,1113,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_ODT_TYPE_64':([1021,1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[1114,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1114,-263,-264,-265,-243,-236,-237,-238,-239,1114,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT':([1021,1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[1115,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1115,-263,-264,-265,-243,-236,-237,-238,-239,1115,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_MAX_ENTRY_SIZE':([1021,1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[1116,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1116,-263,-264,-265,-243,-236,-237,-238,-239,1116,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'SECTOR':([1023,1526,],[1117,1553,]),'FIXED':([1039,],[1131,]),'ADDRESS_EXTENSION_FREE':([1110,1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[1164,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1164,-263,-264,-265,-243,-236,-237,-238,-239,1164,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'ADDRESS_EXTENSION_ODT':([1110,1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[1165,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1165,-263,-264,-265,-243,-236,-237,-238,-239,1165,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'ADDRESS_EXTENSION_DAQ':([1110,1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[1166,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1166,-263,-264,-265,-243,-236,-237,-238,-239,1166,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'IDENTIFICATION_FIELD_TYPE_ABSOLUTE':([1111,1112,1113,1114,1115,1116,1163,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,1239,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1239,-263,-264,-265,-243,-236,-237,-238,-239,1239,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE':([1111,1112,1113,1114,1115,1116,1163,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,1240,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1240,-263,-264,-265,-243,-236,-237,-238,-239,1240,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD':([1111,1112,1113,1114,1115,1116,1163,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,1241,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1241,-263,-264,-265,-243,-236,-237,-238,-239,1241,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED':([1111,1112,1113,1114,1115,1116,1163,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,1242,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1242,-263,-264,-265,-243,-236,-237,-238,-239,1242,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE':([1111,1112,1113,1114,1115,1116,1164,1165,1166,1238,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,1315,-255,-256,-257,-258,-259,-260,-261,-262,1315,-263,-264,-265,-243,-236,-237,-238,-239,1315,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD':([1111,1112,1113,1114,1115,1116,1164,1165,1166,1238,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,1316,-255,-256,-257,-258,-259,-260,-261,-262,1316,-263,-264,-265,-243,-236,-237,-238,-239,1316,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD':([1111,1112,1113,1114,1115,1116,1164,1165,1166,1238,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,1317,-255,-256,-257,-258,-259,-260,-261,-262,1317,-263,-264,-265,-243,-236,-237,-238,-239,1317,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG':([1111,1112,1113,1114,1115,1116,1164,1165,1166,1238,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,1318,-255,-256,-257,-258,-259,-260,-261,-262,1318,-263,-264,-265,-243,-236,-237,-238,-239,1318,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'PRESCALER_SUPPORTED':([1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1478,-263,-264,-265,-243,-236,-237,-238,-239,1478,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'RESUME_SUPPORTED':([1111,1112,1113,1114,1115,1116,1164,1165,1166,1239,1240,1241,1242,1315,1316,1317,1318,1428,1429,1430,1431,1462,1463,1464,1465,1466,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1594,1599,1620,1628,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1479,-263,-264,-265,-243,-236,-237,-238,-239,1479,-232,-233,-234,-235,-240,-241,-242,-244,-245,-271,-292,-291,-270,]),'FORMULA_INV':([1142,1222,1223,1300,],[1224,1224,-661,-666,]),'PAGE':([1169,1527,],[1244,1554,]),'BIT_OPERATION':([1184,1404,],[1283,1441,]),'VIRTUAL':([1184,1408,],[1284,1442,]),'MAP_LIST':([1249,1434,],[1322,1482,]),'DEPENDENT_CHARACTERISTIC':([1249,1483,],[1323,1513,]),'VIRTUAL_CHARACTERISTIC':([1249,1484,],[1324,1514,]),'AXIS_DESCR':([1249,1601,],[1325,1616,]),'CALIBRATION':([1281,],[1332,]),'NO_CALIBRATION':([1281,],[1333,]),'NOT_IN_MCD_SYSTEM':([1281,],[1334,]),'OFFLINE_CALIBRATION':([1281,],[1335,]),'LEFT_SHIFT':([1283,1358,1359,1360,1361,1364,1406,1407,],[1362,1362,-633,-634,-635,-642,-640,-641,]),'RIGHT_SHIFT':([1283,1358,1359,1360,1361,1364,1406,1407,],[1363,1363,-633,-634,-635,-642,-640,-641,]),'SIGN_EXTEND':([1283,1358,1359,1360,1361,1364,1406,1407,],[1364,1364,-633,-634,-635,-642,-640,-641,]),'STD_AXIS':([1325,],[1395,]),'FIX_AXIS':([1325,],[1396,]),'COM_AXIS':([1325,],[1397,]),'RES_AXIS':([1325,],[1398,]),'CURVE_AXIS':([1325,],[1399,]),'NO_OVERLOAD_INDICATION':([1388,],[1429,]),'OVERLOAD_INDICATION_PID':([1388,],[1430,]),'OVERLOAD_INDICATION_EVENT':([1388,],[1431,]),'DAQ_LIST':([1461,1557,],[1500,1594,]),'TIMESTAMP_SUPPORTED':([1461,1614,],[1502,1620,]),'STIM':([1461,1544,1567,1569,],[1503,1561,1561,1599,]),'INIT_SEGMENT':([1481,1510,1511,1529,],[1512,1512,-451,-456,]),'GRANULARITY_ODT_ENTRY_SIZE_STIM_BYTE':([1503,],[1524,]),'DAQ_STIM':([1544,1567,],[1562,1562,]),'TIMESTAMP_FIXED':([1568,],[1598,]),'FIX_AXIS_PAR_LIST':([1570,1621,],[1600,1625,]),'MON_INCREASE':([1590,],[1606,]),'MON_DECREASE':([1590,],[1607,]),'STRICT_INCREASE':([1590,],[1608,]),'STRICT_DECREASE':([1590,],[1609,]),}
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,12,16,17,33,],[-950,0,-1,-7,-8,-5,-2,-3,-4,-6,-95,-96,-111,]),'ASAP2_VERSION':([0,4,5,6,7,8,12,16,17,33,],[9,9,-5,-2,-3,-4,-6,-95,-96,-111,]),'A2ML_VERSION':([0,4,5,6,7,8,12,16,17,33,],[10,10,-5,-2,-3,-4,-6,-95,-96,-111,]),'begin':([0,4,5,6,7,8,12,16,17,19,23,24,25,26,30,33,42,45,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,86,91,115,117,118,132,133,134,135,136,137,138,142,144,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,221,222,223,224,225,226,227,228,229,230,231,232,233,234,238,239,240,241,242,243,244,245,246,247,248,256,257,340,341,342,347,348,349,350,351,353,364,365,366,367,368,369,370,371,372,373,374,375,380,381,382,383,384,385,397,402,403,411,412,413,450,451,452,453,454,455,456,457,458,459,464,465,466,467,468,469,470,471,472,514,518,551,552,553,558,562,564,565,566,567,574,591,599,600,605,606,646,647,648,655,685,692,693,694,695,696,703,704,705,706,711,712,713,714,715,716,717,718,719,720,721,722,742,743,770,771,772,773,774,807,823,839,842,850,851,852,853,880,881,882,896,897,898,903,907,908,909,910,911,912,913,914,915,916,917,918,923,932,933,934,935,936,937,938,944,951,954,955,956,998,999,1000,1004,1013,1014,1024,1028,1029,1030,1031,1039,1040,1042,1054,1060,1063,1064,1065,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1086,1088,1089,1101,1105,1106,1107,1113,1114,1115,1116,1117,1118,1121,1122,1136,1139,1140,1143,1145,1147,1150,1156,1162,1166,1167,1168,1170,1174,1175,1176,1177,1178,1179,1182,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1228,1235,1237,1241,1242,1243,1244,1248,1249,1250,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1289,1290,1291,1292,1294,1296,1297,1299,1304,1310,1311,1312,1313,1314,1317,1318,1319,1320,1323,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1368,1369,1370,1371,1373,1379,1381,1385,1386,1387,1388,1402,1403,1405,1414,1415,1417,1418,1419,1421,1422,1423,1425,1428,1429,1430,1431,1432,1433,1442,1443,1444,1445,1447,1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1460,1461,1462,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1484,1488,1489,1490,1494,1495,1496,1497,1498,1501,1507,1515,1516,1520,1522,1523,1527,1533,1534,1538,1539,1540,1541,1542,1543,1544,1545,1551,1555,1556,1557,1558,1560,1561,1562,1563,1564,1565,1566,1567,1568,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1596,1601,1604,1605,1606,1607,1608,1609,1610,1611,1614,1618,1622,1624,1625,1627,1630,],[11,11,-5,-2,-3,-4,-6,-95,-96,20,20,-114,-112,-113,-115,-111,47,-125,47,-147,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-118,129,-148,161,218,235,129,-881,-876,-877,-878,-879,-880,344,-127,161,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,218,-209,-153,-154,-155,-156,-157,-158,-159,404,-99,-97,-101,-98,235,-309,-302,-303,-304,-305,-306,404,-308,-321,404,447,461,-882,-885,-886,344,-926,-924,-925,-936,-151,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-585,-586,-587,-467,-468,-469,404,-210,-102,-310,-307,404,447,-720,-712,-713,-714,-715,-716,-717,-718,-719,461,-769,-763,-764,-765,-766,-767,-768,-773,-875,-927,-330,-434,-358,404,404,700,700,708,-152,-301,767,-721,-761,-770,-786,-107,841,847,-923,877,404,-224,-222,404,-228,700,-198,-196,-197,708,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,929,-105,767,-490,-487,-488,-489,-711,-762,-893,-108,847,-911,-909,-910,877,-381,-380,-225,1025,-100,-199,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-318,929,-649,-644,-645,-646,-647,-648,-106,-700,-491,-494,-495,-912,-922,-930,-670,-382,1102,-213,1025,-217,-215,404,-194,-195,-161,-319,-650,-669,-675,-688,-486,-724,-731,-737,-743,-749,-755,-774,-471,-780,-888,-908,-938,-379,1102,-396,-395,-246,-247,-248,-249,-250,-251,-218,1171,-465,-316,-317,1186,-643,-668,-887,404,-397,-252,-253,-254,-214,1171,-446,-444,-445,-203,-202,-314,1251,1186,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-496,-385,-391,-255,-256,-257,-258,-447,-187,-315,1251,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1338,-609,-466,-631,-470,-672,-674,-485,-538,-915,404,404,-407,-408,1382,-259,-260,-261,-262,-443,-562,-477,-497,-532,-533,-534,-535,-536,1338,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,1411,-588,-480,-673,-660,404,404,1382,-414,-412,-413,-458,-478,-581,1411,-619,404,404,-617,-624,-537,-667,-400,-415,404,1463,-263,-264,-265,-566,-632,-671,404,-620,-614,-625,-629,-626,-627,-628,-615,-616,1491,-411,404,-297,404,-243,-236,-237,-238,-239,1463,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-479,404,-613,-630,1491,-439,-436,-437,-438,-298,-267,-481,-482,-440,-295,404,-229,-618,-435,404,-287,-272,-273,-274,-275,-276,-277,404,-221,-450,1572,-457,-288,-281,-278,-279,-280,-282,-283,-284,-285,1572,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-271,-292,-513,-516,-517,-518,-519,-520,-521,-522,-526,-498,-291,-523,-524,-525,-270,]),'NUMERIC':([9,10,13,14,117,118,182,191,192,211,212,213,214,215,216,217,221,222,223,224,225,226,227,228,229,230,231,232,233,234,238,239,240,241,242,243,244,245,246,247,248,250,255,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,343,393,395,397,398,400,402,403,411,412,413,414,415,416,417,418,419,420,423,424,425,426,427,428,429,430,431,432,441,442,443,444,445,446,515,545,546,547,548,549,554,555,556,557,558,559,562,563,568,577,579,580,581,584,585,586,587,589,590,612,613,614,663,669,686,688,689,692,693,694,695,696,697,699,723,724,725,726,727,729,730,732,733,734,738,739,740,741,743,746,747,748,749,750,751,752,756,757,758,759,760,761,764,765,766,864,866,868,883,893,894,896,897,898,899,905,920,921,923,928,939,940,943,944,945,946,948,949,950,994,1003,1005,1011,1014,1022,1024,1028,1029,1030,1031,1032,1037,1039,1040,1042,1051,1054,1055,1056,1057,1061,1062,1085,1090,1098,1099,1100,1108,1109,1110,1111,1113,1114,1115,1116,1117,1118,1121,1133,1139,1140,1141,1142,1146,1156,1157,1159,1163,1164,1166,1167,1168,1169,1170,1182,1185,1212,1213,1214,1215,1217,1219,1220,1227,1234,1238,1239,1241,1242,1243,1244,1245,1246,1250,1278,1279,1293,1295,1298,1303,1305,1310,1311,1312,1313,1314,1315,1316,1317,1318,1319,1320,1321,1323,1331,1364,1365,1372,1374,1375,1379,1381,1389,1391,1416,1417,1418,1420,1421,1429,1430,1431,1432,1433,1434,1445,1449,1450,1451,1452,1453,1456,1460,1461,1462,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1482,1487,1488,1490,1494,1495,1496,1497,1498,1499,1501,1502,1504,1507,1514,1517,1520,1521,1522,1523,1526,1527,1532,1535,1538,1539,1540,1541,1542,1543,1544,1545,1547,1548,1549,1550,1551,1552,1555,1558,1560,1561,1562,1563,1564,1565,1566,1567,1568,1591,1593,1594,1596,1597,1601,1602,1612,1613,1615,1617,1619,1620,1621,1622,1626,1630,],[13,14,16,17,231,231,365,374,375,386,387,388,389,390,391,392,231,-209,-153,-154,-155,-156,-157,-158,-159,231,-99,-97,-101,-98,231,-309,-302,-303,-304,-305,-306,231,-308,-321,231,421,446,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,515,554,558,231,563,566,-210,-102,-310,-307,231,575,-459,-460,-461,-462,-463,-464,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,579,-684,-685,580,-696,581,648,685,686,-392,-393,-394,688,689,-230,-231,231,697,231,699,732,741,743,753,762,581,-703,-701,-702,581,-708,835,836,837,870,870,883,893,894,231,-224,-222,231,-228,897,899,908,909,910,911,912,915,916,919,920,743,925,926,927,928,-105,743,-679,-676,-677,-678,944,945,753,-691,-689,-690,753,-697,-704,-686,-709,1003,1005,870,743,1022,1023,-225,231,-100,1032,1041,1051,944,-318,1057,1061,1062,-680,-106,-687,-699,-692,-698,-710,743,1090,1091,1100,944,1111,-213,231,-217,-215,231,1122,1125,-194,-195,-161,1138,-319,1141,1142,1143,1146,1147,944,1157,1100,-387,-386,1163,-432,-433,1164,-246,-247,-248,-249,-250,-251,-218,1181,-316,-317,1184,1185,1227,231,1234,-388,1238,1239,-252,-253,-254,1245,-214,-314,1284,1291,1292,1293,1294,1296,1298,1299,1303,1305,743,1315,-255,-256,-257,-258,1321,1322,-315,1330,1331,1370,1371,1372,1374,1375,231,231,-407,-408,944,1389,1390,-259,-260,-261,-262,1391,-443,1403,1408,1409,1422,1423,1424,231,231,1429,1434,1451,231,231,-623,-624,231,1464,-263,-264,-265,1482,231,1451,-629,-626,-627,-628,231,231,-297,231,-243,-236,-237,-238,-239,1464,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,1508,1517,231,-630,231,-439,-436,-437,-438,1521,-298,1523,1525,-267,1531,1532,-440,1535,-295,231,1554,-229,1557,1558,231,-287,-272,-273,-274,-275,-276,-277,1565,1566,1567,1568,231,1569,-221,-457,-288,-281,-278,-279,-280,-282,-283,-284,-285,1606,1612,1613,-271,1615,-292,743,1619,1620,1621,944,1624,1625,1626,-291,1628,-270,]),'PROJECT':([11,29,],[15,33,]),'IDENT':([15,28,41,75,76,77,78,79,80,81,82,83,84,85,87,88,89,111,112,113,114,117,118,140,208,218,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,238,239,240,241,242,243,244,245,246,247,248,336,337,338,362,396,397,402,403,404,405,409,411,412,413,421,422,423,424,425,426,427,428,429,430,431,432,511,512,513,516,558,562,575,576,592,593,594,595,596,597,601,602,603,641,643,644,645,646,647,651,652,653,654,692,693,694,695,696,698,779,780,781,784,785,786,789,790,791,794,795,796,799,800,801,804,805,806,810,811,812,815,816,817,820,821,822,838,840,842,854,856,865,896,897,898,923,926,927,941,958,960,962,964,966,968,970,972,974,992,993,996,999,1024,1025,1028,1029,1030,1031,1039,1040,1042,1049,1050,1054,1113,1114,1115,1116,1117,1118,1121,1139,1140,1156,1160,1166,1167,1168,1170,1182,1218,1241,1242,1243,1244,1250,1281,1286,1287,1310,1311,1312,1313,1317,1318,1319,1320,1322,1323,1324,1367,1379,1381,1392,1393,1394,1395,1396,1397,1398,1399,1400,1401,1411,1416,1417,1418,1420,1421,1426,1429,1430,1431,1432,1433,1435,1437,1440,1441,1445,1449,1450,1451,1452,1453,1456,1460,1461,1462,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1488,1490,1491,1494,1495,1496,1497,1498,1501,1507,1518,1520,1522,1523,1525,1527,1538,1539,1540,1541,1542,1543,1544,1545,1551,1553,1555,1558,1560,1561,1562,1563,1564,1565,1566,1567,1568,1590,1595,1596,1601,1622,1630,],[18,32,46,118,119,120,121,122,123,124,125,126,127,128,141,142,143,154,154,154,154,232,232,342,379,397,232,-209,-153,-154,-155,-156,-157,-158,-159,232,-99,-97,-101,-98,397,232,-309,-302,-303,-304,-305,-306,232,-308,-321,232,509,512,513,550,559,232,-210,-102,397,568,573,-310,-307,232,576,577,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,512,645,646,654,232,232,739,740,654,654,654,654,654,654,654,817,654,646,-897,512,-896,-107,842,654,-932,-931,-730,232,-224,-222,232,-228,898,654,-726,-725,654,-733,-732,654,-739,-738,654,-745,-744,654,-751,-750,654,-757,-756,654,-776,-775,817,-473,-472,654,-782,-781,842,-898,-108,646,-933,1004,-225,232,-100,-318,1055,1056,1063,-727,-734,-740,-746,-752,-758,-777,-474,-783,1083,1084,1087,842,-213,397,232,-217,-215,232,-194,-195,-161,1136,1137,-319,-246,-247,-248,-249,-250,-251,-218,-316,-317,232,1236,-252,-253,-254,-214,-314,1297,-255,-256,-257,-258,-315,1332,646,1368,232,232,-407,-408,-259,-260,-261,-262,1392,-443,646,842,232,232,1435,842,646,646,1441,-527,-528,-529,-530,-531,1445,1453,232,232,-623,-624,1456,232,1479,-263,-264,-265,1483,842,842,1487,232,1453,-629,-626,-627,-628,232,232,-297,232,-243,-236,-237,-238,-239,1479,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,232,-630,397,232,-439,-436,-437,-438,-298,-267,1533,-440,-295,232,1553,-229,232,-287,-272,-273,-274,-275,-276,-277,232,1570,-221,-457,-288,-281,-278,-279,-280,-282,-283,-284,-285,1605,1614,-271,-292,-291,-270,]),'STRING':([18,27,32,40,73,74,97,117,118,119,120,121,122,123,124,125,126,127,139,141,143,183,184,185,186,187,188,189,190,193,221,222,223,224,225,226,227,228,229,230,231,232,233,234,238,239,240,241,242,243,244,245,246,247,248,352,357,358,359,360,376,397,402,403,406,407,408,409,411,412,413,433,434,435,436,437,438,439,440,460,509,533,534,536,541,542,550,558,562,569,570,571,578,588,668,671,672,675,681,682,684,692,693,694,695,696,735,753,762,775,776,876,896,897,898,923,952,1024,1028,1029,1030,1031,1039,1040,1042,1054,1058,1066,1067,1093,1094,1119,1121,1139,1140,1149,1156,1170,1182,1211,1216,1226,1250,1310,1311,1312,1313,1323,1325,1326,1379,1381,1416,1417,1418,1420,1421,1429,1445,1449,1450,1451,1452,1453,1456,1460,1461,1462,1488,1490,1494,1495,1496,1497,1498,1501,1503,1520,1522,1523,1524,1527,1538,1539,1540,1541,1542,1543,1544,1545,1551,1555,1558,1560,1561,1562,1563,1564,1565,1566,1567,1568,],[19,31,42,45,115,116,150,234,234,249,250,251,252,253,254,255,256,257,341,343,352,366,367,368,369,370,371,372,373,376,234,-209,-153,-154,-155,-156,-157,-158,-159,234,-99,-97,-101,-98,234,-309,-302,-303,-304,-305,-306,234,-308,-321,234,519,530,150,150,545,552,234,-210,-102,569,570,571,572,-310,-307,234,578,-653,-654,-655,-656,-657,-658,-659,600,641,150,-53,150,150,-63,687,234,234,733,734,735,742,765,530,-54,-55,-57,-64,-67,-69,234,-224,-222,234,-228,922,946,950,955,956,-68,-225,234,-100,-318,1067,-213,234,-217,-215,234,-194,-195,-161,-319,1144,1149,-109,-56,-58,1169,-218,-316,-317,-110,234,-214,-314,1290,1295,1302,-315,234,234,-407,-408,-443,1394,1395,234,234,1452,234,234,-623,-624,234,234,1452,-629,-626,-627,-628,234,234,-297,234,234,-630,234,-439,-436,-437,-438,-298,1524,-440,-295,234,1552,-229,234,-287,-272,-273,-274,-275,-276,-277,234,-221,-457,-288,-281,-278,-279,-280,-282,-283,-284,-285,]),'end':([19,21,22,23,24,25,26,30,31,34,35,36,37,38,39,42,44,45,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,86,91,92,93,115,116,117,118,128,130,131,132,133,134,135,136,137,138,142,144,146,147,148,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,194,195,196,197,198,199,200,201,202,203,204,205,206,207,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,236,237,238,239,240,241,242,243,244,246,248,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,340,341,342,345,346,347,348,349,350,351,353,364,365,366,367,368,369,370,371,372,373,374,375,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,397,402,403,411,412,413,423,424,425,426,427,428,429,430,431,432,446,448,449,450,451,452,453,454,455,456,457,458,459,462,463,464,465,466,467,468,469,470,471,472,474,489,490,491,510,511,514,516,518,551,552,553,558,560,561,562,564,565,566,567,572,574,579,580,582,583,584,585,586,587,589,590,591,592,593,594,595,596,597,599,600,601,602,603,605,606,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,685,690,691,692,693,694,695,696,701,702,703,704,705,706,707,709,710,711,712,713,714,715,716,717,718,719,720,721,722,737,742,743,744,745,746,747,748,749,750,751,754,755,756,757,758,759,760,761,764,765,766,768,769,770,771,772,773,774,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,838,839,840,842,843,844,845,846,848,849,850,851,852,853,856,857,858,859,860,861,862,863,878,879,880,881,882,896,897,898,900,901,903,907,908,909,910,911,912,913,914,915,916,917,918,919,921,922,923,925,930,931,932,933,934,935,936,937,938,943,944,945,946,948,949,950,951,954,955,956,958,960,962,964,966,968,970,972,974,975,976,977,978,979,980,981,982,986,987,988,989,990,991,998,999,1000,1002,1004,1011,1013,1014,1024,1026,1027,1028,1029,1030,1031,1033,1034,1035,1036,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1054,1060,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1082,1083,1084,1085,1086,1087,1088,1089,1091,1096,1097,1098,1099,1100,1101,1103,1104,1105,1106,1107,1113,1114,1115,1116,1117,1118,1121,1122,1124,1125,1127,1128,1129,1130,1131,1132,1135,1136,1137,1138,1139,1140,1143,1144,1145,1147,1149,1150,1152,1153,1154,1155,1159,1162,1166,1167,1168,1170,1172,1173,1174,1175,1176,1177,1178,1179,1181,1182,1184,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1221,1222,1223,1224,1225,1228,1229,1231,1232,1233,1235,1236,1237,1241,1242,1243,1244,1248,1249,1250,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1285,1289,1290,1291,1292,1294,1296,1297,1299,1301,1302,1304,1306,1307,1308,1309,1314,1317,1318,1319,1320,1323,1329,1330,1332,1333,1334,1335,1336,1337,1339,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1357,1358,1359,1360,1361,1362,1363,1366,1367,1368,1369,1370,1371,1373,1377,1378,1379,1380,1381,1383,1384,1385,1386,1387,1388,1393,1395,1402,1403,1405,1407,1408,1409,1412,1413,1414,1415,1419,1422,1423,1424,1425,1428,1429,1430,1431,1432,1433,1437,1438,1439,1440,1442,1443,1444,1447,1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1464,1465,1466,1467,1468,1469,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1483,1484,1488,1489,1490,1492,1493,1494,1495,1496,1497,1498,1501,1507,1508,1509,1510,1511,1512,1513,1515,1516,1520,1522,1523,1527,1530,1531,1533,1534,1536,1537,1538,1539,1540,1541,1542,1543,1544,1545,1551,1554,1555,1556,1557,1558,1560,1561,1562,1563,1564,1565,1566,1567,1568,1570,1573,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1596,1598,1599,1600,1601,1604,1605,1606,1607,1608,1609,1610,1611,1614,1617,1618,1622,1624,1625,1627,1628,1630,],[-950,29,-116,-117,-114,-112,-113,-115,-950,43,-123,-124,-121,-119,-120,-950,-122,-125,-126,90,-149,-150,-147,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-118,-950,-148,145,-11,-950,-950,-950,-950,-950,339,-883,-884,-881,-876,-877,-878,-879,-880,-950,-127,-12,-9,-10,363,-349,-350,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,377,-371,-372,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,401,-211,-212,-209,-153,-154,-155,-156,-157,-158,-159,-160,-99,-97,-101,-98,410,-311,-312,-309,-302,-303,-304,-305,-306,-308,-313,-950,-950,473,-829,-830,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-882,-885,-886,517,-928,-929,-926,-924,-925,-936,-151,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-950,-210,-102,-310,-307,-322,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-950,598,-722,-723,-720,-712,-713,-714,-715,-716,-717,-718,-719,604,-771,-772,-769,-763,-764,-765,-766,-767,-768,-773,-828,-850,-851,-852,642,-894,-875,-950,-927,-330,-434,-358,-950,698,-103,-104,-950,-950,-950,-152,736,-301,-950,-950,763,-705,-706,-703,-701,-702,-707,-708,-950,-950,-950,-950,-950,-950,-950,-721,-761,-950,-950,-950,-770,-786,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-897,-895,-896,-107,-950,-950,855,-934,-935,-932,-931,-730,-923,-950,-946,-947,-950,895,-226,-227,-224,-222,-223,-228,902,-200,-201,-198,-196,-197,904,906,-174,-175,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,924,-950,-105,942,-681,-682,-679,-676,-677,-678,-683,947,-693,-694,-691,-689,-690,-695,-697,-704,-686,-709,953,-492,-493,-490,-487,-488,-489,957,-728,-729,-726,-725,959,-735,-736,-733,-732,961,-741,-742,-739,-738,963,-747,-748,-745,-744,965,-753,-754,-751,-750,967,-759,-760,-757,-756,-711,969,-778,-779,-776,-775,971,-475,-476,-473,-472,973,-784,-785,-782,-781,-762,-950,-893,-898,-108,995,-890,-891,-889,997,-913,-914,-911,-909,-910,-933,1001,-944,-945,-942,-939,-940,-941,1012,-383,-384,-381,-380,-225,-950,-100,-950,-950,-199,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-950,1052,1053,-318,-320,1059,-651,-652,-649,-644,-645,-646,-647,-648,-680,-106,-687,-699,-692,-698,-710,-700,-491,-494,-495,-727,-734,-740,-746,-752,-758,-777,-474,-783,-831,-89,-90,-91,-92,-838,-839,-840,1081,-903,-904,-901,-899,-900,-912,-922,-930,-943,-670,-950,-382,-950,-213,1120,-219,-220,-217,-215,-216,1123,-207,-208,-205,1126,-194,-195,-950,-161,1134,-327,-328,-325,-323,-324,-319,-650,-669,-675,-688,1148,-109,-486,-724,-731,-737,-743,-749,-755,-774,-471,-780,-841,-842,-843,-902,-905,-906,1151,-888,-950,-908,-938,-949,1158,-389,-390,-387,-386,-379,1161,-398,-399,-396,-395,-246,-247,-248,-249,-250,-251,-218,-950,-206,-204,1180,-190,-191,-188,-189,-192,-326,-465,-329,1183,-316,-317,-950,-950,-643,-668,-110,-887,1230,-919,-920,-917,-388,-397,-252,-253,-254,-214,1247,-448,-449,-446,-444,-445,-203,-202,-193,-314,-950,1288,-610,-611,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1300,-664,-665,-662,-661,-496,-892,-918,-916,-921,-385,-950,-391,-255,-256,-257,-258,-447,-187,-315,1328,-563,-564,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-950,-950,-609,-466,-631,-470,-672,-674,-485,-538,-663,-666,-915,1376,-405,-406,-403,-950,-259,-260,-261,-262,-443,-562,-477,-497,-532,-533,-534,-535,-536,1404,-582,-583,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,1406,-638,-639,-636,-633,-634,-635,-642,1410,-950,-588,-480,-673,-660,-404,-401,-409,-402,-410,1427,-416,-417,-414,-412,-413,1436,-950,-458,-478,-581,-637,-640,-641,1446,-621,-622,-619,-617,-537,-667,-948,-400,-415,-950,-950,-263,-264,-265,1485,1486,-483,-484,-566,-632,-671,-620,-614,-625,-629,-626,-627,-628,-615,-616,-950,-411,1500,-299,-300,-297,-296,-243,-236,-237,-238,-239,1506,-268,-269,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-950,-479,1518,-613,-630,1519,-441,-442,-439,-436,-437,-438,-298,-267,1528,1529,-454,-455,-452,-451,-481,-482,-440,-295,-950,-229,-453,-456,-618,-435,1559,-289,-290,-287,-272,-273,-274,-275,-276,-277,-286,1571,-221,-450,-950,-457,-288,-281,-278,-279,-280,-282,-283,-284,-285,-950,1603,-514,-515,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-271,1616,-293,-294,-292,-513,-516,-517,-518,-519,-520,-521,-522,-526,1623,-498,-291,-523,-524,-525,1629,-270,]),'HEADER':([20,43,],[27,71,]),'MODULE':([20,90,],[28,144,]),'VERSION':([31,36,37,38,39,44,45,46,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[40,40,-121,-119,-120,-122,-125,-126,40,40,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'PROJECT_NO':([31,36,37,38,39,44,45,46,],[41,41,-121,-119,-120,-122,-125,-126,]),'ADDR_EPK':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,182,182,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'EPK':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,183,183,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'SUPPLIER':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,184,184,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'CUSTOMER':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,185,185,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'CUSTOMER_NO':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,186,186,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'USER':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,187,187,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'PHONE_NO':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,188,188,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'ECU':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,189,189,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'CPU_TYPE':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,190,190,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'NO_OF_INTERFACES':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,191,191,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'ECU_CALIBRATION_OFFSET':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,192,192,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'SYSTEM_CONSTANT':([45,115,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,364,365,366,367,368,369,370,371,372,373,374,375,552,1101,1237,1457,],[-125,193,193,-347,-331,-332,-333,-334,-335,-336,-337,-338,-339,-340,-341,-342,-343,-344,-345,-346,-348,-351,-352,-353,-354,-355,-356,-357,-375,-376,-377,-378,-434,-379,-391,-411,]),'A2ML':([47,145,],[72,353,]),'MOD_PAR':([47,363,],[73,551,]),'MOD_COMMON':([47,377,],[74,553,]),'IF_DATA':([47,401,410,847,1102,1186,1230,1251,1338,1376,1382,1446,1519,],[75,567,574,996,1160,1287,1304,1160,1160,1425,1426,1489,1534,]),'CHARACTERISTIC':([47,1328,],[76,1402,]),'AXIS_PTS':([47,1404,],[77,1442,]),'MEASUREMENT':([47,1288,],[78,1369,]),'COMPU_METHOD':([47,1059,],[79,1145,]),'COMPU_TAB':([47,942,],[80,1064,]),'COMPU_VTAB':([47,947,],[81,1065,]),'COMPU_VTAB_RANGE':([47,763,],[82,951,]),'FUNCTION':([47,598,],[83,807,]),'GROUP':([47,604,],[84,823,]),'RECORD_LAYOUT':([47,473,],[85,606,]),'VARIANT_CODING':([47,339,],[86,514,]),'FRAME':([47,997,],[87,1088,]),'USER_RIGHTS':([47,517,],[88,655,]),'UNIT':([47,1001,],[89,1089,]),'block':([72,92,93,146,147,148,358,359,533,534,536,541,542,671,672,675,681,682,684,876,1093,1094,],[97,97,-11,-12,-9,-10,97,97,97,-53,97,97,-63,-54,-55,-57,-64,-67,-69,-68,-56,-58,]),'char':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[103,103,-11,-12,-9,-10,103,-70,103,103,103,-39,103,103,-40,-41,103,]),'int':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[104,104,-11,-12,-9,-10,104,-70,104,104,104,-39,104,104,-40,-41,104,]),'long':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[105,105,-11,-12,-9,-10,105,-70,105,105,105,-39,105,105,-40,-41,105,]),'uchar':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[106,106,-11,-12,-9,-10,106,-70,106,106,106,-39,106,106,-40,-41,106,]),'uint':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[107,107,-11,-12,-9,-10,107,-70,107,107,107,-39,107,107,-40,-41,107,]),'ulong':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[108,108,-11,-12,-9,-10,108,-70,108,108,108,-39,108,108,-40,-41,108,]),'double':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[109,109,-11,-12,-9,-10,109,-70,109,109,109,-39,109,109,-40,-41,109,]),'float':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[110,110,-11,-12,-9,-10,110,-70,110,110,110,-39,110,110,-40,-41,110,]),'struct':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[111,111,-11,-12,-9,-10,111,-70,111,111,111,-39,111,111,-40,-41,111,]),'enum':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[112,112,-11,-12,-9,-10,112,-70,112,112,112,-39,112,112,-40,-41,112,]),'taggedstruct':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[113,113,-11,-12,-9,-10,113,-70,113,113,113,-39,113,113,-40,-41,113,]),'taggedunion':([72,92,93,146,147,148,149,150,355,356,524,525,538,543,665,666,677,],[114,114,-11,-12,-9,-10,114,-70,114,114,114,-39,114,114,-40,-41,114,]),'XCP':([75,1287,1426,],[117,117,117,]),'VAR_SEPARATOR':([86,132,133,134,135,136,137,138,340,341,342,839,1086,1150,],[139,139,-881,-876,-877,-878,-879,-880,-882,-885,-886,-893,-888,-887,]),'VAR_NAMING':([86,132,133,134,135,136,137,138,340,341,342,839,1086,1150,],[140,140,-881,-876,-877,-878,-879,-880,-882,-885,-886,-893,-888,-887,]),'SEMICOLON':([94,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,150,152,154,156,158,160,354,521,526,535,537,538,543,544,660,661,662,664,667,670,676,678,679,680,683,867,1007,1008,1009,1092,1095,],[147,148,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-70,-36,-71,-30,-50,-62,-27,-950,666,672,675,-950,682,684,-42,-45,-46,-35,-29,-49,-59,-44,-43,-61,876,-28,-47,1093,1094,-48,-60,]),'PARENTHESE_CLOSE':([98,99,100,101,102,103,104,105,106,107,108,109,110,150,152,154,156,158,160,354,520,521,538,660,661,662,664,667,670,673,674,676,678,679,680,867,875,1007,1092,1095,],[-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-70,-36,-71,-30,-50,-62,-27,659,-950,-950,-42,-45,-46,-35,-29,-49,873,874,-59,-44,-43,-61,-28,1010,-47,-48,-60,]),'BRACE_OPEN':([98,99,100,101,102,103,104,105,106,107,108,109,110,152,154,156,158,160,521,662,664,667,670,680,1007,1092,],[-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-36,-71,-30,-50,-62,663,868,-35,-29,-49,-61,-47,-48,]),'CURLY_OPEN':([111,112,113,114,151,152,153,154,155,156,157,158,159,160,],[-950,-950,-950,-950,356,-73,-72,-71,357,-73,358,-73,359,-73,]),'S_REC_LAYOUT':([116,196,197,198,199,200,201,202,203,204,205,206,207,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,],[208,208,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,]),'DEPOSIT':([116,196,197,198,199,200,201,202,203,204,205,206,207,351,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,1068,1076,1136,1280,1284,1290,1297,1299,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1403,1405,1425,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1624,1625,1627,],[209,209,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,-936,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-486,-471,-465,-937,209,-466,-485,-538,-532,-533,-534,-535,-536,209,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-478,-581,-400,209,209,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'BYTE_ORDER':([116,196,197,198,199,200,201,202,203,204,205,206,207,351,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,567,1068,1076,1136,1143,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1289,1290,1291,1292,1294,1296,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1370,1371,1403,1405,1422,1425,1443,1444,1484,1489,1515,1516,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1618,1624,1625,1627,],[210,210,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,-936,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-152,-486,-471,-465,210,210,210,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,210,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,210,-609,-466,-631,-470,-672,-674,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,210,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-581,-537,-400,-632,-671,-479,-613,-481,-482,210,210,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-498,-523,-524,-525,]),'DATA_SIZE':([116,196,197,198,199,200,201,202,203,204,205,206,207,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,],[211,211,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,]),'ALIGNMENT_BYTE':([116,128,196,197,198,199,200,201,202,203,204,205,206,207,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[212,212,212,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,212,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_WORD':([116,128,196,197,198,199,200,201,202,203,204,205,206,207,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[213,213,213,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,213,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_LONG':([116,128,196,197,198,199,200,201,202,203,204,205,206,207,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[214,214,214,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,214,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_INT64':([116,128,196,197,198,199,200,201,202,203,204,205,206,207,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[215,215,215,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,215,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_FLOAT32_IEEE':([116,128,196,197,198,199,200,201,202,203,204,205,206,207,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[216,216,216,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,216,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'ALIGNMENT_FLOAT64_IEEE':([116,128,196,197,198,199,200,201,202,203,204,205,206,207,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[217,217,217,-369,-359,-360,-361,-362,-363,-364,-365,-366,-367,-368,217,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-370,-373,-585,-586,-587,-467,-468,-469,-374,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'TP_BLOB':([118,231,232,233,234,238,239,240,241,242,243,244,246,248,403,411,412,413,898,923,1054,1139,1140,1182,1250,],[247,-99,-97,-101,-98,247,-309,-302,-303,-304,-305,-306,-308,-313,-102,-310,-307,-322,-100,-318,-319,-316,-317,-314,-315,]),'FNC_VALUES':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[302,302,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'IDENTIFICATION':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[303,303,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_PTS_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[304,304,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_PTS_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[305,305,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_PTS_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[306,306,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_RESCALE_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[307,307,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_RESCALE_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[308,308,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'AXIS_RESCALE_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[309,309,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_AXIS_PTS_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[310,310,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_AXIS_PTS_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[311,311,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_AXIS_PTS_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[312,312,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_RESCALE_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[313,313,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_RESCALE_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[314,314,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'NO_RESCALE_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[315,315,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'FIX_NO_AXIS_PTS_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[316,316,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'FIX_NO_AXIS_PTS_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[317,317,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'FIX_NO_AXIS_PTS_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[318,318,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SRC_ADDR_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[319,319,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SRC_ADDR_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[320,320,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SRC_ADDR_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[321,321,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RIP_ADDR_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[322,322,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RIP_ADDR_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[323,323,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RIP_ADDR_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[324,324,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RIP_ADDR_W':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[325,325,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SHIFT_OP_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[326,326,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SHIFT_OP_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[327,327,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'SHIFT_OP_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[328,328,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'OFFSET_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[329,329,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'OFFSET_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[330,330,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'OFFSET_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[331,331,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'DIST_OP_X':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[332,332,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'DIST_OP_Y':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[333,333,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'DIST_OP_Z':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,975,976,977,978,979,980,981,982,1078,1079,1080,],[334,334,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'RESERVED':([128,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,387,388,389,390,391,392,423,424,425,426,427,428,429,430,431,432,474,489,490,491,608,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,687,975,976,977,978,979,980,981,982,1078,1079,1080,],[335,335,-827,-787,-788,-789,-790,-791,-792,-793,-794,-795,-796,-797,-798,-799,-800,-801,-802,-803,-804,-805,-806,-807,-808,-809,-810,-811,-812,-813,-814,-815,-816,-817,-818,-819,-820,-821,-822,-823,-824,-825,-826,-869,-870,-871,-872,-873,-874,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-828,-850,-851,-852,-837,-844,-845,-846,-847,-848,-849,-853,-854,-855,-856,-857,-858,-859,-860,-861,-862,-863,-864,-865,-866,-867,-868,-907,-86,-87,-88,890,-831,-89,-90,-91,-92,-838,-839,-840,-841,-842,-843,]),'VAR_CRITERION':([129,1081,],[336,1150,]),'VAR_FORBIDDEN_COMB':([129,642,],[337,839,]),'VAR_CHARACTERISTIC':([129,995,],[338,1086,]),'READ_ONLY':([142,347,348,349,350,351,380,381,382,383,384,385,518,1000,1068,1076,1136,1184,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1290,1292,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1370,1371,1403,1405,1422,1425,1484,1515,1516,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1618,1624,1625,1627,],[351,351,-926,-924,-925,-936,-585,-586,-587,-467,-468,-469,-927,-930,-486,-471,-465,351,351,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,351,-466,-470,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,351,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-581,-537,-400,-479,-481,-482,351,351,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-498,-523,-524,-525,]),'PARENTHESE_OPEN':([149,150,358,533,534,538,671,672,675,1093,1094,],[355,-70,536,536,-53,677,-54,-55,-57,-56,-58,]),'CALIBRATION_METHOD':([161,1012,],[360,1101,]),'MEMORY_LAYOUT':([161,1161,],[361,1237,]),'MEMORY_SEGMENT':([161,1427,],[362,1457,]),'ABSOLUTE':([209,],[381,]),'DIFFERENCE':([209,],[382,]),'MSB_FIRST':([210,],[384,]),'MSB_LAST':([210,],[385,]),'PROTOCOL_LAYER':([218,1500,],[393,1522,]),'DAQ':([218,1506,1546,1569,],[394,1527,1562,1562,]),'PAG':([218,895,],[395,1024,]),'PGM':([218,1120,],[396,1170,]),'SEGMENT':([218,1247,1491,],[398,1323,398,]),'DAQ_EVENT':([218,902,904,],[399,1039,1040,]),'XCP_ON_CAN':([218,906,],[400,1042,]),'FREEZE_SUPPORTED':([231,232,233,234,403,558,692,693,694,695,696,896,898,],[-99,-97,-101,-98,-102,696,696,-224,-222,-223,-228,-225,-100,]),'QP_BLOB':([231,232,234,898,919,1045,1046,1047,1048,1087,1135,1136,1137,1154,1155,1231,1232,1233,],[-99,-97,-98,-100,1050,1050,-325,-323,-324,1156,-326,-465,-329,1156,-917,-918,-916,-921,]),'DP_BLOB':([231,232,233,234,403,898,1236,1308,1309,1368,1377,1378,1379,1380,1381,1414,1415,1419,1447,1448,1449,1450,1451,1452,1453,1454,1455,1490,1533,],[-99,-97,-101,-98,-102,-100,1312,1312,-403,1312,-404,-401,-409,-402,-410,1312,-619,-617,-620,-614,-625,-629,-626,-627,-628,-615,-616,-630,-618,]),'BA_BLOB':([231,232,233,234,403,898,1236,1308,1309,1377,1378,1379,1380,1381,],[-99,-97,-101,-98,-102,-100,1313,1313,-403,-404,-401,-409,-402,-410,]),'KP_BLOB':([231,232,233,234,403,898,1368,1379,1381,1414,1415,1419,1447,1448,1449,1450,1451,1452,1453,1454,1455,1490,1533,],[-99,-97,-101,-98,-102,-100,1420,-409,-410,1420,-619,-617,-620,-614,-625,-629,-626,-627,-628,-615,-616,-630,-618,]),'PA_BLOB':([231,232,233,234,403,898,1368,1379,1381,1414,1415,1419,1447,1448,1449,1450,1451,1452,1453,1454,1455,1490,1533,],[-99,-97,-101,-98,-102,-100,1421,-409,-410,1421,-619,-617,-620,-614,-625,-629,-626,-627,-628,-615,-616,-630,-618,]),'ADDRESS_MAPPING':([231,232,234,898,1323,1456,1494,1495,1496,1497,1498,1520,1558,],[-99,-97,-98,-100,-443,1499,1499,-439,-436,-437,-438,-440,-457,]),'DAQ_LIST_TYPE':([231,232,233,234,403,898,1523,1538,1539,1540,1541,1542,1543,1544,1545,1551,1560,1561,1562,1563,1564,1565,1566,1567,1568,],[-99,-97,-101,-98,-102,-100,1546,1546,-287,-272,-273,-274,-275,-276,-277,-286,-288,-281,-278,-279,-280,-282,-283,-284,-285,]),'MAX_ODT':([231,232,233,234,403,898,1523,1538,1539,1540,1541,1542,1543,1544,1545,1551,1560,1561,1562,1563,1564,1565,1566,1567,1568,],[-99,-97,-101,-98,-102,-100,1547,1547,-287,-272,-273,-274,-275,-276,-277,-286,-288,-281,-278,-279,-280,-282,-283,-284,-285,]),'MAX_ODT_ENTRIES':([231,232,233,234,403,898,1523,1538,1539,1540,1541,1542,1543,1544,1545,1551,1560,1561,1562,1563,1564,1565,1566,1567,1568,],[-99,-97,-101,-98,-102,-100,1548,1548,-287,-272,-273,-274,-275,-276,-277,-286,-288,-281,-278,-279,-280,-282,-283,-284,-285,]),'FIRST_PID':([231,232,233,234,403,898,1523,1538,1539,1540,1541,1542,1543,1544,1545,1551,1560,1561,1562,1563,1564,1565,1566,1567,1568,],[-99,-97,-101,-98,-102,-100,1549,1549,-287,-272,-273,-274,-275,-276,-277,-286,-288,-281,-278,-279,-280,-282,-283,-284,-285,]),'EVENT_FIXED':([231,232,233,234,403,898,1523,1538,1539,1540,1541,1542,1543,1544,1545,1551,1560,1561,1562,1563,1564,1565,1566,1567,1568,],[-99,-97,-101,-98,-102,-100,1550,1550,-287,-272,-273,-274,-275,-276,-277,-286,-288,-281,-278,-279,-280,-282,-283,-284,-285,]),'SOURCE':([235,1134,],[405,1182,]),'RASTER':([235,1183,],[406,1250,]),'EVENT_GROUP':([235,1052,],[407,1139,]),'SEED_KEY':([235,1053,],[408,1140,]),'CHECKSUM':([235,736,924,1171,],[409,923,1054,409,]),'VALUE':([249,],[415,]),'CURVE':([249,],[416,]),'MAP':([249,],[417,]),'CUBOID':([249,],[418,]),'VAL_BLK':([249,],[419,]),'ASCII':([249,],[420,]),'UBYTE':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,423,]),'SBYTE':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,424,]),'UWORD':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,425,]),'SWORD':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,426,]),'ULONG':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,427,]),'SLONG':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,428,]),'A_UINT64':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,429,]),'A_INT64':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,430,]),'FLOAT32_IEEE':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,431,]),'FLOAT64_IEEE':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,432,]),'TAB_INTP':([252,253,],[434,442,]),'TAB_NOINTP':([252,253,],[435,443,]),'TAB_VERB':([252,254,],[436,445,]),'RAT_FUNC':([252,],[437,]),'FORM':([252,],[438,]),'IDENTICAL':([252,],[439,]),'LINEAR':([252,],[440,]),'FUNCTION_VERSION':([256,450,451,452,453,454,455,456,457,458,459,599,600,1068,1069,1070,1071,1072,1073,1074,],[460,460,-720,-712,-713,-714,-715,-716,-717,-718,-719,-721,-761,-486,-724,-731,-737,-743,-749,-755,]),'ROOT':([257,464,465,466,467,468,469,470,471,472,605,1068,1070,1075,1076,1077,],[472,472,-769,-763,-764,-765,-766,-767,-768,-773,-770,-486,-731,-774,-471,-780,]),'REF_GROUP':([344,855,],[516,1000,]),'DISPLAY_IDENTIFIER':([351,380,381,382,383,384,385,567,919,1045,1046,1047,1048,1068,1076,1135,1136,1137,1143,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1289,1290,1291,1292,1294,1296,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1370,1371,1403,1405,1422,1425,1443,1444,1484,1489,1515,1516,1618,],[-936,-585,-586,-587,-467,-468,-469,-152,1049,1049,-325,-323,-324,-486,-471,-326,-465,-329,1049,1049,1049,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1049,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1049,-609,-466,-631,-470,-672,-674,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,1049,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-581,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'FORMAT':([351,380,381,382,383,384,385,567,1068,1076,1136,1143,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1289,1290,1291,1292,1294,1296,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1370,1371,1403,1405,1422,1425,1443,1444,1484,1489,1515,1516,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1618,1624,1625,1627,],[-936,-585,-586,-587,-467,-468,-469,-152,-486,-471,-465,1211,1211,1211,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1211,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1211,-609,-466,-631,-470,-672,-674,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,1211,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-581,-537,-400,-632,-671,-479,-613,-481,-482,1211,1211,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-498,-523,-524,-525,]),'BIT_MASK':([351,383,384,385,567,1068,1076,1136,1143,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1289,1290,1291,1292,1294,1296,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1370,1371,1403,1422,1425,1443,1444,1484,1489,1515,1516,1618,],[-936,-467,-468,-469,-152,-486,-471,-465,1213,1213,1213,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1213,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-609,-466,-631,-470,-672,-674,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'NUMBER':([351,383,384,385,1068,1076,1136,1184,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1290,1292,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1370,1371,1403,1422,1425,1484,1515,1516,1618,],[-936,-467,-468,-469,-486,-471,-465,1278,1278,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-466,-470,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-479,-481,-482,-498,]),'SYMBOL_LINK':([351,383,384,385,567,1068,1076,1136,1143,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1289,1290,1291,1292,1294,1296,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1370,1371,1403,1422,1425,1443,1444,1484,1489,1515,1516,1618,],[-936,-467,-468,-469,-152,-486,-471,-465,1216,1216,1216,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1216,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-609,-466,-631,-470,-672,-674,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'EXTENDED_LIMITS':([351,380,381,382,383,384,385,1068,1076,1136,1184,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1290,1292,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1370,1371,1403,1405,1422,1425,1484,1515,1516,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1618,1624,1625,1627,],[-936,-585,-586,-587,-467,-468,-469,-486,-471,-465,1279,1279,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1279,-466,-470,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,1279,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-581,-537,-400,-479,-481,-482,1279,1279,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-498,-523,-524,-525,]),'GUARD_RAILS':([351,380,381,382,383,384,385,1068,1076,1136,1184,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1290,1292,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1370,1371,1403,1405,1422,1425,1484,1515,1516,1618,],[-936,-585,-586,-587,-467,-468,-469,-486,-471,-465,1280,1280,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1280,-466,-470,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,1280,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-581,-537,-400,-479,-481,-482,-498,]),'MAX_REFRESH':([351,383,384,385,567,1068,1076,1136,1143,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1289,1290,1291,1292,1294,1296,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1370,1371,1403,1422,1425,1443,1444,1484,1489,1515,1516,1618,],[-936,-467,-468,-469,-152,-486,-471,-465,1214,1214,1214,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1214,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-609,-466,-631,-470,-672,-674,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'REF_MEMORY_SEGMENT':([351,380,381,382,383,384,385,567,1068,1076,1136,1143,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1289,1290,1291,1292,1294,1296,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1370,1371,1403,1405,1422,1425,1443,1444,1484,1489,1515,1516,1618,],[-936,-585,-586,-587,-467,-468,-469,-152,-486,-471,-465,1218,1218,1218,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1218,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1218,-609,-466,-631,-470,-672,-674,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,1218,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-581,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'COMPARISON_QUANTITY':([351,383,384,385,1068,1076,1136,1184,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1290,1292,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1370,1371,1403,1422,1425,1484,1515,1516,1618,],[-936,-467,-468,-469,-486,-471,-465,1281,1281,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-466,-470,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-479,-481,-482,-498,]),'CALIBRATION_ACCESS':([351,380,381,382,383,384,385,1068,1076,1136,1184,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1290,1292,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1370,1371,1403,1405,1422,1425,1484,1515,1516,1618,],[-936,-585,-586,-587,-467,-468,-469,-486,-471,-465,1283,1283,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1283,-466,-470,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,1283,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-581,-537,-400,-479,-481,-482,-498,]),'MATRIX_DIM':([351,383,384,385,567,1068,1076,1136,1143,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1289,1290,1291,1292,1294,1296,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1370,1371,1403,1422,1425,1443,1444,1484,1489,1515,1516,1618,],[-936,-467,-468,-469,-152,-486,-471,-465,1219,1219,1219,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1219,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,-609,-466,-631,-470,-672,-674,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,-480,-673,-478,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'ECU_ADDRESS_EXTENSION':([351,380,381,382,383,384,385,567,1068,1076,1136,1143,1184,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1280,1282,1284,1289,1290,1291,1292,1294,1296,1297,1299,1329,1330,1332,1333,1334,1335,1336,1337,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1370,1371,1403,1405,1422,1425,1443,1444,1484,1489,1515,1516,1618,],[-936,-585,-586,-587,-467,-468,-469,-152,-486,-471,-465,1220,1220,1220,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,1220,-561,-539,-540,-541,-542,-543,-544,-545,-546,-547,-548,-549,-550,-551,-552,-553,-554,-555,-556,-557,-558,-559,-560,-937,-565,1220,-609,-466,-631,-470,-672,-674,-485,-538,-562,-477,-497,-532,-533,-534,-535,-536,1220,-580,-567,-568,-569,-570,-571,-572,-573,-574,-575,-576,-577,-578,-579,-584,-480,-673,-478,-581,-537,-400,-632,-671,-479,-613,-481,-482,-498,]),'AXIS_PTS_REF':([351,380,381,382,383,384,385,1068,1290,1403,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1624,1625,1627,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1590,1590,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'MAX_GRAD':([351,380,381,382,383,384,385,1068,1290,1403,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1624,1625,1627,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1591,1591,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'MONOTONY':([351,380,381,382,383,384,385,1068,1290,1403,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1624,1625,1627,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1592,1592,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'FIX_AXIS_PAR':([351,380,381,382,383,384,385,1068,1290,1403,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1624,1625,1627,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1593,1593,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'FIX_AXIS_PAR_DIST':([351,380,381,382,383,384,385,1068,1290,1403,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1624,1625,1627,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1594,1594,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'CURVE_AXIS_REF':([351,380,381,382,383,384,385,1068,1290,1403,1557,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1604,1605,1606,1607,1608,1609,1610,1611,1614,1624,1625,1627,],[-936,-585,-586,-587,-467,-468,-469,-486,-466,-478,1595,1595,-512,-499,-500,-501,-502,-503,-504,-505,-506,-507,-508,-509,-510,-511,-513,-516,-517,-518,-519,-520,-521,-522,-526,-523,-524,-525,]),'CURLY_CLOSE':([356,358,359,522,523,524,525,527,528,529,530,531,532,533,534,539,540,541,542,665,666,671,672,675,681,682,684,870,871,872,876,1093,1094,],[-950,-950,-950,664,-37,-38,-39,667,-31,-34,-74,670,-51,-52,-53,680,-65,-66,-63,-40,-41,-54,-55,-57,-64,-67,-69,-75,-32,-33,-68,-56,-58,]),'PRG_CODE':([361,],[547,]),'PRG_DATA':([361,],[548,]),'PRG_RESERVED':([361,],[549,]),'READ_WRITE':([383,384,385,567,1068,1076,1136,1143,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1289,1290,1291,1292,1294,1296,1297,1299,1370,1371,1422,1443,1444,1489,],[-467,-468,-469,-152,-486,-471,-465,1210,1210,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-609,-466,-631,-470,-672,-674,-485,-538,-480,-673,-537,-632,-671,-613,]),'ARRAY_SIZE':([383,384,385,567,1068,1076,1136,1143,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1289,1290,1291,1292,1294,1296,1297,1299,1370,1371,1422,1443,1444,1489,],[-467,-468,-469,-152,-486,-471,-465,1212,1212,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-609,-466,-631,-470,-672,-674,-485,-538,-480,-673,-537,-632,-671,-613,]),'ECU_ADDRESS':([383,384,385,567,1068,1076,1136,1143,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1289,1290,1291,1292,1294,1296,1297,1299,1370,1371,1422,1443,1444,1489,],[-467,-468,-469,-152,-486,-471,-465,1215,1215,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-609,-466,-631,-470,-672,-674,-485,-538,-480,-673,-537,-632,-671,-613,]),'ERROR_MASK':([383,384,385,567,1068,1076,1136,1143,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1289,1290,1291,1292,1294,1296,1297,1299,1370,1371,1422,1443,1444,1489,],[-467,-468,-469,-152,-486,-471,-465,1217,1217,-608,-589,-590,-591,-592,-593,-594,-595,-596,-597,-598,-599,-600,-601,-602,-603,-604,-605,-606,-607,-612,-609,-466,-631,-470,-672,-674,-485,-538,-480,-673,-537,-632,-671,-613,]),'STATIC':([394,],[556,]),'DYNAMIC':([394,],[557,]),'FIXED_EVENT_LIST':([399,],[564,]),'VARIABLE':([399,1041,],[565,1132,]),'COLUMN_DIR':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,825,]),'ROW_DIR':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,826,]),'ALTERNATE_WITH_X':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,827,]),'ALTERNATE_WITH_Y':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,828,]),'ALTERNATE_CURVES':([423,424,425,426,427,428,429,430,431,432,607,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,829,]),'INDEX_INCR':([423,424,425,426,427,428,429,430,431,432,609,610,611,835,836,837,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,831,831,831,831,831,831,]),'INDEX_DECR':([423,424,425,426,427,428,429,430,431,432,609,610,611,835,836,837,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,832,832,832,832,832,832,]),'DEFAULT_VALUE':([446,579,580,584,585,586,587,589,590,743,746,747,748,749,750,751,756,757,758,759,760,761,764,765,766,943,944,945,946,948,949,950,],[588,588,588,588,-703,-701,-702,-707,-708,-105,588,-679,-676,-677,-678,-683,588,-691,-689,-690,-695,-697,-704,-686,-709,-680,-106,-687,-699,-692,-698,-710,]),'ANNOTATION':([447,461,953,1186,1251,1338,1572,],[591,591,1068,591,591,591,591,]),'DEF_CHARACTERISTIC':([447,957,],[592,1069,]),'REF_CHARACTERISTIC':([447,461,959,],[593,593,1070,]),'IN_MEASUREMENT':([447,961,],[594,1071,]),'OUT_MEASUREMENT':([447,963,],[595,1072,]),'LOC_MEASUREMENT':([447,965,],[596,1073,]),'SUB_FUNCTION':([447,967,],[597,1074,]),'REF_MEASUREMENT':([461,969,],[601,1075,]),'FUNCTION_LIST':([461,971,1186,1251,1338,],[602,1076,602,602,602,]),'SUB_GROUP':([461,973,],[603,1077,]),'BYTE':([508,],[638,]),'WORD':([508,],[639,]),'LONG':([508,],[640,]),'EXTENDED_SI':([519,],[657,]),'DERIVED':([519,],[658,]),'COMMA':([527,528,529,530,870,871,872,],[668,-31,-34,-74,-75,-32,-33,]),'EQUAL':([529,530,],[669,-74,]),'CAN_ID_BROADCAST':([566,711,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,918,1249,],[723,723,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'CAN_ID_MASTER':([566,711,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,918,1249,],[724,724,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'CAN_ID_SLAVE':([566,711,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,918,1249,],[725,725,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'BAUDRATE':([566,711,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,918,1249,],[726,726,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'SAMPLE_POINT':([566,711,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,918,1249,],[727,727,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'SAMPLE_RATE':([566,711,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,918,1249,],[728,728,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'BTL_CYCLES':([566,711,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,918,1249,],[729,729,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'SJW':([566,711,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,918,1249,],[730,730,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'SYNC_EDGE':([566,711,712,713,714,715,716,717,718,719,720,721,722,907,908,909,910,911,912,913,914,915,916,917,918,1249,],[731,731,-172,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-173,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,]),'MAX_BLOCK_SIZE':([573,],[738,]),'DEFAULT_VALUE_NUMERIC':([579,743,746,747,748,749,750,751,765,943,944,945,],[752,-105,752,-679,-676,-677,-678,-683,-686,-680,-106,-687,]),'ANNOTATION_LABEL':([591,770,771,772,773,774,954,955,956,1228,],[775,775,-490,-487,-488,-489,-491,-494,-495,-496,]),'ANNOTATION_ORIGIN':([591,770,771,772,773,774,954,955,956,1228,],[776,776,-490,-487,-488,-489,-491,-494,-495,-496,]),'VAR_MEASUREMENT':([646,838,842,988,989,990,991,1082,1083,1084,],[-107,992,-108,992,-901,-899,-900,-902,-905,-906,]),'VAR_SELECTION_CHARACTERISTIC':([646,838,842,988,989,990,991,1082,1083,1084,],[-107,993,-108,993,-901,-899,-900,-902,-905,-906,]),'FRAME_MEASUREMENT':([646,648,842,850,851,852,853,998,999,1304,],[-107,854,-108,854,-911,-909,-910,-912,-922,-915,]),'SI_EXPONENTS':([656,657,658,859,860,861,862,863,1002,1004,1091,1424,],[864,-946,-947,864,-942,-939,-940,-941,-943,-670,-949,-948,]),'REF_UNIT':([656,657,658,742,859,860,861,862,863,932,933,934,935,936,937,938,1002,1004,1060,1063,1091,1147,1373,1423,1424,],[865,-946,-947,865,865,-942,-939,-940,-941,865,-649,-644,-645,-646,-647,-648,-943,-670,-650,-669,-949,-668,-660,-667,-948,]),'UNIT_CONVERSION':([656,657,658,859,860,861,862,863,1002,1004,1091,1424,],[866,-946,-947,866,-942,-939,-940,-941,-943,-670,-949,-948,]),'ASTERISK':([659,873,874,1010,],[867,1008,1009,1095,]),'CODE':([687,],[885,]),'DATA':([687,],[886,]),'OFFLINE_DATA':([687,],[887,]),'VARIABLES':([687,],[888,]),'SERAM':([687,],[889,]),'CALIBRATION_VARIABLES':([687,],[891,]),'EXCLUDE_FROM_FLASH':([687,],[892,]),'AVAILABLE_EVENT_LIST':([700,1123,],[900,1178,]),'DEFAULT_EVENT_LIST':([700,1126,],[901,1179,]),'DAQ_LIST_CAN_ID':([708,1180,],[905,1249,]),'SINGLE':([728,731,],[913,917,]),'TRIPLE':([728,],[914,]),'DUAL':([731,],[918,]),'COEFFS':([742,932,933,934,935,936,937,938,1004,1060,1063,1147,1373,1423,],[939,939,-649,-644,-645,-646,-647,-648,-670,-650,-669,-668,-660,-667,]),'COEFFS_LINEAR':([742,932,933,934,935,936,937,938,1004,1060,1063,1147,1373,1423,],[940,940,-649,-644,-645,-646,-647,-648,-670,-650,-669,-668,-660,-667,]),'COMPU_TAB_REF':([742,932,933,934,935,936,937,938,1004,1060,1063,1147,1373,1423,],[941,941,-649,-644,-645,-646,-647,-648,-670,-650,-669,-668,-660,-667,]),'ANNOTATION_TEXT':([767,1148,],[952,1228,]),'PBYTE':([824,825,826,827,828,829,830,831,832,833,834,983,984,985,],[976,-832,-833,-834,-835,-836,976,-93,-94,976,976,976,976,976,]),'PWORD':([824,825,826,827,828,829,830,831,832,833,834,983,984,985,],[977,-832,-833,-834,-835,-836,977,-93,-94,977,977,977,977,977,]),'PLONG':([824,825,826,827,828,829,830,831,832,833,834,983,984,985,],[978,-832,-833,-834,-835,-836,978,-93,-94,978,978,978,978,978,]),'DIRECT':([824,825,826,827,828,829,830,831,832,833,834,983,984,985,],[979,-832,-833,-834,-835,-836,979,-93,-94,979,979,979,979,979,]),'VAR_ADDRESS':([841,1151,],[994,1229,]),'BRACE_CLOSE':([869,870,1006,],[1007,-75,1092,]),'CALIBRATION_HANDLE':([877,1158,],[1011,1235,]),'RAM':([884,885,886,887,888,889,890,891,892,],[1016,-418,-419,-420,-421,-422,-423,-424,-425,]),'EEPROM':([884,885,886,887,888,889,890,891,892,],[1017,-418,-419,-420,-421,-422,-423,-424,-425,]),'EPROM':([884,885,886,887,888,889,890,891,892,],[1018,-418,-419,-420,-421,-422,-423,-424,-425,]),'ROM':([884,885,886,887,888,889,890,891,892,],[1019,-418,-419,-420,-421,-422,-423,-424,-425,]),'REGISTER':([884,885,886,887,888,889,890,891,892,],[1020,-418,-419,-420,-421,-422,-423,-424,-425,]),'FLASH':([884,885,886,887,888,889,890,891,892,],[1021,-418,-419,-420,-421,-422,-423,-424,-425,]),'EVENT':([900,901,1035,1036,1124,1125,1463,1629,],[1037,1037,1037,-205,-206,-204,1503,1630,]),'FORMULA':([929,1300,],[1058,1373,]),'INTERN':([1015,1016,1017,1018,1019,1020,1021,],[1109,-426,-427,-428,-429,-430,-431,]),'EXTERN':([1015,1016,1017,1018,1019,1020,1021,],[1110,-426,-427,-428,-429,-430,-431,]),'OPTIMISATION_TYPE_DEFAULT':([1023,1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[1113,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1113,-263,-264,-265,-243,-236,-237,-238,-239,1113,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_ODT_TYPE_16':([1023,1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[1114,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1114,-263,-264,-265,-243,-236,-237,-238,-239,1114,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_ODT_TYPE_32':([1023,1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[1115,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1115,-263,-264,-265,-243,-236,-237,-238,-239,1115,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_ODT_TYPE_64':([1023,1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[1116,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1116,-263,-264,-265,-243,-236,-237,-238,-239,1116,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT':([1023,1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[1117,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1117,-263,-264,-265,-243,-236,-237,-238,-239,1117,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'OPTIMISATION_TYPE_MAX_ENTRY_SIZE':([1023,1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[1118,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1118,-263,-264,-265,-243,-236,-237,-238,-239,1118,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'SECTOR':([1025,1528,],[1119,1555,]),'FIXED':([1041,],[1133,]),'ADDRESS_EXTENSION_FREE':([1112,1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[1166,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1166,-263,-264,-265,-243,-236,-237,-238,-239,1166,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'ADDRESS_EXTENSION_ODT':([1112,1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[1167,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1167,-263,-264,-265,-243,-236,-237,-238,-239,1167,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'ADDRESS_EXTENSION_DAQ':([1112,1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[1168,-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1168,-263,-264,-265,-243,-236,-237,-238,-239,1168,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'IDENTIFICATION_FIELD_TYPE_ABSOLUTE':([1113,1114,1115,1116,1117,1118,1165,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,1241,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1241,-263,-264,-265,-243,-236,-237,-238,-239,1241,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE':([1113,1114,1115,1116,1117,1118,1165,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,1242,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1242,-263,-264,-265,-243,-236,-237,-238,-239,1242,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD':([1113,1114,1115,1116,1117,1118,1165,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,1243,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1243,-263,-264,-265,-243,-236,-237,-238,-239,1243,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED':([1113,1114,1115,1116,1117,1118,1165,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,1244,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1244,-263,-264,-265,-243,-236,-237,-238,-239,1244,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE':([1113,1114,1115,1116,1117,1118,1166,1167,1168,1240,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,1317,-255,-256,-257,-258,-259,-260,-261,-262,1317,-263,-264,-265,-243,-236,-237,-238,-239,1317,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD':([1113,1114,1115,1116,1117,1118,1166,1167,1168,1240,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,1318,-255,-256,-257,-258,-259,-260,-261,-262,1318,-263,-264,-265,-243,-236,-237,-238,-239,1318,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD':([1113,1114,1115,1116,1117,1118,1166,1167,1168,1240,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,1319,-255,-256,-257,-258,-259,-260,-261,-262,1319,-263,-264,-265,-243,-236,-237,-238,-239,1319,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG':([1113,1114,1115,1116,1117,1118,1166,1167,1168,1240,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,1320,-255,-256,-257,-258,-259,-260,-261,-262,1320,-263,-264,-265,-243,-236,-237,-238,-239,1320,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'PRESCALER_SUPPORTED':([1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1480,-263,-264,-265,-243,-236,-237,-238,-239,1480,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'RESUME_SUPPORTED':([1113,1114,1115,1116,1117,1118,1166,1167,1168,1241,1242,1243,1244,1317,1318,1319,1320,1430,1431,1432,1433,1464,1465,1466,1467,1468,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1507,1596,1601,1622,1630,],[-246,-247,-248,-249,-250,-251,-252,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,1481,-263,-264,-265,-243,-236,-237,-238,-239,1481,-266,-232,-233,-234,-235,-240,-241,-242,-244,-245,-267,-271,-292,-291,-270,]),'FORMULA_INV':([1144,1223,1224,1225,1301,1302,],[1226,1226,-662,-661,-663,-666,]),'PAGE':([1171,1529,],[1246,1556,]),'BIT_OPERATION':([1186,1406,],[1285,1443,]),'VIRTUAL':([1186,1410,],[1286,1444,]),'MAP_LIST':([1251,1436,],[1324,1484,]),'DEPENDENT_CHARACTERISTIC':([1251,1485,],[1325,1515,]),'VIRTUAL_CHARACTERISTIC':([1251,1486,],[1326,1516,]),'AXIS_DESCR':([1251,1603,],[1327,1618,]),'CALIBRATION':([1283,],[1334,]),'NO_CALIBRATION':([1283,],[1335,]),'NOT_IN_MCD_SYSTEM':([1283,],[1336,]),'OFFLINE_CALIBRATION':([1283,],[1337,]),'LEFT_SHIFT':([1285,1359,1360,1361,1362,1363,1366,1407,1408,1409,],[1364,1364,-636,-633,-634,-635,-642,-637,-640,-641,]),'RIGHT_SHIFT':([1285,1359,1360,1361,1362,1363,1366,1407,1408,1409,],[1365,1365,-636,-633,-634,-635,-642,-637,-640,-641,]),'SIGN_EXTEND':([1285,1359,1360,1361,1362,1363,1366,1407,1408,1409,],[1366,1366,-636,-633,-634,-635,-642,-637,-640,-641,]),'STD_AXIS':([1327,],[1397,]),'FIX_AXIS':([1327,],[1398,]),'COM_AXIS':([1327,],[1399,]),'RES_AXIS':([1327,],[1400,]),'CURVE_AXIS':([1327,],[1401,]),'NO_OVERLOAD_INDICATION':([1390,],[1431,]),'OVERLOAD_INDICATION_PID':([1390,],[1432,]),'OVERLOAD_INDICATION_EVENT':([1390,],[1433,]),'DAQ_LIST':([1463,1559,],[1502,1596,]),'TIMESTAMP_SUPPORTED':([1463,1616,],[1504,1622,]),'STIM':([1463,1546,1569,1571,],[1505,1563,1563,1601,]),'INIT_SEGMENT':([1483,1511,1512,1513,1530,1531,],[1514,1514,-452,-451,-453,-456,]),'GRANULARITY_ODT_ENTRY_SIZE_STIM_BYTE':([1505,],[1526,]),'DAQ_STIM':([1546,1569,],[1564,1564,]),'TIMESTAMP_FIXED':([1570,],[1600,]),'FIX_AXIS_PAR_LIST':([1572,1623,],[1602,1627,]),'MON_INCREASE':([1592,],[1608,]),'MON_DECREASE':([1592,],[1609,]),'STRICT_INCREASE':([1592,],[1610,]),'STRICT_DECREASE':([1592,],[1611,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'a2l':([0,],[1,]),'a2l_optional_list_optional':([0,],[2,]),'empty':([0,19,31,42,86,111,112,113,114,115,116,117,118,128,142,256,257,356,358,359,397,446,516,521,538,558,564,565,566,579,580,591,592,593,594,595,596,597,601,602,603,647,648,656,685,742,838,896,899,900,918,1009,1012,1039,1085,1120,1141,1142,1182,1234,1282,1283,1312,1366,1393,1427,1428,1454,1481,1521,1555,1568,],[3,22,35,49,131,153,153,153,153,163,195,220,237,259,346,449,463,523,532,540,561,583,650,661,679,691,702,702,710,745,755,769,778,783,788,793,798,803,809,814,819,844,849,858,878,930,986,1025,1032,1032,1042,1095,1102,1126,1151,1171,1186,1220,1251,1305,1338,1356,1382,1411,1437,1457,1468,1491,1508,1535,1572,1597,]),'a2l_optional_list':([0,5,],[4,12,]),'a2l_optional':([0,5,],[5,5,]),'asap2_version':([0,5,],[6,6,]),'a2ml_version':([0,5,],[7,7,]),'project':([0,5,],[8,8,]),'project_optional_list_optional':([19,],[21,]),'project_optional_list':([19,24,],[23,30,]),'project_optional':([19,24,],[24,24,]),'header':([19,24,],[25,25,]),'module':([19,24,],[26,26,]),'header_optional_list_optional':([31,],[34,]),'header_optional_list':([31,37,],[36,44,]),'header_optional':([31,37,],[37,37,]),'version':([31,37,115,165,],[38,38,166,166,]),'project_no':([31,37,],[39,39,]),'module_optional_list_optional':([42,],[48,]),'module_optional_list':([42,51,],[50,91,]),'module_optional':([42,51,],[51,51,]),'a2ml':([42,51,],[52,52,]),'mod_par':([42,51,],[53,53,]),'mod_common':([42,51,],[54,54,]),'if_data_xcp':([42,51,1141,1188,1312,1384,],[55,55,1204,1204,1386,1386,]),'if_data_module':([42,51,],[56,56,]),'characteristic':([42,51,],[57,57,]),'axis_pts':([42,51,],[58,58,]),'measurement':([42,51,],[59,59,]),'compu_method':([42,51,],[60,60,]),'compu_tab':([42,51,],[61,61,]),'compu_vtab':([42,51,],[62,62,]),'compu_vtab_range':([42,51,],[63,63,]),'function':([42,51,],[64,64,]),'group':([42,51,],[65,65,]),'record_layout':([42,51,],[66,66,]),'variant_coding':([42,51,],[67,67,]),'frame':([42,51,],[68,68,]),'user_rights':([42,51,],[69,69,]),'unit':([42,51,],[70,70,]),'a2ml_declaration_list':([72,93,],[92,146,]),'a2ml_declaration':([72,93,],[93,93,]),'a2ml_type_definition':([72,93,],[94,94,]),'a2ml_block_definition':([72,93,358,359,534,536,542,],[95,95,537,544,537,674,544,]),'a2ml_type_name':([72,93,149,355,356,525,538,543,677,],[96,96,354,521,521,521,521,521,521,]),'a2ml_predefined_type_name':([72,93,149,355,356,525,538,543,677,],[98,98,98,98,98,98,98,98,98,]),'a2ml_struct_type_name':([72,93,149,355,356,525,538,543,677,],[99,99,99,99,99,99,99,99,99,]),'a2ml_enum_type_name':([72,93,149,355,356,525,538,543,677,],[100,100,100,100,100,100,100,100,100,]),'a2ml_taggedstruct_type_name':([72,93,149,355,356,525,538,543,677,],[101,101,101,101,101,101,101,101,101,]),'a2ml_taggedunion_type_name':([72,93,149,355,356,525,538,543,677,],[102,102,102,102,102,102,102,102,102,]),'variant_coding_optional_list_optional':([86,],[130,]),'variant_coding_optional_list':([86,133,],[132,340,]),'variant_coding_optional':([86,133,],[133,133,]),'var_separator':([86,133,],[134,134,]),'var_naming':([86,133,],[135,135,]),'var_criterion':([86,133,],[136,136,]),'var_forbidden_comb':([86,133,],[137,137,]),'var_characteristic':([86,133,],[138,138,]),'a2ml_tag':([97,358,359,534,536,542,],[149,538,543,538,538,543,]),'a2ml_identifier_optional':([111,112,113,114,],[151,155,157,159,]),'a2ml_identifier':([111,112,113,114,],[152,156,158,160,]),'mod_par_optional_list_optional':([115,],[162,]),'mod_par_optional_list':([115,165,],[164,364,]),'mod_par_optional':([115,165,],[165,165,]),'addr_epk':([115,165,],[167,167,]),'epk':([115,165,],[168,168,]),'supplier':([115,165,],[169,169,]),'customer':([115,165,],[170,170,]),'customer_no':([115,165,],[171,171,]),'user':([115,165,],[172,172,]),'phone_no':([115,165,],[173,173,]),'ecu':([115,165,],[174,174,]),'cpu_type':([115,165,],[175,175,]),'no_of_interfaces':([115,165,],[176,176,]),'ecu_calibration_offset':([115,165,],[177,177,]),'calibration_method':([115,165,],[178,178,]),'memory_layout':([115,165,],[179,179,]),'memory_segment':([115,165,],[180,180,]),'system_constant':([115,165,],[181,181,]),'mod_common_optional_list_optional':([116,],[194,]),'mod_common_optional_list':([116,197,],[196,378,]),'mod_common_optional':([116,197,],[197,197,]),'s_rec_layout':([116,197,],[198,198,]),'deposit':([116,197,1282,1340,1555,1574,],[199,199,1344,1344,1586,1586,]),'byte_order':([116,197,1141,1182,1188,1253,1282,1340,1555,1574,],[200,200,1195,1256,1195,1256,1345,1345,1581,1581,]),'data_size':([116,197,],[201,201,]),'alignment_byte':([116,128,197,261,],[202,295,202,295,]),'alignment_word':([116,128,197,261,],[203,296,203,296,]),'alignment_long':([116,128,197,261,],[204,297,204,297,]),'alignment_int64':([116,128,197,261,],[205,300,205,300,]),'alignment_float32_ieee':([116,128,197,261,],[206,298,206,298,]),'alignment_float64_ieee':([116,128,197,261,],[207,299,207,299,]),'if_data_xcp_optional_list_optional':([117,],[219,]),'if_data_xcp_optional_list':([117,222,],[221,402,]),'if_data_xcp_optional':([117,222,],[222,222,]),'protocol_layer':([117,222,],[223,223,]),'daq':([117,222,],[224,224,]),'pag':([117,222,],[225,225,]),'pgm':([117,222,],[226,226,]),'segment':([117,222,1454,1493,],[227,227,1495,1495,]),'daq_event':([117,222,],[228,228,]),'xcp_on_can':([117,222,],[229,229,]),'generic_parameter_list':([117,118,222,233,239,245,397,558,693,896,1027,1308,1309,1415,1416,1427,1443,1459,1521,1537,],[230,248,230,403,248,413,562,695,695,1029,1029,1377,1379,1377,1379,1460,1486,1460,1549,1549,]),'generic_parameter':([117,118,222,233,239,245,397,558,693,896,1027,1154,1308,1309,1415,1416,1427,1443,1454,1459,1493,1521,1537,],[233,233,233,233,233,233,233,233,233,233,233,1231,233,233,233,233,233,233,1496,233,1496,233,233,]),'if_data_module_optional_list_optional':([118,],[236,]),'if_data_module_optional_list':([118,239,],[238,411,]),'if_data_module_optional':([118,239,],[239,239,]),'source':([118,239,],[240,240,]),'raster':([118,239,],[241,241,]),'event_group':([118,239,],[242,242,]),'seed_key':([118,239,],[243,243,]),'checksum':([118,239,1120,1173,],[244,244,1175,1175,]),'tp_blob':([118,239,],[245,245,]),'if_data_module_unsupported_element':([118,239,],[246,246,]),'record_layout_optional_list_optional':([128,],[258,]),'record_layout_optional_list':([128,261,],[260,474,]),'record_layout_optional':([128,261,],[261,261,]),'fnc_values':([128,261,],[262,262,]),'identification':([128,261,],[263,263,]),'axis_pts_x':([128,261,],[264,264,]),'axis_pts_y':([128,261,],[265,265,]),'axis_pts_z':([128,261,],[266,266,]),'axis_rescale_x':([128,261,],[267,267,]),'axis_rescale_y':([128,261,],[268,268,]),'axis_rescale_z':([128,261,],[269,269,]),'no_axis_pts_x':([128,261,],[270,270,]),'no_axis_pts_y':([128,261,],[271,271,]),'no_axis_pts_z':([128,261,],[272,272,]),'no_rescale_x':([128,261,],[273,273,]),'no_rescale_y':([128,261,],[274,274,]),'no_rescale_z':([128,261,],[275,275,]),'fix_no_axis_pts_x':([128,261,],[276,276,]),'fix_no_axis_pts_y':([128,261,],[277,277,]),'fix_no_axis_pts_z':([128,261,],[278,278,]),'src_addr_x':([128,261,],[279,279,]),'src_addr_y':([128,261,],[280,280,]),'src_addr_z':([128,261,],[281,281,]),'rip_addr_x':([128,261,],[282,282,]),'rip_addr_y':([128,261,],[283,283,]),'rip_addr_z':([128,261,],[284,284,]),'rip_addr_w':([128,261,],[285,285,]),'shift_op_x':([128,261,],[286,286,]),'shift_op_y':([128,261,],[287,287,]),'shift_op_z':([128,261,],[288,288,]),'offset_x':([128,261,],[289,289,]),'offset_y':([128,261,],[290,290,]),'offset_z':([128,261,],[291,291,]),'dist_op_x':([128,261,],[292,292,]),'dist_op_y':([128,261,],[293,293,]),'dist_op_z':([128,261,],[294,294,]),'reserved':([128,261,],[301,301,]),'user_rights_optional_list_optional':([142,],[345,]),'user_rights_optional_list':([142,348,],[347,518,]),'user_rights_optional':([142,348,],[348,348,]),'ref_group':([142,348,],[349,349,]),'read_only':([142,348,1182,1253,1282,1340,1555,1574,],[350,350,1262,1262,1342,1342,1575,1575,]),'deposit_mode':([209,],[380,]),'byte_order_type':([210,],[383,]),'tp_data':([245,],[412,]),'characteristic_type':([249,],[414,]),'datatype':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[422,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,]),'compu_method_conversion_type':([252,],[433,]),'compu_tab_conversion_type':([253,],[441,]),'compu_vtab_conversion_type':([254,],[444,]),'function_optional_list_optional':([256,],[448,]),'function_optional_list':([256,451,],[450,599,]),'function_optional':([256,451,],[451,451,]),'annotation':([256,257,451,465,1141,1182,1188,1253,1282,1340,1555,1574,],[452,466,452,466,1203,1269,1203,1269,1350,1350,1577,1577,]),'def_characteristic':([256,451,],[453,453,]),'ref_characteristic':([256,257,451,465,],[454,468,454,468,]),'in_measurement':([256,451,],[455,455,]),'out_measurement':([256,451,],[456,456,]),'loc_measurement':([256,451,],[457,457,]),'sub_function':([256,451,],[458,458,]),'function_version':([256,451,],[459,459,]),'group_optional_list_optional':([257,],[462,]),'group_optional_list':([257,465,],[464,605,]),'group_optional':([257,465,],[465,465,]),'root':([257,465,],[467,467,]),'ref_measurement':([257,465,],[469,469,]),'function_list':([257,465,1141,1182,1188,1253,1282,1340,],[470,470,1198,1258,1198,1258,1346,1346,]),'sub_group':([257,465,],[471,471,]),'var_forbidden_comb_criterion_list':([337,],[510,]),'var_forbidden_comb_criterion_optional':([337,511,643,],[511,643,643,]),'a2ml_member':([355,356,525,538,543,677,],[520,526,526,678,683,874,]),'a2ml_struct_member_list_optional':([356,],[522,]),'a2ml_struct_member_list':([356,525,],[524,665,]),'a2ml_struct_member':([356,525,],[525,525,]),'a2ml_enumerator_list':([357,668,],[527,870,]),'a2ml_enumerator':([357,668,],[528,528,]),'a2ml_keyword':([357,668,],[529,529,]),'a2ml_taggedstruct_member_list_optional':([358,],[531,]),'a2ml_taggedstruct_member_list':([358,534,],[533,671,]),'a2ml_taggedstruct_member':([358,534,],[534,534,]),'a2ml_taggedstruct_definition':([358,534,536,],[535,535,673,]),'a2ml_taggedunion_member_list_optional':([359,],[539,]),'a2ml_taggedunion_member_list':([359,542,],[541,681,]),'a2ml_taggedunion_member':([359,542,],[542,542,]),'memory_layout_prg_type':([361,],[546,]),'daq_config_type':([394,],[555,]),'generic_parameter_list_optional':([397,],[560,]),'compu_vtab_range_optional_list_optional':([446,],[582,]),'compu_vtab_range_optional_list':([446,585,],[584,764,]),'compu_vtab_range_optional':([446,585,],[585,585,]),'default_value':([446,579,580,585,747,757,],[586,749,758,586,749,758,]),'compu_vtab_range_in_val_out_val':([446,585,],[587,587,]),'number_number_string_value_list':([446,585,590,],[589,589,766,]),'number_number_string_value':([446,585,590,],[590,590,590,]),'datasize':([508,],[637,]),'var_forbidden_comb_criterion_optional_list':([511,643,],[644,840,]),'ident_list':([513,641,646,854,1284,1322,1392,1393,],[647,838,841,998,1365,1391,1435,1438,]),'ref_group_optional_list_optional':([516,],[649,]),'ref_group_optional_list':([516,652,],[651,856,]),'ref_group_optional':([516,652,],[652,652,]),'identifier':([516,592,593,594,595,596,597,601,603,652,780,785,790,795,800,805,811,821,],[653,781,786,791,796,801,806,812,822,653,781,786,791,796,801,806,812,822,]),'unit_type':([519,],[656,]),'a2ml_array_specifier_optional':([521,],[660,]),'a2ml_array_specifier':([521,1005,],[662,1090,]),'a2ml_member_optional':([538,],[676,]),'pag_optional_list_optional':([558,],[690,]),'pag_optional_list':([558,693,],[692,895,]),'pag_optional':([558,693,],[693,693,]),'freeze_supported':([558,693,],[694,694,]),'daq_event_optional_list_optional':([564,565,],[701,707,]),'daq_event_optional_list':([564,565,704,],[703,703,902,]),'daq_event_optional':([564,565,704,],[704,704,704,]),'available_event_list':([564,565,704,],[705,705,705,]),'default_event_list':([564,565,704,],[706,706,706,]),'xcp_on_can_optional_list_optional':([566,],[709,]),'xcp_on_can_optional_list':([566,712,],[711,906,]),'xcp_on_can_optional':([566,712,],[712,712,]),'can_id_broadcast':([566,712,],[713,713,]),'can_id_master':([566,712,],[714,714,]),'can_id_slave':([566,712,],[715,715,]),'baudrate':([566,712,],[716,716,]),'sample_point':([566,712,],[717,717,]),'sample_rate':([566,712,],[718,718,]),'btl_cycles':([566,712,],[719,719,]),'sjw':([566,712,],[720,720,]),'sync_edge':([566,712,],[721,721,]),'daq_list_can_id':([566,712,],[722,722,]),'max_block_size':([573,],[737,]),'compu_tab_optional_list_optional':([579,],[744,]),'compu_tab_optional_list':([579,747,],[746,943,]),'compu_tab_optional':([579,747,],[747,747,]),'in_val_out_val':([579,747,],[748,748,]),'default_value_numeric':([579,747,],[750,750,]),'number_list':([579,734,743,747,882,993,1236,1600,],[751,920,941,751,1012,1083,1312,1615,]),'compu_vtab_optional_list_optional':([580,],[754,]),'compu_vtab_optional_list':([580,757,],[756,947,]),'compu_vtab_optional':([580,757,],[757,757,]),'compu_vtab_in_val_out_val':([580,757,],[759,759,]),'number_string_value_list':([580,757,761,],[760,760,948,]),'number_string_value':([580,757,761,],[761,761,761,]),'annotation_optional_list_optional':([591,],[768,]),'annotation_optional_list':([591,771,],[770,953,]),'annotation_optional':([591,771,],[771,771,]),'annotation_label':([591,771,],[772,772,]),'annotation_origin':([591,771,],[773,773,]),'annotation_text':([591,771,],[774,774,]),'def_characteristic_optional_list_optional':([592,],[777,]),'def_characteristic_optional_list':([592,780,],[779,957,]),'def_characteristic_optional':([592,780,],[780,780,]),'ref_characteristic_optional_list_optional':([593,],[782,]),'ref_characteristic_optional_list':([593,785,],[784,959,]),'ref_characteristic_optional':([593,785,],[785,785,]),'in_measurement_optional_list_optional':([594,],[787,]),'in_measurement_optional_list':([594,790,],[789,961,]),'in_measurement_optional':([594,790,],[790,790,]),'out_measurement_optional_list_optional':([595,],[792,]),'out_measurement_optional_list':([595,795,],[794,963,]),'out_measurement_optional':([595,795,],[795,795,]),'loc_measurement_optional_list_optional':([596,],[797,]),'loc_measurement_optional_list':([596,800,],[799,965,]),'loc_measurement_optional':([596,800,],[800,800,]),'sub_function_optional_list_optional':([597,],[802,]),'sub_function_optional_list':([597,805,],[804,967,]),'sub_function_optional':([597,805,],[805,805,]),'ref_measurement_optional_list_optional':([601,],[808,]),'ref_measurement_optional_list':([601,811,],[810,969,]),'ref_measurement_optional':([601,811,],[811,811,]),'function_list_optional_list_optional':([602,],[813,]),'function_list_optional_list':([602,816,],[815,971,]),'function_list_optional':([602,816,],[816,816,]),'sub_group_optional_list_optional':([603,],[818,]),'sub_group_optional_list':([603,821,],[820,973,]),'sub_group_optional':([603,821,],[821,821,]),'fnc_values_index_mode':([607,],[824,]),'indexorder':([609,610,611,835,836,837,],[830,833,834,982,983,984,]),'var_characteristic_optional_optional':([647,],[843,]),'var_characteristic_optional':([647,],[845,]),'var_address':([647,],[846,]),'frame_optional_list_optional':([648,],[848,]),'frame_optional_list':([648,851,],[850,997,]),'frame_optional':([648,851,],[851,851,]),'frame_measurement':([648,851,],[852,852,]),'if_data_frame':([648,851,],[853,853,]),'unit_optional_list_optional':([656,],[857,]),'unit_optional_list':([656,860,],[859,1001,]),'unit_optional':([656,860,],[860,860,]),'si_exponents':([656,860,],[861,861,]),'ref_unit':([656,742,860,932,],[862,937,862,937,]),'unit_conversion':([656,860,],[863,863,]),'a2ml_constant':([663,669,],[868,871,]),'calibration_method_optional_list_optional':([685,],[877,]),'calibration_method_optional_list':([685,880,],[879,1011,]),'calibration_method_optional':([685,880,],[880,880,]),'calibration_handle':([685,880,],[881,881,]),'memory_segment_prg_type':([687,],[883,]),'compu_method_optional_list_optional':([742,],[929,]),'compu_method_optional_list':([742,932,],[931,1058,]),'compu_method_optional':([742,932,],[932,932,]),'formula':([742,932,],[933,933,]),'coeffs':([742,932,],[934,934,]),'coeffs_linear':([742,932,],[935,935,]),'compu_tab_ref':([742,932,],[936,936,]),'addrtype':([824,830,833,834,982,983,984,],[974,979,980,981,1076,1077,1078,]),'var_criterion_optional_list_optional':([838,],[985,]),'var_criterion_optional_list':([838,988,],[987,1080,]),'var_criterion_optional':([838,988,],[988,988,]),'var_measurement':([838,988,],[989,989,]),'var_selection_characteristic':([838,988,],[990,990,]),'memory_segment_memory_type':([883,],[1013,]),'pgm_optional_list_optional':([896,],[1024,]),'pgm_optional_list':([896,1027,],[1026,1119,]),'pgm_optional':([896,1027,],[1027,1027,]),'sector':([896,1027,],[1028,1028,]),'available_event_list_optional_list_optional':([899,900,],[1031,1036,]),'available_event_list_optional_list':([899,900,1034,],[1033,1033,1122,]),'available_event_list_optional':([899,900,1034,],[1034,1034,1034,]),'source_optional_list_optional':([918,],[1041,]),'source_optional_list':([918,1044,],[1043,1133,]),'source_optional':([918,1044,],[1044,1044,]),'display_identifier':([918,1044,1141,1182,1188,1253,1282,1340,],[1045,1045,1189,1254,1189,1254,1341,1341,]),'qp_blob':([918,1044,],[1046,1046,]),'string_list':([951,1065,],[1064,1147,]),'calibration_handle_optional_list_optional':([1009,],[1094,]),'calibration_handle_optional_list':([1009,1097,],[1096,1157,]),'calibration_handle_optional':([1009,1097,],[1097,1097,]),'memory_layout_optional_list_optional':([1012,],[1101,]),'memory_layout_optional_list':([1012,1104,],[1103,1160,]),'memory_layout_optional':([1012,1104,],[1104,1104,]),'if_data_memory_layout':([1012,1104,1182,1253,1282,1340,],[1105,1105,1280,1280,1354,1354,]),'memory_segment_attributes':([1013,],[1106,]),'optimisation_type':([1021,1428,1470,],[1110,1463,1463,]),'daq_list_can_id_optional_optional':([1039,],[1125,]),'daq_list_can_id_optional':([1039,],[1127,]),'daq_list_can_id_type_variable':([1039,],[1128,]),'daq_list_can_id_type_fixed':([1039,],[1129,]),'if_data_frame_optional_list_optional':([1085,],[1150,]),'if_data_frame_optional_list':([1085,1153,],[1152,1229,]),'if_data_frame_optional':([1085,1153,],[1153,1153,]),'address_extension':([1110,1428,1470,],[1163,1464,1464,]),'segment_optional_parameter_list_optional':([1120,],[1170,]),'segment_optional_parameter_list':([1120,1173,],[1172,1246,]),'segment_optional_parameter':([1120,1173,],[1173,1173,]),'page':([1120,1173,],[1174,1174,]),'measurement_optional_list_optional':([1141,],[1185,]),'measurement_optional_list':([1141,1188,],[1187,1287,]),'measurement_optional':([1141,1188,],[1188,1188,]),'read_write':([1141,1188,],[1190,1190,]),'format':([1141,1182,1188,1253,1282,1340,1555,1574,],[1191,1255,1191,1255,1343,1343,1576,1576,]),'array_size':([1141,1188,],[1192,1192,]),'bit_mask':([1141,1182,1188,1253,],[1193,1257,1193,1257,]),'bit_operation':([1141,1188,],[1194,1194,]),'max_refresh':([1141,1182,1188,1253,],[1196,1265,1196,1265,]),'virtual':([1141,1188,],[1197,1197,]),'ecu_address':([1141,1188,],[1199,1199,]),'symbol_link':([1141,1182,1188,1253,],[1200,1260,1200,1260,]),'error_mask':([1141,1188,],[1201,1201,]),'ref_memory_segment':([1141,1182,1188,1253,1282,1340,],[1202,1268,1202,1268,1347,1347,]),'if_data_measurement':([1141,1188,],[1205,1205,]),'matrix_dim':([1141,1182,1188,1253,],[1206,1274,1206,1274,]),'ecu_address_extension':([1141,1182,1188,1253,1282,1340,],[1207,1275,1207,1275,1353,1353,]),'formula_optional_list_optional':([1142,],[1219,]),'formula_optional_list':([1142,1222,],[1221,1299,]),'formula_optional':([1142,1222,],[1222,1222,]),'formula_inv':([1142,1222,],[1223,1223,]),'qp_data':([1154,],[1230,]),'identification_field_type':([1163,1428,1470,],[1238,1465,1465,]),'characteristic_optional_list_optional':([1182,],[1250,]),'characteristic_optional_list':([1182,1253,],[1252,1327,]),'characteristic_optional':([1182,1253,],[1253,1253,]),'number':([1182,1253,],[1259,1259,]),'extended_limits':([1182,1253,1282,1340,1555,1574,],[1261,1261,1349,1349,1582,1582,]),'guard_rails':([1182,1253,1282,1340,],[1263,1263,1348,1348,]),'map_list':([1182,1253,],[1264,1264,]),'dependent_characteristic':([1182,1253,],[1266,1266,]),'virtual_characteristic':([1182,1253,],[1267,1267,]),'comparison_quantity':([1182,1253,],[1270,1270,]),'if_data_characteristic':([1182,1253,],[1271,1271,]),'axis_descr':([1182,1253,],[1272,1272,]),'calibration_access':([1182,1253,1282,1340,],[1273,1273,1352,1352,]),'if_data_memory_layout_optional_list_optional':([1234,],[1304,]),'if_data_memory_layout_optional_list':([1234,1307,],[1306,1375,]),'if_data_memory_layout_optional':([1234,1307,],[1307,1307,]),'dp_blob':([1234,1307,1366,1413,],[1308,1308,1415,1415,]),'ba_blob':([1234,1307,],[1309,1309,]),'granularity_odt_entry':([1238,1428,1470,],[1314,1466,1466,]),'calibration_access_type':([1281,],[1331,]),'axis_pts_optional_list_optional':([1282,],[1337,]),'axis_pts_optional_list':([1282,1340,],[1339,1403,]),'axis_pts_optional':([1282,1340,],[1340,1340,]),'if_data_axis_pts':([1282,1340,],[1351,1351,]),'bit_operation_optional_list_optional':([1283,],[1355,]),'bit_operation_optional_list':([1283,1358,],[1357,1405,]),'bit_operation_optional':([1283,1358,],[1358,1358,]),'left_shift':([1283,1358,],[1359,1359,]),'right_shift':([1283,1358,],[1360,1360,]),'sign_extend':([1283,1358,],[1361,1361,]),'dp_data':([1308,1415,],[1376,1452,]),'pa_data':([1309,1416,],[1378,1453,]),'memory_segment_optional_list_optional':([1312,],[1381,]),'memory_segment_optional_parameter_list':([1312,1384,],[1383,1426,]),'memory_segment_optional':([1312,1384,],[1384,1384,]),'if_data_memory_segment':([1312,1384,],[1385,1385,]),'axis_descr_attribute':([1325,],[1394,]),'if_data_measurement_optional_parameter_list_optional':([1366,],[1410,]),'if_data_measurement_optional_parameter_list':([1366,1413,],[1412,1445,]),'if_data_measurement_optional_parameter':([1366,1413,],[1413,1413,]),'kp_blob':([1366,1413,],[1414,1414,]),'pa_blob':([1366,1413,],[1416,1416,]),'if_data_measurement_unsupported_element':([1366,1413,],[1417,1417,]),'overload_indication':([1388,],[1428,]),'virtual_characteristic_optional':([1393,],[1436,]),'kp_data':([1414,],[1446,]),'kp_data_parameter_optional_list':([1414,1448,],[1447,1488,]),'kp_data_parameter_optional':([1414,1448,],[1448,1448,]),'protocol_layer_optional_list_optional':([1427,],[1456,]),'protocol_layer_optional_list':([1427,1459,],[1458,1499,]),'protocol_layer_optional':([1427,1459,],[1459,1459,]),'daq_optional_list_optional':([1428,],[1467,]),'daq_optional_list':([1428,1470,],[1469,1505,]),'daq_optional':([1428,1470,],[1470,1470,]),'daq_list':([1428,1470,],[1471,1471,]),'event':([1428,1470,],[1472,1472,]),'timestamp_supported':([1428,1470,],[1473,1473,]),'stim':([1428,1470,],[1474,1474,]),'prescaler_supported':([1428,1470,],[1475,1475,]),'resume_supported':([1428,1470,],[1476,1476,]),'if_data_memory_segment_optional_list_optional':([1454,],[1490,]),'if_data_memory_segment_optional_list':([1454,1493,],[1492,1518,]),'if_data_memory_segment_optional':([1454,1493,],[1493,1493,]),'address_mapping':([1454,1493,],[1494,1494,]),'page_optional_parameter_list_optional':([1481,],[1507,]),'page_optional_parameter_list':([1481,1510,],[1509,1528,]),'page_optional_parameter':([1481,1510,],[1510,1510,]),'init_segment':([1481,1510,],[1511,1511,]),'daq_list_optional_list_optional':([1521,],[1534,]),'daq_list_optional_list':([1521,1537,],[1536,1558,]),'daq_list_optional':([1521,1537,],[1537,1537,]),'daq_list_type':([1521,1537,],[1538,1538,]),'max_odt':([1521,1537,],[1539,1539,]),'max_odt_entries':([1521,1537,],[1540,1540,]),'first_pid':([1521,1537,],[1541,1541,]),'event_fixed':([1521,1537,],[1542,1542,]),'predefined':([1521,1537,],[1543,1543,]),'daq_list_type_enum':([1544,1567,],[1559,1595,]),'axis_descr_optional_list_optional':([1555,],[1571,]),'axis_descr_optional_list':([1555,1574,],[1573,1602,]),'axis_descr_optional':([1555,1574,],[1574,1574,]),'axis_pts_ref':([1555,1574,],[1578,1578,]),'max_grad':([1555,1574,],[1579,1579,]),'monotony':([1555,1574,],[1580,1580,]),'fix_axis_par':([1555,1574,],[1583,1583,]),'fix_axis_par_dist':([1555,1574,],[1584,1584,]),'fix_axis_par_list':([1555,1574,],[1585,1585,]),'curve_axis_ref':([1555,1574,],[1587,1587,]),'timestamp_fixed':([1568,],[1596,]),'monotony_type':([1590,],[1605,]),}
+_lr_goto_items = {'a2l':([0,],[1,]),'a2l_optional_list_optional':([0,],[2,]),'empty':([0,19,31,42,86,111,112,113,114,115,116,117,118,128,142,256,257,356,358,359,397,446,516,521,538,558,564,565,566,579,580,591,592,593,594,595,596,597,601,602,603,647,648,656,685,742,838,897,900,901,919,1011,1014,1041,1087,1122,1143,1144,1184,1236,1284,1285,1314,1368,1395,1429,1430,1456,1483,1523,1557,1570,],[3,22,35,49,131,153,153,153,153,163,195,220,237,259,346,449,463,523,532,540,561,583,650,661,679,691,702,702,710,745,755,769,778,783,788,793,798,803,809,814,819,844,849,858,879,931,987,1027,1034,1034,1044,1097,1104,1128,1153,1173,1188,1222,1253,1307,1340,1358,1384,1413,1439,1459,1470,1493,1510,1537,1574,1599,]),'a2l_optional_list':([0,],[4,]),'a2l_optional':([0,4,],[5,12,]),'asap2_version':([0,4,],[6,6,]),'a2ml_version':([0,4,],[7,7,]),'project':([0,4,],[8,8,]),'project_optional_list_optional':([19,],[21,]),'project_optional_list':([19,],[23,]),'project_optional':([19,23,],[24,30,]),'header':([19,23,],[25,25,]),'module':([19,23,],[26,26,]),'header_optional_list_optional':([31,],[34,]),'header_optional_list':([31,],[36,]),'header_optional':([31,36,],[37,44,]),'version':([31,36,115,164,],[38,38,166,166,]),'project_no':([31,36,],[39,39,]),'module_optional_list_optional':([42,],[48,]),'module_optional_list':([42,],[50,]),'module_optional':([42,50,],[51,91,]),'a2ml':([42,50,],[52,52,]),'mod_par':([42,50,],[53,53,]),'mod_common':([42,50,],[54,54,]),'if_data_xcp':([42,50,1143,1189,1314,1385,],[55,55,1206,1206,1388,1388,]),'if_data_module':([42,50,],[56,56,]),'characteristic':([42,50,],[57,57,]),'axis_pts':([42,50,],[58,58,]),'measurement':([42,50,],[59,59,]),'compu_method':([42,50,],[60,60,]),'compu_tab':([42,50,],[61,61,]),'compu_vtab':([42,50,],[62,62,]),'compu_vtab_range':([42,50,],[63,63,]),'function':([42,50,],[64,64,]),'group':([42,50,],[65,65,]),'record_layout':([42,50,],[66,66,]),'variant_coding':([42,50,],[67,67,]),'frame':([42,50,],[68,68,]),'user_rights':([42,50,],[69,69,]),'unit':([42,50,],[70,70,]),'a2ml_declaration_list':([72,],[92,]),'a2ml_declaration':([72,92,],[93,146,]),'a2ml_type_definition':([72,92,],[94,94,]),'a2ml_block_definition':([72,92,358,359,533,536,541,],[95,95,537,544,537,674,544,]),'a2ml_type_name':([72,92,149,355,356,524,538,543,677,],[96,96,354,521,521,521,521,521,521,]),'a2ml_predefined_type_name':([72,92,149,355,356,524,538,543,677,],[98,98,98,98,98,98,98,98,98,]),'a2ml_struct_type_name':([72,92,149,355,356,524,538,543,677,],[99,99,99,99,99,99,99,99,99,]),'a2ml_enum_type_name':([72,92,149,355,356,524,538,543,677,],[100,100,100,100,100,100,100,100,100,]),'a2ml_taggedstruct_type_name':([72,92,149,355,356,524,538,543,677,],[101,101,101,101,101,101,101,101,101,]),'a2ml_taggedunion_type_name':([72,92,149,355,356,524,538,543,677,],[102,102,102,102,102,102,102,102,102,]),'variant_coding_optional_list_optional':([86,],[130,]),'variant_coding_optional_list':([86,],[132,]),'variant_coding_optional':([86,132,],[133,340,]),'var_separator':([86,132,],[134,134,]),'var_naming':([86,132,],[135,135,]),'var_criterion':([86,132,],[136,136,]),'var_forbidden_comb':([86,132,],[137,137,]),'var_characteristic':([86,132,],[138,138,]),'a2ml_tag':([97,358,359,533,536,541,],[149,538,543,538,538,543,]),'a2ml_identifier_optional':([111,112,113,114,],[151,155,157,159,]),'a2ml_identifier':([111,112,113,114,],[152,156,158,160,]),'mod_par_optional_list_optional':([115,],[162,]),'mod_par_optional_list':([115,],[164,]),'mod_par_optional':([115,164,],[165,364,]),'addr_epk':([115,164,],[167,167,]),'epk':([115,164,],[168,168,]),'supplier':([115,164,],[169,169,]),'customer':([115,164,],[170,170,]),'customer_no':([115,164,],[171,171,]),'user':([115,164,],[172,172,]),'phone_no':([115,164,],[173,173,]),'ecu':([115,164,],[174,174,]),'cpu_type':([115,164,],[175,175,]),'no_of_interfaces':([115,164,],[176,176,]),'ecu_calibration_offset':([115,164,],[177,177,]),'calibration_method':([115,164,],[178,178,]),'memory_layout':([115,164,],[179,179,]),'memory_segment':([115,164,],[180,180,]),'system_constant':([115,164,],[181,181,]),'mod_common_optional_list_optional':([116,],[194,]),'mod_common_optional_list':([116,],[196,]),'mod_common_optional':([116,196,],[197,378,]),'s_rec_layout':([116,196,],[198,198,]),'deposit':([116,196,1284,1341,1557,1575,],[199,199,1346,1346,1588,1588,]),'byte_order':([116,196,1143,1184,1189,1254,1284,1341,1557,1575,],[200,200,1197,1258,1197,1258,1347,1347,1583,1583,]),'data_size':([116,196,],[201,201,]),'alignment_byte':([116,128,196,260,],[202,295,202,295,]),'alignment_word':([116,128,196,260,],[203,296,203,296,]),'alignment_long':([116,128,196,260,],[204,297,204,297,]),'alignment_int64':([116,128,196,260,],[205,300,205,300,]),'alignment_float32_ieee':([116,128,196,260,],[206,298,206,298,]),'alignment_float64_ieee':([116,128,196,260,],[207,299,207,299,]),'if_data_xcp_optional_list_optional':([117,],[219,]),'if_data_xcp_optional_list':([117,],[221,]),'if_data_xcp_optional':([117,221,],[222,402,]),'protocol_layer':([117,221,],[223,223,]),'daq':([117,221,],[224,224,]),'pag':([117,221,],[225,225,]),'pgm':([117,221,],[226,226,]),'segment':([117,221,1456,1494,],[227,227,1497,1497,]),'daq_event':([117,221,],[228,228,]),'xcp_on_can':([117,221,],[229,229,]),'generic_parameter_list':([117,118,221,238,245,397,558,692,897,1028,1310,1311,1417,1418,1429,1445,1460,1523,1538,],[230,248,230,248,413,562,695,695,1031,1031,1379,1381,1379,1381,1462,1488,1462,1551,1551,]),'generic_parameter':([117,118,221,230,238,245,248,397,413,558,562,692,695,897,1028,1031,1156,1310,1311,1379,1381,1417,1418,1429,1445,1456,1460,1462,1488,1494,1523,1538,1551,],[233,233,233,403,233,233,403,233,403,233,403,233,403,233,233,403,1233,233,233,403,403,233,233,233,233,1498,233,403,403,1498,233,233,403,]),'if_data_module_optional_list_optional':([118,],[236,]),'if_data_module_optional_list':([118,],[238,]),'if_data_module_optional':([118,238,],[239,411,]),'source':([118,238,],[240,240,]),'raster':([118,238,],[241,241,]),'event_group':([118,238,],[242,242,]),'seed_key':([118,238,],[243,243,]),'checksum':([118,238,1122,1174,],[244,244,1177,1177,]),'tp_blob':([118,238,],[245,245,]),'if_data_module_unsupported_element':([118,238,],[246,246,]),'record_layout_optional_list_optional':([128,],[258,]),'record_layout_optional_list':([128,],[260,]),'record_layout_optional':([128,260,],[261,474,]),'fnc_values':([128,260,],[262,262,]),'identification':([128,260,],[263,263,]),'axis_pts_x':([128,260,],[264,264,]),'axis_pts_y':([128,260,],[265,265,]),'axis_pts_z':([128,260,],[266,266,]),'axis_rescale_x':([128,260,],[267,267,]),'axis_rescale_y':([128,260,],[268,268,]),'axis_rescale_z':([128,260,],[269,269,]),'no_axis_pts_x':([128,260,],[270,270,]),'no_axis_pts_y':([128,260,],[271,271,]),'no_axis_pts_z':([128,260,],[272,272,]),'no_rescale_x':([128,260,],[273,273,]),'no_rescale_y':([128,260,],[274,274,]),'no_rescale_z':([128,260,],[275,275,]),'fix_no_axis_pts_x':([128,260,],[276,276,]),'fix_no_axis_pts_y':([128,260,],[277,277,]),'fix_no_axis_pts_z':([128,260,],[278,278,]),'src_addr_x':([128,260,],[279,279,]),'src_addr_y':([128,260,],[280,280,]),'src_addr_z':([128,260,],[281,281,]),'rip_addr_x':([128,260,],[282,282,]),'rip_addr_y':([128,260,],[283,283,]),'rip_addr_z':([128,260,],[284,284,]),'rip_addr_w':([128,260,],[285,285,]),'shift_op_x':([128,260,],[286,286,]),'shift_op_y':([128,260,],[287,287,]),'shift_op_z':([128,260,],[288,288,]),'offset_x':([128,260,],[289,289,]),'offset_y':([128,260,],[290,290,]),'offset_z':([128,260,],[291,291,]),'dist_op_x':([128,260,],[292,292,]),'dist_op_y':([128,260,],[293,293,]),'dist_op_z':([128,260,],[294,294,]),'reserved':([128,260,],[301,301,]),'user_rights_optional_list_optional':([142,],[345,]),'user_rights_optional_list':([142,],[347,]),'user_rights_optional':([142,347,],[348,518,]),'ref_group':([142,347,],[349,349,]),'read_only':([142,347,1184,1254,1284,1341,1557,1575,],[350,350,1264,1264,1344,1344,1577,1577,]),'deposit_mode':([209,],[380,]),'byte_order_type':([210,],[383,]),'tp_data':([245,],[412,]),'characteristic_type':([249,],[414,]),'datatype':([251,475,476,477,478,479,480,481,482,483,484,485,486,487,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,],[422,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,]),'compu_method_conversion_type':([252,],[433,]),'compu_tab_conversion_type':([253,],[441,]),'compu_vtab_conversion_type':([254,],[444,]),'function_optional_list_optional':([256,],[448,]),'function_optional_list':([256,],[450,]),'function_optional':([256,450,],[451,599,]),'annotation':([256,257,450,464,1143,1184,1189,1254,1284,1341,1557,1575,],[452,466,452,466,1205,1271,1205,1271,1352,1352,1579,1579,]),'def_characteristic':([256,450,],[453,453,]),'ref_characteristic':([256,257,450,464,],[454,468,454,468,]),'in_measurement':([256,450,],[455,455,]),'out_measurement':([256,450,],[456,456,]),'loc_measurement':([256,450,],[457,457,]),'sub_function':([256,450,],[458,458,]),'function_version':([256,450,],[459,459,]),'group_optional_list_optional':([257,],[462,]),'group_optional_list':([257,],[464,]),'group_optional':([257,464,],[465,605,]),'root':([257,464,],[467,467,]),'ref_measurement':([257,464,],[469,469,]),'function_list':([257,464,1143,1184,1189,1254,1284,1341,],[470,470,1200,1260,1200,1260,1348,1348,]),'sub_group':([257,464,],[471,471,]),'var_forbidden_comb_criterion_list':([337,],[510,]),'var_forbidden_comb_criterion_optional':([337,511,644,],[511,643,840,]),'a2ml_member':([355,356,524,538,543,677,],[520,526,526,678,683,875,]),'a2ml_struct_member_list_optional':([356,],[522,]),'a2ml_struct_member_list':([356,],[524,]),'a2ml_struct_member':([356,524,],[525,665,]),'a2ml_enumerator_list':([357,],[527,]),'a2ml_enumerator':([357,668,],[528,871,]),'a2ml_keyword':([357,668,],[529,529,]),'a2ml_taggedstruct_member_list_optional':([358,],[531,]),'a2ml_taggedstruct_member_list':([358,],[533,]),'a2ml_taggedstruct_member':([358,533,],[534,671,]),'a2ml_taggedstruct_definition':([358,533,536,],[535,535,673,]),'a2ml_taggedunion_member_list_optional':([359,],[539,]),'a2ml_taggedunion_member_list':([359,],[541,]),'a2ml_taggedunion_member':([359,541,],[542,681,]),'memory_layout_prg_type':([361,],[546,]),'daq_config_type':([394,],[555,]),'generic_parameter_list_optional':([397,],[560,]),'compu_vtab_range_optional_list_optional':([446,],[582,]),'compu_vtab_range_optional_list':([446,],[584,]),'compu_vtab_range_optional':([446,584,],[585,764,]),'default_value':([446,579,580,584,746,756,],[586,749,758,586,749,758,]),'compu_vtab_range_in_val_out_val':([446,584,],[587,587,]),'number_number_string_value_list':([446,584,],[589,589,]),'number_number_string_value':([446,584,589,],[590,590,766,]),'datasize':([508,],[637,]),'var_forbidden_comb_criterion_optional_list':([511,],[644,]),'ident_list':([513,641,854,1286,1324,1394,1395,],[647,838,999,1367,1393,1437,1440,]),'ref_group_optional_list_optional':([516,],[649,]),'ref_group_optional_list':([516,],[651,]),'ref_group_optional':([516,651,],[652,856,]),'identifier':([516,592,593,594,595,596,597,601,603,651,779,784,789,794,799,804,810,820,],[653,781,786,791,796,801,806,812,822,653,781,786,791,796,801,806,812,822,]),'unit_type':([519,],[656,]),'a2ml_array_specifier_optional':([521,],[660,]),'a2ml_array_specifier':([521,],[662,]),'a2ml_member_optional':([538,],[676,]),'pag_optional_list_optional':([558,],[690,]),'pag_optional_list':([558,],[692,]),'pag_optional':([558,692,],[693,896,]),'freeze_supported':([558,692,],[694,694,]),'daq_event_optional_list_optional':([564,565,],[701,707,]),'daq_event_optional_list':([564,565,],[703,703,]),'daq_event_optional':([564,565,703,],[704,704,903,]),'available_event_list':([564,565,703,],[705,705,705,]),'default_event_list':([564,565,703,],[706,706,706,]),'xcp_on_can_optional_list_optional':([566,],[709,]),'xcp_on_can_optional_list':([566,],[711,]),'xcp_on_can_optional':([566,711,],[712,907,]),'can_id_broadcast':([566,711,],[713,713,]),'can_id_master':([566,711,],[714,714,]),'can_id_slave':([566,711,],[715,715,]),'baudrate':([566,711,],[716,716,]),'sample_point':([566,711,],[717,717,]),'sample_rate':([566,711,],[718,718,]),'btl_cycles':([566,711,],[719,719,]),'sjw':([566,711,],[720,720,]),'sync_edge':([566,711,],[721,721,]),'daq_list_can_id':([566,711,],[722,722,]),'max_block_size':([573,],[737,]),'compu_tab_optional_list_optional':([579,],[744,]),'compu_tab_optional_list':([579,],[746,]),'compu_tab_optional':([579,746,],[747,943,]),'in_val_out_val':([579,746,],[748,748,]),'default_value_numeric':([579,746,],[750,750,]),'number_list':([579,734,746,883,994,1238,1602,],[751,921,751,1014,1085,1314,1617,]),'compu_vtab_optional_list_optional':([580,],[754,]),'compu_vtab_optional_list':([580,],[756,]),'compu_vtab_optional':([580,756,],[757,948,]),'compu_vtab_in_val_out_val':([580,756,],[759,759,]),'number_string_value_list':([580,756,],[760,760,]),'number_string_value':([580,756,760,],[761,761,949,]),'annotation_optional_list_optional':([591,],[768,]),'annotation_optional_list':([591,],[770,]),'annotation_optional':([591,770,],[771,954,]),'annotation_label':([591,770,],[772,772,]),'annotation_origin':([591,770,],[773,773,]),'annotation_text':([591,770,],[774,774,]),'def_characteristic_optional_list_optional':([592,],[777,]),'def_characteristic_optional_list':([592,],[779,]),'def_characteristic_optional':([592,779,],[780,958,]),'ref_characteristic_optional_list_optional':([593,],[782,]),'ref_characteristic_optional_list':([593,],[784,]),'ref_characteristic_optional':([593,784,],[785,960,]),'in_measurement_optional_list_optional':([594,],[787,]),'in_measurement_optional_list':([594,],[789,]),'in_measurement_optional':([594,789,],[790,962,]),'out_measurement_optional_list_optional':([595,],[792,]),'out_measurement_optional_list':([595,],[794,]),'out_measurement_optional':([595,794,],[795,964,]),'loc_measurement_optional_list_optional':([596,],[797,]),'loc_measurement_optional_list':([596,],[799,]),'loc_measurement_optional':([596,799,],[800,966,]),'sub_function_optional_list_optional':([597,],[802,]),'sub_function_optional_list':([597,],[804,]),'sub_function_optional':([597,804,],[805,968,]),'ref_measurement_optional_list_optional':([601,],[808,]),'ref_measurement_optional_list':([601,],[810,]),'ref_measurement_optional':([601,810,],[811,970,]),'function_list_optional_list_optional':([602,],[813,]),'function_list_optional_list':([602,],[815,]),'function_list_optional':([602,815,],[816,972,]),'sub_group_optional_list_optional':([603,],[818,]),'sub_group_optional_list':([603,],[820,]),'sub_group_optional':([603,820,],[821,974,]),'fnc_values_index_mode':([607,],[824,]),'indexorder':([609,610,611,835,836,837,],[830,833,834,983,984,985,]),'var_characteristic_optional_optional':([647,],[843,]),'var_characteristic_optional':([647,],[845,]),'var_address':([647,],[846,]),'frame_optional_list_optional':([648,],[848,]),'frame_optional_list':([648,],[850,]),'frame_optional':([648,850,],[851,998,]),'frame_measurement':([648,850,],[852,852,]),'if_data_frame':([648,850,],[853,853,]),'unit_optional_list_optional':([656,],[857,]),'unit_optional_list':([656,],[859,]),'unit_optional':([656,859,],[860,1002,]),'si_exponents':([656,859,],[861,861,]),'ref_unit':([656,742,859,932,],[862,938,862,938,]),'unit_conversion':([656,859,],[863,863,]),'a2ml_constant':([663,669,868,],[869,872,1006,]),'calibration_method_optional_list_optional':([685,],[878,]),'calibration_method_optional_list':([685,],[880,]),'calibration_method_optional':([685,880,],[881,1013,]),'calibration_handle':([685,880,],[882,882,]),'memory_segment_prg_type':([687,],[884,]),'compu_method_optional_list_optional':([742,],[930,]),'compu_method_optional_list':([742,],[932,]),'compu_method_optional':([742,932,],[933,1060,]),'formula':([742,932,],[934,934,]),'coeffs':([742,932,],[935,935,]),'coeffs_linear':([742,932,],[936,936,]),'compu_tab_ref':([742,932,],[937,937,]),'addrtype':([824,830,833,834,983,984,985,],[975,980,981,982,1078,1079,1080,]),'var_criterion_optional_list_optional':([838,],[986,]),'var_criterion_optional_list':([838,],[988,]),'var_criterion_optional':([838,988,],[989,1082,]),'var_measurement':([838,988,],[990,990,]),'var_selection_characteristic':([838,988,],[991,991,]),'memory_segment_memory_type':([884,],[1015,]),'pgm_optional_list_optional':([897,],[1026,]),'pgm_optional_list':([897,],[1028,]),'pgm_optional':([897,1028,],[1029,1121,]),'sector':([897,1028,],[1030,1030,]),'available_event_list_optional_list_optional':([900,901,],[1033,1038,]),'available_event_list_optional_list':([900,901,],[1035,1035,]),'available_event_list_optional':([900,901,1035,],[1036,1036,1124,]),'source_optional_list_optional':([919,],[1043,]),'source_optional_list':([919,],[1045,]),'source_optional':([919,1045,],[1046,1135,]),'display_identifier':([919,1045,1143,1184,1189,1254,1284,1341,],[1047,1047,1191,1256,1191,1256,1343,1343,]),'qp_blob':([919,1045,],[1048,1048,]),'string_list':([952,],[1066,]),'calibration_handle_optional_list_optional':([1011,],[1096,]),'calibration_handle_optional_list':([1011,],[1098,]),'calibration_handle_optional':([1011,1098,],[1099,1159,]),'memory_layout_optional_list_optional':([1014,],[1103,]),'memory_layout_optional_list':([1014,],[1105,]),'memory_layout_optional':([1014,1105,],[1106,1162,]),'if_data_memory_layout':([1014,1105,1184,1254,1284,1341,],[1107,1107,1282,1282,1356,1356,]),'memory_segment_attributes':([1015,],[1108,]),'optimisation_type':([1023,1430,1471,],[1112,1465,1465,]),'daq_list_can_id_optional_optional':([1041,],[1127,]),'daq_list_can_id_optional':([1041,],[1129,]),'daq_list_can_id_type_variable':([1041,],[1130,]),'daq_list_can_id_type_fixed':([1041,],[1131,]),'if_data_frame_optional_list_optional':([1087,],[1152,]),'if_data_frame_optional_list':([1087,],[1154,]),'if_data_frame_optional':([1087,1154,],[1155,1231,]),'address_extension':([1112,1430,1471,],[1165,1466,1466,]),'segment_optional_parameter_list_optional':([1122,],[1172,]),'segment_optional_parameter_list':([1122,],[1174,]),'segment_optional_parameter':([1122,1174,],[1175,1248,]),'page':([1122,1174,],[1176,1176,]),'measurement_optional_list_optional':([1143,],[1187,]),'measurement_optional_list':([1143,],[1189,]),'measurement_optional':([1143,1189,],[1190,1289,]),'read_write':([1143,1189,],[1192,1192,]),'format':([1143,1184,1189,1254,1284,1341,1557,1575,],[1193,1257,1193,1257,1345,1345,1578,1578,]),'array_size':([1143,1189,],[1194,1194,]),'bit_mask':([1143,1184,1189,1254,],[1195,1259,1195,1259,]),'bit_operation':([1143,1189,],[1196,1196,]),'max_refresh':([1143,1184,1189,1254,],[1198,1267,1198,1267,]),'virtual':([1143,1189,],[1199,1199,]),'ecu_address':([1143,1189,],[1201,1201,]),'symbol_link':([1143,1184,1189,1254,],[1202,1262,1202,1262,]),'error_mask':([1143,1189,],[1203,1203,]),'ref_memory_segment':([1143,1184,1189,1254,1284,1341,],[1204,1270,1204,1270,1349,1349,]),'if_data_measurement':([1143,1189,],[1207,1207,]),'matrix_dim':([1143,1184,1189,1254,],[1208,1276,1208,1276,]),'ecu_address_extension':([1143,1184,1189,1254,1284,1341,],[1209,1277,1209,1277,1355,1355,]),'formula_optional_list_optional':([1144,],[1221,]),'formula_optional_list':([1144,],[1223,]),'formula_optional':([1144,1223,],[1224,1301,]),'formula_inv':([1144,1223,],[1225,1225,]),'qp_data':([1156,],[1232,]),'identification_field_type':([1165,1430,1471,],[1240,1467,1467,]),'characteristic_optional_list_optional':([1184,],[1252,]),'characteristic_optional_list':([1184,],[1254,]),'characteristic_optional':([1184,1254,],[1255,1329,]),'number':([1184,1254,],[1261,1261,]),'extended_limits':([1184,1254,1284,1341,1557,1575,],[1263,1263,1351,1351,1584,1584,]),'guard_rails':([1184,1254,1284,1341,],[1265,1265,1350,1350,]),'map_list':([1184,1254,],[1266,1266,]),'dependent_characteristic':([1184,1254,],[1268,1268,]),'virtual_characteristic':([1184,1254,],[1269,1269,]),'comparison_quantity':([1184,1254,],[1272,1272,]),'if_data_characteristic':([1184,1254,],[1273,1273,]),'axis_descr':([1184,1254,],[1274,1274,]),'calibration_access':([1184,1254,1284,1341,],[1275,1275,1354,1354,]),'if_data_memory_layout_optional_list_optional':([1236,],[1306,]),'if_data_memory_layout_optional_list':([1236,],[1308,]),'if_data_memory_layout_optional':([1236,1308,],[1309,1377,]),'dp_blob':([1236,1308,1368,1414,],[1310,1310,1417,1417,]),'ba_blob':([1236,1308,],[1311,1311,]),'granularity_odt_entry':([1240,1430,1471,],[1316,1468,1468,]),'calibration_access_type':([1283,],[1333,]),'axis_pts_optional_list_optional':([1284,],[1339,]),'axis_pts_optional_list':([1284,],[1341,]),'axis_pts_optional':([1284,1341,],[1342,1405,]),'if_data_axis_pts':([1284,1341,],[1353,1353,]),'bit_operation_optional_list_optional':([1285,],[1357,]),'bit_operation_optional_list':([1285,],[1359,]),'bit_operation_optional':([1285,1359,],[1360,1407,]),'left_shift':([1285,1359,],[1361,1361,]),'right_shift':([1285,1359,],[1362,1362,]),'sign_extend':([1285,1359,],[1363,1363,]),'dp_data':([1310,1417,],[1378,1454,]),'pa_data':([1311,1418,],[1380,1455,]),'memory_segment_optional_list_optional':([1314,],[1383,]),'memory_segment_optional_parameter_list':([1314,],[1385,]),'memory_segment_optional':([1314,1385,],[1386,1428,]),'if_data_memory_segment':([1314,1385,],[1387,1387,]),'axis_descr_attribute':([1327,],[1396,]),'if_data_measurement_optional_parameter_list_optional':([1368,],[1412,]),'if_data_measurement_optional_parameter_list':([1368,],[1414,]),'if_data_measurement_optional_parameter':([1368,1414,],[1415,1447,]),'kp_blob':([1368,1414,],[1416,1416,]),'pa_blob':([1368,1414,],[1418,1418,]),'if_data_measurement_unsupported_element':([1368,1414,],[1419,1419,]),'overload_indication':([1390,],[1430,]),'virtual_characteristic_optional':([1395,],[1438,]),'kp_data':([1416,],[1448,]),'kp_data_parameter_optional_list':([1416,],[1449,]),'kp_data_parameter_optional':([1416,1449,],[1450,1490,]),'protocol_layer_optional_list_optional':([1429,],[1458,]),'protocol_layer_optional_list':([1429,],[1460,]),'protocol_layer_optional':([1429,1460,],[1461,1501,]),'daq_optional_list_optional':([1430,],[1469,]),'daq_optional_list':([1430,],[1471,]),'daq_optional':([1430,1471,],[1472,1507,]),'daq_list':([1430,1471,],[1473,1473,]),'event':([1430,1471,],[1474,1474,]),'timestamp_supported':([1430,1471,],[1475,1475,]),'stim':([1430,1471,],[1476,1476,]),'prescaler_supported':([1430,1471,],[1477,1477,]),'resume_supported':([1430,1471,],[1478,1478,]),'if_data_memory_segment_optional_list_optional':([1456,],[1492,]),'if_data_memory_segment_optional_list':([1456,],[1494,]),'if_data_memory_segment_optional':([1456,1494,],[1495,1520,]),'address_mapping':([1456,1494,],[1496,1496,]),'page_optional_parameter_list_optional':([1483,],[1509,]),'page_optional_parameter_list':([1483,],[1511,]),'page_optional_parameter':([1483,1511,],[1512,1530,]),'init_segment':([1483,1511,],[1513,1513,]),'daq_list_optional_list_optional':([1523,],[1536,]),'daq_list_optional_list':([1523,],[1538,]),'daq_list_optional':([1523,1538,],[1539,1560,]),'daq_list_type':([1523,1538,],[1540,1540,]),'max_odt':([1523,1538,],[1541,1541,]),'max_odt_entries':([1523,1538,],[1542,1542,]),'first_pid':([1523,1538,],[1543,1543,]),'event_fixed':([1523,1538,],[1544,1544,]),'predefined':([1523,1538,],[1545,1545,]),'daq_list_type_enum':([1546,1569,],[1561,1597,]),'axis_descr_optional_list_optional':([1557,],[1573,]),'axis_descr_optional_list':([1557,],[1575,]),'axis_descr_optional':([1557,1575,],[1576,1604,]),'axis_pts_ref':([1557,1575,],[1580,1580,]),'max_grad':([1557,1575,],[1581,1581,]),'monotony':([1557,1575,],[1582,1582,]),'fix_axis_par':([1557,1575,],[1585,1585,]),'fix_axis_par_dist':([1557,1575,],[1586,1586,]),'fix_axis_par_list':([1557,1575,],[1587,1587,]),'curve_axis_ref':([1557,1575,],[1589,1589,]),'timestamp_fixed':([1570,],[1598,]),'monotony_type':([1592,],[1607,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,954 +27,954 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> a2l","S'",1,None,None,None),
-  ('a2l -> a2l_optional_list_optional','a2l',1,'p_a2l','parser.py',55),
-  ('a2l_optional -> asap2_version','a2l_optional',1,'p_a2l_optional','parser.py',60),
-  ('a2l_optional -> a2ml_version','a2l_optional',1,'p_a2l_optional','parser.py',61),
-  ('a2l_optional -> project','a2l_optional',1,'p_a2l_optional','parser.py',62),
-  ('a2l_optional_list -> a2l_optional','a2l_optional_list',1,'p_a2l_optional_list','parser.py',67),
-  ('a2l_optional_list -> a2l_optional a2l_optional_list','a2l_optional_list',2,'p_a2l_optional_list','parser.py',68),
-  ('a2l_optional_list_optional -> empty','a2l_optional_list_optional',1,'p_a2l_optional_list_optional','parser.py',76),
-  ('a2l_optional_list_optional -> a2l_optional_list','a2l_optional_list_optional',1,'p_a2l_optional_list_optional','parser.py',77),
-  ('a2ml_declaration -> a2ml_type_definition SEMICOLON','a2ml_declaration',2,'p_a2ml_declaration','parser.py',82),
-  ('a2ml_declaration -> a2ml_block_definition SEMICOLON','a2ml_declaration',2,'p_a2ml_declaration','parser.py',83),
-  ('a2ml_declaration_list -> a2ml_declaration','a2ml_declaration_list',1,'p_a2ml_declaration_list','parser.py',88),
-  ('a2ml_declaration_list -> a2ml_declaration a2ml_declaration_list','a2ml_declaration_list',2,'p_a2ml_declaration_list','parser.py',89),
-  ('a2ml_type_definition -> a2ml_type_name','a2ml_type_definition',1,'p_a2ml_type_definition','parser.py',97),
-  ('a2ml_type_name -> a2ml_predefined_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',102),
-  ('a2ml_type_name -> a2ml_struct_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',103),
-  ('a2ml_type_name -> a2ml_enum_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',104),
-  ('a2ml_type_name -> a2ml_taggedstruct_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',105),
-  ('a2ml_type_name -> a2ml_taggedunion_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',106),
-  ('a2ml_predefined_type_name -> char','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',111),
-  ('a2ml_predefined_type_name -> int','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',112),
-  ('a2ml_predefined_type_name -> long','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',113),
-  ('a2ml_predefined_type_name -> uchar','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',114),
-  ('a2ml_predefined_type_name -> uint','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',115),
-  ('a2ml_predefined_type_name -> ulong','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',116),
-  ('a2ml_predefined_type_name -> double','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',117),
-  ('a2ml_predefined_type_name -> float','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',118),
-  ('a2ml_block_definition -> block a2ml_tag a2ml_type_name','a2ml_block_definition',3,'p_a2ml_block_definition','parser.py',123),
-  ('a2ml_block_definition -> block a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISK','a2ml_block_definition',6,'p_a2ml_block_definition','parser.py',124),
-  ('a2ml_enum_type_name -> enum a2ml_identifier_optional CURLY_OPEN a2ml_enumerator_list CURLY_CLOSE','a2ml_enum_type_name',5,'p_a2ml_enum_type_name','parser.py',128),
-  ('a2ml_enum_type_name -> enum a2ml_identifier','a2ml_enum_type_name',2,'p_a2ml_enum_type_name','parser.py',129),
-  ('a2ml_enumerator_list -> a2ml_enumerator','a2ml_enumerator_list',1,'p_a2ml_enumerator_list','parser.py',137),
-  ('a2ml_enumerator_list -> a2ml_enumerator COMMA a2ml_enumerator_list','a2ml_enumerator_list',3,'p_a2ml_enumerator_list','parser.py',138),
-  ('a2ml_enumerator -> a2ml_keyword EQUAL a2ml_constant','a2ml_enumerator',3,'p_a2ml_enumerator','parser.py',146),
-  ('a2ml_enumerator -> a2ml_keyword','a2ml_enumerator',1,'p_a2ml_enumerator','parser.py',147),
-  ('a2ml_struct_type_name -> struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE','a2ml_struct_type_name',5,'p_a2ml_struct_type_name','parser.py',152),
-  ('a2ml_struct_type_name -> struct a2ml_identifier','a2ml_struct_type_name',2,'p_a2ml_struct_type_name','parser.py',153),
-  ('a2ml_struct_member_list_optional -> empty','a2ml_struct_member_list_optional',1,'p_a2ml_struct_member_list_optional','parser.py',158),
-  ('a2ml_struct_member_list_optional -> a2ml_struct_member_list','a2ml_struct_member_list_optional',1,'p_a2ml_struct_member_list_optional','parser.py',159),
-  ('a2ml_struct_member_list -> a2ml_struct_member','a2ml_struct_member_list',1,'p_a2ml_struct_member_list','parser.py',164),
-  ('a2ml_struct_member_list -> a2ml_struct_member a2ml_struct_member_list','a2ml_struct_member_list',2,'p_a2ml_struct_member_list','parser.py',165),
-  ('a2ml_struct_member -> a2ml_member SEMICOLON','a2ml_struct_member',2,'p_a2ml_struct_member','parser.py',173),
-  ('a2ml_member -> a2ml_type_name a2ml_array_specifier_optional','a2ml_member',2,'p_a2ml_member','parser.py',178),
-  ('a2ml_member_optional -> empty','a2ml_member_optional',1,'p_a2ml_member_optional','parser.py',183),
-  ('a2ml_member_optional -> a2ml_member','a2ml_member_optional',1,'p_a2ml_member_optional','parser.py',184),
-  ('a2ml_array_specifier_optional -> empty','a2ml_array_specifier_optional',1,'p_a2ml_array_specifier_optional','parser.py',189),
-  ('a2ml_array_specifier_optional -> a2ml_array_specifier','a2ml_array_specifier_optional',1,'p_a2ml_array_specifier_optional','parser.py',190),
-  ('a2ml_array_specifier -> BRACE_OPEN a2ml_constant BRACE_CLOSE','a2ml_array_specifier',3,'p_a2ml_array_specifier','parser.py',195),
-  ('a2ml_array_specifier -> BRACE_OPEN a2ml_constant BRACE_CLOSE a2ml_array_specifier','a2ml_array_specifier',4,'p_a2ml_array_specifier','parser.py',196),
-  ('a2ml_taggedstruct_type_name -> taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE','a2ml_taggedstruct_type_name',5,'p_a2ml_taggedstruct_type_name','parser.py',201),
-  ('a2ml_taggedstruct_type_name -> taggedstruct a2ml_identifier','a2ml_taggedstruct_type_name',2,'p_a2ml_taggedstruct_type_name','parser.py',202),
-  ('a2ml_taggedstruct_member_list_optional -> empty','a2ml_taggedstruct_member_list_optional',1,'p_a2ml_taggedstruct_member_list_optional','parser.py',207),
-  ('a2ml_taggedstruct_member_list_optional -> a2ml_taggedstruct_member_list','a2ml_taggedstruct_member_list_optional',1,'p_a2ml_taggedstruct_member_list_optional','parser.py',208),
-  ('a2ml_taggedstruct_member_list -> a2ml_taggedstruct_member','a2ml_taggedstruct_member_list',1,'p_a2ml_taggedstruct_member_list','parser.py',213),
-  ('a2ml_taggedstruct_member_list -> a2ml_taggedstruct_member a2ml_taggedstruct_member_list','a2ml_taggedstruct_member_list',2,'p_a2ml_taggedstruct_member_list','parser.py',214),
-  ('a2ml_taggedstruct_member -> a2ml_taggedstruct_definition SEMICOLON','a2ml_taggedstruct_member',2,'p_a2ml_taggedstruct_member','parser.py',222),
-  ('a2ml_taggedstruct_member -> PARENTHESE_OPEN a2ml_taggedstruct_definition PARENTHESE_CLOSE ASTERISK SEMICOLON','a2ml_taggedstruct_member',5,'p_a2ml_taggedstruct_member','parser.py',223),
-  ('a2ml_taggedstruct_member -> a2ml_block_definition SEMICOLON','a2ml_taggedstruct_member',2,'p_a2ml_taggedstruct_member','parser.py',224),
-  ('a2ml_taggedstruct_member -> PARENTHESE_OPEN a2ml_block_definition PARENTHESE_CLOSE ASTERISK SEMICOLON','a2ml_taggedstruct_member',5,'p_a2ml_taggedstruct_member','parser.py',225),
-  ('a2ml_taggedstruct_definition -> a2ml_tag a2ml_member_optional','a2ml_taggedstruct_definition',2,'p_a2ml_taggedstruct_definition','parser.py',229),
-  ('a2ml_taggedstruct_definition -> a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISK','a2ml_taggedstruct_definition',5,'p_a2ml_taggedstruct_definition','parser.py',230),
-  ('a2ml_taggedunion_type_name -> taggedunion a2ml_identifier_optional CURLY_OPEN a2ml_taggedunion_member_list_optional CURLY_CLOSE','a2ml_taggedunion_type_name',5,'p_a2ml_taggedunion_type_name','parser.py',235),
-  ('a2ml_taggedunion_type_name -> taggedunion a2ml_identifier','a2ml_taggedunion_type_name',2,'p_a2ml_taggedunion_type_name','parser.py',236),
-  ('a2ml_taggedunion_member_list -> a2ml_taggedunion_member','a2ml_taggedunion_member_list',1,'p_a2ml_taggedunion_member_list','parser.py',240),
-  ('a2ml_taggedunion_member_list -> a2ml_taggedunion_member a2ml_taggedunion_member_list','a2ml_taggedunion_member_list',2,'p_a2ml_taggedunion_member_list','parser.py',241),
-  ('a2ml_taggedunion_member_list_optional -> empty','a2ml_taggedunion_member_list_optional',1,'p_a2ml_taggedunion_member_list_optional','parser.py',249),
-  ('a2ml_taggedunion_member_list_optional -> a2ml_taggedunion_member_list','a2ml_taggedunion_member_list_optional',1,'p_a2ml_taggedunion_member_list_optional','parser.py',250),
-  ('a2ml_taggedunion_member -> a2ml_tag SEMICOLON','a2ml_taggedunion_member',2,'p_a2ml_taggedunion_member','parser.py',255),
-  ('a2ml_taggedunion_member -> a2ml_tag a2ml_member SEMICOLON','a2ml_taggedunion_member',3,'p_a2ml_taggedunion_member','parser.py',256),
-  ('a2ml_taggedunion_member -> a2ml_block_definition SEMICOLON','a2ml_taggedunion_member',2,'p_a2ml_taggedunion_member','parser.py',257),
-  ('a2ml_tag -> STRING','a2ml_tag',1,'p_a2ml_tag','parser.py',261),
-  ('a2ml_identifier -> IDENT','a2ml_identifier',1,'p_a2ml_identifier','parser.py',265),
-  ('a2ml_identifier_optional -> empty','a2ml_identifier_optional',1,'p_a2ml_identifier_optional','parser.py',269),
-  ('a2ml_identifier_optional -> a2ml_identifier','a2ml_identifier_optional',1,'p_a2ml_identifier_optional','parser.py',270),
-  ('a2ml_keyword -> STRING','a2ml_keyword',1,'p_a2ml_keyword','parser.py',274),
-  ('a2ml_constant -> NUMERIC','a2ml_constant',1,'p_a2ml_constant','parser.py',278),
-  ('datatype -> UBYTE','datatype',1,'p_datatype','parser.py',282),
-  ('datatype -> SBYTE','datatype',1,'p_datatype','parser.py',283),
-  ('datatype -> UWORD','datatype',1,'p_datatype','parser.py',284),
-  ('datatype -> SWORD','datatype',1,'p_datatype','parser.py',285),
-  ('datatype -> ULONG','datatype',1,'p_datatype','parser.py',286),
-  ('datatype -> SLONG','datatype',1,'p_datatype','parser.py',287),
-  ('datatype -> A_UINT64','datatype',1,'p_datatype','parser.py',288),
-  ('datatype -> A_INT64','datatype',1,'p_datatype','parser.py',289),
-  ('datatype -> FLOAT32_IEEE','datatype',1,'p_datatype','parser.py',290),
-  ('datatype -> FLOAT64_IEEE','datatype',1,'p_datatype','parser.py',291),
-  ('datasize -> BYTE','datasize',1,'p_datasize','parser.py',296),
-  ('datasize -> WORD','datasize',1,'p_datasize','parser.py',297),
-  ('datasize -> LONG','datasize',1,'p_datasize','parser.py',298),
-  ('addrtype -> PBYTE','addrtype',1,'p_addrtype','parser.py',303),
-  ('addrtype -> PWORD','addrtype',1,'p_addrtype','parser.py',304),
-  ('addrtype -> PLONG','addrtype',1,'p_addrtype','parser.py',305),
-  ('addrtype -> DIRECT','addrtype',1,'p_addrtype','parser.py',306),
-  ('indexorder -> INDEX_INCR','indexorder',1,'p_indexorder','parser.py',311),
-  ('indexorder -> INDEX_DECR','indexorder',1,'p_indexorder','parser.py',312),
-  ('asap2_version -> ASAP2_VERSION NUMERIC NUMERIC','asap2_version',3,'p_asap2_version','parser.py',317),
-  ('a2ml_version -> A2ML_VERSION NUMERIC NUMERIC','a2ml_version',3,'p_a2ml_version','parser.py',322),
-  ('generic_parameter -> IDENT','generic_parameter',1,'p_generic_parameter','parser.py',327),
-  ('generic_parameter -> STRING','generic_parameter',1,'p_generic_parameter','parser.py',328),
-  ('generic_parameter -> NUMERIC','generic_parameter',1,'p_generic_parameter','parser.py',329),
-  ('generic_parameter -> begin IDENT generic_parameter_list_optional end IDENT','generic_parameter',5,'p_generic_parameter','parser.py',330),
-  ('generic_parameter_list -> generic_parameter','generic_parameter_list',1,'p_generic_parameter_list','parser.py',334),
-  ('generic_parameter_list -> generic_parameter generic_parameter_list','generic_parameter_list',2,'p_generic_parameter_list','parser.py',335),
-  ('generic_parameter_list_optional -> empty','generic_parameter_list_optional',1,'p_generic_parameter_list_optional','parser.py',343),
-  ('generic_parameter_list_optional -> generic_parameter_list','generic_parameter_list_optional',1,'p_generic_parameter_list_optional','parser.py',344),
-  ('number_list -> NUMERIC','number_list',1,'p_number_list','parser.py',348),
-  ('number_list -> NUMERIC number_list','number_list',2,'p_number_list','parser.py',349),
-  ('ident_list -> IDENT','ident_list',1,'p_ident_list','parser.py',357),
-  ('ident_list -> IDENT ident_list','ident_list',2,'p_ident_list','parser.py',358),
-  ('string_list -> STRING','string_list',1,'p_string_list','parser.py',366),
-  ('string_list -> STRING string_list','string_list',2,'p_string_list','parser.py',367),
-  ('project -> begin PROJECT IDENT STRING project_optional_list_optional end PROJECT','project',7,'p_project','parser.py',375),
-  ('project_optional -> header','project_optional',1,'p_project_optional','parser.py',380),
-  ('project_optional -> module','project_optional',1,'p_project_optional','parser.py',381),
-  ('project_optional_list -> project_optional','project_optional_list',1,'p_project_optional_list','parser.py',386),
-  ('project_optional_list -> project_optional project_optional_list','project_optional_list',2,'p_project_optional_list','parser.py',387),
-  ('project_optional_list_optional -> empty','project_optional_list_optional',1,'p_project_optional_list_optional','parser.py',395),
-  ('project_optional_list_optional -> project_optional_list','project_optional_list_optional',1,'p_project_optional_list_optional','parser.py',396),
-  ('header -> begin HEADER STRING header_optional_list_optional end HEADER','header',6,'p_header','parser.py',401),
-  ('header_optional -> version','header_optional',1,'p_header_optional','parser.py',406),
-  ('header_optional -> project_no','header_optional',1,'p_header_optional','parser.py',407),
-  ('header_optional_list -> header_optional','header_optional_list',1,'p_header_optional_list','parser.py',412),
-  ('header_optional_list -> header_optional header_optional_list','header_optional_list',2,'p_header_optional_list','parser.py',413),
-  ('header_optional_list_optional -> empty','header_optional_list_optional',1,'p_header_optional_list_optional','parser.py',421),
-  ('header_optional_list_optional -> header_optional_list','header_optional_list_optional',1,'p_header_optional_list_optional','parser.py',422),
-  ('version -> VERSION STRING','version',2,'p_version','parser.py',427),
-  ('project_no -> PROJECT_NO IDENT','project_no',2,'p_project_no','parser.py',432),
-  ('module -> begin MODULE IDENT STRING module_optional_list_optional end MODULE','module',7,'p_module','parser.py',437),
-  ('module_optional -> a2ml','module_optional',1,'p_module_optional','parser.py',442),
-  ('module_optional -> mod_par','module_optional',1,'p_module_optional','parser.py',443),
-  ('module_optional -> mod_common','module_optional',1,'p_module_optional','parser.py',444),
-  ('module_optional -> if_data_xcp','module_optional',1,'p_module_optional','parser.py',445),
-  ('module_optional -> if_data_module','module_optional',1,'p_module_optional','parser.py',446),
-  ('module_optional -> characteristic','module_optional',1,'p_module_optional','parser.py',447),
-  ('module_optional -> axis_pts','module_optional',1,'p_module_optional','parser.py',448),
-  ('module_optional -> measurement','module_optional',1,'p_module_optional','parser.py',449),
-  ('module_optional -> compu_method','module_optional',1,'p_module_optional','parser.py',450),
-  ('module_optional -> compu_tab','module_optional',1,'p_module_optional','parser.py',451),
-  ('module_optional -> compu_vtab','module_optional',1,'p_module_optional','parser.py',452),
-  ('module_optional -> compu_vtab_range','module_optional',1,'p_module_optional','parser.py',453),
-  ('module_optional -> function','module_optional',1,'p_module_optional','parser.py',454),
-  ('module_optional -> group','module_optional',1,'p_module_optional','parser.py',455),
-  ('module_optional -> record_layout','module_optional',1,'p_module_optional','parser.py',456),
-  ('module_optional -> variant_coding','module_optional',1,'p_module_optional','parser.py',457),
-  ('module_optional -> frame','module_optional',1,'p_module_optional','parser.py',458),
-  ('module_optional -> user_rights','module_optional',1,'p_module_optional','parser.py',459),
-  ('module_optional -> unit','module_optional',1,'p_module_optional','parser.py',460),
-  ('module_optional_list -> module_optional','module_optional_list',1,'p_module_optional_list','parser.py',465),
-  ('module_optional_list -> module_optional module_optional_list','module_optional_list',2,'p_module_optional_list','parser.py',466),
-  ('module_optional_list_optional -> empty','module_optional_list_optional',1,'p_module_optional_list_optional','parser.py',474),
-  ('module_optional_list_optional -> module_optional_list','module_optional_list_optional',1,'p_module_optional_list_optional','parser.py',475),
-  ('a2ml -> begin A2ML a2ml_declaration_list end A2ML','a2ml',5,'p_a2ml','parser.py',480),
-  ('if_data_xcp -> begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATA','if_data_xcp',6,'p_if_data_xcp','parser.py',485),
-  ('if_data_xcp_optional -> protocol_layer','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',490),
-  ('if_data_xcp_optional -> daq','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',491),
-  ('if_data_xcp_optional -> pag','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',492),
-  ('if_data_xcp_optional -> pgm','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',493),
-  ('if_data_xcp_optional -> segment','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',494),
-  ('if_data_xcp_optional -> daq_event','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',495),
-  ('if_data_xcp_optional -> xcp_on_can','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',496),
-  ('if_data_xcp_optional -> generic_parameter_list','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',497),
-  ('xcp_on_can -> begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CAN','xcp_on_can',6,'p_xcp_on_can','parser.py',502),
-  ('xcp_on_can_optional -> can_id_broadcast','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',507),
-  ('xcp_on_can_optional -> can_id_master','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',508),
-  ('xcp_on_can_optional -> can_id_slave','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',509),
-  ('xcp_on_can_optional -> baudrate','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',510),
-  ('xcp_on_can_optional -> sample_point','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',511),
-  ('xcp_on_can_optional -> sample_rate','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',512),
-  ('xcp_on_can_optional -> btl_cycles','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',513),
-  ('xcp_on_can_optional -> sjw','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',514),
-  ('xcp_on_can_optional -> sync_edge','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',515),
-  ('xcp_on_can_optional -> daq_list_can_id','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',516),
-  ('xcp_on_can_optional_list -> xcp_on_can_optional','xcp_on_can_optional_list',1,'p_xcp_on_can_optional_list','parser.py',521),
-  ('xcp_on_can_optional_list -> xcp_on_can_optional xcp_on_can_optional_list','xcp_on_can_optional_list',2,'p_xcp_on_can_optional_list','parser.py',522),
-  ('xcp_on_can_optional_list_optional -> empty','xcp_on_can_optional_list_optional',1,'p_xcp_on_can_optional_list_optional','parser.py',530),
-  ('xcp_on_can_optional_list_optional -> xcp_on_can_optional_list','xcp_on_can_optional_list_optional',1,'p_xcp_on_can_optional_list_optional','parser.py',531),
-  ('can_id_broadcast -> CAN_ID_BROADCAST NUMERIC','can_id_broadcast',2,'p_can_id_broadcast','parser.py',536),
-  ('can_id_master -> CAN_ID_MASTER NUMERIC','can_id_master',2,'p_can_id_master','parser.py',541),
-  ('can_id_slave -> CAN_ID_SLAVE NUMERIC','can_id_slave',2,'p_can_id_slave','parser.py',546),
-  ('baudrate -> BAUDRATE NUMERIC','baudrate',2,'p_baudrate','parser.py',551),
-  ('sample_point -> SAMPLE_POINT NUMERIC','sample_point',2,'p_sample_point','parser.py',556),
-  ('sample_rate -> SAMPLE_RATE SINGLE','sample_rate',2,'p_sample_rate','parser.py',561),
-  ('sample_rate -> SAMPLE_RATE TRIPLE','sample_rate',2,'p_sample_rate','parser.py',562),
-  ('btl_cycles -> BTL_CYCLES NUMERIC','btl_cycles',2,'p_btl_cycles','parser.py',567),
-  ('sjw -> SJW NUMERIC','sjw',2,'p_sjw','parser.py',572),
-  ('sync_edge -> SYNC_EDGE SINGLE','sync_edge',2,'p_sync_edge','parser.py',577),
-  ('sync_edge -> SYNC_EDGE DUAL','sync_edge',2,'p_sync_edge','parser.py',578),
-  ('daq_list_can_id -> begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_ID','daq_list_can_id',6,'p_daq_list_can_id','parser.py',583),
-  ('daq_list_can_id_optional -> daq_list_can_id_type_variable','daq_list_can_id_optional',1,'p_daq_list_can_id_optional','parser.py',588),
-  ('daq_list_can_id_optional -> daq_list_can_id_type_fixed','daq_list_can_id_optional',1,'p_daq_list_can_id_optional','parser.py',589),
-  ('daq_list_can_id_optional_optional -> empty','daq_list_can_id_optional_optional',1,'p_daq_list_can_id_optional_optional','parser.py',594),
-  ('daq_list_can_id_optional_optional -> daq_list_can_id_optional','daq_list_can_id_optional_optional',1,'p_daq_list_can_id_optional_optional','parser.py',595),
-  ('daq_list_can_id_type_variable -> VARIABLE','daq_list_can_id_type_variable',1,'p_daq_list_can_id_type_variable','parser.py',600),
-  ('daq_list_can_id_type_fixed -> FIXED NUMERIC','daq_list_can_id_type_fixed',2,'p_daq_list_can_id_type_fixed','parser.py',605),
-  ('daq_event -> begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT','daq_event',6,'p_daq_event','parser.py',610),
-  ('daq_event -> begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENT','daq_event',6,'p_daq_event','parser.py',611),
-  ('daq_event_optional -> available_event_list','daq_event_optional',1,'p_daq_event_optional','parser.py',616),
-  ('daq_event_optional -> default_event_list','daq_event_optional',1,'p_daq_event_optional','parser.py',617),
-  ('daq_event_optional_list -> daq_event_optional','daq_event_optional_list',1,'p_daq_event_optional_list','parser.py',622),
-  ('daq_event_optional_list -> daq_event_optional daq_event_optional_list','daq_event_optional_list',2,'p_daq_event_optional_list','parser.py',623),
-  ('daq_event_optional_list_optional -> empty','daq_event_optional_list_optional',1,'p_daq_event_optional_list_optional','parser.py',631),
-  ('daq_event_optional_list_optional -> daq_event_optional_list','daq_event_optional_list_optional',1,'p_daq_event_optional_list_optional','parser.py',632),
-  ('default_event_list -> begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LIST','default_event_list',5,'p_default_event_list','parser.py',637),
-  ('available_event_list -> begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LIST','available_event_list',5,'p_available_event_list','parser.py',642),
-  ('available_event_list_optional -> EVENT NUMERIC','available_event_list_optional',2,'p_available_event_list_optional','parser.py',647),
-  ('available_event_list_optional_list -> available_event_list_optional','available_event_list_optional_list',1,'p_available_event_list_optional_list','parser.py',652),
-  ('available_event_list_optional_list -> available_event_list_optional available_event_list_optional_list','available_event_list_optional_list',2,'p_available_event_list_optional_list','parser.py',653),
-  ('available_event_list_optional_list_optional -> empty','available_event_list_optional_list_optional',1,'p_available_event_list_optional_list_optional','parser.py',661),
-  ('available_event_list_optional_list_optional -> available_event_list_optional_list','available_event_list_optional_list_optional',1,'p_available_event_list_optional_list_optional','parser.py',662),
-  ('if_data_xcp_optional_list -> if_data_xcp_optional','if_data_xcp_optional_list',1,'p_if_data_xcp_optional_list','parser.py',667),
-  ('if_data_xcp_optional_list -> if_data_xcp_optional if_data_xcp_optional_list','if_data_xcp_optional_list',2,'p_if_data_xcp_optional_list','parser.py',668),
-  ('if_data_xcp_optional_list_optional -> empty','if_data_xcp_optional_list_optional',1,'p_if_data_xcp_optional_list_optional','parser.py',676),
-  ('if_data_xcp_optional_list_optional -> if_data_xcp_optional_list','if_data_xcp_optional_list_optional',1,'p_if_data_xcp_optional_list_optional','parser.py',677),
-  ('pag -> begin PAG NUMERIC pag_optional_list_optional end PAG','pag',6,'p_pag','parser.py',682),
-  ('pgm -> begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGM','pgm',8,'p_pgm','parser.py',687),
-  ('pgm_optional -> sector','pgm_optional',1,'p_pgm_optional','parser.py',692),
-  ('pgm_optional -> generic_parameter_list','pgm_optional',1,'p_pgm_optional','parser.py',693),
-  ('pgm_optional_list -> pgm_optional','pgm_optional_list',1,'p_pgm_optional_list','parser.py',698),
-  ('pgm_optional_list -> pgm_optional pgm_optional_list','pgm_optional_list',2,'p_pgm_optional_list','parser.py',699),
-  ('pgm_optional_list_optional -> empty','pgm_optional_list_optional',1,'p_pgm_optional_list_optional','parser.py',707),
-  ('pgm_optional_list_optional -> pgm_optional_list','pgm_optional_list_optional',1,'p_pgm_optional_list_optional','parser.py',708),
-  ('sector -> begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTOR','sector',11,'p_sector','parser.py',713),
-  ('pag_optional -> freeze_supported','pag_optional',1,'p_pag_optional','parser.py',718),
-  ('pag_optional -> generic_parameter_list','pag_optional',1,'p_pag_optional','parser.py',719),
-  ('pag_optional_list -> pag_optional','pag_optional_list',1,'p_pag_optional_list','parser.py',724),
-  ('pag_optional_list -> pag_optional pag_optional_list','pag_optional_list',2,'p_pag_optional_list','parser.py',725),
-  ('pag_optional_list_optional -> empty','pag_optional_list_optional',1,'p_pag_optional_list_optional','parser.py',733),
-  ('pag_optional_list_optional -> pag_optional_list','pag_optional_list_optional',1,'p_pag_optional_list_optional','parser.py',734),
-  ('freeze_supported -> FREEZE_SUPPORTED','freeze_supported',1,'p_freeze_supported','parser.py',739),
-  ('daq -> begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQ','daq',15,'p_daq','parser.py',744),
-  ('daq_config_type -> STATIC','daq_config_type',1,'p_daq_config_type','parser.py',749),
-  ('daq_config_type -> DYNAMIC','daq_config_type',1,'p_daq_config_type','parser.py',750),
-  ('daq_optional -> daq_list','daq_optional',1,'p_daq_optional','parser.py',755),
-  ('daq_optional -> event','daq_optional',1,'p_daq_optional','parser.py',756),
-  ('daq_optional -> timestamp_supported','daq_optional',1,'p_daq_optional','parser.py',757),
-  ('daq_optional -> stim','daq_optional',1,'p_daq_optional','parser.py',758),
-  ('daq_optional -> optimisation_type','daq_optional',1,'p_daq_optional','parser.py',759),
-  ('daq_optional -> address_extension','daq_optional',1,'p_daq_optional','parser.py',760),
-  ('daq_optional -> identification_field_type','daq_optional',1,'p_daq_optional','parser.py',761),
-  ('daq_optional -> granularity_odt_entry','daq_optional',1,'p_daq_optional','parser.py',762),
-  ('daq_optional -> prescaler_supported','daq_optional',1,'p_daq_optional','parser.py',763),
-  ('daq_optional -> resume_supported','daq_optional',1,'p_daq_optional','parser.py',764),
-  ('daq_optional -> IDENT','daq_optional',1,'p_daq_optional','parser.py',765),
-  ('daq_optional -> NUMERIC','daq_optional',1,'p_daq_optional','parser.py',766),
-  ('prescaler_supported -> PRESCALER_SUPPORTED','prescaler_supported',1,'p_prescaler_supported','parser.py',771),
-  ('resume_supported -> RESUME_SUPPORTED','resume_supported',1,'p_resume_supported','parser.py',776),
-  ('optimisation_type -> OPTIMISATION_TYPE_DEFAULT','optimisation_type',1,'p_optimisation_type','parser.py',781),
-  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_16','optimisation_type',1,'p_optimisation_type','parser.py',782),
-  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_32','optimisation_type',1,'p_optimisation_type','parser.py',783),
-  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_64','optimisation_type',1,'p_optimisation_type','parser.py',784),
-  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT','optimisation_type',1,'p_optimisation_type','parser.py',785),
-  ('optimisation_type -> OPTIMISATION_TYPE_MAX_ENTRY_SIZE','optimisation_type',1,'p_optimisation_type','parser.py',786),
-  ('address_extension -> ADDRESS_EXTENSION_FREE','address_extension',1,'p_address_extension','parser.py',791),
-  ('address_extension -> ADDRESS_EXTENSION_ODT','address_extension',1,'p_address_extension','parser.py',792),
-  ('address_extension -> ADDRESS_EXTENSION_DAQ','address_extension',1,'p_address_extension','parser.py',793),
-  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_ABSOLUTE','identification_field_type',1,'p_identification_field_type','parser.py',798),
-  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE','identification_field_type',1,'p_identification_field_type','parser.py',799),
-  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD','identification_field_type',1,'p_identification_field_type','parser.py',800),
-  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED','identification_field_type',1,'p_identification_field_type','parser.py',801),
-  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',806),
-  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',807),
-  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',808),
-  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',809),
-  ('overload_indication -> NO_OVERLOAD_INDICATION','overload_indication',1,'p_overload_indication','parser.py',814),
-  ('overload_indication -> OVERLOAD_INDICATION_PID','overload_indication',1,'p_overload_indication','parser.py',815),
-  ('overload_indication -> OVERLOAD_INDICATION_EVENT','overload_indication',1,'p_overload_indication','parser.py',816),
-  ('daq_optional_list -> daq_optional','daq_optional_list',1,'p_daq_optional_list','parser.py',821),
-  ('daq_optional_list -> daq_optional daq_optional_list','daq_optional_list',2,'p_daq_optional_list','parser.py',822),
-  ('daq_optional_list_optional -> empty','daq_optional_list_optional',1,'p_daq_optional_list_optional','parser.py',830),
-  ('daq_optional_list_optional -> daq_optional_list','daq_optional_list_optional',1,'p_daq_optional_list_optional','parser.py',831),
-  ('event -> begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENT','event',12,'p_event','parser.py',836),
-  ('daq_list -> begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LIST','daq_list',6,'p_daq_list','parser.py',841),
-  ('daq_list_optional -> daq_list_type','daq_list_optional',1,'p_daq_list_optional','parser.py',846),
-  ('daq_list_optional -> max_odt','daq_list_optional',1,'p_daq_list_optional','parser.py',847),
-  ('daq_list_optional -> max_odt_entries','daq_list_optional',1,'p_daq_list_optional','parser.py',848),
-  ('daq_list_optional -> first_pid','daq_list_optional',1,'p_daq_list_optional','parser.py',849),
-  ('daq_list_optional -> event_fixed','daq_list_optional',1,'p_daq_list_optional','parser.py',850),
-  ('daq_list_optional -> predefined','daq_list_optional',1,'p_daq_list_optional','parser.py',851),
-  ('daq_list_type_enum -> DAQ','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',856),
-  ('daq_list_type_enum -> STIM','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',857),
-  ('daq_list_type_enum -> DAQ_STIM','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',858),
-  ('daq_list_type -> DAQ_LIST_TYPE daq_list_type_enum','daq_list_type',2,'p_daq_list_type','parser.py',863),
-  ('max_odt -> MAX_ODT NUMERIC','max_odt',2,'p_max_odt','parser.py',868),
-  ('max_odt_entries -> MAX_ODT_ENTRIES NUMERIC','max_odt_entries',2,'p_max_odt_entries','parser.py',873),
-  ('first_pid -> FIRST_PID NUMERIC','first_pid',2,'p_first_pid','parser.py',878),
-  ('event_fixed -> EVENT_FIXED NUMERIC','event_fixed',2,'p_event_fixed','parser.py',883),
-  ('predefined -> generic_parameter_list','predefined',1,'p_predefined','parser.py',888),
-  ('daq_list_optional_list -> daq_list_optional','daq_list_optional_list',1,'p_daq_list_optional_list','parser.py',893),
-  ('daq_list_optional_list -> daq_list_optional daq_list_optional_list','daq_list_optional_list',2,'p_daq_list_optional_list','parser.py',894),
-  ('daq_list_optional_list_optional -> empty','daq_list_optional_list_optional',1,'p_daq_list_optional_list_optional','parser.py',902),
-  ('daq_list_optional_list_optional -> daq_list_optional_list','daq_list_optional_list_optional',1,'p_daq_list_optional_list_optional','parser.py',903),
-  ('timestamp_supported -> begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTED','timestamp_supported',8,'p_timestamp_supported','parser.py',908),
-  ('stim -> begin STIM GRANULARITY_ODT_ENTRY_SIZE_STIM_BYTE NUMERIC end STIM','stim',6,'p_stim','parser.py',913),
-  ('timestamp_fixed -> empty','timestamp_fixed',1,'p_timestamp_fixed','parser.py',918),
-  ('timestamp_fixed -> TIMESTAMP_FIXED','timestamp_fixed',1,'p_timestamp_fixed','parser.py',919),
-  ('protocol_layer -> begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYER','protocol_layer',15,'p_protocol_layer','parser.py',924),
-  ('protocol_layer_optional -> generic_parameter_list','protocol_layer_optional',1,'p_protocol_layer_optional','parser.py',929),
-  ('protocol_layer_optional_list -> protocol_layer_optional','protocol_layer_optional_list',1,'p_protocol_layer_optional_list','parser.py',933),
-  ('protocol_layer_optional_list -> protocol_layer_optional protocol_layer_optional_list','protocol_layer_optional_list',2,'p_protocol_layer_optional_list','parser.py',934),
-  ('protocol_layer_optional_list_optional -> empty','protocol_layer_optional_list_optional',1,'p_protocol_layer_optional_list_optional','parser.py',942),
-  ('protocol_layer_optional_list_optional -> protocol_layer_optional_list','protocol_layer_optional_list_optional',1,'p_protocol_layer_optional_list_optional','parser.py',943),
-  ('if_data_module -> begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATA','if_data_module',6,'p_if_data_module','parser.py',948),
-  ('if_data_module_optional -> source','if_data_module_optional',1,'p_if_data_module_optional','parser.py',953),
-  ('if_data_module_optional -> raster','if_data_module_optional',1,'p_if_data_module_optional','parser.py',954),
-  ('if_data_module_optional -> event_group','if_data_module_optional',1,'p_if_data_module_optional','parser.py',955),
-  ('if_data_module_optional -> seed_key','if_data_module_optional',1,'p_if_data_module_optional','parser.py',956),
-  ('if_data_module_optional -> checksum','if_data_module_optional',1,'p_if_data_module_optional','parser.py',957),
-  ('if_data_module_optional -> tp_blob tp_data','if_data_module_optional',2,'p_if_data_module_optional','parser.py',958),
-  ('if_data_module_optional -> if_data_module_unsupported_element','if_data_module_optional',1,'p_if_data_module_optional','parser.py',959),
-  ('if_data_module_optional_list -> if_data_module_optional','if_data_module_optional_list',1,'p_if_data_module_optional_list','parser.py',964),
-  ('if_data_module_optional_list -> if_data_module_optional if_data_module_optional_list','if_data_module_optional_list',2,'p_if_data_module_optional_list','parser.py',965),
-  ('if_data_module_optional_list_optional -> empty','if_data_module_optional_list_optional',1,'p_if_data_module_optional_list_optional','parser.py',973),
-  ('if_data_module_optional_list_optional -> if_data_module_optional_list','if_data_module_optional_list_optional',1,'p_if_data_module_optional_list_optional','parser.py',974),
-  ('if_data_module_unsupported_element -> generic_parameter_list','if_data_module_unsupported_element',1,'p_if_data_module_unsupported_element','parser.py',979),
-  ('source -> begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCE','source',8,'p_source','parser.py',983),
-  ('raster -> begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTER','raster',9,'p_raster','parser.py',988),
-  ('event_group -> begin EVENT_GROUP STRING STRING number_list end EVENT_GROUP','event_group',7,'p_event_group','parser.py',993),
-  ('seed_key -> begin SEED_KEY STRING STRING STRING end SEED_KEY','seed_key',7,'p_seed_key','parser.py',998),
-  ('checksum -> begin CHECKSUM STRING end CHECKSUM','checksum',5,'p_checksum','parser.py',1003),
-  ('checksum -> begin CHECKSUM IDENT max_block_size end CHECKSUM','checksum',6,'p_checksum','parser.py',1004),
-  ('max_block_size -> MAX_BLOCK_SIZE NUMERIC','max_block_size',2,'p_max_block_size','parser.py',1012),
-  ('tp_blob -> TP_BLOB','tp_blob',1,'p_tp_blob','parser.py',1017),
-  ('tp_data -> generic_parameter_list','tp_data',1,'p_tp_data','parser.py',1022),
-  ('source_optional -> display_identifier','source_optional',1,'p_source_optional','parser.py',1027),
-  ('source_optional -> qp_blob','source_optional',1,'p_source_optional','parser.py',1028),
-  ('source_optional_list -> source_optional','source_optional_list',1,'p_source_optional_list','parser.py',1033),
-  ('source_optional_list -> source_optional source_optional_list','source_optional_list',2,'p_source_optional_list','parser.py',1034),
-  ('source_optional_list_optional -> empty','source_optional_list_optional',1,'p_source_optional_list_optional','parser.py',1042),
-  ('source_optional_list_optional -> source_optional_list','source_optional_list_optional',1,'p_source_optional_list_optional','parser.py',1043),
-  ('qp_blob -> QP_BLOB IDENT','qp_blob',2,'p_qp_blob','parser.py',1048),
-  ('mod_par -> begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PAR','mod_par',6,'p_mod_par','parser.py',1052),
-  ('mod_par_optional -> version','mod_par_optional',1,'p_mod_par_optional','parser.py',1057),
-  ('mod_par_optional -> addr_epk','mod_par_optional',1,'p_mod_par_optional','parser.py',1058),
-  ('mod_par_optional -> epk','mod_par_optional',1,'p_mod_par_optional','parser.py',1059),
-  ('mod_par_optional -> supplier','mod_par_optional',1,'p_mod_par_optional','parser.py',1060),
-  ('mod_par_optional -> customer','mod_par_optional',1,'p_mod_par_optional','parser.py',1061),
-  ('mod_par_optional -> customer_no','mod_par_optional',1,'p_mod_par_optional','parser.py',1062),
-  ('mod_par_optional -> user','mod_par_optional',1,'p_mod_par_optional','parser.py',1063),
-  ('mod_par_optional -> phone_no','mod_par_optional',1,'p_mod_par_optional','parser.py',1064),
-  ('mod_par_optional -> ecu','mod_par_optional',1,'p_mod_par_optional','parser.py',1065),
-  ('mod_par_optional -> cpu_type','mod_par_optional',1,'p_mod_par_optional','parser.py',1066),
-  ('mod_par_optional -> no_of_interfaces','mod_par_optional',1,'p_mod_par_optional','parser.py',1067),
-  ('mod_par_optional -> ecu_calibration_offset','mod_par_optional',1,'p_mod_par_optional','parser.py',1068),
-  ('mod_par_optional -> calibration_method','mod_par_optional',1,'p_mod_par_optional','parser.py',1069),
-  ('mod_par_optional -> memory_layout','mod_par_optional',1,'p_mod_par_optional','parser.py',1070),
-  ('mod_par_optional -> memory_segment','mod_par_optional',1,'p_mod_par_optional','parser.py',1071),
-  ('mod_par_optional -> system_constant','mod_par_optional',1,'p_mod_par_optional','parser.py',1072),
-  ('mod_par_optional_list -> mod_par_optional','mod_par_optional_list',1,'p_mod_par_optional_list','parser.py',1077),
-  ('mod_par_optional_list -> mod_par_optional mod_par_optional_list','mod_par_optional_list',2,'p_mod_par_optional_list','parser.py',1078),
-  ('mod_par_optional_list_optional -> empty','mod_par_optional_list_optional',1,'p_mod_par_optional_list_optional','parser.py',1086),
-  ('mod_par_optional_list_optional -> mod_par_optional_list','mod_par_optional_list_optional',1,'p_mod_par_optional_list_optional','parser.py',1087),
-  ('addr_epk -> ADDR_EPK NUMERIC','addr_epk',2,'p_addr_epk','parser.py',1092),
-  ('epk -> EPK STRING','epk',2,'p_epk','parser.py',1097),
-  ('supplier -> SUPPLIER STRING','supplier',2,'p_supplier','parser.py',1102),
-  ('customer -> CUSTOMER STRING','customer',2,'p_customer','parser.py',1107),
-  ('customer_no -> CUSTOMER_NO STRING','customer_no',2,'p_customer_no','parser.py',1112),
-  ('user -> USER STRING','user',2,'p_user','parser.py',1117),
-  ('phone_no -> PHONE_NO STRING','phone_no',2,'p_phone_no','parser.py',1122),
-  ('mod_common -> begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMON','mod_common',6,'p_mod_common','parser.py',1127),
-  ('mod_common_optional -> s_rec_layout','mod_common_optional',1,'p_mod_common_optional','parser.py',1132),
-  ('mod_common_optional -> deposit','mod_common_optional',1,'p_mod_common_optional','parser.py',1133),
-  ('mod_common_optional -> byte_order','mod_common_optional',1,'p_mod_common_optional','parser.py',1134),
-  ('mod_common_optional -> data_size','mod_common_optional',1,'p_mod_common_optional','parser.py',1135),
-  ('mod_common_optional -> alignment_byte','mod_common_optional',1,'p_mod_common_optional','parser.py',1136),
-  ('mod_common_optional -> alignment_word','mod_common_optional',1,'p_mod_common_optional','parser.py',1137),
-  ('mod_common_optional -> alignment_long','mod_common_optional',1,'p_mod_common_optional','parser.py',1138),
-  ('mod_common_optional -> alignment_int64','mod_common_optional',1,'p_mod_common_optional','parser.py',1139),
-  ('mod_common_optional -> alignment_float32_ieee','mod_common_optional',1,'p_mod_common_optional','parser.py',1140),
-  ('mod_common_optional -> alignment_float64_ieee','mod_common_optional',1,'p_mod_common_optional','parser.py',1141),
-  ('mod_common_optional_list -> mod_common_optional','mod_common_optional_list',1,'p_mod_common_optional_parameter_list','parser.py',1146),
-  ('mod_common_optional_list -> mod_common_optional mod_common_optional_list','mod_common_optional_list',2,'p_mod_common_optional_parameter_list','parser.py',1147),
-  ('mod_common_optional_list_optional -> empty','mod_common_optional_list_optional',1,'p_mod_common_optional_parameter_list_optional','parser.py',1155),
-  ('mod_common_optional_list_optional -> mod_common_optional_list','mod_common_optional_list_optional',1,'p_mod_common_optional_parameter_list_optional','parser.py',1156),
-  ('s_rec_layout -> S_REC_LAYOUT IDENT','s_rec_layout',2,'p_s_rec_layout','parser.py',1161),
-  ('data_size -> DATA_SIZE NUMERIC','data_size',2,'p_data_size','parser.py',1166),
-  ('ecu -> ECU STRING','ecu',2,'p_ecu','parser.py',1171),
-  ('cpu_type -> CPU_TYPE STRING','cpu_type',2,'p_cpu_type','parser.py',1176),
-  ('no_of_interfaces -> NO_OF_INTERFACES NUMERIC','no_of_interfaces',2,'p_no_of_interfaces','parser.py',1181),
-  ('ecu_calibration_offset -> ECU_CALIBRATION_OFFSET NUMERIC','ecu_calibration_offset',2,'p_ecu_calibration_offset','parser.py',1186),
-  ('calibration_method -> begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHOD','calibration_method',7,'p_calibration_method','parser.py',1191),
-  ('calibration_method_optional -> calibration_handle','calibration_method_optional',1,'p_calibration_method_optional','parser.py',1196),
-  ('calibration_method_optional_list -> calibration_method_optional','calibration_method_optional_list',1,'p_calibration_method_optional_list','parser.py',1201),
-  ('calibration_method_optional_list -> calibration_method_optional calibration_method_optional_list','calibration_method_optional_list',2,'p_calibration_method_optional_list','parser.py',1202),
-  ('calibration_method_optional_list_optional -> empty','calibration_method_optional_list_optional',1,'p_calibration_method_optional_list_optional','parser.py',1210),
-  ('calibration_method_optional_list_optional -> calibration_method_optional_list','calibration_method_optional_list_optional',1,'p_calibration_method_optional_list_optional','parser.py',1211),
-  ('calibration_handle -> begin CALIBRATION_HANDLE calibration_handle_optional_list_optional end CALIBRATION_HANDLE','calibration_handle',5,'p_calibration_handle','parser.py',1216),
-  ('calibration_handle_optional -> NUMERIC','calibration_handle_optional',1,'p_calibration_handle_optional','parser.py',1221),
-  ('calibration_handle_optional_list -> calibration_handle_optional','calibration_handle_optional_list',1,'p_calibration_handle_optional_list','parser.py',1226),
-  ('calibration_handle_optional_list -> calibration_handle_optional calibration_handle_optional_list','calibration_handle_optional_list',2,'p_calibration_handle_optional_list','parser.py',1227),
-  ('calibration_handle_optional_list_optional -> empty','calibration_handle_optional_list_optional',1,'p_calibration_handle_optional_list_optional','parser.py',1235),
-  ('calibration_handle_optional_list_optional -> calibration_handle_optional_list','calibration_handle_optional_list_optional',1,'p_calibration_handle_optional_list_optional','parser.py',1236),
-  ('memory_layout -> begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUT','memory_layout',9,'p_memory_layout','parser.py',1241),
-  ('memory_layout_prg_type -> PRG_CODE','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',1246),
-  ('memory_layout_prg_type -> PRG_DATA','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',1247),
-  ('memory_layout_prg_type -> PRG_RESERVED','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',1248),
-  ('memory_layout_optional -> if_data_memory_layout','memory_layout_optional',1,'p_memory_layout_optional','parser.py',1253),
-  ('memory_layout_optional_list -> memory_layout_optional','memory_layout_optional_list',1,'p_memory_layout_optional_list','parser.py',1258),
-  ('memory_layout_optional_list -> memory_layout_optional memory_layout_optional_list','memory_layout_optional_list',2,'p_memory_layout_optional_list','parser.py',1259),
-  ('memory_layout_optional_list_optional -> empty','memory_layout_optional_list_optional',1,'p_memory_layout_optional_list_optional','parser.py',1267),
-  ('memory_layout_optional_list_optional -> memory_layout_optional_list','memory_layout_optional_list_optional',1,'p_memory_layout_optional_list_optional','parser.py',1268),
-  ('if_data_memory_layout -> begin IF_DATA IDENT if_data_memory_layout_optional_list_optional end IF_DATA','if_data_memory_layout',6,'p_if_data_memory_layout','parser.py',1273),
-  ('if_data_memory_layout_optional -> dp_blob dp_data','if_data_memory_layout_optional',2,'p_if_data_memory_layout_optional','parser.py',1277),
-  ('if_data_memory_layout_optional -> ba_blob pa_data','if_data_memory_layout_optional',2,'p_if_data_memory_layout_optional','parser.py',1278),
-  ('if_data_memory_layout_optional_list -> if_data_memory_layout_optional','if_data_memory_layout_optional_list',1,'p_if_data_memory_layout_optional_list','parser.py',1282),
-  ('if_data_memory_layout_optional_list -> if_data_memory_layout_optional if_data_memory_layout_optional_list','if_data_memory_layout_optional_list',2,'p_if_data_memory_layout_optional_list','parser.py',1283),
-  ('if_data_memory_layout_optional_list_optional -> empty','if_data_memory_layout_optional_list_optional',1,'p_if_data_memory_layout_optional_list_optional','parser.py',1291),
-  ('if_data_memory_layout_optional_list_optional -> if_data_memory_layout_optional_list','if_data_memory_layout_optional_list_optional',1,'p_if_data_memory_layout_optional_list_optional','parser.py',1292),
-  ('dp_blob -> DP_BLOB','dp_blob',1,'p_dp_blob','parser.py',1296),
-  ('ba_blob -> BA_BLOB','ba_blob',1,'p_ba_blob','parser.py',1301),
-  ('dp_data -> generic_parameter_list','dp_data',1,'p_dp_data','parser.py',1306),
-  ('pa_data -> generic_parameter_list','pa_data',1,'p_pa_data','parser.py',1311),
-  ('memory_segment -> begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENT','memory_segment',13,'p_memory_segment','parser.py',1316),
-  ('memory_segment_optional -> if_data_memory_segment','memory_segment_optional',1,'p_memory_segment_optional','parser.py',1321),
-  ('memory_segment_optional -> if_data_xcp','memory_segment_optional',1,'p_memory_segment_optional','parser.py',1322),
-  ('memory_segment_optional_parameter_list -> memory_segment_optional','memory_segment_optional_parameter_list',1,'p_memory_segment_optional_parameter_list','parser.py',1327),
-  ('memory_segment_optional_parameter_list -> memory_segment_optional memory_segment_optional_parameter_list','memory_segment_optional_parameter_list',2,'p_memory_segment_optional_parameter_list','parser.py',1328),
-  ('memory_segment_optional_list_optional -> empty','memory_segment_optional_list_optional',1,'p_memory_segment_optional_list_optional','parser.py',1336),
-  ('memory_segment_optional_list_optional -> memory_segment_optional_parameter_list','memory_segment_optional_list_optional',1,'p_memory_segment_optional_list_optional','parser.py',1337),
-  ('memory_segment_prg_type -> CODE','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1342),
-  ('memory_segment_prg_type -> DATA','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1343),
-  ('memory_segment_prg_type -> OFFLINE_DATA','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1344),
-  ('memory_segment_prg_type -> VARIABLES','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1345),
-  ('memory_segment_prg_type -> SERAM','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1346),
-  ('memory_segment_prg_type -> RESERVED','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1347),
-  ('memory_segment_prg_type -> CALIBRATION_VARIABLES','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1348),
-  ('memory_segment_prg_type -> EXCLUDE_FROM_FLASH','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',1349),
-  ('memory_segment_memory_type -> RAM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1354),
-  ('memory_segment_memory_type -> EEPROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1355),
-  ('memory_segment_memory_type -> EPROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1356),
-  ('memory_segment_memory_type -> ROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1357),
-  ('memory_segment_memory_type -> REGISTER','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1358),
-  ('memory_segment_memory_type -> FLASH','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',1359),
-  ('memory_segment_attributes -> INTERN','memory_segment_attributes',1,'p_memory_segment_attributes','parser.py',1364),
-  ('memory_segment_attributes -> EXTERN','memory_segment_attributes',1,'p_memory_segment_attributes','parser.py',1365),
-  ('system_constant -> SYSTEM_CONSTANT STRING STRING','system_constant',3,'p_system_constant','parser.py',1370),
-  ('if_data_memory_segment -> begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATA','if_data_memory_segment',6,'p_if_data_memory_segment','parser.py',1375),
-  ('if_data_memory_segment_optional -> address_mapping','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',1380),
-  ('if_data_memory_segment_optional -> segment','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',1381),
-  ('if_data_memory_segment_optional -> generic_parameter','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',1382),
-  ('if_data_memory_segment_optional_list -> if_data_memory_segment_optional','if_data_memory_segment_optional_list',1,'p_if_data_memory_segment_optional_list','parser.py',1387),
-  ('if_data_memory_segment_optional_list -> if_data_memory_segment_optional if_data_memory_segment_optional_list','if_data_memory_segment_optional_list',2,'p_if_data_memory_segment_optional_list','parser.py',1388),
-  ('if_data_memory_segment_optional_list_optional -> empty','if_data_memory_segment_optional_list_optional',1,'p_if_data_memory_segment_optional_list_optional','parser.py',1397),
-  ('if_data_memory_segment_optional_list_optional -> if_data_memory_segment_optional_list','if_data_memory_segment_optional_list_optional',1,'p_if_data_memory_segment_optional_list_optional','parser.py',1398),
-  ('segment -> begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENT','segment',10,'p_segment','parser.py',1403),
-  ('segment_optional_parameter -> page','segment_optional_parameter',1,'p_segment_optional_parameter','parser.py',1408),
-  ('segment_optional_parameter -> checksum','segment_optional_parameter',1,'p_segment_optional_parameter','parser.py',1409),
-  ('segment_optional_parameter_list -> segment_optional_parameter','segment_optional_parameter_list',1,'p_segment_optional_parameter_list','parser.py',1414),
-  ('segment_optional_parameter_list -> segment_optional_parameter segment_optional_parameter_list','segment_optional_parameter_list',2,'p_segment_optional_parameter_list','parser.py',1415),
-  ('segment_optional_parameter_list_optional -> empty','segment_optional_parameter_list_optional',1,'p_segment_optional_parameter_list_optional','parser.py',1423),
-  ('segment_optional_parameter_list_optional -> segment_optional_parameter_list','segment_optional_parameter_list_optional',1,'p_segment_optional_parameter_list_optional','parser.py',1424),
-  ('page -> begin PAGE NUMERIC IDENT IDENT IDENT page_optional_parameter_list_optional end PAGE','page',9,'p_page','parser.py',1429),
-  ('page_optional_parameter -> init_segment','page_optional_parameter',1,'p_page_optional_parameter','parser.py',1433),
-  ('page_optional_parameter_list -> page_optional_parameter','page_optional_parameter_list',1,'p_page_optional_parameter_list','parser.py',1437),
-  ('page_optional_parameter_list -> page_optional_parameter page_optional_parameter_list','page_optional_parameter_list',2,'p_page_optional_parameter_list','parser.py',1438),
-  ('page_optional_parameter_list_optional -> empty','page_optional_parameter_list_optional',1,'p_page_optional_parameter_list_optional','parser.py',1446),
-  ('page_optional_parameter_list_optional -> page_optional_parameter_list','page_optional_parameter_list_optional',1,'p_page_optional_parameter_list_optional','parser.py',1447),
-  ('init_segment -> INIT_SEGMENT NUMERIC','init_segment',2,'p_init_segment','parser.py',1451),
-  ('address_mapping -> ADDRESS_MAPPING NUMERIC NUMERIC NUMERIC','address_mapping',4,'p_address_mapping','parser.py',1455),
-  ('characteristic -> begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTIC','characteristic',14,'p_characteristic','parser.py',1460),
-  ('characteristic_type -> VALUE','characteristic_type',1,'p_characteristic_type','parser.py',1465),
-  ('characteristic_type -> CURVE','characteristic_type',1,'p_characteristic_type','parser.py',1466),
-  ('characteristic_type -> MAP','characteristic_type',1,'p_characteristic_type','parser.py',1467),
-  ('characteristic_type -> CUBOID','characteristic_type',1,'p_characteristic_type','parser.py',1468),
-  ('characteristic_type -> VAL_BLK','characteristic_type',1,'p_characteristic_type','parser.py',1469),
-  ('characteristic_type -> ASCII','characteristic_type',1,'p_characteristic_type','parser.py',1470),
-  ('display_identifier -> DISPLAY_IDENTIFIER IDENT','display_identifier',2,'p_display_identifier','parser.py',1475),
-  ('format -> FORMAT STRING','format',2,'p_format','parser.py',1480),
-  ('byte_order -> BYTE_ORDER byte_order_type','byte_order',2,'p_byte_order','parser.py',1485),
-  ('byte_order_type -> MSB_FIRST','byte_order_type',1,'p_byte_order_type','parser.py',1490),
-  ('byte_order_type -> MSB_LAST','byte_order_type',1,'p_byte_order_type','parser.py',1491),
-  ('bit_mask -> BIT_MASK NUMERIC','bit_mask',2,'p_bit_mask','parser.py',1496),
-  ('function_list -> begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LIST','function_list',5,'p_function_list','parser.py',1501),
-  ('function_list_optional -> IDENT','function_list_optional',1,'p_function_list_optional','parser.py',1506),
-  ('function_list_optional_list -> function_list_optional','function_list_optional_list',1,'p_function_list_optional_list','parser.py',1511),
-  ('function_list_optional_list -> function_list_optional function_list_optional_list','function_list_optional_list',2,'p_function_list_optional_list','parser.py',1512),
-  ('function_list_optional_list_optional -> empty','function_list_optional_list_optional',1,'p_function_list_optional_list_optional','parser.py',1520),
-  ('function_list_optional_list_optional -> function_list_optional_list','function_list_optional_list_optional',1,'p_function_list_optional_list_optional','parser.py',1521),
-  ('number -> NUMBER NUMERIC','number',2,'p_number','parser.py',1526),
-  ('extended_limits -> EXTENDED_LIMITS NUMERIC NUMERIC','extended_limits',3,'p_extended_limits','parser.py',1531),
-  ('map_list -> begin MAP_LIST ident_list end MAP_LIST','map_list',5,'p_map_list','parser.py',1536),
-  ('max_refresh -> MAX_REFRESH NUMERIC NUMERIC','max_refresh',3,'p_max_refresh','parser.py',1541),
-  ('dependent_characteristic -> begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTIC','dependent_characteristic',6,'p_dependent_characteristic','parser.py',1546),
-  ('virtual_characteristic -> begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTIC','virtual_characteristic',6,'p_virtual_characteristic','parser.py',1551),
-  ('virtual_characteristic_optional -> empty','virtual_characteristic_optional',1,'p_virtual_characteristic_optional','parser.py',1556),
-  ('virtual_characteristic_optional -> ident_list','virtual_characteristic_optional',1,'p_virtual_characteristic_optional','parser.py',1557),
-  ('ref_memory_segment -> REF_MEMORY_SEGMENT IDENT','ref_memory_segment',2,'p_ref_memory_segment','parser.py',1562),
-  ('annotation -> begin ANNOTATION annotation_optional_list_optional end ANNOTATION','annotation',5,'p_annotation','parser.py',1567),
-  ('annotation_optional -> annotation_label','annotation_optional',1,'p_annotation_optional','parser.py',1572),
-  ('annotation_optional -> annotation_origin','annotation_optional',1,'p_annotation_optional','parser.py',1573),
-  ('annotation_optional -> annotation_text','annotation_optional',1,'p_annotation_optional','parser.py',1574),
-  ('annotation_optional_list -> annotation_optional','annotation_optional_list',1,'p_annotation_optional_list','parser.py',1579),
-  ('annotation_optional_list -> annotation_optional annotation_optional_list','annotation_optional_list',2,'p_annotation_optional_list','parser.py',1580),
-  ('annotation_optional_list_optional -> empty','annotation_optional_list_optional',1,'p_annotation_optional_list_optional','parser.py',1588),
-  ('annotation_optional_list_optional -> annotation_optional_list','annotation_optional_list_optional',1,'p_annotation_optional_list_optional','parser.py',1589),
-  ('annotation_label -> ANNOTATION_LABEL STRING','annotation_label',2,'p_annotation_label','parser.py',1594),
-  ('annotation_origin -> ANNOTATION_ORIGIN STRING','annotation_origin',2,'p_annotation_origin','parser.py',1599),
-  ('annotation_text -> begin ANNOTATION_TEXT string_list end ANNOTATION_TEXT','annotation_text',5,'p_annotation_text','parser.py',1604),
-  ('comparison_quantity -> COMPARISON_QUANTITY IDENT','comparison_quantity',2,'p_comparison_quantity','parser.py',1609),
-  ('axis_descr -> begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCR','axis_descr',11,'p_axis_descr','parser.py',1614),
-  ('axis_descr_optional -> read_only','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1619),
-  ('axis_descr_optional -> format','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1620),
-  ('axis_descr_optional -> annotation','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1621),
-  ('axis_descr_optional -> axis_pts_ref','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1622),
-  ('axis_descr_optional -> max_grad','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1623),
-  ('axis_descr_optional -> monotony','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1624),
-  ('axis_descr_optional -> byte_order','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1625),
-  ('axis_descr_optional -> extended_limits','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1626),
-  ('axis_descr_optional -> fix_axis_par','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1627),
-  ('axis_descr_optional -> fix_axis_par_dist','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1628),
-  ('axis_descr_optional -> fix_axis_par_list','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1629),
-  ('axis_descr_optional -> deposit','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1630),
-  ('axis_descr_optional -> curve_axis_ref','axis_descr_optional',1,'p_axis_descr_optional','parser.py',1631),
-  ('axis_descr_optional_list -> axis_descr_optional','axis_descr_optional_list',1,'p_axis_descr_optional_list','parser.py',1636),
-  ('axis_descr_optional_list -> axis_descr_optional axis_descr_optional_list','axis_descr_optional_list',2,'p_axis_descr_optional_list','parser.py',1637),
-  ('axis_descr_optional_list_optional -> empty','axis_descr_optional_list_optional',1,'p_axis_descr_optional_list_optional','parser.py',1645),
-  ('axis_descr_optional_list_optional -> axis_descr_optional_list','axis_descr_optional_list_optional',1,'p_axis_descr_optional_list_optional','parser.py',1646),
-  ('axis_pts_ref -> AXIS_PTS_REF IDENT','axis_pts_ref',2,'p_axis_pts_ref','parser.py',1651),
-  ('max_grad -> MAX_GRAD NUMERIC','max_grad',2,'p_max_grad','parser.py',1656),
-  ('monotony -> MONOTONY monotony_type','monotony',2,'p_monotony','parser.py',1661),
-  ('monotony_type -> MON_INCREASE','monotony_type',1,'p_monotony_type','parser.py',1666),
-  ('monotony_type -> MON_DECREASE','monotony_type',1,'p_monotony_type','parser.py',1667),
-  ('monotony_type -> STRICT_INCREASE','monotony_type',1,'p_monotony_type','parser.py',1668),
-  ('monotony_type -> STRICT_DECREASE','monotony_type',1,'p_monotony_type','parser.py',1669),
-  ('fix_axis_par -> FIX_AXIS_PAR NUMERIC NUMERIC NUMERIC','fix_axis_par',4,'p_fix_axis_par','parser.py',1674),
-  ('fix_axis_par_dist -> FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERIC','fix_axis_par_dist',4,'p_fix_axis_par_dist','parser.py',1679),
-  ('fix_axis_par_list -> begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LIST','fix_axis_par_list',5,'p_fix_axis_par_list','parser.py',1684),
-  ('curve_axis_ref -> CURVE_AXIS_REF IDENT','curve_axis_ref',2,'p_curve_axis_ref','parser.py',1689),
-  ('axis_descr_attribute -> STD_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1694),
-  ('axis_descr_attribute -> FIX_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1695),
-  ('axis_descr_attribute -> COM_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1696),
-  ('axis_descr_attribute -> RES_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1697),
-  ('axis_descr_attribute -> CURVE_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',1698),
-  ('calibration_access -> CALIBRATION_ACCESS calibration_access_type','calibration_access',2,'p_calibration_access','parser.py',1703),
-  ('calibration_access_type -> CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',1708),
-  ('calibration_access_type -> NO_CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',1709),
-  ('calibration_access_type -> NOT_IN_MCD_SYSTEM','calibration_access_type',1,'p_calibration_access_type','parser.py',1710),
-  ('calibration_access_type -> OFFLINE_CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',1711),
-  ('matrix_dim -> MATRIX_DIM NUMERIC NUMERIC NUMERIC','matrix_dim',4,'p_matrix_dim','parser.py',1716),
-  ('ecu_address_extension -> ECU_ADDRESS_EXTENSION NUMERIC','ecu_address_extension',2,'p_ecu_address_extension','parser.py',1721),
-  ('characteristic_optional -> display_identifier','characteristic_optional',1,'p_characteristic_optional','parser.py',1726),
-  ('characteristic_optional -> format','characteristic_optional',1,'p_characteristic_optional','parser.py',1727),
-  ('characteristic_optional -> byte_order','characteristic_optional',1,'p_characteristic_optional','parser.py',1728),
-  ('characteristic_optional -> bit_mask','characteristic_optional',1,'p_characteristic_optional','parser.py',1729),
-  ('characteristic_optional -> function_list','characteristic_optional',1,'p_characteristic_optional','parser.py',1730),
-  ('characteristic_optional -> number','characteristic_optional',1,'p_characteristic_optional','parser.py',1731),
-  ('characteristic_optional -> symbol_link','characteristic_optional',1,'p_characteristic_optional','parser.py',1732),
-  ('characteristic_optional -> extended_limits','characteristic_optional',1,'p_characteristic_optional','parser.py',1733),
-  ('characteristic_optional -> read_only','characteristic_optional',1,'p_characteristic_optional','parser.py',1734),
-  ('characteristic_optional -> guard_rails','characteristic_optional',1,'p_characteristic_optional','parser.py',1735),
-  ('characteristic_optional -> map_list','characteristic_optional',1,'p_characteristic_optional','parser.py',1736),
-  ('characteristic_optional -> max_refresh','characteristic_optional',1,'p_characteristic_optional','parser.py',1737),
-  ('characteristic_optional -> dependent_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',1738),
-  ('characteristic_optional -> virtual_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',1739),
-  ('characteristic_optional -> ref_memory_segment','characteristic_optional',1,'p_characteristic_optional','parser.py',1740),
-  ('characteristic_optional -> annotation','characteristic_optional',1,'p_characteristic_optional','parser.py',1741),
-  ('characteristic_optional -> comparison_quantity','characteristic_optional',1,'p_characteristic_optional','parser.py',1742),
-  ('characteristic_optional -> if_data_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',1743),
-  ('characteristic_optional -> axis_descr','characteristic_optional',1,'p_characteristic_optional','parser.py',1744),
-  ('characteristic_optional -> calibration_access','characteristic_optional',1,'p_characteristic_optional','parser.py',1745),
-  ('characteristic_optional -> matrix_dim','characteristic_optional',1,'p_characteristic_optional','parser.py',1746),
-  ('characteristic_optional -> ecu_address_extension','characteristic_optional',1,'p_characteristic_optional','parser.py',1747),
-  ('characteristic_optional_list -> characteristic_optional','characteristic_optional_list',1,'p_characteristic_optional_list','parser.py',1752),
-  ('characteristic_optional_list -> characteristic_optional characteristic_optional_list','characteristic_optional_list',2,'p_characteristic_optional_list','parser.py',1753),
-  ('characteristic_optional_list_optional -> empty','characteristic_optional_list_optional',1,'p_characteristic_optional_list_optional','parser.py',1761),
-  ('characteristic_optional_list_optional -> characteristic_optional_list','characteristic_optional_list_optional',1,'p_characteristic_optional_list_optional','parser.py',1762),
-  ('if_data_characteristic -> if_data_memory_layout','if_data_characteristic',1,'p_if_data_characteristic','parser.py',1767),
-  ('axis_pts -> begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTS','axis_pts',15,'p_axis_pts','parser.py',1771),
-  ('axis_pts_optional -> display_identifier','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1776),
-  ('axis_pts_optional -> read_only','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1777),
-  ('axis_pts_optional -> format','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1778),
-  ('axis_pts_optional -> deposit','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1779),
-  ('axis_pts_optional -> byte_order','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1780),
-  ('axis_pts_optional -> function_list','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1781),
-  ('axis_pts_optional -> ref_memory_segment','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1782),
-  ('axis_pts_optional -> guard_rails','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1783),
-  ('axis_pts_optional -> extended_limits','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1784),
-  ('axis_pts_optional -> annotation','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1785),
-  ('axis_pts_optional -> if_data_axis_pts','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1786),
-  ('axis_pts_optional -> calibration_access','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1787),
-  ('axis_pts_optional -> ecu_address_extension','axis_pts_optional',1,'p_axis_pts_optional','parser.py',1788),
-  ('axis_pts_optional_list -> axis_pts_optional','axis_pts_optional_list',1,'p_axis_pts_optional_list','parser.py',1793),
-  ('axis_pts_optional_list -> axis_pts_optional axis_pts_optional_list','axis_pts_optional_list',2,'p_axis_pts_optional_list','parser.py',1794),
-  ('axis_pts_optional_list_optional -> empty','axis_pts_optional_list_optional',1,'p_axis_pts_optional_list_optional','parser.py',1802),
-  ('axis_pts_optional_list_optional -> axis_pts_optional_list','axis_pts_optional_list_optional',1,'p_axis_pts_optional_list_optional','parser.py',1803),
-  ('if_data_axis_pts -> if_data_memory_layout','if_data_axis_pts',1,'p_if_data_axis_pts','parser.py',1808),
-  ('deposit -> DEPOSIT deposit_mode','deposit',2,'p_deposit','parser.py',1813),
-  ('deposit_mode -> ABSOLUTE','deposit_mode',1,'p_deposit_mode','parser.py',1818),
-  ('deposit_mode -> DIFFERENCE','deposit_mode',1,'p_deposit_mode','parser.py',1819),
-  ('measurement -> begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENT','measurement',13,'p_measurement','parser.py',1824),
-  ('measurement_optional -> display_identifier','measurement_optional',1,'p_measurement_optional','parser.py',1829),
-  ('measurement_optional -> read_write','measurement_optional',1,'p_measurement_optional','parser.py',1830),
-  ('measurement_optional -> format','measurement_optional',1,'p_measurement_optional','parser.py',1831),
-  ('measurement_optional -> array_size','measurement_optional',1,'p_measurement_optional','parser.py',1832),
-  ('measurement_optional -> bit_mask','measurement_optional',1,'p_measurement_optional','parser.py',1833),
-  ('measurement_optional -> bit_operation','measurement_optional',1,'p_measurement_optional','parser.py',1834),
-  ('measurement_optional -> byte_order','measurement_optional',1,'p_measurement_optional','parser.py',1835),
-  ('measurement_optional -> max_refresh','measurement_optional',1,'p_measurement_optional','parser.py',1836),
-  ('measurement_optional -> virtual','measurement_optional',1,'p_measurement_optional','parser.py',1837),
-  ('measurement_optional -> function_list','measurement_optional',1,'p_measurement_optional','parser.py',1838),
-  ('measurement_optional -> ecu_address','measurement_optional',1,'p_measurement_optional','parser.py',1839),
-  ('measurement_optional -> symbol_link','measurement_optional',1,'p_measurement_optional','parser.py',1840),
-  ('measurement_optional -> error_mask','measurement_optional',1,'p_measurement_optional','parser.py',1841),
-  ('measurement_optional -> ref_memory_segment','measurement_optional',1,'p_measurement_optional','parser.py',1842),
-  ('measurement_optional -> annotation','measurement_optional',1,'p_measurement_optional','parser.py',1843),
-  ('measurement_optional -> if_data_xcp','measurement_optional',1,'p_measurement_optional','parser.py',1844),
-  ('measurement_optional -> if_data_measurement','measurement_optional',1,'p_measurement_optional','parser.py',1845),
-  ('measurement_optional -> matrix_dim','measurement_optional',1,'p_measurement_optional','parser.py',1846),
-  ('measurement_optional -> ecu_address_extension','measurement_optional',1,'p_measurement_optional','parser.py',1847),
-  ('measurement_optional_list -> measurement_optional','measurement_optional_list',1,'p_measurement_optional_list','parser.py',1852),
-  ('measurement_optional_list -> measurement_optional measurement_optional_list','measurement_optional_list',2,'p_measurement_optional_list','parser.py',1853),
-  ('measurement_optional_list_optional -> empty','measurement_optional_list_optional',1,'p_measurement_optional_list_optional','parser.py',1862),
-  ('measurement_optional_list_optional -> measurement_optional_list','measurement_optional_list_optional',1,'p_measurement_optional_list_optional','parser.py',1863),
-  ('read_write -> READ_WRITE','read_write',1,'p_read_write','parser.py',1868),
-  ('if_data_measurement -> begin IF_DATA IDENT if_data_measurement_optional_parameter_list_optional end IF_DATA','if_data_measurement',6,'p_if_data_measurement','parser.py',1873),
-  ('if_data_measurement_optional_parameter -> kp_blob kp_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',1878),
-  ('if_data_measurement_optional_parameter -> dp_blob dp_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',1879),
-  ('if_data_measurement_optional_parameter -> pa_blob pa_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',1880),
-  ('if_data_measurement_optional_parameter -> if_data_measurement_unsupported_element','if_data_measurement_optional_parameter',1,'p_if_data_measurement_optional_parameter','parser.py',1881),
-  ('if_data_measurement_unsupported_element -> begin IDENT generic_parameter_list end IDENT','if_data_measurement_unsupported_element',5,'p_if_data_measurement_unsupported_element','parser.py',1886),
-  ('if_data_measurement_optional_parameter_list -> if_data_measurement_optional_parameter','if_data_measurement_optional_parameter_list',1,'p_if_data_measurement_optional_parameter_list','parser.py',1891),
-  ('if_data_measurement_optional_parameter_list -> if_data_measurement_optional_parameter if_data_measurement_optional_parameter_list','if_data_measurement_optional_parameter_list',2,'p_if_data_measurement_optional_parameter_list','parser.py',1892),
-  ('if_data_measurement_optional_parameter_list_optional -> empty','if_data_measurement_optional_parameter_list_optional',1,'p_if_data_measurement_optional_parameter_list_optional','parser.py',1901),
-  ('if_data_measurement_optional_parameter_list_optional -> if_data_measurement_optional_parameter_list','if_data_measurement_optional_parameter_list_optional',1,'p_if_data_measurement_optional_parameter_list_optional','parser.py',1902),
-  ('kp_blob -> KP_BLOB','kp_blob',1,'p_kp_blob','parser.py',1907),
-  ('pa_blob -> PA_BLOB','pa_blob',1,'p_pa_blob','parser.py',1912),
-  ('kp_data -> kp_data_parameter_optional_list','kp_data',1,'p_kp_data','parser.py',1917),
-  ('kp_data_parameter_optional -> NUMERIC','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',1922),
-  ('kp_data_parameter_optional -> STRING','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',1923),
-  ('kp_data_parameter_optional -> IDENT','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',1924),
-  ('kp_data_parameter_optional_list -> kp_data_parameter_optional','kp_data_parameter_optional_list',1,'p_kp_data_parameter_optional_list','parser.py',1929),
-  ('kp_data_parameter_optional_list -> kp_data_parameter_optional kp_data_parameter_optional_list','kp_data_parameter_optional_list',2,'p_kp_data_parameter_optional_list','parser.py',1930),
-  ('array_size -> ARRAY_SIZE NUMERIC','array_size',2,'p_array_size','parser.py',1939),
-  ('bit_operation -> begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATION','bit_operation',5,'p_bit_operation','parser.py',1944),
-  ('bit_operation_optional -> left_shift','bit_operation_optional',1,'p_bit_operation_optional','parser.py',1949),
-  ('bit_operation_optional -> right_shift','bit_operation_optional',1,'p_bit_operation_optional','parser.py',1950),
-  ('bit_operation_optional -> sign_extend','bit_operation_optional',1,'p_bit_operation_optional','parser.py',1951),
-  ('bit_operation_optional_list -> bit_operation_optional','bit_operation_optional_list',1,'p_bit_operation_optional_list','parser.py',1956),
-  ('bit_operation_optional_list -> bit_operation_optional bit_operation_optional_list','bit_operation_optional_list',2,'p_bit_operation_optional_list','parser.py',1957),
-  ('bit_operation_optional_list_optional -> empty','bit_operation_optional_list_optional',1,'p_bit_operation_optional_list_optional','parser.py',1965),
-  ('bit_operation_optional_list_optional -> bit_operation_optional_list','bit_operation_optional_list_optional',1,'p_bit_operation_optional_list_optional','parser.py',1966),
-  ('left_shift -> LEFT_SHIFT NUMERIC','left_shift',2,'p_left_shift','parser.py',1971),
-  ('right_shift -> RIGHT_SHIFT NUMERIC','right_shift',2,'p_right_shift','parser.py',1976),
-  ('sign_extend -> SIGN_EXTEND','sign_extend',1,'p_sign_extend','parser.py',1981),
-  ('compu_method -> begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHOD','compu_method',10,'p_compu_method','parser.py',1986),
-  ('compu_method_optional -> formula','compu_method_optional',1,'p_compu_method_optional','parser.py',1991),
-  ('compu_method_optional -> coeffs','compu_method_optional',1,'p_compu_method_optional','parser.py',1992),
-  ('compu_method_optional -> coeffs_linear','compu_method_optional',1,'p_compu_method_optional','parser.py',1993),
-  ('compu_method_optional -> compu_tab_ref','compu_method_optional',1,'p_compu_method_optional','parser.py',1994),
-  ('compu_method_optional -> ref_unit','compu_method_optional',1,'p_compu_method_optional','parser.py',1995),
-  ('compu_method_optional_list -> compu_method_optional','compu_method_optional_list',1,'p_compu_method_optional_list','parser.py',2000),
-  ('compu_method_optional_list -> compu_method_optional compu_method_optional_list','compu_method_optional_list',2,'p_compu_method_optional_list','parser.py',2001),
-  ('compu_method_optional_list_optional -> empty','compu_method_optional_list_optional',1,'p_compu_method_optional_list_optional','parser.py',2009),
-  ('compu_method_optional_list_optional -> compu_method_optional_list','compu_method_optional_list_optional',1,'p_compu_method_optional_list_optional','parser.py',2010),
-  ('compu_method_conversion_type -> TAB_INTP','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2015),
-  ('compu_method_conversion_type -> TAB_NOINTP','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2016),
-  ('compu_method_conversion_type -> TAB_VERB','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2017),
-  ('compu_method_conversion_type -> RAT_FUNC','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2018),
-  ('compu_method_conversion_type -> FORM','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2019),
-  ('compu_method_conversion_type -> IDENTICAL','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2020),
-  ('compu_method_conversion_type -> LINEAR','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',2021),
-  ('formula -> begin FORMULA STRING formula_optional_list_optional end FORMULA','formula',6,'p_formula','parser.py',2026),
-  ('formula_optional -> formula_inv','formula_optional',1,'p_formula_optional','parser.py',2031),
-  ('formula_optional_list -> formula_optional','formula_optional_list',1,'p_formula_optional_list','parser.py',2036),
-  ('formula_optional_list -> formula_optional formula_optional_list','formula_optional_list',2,'p_formula_optional_list','parser.py',2037),
-  ('formula_optional_list_optional -> empty','formula_optional_list_optional',1,'p_formula_optional_list_optional','parser.py',2045),
-  ('formula_optional_list_optional -> formula_optional_list','formula_optional_list_optional',1,'p_formula_optional_list_optional','parser.py',2046),
-  ('formula_inv -> FORMULA_INV STRING','formula_inv',2,'p_formula_inv','parser.py',2051),
-  ('coeffs -> COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC','coeffs',7,'p_coeffs','parser.py',2056),
-  ('coeffs_linear -> COEFFS_LINEAR NUMERIC NUMERIC','coeffs_linear',3,'p_coeffs_linear','parser.py',2061),
-  ('compu_tab_ref -> COMPU_TAB_REF IDENT','compu_tab_ref',2,'p_compu_tab_ref','parser.py',2066),
-  ('ref_unit -> REF_UNIT IDENT','ref_unit',2,'p_ref_unit','parser.py',2071),
-  ('virtual -> begin VIRTUAL ident_list end VIRTUAL','virtual',5,'p_virtual','parser.py',2076),
-  ('ecu_address -> ECU_ADDRESS NUMERIC','ecu_address',2,'p_ecu_address','parser.py',2081),
-  ('symbol_link -> SYMBOL_LINK STRING NUMERIC','symbol_link',3,'p_symbol_link','parser.py',2086),
-  ('error_mask -> ERROR_MASK NUMERIC','error_mask',2,'p_error_mask','parser.py',2091),
-  ('compu_tab -> begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TAB','compu_tab',9,'p_compu_tab','parser.py',2096),
-  ('compu_tab_optional -> in_val_out_val','compu_tab_optional',1,'p_compu_tab_optional','parser.py',2101),
-  ('compu_tab_optional -> default_value','compu_tab_optional',1,'p_compu_tab_optional','parser.py',2102),
-  ('compu_tab_optional -> default_value_numeric','compu_tab_optional',1,'p_compu_tab_optional','parser.py',2103),
-  ('compu_tab_optional_list -> compu_tab_optional','compu_tab_optional_list',1,'p_compu_tabl_optional_list','parser.py',2108),
-  ('compu_tab_optional_list -> compu_tab_optional compu_tab_optional_list','compu_tab_optional_list',2,'p_compu_tabl_optional_list','parser.py',2109),
-  ('compu_tab_optional_list_optional -> empty','compu_tab_optional_list_optional',1,'p_compu_tab_optional_list_optional','parser.py',2117),
-  ('compu_tab_optional_list_optional -> compu_tab_optional_list','compu_tab_optional_list_optional',1,'p_compu_tab_optional_list_optional','parser.py',2118),
-  ('in_val_out_val -> number_list','in_val_out_val',1,'p_in_val_out_val','parser.py',2123),
-  ('compu_tab_conversion_type -> TAB_INTP','compu_tab_conversion_type',1,'p_compu_tab_conversion_type','parser.py',2128),
-  ('compu_tab_conversion_type -> TAB_NOINTP','compu_tab_conversion_type',1,'p_compu_tab_conversion_type','parser.py',2129),
-  ('default_value -> DEFAULT_VALUE STRING','default_value',2,'p_default_value','parser.py',2134),
-  ('default_value_numeric -> DEFAULT_VALUE_NUMERIC NUMERIC','default_value_numeric',2,'p_default_value_numeric','parser.py',2139),
-  ('compu_vtab -> begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTAB','compu_vtab',9,'p_compu_vtab','parser.py',2144),
-  ('compu_vtab_optional -> default_value','compu_vtab_optional',1,'p_compu_vtab_optional','parser.py',2149),
-  ('compu_vtab_optional -> compu_vtab_in_val_out_val','compu_vtab_optional',1,'p_compu_vtab_optional','parser.py',2150),
-  ('compu_vtab_optional_list -> compu_vtab_optional','compu_vtab_optional_list',1,'p_compu_vtab_optional_list','parser.py',2155),
-  ('compu_vtab_optional_list -> compu_vtab_optional compu_vtab_optional_list','compu_vtab_optional_list',2,'p_compu_vtab_optional_list','parser.py',2156),
-  ('compu_vtab_optional_list_optional -> empty','compu_vtab_optional_list_optional',1,'p_compu_vtab_optional_list_optional','parser.py',2164),
-  ('compu_vtab_optional_list_optional -> compu_vtab_optional_list','compu_vtab_optional_list_optional',1,'p_compu_vtab_optional_list_optional','parser.py',2165),
-  ('compu_vtab_in_val_out_val -> number_string_value_list','compu_vtab_in_val_out_val',1,'p_compu_vtab_in_val_out_val','parser.py',2170),
-  ('compu_vtab_conversion_type -> TAB_VERB','compu_vtab_conversion_type',1,'p_compu_vtab_conversion_type','parser.py',2175),
-  ('number_string_value_list -> number_string_value','number_string_value_list',1,'p_number_string_value_list','parser.py',2180),
-  ('number_string_value_list -> number_string_value number_string_value_list','number_string_value_list',2,'p_number_string_value_list','parser.py',2181),
-  ('number_string_value -> NUMERIC STRING','number_string_value',2,'p_number_string_value','parser.py',2189),
-  ('compu_vtab_range -> begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGE','compu_vtab_range',8,'p_compu_vtab_range','parser.py',2194),
-  ('compu_vtab_range_optional -> default_value','compu_vtab_range_optional',1,'p_compu_vtab_range_optional','parser.py',2199),
-  ('compu_vtab_range_optional -> compu_vtab_range_in_val_out_val','compu_vtab_range_optional',1,'p_compu_vtab_range_optional','parser.py',2200),
-  ('compu_vtab_range_optional_list -> compu_vtab_range_optional','compu_vtab_range_optional_list',1,'p_compu_vtab_range_optional_list','parser.py',2205),
-  ('compu_vtab_range_optional_list -> compu_vtab_range_optional compu_vtab_range_optional_list','compu_vtab_range_optional_list',2,'p_compu_vtab_range_optional_list','parser.py',2206),
-  ('compu_vtab_range_optional_list_optional -> empty','compu_vtab_range_optional_list_optional',1,'p_compu_vtab_range_optional_list_optional','parser.py',2214),
-  ('compu_vtab_range_optional_list_optional -> compu_vtab_range_optional_list','compu_vtab_range_optional_list_optional',1,'p_compu_vtab_range_optional_list_optional','parser.py',2215),
-  ('compu_vtab_range_in_val_out_val -> number_number_string_value_list','compu_vtab_range_in_val_out_val',1,'p_compu_vtab_range_in_val_out_val','parser.py',2220),
-  ('number_number_string_value_list -> number_number_string_value','number_number_string_value_list',1,'p_number_number_string_value_list','parser.py',2225),
-  ('number_number_string_value_list -> number_number_string_value number_number_string_value_list','number_number_string_value_list',2,'p_number_number_string_value_list','parser.py',2226),
-  ('number_number_string_value -> NUMERIC NUMERIC STRING','number_number_string_value',3,'p_number_number_string_value','parser.py',2234),
-  ('function -> begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTION','function',7,'p_function','parser.py',2239),
-  ('function_optional -> annotation','function_optional',1,'p_function_optional','parser.py',2244),
-  ('function_optional -> def_characteristic','function_optional',1,'p_function_optional','parser.py',2245),
-  ('function_optional -> ref_characteristic','function_optional',1,'p_function_optional','parser.py',2246),
-  ('function_optional -> in_measurement','function_optional',1,'p_function_optional','parser.py',2247),
-  ('function_optional -> out_measurement','function_optional',1,'p_function_optional','parser.py',2248),
-  ('function_optional -> loc_measurement','function_optional',1,'p_function_optional','parser.py',2249),
-  ('function_optional -> sub_function','function_optional',1,'p_function_optional','parser.py',2250),
-  ('function_optional -> function_version','function_optional',1,'p_function_optional','parser.py',2251),
-  ('function_optional_list -> function_optional','function_optional_list',1,'p_function_optional_list','parser.py',2256),
-  ('function_optional_list -> function_optional function_optional_list','function_optional_list',2,'p_function_optional_list','parser.py',2257),
-  ('function_optional_list_optional -> empty','function_optional_list_optional',1,'p_function_optional_list_optional','parser.py',2265),
-  ('function_optional_list_optional -> function_optional_list','function_optional_list_optional',1,'p_function_optional_list_optional','parser.py',2266),
-  ('def_characteristic -> begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTIC','def_characteristic',5,'p_def_characteristic','parser.py',2271),
-  ('def_characteristic_optional -> identifier','def_characteristic_optional',1,'p_def_characteristic_optional','parser.py',2276),
-  ('def_characteristic_optional_list -> def_characteristic_optional','def_characteristic_optional_list',1,'p_def_characteristic_optional_list','parser.py',2281),
-  ('def_characteristic_optional_list -> def_characteristic_optional def_characteristic_optional_list','def_characteristic_optional_list',2,'p_def_characteristic_optional_list','parser.py',2282),
-  ('def_characteristic_optional_list_optional -> empty','def_characteristic_optional_list_optional',1,'p_def_characteristic_optional_list_optional','parser.py',2290),
-  ('def_characteristic_optional_list_optional -> def_characteristic_optional_list','def_characteristic_optional_list_optional',1,'p_def_characteristic_optional_list_optional','parser.py',2291),
-  ('identifier -> IDENT','identifier',1,'p_identifier','parser.py',2296),
-  ('ref_characteristic -> begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTIC','ref_characteristic',5,'p_ref_characteristic','parser.py',2301),
-  ('ref_characteristic_optional -> identifier','ref_characteristic_optional',1,'p_ref_characteristic_optional','parser.py',2306),
-  ('ref_characteristic_optional_list -> ref_characteristic_optional','ref_characteristic_optional_list',1,'p_ref_characteristic_optional_list','parser.py',2311),
-  ('ref_characteristic_optional_list -> ref_characteristic_optional ref_characteristic_optional_list','ref_characteristic_optional_list',2,'p_ref_characteristic_optional_list','parser.py',2312),
-  ('ref_characteristic_optional_list_optional -> empty','ref_characteristic_optional_list_optional',1,'p_ref_characteristic_optional_list_optional','parser.py',2320),
-  ('ref_characteristic_optional_list_optional -> ref_characteristic_optional_list','ref_characteristic_optional_list_optional',1,'p_ref_characteristic_optional_list_optional','parser.py',2321),
-  ('in_measurement -> begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENT','in_measurement',5,'p_in_measurement','parser.py',2326),
-  ('in_measurement_optional -> identifier','in_measurement_optional',1,'p_in_measurement_optional','parser.py',2331),
-  ('in_measurement_optional_list -> in_measurement_optional','in_measurement_optional_list',1,'p_in_measurement_optional_list','parser.py',2336),
-  ('in_measurement_optional_list -> in_measurement_optional in_measurement_optional_list','in_measurement_optional_list',2,'p_in_measurement_optional_list','parser.py',2337),
-  ('in_measurement_optional_list_optional -> empty','in_measurement_optional_list_optional',1,'p_in_measurment_optional_list_optional','parser.py',2345),
-  ('in_measurement_optional_list_optional -> in_measurement_optional_list','in_measurement_optional_list_optional',1,'p_in_measurment_optional_list_optional','parser.py',2346),
-  ('out_measurement -> begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENT','out_measurement',5,'p_out_measurement','parser.py',2351),
-  ('out_measurement_optional -> identifier','out_measurement_optional',1,'p_out_measurement_optional','parser.py',2356),
-  ('out_measurement_optional_list -> out_measurement_optional','out_measurement_optional_list',1,'p_out_measurement_optional_list','parser.py',2361),
-  ('out_measurement_optional_list -> out_measurement_optional out_measurement_optional_list','out_measurement_optional_list',2,'p_out_measurement_optional_list','parser.py',2362),
-  ('out_measurement_optional_list_optional -> empty','out_measurement_optional_list_optional',1,'p_out_measurment_optional_list_optional','parser.py',2370),
-  ('out_measurement_optional_list_optional -> out_measurement_optional_list','out_measurement_optional_list_optional',1,'p_out_measurment_optional_list_optional','parser.py',2371),
-  ('loc_measurement -> begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENT','loc_measurement',5,'p_loc_measurement','parser.py',2376),
-  ('loc_measurement_optional -> identifier','loc_measurement_optional',1,'p_loc_measurement_optional','parser.py',2381),
-  ('loc_measurement_optional_list -> loc_measurement_optional','loc_measurement_optional_list',1,'p_loc_measurement_optional_list','parser.py',2386),
-  ('loc_measurement_optional_list -> loc_measurement_optional loc_measurement_optional_list','loc_measurement_optional_list',2,'p_loc_measurement_optional_list','parser.py',2387),
-  ('loc_measurement_optional_list_optional -> empty','loc_measurement_optional_list_optional',1,'p_loc_measurment_optional_list_optional','parser.py',2395),
-  ('loc_measurement_optional_list_optional -> loc_measurement_optional_list','loc_measurement_optional_list_optional',1,'p_loc_measurment_optional_list_optional','parser.py',2396),
-  ('sub_function -> begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTION','sub_function',5,'p_sub_function','parser.py',2401),
-  ('sub_function_optional -> identifier','sub_function_optional',1,'p_sub_function_optional','parser.py',2406),
-  ('sub_function_optional_list -> sub_function_optional','sub_function_optional_list',1,'p_sub_function_optional_list','parser.py',2411),
-  ('sub_function_optional_list -> sub_function_optional sub_function_optional_list','sub_function_optional_list',2,'p_sub_function_optional_list','parser.py',2412),
-  ('sub_function_optional_list_optional -> empty','sub_function_optional_list_optional',1,'p_sub_function_optional_list_optional','parser.py',2420),
-  ('sub_function_optional_list_optional -> sub_function_optional_list','sub_function_optional_list_optional',1,'p_sub_function_optional_list_optional','parser.py',2421),
-  ('function_version -> FUNCTION_VERSION STRING','function_version',2,'p_function_version','parser.py',2426),
-  ('group -> begin GROUP IDENT STRING group_optional_list_optional end GROUP','group',7,'p_group','parser.py',2431),
-  ('group_optional -> annotation','group_optional',1,'p_group_optional','parser.py',2436),
-  ('group_optional -> root','group_optional',1,'p_group_optional','parser.py',2437),
-  ('group_optional -> ref_characteristic','group_optional',1,'p_group_optional','parser.py',2438),
-  ('group_optional -> ref_measurement','group_optional',1,'p_group_optional','parser.py',2439),
-  ('group_optional -> function_list','group_optional',1,'p_group_optional','parser.py',2440),
-  ('group_optional -> sub_group','group_optional',1,'p_group_optional','parser.py',2441),
-  ('group_optional_list -> group_optional','group_optional_list',1,'p_group_optional_list','parser.py',2446),
-  ('group_optional_list -> group_optional group_optional_list','group_optional_list',2,'p_group_optional_list','parser.py',2447),
-  ('group_optional_list_optional -> empty','group_optional_list_optional',1,'p_group_optional_list_optional','parser.py',2455),
-  ('group_optional_list_optional -> group_optional_list','group_optional_list_optional',1,'p_group_optional_list_optional','parser.py',2456),
-  ('root -> ROOT','root',1,'p_root','parser.py',2461),
-  ('ref_measurement -> begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENT','ref_measurement',5,'p_ref_measurement','parser.py',2466),
-  ('ref_measurement_optional -> identifier','ref_measurement_optional',1,'p_ref_measurement_optional','parser.py',2471),
-  ('ref_measurement_optional_list -> ref_measurement_optional','ref_measurement_optional_list',1,'p_ref_measurement_optional_list','parser.py',2476),
-  ('ref_measurement_optional_list -> ref_measurement_optional ref_measurement_optional_list','ref_measurement_optional_list',2,'p_ref_measurement_optional_list','parser.py',2477),
-  ('ref_measurement_optional_list_optional -> empty','ref_measurement_optional_list_optional',1,'p_ref_measurement_optional_list_optional','parser.py',2485),
-  ('ref_measurement_optional_list_optional -> ref_measurement_optional_list','ref_measurement_optional_list_optional',1,'p_ref_measurement_optional_list_optional','parser.py',2486),
-  ('sub_group -> begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUP','sub_group',5,'p_sub_group','parser.py',2491),
-  ('sub_group_optional -> identifier','sub_group_optional',1,'p_sub_group_optional','parser.py',2496),
-  ('sub_group_optional_list -> sub_group_optional','sub_group_optional_list',1,'p_sub_group_optional_list','parser.py',2501),
-  ('sub_group_optional_list -> sub_group_optional sub_group_optional_list','sub_group_optional_list',2,'p_sub_group_optional_list','parser.py',2502),
-  ('sub_group_optional_list_optional -> empty','sub_group_optional_list_optional',1,'p_sub_group_optional_list_optional','parser.py',2510),
-  ('sub_group_optional_list_optional -> sub_group_optional_list','sub_group_optional_list_optional',1,'p_sub_group_optional_list_optional','parser.py',2511),
-  ('record_layout -> begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUT','record_layout',6,'p_record_layout','parser.py',2516),
-  ('record_layout_optional -> fnc_values','record_layout_optional',1,'p_record_layout_optional','parser.py',2521),
-  ('record_layout_optional -> identification','record_layout_optional',1,'p_record_layout_optional','parser.py',2522),
-  ('record_layout_optional -> axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2523),
-  ('record_layout_optional -> axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2524),
-  ('record_layout_optional -> axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2525),
-  ('record_layout_optional -> axis_rescale_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2526),
-  ('record_layout_optional -> axis_rescale_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2527),
-  ('record_layout_optional -> axis_rescale_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2528),
-  ('record_layout_optional -> no_axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2529),
-  ('record_layout_optional -> no_axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2530),
-  ('record_layout_optional -> no_axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2531),
-  ('record_layout_optional -> no_rescale_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2532),
-  ('record_layout_optional -> no_rescale_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2533),
-  ('record_layout_optional -> no_rescale_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2534),
-  ('record_layout_optional -> fix_no_axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2535),
-  ('record_layout_optional -> fix_no_axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2536),
-  ('record_layout_optional -> fix_no_axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2537),
-  ('record_layout_optional -> src_addr_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2538),
-  ('record_layout_optional -> src_addr_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2539),
-  ('record_layout_optional -> src_addr_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2540),
-  ('record_layout_optional -> rip_addr_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2541),
-  ('record_layout_optional -> rip_addr_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2542),
-  ('record_layout_optional -> rip_addr_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2543),
-  ('record_layout_optional -> rip_addr_w','record_layout_optional',1,'p_record_layout_optional','parser.py',2544),
-  ('record_layout_optional -> shift_op_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2545),
-  ('record_layout_optional -> shift_op_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2546),
-  ('record_layout_optional -> shift_op_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2547),
-  ('record_layout_optional -> offset_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2548),
-  ('record_layout_optional -> offset_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2549),
-  ('record_layout_optional -> offset_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2550),
-  ('record_layout_optional -> dist_op_x','record_layout_optional',1,'p_record_layout_optional','parser.py',2551),
-  ('record_layout_optional -> dist_op_y','record_layout_optional',1,'p_record_layout_optional','parser.py',2552),
-  ('record_layout_optional -> dist_op_z','record_layout_optional',1,'p_record_layout_optional','parser.py',2553),
-  ('record_layout_optional -> alignment_byte','record_layout_optional',1,'p_record_layout_optional','parser.py',2554),
-  ('record_layout_optional -> alignment_word','record_layout_optional',1,'p_record_layout_optional','parser.py',2555),
-  ('record_layout_optional -> alignment_long','record_layout_optional',1,'p_record_layout_optional','parser.py',2556),
-  ('record_layout_optional -> alignment_float32_ieee','record_layout_optional',1,'p_record_layout_optional','parser.py',2557),
-  ('record_layout_optional -> alignment_float64_ieee','record_layout_optional',1,'p_record_layout_optional','parser.py',2558),
-  ('record_layout_optional -> alignment_int64','record_layout_optional',1,'p_record_layout_optional','parser.py',2559),
-  ('record_layout_optional -> reserved','record_layout_optional',1,'p_record_layout_optional','parser.py',2560),
-  ('record_layout_optional_list -> record_layout_optional','record_layout_optional_list',1,'p_record_layout_optional_list','parser.py',2565),
-  ('record_layout_optional_list -> record_layout_optional record_layout_optional_list','record_layout_optional_list',2,'p_record_layout_optional_list','parser.py',2566),
-  ('record_layout_optional_list_optional -> empty','record_layout_optional_list_optional',1,'p_record_layout_optional_list_optional','parser.py',2574),
-  ('record_layout_optional_list_optional -> record_layout_optional_list','record_layout_optional_list_optional',1,'p_record_layout_optional_list_optional','parser.py',2575),
-  ('fnc_values -> FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtype','fnc_values',5,'p_fnc_values','parser.py',2580),
-  ('fnc_values_index_mode -> COLUMN_DIR','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2585),
-  ('fnc_values_index_mode -> ROW_DIR','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2586),
-  ('fnc_values_index_mode -> ALTERNATE_WITH_X','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2587),
-  ('fnc_values_index_mode -> ALTERNATE_WITH_Y','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2588),
-  ('fnc_values_index_mode -> ALTERNATE_CURVES','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',2589),
-  ('identification -> IDENTIFICATION NUMERIC datatype','identification',3,'p_identification','parser.py',2594),
-  ('axis_pts_x -> AXIS_PTS_X NUMERIC datatype indexorder addrtype','axis_pts_x',5,'p_axis_pts_x','parser.py',2599),
-  ('axis_pts_y -> AXIS_PTS_Y NUMERIC datatype indexorder addrtype','axis_pts_y',5,'p_axis_pts_y','parser.py',2604),
-  ('axis_pts_z -> AXIS_PTS_Z NUMERIC datatype indexorder addrtype','axis_pts_z',5,'p_axis_pts_z','parser.py',2609),
-  ('axis_rescale_x -> AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_x',6,'p_axis_rescale_x','parser.py',2614),
-  ('axis_rescale_y -> AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_y',6,'p_axis_rescale_y','parser.py',2619),
-  ('axis_rescale_z -> AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_z',6,'p_axis_rescale_z','parser.py',2624),
-  ('no_axis_pts_x -> NO_AXIS_PTS_X NUMERIC datatype','no_axis_pts_x',3,'p_no_axis_pts_x','parser.py',2629),
-  ('no_axis_pts_y -> NO_AXIS_PTS_Y NUMERIC datatype','no_axis_pts_y',3,'p_no_axis_pts_y','parser.py',2634),
-  ('no_axis_pts_z -> NO_AXIS_PTS_Z NUMERIC datatype','no_axis_pts_z',3,'p_no_axis_pts_z','parser.py',2639),
-  ('no_rescale_x -> NO_RESCALE_X NUMERIC datatype','no_rescale_x',3,'p_no_rescale_x','parser.py',2644),
-  ('no_rescale_y -> NO_RESCALE_Y NUMERIC datatype','no_rescale_y',3,'p_no_rescale_y','parser.py',2649),
-  ('no_rescale_z -> NO_RESCALE_Z NUMERIC datatype','no_rescale_z',3,'p_no_rescale_z','parser.py',2654),
-  ('fix_no_axis_pts_x -> FIX_NO_AXIS_PTS_X NUMERIC','fix_no_axis_pts_x',2,'p_fix_no_axis_pts_x','parser.py',2659),
-  ('fix_no_axis_pts_y -> FIX_NO_AXIS_PTS_Y NUMERIC','fix_no_axis_pts_y',2,'p_fix_no_axis_pts_y','parser.py',2664),
-  ('fix_no_axis_pts_z -> FIX_NO_AXIS_PTS_Z NUMERIC','fix_no_axis_pts_z',2,'p_fix_no_axis_pts_z','parser.py',2669),
-  ('src_addr_x -> SRC_ADDR_X NUMERIC datatype','src_addr_x',3,'p_src_addr_x','parser.py',2674),
-  ('src_addr_y -> SRC_ADDR_Y NUMERIC datatype','src_addr_y',3,'p_src_addr_y','parser.py',2679),
-  ('src_addr_z -> SRC_ADDR_Z NUMERIC datatype','src_addr_z',3,'p_src_addr_z','parser.py',2684),
-  ('rip_addr_x -> RIP_ADDR_X NUMERIC datatype','rip_addr_x',3,'p_rip_addr_x','parser.py',2689),
-  ('rip_addr_y -> RIP_ADDR_Y NUMERIC datatype','rip_addr_y',3,'p_rip_addr_y','parser.py',2694),
-  ('rip_addr_z -> RIP_ADDR_Z NUMERIC datatype','rip_addr_z',3,'p_rip_addr_z','parser.py',2699),
-  ('rip_addr_w -> RIP_ADDR_W NUMERIC datatype','rip_addr_w',3,'p_rip_addr_w','parser.py',2704),
-  ('shift_op_x -> SHIFT_OP_X NUMERIC datatype','shift_op_x',3,'p_shift_op_x','parser.py',2709),
-  ('shift_op_y -> SHIFT_OP_Y NUMERIC datatype','shift_op_y',3,'p_shift_op_y','parser.py',2714),
-  ('shift_op_z -> SHIFT_OP_Z NUMERIC datatype','shift_op_z',3,'p_shift_op_z','parser.py',2719),
-  ('offset_x -> OFFSET_X NUMERIC datatype','offset_x',3,'p_offset_x','parser.py',2724),
-  ('offset_y -> OFFSET_Y NUMERIC datatype','offset_y',3,'p_offset_y','parser.py',2729),
-  ('offset_z -> OFFSET_Z NUMERIC datatype','offset_z',3,'p_offset_z','parser.py',2734),
-  ('dist_op_x -> DIST_OP_X NUMERIC datatype','dist_op_x',3,'p_dist_op_x','parser.py',2739),
-  ('dist_op_y -> DIST_OP_Y NUMERIC datatype','dist_op_y',3,'p_dist_op_y','parser.py',2744),
-  ('dist_op_z -> DIST_OP_Z NUMERIC datatype','dist_op_z',3,'p_dist_op_z','parser.py',2749),
-  ('alignment_byte -> ALIGNMENT_BYTE NUMERIC','alignment_byte',2,'p_alignment_byte','parser.py',2754),
-  ('alignment_word -> ALIGNMENT_WORD NUMERIC','alignment_word',2,'p_alignment_word','parser.py',2759),
-  ('alignment_long -> ALIGNMENT_LONG NUMERIC','alignment_long',2,'p_alignment_long','parser.py',2764),
-  ('alignment_int64 -> ALIGNMENT_INT64 NUMERIC','alignment_int64',2,'p_alignment_int64','parser.py',2769),
-  ('alignment_float32_ieee -> ALIGNMENT_FLOAT32_IEEE NUMERIC','alignment_float32_ieee',2,'p_alignment_float32_ieee','parser.py',2774),
-  ('alignment_float64_ieee -> ALIGNMENT_FLOAT64_IEEE NUMERIC','alignment_float64_ieee',2,'p_alignment_float64_ieee','parser.py',2779),
-  ('variant_coding -> begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODING','variant_coding',5,'p_variant_coding','parser.py',2784),
-  ('variant_coding_optional -> var_separator','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2789),
-  ('variant_coding_optional -> var_naming','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2790),
-  ('variant_coding_optional -> var_criterion','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2791),
-  ('variant_coding_optional -> var_forbidden_comb','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2792),
-  ('variant_coding_optional -> var_characteristic','variant_coding_optional',1,'p_variant_coding_optional','parser.py',2793),
-  ('variant_coding_optional_list -> variant_coding_optional','variant_coding_optional_list',1,'p_variant_coding_optional_list','parser.py',2798),
-  ('variant_coding_optional_list -> variant_coding_optional variant_coding_optional_list','variant_coding_optional_list',2,'p_variant_coding_optional_list','parser.py',2799),
-  ('variant_coding_optional_list_optional -> empty','variant_coding_optional_list_optional',1,'p_variant_coding_optional_list_optional','parser.py',2807),
-  ('variant_coding_optional_list_optional -> variant_coding_optional_list','variant_coding_optional_list_optional',1,'p_variant_coding_optional_list_optional','parser.py',2808),
-  ('var_separator -> VAR_SEPARATOR STRING','var_separator',2,'p_var_separator','parser.py',2813),
-  ('var_naming -> VAR_NAMING IDENT','var_naming',2,'p_var_naming','parser.py',2818),
-  ('var_criterion -> begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERION','var_criterion',8,'p_var_criterion','parser.py',2823),
-  ('var_characteristic -> begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTIC','var_characteristic',7,'p_var_characteristic','parser.py',2828),
-  ('var_characteristic_optional -> var_address','var_characteristic_optional',1,'p_var_characteristic_optional','parser.py',2833),
-  ('var_characteristic_optional_optional -> empty','var_characteristic_optional_optional',1,'p_var_characteristic_optional_optional','parser.py',2838),
-  ('var_characteristic_optional_optional -> var_characteristic_optional','var_characteristic_optional_optional',1,'p_var_characteristic_optional_optional','parser.py',2839),
-  ('var_address -> begin VAR_ADDRESS number_list end VAR_ADDRESS','var_address',5,'p_var_address','parser.py',2844),
-  ('var_forbidden_comb -> begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMB','var_forbidden_comb',5,'p_var_forbidden_comb','parser.py',2849),
-  ('var_forbidden_comb_criterion_list -> var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_list',1,'p_var_forbidden_comb_criterion_list','parser.py',2854),
-  ('var_forbidden_comb_criterion_list -> var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_list','var_forbidden_comb_criterion_list',2,'p_var_forbidden_comb_criterion_list','parser.py',2855),
-  ('var_forbidden_comb_criterion_optional -> IDENT IDENT','var_forbidden_comb_criterion_optional',2,'p_var_forbidden_comb_criterion_optional','parser.py',2863),
-  ('var_forbidden_comb_criterion_optional_list -> var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_optional_list',1,'p_var_forbidden_comb_criterion_optional_list','parser.py',2868),
-  ('var_forbidden_comb_criterion_optional_list -> var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_list','var_forbidden_comb_criterion_optional_list',2,'p_var_forbidden_comb_criterion_optional_list','parser.py',2869),
-  ('var_criterion_optional -> var_measurement','var_criterion_optional',1,'p_var_criterion_optional','parser.py',2877),
-  ('var_criterion_optional -> var_selection_characteristic','var_criterion_optional',1,'p_var_criterion_optional','parser.py',2878),
-  ('var_criterion_optional_list -> var_criterion_optional','var_criterion_optional_list',1,'p_var_criterion_optional_list','parser.py',2883),
-  ('var_criterion_optional_list -> var_criterion_optional var_criterion_optional_list','var_criterion_optional_list',2,'p_var_criterion_optional_list','parser.py',2884),
-  ('var_criterion_optional_list_optional -> empty','var_criterion_optional_list_optional',1,'p_var_criterion_optional_list_optional','parser.py',2892),
-  ('var_criterion_optional_list_optional -> var_criterion_optional_list','var_criterion_optional_list_optional',1,'p_var_criterion_optional_list_optional','parser.py',2893),
-  ('var_measurement -> VAR_MEASUREMENT IDENT','var_measurement',2,'p_var_measurement','parser.py',2898),
-  ('var_selection_characteristic -> VAR_SELECTION_CHARACTERISTIC IDENT','var_selection_characteristic',2,'p_var_selection_characteristic','parser.py',2903),
-  ('reserved -> RESERVED NUMERIC datasize','reserved',3,'p_reserved','parser.py',2908),
-  ('frame -> begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAME','frame',9,'p_frame','parser.py',2913),
-  ('frame_optional -> frame_measurement','frame_optional',1,'p_frame_optional','parser.py',2918),
-  ('frame_optional -> if_data_frame','frame_optional',1,'p_frame_optional','parser.py',2919),
-  ('frame_optional_list -> frame_optional','frame_optional_list',1,'p_frame_optional_list','parser.py',2924),
-  ('frame_optional_list -> frame_optional frame_optional_list','frame_optional_list',2,'p_frame_optional_list','parser.py',2925),
-  ('frame_optional_list_optional -> empty','frame_optional_list_optional',1,'p_frame_optional_list_optional','parser.py',2933),
-  ('frame_optional_list_optional -> frame_optional_list','frame_optional_list_optional',1,'p_frame_optional_list_optional','parser.py',2934),
-  ('if_data_frame -> begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATA','if_data_frame',6,'p_if_data_frame','parser.py',2939),
-  ('if_data_frame_optional -> QP_BLOB qp_data','if_data_frame_optional',2,'p_if_data_frame_optional','parser.py',2944),
-  ('if_data_frame_optional_list -> if_data_frame_optional','if_data_frame_optional_list',1,'p_if_data_frame_parameter_optional_list','parser.py',2949),
-  ('if_data_frame_optional_list -> if_data_frame_optional if_data_frame_optional_list','if_data_frame_optional_list',2,'p_if_data_frame_parameter_optional_list','parser.py',2950),
-  ('if_data_frame_optional_list_optional -> empty','if_data_frame_optional_list_optional',1,'p_if_data_frame_optional_list_optional','parser.py',2959),
-  ('if_data_frame_optional_list_optional -> if_data_frame_optional_list','if_data_frame_optional_list_optional',1,'p_if_data_frame_optional_list_optional','parser.py',2960),
-  ('qp_data -> generic_parameter','qp_data',1,'p_qp_data','parser.py',2965),
-  ('frame_measurement -> FRAME_MEASUREMENT ident_list','frame_measurement',2,'p_frame_measurement','parser.py',2970),
-  ('user_rights -> begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTS','user_rights',6,'p_user_rights','parser.py',2975),
-  ('user_rights_optional -> ref_group','user_rights_optional',1,'p_user_rights_optional','parser.py',2980),
-  ('user_rights_optional -> read_only','user_rights_optional',1,'p_user_rights_optional','parser.py',2981),
-  ('user_rights_optional_list -> user_rights_optional','user_rights_optional_list',1,'p_user_rights_optional_list','parser.py',2986),
-  ('user_rights_optional_list -> user_rights_optional user_rights_optional_list','user_rights_optional_list',2,'p_user_rights_optional_list','parser.py',2987),
-  ('user_rights_optional_list_optional -> empty','user_rights_optional_list_optional',1,'p_user_rights_optional_list_optional','parser.py',2995),
-  ('user_rights_optional_list_optional -> user_rights_optional_list','user_rights_optional_list_optional',1,'p_user_rights_optional_list_optional','parser.py',2996),
-  ('ref_group -> begin REF_GROUP ref_group_optional_list_optional end REF_GROUP','ref_group',5,'p_ref_group','parser.py',3001),
-  ('ref_group_optional -> identifier','ref_group_optional',1,'p_ref_group_optional','parser.py',3006),
-  ('ref_group_optional_list -> ref_group_optional','ref_group_optional_list',1,'p_ref_group_optional_list','parser.py',3011),
-  ('ref_group_optional_list -> ref_group_optional ref_group_optional_list','ref_group_optional_list',2,'p_ref_group_optional_list','parser.py',3012),
-  ('ref_group_optional_list_optional -> empty','ref_group_optional_list_optional',1,'p_ref_group_optional_list_optional','parser.py',3020),
-  ('ref_group_optional_list_optional -> ref_group_optional_list','ref_group_optional_list_optional',1,'p_ref_group_optional_list_optional','parser.py',3021),
-  ('read_only -> READ_ONLY','read_only',1,'p_read_only','parser.py',3026),
-  ('guard_rails -> GUARD_RAILS','guard_rails',1,'p_guard_rails','parser.py',3031),
-  ('unit -> begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNIT','unit',9,'p_unit','parser.py',3036),
-  ('unit_optional -> si_exponents','unit_optional',1,'p_unit_optional','parser.py',3041),
-  ('unit_optional -> ref_unit','unit_optional',1,'p_unit_optional','parser.py',3042),
-  ('unit_optional -> unit_conversion','unit_optional',1,'p_unit_optional','parser.py',3043),
-  ('unit_optional_list -> unit_optional','unit_optional_list',1,'p_unit_optional_list','parser.py',3048),
-  ('unit_optional_list -> unit_optional unit_optional_list','unit_optional_list',2,'p_unit_optional_list','parser.py',3049),
-  ('unit_optional_list_optional -> empty','unit_optional_list_optional',1,'p_unit_optional_list_optional','parser.py',3057),
-  ('unit_optional_list_optional -> unit_optional_list','unit_optional_list_optional',1,'p_unit_optional_list_optional','parser.py',3058),
-  ('unit_type -> EXTENDED_SI','unit_type',1,'p_unit_type','parser.py',3063),
-  ('unit_type -> DERIVED','unit_type',1,'p_unit_type','parser.py',3064),
-  ('si_exponents -> SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC','si_exponents',8,'p_si_exponents','parser.py',3069),
-  ('unit_conversion -> UNIT_CONVERSION NUMERIC NUMERIC','unit_conversion',3,'p_unit_conversion','parser.py',3074),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',3079),
+  ('a2l -> a2l_optional_list_optional','a2l',1,'p_a2l','parser.py',957),
+  ('a2l_optional -> asap2_version','a2l_optional',1,'p_a2l_optional','parser.py',963),
+  ('a2l_optional -> a2ml_version','a2l_optional',1,'p_a2l_optional','parser.py',964),
+  ('a2l_optional -> project','a2l_optional',1,'p_a2l_optional','parser.py',965),
+  ('a2l_optional_list -> a2l_optional','a2l_optional_list',1,'p_a2l_optional_list','parser.py',971),
+  ('a2l_optional_list -> a2l_optional_list a2l_optional','a2l_optional_list',2,'p_a2l_optional_list','parser.py',972),
+  ('a2l_optional_list_optional -> empty','a2l_optional_list_optional',1,'p_a2l_optional_list_optional','parser.py',982),
+  ('a2l_optional_list_optional -> a2l_optional_list','a2l_optional_list_optional',1,'p_a2l_optional_list_optional','parser.py',983),
+  ('a2ml_declaration -> a2ml_type_definition SEMICOLON','a2ml_declaration',2,'p_a2ml_declaration','parser.py',989),
+  ('a2ml_declaration -> a2ml_block_definition SEMICOLON','a2ml_declaration',2,'p_a2ml_declaration','parser.py',990),
+  ('a2ml_declaration_list -> a2ml_declaration','a2ml_declaration_list',1,'p_a2ml_declaration_list','parser.py',996),
+  ('a2ml_declaration_list -> a2ml_declaration_list a2ml_declaration','a2ml_declaration_list',2,'p_a2ml_declaration_list','parser.py',997),
+  ('a2ml_type_definition -> a2ml_type_name','a2ml_type_definition',1,'p_a2ml_type_definition','parser.py',1007),
+  ('a2ml_type_name -> a2ml_predefined_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',1013),
+  ('a2ml_type_name -> a2ml_struct_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',1014),
+  ('a2ml_type_name -> a2ml_enum_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',1015),
+  ('a2ml_type_name -> a2ml_taggedstruct_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',1016),
+  ('a2ml_type_name -> a2ml_taggedunion_type_name','a2ml_type_name',1,'p_a2ml_type_name','parser.py',1017),
+  ('a2ml_predefined_type_name -> char','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',1023),
+  ('a2ml_predefined_type_name -> int','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',1024),
+  ('a2ml_predefined_type_name -> long','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',1025),
+  ('a2ml_predefined_type_name -> uchar','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',1026),
+  ('a2ml_predefined_type_name -> uint','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',1027),
+  ('a2ml_predefined_type_name -> ulong','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',1028),
+  ('a2ml_predefined_type_name -> double','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',1029),
+  ('a2ml_predefined_type_name -> float','a2ml_predefined_type_name',1,'p_a2ml_predefined_type_name','parser.py',1030),
+  ('a2ml_block_definition -> block a2ml_tag a2ml_type_name','a2ml_block_definition',3,'p_a2ml_block_definition','parser.py',1036),
+  ('a2ml_block_definition -> block a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISK','a2ml_block_definition',6,'p_a2ml_block_definition','parser.py',1037),
+  ('a2ml_enum_type_name -> enum a2ml_identifier_optional CURLY_OPEN a2ml_enumerator_list CURLY_CLOSE','a2ml_enum_type_name',5,'p_a2ml_enum_type_name','parser.py',1041),
+  ('a2ml_enum_type_name -> enum a2ml_identifier','a2ml_enum_type_name',2,'p_a2ml_enum_type_name','parser.py',1042),
+  ('a2ml_enumerator_list -> a2ml_enumerator','a2ml_enumerator_list',1,'p_a2ml_enumerator_list','parser.py',1050),
+  ('a2ml_enumerator_list -> a2ml_enumerator_list COMMA a2ml_enumerator','a2ml_enumerator_list',3,'p_a2ml_enumerator_list','parser.py',1051),
+  ('a2ml_enumerator -> a2ml_keyword EQUAL a2ml_constant','a2ml_enumerator',3,'p_a2ml_enumerator','parser.py',1060),
+  ('a2ml_enumerator -> a2ml_keyword','a2ml_enumerator',1,'p_a2ml_enumerator','parser.py',1061),
+  ('a2ml_struct_type_name -> struct a2ml_identifier_optional CURLY_OPEN a2ml_struct_member_list_optional CURLY_CLOSE','a2ml_struct_type_name',5,'p_a2ml_struct_type_name','parser.py',1067),
+  ('a2ml_struct_type_name -> struct a2ml_identifier','a2ml_struct_type_name',2,'p_a2ml_struct_type_name','parser.py',1068),
+  ('a2ml_struct_member_list_optional -> empty','a2ml_struct_member_list_optional',1,'p_a2ml_struct_member_list_optional','parser.py',1074),
+  ('a2ml_struct_member_list_optional -> a2ml_struct_member_list','a2ml_struct_member_list_optional',1,'p_a2ml_struct_member_list_optional','parser.py',1075),
+  ('a2ml_struct_member_list -> a2ml_struct_member','a2ml_struct_member_list',1,'p_a2ml_struct_member_list','parser.py',1081),
+  ('a2ml_struct_member_list -> a2ml_struct_member_list a2ml_struct_member','a2ml_struct_member_list',2,'p_a2ml_struct_member_list','parser.py',1082),
+  ('a2ml_struct_member -> a2ml_member SEMICOLON','a2ml_struct_member',2,'p_a2ml_struct_member','parser.py',1092),
+  ('a2ml_member -> a2ml_type_name a2ml_array_specifier_optional','a2ml_member',2,'p_a2ml_member','parser.py',1098),
+  ('a2ml_member_optional -> empty','a2ml_member_optional',1,'p_a2ml_member_optional','parser.py',1104),
+  ('a2ml_member_optional -> a2ml_member','a2ml_member_optional',1,'p_a2ml_member_optional','parser.py',1105),
+  ('a2ml_array_specifier_optional -> empty','a2ml_array_specifier_optional',1,'p_a2ml_array_specifier_optional','parser.py',1111),
+  ('a2ml_array_specifier_optional -> a2ml_array_specifier','a2ml_array_specifier_optional',1,'p_a2ml_array_specifier_optional','parser.py',1112),
+  ('a2ml_array_specifier -> BRACE_OPEN a2ml_constant BRACE_CLOSE','a2ml_array_specifier',3,'p_a2ml_array_specifier','parser.py',1118),
+  ('a2ml_array_specifier -> a2ml_array_specifier BRACE_OPEN a2ml_constant BRACE_CLOSE','a2ml_array_specifier',4,'p_a2ml_array_specifier','parser.py',1119),
+  ('a2ml_taggedstruct_type_name -> taggedstruct a2ml_identifier_optional CURLY_OPEN a2ml_taggedstruct_member_list_optional CURLY_CLOSE','a2ml_taggedstruct_type_name',5,'p_a2ml_taggedstruct_type_name','parser.py',1125),
+  ('a2ml_taggedstruct_type_name -> taggedstruct a2ml_identifier','a2ml_taggedstruct_type_name',2,'p_a2ml_taggedstruct_type_name','parser.py',1126),
+  ('a2ml_taggedstruct_member_list_optional -> empty','a2ml_taggedstruct_member_list_optional',1,'p_a2ml_taggedstruct_member_list_optional','parser.py',1132),
+  ('a2ml_taggedstruct_member_list_optional -> a2ml_taggedstruct_member_list','a2ml_taggedstruct_member_list_optional',1,'p_a2ml_taggedstruct_member_list_optional','parser.py',1133),
+  ('a2ml_taggedstruct_member_list -> a2ml_taggedstruct_member','a2ml_taggedstruct_member_list',1,'p_a2ml_taggedstruct_member_list','parser.py',1139),
+  ('a2ml_taggedstruct_member_list -> a2ml_taggedstruct_member_list a2ml_taggedstruct_member','a2ml_taggedstruct_member_list',2,'p_a2ml_taggedstruct_member_list','parser.py',1140),
+  ('a2ml_taggedstruct_member -> a2ml_taggedstruct_definition SEMICOLON','a2ml_taggedstruct_member',2,'p_a2ml_taggedstruct_member','parser.py',1150),
+  ('a2ml_taggedstruct_member -> PARENTHESE_OPEN a2ml_taggedstruct_definition PARENTHESE_CLOSE ASTERISK SEMICOLON','a2ml_taggedstruct_member',5,'p_a2ml_taggedstruct_member','parser.py',1151),
+  ('a2ml_taggedstruct_member -> a2ml_block_definition SEMICOLON','a2ml_taggedstruct_member',2,'p_a2ml_taggedstruct_member','parser.py',1152),
+  ('a2ml_taggedstruct_member -> PARENTHESE_OPEN a2ml_block_definition PARENTHESE_CLOSE ASTERISK SEMICOLON','a2ml_taggedstruct_member',5,'p_a2ml_taggedstruct_member','parser.py',1153),
+  ('a2ml_taggedstruct_definition -> a2ml_tag a2ml_member_optional','a2ml_taggedstruct_definition',2,'p_a2ml_taggedstruct_definition','parser.py',1157),
+  ('a2ml_taggedstruct_definition -> a2ml_tag PARENTHESE_OPEN a2ml_member PARENTHESE_CLOSE ASTERISK','a2ml_taggedstruct_definition',5,'p_a2ml_taggedstruct_definition','parser.py',1158),
+  ('a2ml_taggedunion_type_name -> taggedunion a2ml_identifier_optional CURLY_OPEN a2ml_taggedunion_member_list_optional CURLY_CLOSE','a2ml_taggedunion_type_name',5,'p_a2ml_taggedunion_type_name','parser.py',1163),
+  ('a2ml_taggedunion_type_name -> taggedunion a2ml_identifier','a2ml_taggedunion_type_name',2,'p_a2ml_taggedunion_type_name','parser.py',1164),
+  ('a2ml_taggedunion_member_list -> a2ml_taggedunion_member','a2ml_taggedunion_member_list',1,'p_a2ml_taggedunion_member_list','parser.py',1168),
+  ('a2ml_taggedunion_member_list -> a2ml_taggedunion_member_list a2ml_taggedunion_member','a2ml_taggedunion_member_list',2,'p_a2ml_taggedunion_member_list','parser.py',1169),
+  ('a2ml_taggedunion_member_list_optional -> empty','a2ml_taggedunion_member_list_optional',1,'p_a2ml_taggedunion_member_list_optional','parser.py',1179),
+  ('a2ml_taggedunion_member_list_optional -> a2ml_taggedunion_member_list','a2ml_taggedunion_member_list_optional',1,'p_a2ml_taggedunion_member_list_optional','parser.py',1180),
+  ('a2ml_taggedunion_member -> a2ml_tag SEMICOLON','a2ml_taggedunion_member',2,'p_a2ml_taggedunion_member','parser.py',1186),
+  ('a2ml_taggedunion_member -> a2ml_tag a2ml_member SEMICOLON','a2ml_taggedunion_member',3,'p_a2ml_taggedunion_member','parser.py',1187),
+  ('a2ml_taggedunion_member -> a2ml_block_definition SEMICOLON','a2ml_taggedunion_member',2,'p_a2ml_taggedunion_member','parser.py',1188),
+  ('a2ml_tag -> STRING','a2ml_tag',1,'p_a2ml_tag','parser.py',1192),
+  ('a2ml_identifier -> IDENT','a2ml_identifier',1,'p_a2ml_identifier','parser.py',1196),
+  ('a2ml_identifier_optional -> empty','a2ml_identifier_optional',1,'p_a2ml_identifier_optional','parser.py',1200),
+  ('a2ml_identifier_optional -> a2ml_identifier','a2ml_identifier_optional',1,'p_a2ml_identifier_optional','parser.py',1201),
+  ('a2ml_keyword -> STRING','a2ml_keyword',1,'p_a2ml_keyword','parser.py',1205),
+  ('a2ml_constant -> NUMERIC','a2ml_constant',1,'p_a2ml_constant','parser.py',1209),
+  ('datatype -> UBYTE','datatype',1,'p_datatype','parser.py',1213),
+  ('datatype -> SBYTE','datatype',1,'p_datatype','parser.py',1214),
+  ('datatype -> UWORD','datatype',1,'p_datatype','parser.py',1215),
+  ('datatype -> SWORD','datatype',1,'p_datatype','parser.py',1216),
+  ('datatype -> ULONG','datatype',1,'p_datatype','parser.py',1217),
+  ('datatype -> SLONG','datatype',1,'p_datatype','parser.py',1218),
+  ('datatype -> A_UINT64','datatype',1,'p_datatype','parser.py',1219),
+  ('datatype -> A_INT64','datatype',1,'p_datatype','parser.py',1220),
+  ('datatype -> FLOAT32_IEEE','datatype',1,'p_datatype','parser.py',1221),
+  ('datatype -> FLOAT64_IEEE','datatype',1,'p_datatype','parser.py',1222),
+  ('datasize -> BYTE','datasize',1,'p_datasize','parser.py',1228),
+  ('datasize -> WORD','datasize',1,'p_datasize','parser.py',1229),
+  ('datasize -> LONG','datasize',1,'p_datasize','parser.py',1230),
+  ('addrtype -> PBYTE','addrtype',1,'p_addrtype','parser.py',1236),
+  ('addrtype -> PWORD','addrtype',1,'p_addrtype','parser.py',1237),
+  ('addrtype -> PLONG','addrtype',1,'p_addrtype','parser.py',1238),
+  ('addrtype -> DIRECT','addrtype',1,'p_addrtype','parser.py',1239),
+  ('indexorder -> INDEX_INCR','indexorder',1,'p_indexorder','parser.py',1245),
+  ('indexorder -> INDEX_DECR','indexorder',1,'p_indexorder','parser.py',1246),
+  ('asap2_version -> ASAP2_VERSION NUMERIC NUMERIC','asap2_version',3,'p_asap2_version','parser.py',1252),
+  ('a2ml_version -> A2ML_VERSION NUMERIC NUMERIC','a2ml_version',3,'p_a2ml_version','parser.py',1258),
+  ('generic_parameter -> IDENT','generic_parameter',1,'p_generic_parameter','parser.py',1264),
+  ('generic_parameter -> STRING','generic_parameter',1,'p_generic_parameter','parser.py',1265),
+  ('generic_parameter -> NUMERIC','generic_parameter',1,'p_generic_parameter','parser.py',1266),
+  ('generic_parameter -> begin IDENT generic_parameter_list_optional end IDENT','generic_parameter',5,'p_generic_parameter','parser.py',1267),
+  ('generic_parameter_list -> generic_parameter','generic_parameter_list',1,'p_generic_parameter_list','parser.py',1271),
+  ('generic_parameter_list -> generic_parameter_list generic_parameter','generic_parameter_list',2,'p_generic_parameter_list','parser.py',1272),
+  ('generic_parameter_list_optional -> empty','generic_parameter_list_optional',1,'p_generic_parameter_list_optional','parser.py',1282),
+  ('generic_parameter_list_optional -> generic_parameter_list','generic_parameter_list_optional',1,'p_generic_parameter_list_optional','parser.py',1283),
+  ('number_list -> NUMERIC','number_list',1,'p_number_list','parser.py',1287),
+  ('number_list -> number_list NUMERIC','number_list',2,'p_number_list','parser.py',1288),
+  ('ident_list -> IDENT','ident_list',1,'p_ident_list','parser.py',1298),
+  ('ident_list -> ident_list IDENT','ident_list',2,'p_ident_list','parser.py',1299),
+  ('string_list -> STRING','string_list',1,'p_string_list','parser.py',1309),
+  ('string_list -> string_list STRING','string_list',2,'p_string_list','parser.py',1310),
+  ('project -> begin PROJECT IDENT STRING project_optional_list_optional end PROJECT','project',7,'p_project','parser.py',1320),
+  ('project_optional -> header','project_optional',1,'p_project_optional','parser.py',1326),
+  ('project_optional -> module','project_optional',1,'p_project_optional','parser.py',1327),
+  ('project_optional_list -> project_optional','project_optional_list',1,'p_project_optional_list','parser.py',1333),
+  ('project_optional_list -> project_optional_list project_optional','project_optional_list',2,'p_project_optional_list','parser.py',1334),
+  ('project_optional_list_optional -> empty','project_optional_list_optional',1,'p_project_optional_list_optional','parser.py',1344),
+  ('project_optional_list_optional -> project_optional_list','project_optional_list_optional',1,'p_project_optional_list_optional','parser.py',1345),
+  ('header -> begin HEADER STRING header_optional_list_optional end HEADER','header',6,'p_header','parser.py',1351),
+  ('header_optional -> version','header_optional',1,'p_header_optional','parser.py',1357),
+  ('header_optional -> project_no','header_optional',1,'p_header_optional','parser.py',1358),
+  ('header_optional_list -> header_optional','header_optional_list',1,'p_header_optional_list','parser.py',1364),
+  ('header_optional_list -> header_optional_list header_optional','header_optional_list',2,'p_header_optional_list','parser.py',1365),
+  ('header_optional_list_optional -> empty','header_optional_list_optional',1,'p_header_optional_list_optional','parser.py',1375),
+  ('header_optional_list_optional -> header_optional_list','header_optional_list_optional',1,'p_header_optional_list_optional','parser.py',1376),
+  ('version -> VERSION STRING','version',2,'p_version','parser.py',1382),
+  ('project_no -> PROJECT_NO IDENT','project_no',2,'p_project_no','parser.py',1388),
+  ('module -> begin MODULE IDENT STRING module_optional_list_optional end MODULE','module',7,'p_module','parser.py',1394),
+  ('module_optional -> a2ml','module_optional',1,'p_module_optional','parser.py',1400),
+  ('module_optional -> mod_par','module_optional',1,'p_module_optional','parser.py',1401),
+  ('module_optional -> mod_common','module_optional',1,'p_module_optional','parser.py',1402),
+  ('module_optional -> if_data_xcp','module_optional',1,'p_module_optional','parser.py',1403),
+  ('module_optional -> if_data_module','module_optional',1,'p_module_optional','parser.py',1404),
+  ('module_optional -> characteristic','module_optional',1,'p_module_optional','parser.py',1405),
+  ('module_optional -> axis_pts','module_optional',1,'p_module_optional','parser.py',1406),
+  ('module_optional -> measurement','module_optional',1,'p_module_optional','parser.py',1407),
+  ('module_optional -> compu_method','module_optional',1,'p_module_optional','parser.py',1408),
+  ('module_optional -> compu_tab','module_optional',1,'p_module_optional','parser.py',1409),
+  ('module_optional -> compu_vtab','module_optional',1,'p_module_optional','parser.py',1410),
+  ('module_optional -> compu_vtab_range','module_optional',1,'p_module_optional','parser.py',1411),
+  ('module_optional -> function','module_optional',1,'p_module_optional','parser.py',1412),
+  ('module_optional -> group','module_optional',1,'p_module_optional','parser.py',1413),
+  ('module_optional -> record_layout','module_optional',1,'p_module_optional','parser.py',1414),
+  ('module_optional -> variant_coding','module_optional',1,'p_module_optional','parser.py',1415),
+  ('module_optional -> frame','module_optional',1,'p_module_optional','parser.py',1416),
+  ('module_optional -> user_rights','module_optional',1,'p_module_optional','parser.py',1417),
+  ('module_optional -> unit','module_optional',1,'p_module_optional','parser.py',1418),
+  ('module_optional_list -> module_optional','module_optional_list',1,'p_module_optional_list','parser.py',1424),
+  ('module_optional_list -> module_optional_list module_optional','module_optional_list',2,'p_module_optional_list','parser.py',1425),
+  ('module_optional_list_optional -> empty','module_optional_list_optional',1,'p_module_optional_list_optional','parser.py',1435),
+  ('module_optional_list_optional -> module_optional_list','module_optional_list_optional',1,'p_module_optional_list_optional','parser.py',1436),
+  ('a2ml -> begin A2ML a2ml_declaration_list end A2ML','a2ml',5,'p_a2ml','parser.py',1442),
+  ('if_data_xcp -> begin IF_DATA XCP if_data_xcp_optional_list_optional end IF_DATA','if_data_xcp',6,'p_if_data_xcp','parser.py',1448),
+  ('if_data_xcp_optional -> protocol_layer','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',1454),
+  ('if_data_xcp_optional -> daq','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',1455),
+  ('if_data_xcp_optional -> pag','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',1456),
+  ('if_data_xcp_optional -> pgm','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',1457),
+  ('if_data_xcp_optional -> segment','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',1458),
+  ('if_data_xcp_optional -> daq_event','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',1459),
+  ('if_data_xcp_optional -> xcp_on_can','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',1460),
+  ('if_data_xcp_optional -> generic_parameter_list','if_data_xcp_optional',1,'p_if_data_xcp_optional','parser.py',1461),
+  ('xcp_on_can -> begin XCP_ON_CAN NUMERIC xcp_on_can_optional_list_optional end XCP_ON_CAN','xcp_on_can',6,'p_xcp_on_can','parser.py',1467),
+  ('xcp_on_can_optional -> can_id_broadcast','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1473),
+  ('xcp_on_can_optional -> can_id_master','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1474),
+  ('xcp_on_can_optional -> can_id_slave','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1475),
+  ('xcp_on_can_optional -> baudrate','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1476),
+  ('xcp_on_can_optional -> sample_point','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1477),
+  ('xcp_on_can_optional -> sample_rate','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1478),
+  ('xcp_on_can_optional -> btl_cycles','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1479),
+  ('xcp_on_can_optional -> sjw','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1480),
+  ('xcp_on_can_optional -> sync_edge','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1481),
+  ('xcp_on_can_optional -> daq_list_can_id','xcp_on_can_optional',1,'p_xcp_on_can_optional','parser.py',1482),
+  ('xcp_on_can_optional_list -> xcp_on_can_optional','xcp_on_can_optional_list',1,'p_xcp_on_can_optional_list','parser.py',1488),
+  ('xcp_on_can_optional_list -> xcp_on_can_optional_list xcp_on_can_optional','xcp_on_can_optional_list',2,'p_xcp_on_can_optional_list','parser.py',1489),
+  ('xcp_on_can_optional_list_optional -> empty','xcp_on_can_optional_list_optional',1,'p_xcp_on_can_optional_list_optional','parser.py',1499),
+  ('xcp_on_can_optional_list_optional -> xcp_on_can_optional_list','xcp_on_can_optional_list_optional',1,'p_xcp_on_can_optional_list_optional','parser.py',1500),
+  ('can_id_broadcast -> CAN_ID_BROADCAST NUMERIC','can_id_broadcast',2,'p_can_id_broadcast','parser.py',1506),
+  ('can_id_master -> CAN_ID_MASTER NUMERIC','can_id_master',2,'p_can_id_master','parser.py',1512),
+  ('can_id_slave -> CAN_ID_SLAVE NUMERIC','can_id_slave',2,'p_can_id_slave','parser.py',1518),
+  ('baudrate -> BAUDRATE NUMERIC','baudrate',2,'p_baudrate','parser.py',1524),
+  ('sample_point -> SAMPLE_POINT NUMERIC','sample_point',2,'p_sample_point','parser.py',1530),
+  ('sample_rate -> SAMPLE_RATE SINGLE','sample_rate',2,'p_sample_rate','parser.py',1536),
+  ('sample_rate -> SAMPLE_RATE TRIPLE','sample_rate',2,'p_sample_rate','parser.py',1537),
+  ('btl_cycles -> BTL_CYCLES NUMERIC','btl_cycles',2,'p_btl_cycles','parser.py',1543),
+  ('sjw -> SJW NUMERIC','sjw',2,'p_sjw','parser.py',1549),
+  ('sync_edge -> SYNC_EDGE SINGLE','sync_edge',2,'p_sync_edge','parser.py',1555),
+  ('sync_edge -> SYNC_EDGE DUAL','sync_edge',2,'p_sync_edge','parser.py',1556),
+  ('daq_list_can_id -> begin DAQ_LIST_CAN_ID NUMERIC daq_list_can_id_optional_optional end DAQ_LIST_CAN_ID','daq_list_can_id',6,'p_daq_list_can_id','parser.py',1562),
+  ('daq_list_can_id_optional -> daq_list_can_id_type_variable','daq_list_can_id_optional',1,'p_daq_list_can_id_optional','parser.py',1568),
+  ('daq_list_can_id_optional -> daq_list_can_id_type_fixed','daq_list_can_id_optional',1,'p_daq_list_can_id_optional','parser.py',1569),
+  ('daq_list_can_id_optional_optional -> empty','daq_list_can_id_optional_optional',1,'p_daq_list_can_id_optional_optional','parser.py',1575),
+  ('daq_list_can_id_optional_optional -> daq_list_can_id_optional','daq_list_can_id_optional_optional',1,'p_daq_list_can_id_optional_optional','parser.py',1576),
+  ('daq_list_can_id_type_variable -> VARIABLE','daq_list_can_id_type_variable',1,'p_daq_list_can_id_type_variable','parser.py',1581),
+  ('daq_list_can_id_type_fixed -> FIXED NUMERIC','daq_list_can_id_type_fixed',2,'p_daq_list_can_id_type_fixed','parser.py',1587),
+  ('daq_event -> begin DAQ_EVENT FIXED_EVENT_LIST daq_event_optional_list_optional end DAQ_EVENT','daq_event',6,'p_daq_event','parser.py',1593),
+  ('daq_event -> begin DAQ_EVENT VARIABLE daq_event_optional_list_optional end DAQ_EVENT','daq_event',6,'p_daq_event','parser.py',1594),
+  ('daq_event_optional -> available_event_list','daq_event_optional',1,'p_daq_event_optional','parser.py',1600),
+  ('daq_event_optional -> default_event_list','daq_event_optional',1,'p_daq_event_optional','parser.py',1601),
+  ('daq_event_optional_list -> daq_event_optional','daq_event_optional_list',1,'p_daq_event_optional_list','parser.py',1607),
+  ('daq_event_optional_list -> daq_event_optional_list daq_event_optional','daq_event_optional_list',2,'p_daq_event_optional_list','parser.py',1608),
+  ('daq_event_optional_list_optional -> empty','daq_event_optional_list_optional',1,'p_daq_event_optional_list_optional','parser.py',1618),
+  ('daq_event_optional_list_optional -> daq_event_optional_list','daq_event_optional_list_optional',1,'p_daq_event_optional_list_optional','parser.py',1619),
+  ('default_event_list -> begin DEFAULT_EVENT_LIST available_event_list_optional_list_optional end DEFAULT_EVENT_LIST','default_event_list',5,'p_default_event_list','parser.py',1625),
+  ('available_event_list -> begin AVAILABLE_EVENT_LIST available_event_list_optional_list_optional end AVAILABLE_EVENT_LIST','available_event_list',5,'p_available_event_list','parser.py',1631),
+  ('available_event_list_optional -> EVENT NUMERIC','available_event_list_optional',2,'p_available_event_list_optional','parser.py',1637),
+  ('available_event_list_optional_list -> available_event_list_optional','available_event_list_optional_list',1,'p_available_event_list_optional_list','parser.py',1642),
+  ('available_event_list_optional_list -> available_event_list_optional_list available_event_list_optional','available_event_list_optional_list',2,'p_available_event_list_optional_list','parser.py',1643),
+  ('available_event_list_optional_list_optional -> empty','available_event_list_optional_list_optional',1,'p_available_event_list_optional_list_optional','parser.py',1653),
+  ('available_event_list_optional_list_optional -> available_event_list_optional_list','available_event_list_optional_list_optional',1,'p_available_event_list_optional_list_optional','parser.py',1654),
+  ('if_data_xcp_optional_list -> if_data_xcp_optional','if_data_xcp_optional_list',1,'p_if_data_xcp_optional_list','parser.py',1660),
+  ('if_data_xcp_optional_list -> if_data_xcp_optional_list if_data_xcp_optional','if_data_xcp_optional_list',2,'p_if_data_xcp_optional_list','parser.py',1661),
+  ('if_data_xcp_optional_list_optional -> empty','if_data_xcp_optional_list_optional',1,'p_if_data_xcp_optional_list_optional','parser.py',1671),
+  ('if_data_xcp_optional_list_optional -> if_data_xcp_optional_list','if_data_xcp_optional_list_optional',1,'p_if_data_xcp_optional_list_optional','parser.py',1672),
+  ('pag -> begin PAG NUMERIC pag_optional_list_optional end PAG','pag',6,'p_pag','parser.py',1678),
+  ('pgm -> begin PGM IDENT NUMERIC NUMERIC pgm_optional_list_optional end PGM','pgm',8,'p_pgm','parser.py',1684),
+  ('pgm_optional -> sector','pgm_optional',1,'p_pgm_optional','parser.py',1690),
+  ('pgm_optional -> generic_parameter_list','pgm_optional',1,'p_pgm_optional','parser.py',1691),
+  ('pgm_optional_list -> pgm_optional','pgm_optional_list',1,'p_pgm_optional_list','parser.py',1697),
+  ('pgm_optional_list -> pgm_optional_list pgm_optional','pgm_optional_list',2,'p_pgm_optional_list','parser.py',1698),
+  ('pgm_optional_list_optional -> empty','pgm_optional_list_optional',1,'p_pgm_optional_list_optional','parser.py',1708),
+  ('pgm_optional_list_optional -> pgm_optional_list','pgm_optional_list_optional',1,'p_pgm_optional_list_optional','parser.py',1709),
+  ('sector -> begin SECTOR STRING NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC end SECTOR','sector',11,'p_sector','parser.py',1715),
+  ('pag_optional -> freeze_supported','pag_optional',1,'p_pag_optional','parser.py',1721),
+  ('pag_optional -> generic_parameter_list','pag_optional',1,'p_pag_optional','parser.py',1722),
+  ('pag_optional_list -> pag_optional','pag_optional_list',1,'p_pag_optional_list','parser.py',1728),
+  ('pag_optional_list -> pag_optional_list pag_optional','pag_optional_list',2,'p_pag_optional_list','parser.py',1729),
+  ('pag_optional_list_optional -> empty','pag_optional_list_optional',1,'p_pag_optional_list_optional','parser.py',1739),
+  ('pag_optional_list_optional -> pag_optional_list','pag_optional_list_optional',1,'p_pag_optional_list_optional','parser.py',1740),
+  ('freeze_supported -> FREEZE_SUPPORTED','freeze_supported',1,'p_freeze_supported','parser.py',1746),
+  ('daq -> begin DAQ daq_config_type NUMERIC NUMERIC NUMERIC optimisation_type address_extension identification_field_type granularity_odt_entry NUMERIC overload_indication daq_optional_list_optional end DAQ','daq',15,'p_daq','parser.py',1752),
+  ('daq_config_type -> STATIC','daq_config_type',1,'p_daq_config_type','parser.py',1758),
+  ('daq_config_type -> DYNAMIC','daq_config_type',1,'p_daq_config_type','parser.py',1759),
+  ('daq_optional -> daq_list','daq_optional',1,'p_daq_optional','parser.py',1765),
+  ('daq_optional -> event','daq_optional',1,'p_daq_optional','parser.py',1766),
+  ('daq_optional -> timestamp_supported','daq_optional',1,'p_daq_optional','parser.py',1767),
+  ('daq_optional -> stim','daq_optional',1,'p_daq_optional','parser.py',1768),
+  ('daq_optional -> optimisation_type','daq_optional',1,'p_daq_optional','parser.py',1769),
+  ('daq_optional -> address_extension','daq_optional',1,'p_daq_optional','parser.py',1770),
+  ('daq_optional -> identification_field_type','daq_optional',1,'p_daq_optional','parser.py',1771),
+  ('daq_optional -> granularity_odt_entry','daq_optional',1,'p_daq_optional','parser.py',1772),
+  ('daq_optional -> prescaler_supported','daq_optional',1,'p_daq_optional','parser.py',1773),
+  ('daq_optional -> resume_supported','daq_optional',1,'p_daq_optional','parser.py',1774),
+  ('daq_optional -> IDENT','daq_optional',1,'p_daq_optional','parser.py',1775),
+  ('daq_optional -> NUMERIC','daq_optional',1,'p_daq_optional','parser.py',1776),
+  ('prescaler_supported -> PRESCALER_SUPPORTED','prescaler_supported',1,'p_prescaler_supported','parser.py',1782),
+  ('resume_supported -> RESUME_SUPPORTED','resume_supported',1,'p_resume_supported','parser.py',1788),
+  ('optimisation_type -> OPTIMISATION_TYPE_DEFAULT','optimisation_type',1,'p_optimisation_type','parser.py',1794),
+  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_16','optimisation_type',1,'p_optimisation_type','parser.py',1795),
+  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_32','optimisation_type',1,'p_optimisation_type','parser.py',1796),
+  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_64','optimisation_type',1,'p_optimisation_type','parser.py',1797),
+  ('optimisation_type -> OPTIMISATION_TYPE_ODT_TYPE_ALIGNMENT','optimisation_type',1,'p_optimisation_type','parser.py',1798),
+  ('optimisation_type -> OPTIMISATION_TYPE_MAX_ENTRY_SIZE','optimisation_type',1,'p_optimisation_type','parser.py',1799),
+  ('address_extension -> ADDRESS_EXTENSION_FREE','address_extension',1,'p_address_extension','parser.py',1805),
+  ('address_extension -> ADDRESS_EXTENSION_ODT','address_extension',1,'p_address_extension','parser.py',1806),
+  ('address_extension -> ADDRESS_EXTENSION_DAQ','address_extension',1,'p_address_extension','parser.py',1807),
+  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_ABSOLUTE','identification_field_type',1,'p_identification_field_type','parser.py',1813),
+  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_BYTE','identification_field_type',1,'p_identification_field_type','parser.py',1814),
+  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD','identification_field_type',1,'p_identification_field_type','parser.py',1815),
+  ('identification_field_type -> IDENTIFICATION_FIELD_TYPE_RELATIVE_WORD_ALIGNED','identification_field_type',1,'p_identification_field_type','parser.py',1816),
+  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_BYTE','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',1822),
+  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_WORD','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',1823),
+  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_DWORD','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',1824),
+  ('granularity_odt_entry -> GRANULARITY_ODT_ENTRY_SIZE_DAQ_DLONG','granularity_odt_entry',1,'p_granularity_odt_entry','parser.py',1825),
+  ('overload_indication -> NO_OVERLOAD_INDICATION','overload_indication',1,'p_overload_indication','parser.py',1831),
+  ('overload_indication -> OVERLOAD_INDICATION_PID','overload_indication',1,'p_overload_indication','parser.py',1832),
+  ('overload_indication -> OVERLOAD_INDICATION_EVENT','overload_indication',1,'p_overload_indication','parser.py',1833),
+  ('daq_optional_list -> daq_optional','daq_optional_list',1,'p_daq_optional_list','parser.py',1839),
+  ('daq_optional_list -> daq_optional_list daq_optional','daq_optional_list',2,'p_daq_optional_list','parser.py',1840),
+  ('daq_optional_list_optional -> empty','daq_optional_list_optional',1,'p_daq_optional_list_optional','parser.py',1850),
+  ('daq_optional_list_optional -> daq_optional_list','daq_optional_list_optional',1,'p_daq_optional_list_optional','parser.py',1851),
+  ('event -> begin EVENT STRING STRING NUMERIC daq_list_type_enum NUMERIC NUMERIC NUMERIC NUMERIC end EVENT','event',12,'p_event','parser.py',1857),
+  ('daq_list -> begin DAQ_LIST NUMERIC daq_list_optional_list_optional end DAQ_LIST','daq_list',6,'p_daq_list','parser.py',1863),
+  ('daq_list_optional -> daq_list_type','daq_list_optional',1,'p_daq_list_optional','parser.py',1869),
+  ('daq_list_optional -> max_odt','daq_list_optional',1,'p_daq_list_optional','parser.py',1870),
+  ('daq_list_optional -> max_odt_entries','daq_list_optional',1,'p_daq_list_optional','parser.py',1871),
+  ('daq_list_optional -> first_pid','daq_list_optional',1,'p_daq_list_optional','parser.py',1872),
+  ('daq_list_optional -> event_fixed','daq_list_optional',1,'p_daq_list_optional','parser.py',1873),
+  ('daq_list_optional -> predefined','daq_list_optional',1,'p_daq_list_optional','parser.py',1874),
+  ('daq_list_type_enum -> DAQ','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',1880),
+  ('daq_list_type_enum -> STIM','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',1881),
+  ('daq_list_type_enum -> DAQ_STIM','daq_list_type_enum',1,'p_daq_list_type_enum','parser.py',1882),
+  ('daq_list_type -> DAQ_LIST_TYPE daq_list_type_enum','daq_list_type',2,'p_daq_list_type','parser.py',1888),
+  ('max_odt -> MAX_ODT NUMERIC','max_odt',2,'p_max_odt','parser.py',1894),
+  ('max_odt_entries -> MAX_ODT_ENTRIES NUMERIC','max_odt_entries',2,'p_max_odt_entries','parser.py',1900),
+  ('first_pid -> FIRST_PID NUMERIC','first_pid',2,'p_first_pid','parser.py',1906),
+  ('event_fixed -> EVENT_FIXED NUMERIC','event_fixed',2,'p_event_fixed','parser.py',1912),
+  ('predefined -> generic_parameter_list','predefined',1,'p_predefined','parser.py',1918),
+  ('daq_list_optional_list -> daq_list_optional','daq_list_optional_list',1,'p_daq_list_optional_list','parser.py',1924),
+  ('daq_list_optional_list -> daq_list_optional_list daq_list_optional','daq_list_optional_list',2,'p_daq_list_optional_list','parser.py',1925),
+  ('daq_list_optional_list_optional -> empty','daq_list_optional_list_optional',1,'p_daq_list_optional_list_optional','parser.py',1935),
+  ('daq_list_optional_list_optional -> daq_list_optional_list','daq_list_optional_list_optional',1,'p_daq_list_optional_list_optional','parser.py',1936),
+  ('timestamp_supported -> begin TIMESTAMP_SUPPORTED NUMERIC IDENT IDENT timestamp_fixed end TIMESTAMP_SUPPORTED','timestamp_supported',8,'p_timestamp_supported','parser.py',1942),
+  ('stim -> begin STIM GRANULARITY_ODT_ENTRY_SIZE_STIM_BYTE NUMERIC end STIM','stim',6,'p_stim','parser.py',1948),
+  ('timestamp_fixed -> empty','timestamp_fixed',1,'p_timestamp_fixed','parser.py',1953),
+  ('timestamp_fixed -> TIMESTAMP_FIXED','timestamp_fixed',1,'p_timestamp_fixed','parser.py',1954),
+  ('protocol_layer -> begin PROTOCOL_LAYER NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC protocol_layer_optional_list_optional end PROTOCOL_LAYER','protocol_layer',15,'p_protocol_layer','parser.py',1959),
+  ('protocol_layer_optional -> generic_parameter_list','protocol_layer_optional',1,'p_protocol_layer_optional','parser.py',1965),
+  ('protocol_layer_optional_list -> protocol_layer_optional','protocol_layer_optional_list',1,'p_protocol_layer_optional_list','parser.py',1969),
+  ('protocol_layer_optional_list -> protocol_layer_optional_list protocol_layer_optional','protocol_layer_optional_list',2,'p_protocol_layer_optional_list','parser.py',1970),
+  ('protocol_layer_optional_list_optional -> empty','protocol_layer_optional_list_optional',1,'p_protocol_layer_optional_list_optional','parser.py',1980),
+  ('protocol_layer_optional_list_optional -> protocol_layer_optional_list','protocol_layer_optional_list_optional',1,'p_protocol_layer_optional_list_optional','parser.py',1981),
+  ('if_data_module -> begin IF_DATA IDENT if_data_module_optional_list_optional end IF_DATA','if_data_module',6,'p_if_data_module','parser.py',1987),
+  ('if_data_module_optional -> source','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1993),
+  ('if_data_module_optional -> raster','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1994),
+  ('if_data_module_optional -> event_group','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1995),
+  ('if_data_module_optional -> seed_key','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1996),
+  ('if_data_module_optional -> checksum','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1997),
+  ('if_data_module_optional -> tp_blob tp_data','if_data_module_optional',2,'p_if_data_module_optional','parser.py',1998),
+  ('if_data_module_optional -> if_data_module_unsupported_element','if_data_module_optional',1,'p_if_data_module_optional','parser.py',1999),
+  ('if_data_module_optional_list -> if_data_module_optional','if_data_module_optional_list',1,'p_if_data_module_optional_list','parser.py',2005),
+  ('if_data_module_optional_list -> if_data_module_optional_list if_data_module_optional','if_data_module_optional_list',2,'p_if_data_module_optional_list','parser.py',2006),
+  ('if_data_module_optional_list_optional -> empty','if_data_module_optional_list_optional',1,'p_if_data_module_optional_list_optional','parser.py',2016),
+  ('if_data_module_optional_list_optional -> if_data_module_optional_list','if_data_module_optional_list_optional',1,'p_if_data_module_optional_list_optional','parser.py',2017),
+  ('if_data_module_unsupported_element -> generic_parameter_list','if_data_module_unsupported_element',1,'p_if_data_module_unsupported_element','parser.py',2023),
+  ('source -> begin SOURCE IDENT NUMERIC NUMERIC source_optional_list_optional end SOURCE','source',8,'p_source','parser.py',2027),
+  ('raster -> begin RASTER STRING STRING NUMERIC NUMERIC NUMERIC end RASTER','raster',9,'p_raster','parser.py',2033),
+  ('event_group -> begin EVENT_GROUP STRING STRING number_list end EVENT_GROUP','event_group',7,'p_event_group','parser.py',2039),
+  ('seed_key -> begin SEED_KEY STRING STRING STRING end SEED_KEY','seed_key',7,'p_seed_key','parser.py',2045),
+  ('checksum -> begin CHECKSUM STRING end CHECKSUM','checksum',5,'p_checksum','parser.py',2051),
+  ('checksum -> begin CHECKSUM IDENT max_block_size end CHECKSUM','checksum',6,'p_checksum','parser.py',2052),
+  ('max_block_size -> MAX_BLOCK_SIZE NUMERIC','max_block_size',2,'p_max_block_size','parser.py',2061),
+  ('tp_blob -> TP_BLOB','tp_blob',1,'p_tp_blob','parser.py',2067),
+  ('tp_data -> generic_parameter_list','tp_data',1,'p_tp_data','parser.py',2073),
+  ('source_optional -> display_identifier','source_optional',1,'p_source_optional','parser.py',2079),
+  ('source_optional -> qp_blob','source_optional',1,'p_source_optional','parser.py',2080),
+  ('source_optional_list -> source_optional','source_optional_list',1,'p_source_optional_list','parser.py',2086),
+  ('source_optional_list -> source_optional_list source_optional','source_optional_list',2,'p_source_optional_list','parser.py',2087),
+  ('source_optional_list_optional -> empty','source_optional_list_optional',1,'p_source_optional_list_optional','parser.py',2097),
+  ('source_optional_list_optional -> source_optional_list','source_optional_list_optional',1,'p_source_optional_list_optional','parser.py',2098),
+  ('qp_blob -> QP_BLOB IDENT','qp_blob',2,'p_qp_blob','parser.py',2104),
+  ('mod_par -> begin MOD_PAR STRING mod_par_optional_list_optional end MOD_PAR','mod_par',6,'p_mod_par','parser.py',2108),
+  ('mod_par_optional -> version','mod_par_optional',1,'p_mod_par_optional','parser.py',2114),
+  ('mod_par_optional -> addr_epk','mod_par_optional',1,'p_mod_par_optional','parser.py',2115),
+  ('mod_par_optional -> epk','mod_par_optional',1,'p_mod_par_optional','parser.py',2116),
+  ('mod_par_optional -> supplier','mod_par_optional',1,'p_mod_par_optional','parser.py',2117),
+  ('mod_par_optional -> customer','mod_par_optional',1,'p_mod_par_optional','parser.py',2118),
+  ('mod_par_optional -> customer_no','mod_par_optional',1,'p_mod_par_optional','parser.py',2119),
+  ('mod_par_optional -> user','mod_par_optional',1,'p_mod_par_optional','parser.py',2120),
+  ('mod_par_optional -> phone_no','mod_par_optional',1,'p_mod_par_optional','parser.py',2121),
+  ('mod_par_optional -> ecu','mod_par_optional',1,'p_mod_par_optional','parser.py',2122),
+  ('mod_par_optional -> cpu_type','mod_par_optional',1,'p_mod_par_optional','parser.py',2123),
+  ('mod_par_optional -> no_of_interfaces','mod_par_optional',1,'p_mod_par_optional','parser.py',2124),
+  ('mod_par_optional -> ecu_calibration_offset','mod_par_optional',1,'p_mod_par_optional','parser.py',2125),
+  ('mod_par_optional -> calibration_method','mod_par_optional',1,'p_mod_par_optional','parser.py',2126),
+  ('mod_par_optional -> memory_layout','mod_par_optional',1,'p_mod_par_optional','parser.py',2127),
+  ('mod_par_optional -> memory_segment','mod_par_optional',1,'p_mod_par_optional','parser.py',2128),
+  ('mod_par_optional -> system_constant','mod_par_optional',1,'p_mod_par_optional','parser.py',2129),
+  ('mod_par_optional_list -> mod_par_optional','mod_par_optional_list',1,'p_mod_par_optional_list','parser.py',2135),
+  ('mod_par_optional_list -> mod_par_optional_list mod_par_optional','mod_par_optional_list',2,'p_mod_par_optional_list','parser.py',2136),
+  ('mod_par_optional_list_optional -> empty','mod_par_optional_list_optional',1,'p_mod_par_optional_list_optional','parser.py',2146),
+  ('mod_par_optional_list_optional -> mod_par_optional_list','mod_par_optional_list_optional',1,'p_mod_par_optional_list_optional','parser.py',2147),
+  ('addr_epk -> ADDR_EPK NUMERIC','addr_epk',2,'p_addr_epk','parser.py',2153),
+  ('epk -> EPK STRING','epk',2,'p_epk','parser.py',2159),
+  ('supplier -> SUPPLIER STRING','supplier',2,'p_supplier','parser.py',2165),
+  ('customer -> CUSTOMER STRING','customer',2,'p_customer','parser.py',2171),
+  ('customer_no -> CUSTOMER_NO STRING','customer_no',2,'p_customer_no','parser.py',2177),
+  ('user -> USER STRING','user',2,'p_user','parser.py',2183),
+  ('phone_no -> PHONE_NO STRING','phone_no',2,'p_phone_no','parser.py',2189),
+  ('mod_common -> begin MOD_COMMON STRING mod_common_optional_list_optional end MOD_COMMON','mod_common',6,'p_mod_common','parser.py',2195),
+  ('mod_common_optional -> s_rec_layout','mod_common_optional',1,'p_mod_common_optional','parser.py',2201),
+  ('mod_common_optional -> deposit','mod_common_optional',1,'p_mod_common_optional','parser.py',2202),
+  ('mod_common_optional -> byte_order','mod_common_optional',1,'p_mod_common_optional','parser.py',2203),
+  ('mod_common_optional -> data_size','mod_common_optional',1,'p_mod_common_optional','parser.py',2204),
+  ('mod_common_optional -> alignment_byte','mod_common_optional',1,'p_mod_common_optional','parser.py',2205),
+  ('mod_common_optional -> alignment_word','mod_common_optional',1,'p_mod_common_optional','parser.py',2206),
+  ('mod_common_optional -> alignment_long','mod_common_optional',1,'p_mod_common_optional','parser.py',2207),
+  ('mod_common_optional -> alignment_int64','mod_common_optional',1,'p_mod_common_optional','parser.py',2208),
+  ('mod_common_optional -> alignment_float32_ieee','mod_common_optional',1,'p_mod_common_optional','parser.py',2209),
+  ('mod_common_optional -> alignment_float64_ieee','mod_common_optional',1,'p_mod_common_optional','parser.py',2210),
+  ('mod_common_optional_list -> mod_common_optional','mod_common_optional_list',1,'p_mod_common_optional_parameter_list','parser.py',2216),
+  ('mod_common_optional_list -> mod_common_optional_list mod_common_optional','mod_common_optional_list',2,'p_mod_common_optional_parameter_list','parser.py',2217),
+  ('mod_common_optional_list_optional -> empty','mod_common_optional_list_optional',1,'p_mod_common_optional_parameter_list_optional','parser.py',2227),
+  ('mod_common_optional_list_optional -> mod_common_optional_list','mod_common_optional_list_optional',1,'p_mod_common_optional_parameter_list_optional','parser.py',2228),
+  ('s_rec_layout -> S_REC_LAYOUT IDENT','s_rec_layout',2,'p_s_rec_layout','parser.py',2234),
+  ('data_size -> DATA_SIZE NUMERIC','data_size',2,'p_data_size','parser.py',2240),
+  ('ecu -> ECU STRING','ecu',2,'p_ecu','parser.py',2246),
+  ('cpu_type -> CPU_TYPE STRING','cpu_type',2,'p_cpu_type','parser.py',2252),
+  ('no_of_interfaces -> NO_OF_INTERFACES NUMERIC','no_of_interfaces',2,'p_no_of_interfaces','parser.py',2258),
+  ('ecu_calibration_offset -> ECU_CALIBRATION_OFFSET NUMERIC','ecu_calibration_offset',2,'p_ecu_calibration_offset','parser.py',2264),
+  ('calibration_method -> begin CALIBRATION_METHOD STRING NUMERIC calibration_method_optional_list_optional end CALIBRATION_METHOD','calibration_method',7,'p_calibration_method','parser.py',2270),
+  ('calibration_method_optional -> calibration_handle','calibration_method_optional',1,'p_calibration_method_optional','parser.py',2276),
+  ('calibration_method_optional_list -> calibration_method_optional','calibration_method_optional_list',1,'p_calibration_method_optional_list','parser.py',2282),
+  ('calibration_method_optional_list -> calibration_method_optional_list calibration_method_optional','calibration_method_optional_list',2,'p_calibration_method_optional_list','parser.py',2283),
+  ('calibration_method_optional_list_optional -> empty','calibration_method_optional_list_optional',1,'p_calibration_method_optional_list_optional','parser.py',2293),
+  ('calibration_method_optional_list_optional -> calibration_method_optional_list','calibration_method_optional_list_optional',1,'p_calibration_method_optional_list_optional','parser.py',2294),
+  ('calibration_handle -> begin CALIBRATION_HANDLE calibration_handle_optional_list_optional end CALIBRATION_HANDLE','calibration_handle',5,'p_calibration_handle','parser.py',2300),
+  ('calibration_handle_optional -> NUMERIC','calibration_handle_optional',1,'p_calibration_handle_optional','parser.py',2306),
+  ('calibration_handle_optional_list -> calibration_handle_optional','calibration_handle_optional_list',1,'p_calibration_handle_optional_list','parser.py',2312),
+  ('calibration_handle_optional_list -> calibration_handle_optional_list calibration_handle_optional','calibration_handle_optional_list',2,'p_calibration_handle_optional_list','parser.py',2313),
+  ('calibration_handle_optional_list_optional -> empty','calibration_handle_optional_list_optional',1,'p_calibration_handle_optional_list_optional','parser.py',2323),
+  ('calibration_handle_optional_list_optional -> calibration_handle_optional_list','calibration_handle_optional_list_optional',1,'p_calibration_handle_optional_list_optional','parser.py',2324),
+  ('memory_layout -> begin MEMORY_LAYOUT memory_layout_prg_type NUMERIC NUMERIC number_list memory_layout_optional_list_optional end MEMORY_LAYOUT','memory_layout',9,'p_memory_layout','parser.py',2330),
+  ('memory_layout_prg_type -> PRG_CODE','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',2336),
+  ('memory_layout_prg_type -> PRG_DATA','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',2337),
+  ('memory_layout_prg_type -> PRG_RESERVED','memory_layout_prg_type',1,'p_memory_layout_prg_type','parser.py',2338),
+  ('memory_layout_optional -> if_data_memory_layout','memory_layout_optional',1,'p_memory_layout_optional','parser.py',2344),
+  ('memory_layout_optional_list -> memory_layout_optional','memory_layout_optional_list',1,'p_memory_layout_optional_list','parser.py',2350),
+  ('memory_layout_optional_list -> memory_layout_optional_list memory_layout_optional','memory_layout_optional_list',2,'p_memory_layout_optional_list','parser.py',2351),
+  ('memory_layout_optional_list_optional -> empty','memory_layout_optional_list_optional',1,'p_memory_layout_optional_list_optional','parser.py',2361),
+  ('memory_layout_optional_list_optional -> memory_layout_optional_list','memory_layout_optional_list_optional',1,'p_memory_layout_optional_list_optional','parser.py',2362),
+  ('if_data_memory_layout -> begin IF_DATA IDENT if_data_memory_layout_optional_list_optional end IF_DATA','if_data_memory_layout',6,'p_if_data_memory_layout','parser.py',2367),
+  ('if_data_memory_layout_optional -> dp_blob dp_data','if_data_memory_layout_optional',2,'p_if_data_memory_layout_optional','parser.py',2371),
+  ('if_data_memory_layout_optional -> ba_blob pa_data','if_data_memory_layout_optional',2,'p_if_data_memory_layout_optional','parser.py',2372),
+  ('if_data_memory_layout_optional_list -> if_data_memory_layout_optional','if_data_memory_layout_optional_list',1,'p_if_data_memory_layout_optional_list','parser.py',2376),
+  ('if_data_memory_layout_optional_list -> if_data_memory_layout_optional_list if_data_memory_layout_optional','if_data_memory_layout_optional_list',2,'p_if_data_memory_layout_optional_list','parser.py',2377),
+  ('if_data_memory_layout_optional_list_optional -> empty','if_data_memory_layout_optional_list_optional',1,'p_if_data_memory_layout_optional_list_optional','parser.py',2387),
+  ('if_data_memory_layout_optional_list_optional -> if_data_memory_layout_optional_list','if_data_memory_layout_optional_list_optional',1,'p_if_data_memory_layout_optional_list_optional','parser.py',2388),
+  ('dp_blob -> DP_BLOB','dp_blob',1,'p_dp_blob','parser.py',2392),
+  ('ba_blob -> BA_BLOB','ba_blob',1,'p_ba_blob','parser.py',2398),
+  ('dp_data -> generic_parameter_list','dp_data',1,'p_dp_data','parser.py',2404),
+  ('pa_data -> generic_parameter_list','pa_data',1,'p_pa_data','parser.py',2410),
+  ('memory_segment -> begin MEMORY_SEGMENT IDENT STRING memory_segment_prg_type memory_segment_memory_type memory_segment_attributes NUMERIC NUMERIC number_list memory_segment_optional_list_optional end MEMORY_SEGMENT','memory_segment',13,'p_memory_segment','parser.py',2416),
+  ('memory_segment_optional -> if_data_memory_segment','memory_segment_optional',1,'p_memory_segment_optional','parser.py',2422),
+  ('memory_segment_optional -> if_data_xcp','memory_segment_optional',1,'p_memory_segment_optional','parser.py',2423),
+  ('memory_segment_optional_parameter_list -> memory_segment_optional','memory_segment_optional_parameter_list',1,'p_memory_segment_optional_parameter_list','parser.py',2429),
+  ('memory_segment_optional_parameter_list -> memory_segment_optional_parameter_list memory_segment_optional','memory_segment_optional_parameter_list',2,'p_memory_segment_optional_parameter_list','parser.py',2430),
+  ('memory_segment_optional_list_optional -> empty','memory_segment_optional_list_optional',1,'p_memory_segment_optional_list_optional','parser.py',2440),
+  ('memory_segment_optional_list_optional -> memory_segment_optional_parameter_list','memory_segment_optional_list_optional',1,'p_memory_segment_optional_list_optional','parser.py',2441),
+  ('memory_segment_prg_type -> CODE','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',2447),
+  ('memory_segment_prg_type -> DATA','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',2448),
+  ('memory_segment_prg_type -> OFFLINE_DATA','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',2449),
+  ('memory_segment_prg_type -> VARIABLES','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',2450),
+  ('memory_segment_prg_type -> SERAM','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',2451),
+  ('memory_segment_prg_type -> RESERVED','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',2452),
+  ('memory_segment_prg_type -> CALIBRATION_VARIABLES','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',2453),
+  ('memory_segment_prg_type -> EXCLUDE_FROM_FLASH','memory_segment_prg_type',1,'p_memory_segment_prg_type','parser.py',2454),
+  ('memory_segment_memory_type -> RAM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',2460),
+  ('memory_segment_memory_type -> EEPROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',2461),
+  ('memory_segment_memory_type -> EPROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',2462),
+  ('memory_segment_memory_type -> ROM','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',2463),
+  ('memory_segment_memory_type -> REGISTER','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',2464),
+  ('memory_segment_memory_type -> FLASH','memory_segment_memory_type',1,'p_memory_segment_memory_type','parser.py',2465),
+  ('memory_segment_attributes -> INTERN','memory_segment_attributes',1,'p_memory_segment_attributes','parser.py',2471),
+  ('memory_segment_attributes -> EXTERN','memory_segment_attributes',1,'p_memory_segment_attributes','parser.py',2472),
+  ('system_constant -> SYSTEM_CONSTANT STRING STRING','system_constant',3,'p_system_constant','parser.py',2478),
+  ('if_data_memory_segment -> begin IF_DATA IDENT if_data_memory_segment_optional_list_optional end IF_DATA','if_data_memory_segment',6,'p_if_data_memory_segment','parser.py',2484),
+  ('if_data_memory_segment_optional -> address_mapping','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',2490),
+  ('if_data_memory_segment_optional -> segment','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',2491),
+  ('if_data_memory_segment_optional -> generic_parameter','if_data_memory_segment_optional',1,'p_if_data_memory_segment_optional','parser.py',2492),
+  ('if_data_memory_segment_optional_list -> if_data_memory_segment_optional','if_data_memory_segment_optional_list',1,'p_if_data_memory_segment_optional_list','parser.py',2498),
+  ('if_data_memory_segment_optional_list -> if_data_memory_segment_optional_list if_data_memory_segment_optional','if_data_memory_segment_optional_list',2,'p_if_data_memory_segment_optional_list','parser.py',2499),
+  ('if_data_memory_segment_optional_list_optional -> empty','if_data_memory_segment_optional_list_optional',1,'p_if_data_memory_segment_optional_list_optional','parser.py',2509),
+  ('if_data_memory_segment_optional_list_optional -> if_data_memory_segment_optional_list','if_data_memory_segment_optional_list_optional',1,'p_if_data_memory_segment_optional_list_optional','parser.py',2510),
+  ('segment -> begin SEGMENT NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC segment_optional_parameter_list_optional end SEGMENT','segment',10,'p_segment','parser.py',2516),
+  ('segment_optional_parameter -> page','segment_optional_parameter',1,'p_segment_optional_parameter','parser.py',2522),
+  ('segment_optional_parameter -> checksum','segment_optional_parameter',1,'p_segment_optional_parameter','parser.py',2523),
+  ('segment_optional_parameter_list -> segment_optional_parameter','segment_optional_parameter_list',1,'p_segment_optional_parameter_list','parser.py',2529),
+  ('segment_optional_parameter_list -> segment_optional_parameter_list segment_optional_parameter','segment_optional_parameter_list',2,'p_segment_optional_parameter_list','parser.py',2530),
+  ('segment_optional_parameter_list_optional -> empty','segment_optional_parameter_list_optional',1,'p_segment_optional_parameter_list_optional','parser.py',2540),
+  ('segment_optional_parameter_list_optional -> segment_optional_parameter_list','segment_optional_parameter_list_optional',1,'p_segment_optional_parameter_list_optional','parser.py',2541),
+  ('page -> begin PAGE NUMERIC IDENT IDENT IDENT page_optional_parameter_list_optional end PAGE','page',9,'p_page','parser.py',2547),
+  ('page_optional_parameter -> init_segment','page_optional_parameter',1,'p_page_optional_parameter','parser.py',2551),
+  ('page_optional_parameter_list -> page_optional_parameter','page_optional_parameter_list',1,'p_page_optional_parameter_list','parser.py',2555),
+  ('page_optional_parameter_list -> page_optional_parameter_list page_optional_parameter','page_optional_parameter_list',2,'p_page_optional_parameter_list','parser.py',2556),
+  ('page_optional_parameter_list_optional -> empty','page_optional_parameter_list_optional',1,'p_page_optional_parameter_list_optional','parser.py',2566),
+  ('page_optional_parameter_list_optional -> page_optional_parameter_list','page_optional_parameter_list_optional',1,'p_page_optional_parameter_list_optional','parser.py',2567),
+  ('init_segment -> INIT_SEGMENT NUMERIC','init_segment',2,'p_init_segment','parser.py',2571),
+  ('address_mapping -> ADDRESS_MAPPING NUMERIC NUMERIC NUMERIC','address_mapping',4,'p_address_mapping','parser.py',2575),
+  ('characteristic -> begin CHARACTERISTIC IDENT STRING characteristic_type NUMERIC IDENT NUMERIC IDENT NUMERIC NUMERIC characteristic_optional_list_optional end CHARACTERISTIC','characteristic',14,'p_characteristic','parser.py',2581),
+  ('characteristic_type -> VALUE','characteristic_type',1,'p_characteristic_type','parser.py',2587),
+  ('characteristic_type -> CURVE','characteristic_type',1,'p_characteristic_type','parser.py',2588),
+  ('characteristic_type -> MAP','characteristic_type',1,'p_characteristic_type','parser.py',2589),
+  ('characteristic_type -> CUBOID','characteristic_type',1,'p_characteristic_type','parser.py',2590),
+  ('characteristic_type -> VAL_BLK','characteristic_type',1,'p_characteristic_type','parser.py',2591),
+  ('characteristic_type -> ASCII','characteristic_type',1,'p_characteristic_type','parser.py',2592),
+  ('display_identifier -> DISPLAY_IDENTIFIER IDENT','display_identifier',2,'p_display_identifier','parser.py',2598),
+  ('format -> FORMAT STRING','format',2,'p_format','parser.py',2604),
+  ('byte_order -> BYTE_ORDER byte_order_type','byte_order',2,'p_byte_order','parser.py',2610),
+  ('byte_order_type -> MSB_FIRST','byte_order_type',1,'p_byte_order_type','parser.py',2616),
+  ('byte_order_type -> MSB_LAST','byte_order_type',1,'p_byte_order_type','parser.py',2617),
+  ('bit_mask -> BIT_MASK NUMERIC','bit_mask',2,'p_bit_mask','parser.py',2623),
+  ('function_list -> begin FUNCTION_LIST function_list_optional_list_optional end FUNCTION_LIST','function_list',5,'p_function_list','parser.py',2629),
+  ('function_list_optional -> IDENT','function_list_optional',1,'p_function_list_optional','parser.py',2635),
+  ('function_list_optional_list -> function_list_optional','function_list_optional_list',1,'p_function_list_optional_list','parser.py',2641),
+  ('function_list_optional_list -> function_list_optional_list function_list_optional','function_list_optional_list',2,'p_function_list_optional_list','parser.py',2642),
+  ('function_list_optional_list_optional -> empty','function_list_optional_list_optional',1,'p_function_list_optional_list_optional','parser.py',2652),
+  ('function_list_optional_list_optional -> function_list_optional_list','function_list_optional_list_optional',1,'p_function_list_optional_list_optional','parser.py',2653),
+  ('number -> NUMBER NUMERIC','number',2,'p_number','parser.py',2659),
+  ('extended_limits -> EXTENDED_LIMITS NUMERIC NUMERIC','extended_limits',3,'p_extended_limits','parser.py',2665),
+  ('map_list -> begin MAP_LIST ident_list end MAP_LIST','map_list',5,'p_map_list','parser.py',2670),
+  ('max_refresh -> MAX_REFRESH NUMERIC NUMERIC','max_refresh',3,'p_max_refresh','parser.py',2676),
+  ('dependent_characteristic -> begin DEPENDENT_CHARACTERISTIC STRING ident_list end DEPENDENT_CHARACTERISTIC','dependent_characteristic',6,'p_dependent_characteristic','parser.py',2682),
+  ('virtual_characteristic -> begin VIRTUAL_CHARACTERISTIC STRING virtual_characteristic_optional end VIRTUAL_CHARACTERISTIC','virtual_characteristic',6,'p_virtual_characteristic','parser.py',2688),
+  ('virtual_characteristic_optional -> empty','virtual_characteristic_optional',1,'p_virtual_characteristic_optional','parser.py',2694),
+  ('virtual_characteristic_optional -> ident_list','virtual_characteristic_optional',1,'p_virtual_characteristic_optional','parser.py',2695),
+  ('ref_memory_segment -> REF_MEMORY_SEGMENT IDENT','ref_memory_segment',2,'p_ref_memory_segment','parser.py',2701),
+  ('annotation -> begin ANNOTATION annotation_optional_list_optional end ANNOTATION','annotation',5,'p_annotation','parser.py',2707),
+  ('annotation_optional -> annotation_label','annotation_optional',1,'p_annotation_optional','parser.py',2713),
+  ('annotation_optional -> annotation_origin','annotation_optional',1,'p_annotation_optional','parser.py',2714),
+  ('annotation_optional -> annotation_text','annotation_optional',1,'p_annotation_optional','parser.py',2715),
+  ('annotation_optional_list -> annotation_optional','annotation_optional_list',1,'p_annotation_optional_list','parser.py',2721),
+  ('annotation_optional_list -> annotation_optional_list annotation_optional','annotation_optional_list',2,'p_annotation_optional_list','parser.py',2722),
+  ('annotation_optional_list_optional -> empty','annotation_optional_list_optional',1,'p_annotation_optional_list_optional','parser.py',2732),
+  ('annotation_optional_list_optional -> annotation_optional_list','annotation_optional_list_optional',1,'p_annotation_optional_list_optional','parser.py',2733),
+  ('annotation_label -> ANNOTATION_LABEL STRING','annotation_label',2,'p_annotation_label','parser.py',2739),
+  ('annotation_origin -> ANNOTATION_ORIGIN STRING','annotation_origin',2,'p_annotation_origin','parser.py',2745),
+  ('annotation_text -> begin ANNOTATION_TEXT string_list end ANNOTATION_TEXT','annotation_text',5,'p_annotation_text','parser.py',2751),
+  ('comparison_quantity -> COMPARISON_QUANTITY IDENT','comparison_quantity',2,'p_comparison_quantity','parser.py',2757),
+  ('axis_descr -> begin AXIS_DESCR axis_descr_attribute IDENT IDENT NUMERIC NUMERIC NUMERIC axis_descr_optional_list_optional end AXIS_DESCR','axis_descr',11,'p_axis_descr','parser.py',2763),
+  ('axis_descr_optional -> read_only','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2769),
+  ('axis_descr_optional -> format','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2770),
+  ('axis_descr_optional -> annotation','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2771),
+  ('axis_descr_optional -> axis_pts_ref','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2772),
+  ('axis_descr_optional -> max_grad','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2773),
+  ('axis_descr_optional -> monotony','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2774),
+  ('axis_descr_optional -> byte_order','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2775),
+  ('axis_descr_optional -> extended_limits','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2776),
+  ('axis_descr_optional -> fix_axis_par','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2777),
+  ('axis_descr_optional -> fix_axis_par_dist','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2778),
+  ('axis_descr_optional -> fix_axis_par_list','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2779),
+  ('axis_descr_optional -> deposit','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2780),
+  ('axis_descr_optional -> curve_axis_ref','axis_descr_optional',1,'p_axis_descr_optional','parser.py',2781),
+  ('axis_descr_optional_list -> axis_descr_optional','axis_descr_optional_list',1,'p_axis_descr_optional_list','parser.py',2787),
+  ('axis_descr_optional_list -> axis_descr_optional_list axis_descr_optional','axis_descr_optional_list',2,'p_axis_descr_optional_list','parser.py',2788),
+  ('axis_descr_optional_list_optional -> empty','axis_descr_optional_list_optional',1,'p_axis_descr_optional_list_optional','parser.py',2798),
+  ('axis_descr_optional_list_optional -> axis_descr_optional_list','axis_descr_optional_list_optional',1,'p_axis_descr_optional_list_optional','parser.py',2799),
+  ('axis_pts_ref -> AXIS_PTS_REF IDENT','axis_pts_ref',2,'p_axis_pts_ref','parser.py',2805),
+  ('max_grad -> MAX_GRAD NUMERIC','max_grad',2,'p_max_grad','parser.py',2811),
+  ('monotony -> MONOTONY monotony_type','monotony',2,'p_monotony','parser.py',2817),
+  ('monotony_type -> MON_INCREASE','monotony_type',1,'p_monotony_type','parser.py',2823),
+  ('monotony_type -> MON_DECREASE','monotony_type',1,'p_monotony_type','parser.py',2824),
+  ('monotony_type -> STRICT_INCREASE','monotony_type',1,'p_monotony_type','parser.py',2825),
+  ('monotony_type -> STRICT_DECREASE','monotony_type',1,'p_monotony_type','parser.py',2826),
+  ('fix_axis_par -> FIX_AXIS_PAR NUMERIC NUMERIC NUMERIC','fix_axis_par',4,'p_fix_axis_par','parser.py',2832),
+  ('fix_axis_par_dist -> FIX_AXIS_PAR_DIST NUMERIC NUMERIC NUMERIC','fix_axis_par_dist',4,'p_fix_axis_par_dist','parser.py',2838),
+  ('fix_axis_par_list -> begin FIX_AXIS_PAR_LIST number_list end FIX_AXIS_PAR_LIST','fix_axis_par_list',5,'p_fix_axis_par_list','parser.py',2844),
+  ('curve_axis_ref -> CURVE_AXIS_REF IDENT','curve_axis_ref',2,'p_curve_axis_ref','parser.py',2850),
+  ('axis_descr_attribute -> STD_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',2856),
+  ('axis_descr_attribute -> FIX_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',2857),
+  ('axis_descr_attribute -> COM_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',2858),
+  ('axis_descr_attribute -> RES_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',2859),
+  ('axis_descr_attribute -> CURVE_AXIS','axis_descr_attribute',1,'p_axis_descr_attribute','parser.py',2860),
+  ('calibration_access -> CALIBRATION_ACCESS calibration_access_type','calibration_access',2,'p_calibration_access','parser.py',2866),
+  ('calibration_access_type -> CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',2872),
+  ('calibration_access_type -> NO_CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',2873),
+  ('calibration_access_type -> NOT_IN_MCD_SYSTEM','calibration_access_type',1,'p_calibration_access_type','parser.py',2874),
+  ('calibration_access_type -> OFFLINE_CALIBRATION','calibration_access_type',1,'p_calibration_access_type','parser.py',2875),
+  ('matrix_dim -> MATRIX_DIM NUMERIC NUMERIC NUMERIC','matrix_dim',4,'p_matrix_dim','parser.py',2881),
+  ('ecu_address_extension -> ECU_ADDRESS_EXTENSION NUMERIC','ecu_address_extension',2,'p_ecu_address_extension','parser.py',2886),
+  ('characteristic_optional -> display_identifier','characteristic_optional',1,'p_characteristic_optional','parser.py',2892),
+  ('characteristic_optional -> format','characteristic_optional',1,'p_characteristic_optional','parser.py',2893),
+  ('characteristic_optional -> byte_order','characteristic_optional',1,'p_characteristic_optional','parser.py',2894),
+  ('characteristic_optional -> bit_mask','characteristic_optional',1,'p_characteristic_optional','parser.py',2895),
+  ('characteristic_optional -> function_list','characteristic_optional',1,'p_characteristic_optional','parser.py',2896),
+  ('characteristic_optional -> number','characteristic_optional',1,'p_characteristic_optional','parser.py',2897),
+  ('characteristic_optional -> symbol_link','characteristic_optional',1,'p_characteristic_optional','parser.py',2898),
+  ('characteristic_optional -> extended_limits','characteristic_optional',1,'p_characteristic_optional','parser.py',2899),
+  ('characteristic_optional -> read_only','characteristic_optional',1,'p_characteristic_optional','parser.py',2900),
+  ('characteristic_optional -> guard_rails','characteristic_optional',1,'p_characteristic_optional','parser.py',2901),
+  ('characteristic_optional -> map_list','characteristic_optional',1,'p_characteristic_optional','parser.py',2902),
+  ('characteristic_optional -> max_refresh','characteristic_optional',1,'p_characteristic_optional','parser.py',2903),
+  ('characteristic_optional -> dependent_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',2904),
+  ('characteristic_optional -> virtual_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',2905),
+  ('characteristic_optional -> ref_memory_segment','characteristic_optional',1,'p_characteristic_optional','parser.py',2906),
+  ('characteristic_optional -> annotation','characteristic_optional',1,'p_characteristic_optional','parser.py',2907),
+  ('characteristic_optional -> comparison_quantity','characteristic_optional',1,'p_characteristic_optional','parser.py',2908),
+  ('characteristic_optional -> if_data_characteristic','characteristic_optional',1,'p_characteristic_optional','parser.py',2909),
+  ('characteristic_optional -> axis_descr','characteristic_optional',1,'p_characteristic_optional','parser.py',2910),
+  ('characteristic_optional -> calibration_access','characteristic_optional',1,'p_characteristic_optional','parser.py',2911),
+  ('characteristic_optional -> matrix_dim','characteristic_optional',1,'p_characteristic_optional','parser.py',2912),
+  ('characteristic_optional -> ecu_address_extension','characteristic_optional',1,'p_characteristic_optional','parser.py',2913),
+  ('characteristic_optional_list -> characteristic_optional','characteristic_optional_list',1,'p_characteristic_optional_list','parser.py',2919),
+  ('characteristic_optional_list -> characteristic_optional_list characteristic_optional','characteristic_optional_list',2,'p_characteristic_optional_list','parser.py',2920),
+  ('characteristic_optional_list_optional -> empty','characteristic_optional_list_optional',1,'p_characteristic_optional_list_optional','parser.py',2930),
+  ('characteristic_optional_list_optional -> characteristic_optional_list','characteristic_optional_list_optional',1,'p_characteristic_optional_list_optional','parser.py',2931),
+  ('if_data_characteristic -> if_data_memory_layout','if_data_characteristic',1,'p_if_data_characteristic','parser.py',2937),
+  ('axis_pts -> begin AXIS_PTS IDENT STRING NUMERIC IDENT IDENT NUMERIC IDENT NUMERIC NUMERIC NUMERIC axis_pts_optional_list_optional end AXIS_PTS','axis_pts',15,'p_axis_pts','parser.py',2941),
+  ('axis_pts_optional -> display_identifier','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2947),
+  ('axis_pts_optional -> read_only','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2948),
+  ('axis_pts_optional -> format','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2949),
+  ('axis_pts_optional -> deposit','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2950),
+  ('axis_pts_optional -> byte_order','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2951),
+  ('axis_pts_optional -> function_list','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2952),
+  ('axis_pts_optional -> ref_memory_segment','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2953),
+  ('axis_pts_optional -> guard_rails','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2954),
+  ('axis_pts_optional -> extended_limits','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2955),
+  ('axis_pts_optional -> annotation','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2956),
+  ('axis_pts_optional -> if_data_axis_pts','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2957),
+  ('axis_pts_optional -> calibration_access','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2958),
+  ('axis_pts_optional -> ecu_address_extension','axis_pts_optional',1,'p_axis_pts_optional','parser.py',2959),
+  ('axis_pts_optional_list -> axis_pts_optional','axis_pts_optional_list',1,'p_axis_pts_optional_list','parser.py',2965),
+  ('axis_pts_optional_list -> axis_pts_optional_list axis_pts_optional','axis_pts_optional_list',2,'p_axis_pts_optional_list','parser.py',2966),
+  ('axis_pts_optional_list_optional -> empty','axis_pts_optional_list_optional',1,'p_axis_pts_optional_list_optional','parser.py',2976),
+  ('axis_pts_optional_list_optional -> axis_pts_optional_list','axis_pts_optional_list_optional',1,'p_axis_pts_optional_list_optional','parser.py',2977),
+  ('if_data_axis_pts -> if_data_memory_layout','if_data_axis_pts',1,'p_if_data_axis_pts','parser.py',2983),
+  ('deposit -> DEPOSIT deposit_mode','deposit',2,'p_deposit','parser.py',2989),
+  ('deposit_mode -> ABSOLUTE','deposit_mode',1,'p_deposit_mode','parser.py',2995),
+  ('deposit_mode -> DIFFERENCE','deposit_mode',1,'p_deposit_mode','parser.py',2996),
+  ('measurement -> begin MEASUREMENT IDENT STRING datatype IDENT NUMERIC NUMERIC NUMERIC NUMERIC measurement_optional_list_optional end MEASUREMENT','measurement',13,'p_measurement','parser.py',3002),
+  ('measurement_optional -> display_identifier','measurement_optional',1,'p_measurement_optional','parser.py',3008),
+  ('measurement_optional -> read_write','measurement_optional',1,'p_measurement_optional','parser.py',3009),
+  ('measurement_optional -> format','measurement_optional',1,'p_measurement_optional','parser.py',3010),
+  ('measurement_optional -> array_size','measurement_optional',1,'p_measurement_optional','parser.py',3011),
+  ('measurement_optional -> bit_mask','measurement_optional',1,'p_measurement_optional','parser.py',3012),
+  ('measurement_optional -> bit_operation','measurement_optional',1,'p_measurement_optional','parser.py',3013),
+  ('measurement_optional -> byte_order','measurement_optional',1,'p_measurement_optional','parser.py',3014),
+  ('measurement_optional -> max_refresh','measurement_optional',1,'p_measurement_optional','parser.py',3015),
+  ('measurement_optional -> virtual','measurement_optional',1,'p_measurement_optional','parser.py',3016),
+  ('measurement_optional -> function_list','measurement_optional',1,'p_measurement_optional','parser.py',3017),
+  ('measurement_optional -> ecu_address','measurement_optional',1,'p_measurement_optional','parser.py',3018),
+  ('measurement_optional -> symbol_link','measurement_optional',1,'p_measurement_optional','parser.py',3019),
+  ('measurement_optional -> error_mask','measurement_optional',1,'p_measurement_optional','parser.py',3020),
+  ('measurement_optional -> ref_memory_segment','measurement_optional',1,'p_measurement_optional','parser.py',3021),
+  ('measurement_optional -> annotation','measurement_optional',1,'p_measurement_optional','parser.py',3022),
+  ('measurement_optional -> if_data_xcp','measurement_optional',1,'p_measurement_optional','parser.py',3023),
+  ('measurement_optional -> if_data_measurement','measurement_optional',1,'p_measurement_optional','parser.py',3024),
+  ('measurement_optional -> matrix_dim','measurement_optional',1,'p_measurement_optional','parser.py',3025),
+  ('measurement_optional -> ecu_address_extension','measurement_optional',1,'p_measurement_optional','parser.py',3026),
+  ('measurement_optional_list -> measurement_optional','measurement_optional_list',1,'p_measurement_optional_list','parser.py',3032),
+  ('measurement_optional_list -> measurement_optional_list measurement_optional','measurement_optional_list',2,'p_measurement_optional_list','parser.py',3033),
+  ('measurement_optional_list_optional -> empty','measurement_optional_list_optional',1,'p_measurement_optional_list_optional','parser.py',3043),
+  ('measurement_optional_list_optional -> measurement_optional_list','measurement_optional_list_optional',1,'p_measurement_optional_list_optional','parser.py',3044),
+  ('read_write -> READ_WRITE','read_write',1,'p_read_write','parser.py',3050),
+  ('if_data_measurement -> begin IF_DATA IDENT if_data_measurement_optional_parameter_list_optional end IF_DATA','if_data_measurement',6,'p_if_data_measurement','parser.py',3056),
+  ('if_data_measurement_optional_parameter -> kp_blob kp_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',3062),
+  ('if_data_measurement_optional_parameter -> dp_blob dp_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',3063),
+  ('if_data_measurement_optional_parameter -> pa_blob pa_data','if_data_measurement_optional_parameter',2,'p_if_data_measurement_optional_parameter','parser.py',3064),
+  ('if_data_measurement_optional_parameter -> if_data_measurement_unsupported_element','if_data_measurement_optional_parameter',1,'p_if_data_measurement_optional_parameter','parser.py',3065),
+  ('if_data_measurement_unsupported_element -> begin IDENT generic_parameter_list end IDENT','if_data_measurement_unsupported_element',5,'p_if_data_measurement_unsupported_element','parser.py',3071),
+  ('if_data_measurement_optional_parameter_list -> if_data_measurement_optional_parameter','if_data_measurement_optional_parameter_list',1,'p_if_data_measurement_optional_parameter_list','parser.py',3077),
+  ('if_data_measurement_optional_parameter_list -> if_data_measurement_optional_parameter_list if_data_measurement_optional_parameter','if_data_measurement_optional_parameter_list',2,'p_if_data_measurement_optional_parameter_list','parser.py',3078),
+  ('if_data_measurement_optional_parameter_list_optional -> empty','if_data_measurement_optional_parameter_list_optional',1,'p_if_data_measurement_optional_parameter_list_optional','parser.py',3088),
+  ('if_data_measurement_optional_parameter_list_optional -> if_data_measurement_optional_parameter_list','if_data_measurement_optional_parameter_list_optional',1,'p_if_data_measurement_optional_parameter_list_optional','parser.py',3089),
+  ('kp_blob -> KP_BLOB','kp_blob',1,'p_kp_blob','parser.py',3095),
+  ('pa_blob -> PA_BLOB','pa_blob',1,'p_pa_blob','parser.py',3101),
+  ('kp_data -> kp_data_parameter_optional_list','kp_data',1,'p_kp_data','parser.py',3107),
+  ('kp_data_parameter_optional -> NUMERIC','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',3113),
+  ('kp_data_parameter_optional -> STRING','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',3114),
+  ('kp_data_parameter_optional -> IDENT','kp_data_parameter_optional',1,'p_kp_data_parameter_optional','parser.py',3115),
+  ('kp_data_parameter_optional_list -> kp_data_parameter_optional','kp_data_parameter_optional_list',1,'p_kp_data_parameter_optional_list','parser.py',3121),
+  ('kp_data_parameter_optional_list -> kp_data_parameter_optional_list kp_data_parameter_optional','kp_data_parameter_optional_list',2,'p_kp_data_parameter_optional_list','parser.py',3122),
+  ('array_size -> ARRAY_SIZE NUMERIC','array_size',2,'p_array_size','parser.py',3128),
+  ('bit_operation -> begin BIT_OPERATION bit_operation_optional_list_optional end BIT_OPERATION','bit_operation',5,'p_bit_operation','parser.py',3134),
+  ('bit_operation_optional -> left_shift','bit_operation_optional',1,'p_bit_operation_optional','parser.py',3140),
+  ('bit_operation_optional -> right_shift','bit_operation_optional',1,'p_bit_operation_optional','parser.py',3141),
+  ('bit_operation_optional -> sign_extend','bit_operation_optional',1,'p_bit_operation_optional','parser.py',3142),
+  ('bit_operation_optional_list -> bit_operation_optional','bit_operation_optional_list',1,'p_bit_operation_optional_list','parser.py',3148),
+  ('bit_operation_optional_list -> bit_operation_optional_list bit_operation_optional','bit_operation_optional_list',2,'p_bit_operation_optional_list','parser.py',3149),
+  ('bit_operation_optional_list_optional -> empty','bit_operation_optional_list_optional',1,'p_bit_operation_optional_list_optional','parser.py',3159),
+  ('bit_operation_optional_list_optional -> bit_operation_optional_list','bit_operation_optional_list_optional',1,'p_bit_operation_optional_list_optional','parser.py',3160),
+  ('left_shift -> LEFT_SHIFT NUMERIC','left_shift',2,'p_left_shift','parser.py',3166),
+  ('right_shift -> RIGHT_SHIFT NUMERIC','right_shift',2,'p_right_shift','parser.py',3172),
+  ('sign_extend -> SIGN_EXTEND','sign_extend',1,'p_sign_extend','parser.py',3178),
+  ('compu_method -> begin COMPU_METHOD IDENT STRING compu_method_conversion_type STRING STRING compu_method_optional_list_optional end COMPU_METHOD','compu_method',10,'p_compu_method','parser.py',3184),
+  ('compu_method_optional -> formula','compu_method_optional',1,'p_compu_method_optional','parser.py',3190),
+  ('compu_method_optional -> coeffs','compu_method_optional',1,'p_compu_method_optional','parser.py',3191),
+  ('compu_method_optional -> coeffs_linear','compu_method_optional',1,'p_compu_method_optional','parser.py',3192),
+  ('compu_method_optional -> compu_tab_ref','compu_method_optional',1,'p_compu_method_optional','parser.py',3193),
+  ('compu_method_optional -> ref_unit','compu_method_optional',1,'p_compu_method_optional','parser.py',3194),
+  ('compu_method_optional_list -> compu_method_optional','compu_method_optional_list',1,'p_compu_method_optional_list','parser.py',3200),
+  ('compu_method_optional_list -> compu_method_optional_list compu_method_optional','compu_method_optional_list',2,'p_compu_method_optional_list','parser.py',3201),
+  ('compu_method_optional_list_optional -> empty','compu_method_optional_list_optional',1,'p_compu_method_optional_list_optional','parser.py',3211),
+  ('compu_method_optional_list_optional -> compu_method_optional_list','compu_method_optional_list_optional',1,'p_compu_method_optional_list_optional','parser.py',3212),
+  ('compu_method_conversion_type -> TAB_INTP','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',3218),
+  ('compu_method_conversion_type -> TAB_NOINTP','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',3219),
+  ('compu_method_conversion_type -> TAB_VERB','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',3220),
+  ('compu_method_conversion_type -> RAT_FUNC','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',3221),
+  ('compu_method_conversion_type -> FORM','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',3222),
+  ('compu_method_conversion_type -> IDENTICAL','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',3223),
+  ('compu_method_conversion_type -> LINEAR','compu_method_conversion_type',1,'p_compu_method_conversion_type','parser.py',3224),
+  ('formula -> begin FORMULA STRING formula_optional_list_optional end FORMULA','formula',6,'p_formula','parser.py',3230),
+  ('formula_optional -> formula_inv','formula_optional',1,'p_formula_optional','parser.py',3236),
+  ('formula_optional_list -> formula_optional','formula_optional_list',1,'p_formula_optional_list','parser.py',3242),
+  ('formula_optional_list -> formula_optional_list formula_optional','formula_optional_list',2,'p_formula_optional_list','parser.py',3243),
+  ('formula_optional_list_optional -> empty','formula_optional_list_optional',1,'p_formula_optional_list_optional','parser.py',3253),
+  ('formula_optional_list_optional -> formula_optional_list','formula_optional_list_optional',1,'p_formula_optional_list_optional','parser.py',3254),
+  ('formula_inv -> FORMULA_INV STRING','formula_inv',2,'p_formula_inv','parser.py',3260),
+  ('coeffs -> COEFFS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC','coeffs',7,'p_coeffs','parser.py',3266),
+  ('coeffs_linear -> COEFFS_LINEAR NUMERIC NUMERIC','coeffs_linear',3,'p_coeffs_linear','parser.py',3272),
+  ('compu_tab_ref -> COMPU_TAB_REF IDENT','compu_tab_ref',2,'p_compu_tab_ref','parser.py',3278),
+  ('ref_unit -> REF_UNIT IDENT','ref_unit',2,'p_ref_unit','parser.py',3284),
+  ('virtual -> begin VIRTUAL ident_list end VIRTUAL','virtual',5,'p_virtual','parser.py',3290),
+  ('ecu_address -> ECU_ADDRESS NUMERIC','ecu_address',2,'p_ecu_address','parser.py',3296),
+  ('symbol_link -> SYMBOL_LINK STRING NUMERIC','symbol_link',3,'p_symbol_link','parser.py',3302),
+  ('error_mask -> ERROR_MASK NUMERIC','error_mask',2,'p_error_mask','parser.py',3308),
+  ('compu_tab -> begin COMPU_TAB IDENT STRING compu_tab_conversion_type NUMERIC compu_tab_optional_list_optional end COMPU_TAB','compu_tab',9,'p_compu_tab','parser.py',3314),
+  ('compu_tab_optional -> in_val_out_val','compu_tab_optional',1,'p_compu_tab_optional','parser.py',3320),
+  ('compu_tab_optional -> default_value','compu_tab_optional',1,'p_compu_tab_optional','parser.py',3321),
+  ('compu_tab_optional -> default_value_numeric','compu_tab_optional',1,'p_compu_tab_optional','parser.py',3322),
+  ('compu_tab_optional_list -> compu_tab_optional','compu_tab_optional_list',1,'p_compu_tabl_optional_list','parser.py',3328),
+  ('compu_tab_optional_list -> compu_tab_optional_list compu_tab_optional','compu_tab_optional_list',2,'p_compu_tabl_optional_list','parser.py',3329),
+  ('compu_tab_optional_list_optional -> empty','compu_tab_optional_list_optional',1,'p_compu_tab_optional_list_optional','parser.py',3339),
+  ('compu_tab_optional_list_optional -> compu_tab_optional_list','compu_tab_optional_list_optional',1,'p_compu_tab_optional_list_optional','parser.py',3340),
+  ('in_val_out_val -> number_list','in_val_out_val',1,'p_in_val_out_val','parser.py',3346),
+  ('compu_tab_conversion_type -> TAB_INTP','compu_tab_conversion_type',1,'p_compu_tab_conversion_type','parser.py',3352),
+  ('compu_tab_conversion_type -> TAB_NOINTP','compu_tab_conversion_type',1,'p_compu_tab_conversion_type','parser.py',3353),
+  ('default_value -> DEFAULT_VALUE STRING','default_value',2,'p_default_value','parser.py',3359),
+  ('default_value_numeric -> DEFAULT_VALUE_NUMERIC NUMERIC','default_value_numeric',2,'p_default_value_numeric','parser.py',3365),
+  ('compu_vtab -> begin COMPU_VTAB IDENT STRING compu_vtab_conversion_type NUMERIC compu_vtab_optional_list_optional end COMPU_VTAB','compu_vtab',9,'p_compu_vtab','parser.py',3371),
+  ('compu_vtab_optional -> default_value','compu_vtab_optional',1,'p_compu_vtab_optional','parser.py',3377),
+  ('compu_vtab_optional -> compu_vtab_in_val_out_val','compu_vtab_optional',1,'p_compu_vtab_optional','parser.py',3378),
+  ('compu_vtab_optional_list -> compu_vtab_optional','compu_vtab_optional_list',1,'p_compu_vtab_optional_list','parser.py',3384),
+  ('compu_vtab_optional_list -> compu_vtab_optional_list compu_vtab_optional','compu_vtab_optional_list',2,'p_compu_vtab_optional_list','parser.py',3385),
+  ('compu_vtab_optional_list_optional -> empty','compu_vtab_optional_list_optional',1,'p_compu_vtab_optional_list_optional','parser.py',3395),
+  ('compu_vtab_optional_list_optional -> compu_vtab_optional_list','compu_vtab_optional_list_optional',1,'p_compu_vtab_optional_list_optional','parser.py',3396),
+  ('compu_vtab_in_val_out_val -> number_string_value_list','compu_vtab_in_val_out_val',1,'p_compu_vtab_in_val_out_val','parser.py',3402),
+  ('compu_vtab_conversion_type -> TAB_VERB','compu_vtab_conversion_type',1,'p_compu_vtab_conversion_type','parser.py',3408),
+  ('number_string_value_list -> number_string_value','number_string_value_list',1,'p_number_string_value_list','parser.py',3414),
+  ('number_string_value_list -> number_string_value_list number_string_value','number_string_value_list',2,'p_number_string_value_list','parser.py',3415),
+  ('number_string_value -> NUMERIC STRING','number_string_value',2,'p_number_string_value','parser.py',3425),
+  ('compu_vtab_range -> begin COMPU_VTAB_RANGE IDENT STRING NUMERIC compu_vtab_range_optional_list_optional end COMPU_VTAB_RANGE','compu_vtab_range',8,'p_compu_vtab_range','parser.py',3430),
+  ('compu_vtab_range_optional -> default_value','compu_vtab_range_optional',1,'p_compu_vtab_range_optional','parser.py',3436),
+  ('compu_vtab_range_optional -> compu_vtab_range_in_val_out_val','compu_vtab_range_optional',1,'p_compu_vtab_range_optional','parser.py',3437),
+  ('compu_vtab_range_optional_list -> compu_vtab_range_optional','compu_vtab_range_optional_list',1,'p_compu_vtab_range_optional_list','parser.py',3443),
+  ('compu_vtab_range_optional_list -> compu_vtab_range_optional_list compu_vtab_range_optional','compu_vtab_range_optional_list',2,'p_compu_vtab_range_optional_list','parser.py',3444),
+  ('compu_vtab_range_optional_list_optional -> empty','compu_vtab_range_optional_list_optional',1,'p_compu_vtab_range_optional_list_optional','parser.py',3454),
+  ('compu_vtab_range_optional_list_optional -> compu_vtab_range_optional_list','compu_vtab_range_optional_list_optional',1,'p_compu_vtab_range_optional_list_optional','parser.py',3455),
+  ('compu_vtab_range_in_val_out_val -> number_number_string_value_list','compu_vtab_range_in_val_out_val',1,'p_compu_vtab_range_in_val_out_val','parser.py',3461),
+  ('number_number_string_value_list -> number_number_string_value','number_number_string_value_list',1,'p_number_number_string_value_list','parser.py',3467),
+  ('number_number_string_value_list -> number_number_string_value_list number_number_string_value','number_number_string_value_list',2,'p_number_number_string_value_list','parser.py',3468),
+  ('number_number_string_value -> NUMERIC NUMERIC STRING','number_number_string_value',3,'p_number_number_string_value','parser.py',3478),
+  ('function -> begin FUNCTION IDENT STRING function_optional_list_optional end FUNCTION','function',7,'p_function','parser.py',3483),
+  ('function_optional -> annotation','function_optional',1,'p_function_optional','parser.py',3489),
+  ('function_optional -> def_characteristic','function_optional',1,'p_function_optional','parser.py',3490),
+  ('function_optional -> ref_characteristic','function_optional',1,'p_function_optional','parser.py',3491),
+  ('function_optional -> in_measurement','function_optional',1,'p_function_optional','parser.py',3492),
+  ('function_optional -> out_measurement','function_optional',1,'p_function_optional','parser.py',3493),
+  ('function_optional -> loc_measurement','function_optional',1,'p_function_optional','parser.py',3494),
+  ('function_optional -> sub_function','function_optional',1,'p_function_optional','parser.py',3495),
+  ('function_optional -> function_version','function_optional',1,'p_function_optional','parser.py',3496),
+  ('function_optional_list -> function_optional','function_optional_list',1,'p_function_optional_list','parser.py',3502),
+  ('function_optional_list -> function_optional_list function_optional','function_optional_list',2,'p_function_optional_list','parser.py',3503),
+  ('function_optional_list_optional -> empty','function_optional_list_optional',1,'p_function_optional_list_optional','parser.py',3513),
+  ('function_optional_list_optional -> function_optional_list','function_optional_list_optional',1,'p_function_optional_list_optional','parser.py',3514),
+  ('def_characteristic -> begin DEF_CHARACTERISTIC def_characteristic_optional_list_optional end DEF_CHARACTERISTIC','def_characteristic',5,'p_def_characteristic','parser.py',3520),
+  ('def_characteristic_optional -> identifier','def_characteristic_optional',1,'p_def_characteristic_optional','parser.py',3526),
+  ('def_characteristic_optional_list -> def_characteristic_optional','def_characteristic_optional_list',1,'p_def_characteristic_optional_list','parser.py',3532),
+  ('def_characteristic_optional_list -> def_characteristic_optional_list def_characteristic_optional','def_characteristic_optional_list',2,'p_def_characteristic_optional_list','parser.py',3533),
+  ('def_characteristic_optional_list_optional -> empty','def_characteristic_optional_list_optional',1,'p_def_characteristic_optional_list_optional','parser.py',3543),
+  ('def_characteristic_optional_list_optional -> def_characteristic_optional_list','def_characteristic_optional_list_optional',1,'p_def_characteristic_optional_list_optional','parser.py',3544),
+  ('identifier -> IDENT','identifier',1,'p_identifier','parser.py',3550),
+  ('ref_characteristic -> begin REF_CHARACTERISTIC ref_characteristic_optional_list_optional end REF_CHARACTERISTIC','ref_characteristic',5,'p_ref_characteristic','parser.py',3556),
+  ('ref_characteristic_optional -> identifier','ref_characteristic_optional',1,'p_ref_characteristic_optional','parser.py',3562),
+  ('ref_characteristic_optional_list -> ref_characteristic_optional','ref_characteristic_optional_list',1,'p_ref_characteristic_optional_list','parser.py',3568),
+  ('ref_characteristic_optional_list -> ref_characteristic_optional_list ref_characteristic_optional','ref_characteristic_optional_list',2,'p_ref_characteristic_optional_list','parser.py',3569),
+  ('ref_characteristic_optional_list_optional -> empty','ref_characteristic_optional_list_optional',1,'p_ref_characteristic_optional_list_optional','parser.py',3579),
+  ('ref_characteristic_optional_list_optional -> ref_characteristic_optional_list','ref_characteristic_optional_list_optional',1,'p_ref_characteristic_optional_list_optional','parser.py',3580),
+  ('in_measurement -> begin IN_MEASUREMENT in_measurement_optional_list_optional end IN_MEASUREMENT','in_measurement',5,'p_in_measurement','parser.py',3586),
+  ('in_measurement_optional -> identifier','in_measurement_optional',1,'p_in_measurement_optional','parser.py',3592),
+  ('in_measurement_optional_list -> in_measurement_optional','in_measurement_optional_list',1,'p_in_measurement_optional_list','parser.py',3598),
+  ('in_measurement_optional_list -> in_measurement_optional_list in_measurement_optional','in_measurement_optional_list',2,'p_in_measurement_optional_list','parser.py',3599),
+  ('in_measurement_optional_list_optional -> empty','in_measurement_optional_list_optional',1,'p_in_measurment_optional_list_optional','parser.py',3609),
+  ('in_measurement_optional_list_optional -> in_measurement_optional_list','in_measurement_optional_list_optional',1,'p_in_measurment_optional_list_optional','parser.py',3610),
+  ('out_measurement -> begin OUT_MEASUREMENT out_measurement_optional_list_optional end OUT_MEASUREMENT','out_measurement',5,'p_out_measurement','parser.py',3616),
+  ('out_measurement_optional -> identifier','out_measurement_optional',1,'p_out_measurement_optional','parser.py',3622),
+  ('out_measurement_optional_list -> out_measurement_optional','out_measurement_optional_list',1,'p_out_measurement_optional_list','parser.py',3628),
+  ('out_measurement_optional_list -> out_measurement_optional_list out_measurement_optional','out_measurement_optional_list',2,'p_out_measurement_optional_list','parser.py',3629),
+  ('out_measurement_optional_list_optional -> empty','out_measurement_optional_list_optional',1,'p_out_measurment_optional_list_optional','parser.py',3639),
+  ('out_measurement_optional_list_optional -> out_measurement_optional_list','out_measurement_optional_list_optional',1,'p_out_measurment_optional_list_optional','parser.py',3640),
+  ('loc_measurement -> begin LOC_MEASUREMENT loc_measurement_optional_list_optional end LOC_MEASUREMENT','loc_measurement',5,'p_loc_measurement','parser.py',3646),
+  ('loc_measurement_optional -> identifier','loc_measurement_optional',1,'p_loc_measurement_optional','parser.py',3652),
+  ('loc_measurement_optional_list -> loc_measurement_optional','loc_measurement_optional_list',1,'p_loc_measurement_optional_list','parser.py',3658),
+  ('loc_measurement_optional_list -> loc_measurement_optional_list loc_measurement_optional','loc_measurement_optional_list',2,'p_loc_measurement_optional_list','parser.py',3659),
+  ('loc_measurement_optional_list_optional -> empty','loc_measurement_optional_list_optional',1,'p_loc_measurment_optional_list_optional','parser.py',3669),
+  ('loc_measurement_optional_list_optional -> loc_measurement_optional_list','loc_measurement_optional_list_optional',1,'p_loc_measurment_optional_list_optional','parser.py',3670),
+  ('sub_function -> begin SUB_FUNCTION sub_function_optional_list_optional end SUB_FUNCTION','sub_function',5,'p_sub_function','parser.py',3676),
+  ('sub_function_optional -> identifier','sub_function_optional',1,'p_sub_function_optional','parser.py',3682),
+  ('sub_function_optional_list -> sub_function_optional','sub_function_optional_list',1,'p_sub_function_optional_list','parser.py',3688),
+  ('sub_function_optional_list -> sub_function_optional_list sub_function_optional','sub_function_optional_list',2,'p_sub_function_optional_list','parser.py',3689),
+  ('sub_function_optional_list_optional -> empty','sub_function_optional_list_optional',1,'p_sub_function_optional_list_optional','parser.py',3699),
+  ('sub_function_optional_list_optional -> sub_function_optional_list','sub_function_optional_list_optional',1,'p_sub_function_optional_list_optional','parser.py',3700),
+  ('function_version -> FUNCTION_VERSION STRING','function_version',2,'p_function_version','parser.py',3706),
+  ('group -> begin GROUP IDENT STRING group_optional_list_optional end GROUP','group',7,'p_group','parser.py',3712),
+  ('group_optional -> annotation','group_optional',1,'p_group_optional','parser.py',3718),
+  ('group_optional -> root','group_optional',1,'p_group_optional','parser.py',3719),
+  ('group_optional -> ref_characteristic','group_optional',1,'p_group_optional','parser.py',3720),
+  ('group_optional -> ref_measurement','group_optional',1,'p_group_optional','parser.py',3721),
+  ('group_optional -> function_list','group_optional',1,'p_group_optional','parser.py',3722),
+  ('group_optional -> sub_group','group_optional',1,'p_group_optional','parser.py',3723),
+  ('group_optional_list -> group_optional','group_optional_list',1,'p_group_optional_list','parser.py',3729),
+  ('group_optional_list -> group_optional_list group_optional','group_optional_list',2,'p_group_optional_list','parser.py',3730),
+  ('group_optional_list_optional -> empty','group_optional_list_optional',1,'p_group_optional_list_optional','parser.py',3740),
+  ('group_optional_list_optional -> group_optional_list','group_optional_list_optional',1,'p_group_optional_list_optional','parser.py',3741),
+  ('root -> ROOT','root',1,'p_root','parser.py',3747),
+  ('ref_measurement -> begin REF_MEASUREMENT ref_measurement_optional_list_optional end REF_MEASUREMENT','ref_measurement',5,'p_ref_measurement','parser.py',3753),
+  ('ref_measurement_optional -> identifier','ref_measurement_optional',1,'p_ref_measurement_optional','parser.py',3759),
+  ('ref_measurement_optional_list -> ref_measurement_optional','ref_measurement_optional_list',1,'p_ref_measurement_optional_list','parser.py',3765),
+  ('ref_measurement_optional_list -> ref_measurement_optional_list ref_measurement_optional','ref_measurement_optional_list',2,'p_ref_measurement_optional_list','parser.py',3766),
+  ('ref_measurement_optional_list_optional -> empty','ref_measurement_optional_list_optional',1,'p_ref_measurement_optional_list_optional','parser.py',3776),
+  ('ref_measurement_optional_list_optional -> ref_measurement_optional_list','ref_measurement_optional_list_optional',1,'p_ref_measurement_optional_list_optional','parser.py',3777),
+  ('sub_group -> begin SUB_GROUP sub_group_optional_list_optional end SUB_GROUP','sub_group',5,'p_sub_group','parser.py',3783),
+  ('sub_group_optional -> identifier','sub_group_optional',1,'p_sub_group_optional','parser.py',3789),
+  ('sub_group_optional_list -> sub_group_optional','sub_group_optional_list',1,'p_sub_group_optional_list','parser.py',3795),
+  ('sub_group_optional_list -> sub_group_optional_list sub_group_optional','sub_group_optional_list',2,'p_sub_group_optional_list','parser.py',3796),
+  ('sub_group_optional_list_optional -> empty','sub_group_optional_list_optional',1,'p_sub_group_optional_list_optional','parser.py',3806),
+  ('sub_group_optional_list_optional -> sub_group_optional_list','sub_group_optional_list_optional',1,'p_sub_group_optional_list_optional','parser.py',3807),
+  ('record_layout -> begin RECORD_LAYOUT IDENT record_layout_optional_list_optional end RECORD_LAYOUT','record_layout',6,'p_record_layout','parser.py',3813),
+  ('record_layout_optional -> fnc_values','record_layout_optional',1,'p_record_layout_optional','parser.py',3819),
+  ('record_layout_optional -> identification','record_layout_optional',1,'p_record_layout_optional','parser.py',3820),
+  ('record_layout_optional -> axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3821),
+  ('record_layout_optional -> axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3822),
+  ('record_layout_optional -> axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3823),
+  ('record_layout_optional -> axis_rescale_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3824),
+  ('record_layout_optional -> axis_rescale_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3825),
+  ('record_layout_optional -> axis_rescale_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3826),
+  ('record_layout_optional -> no_axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3827),
+  ('record_layout_optional -> no_axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3828),
+  ('record_layout_optional -> no_axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3829),
+  ('record_layout_optional -> no_rescale_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3830),
+  ('record_layout_optional -> no_rescale_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3831),
+  ('record_layout_optional -> no_rescale_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3832),
+  ('record_layout_optional -> fix_no_axis_pts_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3833),
+  ('record_layout_optional -> fix_no_axis_pts_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3834),
+  ('record_layout_optional -> fix_no_axis_pts_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3835),
+  ('record_layout_optional -> src_addr_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3836),
+  ('record_layout_optional -> src_addr_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3837),
+  ('record_layout_optional -> src_addr_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3838),
+  ('record_layout_optional -> rip_addr_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3839),
+  ('record_layout_optional -> rip_addr_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3840),
+  ('record_layout_optional -> rip_addr_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3841),
+  ('record_layout_optional -> rip_addr_w','record_layout_optional',1,'p_record_layout_optional','parser.py',3842),
+  ('record_layout_optional -> shift_op_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3843),
+  ('record_layout_optional -> shift_op_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3844),
+  ('record_layout_optional -> shift_op_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3845),
+  ('record_layout_optional -> offset_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3846),
+  ('record_layout_optional -> offset_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3847),
+  ('record_layout_optional -> offset_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3848),
+  ('record_layout_optional -> dist_op_x','record_layout_optional',1,'p_record_layout_optional','parser.py',3849),
+  ('record_layout_optional -> dist_op_y','record_layout_optional',1,'p_record_layout_optional','parser.py',3850),
+  ('record_layout_optional -> dist_op_z','record_layout_optional',1,'p_record_layout_optional','parser.py',3851),
+  ('record_layout_optional -> alignment_byte','record_layout_optional',1,'p_record_layout_optional','parser.py',3852),
+  ('record_layout_optional -> alignment_word','record_layout_optional',1,'p_record_layout_optional','parser.py',3853),
+  ('record_layout_optional -> alignment_long','record_layout_optional',1,'p_record_layout_optional','parser.py',3854),
+  ('record_layout_optional -> alignment_float32_ieee','record_layout_optional',1,'p_record_layout_optional','parser.py',3855),
+  ('record_layout_optional -> alignment_float64_ieee','record_layout_optional',1,'p_record_layout_optional','parser.py',3856),
+  ('record_layout_optional -> alignment_int64','record_layout_optional',1,'p_record_layout_optional','parser.py',3857),
+  ('record_layout_optional -> reserved','record_layout_optional',1,'p_record_layout_optional','parser.py',3858),
+  ('record_layout_optional_list -> record_layout_optional','record_layout_optional_list',1,'p_record_layout_optional_list','parser.py',3864),
+  ('record_layout_optional_list -> record_layout_optional_list record_layout_optional','record_layout_optional_list',2,'p_record_layout_optional_list','parser.py',3865),
+  ('record_layout_optional_list_optional -> empty','record_layout_optional_list_optional',1,'p_record_layout_optional_list_optional','parser.py',3875),
+  ('record_layout_optional_list_optional -> record_layout_optional_list','record_layout_optional_list_optional',1,'p_record_layout_optional_list_optional','parser.py',3876),
+  ('fnc_values -> FNC_VALUES NUMERIC datatype fnc_values_index_mode addrtype','fnc_values',5,'p_fnc_values','parser.py',3882),
+  ('fnc_values_index_mode -> COLUMN_DIR','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',3888),
+  ('fnc_values_index_mode -> ROW_DIR','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',3889),
+  ('fnc_values_index_mode -> ALTERNATE_WITH_X','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',3890),
+  ('fnc_values_index_mode -> ALTERNATE_WITH_Y','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',3891),
+  ('fnc_values_index_mode -> ALTERNATE_CURVES','fnc_values_index_mode',1,'p_fnc_values_index_mode','parser.py',3892),
+  ('identification -> IDENTIFICATION NUMERIC datatype','identification',3,'p_identification','parser.py',3898),
+  ('axis_pts_x -> AXIS_PTS_X NUMERIC datatype indexorder addrtype','axis_pts_x',5,'p_axis_pts_x','parser.py',3904),
+  ('axis_pts_y -> AXIS_PTS_Y NUMERIC datatype indexorder addrtype','axis_pts_y',5,'p_axis_pts_y','parser.py',3910),
+  ('axis_pts_z -> AXIS_PTS_Z NUMERIC datatype indexorder addrtype','axis_pts_z',5,'p_axis_pts_z','parser.py',3916),
+  ('axis_rescale_x -> AXIS_RESCALE_X NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_x',6,'p_axis_rescale_x','parser.py',3922),
+  ('axis_rescale_y -> AXIS_RESCALE_Y NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_y',6,'p_axis_rescale_y','parser.py',3928),
+  ('axis_rescale_z -> AXIS_RESCALE_Z NUMERIC datatype NUMERIC indexorder addrtype','axis_rescale_z',6,'p_axis_rescale_z','parser.py',3934),
+  ('no_axis_pts_x -> NO_AXIS_PTS_X NUMERIC datatype','no_axis_pts_x',3,'p_no_axis_pts_x','parser.py',3940),
+  ('no_axis_pts_y -> NO_AXIS_PTS_Y NUMERIC datatype','no_axis_pts_y',3,'p_no_axis_pts_y','parser.py',3946),
+  ('no_axis_pts_z -> NO_AXIS_PTS_Z NUMERIC datatype','no_axis_pts_z',3,'p_no_axis_pts_z','parser.py',3952),
+  ('no_rescale_x -> NO_RESCALE_X NUMERIC datatype','no_rescale_x',3,'p_no_rescale_x','parser.py',3958),
+  ('no_rescale_y -> NO_RESCALE_Y NUMERIC datatype','no_rescale_y',3,'p_no_rescale_y','parser.py',3964),
+  ('no_rescale_z -> NO_RESCALE_Z NUMERIC datatype','no_rescale_z',3,'p_no_rescale_z','parser.py',3970),
+  ('fix_no_axis_pts_x -> FIX_NO_AXIS_PTS_X NUMERIC','fix_no_axis_pts_x',2,'p_fix_no_axis_pts_x','parser.py',3976),
+  ('fix_no_axis_pts_y -> FIX_NO_AXIS_PTS_Y NUMERIC','fix_no_axis_pts_y',2,'p_fix_no_axis_pts_y','parser.py',3982),
+  ('fix_no_axis_pts_z -> FIX_NO_AXIS_PTS_Z NUMERIC','fix_no_axis_pts_z',2,'p_fix_no_axis_pts_z','parser.py',3988),
+  ('src_addr_x -> SRC_ADDR_X NUMERIC datatype','src_addr_x',3,'p_src_addr_x','parser.py',3994),
+  ('src_addr_y -> SRC_ADDR_Y NUMERIC datatype','src_addr_y',3,'p_src_addr_y','parser.py',4000),
+  ('src_addr_z -> SRC_ADDR_Z NUMERIC datatype','src_addr_z',3,'p_src_addr_z','parser.py',4006),
+  ('rip_addr_x -> RIP_ADDR_X NUMERIC datatype','rip_addr_x',3,'p_rip_addr_x','parser.py',4012),
+  ('rip_addr_y -> RIP_ADDR_Y NUMERIC datatype','rip_addr_y',3,'p_rip_addr_y','parser.py',4018),
+  ('rip_addr_z -> RIP_ADDR_Z NUMERIC datatype','rip_addr_z',3,'p_rip_addr_z','parser.py',4024),
+  ('rip_addr_w -> RIP_ADDR_W NUMERIC datatype','rip_addr_w',3,'p_rip_addr_w','parser.py',4030),
+  ('shift_op_x -> SHIFT_OP_X NUMERIC datatype','shift_op_x',3,'p_shift_op_x','parser.py',4036),
+  ('shift_op_y -> SHIFT_OP_Y NUMERIC datatype','shift_op_y',3,'p_shift_op_y','parser.py',4042),
+  ('shift_op_z -> SHIFT_OP_Z NUMERIC datatype','shift_op_z',3,'p_shift_op_z','parser.py',4048),
+  ('offset_x -> OFFSET_X NUMERIC datatype','offset_x',3,'p_offset_x','parser.py',4054),
+  ('offset_y -> OFFSET_Y NUMERIC datatype','offset_y',3,'p_offset_y','parser.py',4060),
+  ('offset_z -> OFFSET_Z NUMERIC datatype','offset_z',3,'p_offset_z','parser.py',4066),
+  ('dist_op_x -> DIST_OP_X NUMERIC datatype','dist_op_x',3,'p_dist_op_x','parser.py',4072),
+  ('dist_op_y -> DIST_OP_Y NUMERIC datatype','dist_op_y',3,'p_dist_op_y','parser.py',4078),
+  ('dist_op_z -> DIST_OP_Z NUMERIC datatype','dist_op_z',3,'p_dist_op_z','parser.py',4084),
+  ('alignment_byte -> ALIGNMENT_BYTE NUMERIC','alignment_byte',2,'p_alignment_byte','parser.py',4090),
+  ('alignment_word -> ALIGNMENT_WORD NUMERIC','alignment_word',2,'p_alignment_word','parser.py',4096),
+  ('alignment_long -> ALIGNMENT_LONG NUMERIC','alignment_long',2,'p_alignment_long','parser.py',4102),
+  ('alignment_int64 -> ALIGNMENT_INT64 NUMERIC','alignment_int64',2,'p_alignment_int64','parser.py',4108),
+  ('alignment_float32_ieee -> ALIGNMENT_FLOAT32_IEEE NUMERIC','alignment_float32_ieee',2,'p_alignment_float32_ieee','parser.py',4114),
+  ('alignment_float64_ieee -> ALIGNMENT_FLOAT64_IEEE NUMERIC','alignment_float64_ieee',2,'p_alignment_float64_ieee','parser.py',4120),
+  ('variant_coding -> begin VARIANT_CODING variant_coding_optional_list_optional end VARIANT_CODING','variant_coding',5,'p_variant_coding','parser.py',4126),
+  ('variant_coding_optional -> var_separator','variant_coding_optional',1,'p_variant_coding_optional','parser.py',4132),
+  ('variant_coding_optional -> var_naming','variant_coding_optional',1,'p_variant_coding_optional','parser.py',4133),
+  ('variant_coding_optional -> var_criterion','variant_coding_optional',1,'p_variant_coding_optional','parser.py',4134),
+  ('variant_coding_optional -> var_forbidden_comb','variant_coding_optional',1,'p_variant_coding_optional','parser.py',4135),
+  ('variant_coding_optional -> var_characteristic','variant_coding_optional',1,'p_variant_coding_optional','parser.py',4136),
+  ('variant_coding_optional_list -> variant_coding_optional','variant_coding_optional_list',1,'p_variant_coding_optional_list','parser.py',4142),
+  ('variant_coding_optional_list -> variant_coding_optional_list variant_coding_optional','variant_coding_optional_list',2,'p_variant_coding_optional_list','parser.py',4143),
+  ('variant_coding_optional_list_optional -> empty','variant_coding_optional_list_optional',1,'p_variant_coding_optional_list_optional','parser.py',4153),
+  ('variant_coding_optional_list_optional -> variant_coding_optional_list','variant_coding_optional_list_optional',1,'p_variant_coding_optional_list_optional','parser.py',4154),
+  ('var_separator -> VAR_SEPARATOR STRING','var_separator',2,'p_var_separator','parser.py',4160),
+  ('var_naming -> VAR_NAMING IDENT','var_naming',2,'p_var_naming','parser.py',4166),
+  ('var_criterion -> begin VAR_CRITERION IDENT STRING ident_list var_criterion_optional_list_optional end VAR_CRITERION','var_criterion',8,'p_var_criterion','parser.py',4172),
+  ('var_characteristic -> begin VAR_CHARACTERISTIC IDENT ident_list var_characteristic_optional_optional end VAR_CHARACTERISTIC','var_characteristic',7,'p_var_characteristic','parser.py',4178),
+  ('var_characteristic_optional -> var_address','var_characteristic_optional',1,'p_var_characteristic_optional','parser.py',4184),
+  ('var_characteristic_optional_optional -> empty','var_characteristic_optional_optional',1,'p_var_characteristic_optional_optional','parser.py',4190),
+  ('var_characteristic_optional_optional -> var_characteristic_optional','var_characteristic_optional_optional',1,'p_var_characteristic_optional_optional','parser.py',4191),
+  ('var_address -> begin VAR_ADDRESS number_list end VAR_ADDRESS','var_address',5,'p_var_address','parser.py',4196),
+  ('var_forbidden_comb -> begin VAR_FORBIDDEN_COMB var_forbidden_comb_criterion_list end VAR_FORBIDDEN_COMB','var_forbidden_comb',5,'p_var_forbidden_comb','parser.py',4202),
+  ('var_forbidden_comb_criterion_list -> var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_list',1,'p_var_forbidden_comb_criterion_list','parser.py',4208),
+  ('var_forbidden_comb_criterion_list -> var_forbidden_comb_criterion_optional var_forbidden_comb_criterion_optional_list','var_forbidden_comb_criterion_list',2,'p_var_forbidden_comb_criterion_list','parser.py',4209),
+  ('var_forbidden_comb_criterion_optional -> IDENT IDENT','var_forbidden_comb_criterion_optional',2,'p_var_forbidden_comb_criterion_optional','parser.py',4217),
+  ('var_forbidden_comb_criterion_optional_list -> var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_optional_list',1,'p_var_forbidden_comb_criterion_optional_list','parser.py',4222),
+  ('var_forbidden_comb_criterion_optional_list -> var_forbidden_comb_criterion_optional_list var_forbidden_comb_criterion_optional','var_forbidden_comb_criterion_optional_list',2,'p_var_forbidden_comb_criterion_optional_list','parser.py',4223),
+  ('var_criterion_optional -> var_measurement','var_criterion_optional',1,'p_var_criterion_optional','parser.py',4230),
+  ('var_criterion_optional -> var_selection_characteristic','var_criterion_optional',1,'p_var_criterion_optional','parser.py',4231),
+  ('var_criterion_optional_list -> var_criterion_optional','var_criterion_optional_list',1,'p_var_criterion_optional_list','parser.py',4237),
+  ('var_criterion_optional_list -> var_criterion_optional_list var_criterion_optional','var_criterion_optional_list',2,'p_var_criterion_optional_list','parser.py',4238),
+  ('var_criterion_optional_list_optional -> empty','var_criterion_optional_list_optional',1,'p_var_criterion_optional_list_optional','parser.py',4248),
+  ('var_criterion_optional_list_optional -> var_criterion_optional_list','var_criterion_optional_list_optional',1,'p_var_criterion_optional_list_optional','parser.py',4249),
+  ('var_measurement -> VAR_MEASUREMENT IDENT','var_measurement',2,'p_var_measurement','parser.py',4255),
+  ('var_selection_characteristic -> VAR_SELECTION_CHARACTERISTIC IDENT','var_selection_characteristic',2,'p_var_selection_characteristic','parser.py',4261),
+  ('reserved -> RESERVED NUMERIC datasize','reserved',3,'p_reserved','parser.py',4267),
+  ('frame -> begin FRAME IDENT STRING NUMERIC NUMERIC frame_optional_list_optional end FRAME','frame',9,'p_frame','parser.py',4273),
+  ('frame_optional -> frame_measurement','frame_optional',1,'p_frame_optional','parser.py',4279),
+  ('frame_optional -> if_data_frame','frame_optional',1,'p_frame_optional','parser.py',4280),
+  ('frame_optional_list -> frame_optional','frame_optional_list',1,'p_frame_optional_list','parser.py',4286),
+  ('frame_optional_list -> frame_optional_list frame_optional','frame_optional_list',2,'p_frame_optional_list','parser.py',4287),
+  ('frame_optional_list_optional -> empty','frame_optional_list_optional',1,'p_frame_optional_list_optional','parser.py',4297),
+  ('frame_optional_list_optional -> frame_optional_list','frame_optional_list_optional',1,'p_frame_optional_list_optional','parser.py',4298),
+  ('if_data_frame -> begin IF_DATA IDENT if_data_frame_optional_list_optional end IF_DATA','if_data_frame',6,'p_if_data_frame','parser.py',4304),
+  ('if_data_frame_optional -> QP_BLOB qp_data','if_data_frame_optional',2,'p_if_data_frame_optional','parser.py',4310),
+  ('if_data_frame_optional_list -> if_data_frame_optional','if_data_frame_optional_list',1,'p_if_data_frame_parameter_optional_list','parser.py',4316),
+  ('if_data_frame_optional_list -> if_data_frame_optional_list if_data_frame_optional','if_data_frame_optional_list',2,'p_if_data_frame_parameter_optional_list','parser.py',4317),
+  ('if_data_frame_optional_list_optional -> empty','if_data_frame_optional_list_optional',1,'p_if_data_frame_optional_list_optional','parser.py',4327),
+  ('if_data_frame_optional_list_optional -> if_data_frame_optional_list','if_data_frame_optional_list_optional',1,'p_if_data_frame_optional_list_optional','parser.py',4328),
+  ('qp_data -> generic_parameter','qp_data',1,'p_qp_data','parser.py',4334),
+  ('frame_measurement -> FRAME_MEASUREMENT ident_list','frame_measurement',2,'p_frame_measurement','parser.py',4340),
+  ('user_rights -> begin USER_RIGHTS IDENT user_rights_optional_list_optional end USER_RIGHTS','user_rights',6,'p_user_rights','parser.py',4346),
+  ('user_rights_optional -> ref_group','user_rights_optional',1,'p_user_rights_optional','parser.py',4352),
+  ('user_rights_optional -> read_only','user_rights_optional',1,'p_user_rights_optional','parser.py',4353),
+  ('user_rights_optional_list -> user_rights_optional','user_rights_optional_list',1,'p_user_rights_optional_list','parser.py',4359),
+  ('user_rights_optional_list -> user_rights_optional_list user_rights_optional','user_rights_optional_list',2,'p_user_rights_optional_list','parser.py',4360),
+  ('user_rights_optional_list_optional -> empty','user_rights_optional_list_optional',1,'p_user_rights_optional_list_optional','parser.py',4370),
+  ('user_rights_optional_list_optional -> user_rights_optional_list','user_rights_optional_list_optional',1,'p_user_rights_optional_list_optional','parser.py',4371),
+  ('ref_group -> begin REF_GROUP ref_group_optional_list_optional end REF_GROUP','ref_group',5,'p_ref_group','parser.py',4377),
+  ('ref_group_optional -> identifier','ref_group_optional',1,'p_ref_group_optional','parser.py',4383),
+  ('ref_group_optional_list -> ref_group_optional','ref_group_optional_list',1,'p_ref_group_optional_list','parser.py',4389),
+  ('ref_group_optional_list -> ref_group_optional_list ref_group_optional','ref_group_optional_list',2,'p_ref_group_optional_list','parser.py',4390),
+  ('ref_group_optional_list_optional -> empty','ref_group_optional_list_optional',1,'p_ref_group_optional_list_optional','parser.py',4400),
+  ('ref_group_optional_list_optional -> ref_group_optional_list','ref_group_optional_list_optional',1,'p_ref_group_optional_list_optional','parser.py',4401),
+  ('read_only -> READ_ONLY','read_only',1,'p_read_only','parser.py',4407),
+  ('guard_rails -> GUARD_RAILS','guard_rails',1,'p_guard_rails','parser.py',4413),
+  ('unit -> begin UNIT IDENT STRING STRING unit_type unit_optional_list_optional end UNIT','unit',9,'p_unit','parser.py',4419),
+  ('unit_optional -> si_exponents','unit_optional',1,'p_unit_optional','parser.py',4425),
+  ('unit_optional -> ref_unit','unit_optional',1,'p_unit_optional','parser.py',4426),
+  ('unit_optional -> unit_conversion','unit_optional',1,'p_unit_optional','parser.py',4427),
+  ('unit_optional_list -> unit_optional','unit_optional_list',1,'p_unit_optional_list','parser.py',4433),
+  ('unit_optional_list -> unit_optional_list unit_optional','unit_optional_list',2,'p_unit_optional_list','parser.py',4434),
+  ('unit_optional_list_optional -> empty','unit_optional_list_optional',1,'p_unit_optional_list_optional','parser.py',4444),
+  ('unit_optional_list_optional -> unit_optional_list','unit_optional_list_optional',1,'p_unit_optional_list_optional','parser.py',4445),
+  ('unit_type -> EXTENDED_SI','unit_type',1,'p_unit_type','parser.py',4451),
+  ('unit_type -> DERIVED','unit_type',1,'p_unit_type','parser.py',4452),
+  ('si_exponents -> SI_EXPONENTS NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC NUMERIC','si_exponents',8,'p_si_exponents','parser.py',4458),
+  ('unit_conversion -> UNIT_CONVERSION NUMERIC NUMERIC','unit_conversion',3,'p_unit_conversion','parser.py',4464),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',4470),
 ]
@@ -0,0 +1,127 @@
+"""
+@project: a2l_parser
+@file: reference.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+from .exception import A2lDiagnostic
+from .scanner import text_type
+
+# the properties of the nodes holding the names of other nodes of their module, by node type, with the types the names
+# are looked up in (in this order). the properties hold a name, or a node whose list of names is given by LIST_NAMES.
+REFERENCES = {
+    'CHARACTERISTIC': (('conversion', ('COMPU_METHOD',)), ('deposit', ('RECORD_LAYOUT',)),
+                       ('function_list', ('FUNCTION',))),
+    'AXIS_PTS': (('conversion', ('COMPU_METHOD',)), ('deposit', ('RECORD_LAYOUT',)), ('function_list', ('FUNCTION',))),
+    'MEASUREMENT': (('conversion', ('COMPU_METHOD',)), ('function_list', ('FUNCTION',))),
+    'AXIS_DESCR': (('conversion', ('COMPU_METHOD',)), ('axis_pts_ref', ('AXIS_PTS',)),
+                   ('curve_axis_ref', ('CHARACTERISTIC',))),
+    'COMPU_METHOD': (('compu_tab_ref', ('COMPU_TAB', 'COMPU_VTAB', 'COMPU_VTAB_RANGE')), ('ref_unit', ('UNIT',))),
+    'FUNCTION': (('def_characteristic', ('CHARACTERISTIC', 'AXIS_PTS')),
+                 ('ref_characteristic', ('CHARACTERISTIC', 'AXIS_PTS')), ('in_measurement', ('MEASUREMENT',)),
+                 ('out_measurement', ('MEASUREMENT',)), ('loc_measurement', ('MEASUREMENT',)),
+                 ('sub_function', ('FUNCTION',))),
+    'GROUP': (('ref_characteristic', ('CHARACTERISTIC', 'AXIS_PTS')), ('ref_measurement', ('MEASUREMENT',)),
+              ('function_list', ('FUNCTION',)), ('sub_group', ('GROUP',))),
+}
+
+REFERENCE_TARGETS = dict((node_type, dict(references)) for node_type, references in REFERENCES.items())
+
+# the property holding the names of the nodes of the lists of references, identifier for the other ones.
+LIST_NAMES = dict(FUNCTION_LIST='name')
+
+# the names which do not refer to any node.
+NO_REFERENCE = frozenset(('NO_COMPU_METHOD',))
+
+# the attributes of the modules holding the nodes with references, the axis descriptions of the characteristics being
+# visited with them.
+REFERRING_ATTRIBUTES = ('characteristic', 'axis_pts', 'measurement', 'compu_method', 'function', 'group')
+
+
+def reference_names(value):
+    # the name held by a reference, or the list of names held by the node of a list of references.
+    if value is None or isinstance(value, (str, text_type)):
+        return value
+    if hasattr(value, '_node'):
+        return getattr(value, LIST_NAMES.get(value._node, 'identifier'))
+    return value
+
+
+def node_name(node):
+    return getattr(node, 'name', None) or getattr(node, 'group_name', None) or node.node()
+
+
+class A2lReferences(object):
+    """
+    links from the references of the nodes of a module (see REFERENCES) to the nodes they name, resolved when first
+    requested then kept. a name which is not found in the module resolves to None. the links are dropped when the
+    module is changed (see A2lParser.reparse and A2lNode.add_children).
+    """
+
+    __slots__ = 'links',
+
+    def __init__(self):
+        # the resolved references, by node and attribute.
+        self.links = dict()
+
+    def resolve(self, module, node, attribute):
+        """
+        returns the node of module named by attribute of node, or the list of nodes (None for the dangling names) for
+        the lists of references. raises a ValueError if attribute is not a reference.
+        """
+        key = node, attribute
+        if key in self.links:
+            return self.links[key]
+        targets = REFERENCE_TARGETS.get(node.node(), dict()).get(attribute)
+        if targets is None:
+            raise ValueError('{0} of {1} is not a reference.'.format(attribute, node.node()))
+        names = reference_names(getattr(node, attribute, None))
+        if names is None or isinstance(names, (str, text_type)):
+            link = self.lookup(module, names, targets)
+        else:
+            link = [self.lookup(module, name, targets) for name in names]
+        self.links[key] = link
+        return link
+
+    @staticmethod
+    def lookup(module, name, targets):
+        if name is None or name in NO_REFERENCE:
+            return None
+        for target in targets:
+            node = module.lookup(target, name)
+            if node is not None:
+                return node
+        return None
+
+    def resolve_all(self, module):
+        """
+        resolves every reference of the nodes of module in one pass over its lists, returns the dangling ones as
+        diagnostics.
+        """
+        diagnostics = list()
+        for attribute in REFERRING_ATTRIBUTES:
+            for node in getattr(module, attribute, ()):
+                nodes = [node]
+                if node.node() == 'CHARACTERISTIC':
+                    nodes.extend(getattr(node, 'axis_descr', ()))
+                for item in nodes:
+                    for reference, _ in REFERENCES[item.node()]:
+                        if hasattr(item, reference):
+                            self.report(module, item, reference, diagnostics)
+        return diagnostics
+
+    def report(self, module, node, attribute, diagnostics):
+        # adds the dangling names of attribute of node to diagnostics.
+        link = self.resolve(module, node, attribute)
+        names = reference_names(getattr(node, attribute))
+        if isinstance(names, (str, text_type)):
+            names, link = [names], [link]
+        for name, target in zip(names or (), link or ()):
+            if target is None and name not in NO_REFERENCE:
+                owner = node if node.node() != 'AXIS_DESCR' else node._parent
+                start, end = node.span or (None, None)
+                diagnostic = A2lDiagnostic('dangling reference {0} {1} of {2} {3}'.format(
+                    attribute, name, owner.node(), node_name(owner)), start, start, end)
+                diagnostic.line, diagnostic.column = node.location or (None, None)
+                diagnostics.append(diagnostic)
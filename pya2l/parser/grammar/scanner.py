@@ -0,0 +1,460 @@
+"""
+@project: a2l_parser
+@file: scanner.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+import array
+import codecs
+import functools
+import itertools
+import mmap
+import multiprocessing
+import operator
+import re
+import sys
+
+from ply.lex import LexToken
+
+from .exception import A2lFormatException
+from .lexer import keywords, tokens, decode_numeric, make_intern_table, MAX_COMMENT_LENGTH, MAX_STRING_LENGTH
+
+# the rules of lexer.py folded into a single pattern, leading white spaces being consumed by the match itself. no two
+# alternatives can match at the same position, so they are ordered by decreasing frequency instead of the ply order. the
+# empty INVALID alternative makes the pattern match at any position, the regex engine never searches forward (which is
+# quadratic on white spaces) and the scanner deals with the invalid character or incomplete token itself.
+MASTER_PATTERN = r'''[ \t\r\n]*(?:
+    (?P<IDENT>[A-Za-z_][A-Za-z0-9_.\[\]]*)
+  | (?P<NUMERIC>[+-]?(?:0[Xx][A-Fa-f0-9]+|\d+(?:\.(?:\d*(?:[eE][+-]?\d+)?)?|(?:[eE][+-]?\d+)?)?))
+  | (?P<end>/end)
+  | (?P<begin>/begin)
+  | (?P<STRING>"[^"\\]*(?:\\.[^"\\]*)*")
+  | (?P<C_COMMENT>/\*[^*]*\*+(?:[^/*][^*]*\*+)*/)
+  | (?P<CPP_COMMENT>//[^\n]*)
+  | (?P<PARENTHESE_OPEN>\()
+  | (?P<PARENTHESE_CLOSE>\))
+  | (?P<CURLY_OPEN>\{)
+  | (?P<CURLY_CLOSE>\})
+  | (?P<BRACE_OPEN>\[)
+  | (?P<BRACE_CLOSE>\])
+  | (?P<ASTERISK>\*)
+  | (?P<SEMICOLON>;)
+  | (?P<EQUAL>=)
+  | (?P<COMMA>,)
+  | (?P<INVALID>)
+)'''
+
+IGNORED = frozenset(('C_COMMENT', 'CPP_COMMENT'))
+
+master_regex = re.compile(MASTER_PATTERN, re.VERBOSE)
+master_regex_bytes = re.compile(MASTER_PATTERN.encode('ascii'), re.VERBOSE)
+non_ascii_regex = re.compile(b'[\x80-\xff]+')
+
+# the bytes removed from a chunk to check whether it only holds ascii characters, and the size of the checked chunks.
+ASCII_BYTES = bytes(bytearray(range(0x80)))
+ASCII_CHUNK_SIZE = 1 << 20
+
+# a comment or a string which is not terminated in the current chunk of a stream. a // comment is terminated by the end
+# of its line, it matches up to the end of the chunk until then.
+PENDING_PATTERN = r'(?P<comment>/\*|//)|(?P<string>")'
+pending_regex_text = re.compile(PENDING_PATTERN)
+pending_regex_bytes = re.compile(PENDING_PATTERN.encode('ascii'))
+
+# number of characters the pattern might read after the end of a match (exponent of a NUMERIC token), and length of the
+# longest incomplete token that does not match the pattern (/begi).
+LOOKAHEAD = 2
+LONGEST_PREFIX = 6
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# the /begin and /end tokens, outside of the strings and comments (see split_offsets).
+SPLIT_PATTERN = r'"[^"\\]*(?:\\.[^"\\]*)*"|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|//[^\n]*|(?P<begin>/begin)|(?P<end>/end)'
+split_regex_text = re.compile(SPLIT_PATTERN)
+split_regex_bytes = re.compile(SPLIT_PATTERN.encode('ascii'))
+
+# smallest chunk scanned by a worker process, smaller ones cost more to transfer than to scan.
+PARALLEL_CHUNK_SIZE = 1 << 20
+
+# the /begin token of a child block of a MODULE is at this depth.
+SPLIT_DEPTH = 2
+
+try:
+    text_type = unicode
+except NameError:
+    text_type = str
+
+
+def detect_encoding(data):
+    """
+    returns the encoding of a bytes-like object and the length of its byte order mark. without byte order mark, only the
+    non-ascii sequences are decoded: if one of them is not valid utf-8, the data is considered latin-1 encoded.
+    """
+    bom = bytes(data[:3])
+    if bom.startswith(codecs.BOM_UTF8):
+        return 'utf-8', len(codecs.BOM_UTF8)
+    if bom.startswith(codecs.BOM_UTF16_LE) or bom.startswith(codecs.BOM_UTF16_BE):
+        return 'utf-16', 2
+    # most files are ascii, the chunks are checked several times faster than by the regex. the non-ascii sequences are
+    # only searched from the first chunk which is not ascii, none of them being split.
+    position = 0
+    while position < len(data) and not bytes(data[position:position + ASCII_CHUNK_SIZE]).translate(None, ASCII_BYTES):
+        position += ASCII_CHUNK_SIZE
+    for match in non_ascii_regex.finditer(data, position):
+        try:
+            match.group().decode('utf-8')
+        except UnicodeDecodeError:
+            return 'latin-1', 0
+    return 'utf-8', 0
+
+
+def split_offsets(data, position, chunk_size):
+    """
+    returns the offsets at which data can be split in chunks of at least chunk_size characters, the first one being
+    position. the chunks start with the /begin token of a child block of a MODULE, which is never part of a string or of
+    a comment, and the scanner does not carry any state from one token to the other: each chunk can be scanned alone.
+    """
+    regex = split_regex_text if isinstance(data, (str, text_type)) else split_regex_bytes
+    offsets = [position]
+    limit = position + chunk_size
+    depth = 0
+    for match in regex.finditer(data, position):
+        kind = match.lastgroup
+        if kind == 'begin':
+            if depth == SPLIT_DEPTH and match.start() >= limit:
+                offsets.append(match.start())
+                limit = match.start() + chunk_size
+            depth += 1
+        elif kind == 'end':
+            depth -= 1
+    return offsets
+
+
+def tokenize_range(arguments):
+    # scans one chunk in a worker process of A2lScanner.tokenize_parallel. the file is mapped again by the worker if its
+    # path is given, only the resulting TokenBuffer is sent back.
+    path, data, start, end, encoding, options = arguments
+    if path is not None:
+        with open(path, 'rb') as fp:
+            buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                data = buf[start:end]
+            finally:
+                buf.close()
+    decode = None if encoding is None else operator.methodcaller('decode', encoding)
+    return TokenBuffer(A2lScanner(**options)._generate(iter((data,)), 0, decode, raw=True, offset=start))
+
+
+def decode_ident(value):
+    if '[' in value:
+        return keywords.get(value.split('[', 1)[0], 'IDENT')
+    return keywords.get(value, 'IDENT')
+
+
+def decode_utf8_or_latin1(value):
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        return value.decode('latin-1')
+
+
+class A2lScanner(object):
+    """
+    drop-in replacement for the ply lexer of lexer.py, producing the same token stream from one compiled pattern.
+    """
+
+    def __init__(self, keep_lexemes=False, max_comment_length=MAX_COMMENT_LENGTH, max_string_length=MAX_STRING_LENGTH,
+                 intern_table=None):
+        self.keep_lexemes = keep_lexemes
+        self.max_length = dict(comment=max_comment_length, string=max_string_length)
+        self.intern_table = make_intern_table(intern_table)
+        self.lexdata = None
+        self.lexoffset = 0
+        self.lexpos = 0
+        self.lineno = 1
+        self.token = functools.partial(next, iter(()), None)
+        # the offsets of the invalid characters are added to errors if it is a set (see the recover option of
+        # A2lParser), they are printed otherwise.
+        self.errors = None
+
+    def input(self, data):
+        self.token = functools.partial(next, self._generate(*self._source(data)), None)
+
+    def input_stream(self, fp, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        scans the content of a file object opened in text or binary mode, reading it by chunks of chunk_size. only the
+        chunk being scanned and the tokens not yet consumed are held in memory.
+        """
+        self.token = functools.partial(next, self._generate(*self._stream_source(fp, chunk_size)), None)
+
+    def tokenize(self, data):
+        """
+        returns the whole token stream of data as a TokenBuffer, without building any token object.
+        """
+        return TokenBuffer(self._generate(*self._source(data), raw=True))
+
+    def tokenize_stream(self, fp, chunk_size=DEFAULT_CHUNK_SIZE):
+        return TokenBuffer(self._generate(*self._stream_source(fp, chunk_size), raw=True))
+
+    def tokenize_parallel(self, data, processes=None, path=None, chunk_size=None):
+        """
+        returns the token stream of data as a TokenBuffer, the chunks of data returned by split_offsets being scanned by
+        a pool of processes (one per cpu if processes is None). if data is a mapped file, its path should be given: the
+        workers then map the file themselves instead of receiving their chunk. the positions of the tokens are the same
+        as with tokenize.
+        """
+        if isinstance(data, (str, text_type)):
+            encoding, position = None, 0
+        else:
+            encoding, position = detect_encoding(data)
+            if encoding == 'utf-16':
+                return self.tokenize(data)
+        processes = processes or multiprocessing.cpu_count()
+        if chunk_size is None:
+            chunk_size = max(PARALLEL_CHUNK_SIZE, len(data) // (4 * processes))
+        offsets = split_offsets(data, position, chunk_size)
+        if processes == 1 or len(offsets) == 1:
+            return self.tokenize(data)
+        options = dict(keep_lexemes=self.keep_lexemes, max_comment_length=self.max_length['comment'],
+                       max_string_length=self.max_length['string'])
+        tasks = ((path, None if path is not None else data[start:end], start, end, encoding, options)
+                 for start, end in zip(offsets, offsets[1:] + [len(data)]))
+        pool = multiprocessing.Pool(processes)
+        try:
+            token_buffer = TokenBuffer()
+            for chunk in pool.imap(tokenize_range, tasks):
+                token_buffer.extend(chunk)
+        finally:
+            pool.terminate()
+        return token_buffer
+
+    def input_parallel(self, data, processes=None, path=None, chunk_size=None):
+        # see tokenize_parallel. utf-16 encoded data is decoded, it is scanned as text by the current process.
+        if (processes or multiprocessing.cpu_count()) == 1 or \
+                not isinstance(data, (str, text_type)) and detect_encoding(data[:2])[0] == 'utf-16':
+            return self.input(data)
+        self.input_tokens(self.tokenize_parallel(data, processes, path, chunk_size), data)
+
+    def input_tokens(self, token_buffer, data, offset=0):
+        """
+        feeds tokens scanned from data (a TokenBuffer, or any iterable of (type, value, start, end) tuples), offset
+        being the position of data in the scanned input. the values are interned again, in the table of this scanner.
+        """
+        self.token = functools.partial(next, self._replay(token_buffer), None)
+        self.lexdata = data
+        self.lexoffset = offset
+
+    def _replay(self, token_buffer):
+        intern = None if self.intern_table is None else self.intern_table.setdefault
+        lineno = self.lineno
+        for kind, value, start, end in token_buffer:
+            if intern is not None and isinstance(value, (str, text_type)):
+                value = intern(value, value)
+            token = LexToken()
+            token.type = kind
+            token.value = value
+            token.lineno = lineno
+            token.lexpos = start
+            token.lexer = self
+            yield token
+        self.lexpos = self.lexoffset + len(self.lexdata)
+
+    @staticmethod
+    def _source(data):
+        # text is scanned as is. bytes-like objects (bytes, bytearray, mmap) are scanned without being decoded, only the
+        # token values are, and the token positions are byte offsets. utf-16 can not be scanned that way and is decoded.
+        if isinstance(data, (str, text_type)):
+            return iter((data,)), 0, None
+        encoding, start = detect_encoding(data)
+        if encoding == 'utf-16':
+            return iter((bytes(data).decode(encoding),)), 0, None
+        return iter((data,)), start, operator.methodcaller('decode', encoding)
+
+    @staticmethod
+    def _stream_source(fp, chunk_size):
+        first = fp.read(max(chunk_size, len(codecs.BOM_UTF8)))
+        chunks = itertools.chain((first,), iter(functools.partial(fp.read, chunk_size), first[:0]))
+        if isinstance(first, (str, text_type)):
+            return chunks, 0, None
+        if first.startswith(codecs.BOM_UTF16_LE) or first.startswith(codecs.BOM_UTF16_BE):
+            decoder = codecs.getincrementaldecoder('utf-16')()
+            return itertools.chain((decoder.decode(chunk) for chunk in chunks), (decoder.decode(b'', True),)), 0, None
+        if first.startswith(codecs.BOM_UTF8):
+            return chunks, len(codecs.BOM_UTF8), operator.methodcaller('decode', 'utf-8')
+        return chunks, 0, decode_utf8_or_latin1
+
+    def clone(self):
+        return A2lScanner(keep_lexemes=self.keep_lexemes, max_comment_length=self.max_length['comment'],
+                          max_string_length=self.max_length['string'],
+                          intern_table=False if self.intern_table is None else self.intern_table)
+
+    def __iter__(self):
+        return iter(self.token, None)
+
+    def error(self, data, start, end):
+        white_spaces = ' \t\r\n' if isinstance(data, (str, text_type)) else b' \t\r\n'
+        for position in range(start, end):
+            if data[position:position + 1] not in white_spaces:
+                if self.errors is not None:
+                    self.errors.add(self.lexoffset + position)
+                else:
+                    print('invalid character at line ' + str(self.lineno) + ', position ' +
+                          str(self.lexoffset + position))
+
+    def check_length(self, kind, start, end, buffer):
+        maximum = self.max_length[kind]
+        if maximum is not None and end - start > maximum:
+            raise A2lFormatException(kind + ' longer than ' + str(maximum) + ' characters at position ',
+                                     self.lexoffset + start, string=buffer, offset=self.lexoffset)
+
+    def _generate(self, chunks, position=0, decode=None, raw=False, offset=0):
+        # the tokens are matched in the current buffer until the INVALID alternative matches, or a match ends too close
+        # to the end of the buffer to be complete. the buffer is then either extended with the following chunks, or the
+        # invalid character is skipped. a whole string is scanned as a single chunk. as long as a comment or a string is
+        # not terminated, the number of chunks read at once doubles, which keeps the scan of long constructs linear. raw
+        # tokens are (type, value, start, end) tuples instead of ply tokens. offset is the position of the first chunk.
+        lineno = self.lineno
+        keep_lexemes = self.keep_lexemes
+        intern = None if self.intern_table is None else self.intern_table.setdefault
+        max_comment_length, max_string_length = (sys.maxsize if self.max_length[kind] is None else self.max_length[kind]
+                                                 for kind in ('comment', 'string'))
+        buffer = next(chunks)
+        if isinstance(buffer, (str, text_type)):
+            regex, pending_regex = master_regex, pending_regex_text
+        else:
+            regex, pending_regex = master_regex_bytes, pending_regex_bytes
+        self.lexdata = buffer
+        self.lexoffset = offset
+        eof = False
+        growth = 1
+        while True:
+            for match in regex.finditer(buffer, position):
+                kind = match.lastgroup
+                if kind == 'INVALID' or (not eof and len(buffer) - match.end() <= LOOKAHEAD):
+                    break
+                position = match.end()
+                if kind in IGNORED:
+                    if position - match.start(kind) > max_comment_length:
+                        self.check_length('comment', match.start(kind), position, buffer)
+                    continue
+                start = match.start(kind)
+                if kind == 'STRING':
+                    if position - start > max_string_length:
+                        self.check_length('string', start, position, buffer)
+                    value = buffer[start + 1:position - 1]
+                    if decode is not None:
+                        value = decode(value)
+                    if intern is not None:
+                        value = intern(value, value)
+                else:
+                    value = match.group(kind)
+                    if decode is not None:
+                        value = value.decode('ascii')
+                    if kind == 'IDENT':
+                        kind = decode_ident(value)
+                        if intern is not None:
+                            value = intern(value, value)
+                    elif kind == 'NUMERIC':
+                        value = decode_numeric(value, keep_lexemes)
+                if raw:
+                    yield kind, value, offset + start, offset + position
+                    continue
+                token = LexToken()
+                token.type = kind
+                token.value = value
+                token.lineno = lineno
+                token.lexpos = offset + start
+                token.lexer = self
+                yield token
+            start = match.start(kind)
+            pending = pending_regex.match(buffer, start) if kind in ('INVALID', 'CPP_COMMENT') else None
+            if pending is not None:
+                if eof:
+                    raise A2lFormatException('unterminated ' + pending.lastgroup + ' at position ', offset + start,
+                                             string=buffer, offset=offset)
+                self.check_length(pending.lastgroup, start, len(buffer), buffer)
+            if not eof and (kind != 'INVALID' or pending is not None or len(buffer) - start < LONGEST_PREFIX):
+                growth = growth * 2 if start == 0 else 1
+                following = list(itertools.islice(chunks, growth))
+                if not following:
+                    eof = True
+                else:
+                    buffer = buffer[start:] + buffer[:0].join(following)
+                    offset += start
+                    position = 0
+                    self.lexdata = buffer
+                    self.lexoffset = offset
+            elif start == len(buffer):
+                break
+            else:
+                self.error(buffer, start, start + 1)
+                position = start + 1
+        self.lexpos = offset + len(buffer)
+
+
+# the type codes of the tokens, stable from one process to the other.
+TOKEN_TYPES = tuple(sorted(tokens))
+TOKEN_CODES = dict((token_type, code) for code, token_type in enumerate(TOKEN_TYPES))
+
+# the value of these tokens is implied by their type, it is not stored in the value table of a TokenBuffer.
+FIXED_VALUES = dict(begin='/begin', end='/end', PARENTHESE_OPEN='(', PARENTHESE_CLOSE=')', CURLY_OPEN='{',
+                    CURLY_CLOSE='}', BRACE_OPEN='[', BRACE_CLOSE=']', ASTERISK='*', SEMICOLON=';', EQUAL='=', COMMA=',')
+
+# the offsets are stored as 64 bits integers. array only supports them from python 3.3 on, 'l' is used by python 2 (64
+# bits on most platforms, but 32 bits on windows, where the offsets are then limited to 2 GiB).
+OFFSET_TYPECODE = 'q' if 'q' in getattr(array, 'typecodes', '') else 'l'
+
+
+class TokenBuffer(object):
+    """
+    token stream stored as arrays: the type codes (index in TOKEN_TYPES) as uint16, the start and end offsets as
+    integers of OFFSET_TYPECODE and the decoded values in a side table (None for the tokens of FIXED_VALUES).
+    """
+
+    __slots__ = 'types', 'starts', 'ends', 'values'
+
+    def __init__(self, raw_tokens=()):
+        self.types = array.array('H')
+        self.starts = array.array(OFFSET_TYPECODE)
+        self.ends = array.array(OFFSET_TYPECODE)
+        self.values = list()
+        types, starts, ends, values = self.types.append, self.starts.append, self.ends.append, self.values.append
+        for kind, value, start, end in raw_tokens:
+            types(TOKEN_CODES[kind])
+            starts(start)
+            ends(end)
+            values(None if kind in FIXED_VALUES else value)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        return self.type(index), self.value(index), self.starts[index], self.ends[index]
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+    def type(self, index):
+        return TOKEN_TYPES[self.types[index]]
+
+    def value(self, index):
+        value = self.values[index]
+        return FIXED_VALUES[TOKEN_TYPES[self.types[index]]] if value is None else value
+
+    def extend(self, token_buffer):
+        self.types.extend(token_buffer.types)
+        self.starts.extend(token_buffer.starts)
+        self.ends.extend(token_buffer.ends)
+        self.values.extend(token_buffer.values)
+
+    def count(self, token_type):
+        return self.types.count(TOKEN_CODES[token_type])
+
+    def to_numpy(self):
+        # numpy is not a dependency of this package, it is only imported when the arrays are requested. the arrays share
+        # their memory with the buffer.
+        # the offsets are viewed with the size of their type code, which depends on the platform.
+        import numpy
+        offset_type = numpy.dtype('i{0}'.format(self.starts.itemsize))
+        return (numpy.frombuffer(self.types, dtype=numpy.uint16), numpy.frombuffer(self.starts, dtype=offset_type),
+                numpy.frombuffer(self.ends, dtype=offset_type))
@@ -0,0 +1,237 @@
+"""
+@project: a2l_parser
+@file: skeleton.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+import operator
+import re
+import sys
+
+from .exception import A2lFormatException, A2lDiagnostic
+from .scanner import text_type
+
+# the text up to the next /begin or /end token, outside of the strings and comments. unlike SPLIT_PATTERN, the strings
+# and comments are skipped by the regex engine within a single match.
+SKELETON_PATTERN = r'[^"/]*(?:(?:"[^"\\]*(?:\\.[^"\\]*)*"|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|//[^\n]*|/(?!begin|end))' \
+                   r'[^"/]*)*(?:(?P<begin>/begin)|(?P<end>/end))'
+skeleton_regex_text = re.compile(SKELETON_PATTERN)
+skeleton_regex_bytes = re.compile(SKELETON_PATTERN.encode('ascii'))
+
+# the keyword following /begin or /end and the identifier following the keyword (the name of most blocks), comments
+# being skipped. the white spaces are matched one by one, a repeated [ \t\r\n]+ would backtrack exponentially over a
+# long run of them when no name follows the keyword.
+SKIPPED_PATTERN = r'(?:[ \t\r\n]|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|//[^\n]*)*'
+HEAD_PATTERN = SKIPPED_PATTERN + r'(?P<keyword>[A-Za-z_][A-Za-z0-9_]*)(?:' + SKIPPED_PATTERN + \
+               r'(?P<name>[A-Za-z_][A-Za-z0-9_.\[\]]*))?'
+head_regex_text = re.compile(HEAD_PATTERN)
+head_regex_bytes = re.compile(HEAD_PATTERN.encode('ascii'))
+KEYWORD_PATTERN = SKIPPED_PATTERN + r'(?P<keyword>[A-Za-z_][A-Za-z0-9_]*)'
+keyword_regex_text = re.compile(KEYWORD_PATTERN)
+keyword_regex_bytes = re.compile(KEYWORD_PATTERN.encode('ascii'))
+
+
+class A2lBlock(object):
+    """
+    entry of the skeleton of a file: the keyword and the name (identifier following the keyword, None for the blocks
+    without one) of a /begin ... /end block, the offsets of its first and last characters, and the blocks it contains.
+    the node parsed from the block is kept once it is requested.
+    """
+
+    __slots__ = 'keyword', 'name', 'start', 'end', 'children', 'node'
+
+    def __init__(self, keyword, name, start, end=None):
+        self.keyword = keyword
+        self.name = name
+        self.start = start
+        self.end = end
+        # most blocks do not contain any other one, the list is only built for the first child.
+        self.children = ()
+        self.node = None
+
+    def get_span(self):
+        return self.start, self.end
+
+    def __repr__(self):
+        return 'A2lBlock({0!r}, {1!r}, {2!r}, {3!r})'.format(self.keyword, self.name, self.start, self.end)
+
+    span = property(fget=get_span)
+
+
+def skeleton(data, position=0, max_depth=None):
+    """
+    returns the blocks at the top level of data, found from position by scanning the /begin and /end tokens only (the
+    strings and comments being skipped). the blocks nested in more than max_depth blocks are not recorded. raises an
+    A2lFormatException if a /end token does not close any block, or if a block is not closed.
+    """
+    # the keywords repeat, a single instance of each is kept.
+    keywords = dict()
+    if isinstance(data, (str, text_type)):
+        regex, head_regex, keyword_regex, decode = skeleton_regex_text, head_regex_text, keyword_regex_text, None
+    else:
+        regex, head_regex, keyword_regex, decode = skeleton_regex_bytes, head_regex_bytes, keyword_regex_bytes, \
+                                                    operator.methodcaller('decode', 'ascii')
+    if max_depth is None:
+        max_depth = sys.maxsize
+    blocks = list()
+    stack = list()
+    depth = 0
+    for match in regex.finditer(data, position):
+        if match.lastgroup == 'begin':
+            depth += 1
+            if depth > max_depth:
+                continue
+            head = head_regex.match(data, match.end())
+            if head is None:
+                block = A2lBlock(None, None, match.start('begin'))
+            else:
+                keyword, name = head.group('keyword', 'name')
+                if decode is not None:
+                    keyword = decode(keyword)
+                    name = None if name is None else decode(name)
+                block = A2lBlock(keywords.setdefault(keyword, keyword), name, match.start('begin'))
+            if not stack:
+                blocks.append(block)
+            elif stack[-1].children:
+                stack[-1].children.append(block)
+            else:
+                stack[-1].children = [block]
+            stack.append(block)
+        else:
+            depth -= 1
+            if depth >= max_depth:
+                continue
+            if depth < 0:
+                raise A2lFormatException('unexpected /end at position ', match.start('end'), string=data)
+            tail = keyword_regex.match(data, match.end())
+            stack.pop().end = match.end() if tail is None else tail.end()
+    if depth:
+        raise A2lFormatException('unterminated block at position ', stack[-1].start if stack else position,
+                                 string=data)
+    return blocks
+
+
+def recovered_skeleton(data, errors, parents, position=0, max_depth=None):
+    """
+    returns the blocks at the top level of data like skeleton, the problems being added to errors as A2lDiagnostic
+    instead of raised. a /end token closes the innermost open block with the same keyword, and is skipped if there is
+    none. a block whose keyword is in parents closes the blocks it is nested in, up to the innermost open block with the
+    keyword parents gives for it (None for the top level) if there is one. the blocks which are not closed by their own
+    /end token are left out of the skeleton, the spans of the diagnostics are the ranges of data to skip.
+    """
+    keywords = dict()
+    if isinstance(data, (str, text_type)):
+        regex, head_regex, keyword_regex, decode = skeleton_regex_text, head_regex_text, keyword_regex_text, None
+    else:
+        regex, head_regex, keyword_regex, decode = skeleton_regex_bytes, head_regex_bytes, keyword_regex_bytes, \
+                                                    operator.methodcaller('decode', 'ascii')
+    if max_depth is None:
+        max_depth = sys.maxsize
+    blocks = list()
+    # the open blocks as (keyword, start, block) tuples, the block being None if it is nested too deep to be recorded.
+    stack = list()
+
+    def close(end):
+        # the innermost open block is not terminated, it ends before the token recovering it.
+        keyword, start, block = stack.pop()
+        errors.append(A2lDiagnostic('unterminated {0} block at position {1}'.format(keyword, start), start, start,
+                                    end))
+        if block is not None:
+            (stack[-1][2].children if stack else blocks).pop()
+
+    for match in regex.finditer(data, position):
+        # the /end tokens are followed by a keyword only.
+        head = (head_regex if match.lastgroup == 'begin' else keyword_regex).match(data, match.end())
+        keyword = name = None
+        if head is not None:
+            keyword = head.group('keyword')
+            name = head.group('name') if match.lastgroup == 'begin' else None
+            if decode is not None:
+                keyword = decode(keyword)
+                name = None if name is None else decode(name)
+        if match.lastgroup == 'begin':
+            start = match.start('begin')
+            if keyword in parents:
+                parent = parents[keyword]
+                if parent is None or any(item[0] == parent for item in stack):
+                    while stack and stack[-1][0] != parent:
+                        close(start)
+            block = None
+            if len(stack) < max_depth:
+                block = A2lBlock(keywords.setdefault(keyword, keyword), name, start)
+                if not stack:
+                    blocks.append(block)
+                elif stack[-1][2].children:
+                    stack[-1][2].children.append(block)
+                else:
+                    stack[-1][2].children = [block]
+            stack.append((keyword, start, block))
+        else:
+            start = match.start('end')
+            end = match.end() if head is None else head.end('keyword')
+            if not any(item[0] == keyword for item in stack):
+                errors.append(A2lDiagnostic('unexpected /end at position {0}'.format(start), start, start, end))
+                continue
+            while stack[-1][0] != keyword:
+                close(start)
+            block = stack.pop()[2]
+            if block is not None:
+                block.end = end
+    while stack:
+        close(len(data))
+    return blocks
+
+
+class A2lLazyList(list):
+    """
+    list whose items are parsed from blocks of the skeleton when first accessed (see the lazy mode of A2lParser), load
+    being called with the block and the parent of the list. an item is only parsed once, the node is then returned.
+    """
+
+    __slots__ = '_parent', '_load'
+
+    def __init__(self, items, parent, load):
+        super(A2lLazyList, self).__init__(items)
+        self._parent = parent
+        self._load = load
+
+    def __reduce_ex__(self, protocol):
+        # the items which are not parsed yet are stored as blocks. the parent refers back to the list, it is restored
+        # once the list exists.
+        return A2lLazyList, (list(list.__iter__(self)), None, None), (self._parent, self._load)
+
+    def __setstate__(self, state):
+        self._parent, self._load = state
+
+    def _resolve(self, index, item):
+        if item.__class__ is A2lBlock:
+            if item.node is None:
+                item.node = self._load(item, self._parent)
+            item = item.node
+            list.__setitem__(self, index, item)
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._resolve(i, list.__getitem__(self, i)) for i in range(*index.indices(len(self)))]
+        return self._resolve(index, list.__getitem__(self, index))
+
+    def __iter__(self):
+        index = 0
+        while index < len(self):
+            yield self._resolve(index, list.__getitem__(self, index))
+            index += 1
+
+    def __reversed__(self):
+        for index in range(len(self) - 1, -1, -1):
+            yield self._resolve(index, list.__getitem__(self, index))
+
+    def find(self, name):
+        """
+        returns the item named name, only this one being parsed, or None.
+        """
+        for index, item in enumerate(list.__iter__(self)):
+            if getattr(item, 'name', None) == name:
+                return self._resolve(index, item)
+        return None
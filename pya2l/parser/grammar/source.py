@@ -0,0 +1,178 @@
+"""
+@project: a2l_parser
+@file: source.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+import array
+import bisect
+import codecs
+import mmap
+import re
+
+from .scanner import master_regex, master_regex_bytes, detect_encoding, text_type, OFFSET_TYPECODE
+
+newline_regex_text = re.compile('\n')
+newline_regex_bytes = re.compile(b'\n')
+
+# the number of recorded edits of a source after which they are folded (see A2lSource.fold).
+MAX_EDITS = 128
+
+
+def newline_offsets(data, end=None):
+    # the offsets of the newlines of data (text or a bytes-like object), up to end.
+    regex = newline_regex_text if isinstance(data, (str, text_type)) else newline_regex_bytes
+    return array.array(OFFSET_TYPECODE, (match.start() for match in regex.finditer(data, 0, len(data) if end is None
+                                                                                    else end)))
+
+
+def offset_location(newlines, offset):
+    """
+    returns the line and the column (both starting at 1) of offset, newlines holding the offsets of the newlines of the
+    data up to offset at least (see newline_offsets).
+    """
+    line = bisect.bisect_left(newlines, offset)
+    return line + 1, offset - (newlines[line - 1] + 1 if line else 0) + 1
+
+
+class A2lSource(object):
+    """
+    the data a tree has been parsed from, either held as is or mapped again from path when first needed. the offsets of
+    the nodes are mapped to lines and columns through the table of the newline offsets, built on the first request.
+
+    once the data has been edited (see A2lParser.reparse), the offsets of the nodes parsed before an edit are translated
+    when requested instead of being updated: each edit is recorded, and the nodes parsed again after the nth edit are
+    registered in epochs with n. the nodes they contain share their epoch. the recorded edits are regularly folded into
+    a single table of shifts of the offsets of the parsed data (see fold).
+    """
+
+    def __init__(self, data=None, path=None):
+        self.path = path
+        self._data = data
+        self._newlines = None
+        self._encoding = None
+        self.edits = list()
+        self.epochs = dict()
+        # the number of folded edits, and the offsets of the parsed data from which the shifts in the folded data apply.
+        self.folded = 0
+        self.bounds = list()
+        self.shifts = list()
+        # the range of the edits which could not be parsed yet, in the current data.
+        self.pending = None
+
+    def __getstate__(self):
+        # the data is never stored with a pickled tree, only the path of the file it comes from.
+        return dict(path=self.path)
+
+    def __setstate__(self, state):
+        self.__init__(path=state['path'])
+
+    def get_data(self):
+        if self._data is None and self.path is not None:
+            with open(self.path, 'rb') as fp:
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) if fp.read(1) else b''
+            # utf-16 files are scanned once decoded, the offsets are then the ones of the text.
+            if data[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+                data = bytes(data).decode('utf-16')
+            self._data = data
+        return self._data
+
+    def get_encoding(self):
+        # the encoding of binary data (see detect_encoding), detected once. None for text.
+        if self._encoding is None and not isinstance(self.data, (str, text_type)):
+            self._encoding = detect_encoding(self.data)[0]
+        return self._encoding
+
+    def get_newlines(self):
+        if self._newlines is None:
+            self._newlines = newline_offsets(self.data)
+        return self._newlines
+
+    def token_end(self, offset):
+        # the token starting at offset is scanned again.
+        data = self.data
+        match = (master_regex if isinstance(data, (str, text_type)) else master_regex_bytes).match(data, offset)
+        return offset if match.lastgroup == 'INVALID' else match.end(match.lastgroup)
+
+    def edit(self, position, length, text):
+        """
+        replaces length characters (bytes for binary data) of the data at position by text, and returns the epoch of
+        the edited data. the data is then held as is, it is not mapped from path anymore.
+        """
+        data = self.data
+        if isinstance(data, (str, text_type)):
+            self._data = data[:position] + text + data[position + length:]
+        else:
+            # binary data is copied once, then edited in place.
+            if not isinstance(data, bytearray):
+                self._data = data = bytearray(data)
+            data[position:position + length] = text
+        self.path = None
+        self._newlines = None
+        self.edits.append((position, position + length, len(text) - length))
+        return self.folded + len(self.edits)
+
+    def fold(self):
+        """
+        folds the recorded edits into the table of shifts, which then translates the offsets of the parsed data (epoch
+        0) to the current data. the nodes of the other epochs must have been translated before (see
+        A2lParser.reparse). as no node is left in a replaced range, an edit shifts all the offsets from its position.
+        """
+        bounds, shifts = self.bounds, self.shifts
+        for position, end, delta in self.edits:
+            # the shifts are constant between the bounds, the first range reaching position holds the new bound. the
+            # ranges do not grow monotonically, the characters of the replaced ranges being shifted back.
+            bound = position
+            for index in range(len(bounds) + 1):
+                shift = shifts[index - 1] if index else 0
+                if index == len(bounds) or bounds[index] - 1 + shift >= position:
+                    bound = max(bounds[index - 1] if index else bound, position - shift)
+                    break
+            index = bisect.bisect_left(bounds, bound)
+            if index == len(bounds) or bounds[index] != bound:
+                bounds.insert(index, bound)
+                shifts.insert(index, shifts[index - 1] if index else 0)
+            shifts[index:] = [shift + delta for shift in shifts[index:]]
+        self.folded += len(self.edits)
+        del self.edits[:]
+
+    def epoch(self, node):
+        # the epoch of the innermost node registered in epochs containing node.
+        while node is not None:
+            if node in self.epochs:
+                return self.epochs[node]
+            node = node._parent
+        return 0
+
+    def translate(self, offset, epoch=0):
+        """
+        returns the offset in the current data of a token which was at offset after the epoch-th edit. the offsets in a
+        replaced range are only translated by the folded edits.
+        """
+        if epoch < self.folded:
+            index = bisect.bisect_right(self.bounds, offset) - 1
+            if index >= 0:
+                offset += self.shifts[index]
+            epoch = self.folded
+        for position, end, delta in self.edits[epoch - self.folded:]:
+            if offset >= end:
+                offset += delta
+        return offset
+
+    def offsets(self, node):
+        # the offsets of the first and of the last token of node in the current data.
+        if not self.folded and not self.edits or node._start is None:
+            return node._start, node._last
+        epoch = self.epoch(node)
+        return self.translate(node._start, epoch), self.translate(node._last, epoch)
+
+    def location(self, offset):
+        """
+        returns the line and the column (both starting at 1) of offset.
+        """
+        return offset_location(self.newlines, offset)
+
+    data = property(fget=get_data)
+    encoding = property(fget=get_encoding)
+    newlines = property(fget=get_newlines)
@@ -0,0 +1,164 @@
+"""
+@project: a2l_parser
+@file: transfer.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+import gc
+import operator
+from collections import deque
+from itertools import repeat
+
+from .node import A2lNode, projected_class
+
+# the first item of an encoded tuple value.
+TUPLE = -1
+
+# the first item of an encoded reference to a node, followed by its index in the encoded nodes.
+NODE = -2
+
+# the first item of an encoded list holding nodes, lists or tuples. the lists of plain values are not encoded.
+LIST = -3
+
+# the first item of an encoded list of nodes, followed by their indices.
+NODES = -4
+
+# the encoded value of a slot which is not set.
+UNSET = -5,
+
+# the slots which are not transferred: the links between the nodes are rebuilt by decode_nodes, the source of the data
+# is the one of the receiving process and the indexes are built again when requested.
+LINKS = frozenset(('_parent', '_children', '_source', '_index', '_names', '_references'))
+
+# the values which are transferred as they are.
+PLAIN = frozenset((str, int, float, bool, type(None)))
+
+
+def node_slots(cls):
+    # the transferred slots of the instances of cls, in a fixed order.
+    return tuple(name for base in reversed(cls.__mro__) for name in base.__dict__.get('__slots__', ())
+                 if name not in LINKS and name not in cls._dropped)
+
+
+def fill(nodes, name, values):
+    # sets slot name of each of nodes to the value at the same index of values, without a python loop.
+    deque(map(setattr, nodes, repeat(name), values), 0)
+
+
+def encode_nodes(value):
+    """
+    returns value (a node, or a list or tuple of nodes and values) as the classes of its nodes, the nodes of each class
+    and the encoded value, made of nested tuples and lists of plain values. the nodes of a class are encoded by columns:
+    the indices of the nodes (in the order they are reached, a node before its children), the indices of their parents
+    and of their children, then one column per slot in the order of node_slots. a column holding plain values only is
+    kept as a list, the other ones are tuples of encoded values. the encoded values are tuples starting with a negative
+    marker, the nodes being referred to by their index. the encoded nodes are pickled in about 60% of the size of the
+    nodes themselves (the state of a node is pickled as a dictionary of its slots, the names of the slots being repeated
+    for each node) and decode_nodes builds them faster than they are unpickled.
+    """
+    classes = list()
+    groups = list()
+    getters = dict()
+    indices = dict()
+
+    def encode_node(node, parent=-1):
+        index = indices.get(id(node))
+        if index is not None:
+            return index
+        cls = node.__class__
+        if cls not in getters:
+            slots = node_slots(cls)
+            # the children are read with the slots, the getter then always returns a tuple.
+            getters[cls] = len(groups), slots, operator.attrgetter('_children', *slots)
+            classes.append(cls if cls._projection is None else cls._projection)
+            groups.append(([], [], [], [[] for _ in slots]))
+        code, slots, getter = getters[cls]
+        node_indices, parents, children, columns = groups[code]
+        index = indices[id(node)] = len(indices)
+        # the place of the node in its group is taken before its children, which might be of the same class.
+        position = len(node_indices)
+        node_indices.append(index)
+        parents.append(parent)
+        children.append(None)
+        for column in columns:
+            column.append(None)
+        try:
+            values = getter(node)
+        except AttributeError:
+            values = (node._children,) + tuple(getattr(node, name) if hasattr(node, name) else UNSET for name in slots)
+        children[position] = [encode_node(child, index) for child in values[0]]
+        for column, item in zip(columns, values[1:]):
+            column[position] = item if item.__class__ in PLAIN or item is UNSET else encode_value(item)
+        return index
+
+    def encode_value(item):
+        if isinstance(item, A2lNode):
+            return NODE, encode_node(item)
+        if isinstance(item, list):
+            if item.__class__ is list and PLAIN.issuperset(map(type, item)):
+                return item
+            if all(isinstance(i, A2lNode) for i in item):
+                return (NODES,) + tuple(encode_node(i) for i in item)
+            return (LIST,) + tuple(encode_value(i) for i in item)
+        if isinstance(item, tuple):
+            return (TUPLE,) + tuple(encode_value(i) for i in item)
+        return item
+
+    value = encode_value(value)
+    for node_indices, parents, children, columns in groups:
+        for position, column in enumerate(columns):
+            if not PLAIN.issuperset(map(type, column)):
+                columns[position] = tuple(column)
+    return classes, groups, value
+
+
+def decode_nodes(encoded):
+    """
+    returns the value encoded by encode_nodes. the nodes of each class are built at once without calling their
+    constructor, then their slots are set column by column.
+    """
+    classes, groups, value = encoded
+    # the last item stands for the nodes without parent.
+    nodes = [None] * (sum(len(group[0]) for group in groups) + 1)
+    unset = object()
+
+    def decode_value(item):
+        if item.__class__ is tuple:
+            if item[0] == NODE:
+                return nodes[item[1]]
+            if item[0] == NODES:
+                return [nodes[i] for i in item[1:]]
+            if item[0] == LIST:
+                return [decode_value(i) for i in item[1:]]
+            if item == UNSET:
+                return unset
+            return tuple(decode_value(i) for i in item[1:])
+        return item
+
+    # the garbage collector would otherwise run many times while the nodes are created.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        built = list()
+        for cls, (node_indices, _, _, _) in zip(classes, groups):
+            cls = projected_class(*cls) if isinstance(cls, tuple) else cls
+            instances = list(map(cls.__new__, repeat(cls, len(node_indices))))
+            deque(map(nodes.__setitem__, node_indices, instances), 0)
+            built.append((cls, instances))
+        get = nodes.__getitem__
+        for (cls, instances), (_, parents, children, columns) in zip(built, groups):
+            fill(instances, '_parent', map(get, parents))
+            fill(instances, '_children', [list(map(get, items)) for items in children])
+            for name, column in zip(node_slots(cls), columns):
+                if column.__class__ is list:
+                    fill(instances, name, column)
+                    continue
+                for node, item in zip(instances, column):
+                    item = decode_value(item)
+                    if item is not unset:
+                        setattr(node, name, item)
+        return decode_value(value)
+    finally:
+        if enabled:
+            gc.enable()
@@ -0,0 +1,98 @@
+"""
+@project: a2l_parser
+@file: metadata.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+import itertools
+import mmap
+import operator
+import os
+
+from .grammar.parser import A2lParser
+from .grammar.scanner import A2lScanner, detect_encoding, text_type
+from .grammar.skeleton import skeleton
+
+# the child blocks of the modules which are parsed by probe, the other ones are only counted.
+PROBED_BLOCKS = frozenset(('MOD_PAR',))
+
+
+def count_blocks(blocks):
+    # the number of blocks of blocks and of the blocks they contain, by keyword.
+    counts = dict()
+    pending = list(blocks)
+    while pending:
+        block = pending.pop()
+        counts[block.keyword] = counts.get(block.keyword, 0) + 1
+        pending.extend(block.children)
+    return counts
+
+
+def version(node):
+    return None if node is None else dict(version_no=node.version_no, upgrade_no=node.upgrade_no)
+
+
+def probe(source):
+    """
+    returns the metadata of the data of source (the path of a file, or a bytes-like object) as a dictionary: the
+    ASAP2_VERSION, the name of the project and the VERSION and PROJECT_NO of its HEADER, then, for each module, its
+    name, the EPK and ADDR_EPK of its MOD_PAR and the number of blocks of each keyword it contains. counts gives the
+    number of blocks of each keyword of the whole data. only the /begin and /end tokens of the data are scanned (see
+    skeleton), except for the tokens outside of the child blocks of the modules and of the MOD_PAR blocks, which are
+    parsed. the data is not checked any further.
+    """
+    fp = None
+    data = source
+    if isinstance(source, (str, text_type)):
+        fp = open(source, 'rb')
+        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(fp.fileno()).st_size else b''
+    try:
+        return probe_data(data)
+    finally:
+        if fp is not None:
+            try:
+                data.close()
+            except (AttributeError, BufferError):
+                pass
+            fp.close()
+
+
+def probe_data(data):
+    if isinstance(data, (str, text_type)):
+        encoding, position = None, 0
+    else:
+        encoding, position = detect_encoding(data)
+        if encoding == 'utf-16':
+            data, encoding, position = bytes(data).decode(encoding), None, 0
+    blocks = skeleton(data, position)
+    modules = [module for project in blocks if project.keyword == 'PROJECT' for module in project.children
+               if module.keyword == 'MODULE']
+    # the offsets delimit the ranges to scan, the child blocks of the modules being left out.
+    offsets = [position]
+    for block in (block for module in modules for block in module.children if block.keyword not in PROBED_BLOCKS):
+        if len(offsets) > 1 and not data[offsets[-1]:block.start].strip():
+            offsets[-1] = block.end
+        else:
+            offsets.extend(block.span)
+    offsets.append(len(data))
+    scanner = A2lScanner(intern_table=False)
+    decode = None if encoding is None else operator.methodcaller('decode', encoding)
+    tokens = itertools.chain.from_iterable(
+        scanner._generate(iter((data[start:end],)), 0, decode, raw=True, offset=start)
+        for start, end in zip(offsets[::2], offsets[1::2]))
+    tree = A2lParser.descent_engine().parse_rule('a2l', tokens, data)
+    project = tree.project
+    header = None if project is None else project.header
+    return dict(
+        asap2_version=version(tree.asap2_version),
+        project=None if project is None else dict(
+            name=project.name, long_identifier=project.long_identifier,
+            version=None if header is None else header.version,
+            project_no=None if header is None else header.project_no),
+        modules=[dict(name=module.name, long_identifier=module.long_identifier,
+                      epk=None if module.mod_par is None else module.mod_par.epk,
+                      addr_epk=[] if module.mod_par is None else list(module.mod_par.addr_epk),
+                      counts=count_blocks(block.children))
+                 for module, block in zip(project.module if project else (), modules)],
+        counts=count_blocks(blocks))
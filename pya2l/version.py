@@ -0,0 +1,8 @@
+"""
+@project: parser
+@file: version.py
+@author: Guillaume Sottas
+@date: 17.10.2026
+"""
+
+__version__ = '0.0.1'
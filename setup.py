@@ -1,8 +1,15 @@
+import os
+
 from setuptools import setup
 
+# the version is defined once, in pya2l/version.py (it is part of the keys of the cache of parsed trees).
+version = dict()
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pya2l', 'version.py')) as fp:
+    exec(fp.read(), version)
+
 setup(
     name='pya2l',
-    version='0.0.1',
+    version=version['__version__'],
     packages=[
         'pya2l',
         'pya2l.parser',